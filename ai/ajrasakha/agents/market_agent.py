@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import re
@@ -22,6 +23,12 @@ from ajrasakha.tools.market.market_enam_tool import (
     get_commodity_list_from_enam,
     get_trade_data_from_enam
 )
+from ajrasakha.agents.market_catalog_cache import (
+    CATALOG_TTL_SEC,
+    COMMODITY_LIST_TTL_SEC,
+    RESOLUTION_TTL_SEC,
+    get_catalog_cache,
+)
 from ajrasakha.agents.prompts import MARKET_GEMMA_RESOLUTION_PROMPT, MARKET_QUERY_ANALYSIS_PROMPT
 
 logger = logging.getLogger(__name__)
@@ -31,16 +38,64 @@ from dotenv import load_dotenv
 load_dotenv()
 MARKET_GEMMA_BASE_URL = os.getenv("WEATHER_GEMMA_BASE_URL", "http://100.100.108.44:8014/v1")
 
-# --- IN-MEMORY CACHES ---
-_AGM_CACHE = {
-    "states": None,
-    "commodities": None,
-    "districts": {} # keyed by state_id
-}
-_ENAM_CACHE = {
-    "states": None,
-    "apmcs": {} # keyed by state_id
-}
+# --- CATALOG CACHE (LRU + shared SQLite, see market_catalog_cache) ---
+def _enam_rows(res: dict) -> list:
+    return res["data"].get("data", []) if isinstance(res.get("data"), dict) else []
+
+
+async def _agm_states() -> dict:
+    async def load():
+        res = await agm_get_states()
+        if res.get("success"):
+            return {s["name"]: s["id"] for s in res["data"]}
+        return None
+    return await get_catalog_cache().get_or_load("agm:states", load, CATALOG_TTL_SEC) or {}
+
+
+async def _agm_commodities() -> dict:
+    async def load():
+        res = await agm_get_commodities()
+        if res.get("success"):
+            return {c["name"]: c["id"] for c in res["data"]}
+        return None
+    return await get_catalog_cache().get_or_load("agm:commodities", load, CATALOG_TTL_SEC) or {}
+
+
+async def _agm_districts(s_id: int) -> dict:
+    async def load():
+        res = await agm_get_districts(s_id)
+        if res.get("success"):
+            return {d["name"]: d["id"] for d in res["data"]}
+        return None
+    return await get_catalog_cache().get_or_load(f"agm:districts:{s_id}", load, CATALOG_TTL_SEC) or {}
+
+
+async def _enam_states() -> dict:
+    async def load():
+        res = await get_state_list_from_enam()
+        if res.get("success"):
+            return {s["state_name"]: s["state_id"] for s in _enam_rows(res) if "state_name" in s}
+        return None
+    return await get_catalog_cache().get_or_load("enam:states", load, CATALOG_TTL_SEC) or {}
+
+
+async def _enam_apmcs(s_id: str) -> list:
+    async def load():
+        res = await get_apmc_list_from_enam(s_id)
+        if res.get("success"):
+            return [a["apmc_name"] for a in _enam_rows(res) if "apmc_name" in a]
+        return None
+    return await get_catalog_cache().get_or_load(f"enam:apmcs:{s_id}", load, CATALOG_TTL_SEC) or []
+
+
+async def _enam_commodities(state_name: str, apmc_name: str, from_date: str, to_date: str) -> list:
+    async def load():
+        res = await get_commodity_list_from_enam(state_name, apmc_name, from_date, to_date)
+        if res.get("success"):
+            return [c["commodity_name"] for c in _enam_rows(res) if "commodity_name" in c]
+        return None
+    key = f"enam:commodities:{state_name}:{apmc_name}:{from_date}:{to_date}"
+    return await get_catalog_cache().get_or_load(key, load, COMMODITY_LIST_TTL_SEC) or []
 
 class MarketInput(BaseModel):
     query: str        # e.g., "What is the current price of rice in Rangareddy?"
@@ -89,10 +144,22 @@ async def resolve_market_entities_via_gemma(failures: list[dict]) -> dict[str, s
     """
     Given a list of failed string matches, query Gemma once to resolve them.
     failures format: [{"field": "crop", "user_term": "Kapas", "options": ["Cotton", "Wheat", "Paddy"]}, ...]
+    Answers are cached per (term, options), so the same miss does not hit Gemma again.
     """
     if not failures:
         return {}
 
+    digest = hashlib.sha1(
+        json.dumps(failures, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    ).hexdigest()
+
+    async def load():
+        return await _resolve_via_gemma_uncached(failures) or None
+
+    return await get_catalog_cache().get_or_load(f"gemma:{digest}", load, RESOLUTION_TTL_SEC) or {}
+
+
+async def _resolve_via_gemma_uncached(failures: list[dict]) -> dict[str, str]:
     prompt_parts = MARKET_GEMMA_RESOLUTION_PROMPT.copy()
     
     for fail in failures:
@@ -205,12 +272,7 @@ async def resolve_agmarknet_entities(state: str, district: str, crop: str) -> Di
     failures = []
 
     # 1. State
-    if _AGM_CACHE["states"] is None:
-        res = await agm_get_states()
-        if res.get("success"):
-            _AGM_CACHE["states"] = {s["name"]: s["id"] for s in res["data"]}
-    
-    state_options = _AGM_CACHE["states"] or {}
+    state_options = await _agm_states()
     for name, s_id in state_options.items():
         if _normalize(name) == norm_state:
             ag_ids["state_id"] = s_id
@@ -224,12 +286,7 @@ async def resolve_agmarknet_entities(state: str, district: str, crop: str) -> Di
         ag_ids["cmdt_id"] = 100001
         cmdt_options = {}
     else:
-        if _AGM_CACHE["commodities"] is None:
-            res = await agm_get_commodities()
-            if res.get("success"):
-                _AGM_CACHE["commodities"] = {c["name"]: c["id"] for c in res["data"]}
-        
-        cmdt_options = _AGM_CACHE["commodities"] or {}
+        cmdt_options = await _agm_commodities()
         for name, c_id in cmdt_options.items():
             if _normalize(name) == norm_crop:
                 ag_ids["cmdt_id"] = c_id
@@ -255,13 +312,7 @@ async def resolve_agmarknet_entities(state: str, district: str, crop: str) -> Di
     if district.lower() in ("all", "any"):
         ag_ids["dist_id"] = 100007
     else:
-        s_id = ag_ids["state_id"]
-        if s_id not in _AGM_CACHE["districts"]:
-            res = await agm_get_districts(s_id)
-            if res.get("success"):
-                _AGM_CACHE["districts"][s_id] = {d["name"]: d["id"] for d in res["data"]}
-        
-        dist_options = _AGM_CACHE["districts"].get(s_id, {})
+        dist_options = await _agm_districts(ag_ids["state_id"])
         for name, d_id in dist_options.items():
             if norm_dist in _normalize(name):
                 ag_ids["dist_id"] = d_id
@@ -289,13 +340,7 @@ async def resolve_enam_entities(state: str, district: str, crop: str, from_date:
     failures = []
 
     # 1. State
-    if _ENAM_CACHE["states"] is None:
-        res = await get_state_list_from_enam()
-        if res.get("success"):
-            state_data = res["data"].get("data", []) if isinstance(res.get("data"), dict) else []
-            _ENAM_CACHE["states"] = {s["state_name"]: s["state_id"] for s in state_data if "state_name" in s}
-            
-    state_options = _ENAM_CACHE["states"] or {}
+    state_options = await _enam_states()
     for name, s_id in state_options.items():
         if _normalize(name) == norm_state:
             en_ids["state_name"] = name
@@ -315,14 +360,7 @@ async def resolve_enam_entities(state: str, district: str, crop: str, from_date:
         return {"error": f"State '{state}' not found in eNAM"}
 
     # 2. Mandi (APMC)
-    s_id = en_ids["state_id"]
-    if s_id not in _ENAM_CACHE["apmcs"]:
-        res = await get_apmc_list_from_enam(s_id)
-        if res.get("success"):
-            apmc_data = res["data"].get("data", []) if isinstance(res.get("data"), dict) else []
-            _ENAM_CACHE["apmcs"][s_id] = [a["apmc_name"] for a in apmc_data if "apmc_name" in a]
-            
-    apmc_options = _ENAM_CACHE["apmcs"].get(s_id, [])
+    apmc_options = await _enam_apmcs(en_ids["state_id"])
     if district.lower() in ("all", "any"):
         en_ids["apmcs"] = apmc_options
     else:
@@ -366,7 +404,7 @@ async def fetch_agmarknet_prices_by_id(ag_ids: dict, target_date: str) -> dict:
         data = await agm_get_price_arrivals(state=s_id, district=d_id, commodity=c_id, date=d)
         return data.get("data", {}).get("data", []) if isinstance(data.get("data"), dict) else data.get("data", [])
 
-    # Limit concurrency to 5
+    # All five dates are fetched concurrently
     results = await asyncio.gather(*[fetch_for_date(d) for d in dates_to_fetch], return_exceptions=True)
     
     extracted_data = []
@@ -400,33 +438,26 @@ async def fetch_enam_prices_by_id(en_ids: dict, target_date: str) -> dict:
     
     async def fetch_for_apmc(apmc_name: str):
         target_crops = []
+        # The commodity list for this APMC/window is cached, as is any Gemma pick against it
+        cmdt_options = await _enam_commodities(state_name, apmc_name, from_date, to_date)
         if crop_raw.lower() in ("all", "any"):
-            cmdt_res = await get_commodity_list_from_enam(state_name, apmc_name, from_date, to_date)
-            if cmdt_res.get("success"):
-                cmdt_data = cmdt_res["data"].get("data", []) if isinstance(cmdt_res.get("data"), dict) else []
-                target_crops = [c["commodity_name"] for c in cmdt_data if "commodity_name" in c]
+            target_crops = cmdt_options
         else:
-            # We must fetch the list of available commodities to find the exact match string
-            cmdt_res = await get_commodity_list_from_enam(state_name, apmc_name, from_date, to_date)
-            if cmdt_res.get("success"):
-                cmdt_data = cmdt_res["data"].get("data", []) if isinstance(cmdt_res.get("data"), dict) else []
-                cmdt_options = [c["commodity_name"] for c in cmdt_data if "commodity_name" in c]
-                
-                matched_cmdt_name = None
-                for name in cmdt_options:
-                    if _normalize(name) == norm_crop:
-                        matched_cmdt_name = name
-                        break
-                        
-                if not matched_cmdt_name and cmdt_options:
-                    res = await resolve_market_entities_via_gemma([
-                        {"field": "crop", "user_term": crop_raw, "options": cmdt_options}
-                    ])
-                    if res.get("crop") in cmdt_options:
-                        matched_cmdt_name = res["crop"]
-                        
-                if matched_cmdt_name:
-                    target_crops = [matched_cmdt_name]
+            matched_cmdt_name = None
+            for name in cmdt_options:
+                if _normalize(name) == norm_crop:
+                    matched_cmdt_name = name
+                    break
+
+            if not matched_cmdt_name and cmdt_options:
+                res = await resolve_market_entities_via_gemma([
+                    {"field": "crop", "user_term": crop_raw, "options": cmdt_options}
+                ])
+                if res.get("crop") in cmdt_options:
+                    matched_cmdt_name = res["crop"]
+
+            if matched_cmdt_name:
+                target_crops = [matched_cmdt_name]
 
         apmc_results = []
         for c_name in target_crops:
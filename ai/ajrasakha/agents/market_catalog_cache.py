@@ -0,0 +1,67 @@
+"""Shared catalog cache for the market agent's Agmarknet / eNAM lookups.
+
+State, district, commodity and APMC lists change rarely but were refetched by
+every worker after each restart. Entries now live in two tiers:
+
+  memory: a bounded LRU per process (MARKET_CATALOG_CACHE_MAX_ENTRIES)
+  disk:   a SQLite file shared by every worker on the host
+          (MARKET_CATALOG_CACHE_PATH; empty disables the disk tier)
+
+Each entry carries its own expiry, so slow-moving catalogs and per-date eNAM
+commodity lists can use different TTLs. Concurrent misses on the same key are
+single-flighted: one coroutine calls the upstream loader, the others await its
+result. A failed load (loader returns None or raises) is not cached; a stale
+entry is served instead when one exists. The tiers and single-flight live in
+ajrasakha.tiered_cache.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from ajrasakha.tiered_cache import AsyncTieredCache, env_int
+
+CATALOG_CACHE_PATH = os.getenv("MARKET_CATALOG_CACHE_PATH", ".cache/market_catalog.sqlite3").strip()
+CATALOG_CACHE_MAX_ENTRIES = env_int("MARKET_CATALOG_CACHE_MAX_ENTRIES", 2048)
+# states / districts / commodities / APMC lists
+CATALOG_TTL_SEC = env_int("MARKET_CATALOG_TTL_SEC", 24 * 3600)
+# eNAM commodities traded in an APMC for a date window
+COMMODITY_LIST_TTL_SEC = env_int("MARKET_CATALOG_COMMODITY_LIST_TTL_SEC", 3600)
+# Gemma picks for a user term against a fixed option list
+RESOLUTION_TTL_SEC = env_int("MARKET_CATALOG_RESOLUTION_TTL_SEC", 7 * 24 * 3600)
+
+
+class CatalogCache(AsyncTieredCache):
+    """Catalog entries keyed by strings such as "agm:districts:36"; loaders return None on failure."""
+
+    def __init__(
+        self,
+        path: str | Path | None = CATALOG_CACHE_PATH,
+        *,
+        max_entries: int = CATALOG_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(
+            path,
+            table="catalog",
+            label="Market catalog",
+            max_entries=max_entries,
+            clock=clock,
+        )
+
+
+_cache: CatalogCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_catalog_cache() -> CatalogCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CatalogCache()
+    return _cache
@@ -0,0 +1,196 @@
+"""Market agent catalog cache: LRU + SQLite tiers, TTLs, single-flight, against a stub HTTP server."""
+
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from ajrasakha.agents import market_agent
+from ajrasakha.agents.market_catalog_cache import CatalogCache
+from ajrasakha.tools.market import market_agmarknet_tool, market_enam_tool
+
+_FILTERS = {
+    "state_data": [
+        {"state_id": 100006, "state_name": "All States"},
+        {"state_id": 36, "state_name": "Telangana"},
+        {"state_id": 28, "state_name": "Andhra Pradesh"},
+    ],
+    "district_data": [
+        {"id": 501, "district_name": "Rangareddy", "state_id": 36},
+        {"id": 502, "district_name": "Warangal", "state_id": 36},
+    ],
+    "market_data": [],
+    "cmdt_data": [
+        {"cmdt_id": 100001, "cmdt_name": "All Commodities"},
+        {"cmdt_id": 3, "cmdt_name": "Rice"},
+        {"cmdt_id": 15, "cmdt_name": "Cotton"},
+    ],
+}
+
+
+class _Stub(BaseHTTPRequestHandler):
+    hits: Counter
+    delay = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        name = url.path.strip("/").split("/")[-1]
+        self.hits[name] += 1
+        if name == "dashboard-filters":
+            time.sleep(self.delay)
+            self._send({"data": _FILTERS})
+        elif name == "dashboard-data":
+            time.sleep(self.delay)
+            date = parse_qs(url.query)["date"][0]
+            self._send({"data": {"records": [{"date": date, "modal_price": 2100}]}})
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        name = urlparse(self.path).path.strip("/").split("/")[-1]
+        self.hits[name] += 1
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        time.sleep(self.delay)
+        if name == "states_name":
+            self._send({"data": [{"state_name": "TELANGANA", "state_id": "36"}]})
+        elif name == "apmc_list":
+            self._send({"data": [{"apmc_name": "Shadnagar"}, {"apmc_name": "Warangal"}]})
+        elif name == "commodity_list":
+            self._send({"data": [{"commodity_name": "Cotton"}, {"commodity_name": "Paddy(Dhan)"}]})
+        elif name == "trade_data_list":
+            form = parse_qs(body.decode())
+            self._send({"data": [{"apmc": form["apmcName"][0], "commodity": form["commodityName"][0]}]})
+        elif name == "completions":
+            self._send({"choices": [{"message": {"content": '{"crop": "Cotton"}'}}]})
+        else:
+            self.send_error(404)
+
+
+@pytest.fixture
+def stub(monkeypatch, tmp_path):
+    handler = type("Handler", (_Stub,), {"hits": Counter(), "delay": 0.0})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    monkeypatch.setattr(market_agmarknet_tool, "BASE_URL", f"{base}/agm")
+    monkeypatch.setattr(market_agmarknet_tool, "_filters_cache", {})
+    monkeypatch.setattr(market_enam_tool, "ENAM_BASE", f"{base}/enam")
+    monkeypatch.setattr(market_agent, "MARKET_GEMMA_BASE_URL", f"{base}/v1")
+    cache = CatalogCache(tmp_path / "catalog.sqlite3")
+    monkeypatch.setattr(market_agent, "get_catalog_cache", lambda: cache)
+    try:
+        yield handler, cache, tmp_path / "catalog.sqlite3"
+    finally:
+        server.shutdown()
+        server.server_close()
+        cache.close()
+
+
+async def test_agmarknet_catalog_survives_restart(stub, monkeypatch):
+    handler, cache, path = stub
+    first = await market_agent.resolve_agmarknet_entities("Telangana", "Rangareddy", "Rice")
+    assert first == {"success": True, "ids": {"state_id": 36, "dist_id": 501, "cmdt_id": 3}}
+    assert handler.hits["dashboard-filters"] == 1
+
+    # A fresh worker: empty tool-level cache and empty LRU, same SQLite file.
+    monkeypatch.setattr(market_agmarknet_tool, "_filters_cache", {})
+    restarted = CatalogCache(path)
+    monkeypatch.setattr(market_agent, "get_catalog_cache", lambda: restarted)
+    again = await market_agent.resolve_agmarknet_entities("Telangana", "Rangareddy", "Rice")
+    restarted.close()
+    assert again == first
+    assert handler.hits["dashboard-filters"] == 1
+
+
+async def test_concurrent_enam_misses_are_single_flighted(stub):
+    handler, _, _ = stub
+    handler.delay = 0.05
+    results = await asyncio.gather(
+        *(market_agent.resolve_enam_entities("Telangana", "Shadnagar", "Cotton", "2026-10-19", "2026-10-19")
+          for _ in range(10))
+    )
+    assert all(r["ids"]["apmcs"] == ["Shadnagar"] for r in results)
+    assert handler.hits["states_name"] == 1
+    assert handler.hits["apmc_list"] == 1
+
+
+async def test_enam_commodity_list_and_gemma_pick_are_cached(stub):
+    handler, _, _ = stub
+    en_ids = await market_agent.resolve_enam_entities("Telangana", "all", "Kapas", "2026-10-19", "2026-10-19")
+    for _ in range(3):
+        res = await market_agent.fetch_enam_prices_by_id(en_ids, "2026-10-19")
+        assert sorted(r["apmc"] for r in res["data"]) == ["Shadnagar", "Warangal"]
+        assert {r["commodity"] for r in res["data"]} == {"Cotton"}
+    assert handler.hits["commodity_list"] == 2  # once per APMC
+    assert handler.hits["completions"] == 1  # same term + options -> one Gemma call
+    assert handler.hits["trade_data_list"] == 6
+
+
+async def test_agmarknet_dates_are_fetched_concurrently(stub):
+    handler, _, _ = stub
+    handler.delay = 0.2
+    ag_ids = {"ids": {"state_id": 36, "dist_id": 501, "cmdt_id": 3}}
+    started = time.perf_counter()
+    res = await market_agent.fetch_agmarknet_prices_by_id(ag_ids, "2026-10-19")
+    elapsed = time.perf_counter() - started
+    assert [r["date"] for r in res["data"]] == [
+        "2026-10-19", "2026-10-18", "2026-10-17", "2026-10-16", "2026-10-15"
+    ]
+    assert handler.hits["dashboard-data"] == 5
+    assert elapsed < 0.6
+
+
+async def test_ttl_lru_and_failed_loads(tmp_path):
+    now = [1000.0]
+    cache = CatalogCache(tmp_path / "c.sqlite3", max_entries=2, clock=lambda: now[0])
+    calls = Counter()
+
+    def loader(key, value):
+        async def load():
+            calls[key] += 1
+            return value
+        return load
+
+    assert await cache.get_or_load("a", loader("a", [1]), ttl=60) == [1]
+    assert await cache.get_or_load("a", loader("a", [2]), ttl=60) == [1]
+    now[0] += 61
+    assert cache.get("a") is None
+    assert await cache.get_or_load("a", loader("a", [2]), ttl=60) == [2]
+    assert calls["a"] == 2
+
+    # upstream failure: nothing cached, stale value served
+    assert await cache.get_or_load("b", loader("b", None), ttl=60) is None
+    assert await cache.get_or_load("b", loader("b", {"x": 1}), ttl=60) == {"x": 1}
+    now[0] += 61
+    assert await cache.get_or_load("b", loader("b", None), ttl=60) == {"x": 1}
+    assert calls["b"] == 3
+
+    # memory tier is bounded; evicted keys are still read back from disk
+    await cache.get_or_load("c", loader("c", "cv"), ttl=60)
+    await cache.get_or_load("d", loader("d", "dv"), ttl=60)
+    assert len(cache._memory) == 2
+    assert cache.get("c") == "cv"
+    assert calls["c"] == 1
+
+    now[0] += 61
+    assert cache.purge_expired() == 4
+    cache.close()
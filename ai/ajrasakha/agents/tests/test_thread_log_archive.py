@@ -0,0 +1,164 @@
+"""Tests for rolling gzip archival of per-thread log files."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from ajrasakha.agents import thread_log_archive as tla
+from ajrasakha.agents import thread_logging as tl
+
+
+@pytest.fixture(autouse=True)
+def _local_logs(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(tl, "mongo_thread_log_enabled", lambda: False)
+    monkeypatch.setattr(tl, "thread_log_dir", lambda: tmp_path)
+    tl._turn_counts.clear()
+    yield
+    tl.clear_thread_log_context()
+    tl._turn_counts.clear()
+
+
+def _run_turns(thread_id: str, count: int) -> None:
+    tl.set_thread_log_context(thread_id)
+    for n in range(count):
+        tl.begin_conversation_turn(f"question {n + 1} about wheat rust in Punjab")
+        for step in range(5):
+            tl.append_thread_block(f"  │ planner step {step}: resolved crop=wheat state=Punjab")
+        tl.end_conversation_turn(f"answer {n + 1}: spray propiconazole", outcome="answer")
+    tl.clear_thread_log_context()
+
+
+def _disk_usage(tmp_path: Path) -> int:
+    return sum(p.stat().st_size for p in tmp_path.rglob("*") if p.is_file())
+
+
+def test_thousands_of_turns_rotate_into_compressed_segments(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("THREAD_LOG_ROTATE_BYTES", str(64 * 1024))
+    _run_turns("thread-long", 3000)
+
+    log_path = tmp_path / "thread-long.txt"
+    manifest = tla.load_manifest(log_path)
+    segments = manifest["segments"]
+    assert len(segments) > 10
+    raw_total = sum(s["raw_bytes"] for s in segments) + log_path.stat().st_size
+
+    # disk: active segment stays under the threshold, archive is compressed
+    assert log_path.stat().st_size < 64 * 1024
+    assert _disk_usage(tmp_path) < raw_total * 0.2
+
+    # segment offsets tile the logical log
+    offset = 0
+    for seg in segments:
+        assert seg["offset"] == offset
+        offset += seg["raw_bytes"]
+    assert segments[0]["first_turn"] == 1
+    assert all(b["first_turn"] == a["last_turn"] + 1 for a, b in zip(segments, segments[1:]))
+
+    # hot-path reads only touch the active segment + manifest
+    def _no_segment_reads(*args, **kwargs):
+        raise AssertionError("archived segment read on hot path")
+
+    with monkeypatch.context() as m:
+        m.setattr(tla, "read_segment", _no_segment_reads)
+        start = time.perf_counter()
+        for _ in range(100):
+            assert tl._max_turn_from_log("thread-long") == 3000
+        per_call_ms = (time.perf_counter() - start) * 10
+    assert per_call_ms < 20
+
+    # archived turns are recoverable intact
+    first = tl._extract_turn_text_from_file("thread-long", 1)
+    assert "question 1 about wheat rust" in first
+    assert "END TURN 1\n" in first
+    middle = tl._extract_turn_text_from_file("thread-long", 1500)
+    assert "answer 1500: spray propiconazole" in middle
+    assert "TURN 1501 " not in middle
+
+    full = tl._read_thread_log_text("thread-long")
+    assert len(full.encode("utf-8")) == raw_total
+    assert full.count("END TURN") == 3000
+
+
+def test_turn_numbering_continues_after_rotation(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("THREAD_LOG_ROTATE_BYTES", "1")
+    _run_turns("thread-rot", 3)
+    assert (tmp_path / "thread-rot.txt").stat().st_size == 0
+
+    tl._turn_counts.clear()
+    monkeypatch.setenv("THREAD_LOG_ROTATE_BYTES", "0")
+    _run_turns("thread-rot", 1)
+    text = (tmp_path / "thread-rot.txt").read_text(encoding="utf-8")
+    assert "#  TURN 4 " in text
+    assert [s["last_turn"] for s in tla.load_manifest(tmp_path / "thread-rot.txt")["segments"]] == [1, 2, 3]
+
+
+def test_age_based_rotation(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("THREAD_LOG_ROTATE_BYTES", "0")
+    monkeypatch.setenv("THREAD_LOG_ROTATE_AGE_HOURS", "1")
+    _run_turns("thread-age", 1)
+    log_path = tmp_path / "thread-age.txt"
+    assert not tla.should_rotate(log_path)
+
+    later = datetime.now(tla._IST) + timedelta(hours=2)
+    assert tla.should_rotate(log_path, now=later)
+    assert tla.rotate(log_path)["last_turn"] == 1
+    assert not tla.should_rotate(log_path, now=later)
+
+
+def test_compression_runs_outside_the_append_lock(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("THREAD_LOG_ROTATE_BYTES", "1")
+    compressing = threading.Event()
+    release = threading.Event()
+    real_compress = tla._compress
+
+    def slow_compress(*args, **kwargs):
+        compressing.set()
+        assert release.wait(5)
+        return real_compress(*args, **kwargs)
+
+    monkeypatch.setattr(tla, "_compress", slow_compress)
+    rotating = threading.Thread(target=_run_turns, args=("thread-slow", 1))
+    rotating.start()
+    assert compressing.wait(5)
+
+    # another thread appends while thread-slow's segment is being compressed
+    start = time.perf_counter()
+    tl.append_thread_block("other thread still logging", thread_id="thread-other")
+    assert time.perf_counter() - start < 1
+    assert (tmp_path / "thread-other.txt").read_text(encoding="utf-8") == "other thread still logging\n"
+
+    # the pending segment stays visible to readers until it is compressed
+    log_path = tmp_path / "thread-slow.txt"
+    assert log_path.stat().st_size == 0
+    assert tla.archived_max_turn(log_path) == 1
+    assert tl._max_turn_from_log("thread-slow") == 1
+
+    release.set()
+    rotating.join(5)
+    assert not rotating.is_alive()
+    assert [s["file"] for s in tla.load_manifest(log_path)["segments"]] == ["seg-000001.log.gz"]
+    assert not list(tla.archive_dir(log_path).glob("seg-*.log"))
+    assert "END TURN 1" in tl._read_thread_log_text("thread-slow")
+
+
+def test_segments_left_pending_are_compressed_by_the_next_rotation(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("THREAD_LOG_ROTATE_BYTES", "0")
+    _run_turns("thread-crash", 1)
+    log_path = tmp_path / "thread-crash.txt"
+    pending = tla.detach(log_path)  # e.g. the process died before compressing
+    assert pending is not None and pending.name == "seg-000001.log"
+    assert "answer 1" in tl._extract_turn_text_from_file("thread-crash", 1)
+
+    tl._turn_counts.clear()
+    _run_turns("thread-crash", 1)
+    assert "#  TURN 2 " in log_path.read_text(encoding="utf-8")
+    assert tla.rotate(log_path)["last_turn"] == 2
+    segments = tla.load_manifest(log_path)["segments"]
+    assert [(s["file"], s["first_turn"], s["offset"]) for s in segments] == [
+        ("seg-000001.log.gz", 1, 0),
+        ("seg-000002.log.gz", 2, segments[0]["raw_bytes"]),
+    ]
+    assert tl._read_thread_log_text("thread-crash").count("END TURN") == 2
@@ -56,36 +56,36 @@ def test_sync_turn_to_mongo_pushes_turn_without_text(tmp_path: Path, monkeypatch
     assert filter_doc == {"_id": "thread-abc"}
     assert update_doc["$push"]["turns"] == turn_record
     assert "text" not in update_doc.get("$set", {})
-    assert update_doc["$unset"] == {"text": ""}
+    assert update_doc["$unset"] == {"text": "", "full_logs": ""}
+    assert update_doc["$max"] == {"max_turn": 1}
     assert "updated_at" in update_doc["$set"]
     assert mock_col.update_one.call_args[1]["upsert"] is True
 
 
-def test_sync_missing_turns_only_pushes_absent(tmp_path: Path, monkeypatch):
+def test_sync_missing_turns_only_pushes_above_watermark(monkeypatch):
     monkeypatch.setenv("GOLDEN_MONGODB_URI", "mongodb://localhost:27017")
     mock_col = MagicMock()
+    mock_col.find.return_value = [{"_id": "thread-abc", "max_turn": 1, "turn_count": 1}]
     monkeypatch.setattr(tlm, "_collection", mock_col)
-    monkeypatch.setattr(
-        tlm,
-        "read_thread_turns",
-        lambda thread_id: [{"turn": 2, "user_message": "punjab"}],
-    )
 
     records = [
         {"turn": 1, "user_message": "disease", "log_text": "turn1"},
+        {"turn": 3, "user_message": "again", "log_text": "turn3"},
         {"turn": 2, "user_message": "punjab", "log_text": "turn2"},
     ]
-    tlm.sync_completed_turns_to_mongo(
-        "thread-abc",
-        records,
-        full_logs="full file text",
-        background=False,
-    )
+    tlm.sync_completed_turns_to_mongo("thread-abc", records, background=False)
 
+    mock_col.find.assert_called_once_with(
+        {"_id": {"$in": ["thread-abc"]}},
+        {"max_turn": 1, "turn_count": 1},
+        max_time_ms=tlm._MONGO_OP_TIMEOUT_MS,
+    )
     mock_col.update_one.assert_called_once()
     _, update_doc = mock_col.update_one.call_args[0]
-    assert update_doc["$push"]["turns"]["turn"] == 1
-    assert update_doc["$set"]["full_logs"] == "full file text"
+    assert [t["turn"] for t in update_doc["$push"]["turns"]["$each"]] == [2, 3]
+    assert update_doc["$max"] == {"max_turn": 3}
+    assert update_doc["$inc"] == {"turn_count": 2}
+    assert "full_logs" not in update_doc["$set"]
 
 
 def test_sync_turn_to_mongo_swallows_errors(tmp_path: Path, monkeypatch):
@@ -157,6 +157,21 @@ def test_sync_thread_log_file_replaces_document(tmp_path: Path, monkeypatch):
     assert "max_time_ms" not in mock_col.update_one.call_args[1]
 
 
+def test_background_file_sync_uses_the_shared_pool(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("GOLDEN_MONGODB_URI", "mongodb://localhost:27017")
+    monkeypatch.delenv("THREAD_LOG_MONGO_SYNC", raising=False)
+    mock_col = MagicMock()
+    monkeypatch.setattr(tlm, "_collection", mock_col)
+    log_file = tmp_path / "thread-abc.txt"
+    log_file.write_text("full turn log\n", encoding="utf-8")
+
+    for _ in range(3):
+        tlm.sync_thread_log_file_to_mongo("thread-abc", file_path=log_file)
+    # shutting the pool down waits for the queued writes
+    tlm._shutdown_executor()
+    assert mock_col.update_one.call_count == 3
+
+
 def test_sync_thread_log_file_swallows_errors(tmp_path: Path, monkeypatch):
     monkeypatch.setenv("GOLDEN_MONGODB_URI", "mongodb://localhost:27017")
     mock_col = MagicMock()
@@ -192,6 +207,20 @@ def test_read_thread_log_text_from_turns(monkeypatch):
     )
 
 
+def test_read_max_turn_number_uses_watermark(monkeypatch):
+    monkeypatch.setenv("GOLDEN_MONGODB_URI", "mongodb://localhost:27017")
+    mock_col = MagicMock()
+    mock_col.find_one.return_value = {"max_turn": 7}
+    monkeypatch.setattr(tlm, "_collection", mock_col)
+
+    assert tlm.read_max_turn_number("thread-abc") == 7
+    mock_col.find_one.assert_called_once_with(
+        {"_id": "thread-abc"},
+        {"max_turn": 1},
+        max_time_ms=tlm._MONGO_OP_TIMEOUT_MS,
+    )
+
+
 def test_read_max_turn_number(monkeypatch):
     monkeypatch.setenv("GOLDEN_MONGODB_URI", "mongodb://localhost:27017")
     mock_col = MagicMock()
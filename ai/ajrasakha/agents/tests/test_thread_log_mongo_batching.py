@@ -0,0 +1,134 @@
+"""Batched, watermark-based thread log sync against mongomock."""
+
+import bson
+import mongomock
+import pytest
+
+from ajrasakha.agents import thread_log_mongo as tlm
+
+
+class _MeteredCollection:
+    """Wraps a mongomock collection, recording the BSON size of each update."""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.update_bytes: list[int] = []
+        self.fail_updates = 0
+
+    def find(self, *args, max_time_ms=None, **kwargs):
+        return self._collection.find(*args, **kwargs)
+
+    def find_one(self, *args, max_time_ms=None, **kwargs):
+        return self._collection.find_one(*args, **kwargs)
+
+    def update_one(self, filter_doc, update_doc, **kwargs):
+        if self.fail_updates:
+            self.fail_updates -= 1
+            raise RuntimeError("db down")
+        self.update_bytes.append(len(bson.encode(update_doc)))
+        return self._collection.update_one(filter_doc, update_doc, **kwargs)
+
+
+@pytest.fixture
+def col(monkeypatch):
+    monkeypatch.setenv("GOLDEN_MONGODB_URI", "mongodb://localhost:27017")
+    monkeypatch.delenv("THREAD_LOG_MONGO_SYNC", raising=False)
+    monkeypatch.setattr(tlm, "_MONGO_SYNC_RETRY_BASE_S", 0.01)
+    metered = _MeteredCollection(mongomock.MongoClient()["agriai"]["langgraph_log"])
+    monkeypatch.setattr(tlm, "_collection", metered)
+    monkeypatch.setattr(tlm, "_batcher", tlm._TurnSyncBatcher(linger_s=0.01, max_attempts=4))
+    yield metered
+    tlm.flush_thread_log_mongo(timeout=5)
+    tlm._collection = None
+
+
+def _turn(n: int, size: int = 2000) -> dict:
+    return {
+        "turn": n,
+        "user_message": f"question {n}",
+        "bot_message": f"answer {n}",
+        "log_text": f"#  TURN {n} \n" + "x" * size,
+    }
+
+
+def test_bytes_written_per_turn_stay_flat(col):
+    records: list[dict] = []
+    for n in range(1, 31):
+        records.append(_turn(n))
+        # callers pass every completed turn, as end_conversation_turn does
+        tlm.sync_completed_turns_to_mongo("thread-1", list(records), background=False)
+
+    assert len(col.update_bytes) == 30
+    first, last = col.update_bytes[0], col.update_bytes[-1]
+    print(f"\nbytes written per turn: first={first} last={last} total={sum(col.update_bytes)}")
+    assert last <= first * 1.05
+    # a full_logs snapshot of 30 turns alone would be ~60 KB per write
+    assert sum(col.update_bytes) < 30 * 2500
+
+    doc = col._collection.find_one({"_id": "thread-1"})
+    assert doc["max_turn"] == 30
+    assert [t["turn"] for t in doc["turns"]] == list(range(1, 31))
+    assert tlm.read_max_turn_number("thread-1") == 30
+    assert tlm.read_thread_log_text("thread-1").count("#  TURN") == 30
+
+
+def test_batcher_writes_each_thread_once_per_pass(col):
+    for n in range(1, 4):
+        tlm.sync_completed_turns_to_mongo("thread-a", [_turn(n, 10)])
+        tlm.sync_completed_turns_to_mongo("thread-b", [_turn(n, 10)])
+    # re-submitting a queued turn does not duplicate it
+    tlm.sync_completed_turns_to_mongo("thread-a", [_turn(3, 10)])
+    assert tlm.flush_thread_log_mongo(timeout=5)
+
+    assert len(col.update_bytes) == 2
+    for tid in ("thread-a", "thread-b"):
+        doc = col._collection.find_one({"_id": tid})
+        assert [t["turn"] for t in doc["turns"]] == [1, 2, 3]
+        assert doc["max_turn"] == 3
+
+
+def test_batcher_retries_failed_thread_with_backoff(col):
+    col.fail_updates = 2
+    tlm.sync_completed_turns_to_mongo("thread-r", [_turn(1, 10), _turn(2, 10)])
+    assert tlm.flush_thread_log_mongo(timeout=5)
+
+    doc = col._collection.find_one({"_id": "thread-r"})
+    assert [t["turn"] for t in doc["turns"]] == [1, 2]
+    assert len(tlm._batcher) == 0
+
+
+def test_legacy_document_without_watermark(col):
+    col._collection.insert_one({
+        "_id": "thread-old",
+        "turns": [{"turn": 1, "log_text": "one"}, {"turn": 2, "log_text": "two"}],
+        "full_logs": "stale snapshot",
+    })
+    assert tlm.read_max_turn_number("thread-old") == 2
+
+    tlm.sync_completed_turns_to_mongo(
+        "thread-old", [_turn(1, 10), _turn(2, 10), _turn(3, 10)], background=False
+    )
+    doc = col._collection.find_one({"_id": "thread-old"})
+    assert [t["turn"] for t in doc["turns"]] == [1, 2, 3]
+    assert doc["max_turn"] == 3
+    assert "full_logs" not in doc
+
+
+def test_turn_dropped_below_the_watermark_is_repaired(col):
+    tlm.sync_completed_turns_to_mongo("thread-g", [_turn(1, 10)], background=False)
+    # turn 2 never reached Mongo, but turn 3 did
+    tlm.sync_completed_turns_to_mongo("thread-g", [_turn(3, 10)], background=False)
+    doc = col._collection.find_one({"_id": "thread-g"})
+    assert (doc["max_turn"], doc["turn_count"]) == (3, 2)
+
+    # the next full-file sync carries every completed turn and fills the gap in order
+    records = [_turn(n, 10) for n in range(1, 5)]
+    tlm.sync_completed_turns_to_mongo("thread-g", records, background=False)
+    doc = col._collection.find_one({"_id": "thread-g"})
+    assert [t["turn"] for t in doc["turns"]] == [1, 2, 3, 4]
+    assert (doc["max_turn"], doc["turn_count"]) == (4, 4)
+
+    # once whole again, writes go back to pushing only turns above the watermark
+    updates = len(col.update_bytes)
+    tlm.sync_completed_turns_to_mongo("thread-g", records, background=False)
+    assert len(col.update_bytes) == updates
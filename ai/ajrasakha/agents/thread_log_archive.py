@@ -0,0 +1,295 @@
+"""Rolling gzip archive for per-thread log files.
+
+The local ``{thread_id}.txt`` file is the *active segment*. When a turn closes
+and the active segment is larger than THREAD_LOG_ROTATE_BYTES or older than
+THREAD_LOG_ROTATE_AGE_HOURS, it is compressed into
+``{thread_id}.archive/seg-NNNNNN.log.gz``. Rotation is two steps: ``detach``
+renames the active segment to a pending ``seg-NNNNNN.log`` under the append
+lock, and ``compress_pending`` gzips it and records it in the manifest without
+that lock. Segments only ever hold closed turns, so hot-path reads (turn
+numbering, the turn just closed) touch the active segment, the small
+``manifest.json`` and any pending segment only.
+
+Manifest entries record, per segment, its turn range and byte offset within the
+logical (uncompressed, concatenated) thread log.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_IST = timezone(timedelta(hours=5, minutes=30))
+_MANIFEST_NAME = "manifest.json"
+_HEAD_BYTES = 4_096
+_END_TURN_RE = re.compile(r"END TURN (\d+)", re.MULTILINE)
+_STARTED_AT_RE = re.compile(r"#  started: (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) IST")
+_SEGMENT_INDEX_RE = re.compile(r"^seg-(\d+)\.")
+_PENDING_SUFFIX = ".log"
+
+# Per-archive locks: compression and manifest writes for one thread log.
+_archive_locks: dict[Path, threading.Lock] = {}
+_archive_locks_guard = threading.Lock()
+
+
+def rotate_max_bytes() -> int:
+    try:
+        return max(0, int(os.getenv("THREAD_LOG_ROTATE_BYTES", str(1024 * 1024))))
+    except ValueError:
+        return 1024 * 1024
+
+
+def rotate_max_age_s() -> float:
+    try:
+        return max(0.0, float(os.getenv("THREAD_LOG_ROTATE_AGE_HOURS", "24"))) * 3600
+    except ValueError:
+        return 24 * 3600.0
+
+
+def archive_dir(log_path: Path) -> Path:
+    return log_path.with_name(f"{log_path.stem}.archive")
+
+
+def _empty_manifest() -> dict[str, Any]:
+    return {"segments": []}
+
+
+def load_manifest(log_path: Path) -> dict[str, Any]:
+    """Segment list for a thread log; empty when nothing has been archived."""
+    path = archive_dir(log_path) / _MANIFEST_NAME
+    if not path.is_file():
+        return _empty_manifest()
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        logger.exception("Unreadable thread log manifest: %s", path)
+        return _empty_manifest()
+    if not isinstance(manifest.get("segments"), list):
+        return _empty_manifest()
+    return manifest
+
+
+def _write_manifest(log_path: Path, manifest: dict[str, Any]) -> None:
+    path = archive_dir(log_path) / _MANIFEST_NAME
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _archive_lock(log_path: Path) -> threading.Lock:
+    with _archive_locks_guard:
+        return _archive_locks.setdefault(log_path, threading.Lock())
+
+
+def _pending_segments(log_path: Path) -> list[Path]:
+    """Detached segments not yet compressed, oldest first."""
+    directory = archive_dir(log_path)
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    return [
+        directory / name
+        for name in sorted(names)
+        if name.startswith("seg-") and name.endswith(_PENDING_SUFFIX)
+    ]
+
+
+def _read_pending(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:  # compressed (and removed) meanwhile
+        return ""
+
+
+def _turn_range(text: str) -> tuple[int, int]:
+    turns = [int(m) for m in _END_TURN_RE.findall(text)]
+    return (min(turns), max(turns)) if turns else (0, 0)
+
+
+def archived_max_turn(log_path: Path) -> int:
+    # Pending first: one compressed meanwhile is then in the manifest read below.
+    pending_max = max(
+        (_turn_range(_read_pending(p))[1] for p in _pending_segments(log_path)), default=0
+    )
+    segments = load_manifest(log_path)["segments"]
+    return max(pending_max, max((int(s.get("last_turn") or 0) for s in segments), default=0))
+
+
+def _active_started_at(log_path: Path) -> datetime | None:
+    """Start time of the first turn in the active segment (read from its header)."""
+    try:
+        with log_path.open("rb") as fh:
+            head = fh.read(_HEAD_BYTES).decode("utf-8", errors="ignore")
+    except OSError:
+        return None
+    match = _STARTED_AT_RE.search(head)
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S").replace(tzinfo=_IST)
+
+
+def should_rotate(
+    log_path: Path,
+    *,
+    max_bytes: int | None = None,
+    max_age_s: float | None = None,
+    now: datetime | None = None,
+) -> bool:
+    max_bytes = rotate_max_bytes() if max_bytes is None else max_bytes
+    max_age_s = rotate_max_age_s() if max_age_s is None else max_age_s
+    try:
+        size = log_path.stat().st_size
+    except OSError:
+        return False
+    if size == 0:
+        return False
+    if max_bytes and size >= max_bytes:
+        return True
+    if max_age_s:
+        started = _active_started_at(log_path)
+        if started is not None:
+            age = ((now or datetime.now(_IST)) - started).total_seconds()
+            return age >= max_age_s
+    return False
+
+
+def _next_segment_index(directory: Path) -> int:
+    # A segment keeps at least one seg-NNNNNN.* name from detach to manifest entry.
+    indices = [0]
+    for name in os.listdir(directory):
+        match = _SEGMENT_INDEX_RE.match(name)
+        if match:
+            indices.append(int(match.group(1)))
+    return max(indices) + 1
+
+
+def detach(log_path: Path) -> Path | None:
+    """Rename the active segment to a pending archive segment; leave it empty.
+
+    Callers must hold the lock that serialises appends to ``log_path`` and only
+    detach at a turn boundary. No segment data is read, so the lock is held for
+    a rename only; ``compress_pending`` does the rest. Returns the pending path.
+    """
+    try:
+        if log_path.stat().st_size == 0:
+            return None
+        directory = archive_dir(log_path)
+        directory.mkdir(parents=True, exist_ok=True)
+        pending = directory / f"seg-{_next_segment_index(directory):06d}{_PENDING_SUFFIX}"
+        os.replace(log_path, pending)
+        log_path.touch()
+    except OSError:
+        logger.exception("Failed to detach thread log for rotation: %s", log_path)
+        return None
+    return pending
+
+
+def _compress(log_path: Path, pending: Path, manifest: dict[str, Any]) -> dict[str, Any] | None:
+    try:
+        raw = pending.read_bytes()
+    except OSError:
+        logger.exception("Failed to read pending thread log segment: %s", pending)
+        return None
+
+    segments = manifest["segments"]
+    offset = sum(int(s.get("raw_bytes") or 0) for s in segments)
+    first_turn, last_turn = _turn_range(raw.decode("utf-8", errors="ignore"))
+    name = f"{pending.name}.gz"
+    seg_path = pending.with_name(name)
+    tmp = seg_path.with_suffix(".gz.tmp")
+    with gzip.open(tmp, "wb", compresslevel=6) as fh:
+        fh.write(raw)
+    os.replace(tmp, seg_path)
+
+    entry = {
+        "file": name,
+        "first_turn": first_turn,
+        "last_turn": last_turn,
+        "offset": offset,
+        "raw_bytes": len(raw),
+        "stored_bytes": seg_path.stat().st_size,
+        "archived_at": datetime.now(_IST).strftime("%Y-%m-%d %H:%M:%S IST"),
+    }
+    segments.append(entry)
+    _write_manifest(log_path, manifest)
+    # Drop the pending copy only once the segment and manifest are durable.
+    pending.unlink()
+    logger.debug(
+        "Archived %s turns %s-%s (%d -> %d bytes)",
+        log_path.name,
+        entry["first_turn"],
+        entry["last_turn"],
+        entry["raw_bytes"],
+        entry["stored_bytes"],
+    )
+    return entry
+
+
+def compress_pending(log_path: Path) -> list[dict[str, Any]]:
+    """Gzip every pending segment of ``log_path`` into the manifest, oldest first.
+
+    Runs without the append lock; also picks up segments left pending by a
+    crash. Returns the new manifest entries.
+    """
+    entries = []
+    with _archive_lock(log_path):
+        for pending in _pending_segments(log_path):
+            manifest = load_manifest(log_path)
+            entry = _compress(log_path, pending, manifest)
+            if entry is None:
+                break
+            entries.append(entry)
+    return entries
+
+
+def rotate(log_path: Path) -> dict[str, Any] | None:
+    """``detach`` + ``compress_pending`` in one call. Returns the new manifest entry.
+
+    Callers must hold the append lock for ``log_path`` (prefer calling the two
+    steps separately so only ``detach`` runs under it).
+    """
+    if detach(log_path) is None:
+        return None
+    entries = compress_pending(log_path)
+    return entries[-1] if entries else None
+
+
+def read_segment(log_path: Path, entry: dict[str, Any]) -> str:
+    try:
+        with gzip.open(archive_dir(log_path) / entry["file"], "rb") as fh:
+            return fh.read().decode("utf-8")
+    except (OSError, KeyError, EOFError):
+        logger.exception("Failed to read thread log segment %s for %s", entry.get("file"), log_path)
+        return ""
+
+
+def segment_text_for_turn(log_path: Path, turn: int) -> str:
+    """Text of the archived (or pending) segment holding ``turn`` ("" if none)."""
+    with _archive_lock(log_path):
+        for entry in load_manifest(log_path)["segments"]:
+            if int(entry.get("first_turn") or 0) <= turn <= int(entry.get("last_turn") or 0):
+                return read_segment(log_path, entry)
+        for pending in _pending_segments(log_path):
+            text = _read_pending(pending)
+            first_turn, last_turn = _turn_range(text)
+            if first_turn <= turn <= last_turn:
+                return text
+    return ""
+
+
+def read_archived_text(log_path: Path) -> str:
+    """All archived and pending segments concatenated, oldest first."""
+    with _archive_lock(log_path):
+        archived = [read_segment(log_path, entry) for entry in load_manifest(log_path)["segments"]]
+        pending = [_read_pending(p) for p in _pending_segments(log_path)]
+    return "".join(archived + pending)
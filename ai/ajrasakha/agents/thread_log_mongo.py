@@ -4,8 +4,17 @@ During a request, logs are written only to the local file (THREAD_LOG_DIR).
 When a turn completes, the turn record is pushed to ``turns[]`` on the thread
 document (one document per thread_id, no top-level ``text`` field).
 
-Writes are queued on a background thread pool (non-blocking for the graph) with
-retries so fast clarify turns are not lost when the worker returns early.
+Only new turns are sent: each thread document carries a ``max_turn`` watermark,
+and a push carries just the turns above it, so a write costs one turn rather
+than the whole conversation. Completed turns are queued for a single background
+writer that drains the queue in batches (one ``$push``/``$each`` per thread) and
+re-queues failed threads with exponential backoff instead of sleeping on a worker.
+
+A ``turn_count`` beside the watermark shows when turns below it are missing
+(e.g. a turn dropped after its retries while a later one got through). For
+such threads the stored turn numbers are read and any missing turn the caller
+passes is pushed back in order, so the full-file sync at the end of each turn
+repairs the gap.
 """
 
 from __future__ import annotations
@@ -13,6 +22,7 @@ from __future__ import annotations
 import atexit
 import logging
 import os
+import random
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
@@ -35,6 +45,7 @@ _executor_lock = threading.Lock()
 _MONGO_OP_TIMEOUT_MS = 5_000
 _MONGO_SYNC_RETRIES = 3
 _MONGO_SYNC_RETRY_BASE_S = 0.2
+_MONGO_SYNC_RETRY_MAX_S = 30.0
 
 
 def _env_flag(name: str, default: bool = False) -> bool:
@@ -44,6 +55,13 @@ def _env_flag(name: str, default: bool = False) -> bool:
     return raw.strip().lower() in ("true", "1", "yes")
 
 
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
 def mongo_thread_log_enabled() -> bool:
     uri = os.getenv("GOLDEN_MONGODB_URI", "").strip()
     if not uri:
@@ -92,7 +110,7 @@ def _get_collection() -> Collection | None:
         if not _init_logged:
             _init_logged = True
             logger.info(
-                "Thread log MongoDB enabled: %s.%s (async turns[] sync with retries)",
+                "Thread log MongoDB enabled: %s.%s (batched turns[] sync, max_turn watermark)",
                 _database_name(),
                 _collection_name(),
             )
@@ -100,7 +118,7 @@ def _get_collection() -> Collection | None:
 
 
 def _get_executor() -> ThreadPoolExecutor:
-    """Shared pool for background Mongo writes (non-daemon workers survive request return)."""
+    """Shared pool for background full-file writes (non-daemon workers survive request return)."""
     global _executor
     with _executor_lock:
         if _executor is None:
@@ -121,48 +139,296 @@ def _shutdown_executor() -> None:
             _executor = None
 
 
-def _sync_turn_to_mongo(
-    thread_id: str,
-    turn_record: dict[str, Any],
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the ``attempt``-th retry (0-based)."""
+    delay = min(_MONGO_SYNC_RETRY_MAX_S, _MONGO_SYNC_RETRY_BASE_S * (2**attempt))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _turn_number(record: dict[str, Any]) -> int:
+    turn = record.get("turn")
+    return turn if isinstance(turn, int) and turn > 0 else 0
+
+
+def _max_turn_in(turns: Any) -> int:
+    if not isinstance(turns, list):
+        return 0
+    return max((_turn_number(t) for t in turns if isinstance(t, dict)), default=0)
+
+
+def _read_watermarks(
+    col: Collection,
+    thread_ids: list[str],
+) -> tuple[dict[str, int], dict[str, set[int]]]:
+    """Highest stored turn per thread, plus stored turn numbers where they are needed.
+
+    The mark comes from the ``max_turn`` field. Stored turn numbers are read
+    (turn bodies are not fetched) for documents with a gap below the mark
+    (``turn_count`` < ``max_turn``) and for documents written before
+    ``max_turn``/``turn_count`` existed.
+    """
+    marks: dict[str, int] = {}
+    itemized: list[str] = []
+    for doc in col.find(
+        {"_id": {"$in": thread_ids}},
+        {"max_turn": 1, "turn_count": 1},
+        max_time_ms=_MONGO_OP_TIMEOUT_MS,
+    ):
+        mark, count = doc.get("max_turn"), doc.get("turn_count")
+        if isinstance(mark, int) and isinstance(count, int):
+            marks[doc["_id"]] = mark
+            if count < mark:
+                itemized.append(doc["_id"])
+        else:
+            itemized.append(doc["_id"])
+
+    stored: dict[str, set[int]] = {}
+    if itemized:
+        for doc in col.find(
+            {"_id": {"$in": itemized}},
+            {"turns.turn": 1},
+            max_time_ms=_MONGO_OP_TIMEOUT_MS,
+        ):
+            turns = doc.get("turns")
+            numbers = {_turn_number(t) for t in turns if isinstance(t, dict)} if isinstance(turns, list) else set()
+            numbers.discard(0)
+            stored[doc["_id"]] = numbers
+            marks[doc["_id"]] = max(marks.get(doc["_id"], 0), max(numbers, default=0))
+    return marks, stored
+
+
+def _turns_update(
+    records: list[dict[str, Any]],
     *,
-    full_logs: str | None = None,
-) -> None:
-    """Push one turn to turns[] on the thread document (with retries)."""
-    col = _get_collection()
-    if col is None:
-        return
+    turn_count: int | None = None,
+    in_order: bool = False,
+) -> dict[str, Any]:
+    """Update document appending ``records`` (sorted by turn).
 
+    ``turn_count`` replaces the stored count (otherwise it grows by the number
+    of records); ``in_order`` re-sorts turns[] for records filling a gap.
+    """
     now = datetime.now(timezone.utc)
-    set_fields: dict[str, Any] = {"updated_at": now}
-    if full_logs is not None:
-        set_fields["full_logs"] = full_logs
-
-    update_doc: dict[str, Any] = {
-        "$push": {"turns": turn_record},
-        "$set": set_fields,
-        "$unset": {"text": ""},
+    if in_order:
+        push: Any = {"$each": records, "$sort": {"turn": 1}}
+    else:
+        push = records[0] if len(records) == 1 else {"$each": records}
+    update: dict[str, Any] = {
+        "$push": {"turns": push},
+        "$max": {"max_turn": _turn_number(records[-1])},
+        "$set": {"updated_at": now},
+        # full_logs was a per-turn snapshot of the whole file; drop it so
+        # readers fall back to turns[] instead of a stale copy.
+        "$unset": {"text": "", "full_logs": ""},
         "$setOnInsert": {"created_at": now},
     }
+    if turn_count is None:
+        update["$inc"] = {"turn_count": len(records)}
+    else:
+        update["$set"]["turn_count"] = turn_count
+    return update
 
-    last_exc: Exception | None = None
-    for attempt in range(_MONGO_SYNC_RETRIES):
+
+def _write_turns(
+    col: Collection,
+    batch: dict[str, list[dict[str, Any]]],
+) -> set[str]:
+    """Push turns missing from each thread's document; returns the thread ids that failed."""
+    try:
+        marks, stored = _read_watermarks(col, list(batch))
+    except Exception as exc:
+        logger.warning("Failed to read thread log watermarks (%d threads): %s", len(batch), exc)
+        return set(batch)
+
+    failed: set[str] = set()
+    for thread_id, records in batch.items():
+        mark = marks.get(thread_id, 0)
+        have = stored.get(thread_id)
+        if have is None:
+            fresh = sorted((r for r in records if _turn_number(r) > mark), key=_turn_number)
+        else:
+            by_turn = {_turn_number(r): r for r in records if _turn_number(r) not in have}
+            by_turn.pop(0, None)
+            fresh = [by_turn[n] for n in sorted(by_turn)]
+        if not fresh:
+            continue
+        if have is None:
+            update = _turns_update(fresh)
+        else:
+            update = _turns_update(
+                fresh,
+                turn_count=len(have) + len(fresh),
+                in_order=_turn_number(fresh[0]) < mark,
+            )
         try:
-            col.update_one(
-                {"_id": thread_id},
-                update_doc,
-                upsert=True,
+            col.update_one({"_id": thread_id}, update, upsert=True)
+        except Exception as exc:
+            logger.warning("Failed to sync turn log to MongoDB for %s: %s", thread_id, exc)
+            failed.add(thread_id)
+            continue
+        logger.debug(
+            "Synced %d turn(s) to Mongo for thread %s (turns=%s)",
+            len(fresh),
+            thread_id,
+            [_turn_number(r) for r in fresh],
+        )
+    return failed
+
+
+class _TurnSyncBatcher:
+    """Single background writer for completed turns.
+
+    Records are keyed by (thread, turn), so a turn re-submitted before the
+    writer runs is written once. Each pass waits ``linger_s`` to gather more
+    turns, then writes everything that is due with one watermark read. A
+    thread whose write fails is re-queued with backoff; other threads keep
+    flowing.
+    """
+
+    def __init__(
+        self,
+        *,
+        linger_s: float = 0.05,
+        max_attempts: int = 6,
+    ) -> None:
+        self.linger_s = linger_s
+        self.max_attempts = max(1, max_attempts)
+        self._cond = threading.Condition()
+        self._pending: dict[str, dict[int, dict[str, Any]]] = {}
+        self._attempts: dict[str, int] = {}
+        self._not_before: dict[str, float] = {}
+        self._busy = False
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        with self._cond:
+            return sum(len(turns) for turns in self._pending.values())
+
+    def submit(self, thread_id: str, records: list[dict[str, Any]]) -> None:
+        with self._cond:
+            turns = self._pending.setdefault(thread_id, {})
+            for record in records:
+                if _turn_number(record):
+                    turns[_turn_number(record)] = record
+            if not turns:
+                del self._pending[thread_id]
+                return
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="thread-log-mongo",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until the queue is empty; returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._busy,
+                timeout=timeout,
             )
+
+    def _next_due(self) -> float | None:
+        if not self._pending:
+            return None
+        return min(self._not_before.get(tid, 0.0) for tid in self._pending)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    due = self._next_due()
+                    if due is None:
+                        self._cond.wait()
+                        continue
+                    wait = due - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                self._busy = True
+
+            if self.linger_s > 0:
+                time.sleep(self.linger_s)
+
+            with self._cond:
+                now = time.monotonic()
+                batch = {
+                    tid: list(turns.values())
+                    for tid, turns in self._pending.items()
+                    if self._not_before.get(tid, 0.0) <= now
+                }
+                for tid in batch:
+                    del self._pending[tid]
+
+            failed: set[str] = set(batch)
+            try:
+                col = _get_collection()
+                failed = _write_turns(col, batch) if col is not None else set()
+            except Exception:
+                logger.exception("Thread log Mongo batch failed (%d threads)", len(batch))
+            finally:
+                with self._cond:
+                    self._requeue(batch, failed)
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _requeue(self, batch: dict[str, list[dict[str, Any]]], failed: set[str]) -> None:
+        for tid in batch:
+            if tid not in failed:
+                self._attempts.pop(tid, None)
+                self._not_before.pop(tid, None)
+                continue
+            attempt = self._attempts.get(tid, 0) + 1
+            if attempt >= self.max_attempts:
+                logger.error(
+                    "Dropping %d turn(s) for %s after %d failed MongoDB attempts",
+                    len(batch[tid]),
+                    tid,
+                    attempt,
+                )
+                self._attempts.pop(tid, None)
+                self._not_before.pop(tid, None)
+                continue
+            self._attempts[tid] = attempt
+            self._not_before[tid] = time.monotonic() + _backoff_delay(attempt - 1)
+            turns = self._pending.setdefault(tid, {})
+            for record in batch[tid]:
+                # a newer submission of the same turn wins
+                turns.setdefault(_turn_number(record), record)
+
+
+_batcher = _TurnSyncBatcher(
+    linger_s=_env_float("THREAD_LOG_MONGO_BATCH_MS", 50) / 1000,
+    max_attempts=int(_env_float("THREAD_LOG_MONGO_RETRIES", 6)),
+)
+
+
+def flush_thread_log_mongo(timeout: float | None = None) -> bool:
+    """Wait for queued turn writes to reach MongoDB (tests, shutdown)."""
+    return _batcher.flush(timeout)
+
+
+atexit.register(flush_thread_log_mongo, _env_float("THREAD_LOG_MONGO_FLUSH_TIMEOUT_S", 10))
+
+
+def _sync_turns_blocking(thread_id: str, turn_records: list[dict[str, Any]]) -> None:
+    """Write missing turns inline, retrying with backoff (THREAD_LOG_MONGO_SYNC / tests)."""
+    col = _get_collection()
+    if col is None:
+        return
+
+    for attempt in range(_MONGO_SYNC_RETRIES):
+        if not _write_turns(col, {thread_id: turn_records}):
             return
-        except Exception as exc:
-            last_exc = exc
-            if attempt < _MONGO_SYNC_RETRIES - 1:
-                time.sleep(_MONGO_SYNC_RETRY_BASE_S * (attempt + 1))
+        if attempt < _MONGO_SYNC_RETRIES - 1:
+            time.sleep(_backoff_delay(attempt))
 
-    logger.exception(
-        "Failed to sync turn log to MongoDB for %s after %d attempts: %s",
+    logger.error(
+        "Failed to sync turn log to MongoDB for %s after %d attempts",
         thread_id,
         _MONGO_SYNC_RETRIES,
-        last_exc,
     )
 
 
@@ -170,7 +436,6 @@ def sync_turn_to_mongo(
     thread_id: str,
     turn_record: dict[str, Any],
     *,
-    full_logs: str | None = None,
     background: bool = True,
 ) -> None:
     """Push a completed turn to MongoDB turns[] on the thread document.
@@ -180,86 +445,54 @@ def sync_turn_to_mongo(
     sync_completed_turns_to_mongo(
         thread_id,
         [turn_record],
-        full_logs=full_logs,
         background=background,
     )
 
 
-def _sync_missing_turns_impl(
-    thread_id: str,
-    turn_records: list[dict[str, Any]],
-    *,
-    full_logs: str | None = None,
-) -> None:
-    """Push any turn records not yet present in Mongo (by turn number)."""
-    if not turn_records:
-        return
-
-    existing_nums: set[int] = set()
-    for item in read_thread_turns(thread_id):
-        if isinstance(item, dict):
-            turn = item.get("turn")
-            if isinstance(turn, int) and turn > 0:
-                existing_nums.add(turn)
-
-    missing = sorted(
-        (r for r in turn_records if isinstance(r.get("turn"), int) and r["turn"] not in existing_nums),
-        key=lambda r: r["turn"],
-    )
-    if not missing:
-        return
-
-    for idx, record in enumerate(missing):
-        is_last = idx == len(missing) - 1
-        _sync_turn_to_mongo(
-            thread_id,
-            record,
-            full_logs=full_logs if is_last else None,
-        )
-
-    logger.info(
-        "Synced %d missing turn(s) to Mongo for thread %s (turns=%s)",
-        len(missing),
-        thread_id,
-        [r["turn"] for r in missing],
-    )
-
-
 def sync_completed_turns_to_mongo(
     thread_id: str,
     turn_records: list[dict[str, Any]],
     *,
-    full_logs: str | None = None,
     background: bool = True,
 ) -> None:
-    """Push all completed turns that are not yet stored in Mongo (non-blocking by default)."""
+    """Push completed turns above the stored watermark (non-blocking by default).
+
+    Callers may pass every completed turn; only turns newer than the thread's
+    ``max_turn`` are written, plus any older turn the document is missing.
+    """
     if not thread_id or not mongo_thread_log_enabled() or not turn_records:
         return
 
     sync_blocking = not background or _env_flag("THREAD_LOG_MONGO_SYNC")
     if sync_blocking:
-        _sync_missing_turns_impl(thread_id, turn_records, full_logs=full_logs)
+        _sync_turns_blocking(thread_id, turn_records)
         return
 
-    _get_executor().submit(
-        _sync_missing_turns_impl,
-        thread_id,
-        turn_records,
-        full_logs=full_logs,
-    )
+    _batcher.submit(thread_id, turn_records)
 
 
 def read_max_turn_number(thread_id: str) -> int:
-    """Highest completed turn number stored in Mongo for this thread."""
-    turns = read_thread_turns(thread_id)
-    nums: list[int] = []
-    for item in turns:
-        if not isinstance(item, dict):
-            continue
-        turn = item.get("turn")
-        if isinstance(turn, int) and turn > 0:
-            nums.append(turn)
-    return max(nums) if nums else 0
+    """Highest completed turn number stored in Mongo for this thread (the watermark)."""
+    if not thread_id:
+        return 0
+
+    col = _get_collection()
+    if col is None:
+        return 0
+
+    try:
+        doc = col.find_one(
+            {"_id": thread_id},
+            {"max_turn": 1},
+            max_time_ms=_MONGO_OP_TIMEOUT_MS,
+        )
+    except Exception:
+        logger.exception("Failed to read thread watermark from MongoDB for %s", thread_id)
+        return 0
+    if doc and isinstance(doc.get("max_turn"), int):
+        return doc["max_turn"]
+    # Documents written before the watermark existed.
+    return _max_turn_in(read_thread_turns(thread_id))
 
 
 def read_thread_turns(thread_id: str) -> list[dict[str, Any]]:
@@ -287,7 +520,7 @@ def read_thread_turns(thread_id: str) -> list[dict[str, Any]]:
 
 
 def read_thread_log_text(thread_id: str) -> str:
-    """Read accumulated log text for a thread (full_logs, then turns[], then legacy text)."""
+    """Read accumulated log text for a thread (legacy full_logs, then turns[], then legacy text)."""
     if not thread_id:
         return ""
 
@@ -4,6 +4,8 @@ Set context at graph node entry; a root logging handler routes records to the
 matching file while that context is active.
 
 Multi-turn: each new farmer message opens a beautified TURN block in the same file.
+Closed turns are rolled into gzip segments once the file grows too large or old
+(see :mod:`ajrasakha.agents.thread_log_archive`).
 """
 
 from __future__ import annotations
@@ -24,6 +26,7 @@ from typing import Any, Callable, TypeVar
 
 from langchain_core.runnables import RunnableConfig
 
+from ajrasakha.agents import thread_log_archive
 from ajrasakha.agents.config import resolve_thread_id
 from ajrasakha.agents.thread_log_mongo import (
     mongo_thread_log_enabled,
@@ -59,6 +62,7 @@ _BOT_MESSAGE_RE = re.compile(
 _OUTCOME_RE = re.compile(r"── bot reply \(turn \d+\) \| outcome=(\w+)")
 _STARTED_AT_RE = re.compile(r"#  started: (.+)")
 _BOX_WIDTH = 76
+_TAIL_BYTES = 64 * 1024
 
 # Thread log files: application logs only (skip httpx / MCP transport noise).
 _THREAD_LOG_LOGGER_PREFIX = "ajrasakha"
@@ -114,7 +118,7 @@ def _thread_log_path(thread_id: str) -> Path:
 
 
 def _read_local_thread_log_text(thread_id: str) -> str:
-    """Read accumulated log text from the local file only (never blocks on MongoDB)."""
+    """Read the active segment of the local log (never blocks on MongoDB or the archive)."""
     path = _thread_log_path(thread_id)
     if not path.is_file():
         return ""
@@ -124,9 +128,22 @@ def _read_local_thread_log_text(thread_id: str) -> str:
         return ""
 
 
+def _read_local_tail(thread_id: str, nbytes: int = _TAIL_BYTES) -> str:
+    """Read the last ``nbytes`` of the active segment."""
+    path = _thread_log_path(thread_id)
+    try:
+        with path.open("rb") as fh:
+            size = fh.seek(0, os.SEEK_END)
+            fh.seek(max(0, size - nbytes))
+            return fh.read().decode("utf-8", errors="ignore")
+    except OSError:
+        return ""
+
+
 def _read_thread_log_text(thread_id: str) -> str:
-    """Read log text: local file first, then MongoDB (for offline/admin reads only)."""
-    text = _read_local_thread_log_text(thread_id)
+    """Read log text: local archive + active segment, then MongoDB (offline/admin reads only)."""
+    path = _thread_log_path(thread_id)
+    text = thread_log_archive.read_archived_text(path) + _read_local_thread_log_text(thread_id)
     if text:
         return text
     if mongo_thread_log_enabled():
@@ -136,11 +153,13 @@ def _read_thread_log_text(thread_id: str) -> str:
 
 def _max_turn_from_log(thread_id: str) -> int:
     """Read highest completed turn from local file, then Mongo (for multi-replica / restart)."""
-    text = _read_local_thread_log_text(thread_id)
-    local_max = 0
-    if text:
-        turns = [int(m) for m in _END_TURN_RE.findall(text)]
-        local_max = max(turns) if turns else 0
+    text = _read_local_tail(thread_id)
+    turns = [int(m) for m in _END_TURN_RE.findall(text)]
+    if not turns and len(text.encode("utf-8")) >= _TAIL_BYTES:
+        # One turn longer than the tail window: scan the whole active segment.
+        turns = [int(m) for m in _END_TURN_RE.findall(_read_local_thread_log_text(thread_id))]
+    local_max = max(turns) if turns else 0
+    local_max = max(local_max, thread_log_archive.archived_max_turn(_thread_log_path(thread_id)))
 
     mongo_max = 0
     if mongo_thread_log_enabled():
@@ -159,9 +178,21 @@ def _get_active_turn(thread_id: str | None) -> dict[str, Any] | None:
 
 
 def _extract_turn_text_from_file(thread_id: str, turn: int) -> str:
-    """Extract one turn block from the local log file (authoritative for Mongo log_text)."""
-    text = _read_local_thread_log_text(thread_id)
-    if not text or turn <= 0:
+    """Extract one turn block from the local log (authoritative for Mongo log_text).
+
+    Looks in the active segment first, then in the archived segment for ``turn``.
+    """
+    if turn <= 0:
+        return ""
+    block = _extract_turn_block(_read_local_thread_log_text(thread_id), turn)
+    if block:
+        return block
+    archived = thread_log_archive.segment_text_for_turn(_thread_log_path(thread_id), turn)
+    return _extract_turn_block(archived, turn)
+
+
+def _extract_turn_block(text: str, turn: int) -> str:
+    if not text:
         return ""
 
     start_marker = f"#  TURN {turn} "
@@ -380,7 +411,6 @@ def end_conversation_turn(
     _turn_num_ctx.set(None)
 
     if mongo_thread_log_enabled():
-        full_logs = _read_local_thread_log_text(tid) or None
         records = build_turn_records_from_local_file(tid)
         if not records:
             records = [turn_record]
@@ -393,7 +423,22 @@ def end_conversation_turn(
                     break
             if not updated:
                 records.append(turn_record)
-        sync_completed_turns_to_mongo(tid, records, full_logs=full_logs)
+        sync_completed_turns_to_mongo(tid, records)
+
+    _maybe_rotate_thread_log(tid)
+
+
+def _maybe_rotate_thread_log(thread_id: str) -> None:
+    """Archive the active segment at a turn boundary once it is too large or old."""
+    path = _thread_log_path(thread_id)
+    try:
+        # Only the rename blocks appends; gzip and the manifest write run unlocked.
+        with _turn_counts_lock:
+            pending = thread_log_archive.detach(path) if thread_log_archive.should_rotate(path) else None
+        if pending is not None:
+            thread_log_archive.compress_pending(path)
+    except Exception:
+        logging.getLogger(__name__).exception("Thread log rotation failed for %s", thread_id)
 
 
 def _resolve_config_thread_id(config: RunnableConfig | dict[str, Any] | None) -> str | None:
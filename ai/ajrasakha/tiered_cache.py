@@ -0,0 +1,336 @@
+"""Two-tier read-through cache shared by the market catalog and soil health lookups.
+
+Entries live in two tiers:
+
+  memory: a bounded LRU per process
+  disk:   an optional SQLite file shared by every worker on the host
+          (a falsy path disables the disk tier)
+
+Each entry carries its own expiry. Concurrent misses on the same key are
+single-flighted: one caller runs the loader, the others wait for its result.
+``ThreadedTieredCache`` does this for blocking loaders across threads,
+``AsyncTieredCache`` for coroutine loaders on one event loop. A failed load
+is not cached; the last known (expired) value is served instead when one
+exists.
+
+Callers choose the SQLite table, how keys are encoded, and which parts of a
+key are stored in their own columns so entries can be dropped by them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Hashable, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+def env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class TieredCache:
+    """Bounded in-memory LRU in front of an optional SQLite tier.
+
+    table:        SQLite table holding this cache's rows
+    label:        name used in log messages, e.g. "Market catalog"
+    encode_key:   key -> TEXT primary key on disk
+    key_columns:  {column: key -> str} stored beside each row for ``drop``
+    is_failure:   loader results that must not be cached
+    on_error:     value standing in for a loader that raised
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None,
+        *,
+        table: str,
+        label: str,
+        max_entries: int,
+        clock: Callable[[], float] = time.time,
+        encode_key: Callable[[Hashable], str] = str,
+        key_columns: Mapping[str, Callable[[Hashable], str]] | None = None,
+        is_failure: Callable[[Any], bool] = lambda value: value is None,
+        on_error: Callable[[Exception], Any] = lambda exc: None,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.table = table
+        self.label = label
+        self._clock = clock
+        self._encode = encode_key
+        self._key_columns = dict(key_columns or {})
+        self._is_failure = is_failure
+        self._on_error = on_error
+        self._memory: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self.loads = 0
+        if path:
+            self._db = self._open(Path(path))
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+    def _open(self, path: Path) -> sqlite3.Connection | None:
+        columns = "".join(f"    {name} TEXT NOT NULL,\n" for name in self._key_columns)
+        schema = (
+            f"CREATE TABLE IF NOT EXISTS {self.table} (\n"
+            "    key        TEXT PRIMARY KEY,\n"
+            f"{columns}"
+            "    value      TEXT NOT NULL,\n"
+            "    expires_at REAL NOT NULL\n"
+            ")"
+        )
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(path), timeout=5.0, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(schema)
+            return db
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("%s cache: disk tier unavailable at %s (%s); memory only.", self.label, path, exc)
+            return None
+
+    def _remember(self, key: Hashable, value: Any, expires_at: float) -> None:
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, key: Hashable) -> tuple[Any, float] | None:
+        """(value, expires_at) from memory, then disk; expired entries included."""
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                self._memory.move_to_end(key)
+                return hit
+            if self._db is None:
+                return None
+            try:
+                row = self._db.execute(
+                    f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (self._encode(key),)
+                ).fetchone()
+            except sqlite3.Error as exc:
+                logger.warning("%s cache read failed for %s: %s", self.label, key, exc)
+                return None
+            if row is None:
+                return None
+            try:
+                value = json.loads(row[0])
+            except ValueError:
+                return None
+            self._remember(key, value, row[1])
+            return value, row[1]
+
+    def get(self, key: Hashable) -> Any | None:
+        """Fresh value for ``key`` or None."""
+        hit = self._lookup(key)
+        if hit is None or hit[1] <= self._clock():
+            return None
+        return hit[0]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        expires_at = self._clock() + ttl
+        with self._lock:
+            self._remember(key, value, expires_at)
+            if self._db is None:
+                return
+            columns = ["key", *self._key_columns, "value", "expires_at"]
+            try:
+                self._db.execute(
+                    f"INSERT OR REPLACE INTO {self.table} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})",
+                    (
+                        self._encode(key),
+                        *(column(key) for column in self._key_columns.values()),
+                        json.dumps(value, ensure_ascii=False),
+                        expires_at,
+                    ),
+                )
+            except (sqlite3.Error, TypeError, ValueError) as exc:
+                logger.warning("%s cache write failed for %s: %s", self.label, key, exc)
+
+    def drop(self, **match: str | None) -> int:
+        """Drop entries whose key columns equal the given values (None matches any).
+
+        With no values every entry is dropped. Returns the number removed.
+        """
+        match = {name: value for name, value in match.items() if value is not None}
+        unknown = set(match) - set(self._key_columns)
+        if unknown:
+            raise ValueError(f"unknown key columns: {', '.join(sorted(unknown))}")
+
+        def matches(key: Hashable) -> bool:
+            return all(self._key_columns[name](key) == value for name, value in match.items())
+
+        with self._lock:
+            stale = [k for k in self._memory if matches(k)]
+            for k in stale:
+                del self._memory[k]
+            removed = len(stale)
+            if self._db is not None:
+                where = " AND ".join(f"{name} = ?" for name in match)
+                try:
+                    removed = max(
+                        removed,
+                        self._db.execute(
+                            f"DELETE FROM {self.table}{f' WHERE {where}' if where else ''}",
+                            list(match.values()),
+                        ).rowcount,
+                    )
+                except sqlite3.Error as exc:
+                    logger.warning("%s cache invalidation failed: %s", self.label, exc)
+        return removed
+
+    def purge_expired(self) -> int:
+        """Drop expired rows from the disk tier; returns rows removed."""
+        if self._db is None:
+            return 0
+        with self._lock:
+            try:
+                return self._db.execute(
+                    f"DELETE FROM {self.table} WHERE expires_at <= ?", (self._clock(),)
+                ).rowcount
+            except sqlite3.Error as exc:
+                logger.warning("%s cache purge failed: %s", self.label, exc)
+                return 0
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ------------------------------------------------------------------
+    # Read-through helpers
+    # ------------------------------------------------------------------
+    def _fresh(self, key: Hashable) -> tuple[bool, tuple[Any, float] | None]:
+        hit = self._lookup(key)
+        return hit is not None and hit[1] > self._clock(), hit
+
+    def _settle(self, key: Hashable, hit: tuple[Any, float] | None, value: Any, ttl: float) -> Any:
+        """Cache a loaded value, or fall back to the stale hit after a failure."""
+        if not self._is_failure(value):
+            self.set(key, value, ttl)
+        elif hit is not None:
+            logger.info("%s cache: serving stale %s after failed refresh", self.label, key)
+            value = hit[0]
+        return value
+
+    def _failed(self, key: Hashable, exc: Exception) -> Any:
+        logger.warning("%s load failed for %s: %s", self.label, key, exc)
+        return self._on_error(exc)
+
+
+class _Flight:
+    __slots__ = ("done", "value")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+
+
+class ThreadedTieredCache(TieredCache):
+    """TieredCache whose misses are single-flighted across threads."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._inflight: dict[Hashable, _Flight] = {}
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: float) -> Any:
+        """Cached value, or the loader's (cached unless it is a failure).
+
+        Concurrent callers for the same key share one loader call. When the
+        loader fails, the last known (expired) value is returned if there
+        is one, otherwise the failure itself.
+        """
+        fresh, hit = self._fresh(key)
+        if fresh:
+            return hit[0]
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = self._inflight[key] = _Flight()
+        if not owner:
+            flight.done.wait()
+            return flight.value
+
+        try:
+            self.loads += 1
+            try:
+                value = loader()
+            except Exception as exc:
+                value = self._failed(key, exc)
+            flight.value = value = self._settle(key, hit, value, ttl)
+            return value
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            flight.done.set()
+
+
+class AsyncTieredCache(TieredCache):
+    """TieredCache whose misses are single-flighted across coroutines."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+    ) -> Any:
+        """Cached value, or the loader's result (cached unless it is a failure).
+
+        Concurrent callers for the same key share one loader call. When the
+        loader fails, the last known (expired) value is returned if there is one.
+        """
+        fresh, hit = self._fresh(key)
+        if fresh:
+            return hit[0]
+
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            self.loads += 1
+            try:
+                value = await loader()
+            except Exception as exc:
+                value = self._failed(key, exc)
+            value = self._settle(key, hit, value, ttl)
+            future.set_result(value)
+            return value
+        except BaseException:
+            # cancelled mid-load: waiters get None rather than hanging
+            if not future.done():
+                future.set_result(None)
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
@@ -0,0 +1,303 @@
+"""
+In-process index over commodity_alias_lookup and available_mandi.
+
+Commodity and market aliases change rarely, so both tables are loaded once and
+resolved in memory instead of querying Mongo on every tool call:
+
+  commodities: exact canonical/alias match (same semantics as the Mongo
+               find_one), then normalized-token match, unique-ish prefix,
+               and finally rapidfuzz.
+  markets:     the same case-insensitive substring match the Mongo regex did,
+               with a rapidfuzz fallback on names/aliases within the state.
+
+A background thread rebuilds the index when either collection changes (change
+stream when the deployment supports it, otherwise polling every
+MARKET_ALIAS_REFRESH_SEC) and swaps the new index in atomically.
+"""
+import bisect
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from typing import Any, Callable, Iterable, Optional
+
+import bson
+from pymongo.database import Database
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # fuzzy fallback is optional
+    fuzz = process = None
+
+logger = logging.getLogger("mandi_price_tool")
+
+ALIAS_INDEX_ENABLED = os.getenv("MARKET_ALIAS_INDEX", "true").strip().lower() in ("1", "true", "yes")
+ALIAS_REFRESH_SEC = float(os.getenv("MARKET_ALIAS_REFRESH_SEC", 300))
+ALIAS_FUZZY_CUTOFF = float(os.getenv("MARKET_ALIAS_FUZZY_CUTOFF", 88))
+_MIN_PREFIX = 3
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize_key(value: Any) -> str:
+    """Case-, accent- and punctuation-insensitive key ("Lady's Finger" -> "lady s finger")."""
+    if not isinstance(value, str):
+        return ""
+    text = unicodedata.normalize("NFKC", value).casefold()
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def _strings(values: Any) -> list[str]:
+    if isinstance(values, str):
+        return [values]
+    if isinstance(values, (list, tuple)):
+        return [v for v in values if isinstance(v, str)]
+    return []
+
+
+class AliasIndex:
+    """Immutable snapshot of both alias tables; build a new one to refresh."""
+
+    def __init__(
+        self,
+        commodity_docs: Iterable[dict],
+        market_docs: Iterable[dict],
+        *,
+        fuzzy_cutoff: float = ALIAS_FUZZY_CUTOFF,
+        version: str = "",
+    ):
+        self.version = version
+        self.fuzzy_cutoff = fuzzy_cutoff
+
+        # Commodities — first document in natural order wins, like find_one.
+        self._exact: dict[str, dict] = {}
+        self._normalized: dict[str, dict] = {}
+        for doc in commodity_docs:
+            if doc.get("active") is not True:
+                continue
+            for key in _strings(doc.get("canonical_name")) + _strings(doc.get("aliases")):
+                self._exact.setdefault(key, doc)
+                norm = normalize_key(key)
+                if norm:
+                    self._normalized.setdefault(norm, doc)
+        self._sorted_keys = sorted(self._normalized)
+
+        # Markets — kept in natural order, grouped by exact state value.
+        self._markets: list[dict] = list(market_docs)
+        self._position = {id(doc): i for i, doc in enumerate(self._markets)}
+        self._by_state: dict[Any, list[dict]] = {}
+        for doc in self._markets:
+            self._by_state.setdefault(doc.get("state"), []).append(doc)
+
+    def __len__(self) -> int:
+        return len(self._exact) + len(self._markets)
+
+    # ------------------------------------------------------------------
+    # Commodities
+    # ------------------------------------------------------------------
+    def resolve_commodity(self, raw: Any) -> tuple[Optional[dict], str]:
+        """Return (alias document, match kind) where kind is exact/normalized/prefix/fuzzy/none."""
+        candidates: list[str] = []
+        if isinstance(raw, str):
+            for key in (raw.strip().lower(), raw.strip()):
+                if key and key not in candidates:
+                    candidates.append(key)
+        for key in candidates:
+            doc = self._exact.get(key)
+            if doc is not None:
+                return doc, "exact"
+
+        norm = normalize_key(raw)
+        if not norm:
+            return None, "none"
+        doc = self._normalized.get(norm)
+        if doc is not None:
+            return doc, "normalized"
+
+        if len(norm) >= _MIN_PREFIX:
+            start = bisect.bisect_left(self._sorted_keys, norm)
+            matches: list[str] = []
+            for key in self._sorted_keys[start:]:
+                if not key.startswith(norm):
+                    break
+                matches.append(key)
+            if matches:
+                best = min(matches, key=len)
+                return self._normalized[best], "prefix"
+
+        if process is not None and self._sorted_keys:
+            hit = process.extractOne(
+                norm, self._sorted_keys, scorer=fuzz.WRatio, score_cutoff=self.fuzzy_cutoff
+            )
+            if hit:
+                return self._normalized[hit[0]], "fuzzy"
+        return None, "none"
+
+    # ------------------------------------------------------------------
+    # Markets
+    # ------------------------------------------------------------------
+    def search_markets(
+        self,
+        state_values: list[str],
+        tokens: list[str],
+        *,
+        market_ids: Optional[Iterable] = None,
+        limit: int,
+    ) -> list[dict]:
+        """available_mandi docs in the given states, optionally restricted by id and name.
+
+        Name tokens match as case-insensitive substrings of ``name`` or any
+        alias (the Mongo regex semantics); when nothing matches, rapidfuzz picks
+        the closest names within the candidate set.
+        """
+        pool: list[dict] = []
+        for state in dict.fromkeys(state_values):
+            pool.extend(self._by_state.get(state, ()))
+        if len(state_values) > 1:
+            pool.sort(key=lambda d: self._position[id(d)])
+        if market_ids is not None:
+            wanted = set(market_ids)
+            pool = [d for d in pool if d.get("_id") in wanted]
+        if not tokens:
+            return pool[:limit]
+
+        patterns = [re.compile(re.escape(t), re.IGNORECASE) for t in tokens]
+
+        def _matches(doc: dict) -> bool:
+            names = _strings(doc.get("name")) + _strings(doc.get("aliases"))
+            return any(p.search(n) for p in patterns for n in names)
+
+        hits = [d for d in pool if _matches(d)]
+        if hits or process is None:
+            return hits[:limit]
+        return self._fuzzy_markets(pool, tokens, limit)
+
+    def _fuzzy_markets(self, pool: list[dict], tokens: list[str], limit: int) -> list[dict]:
+        choices: list[str] = []
+        owners: list[dict] = []
+        for doc in pool:
+            for name in _strings(doc.get("name")) + _strings(doc.get("aliases")):
+                key = normalize_key(name)
+                if key:
+                    choices.append(key)
+                    owners.append(doc)
+        best: dict[int, float] = {}
+        for token in tokens:
+            query = normalize_key(token)
+            if not query or not choices:
+                continue
+            for _, score, idx in process.extract(
+                query, choices, scorer=fuzz.WRatio, score_cutoff=self.fuzzy_cutoff, limit=limit
+            ):
+                key = id(owners[idx])
+                best[key] = max(best.get(key, 0.0), score)
+        ranked = sorted(
+            (doc for doc in pool if id(doc) in best),
+            key=lambda d: -best[id(d)],
+        )
+        return ranked[:limit]
+
+
+def _fingerprint(commodity_docs: list[dict], market_docs: list[dict]) -> str:
+    digest = hashlib.sha1()
+    for doc in commodity_docs + market_docs:
+        digest.update(bson.encode(doc))
+    return digest.hexdigest()
+
+
+def load_alias_index(db: Database, *, fuzzy_cutoff: float = ALIAS_FUZZY_CUTOFF) -> AliasIndex:
+    commodity_docs = list(db["commodity_alias_lookup"].find({"active": True}))
+    market_docs = list(db["available_mandi"].find({}))
+    return AliasIndex(
+        commodity_docs,
+        market_docs,
+        fuzzy_cutoff=fuzzy_cutoff,
+        version=_fingerprint(commodity_docs, market_docs),
+    )
+
+
+class AliasIndexHolder:
+    """Holds the current index and refreshes it in the background."""
+
+    def __init__(self, *, refresh_sec: float = ALIAS_REFRESH_SEC):
+        self.refresh_sec = refresh_sec
+        self._index: Optional[AliasIndex] = None
+        self._db_getter: Optional[Callable[[], Database]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self, db_getter: Callable[[], Database]) -> Optional[AliasIndex]:
+        """Current index; the first call loads it synchronously. None if loading failed."""
+        index = self._index
+        if index is not None:
+            return index
+        with self._lock:
+            if self._index is None:
+                self._db_getter = db_getter
+                try:
+                    self._index = load_alias_index(db_getter())
+                except Exception:
+                    logger.exception("Alias index load failed; resolving aliases via Mongo.")
+                    return None
+                logger.info("Alias index loaded (%d keys, version %s)", len(self._index), self._index.version[:8])
+                self._start_refresher()
+            return self._index
+
+    def refresh(self) -> bool:
+        """Rebuild from Mongo; swap only when the content changed. Returns True on swap."""
+        if self._db_getter is None:
+            return False
+        new = load_alias_index(self._db_getter())
+        current = self._index
+        if current is not None and current.version == new.version:
+            return False
+        self._index = new
+        logger.info("Alias index refreshed (%d keys, version %s)", len(new), new.version[:8])
+        return True
+
+    def close(self) -> None:
+        self._stop.set()
+
+    def _start_refresher(self) -> None:
+        if self.refresh_sec <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="alias-index-refresh", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            self._watch()
+        except Exception as exc:
+            logger.info("Alias index change stream unavailable (%s); polling every %ss.", exc, self.refresh_sec)
+        while not self._stop.wait(self.refresh_sec):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Alias index refresh failed; keeping previous index.")
+
+    def _watch(self) -> None:
+        """Rebuild on any write to either table (raises on standalone servers)."""
+        db = self._db_getter()
+        names = ["commodity_alias_lookup", "available_mandi"]
+        pipeline = [{"$match": {"ns.coll": {"$in": names}}}]
+        with db.watch(pipeline, max_await_time_ms=int(self.refresh_sec * 1000) or None) as stream:
+            while not self._stop.is_set():
+                change = stream.try_next()
+                if change is None:
+                    continue
+                # coalesce bursts of writes into one rebuild
+                time.sleep(1.0)
+                self.refresh()
+
+
+_holder = AliasIndexHolder()
+
+
+def get_alias_index(db_getter: Callable[[], Database]) -> Optional[AliasIndex]:
+    if not ALIAS_INDEX_ENABLED:
+        return None
+    return _holder.get(db_getter)
@@ -16,6 +16,13 @@ from mcp.server.transport_security import TransportSecuritySettings
 from dotenv import load_dotenv
 load_dotenv()
 
+try:
+    from .alias_index import get_alias_index
+    from .latest_prices import LATEST_PRICES_COLLECTION, as_utc, find_latest_prices, is_current
+except ImportError:
+    from alias_index import get_alias_index
+    from latest_prices import LATEST_PRICES_COLLECTION, as_utc, find_latest_prices, is_current
+
 # Configure logging to output to stderr (stdout is reserved for MCP protocol messages)
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +45,9 @@ MAX_CANDIDATE_MARKETS = int(os.getenv("MARKET_MAX_CANDIDATE_MARKETS", 500))
 MAX_ACTIONS = int(os.getenv("MARKET_MAX_ACTIONS", "3"))
 # Safety timeout for Mongo reads (ms) — prevent MCP session hangs
 MONGO_MAX_TIME_MS = int(os.getenv("MARKET_MONGO_MAX_TIME_MS", 10000))
+# Serve today/latest price lookups from the materialized latest_prices collection
+# (only while its watermark is current; see latest_prices.is_current)
+USE_LATEST_PRICES = os.getenv("MARKET_USE_LATEST_PRICES", "true").strip().lower() in ("1", "true", "yes")
 
 # Standardized / alternate state keys across collections (exact match only).
 # markets_commodities often uses "nct of delhi"; available_mandi uses "delhi".
@@ -52,6 +62,8 @@ _STATE_SYNONYMS: dict[str, tuple[str, ...]] = {
     "chattisgarh": ("chhattisgarh", "chattisgarh"),
 }
 
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
 _client: Optional[MongoClient] = None
 
 
@@ -78,6 +90,9 @@ def available_mandi_col() -> Collection:
 def commodity_alias_col() -> Collection:
     return get_db()["commodity_alias_lookup"]
 
+def latest_prices_col() -> Collection:
+    return get_db()[LATEST_PRICES_COLLECTION]
+
 
 # --------------------------------------------------------------------------
 # MCP Server
@@ -387,8 +402,22 @@ def mandi_price_tool(
     def _resolve_commodity_aliases(names: list[str]) -> dict[str, Optional[dict]]:
         """Exact alias/canonical match first (indexed); avoid slow regex scans."""
         logger.info("Resolving commodity aliases for input names: %s", names)
-        coll = commodity_alias_col()
         results: dict[str, Optional[dict]] = {}
+        index = get_alias_index(get_db)
+        if index is not None:
+            for raw in names:
+                doc, how = index.resolve_commodity(raw)
+                results[raw] = doc
+                if doc:
+                    logger.info(
+                        "Resolved commodity '%s' to canonical name: '%s' (_id: %s, match=%s)",
+                        raw, doc.get("canonical_name"), doc.get("_id"), how,
+                    )
+                else:
+                    logger.warning("Could not resolve commodity alias for input name: '%s'", raw)
+            return results
+
+        coll = commodity_alias_col()
         for raw in names:
             norm = _norm(raw)
             candidates = [norm]
@@ -456,6 +485,20 @@ def mandi_price_tool(
             return {"date": date_range}, date_meta
         return {}, {"mode": "all_dates"}
 
+    def _in_date_window(value: Any, clause: dict[str, Any]) -> bool:
+        """In-memory equivalent of a _date_query clause (for latest_prices rows)."""
+        bounds = clause.get("date")
+        if not bounds:
+            return True
+        dt = as_utc(value)
+        if dt is None:
+            return False
+        if "$gte" in bounds and dt < bounds["$gte"]:
+            return False
+        if "$lte" in bounds and dt > bounds["$lte"]:
+            return False
+        return True
+
     # ------------------------------------------------------------------
     # Market search — state required; exact match; distance in-memory
     # ------------------------------------------------------------------
@@ -477,8 +520,34 @@ def mandi_price_tool(
             market_name, state, lat, long, nearest_market, radius_km,
             len(market_ids) if market_ids is not None else None,
         )
-        coll = available_mandi_col()
         state_values = _state_exact_values(state or "")
+        index = get_alias_index(get_db)
+        if index is not None:
+            docs = index.search_markets(
+                state_values,
+                _market_name_tokens(market_name) if market_name else [],
+                market_ids=market_ids,
+                limit=MAX_CANDIDATE_MARKETS,
+            )
+            logger.info("Alias index matched %d markets for state=%s name=%s.", len(docs), state, market_name)
+        else:
+            docs = _query_markets(state_values, market_name, market_ids)
+        if not docs:
+            return {
+                "count": 0,
+                "mode": "state_exact",
+                "markets": [],
+                "_raw_docs": [],
+                "error": f"APMC not available for state '{state}'.",
+            }
+        return _rank_market_docs(docs, market_name, lat, long, nearest_market, radius_km)
+
+    def _query_markets(
+        state_values: list[str],
+        market_name: Optional[str],
+        market_ids: Optional[list[ObjectId]],
+    ) -> list[dict]:
+        coll = available_mandi_col()
         query: dict[str, Any] = {"state": {"$in": state_values}}
         if market_ids is not None:
             query["_id"] = {"$in": list(market_ids)}
@@ -493,15 +562,16 @@ def mandi_price_tool(
         cursor = coll.find(query).limit(MAX_CANDIDATE_MARKETS).max_time_ms(MONGO_MAX_TIME_MS)
         docs = list(cursor)
         logger.info("State-filtered available_mandi returned %d markets.", len(docs))
-        if not docs:
-            return {
-                "count": 0,
-                "mode": "state_exact",
-                "markets": [],
-                "_raw_docs": [],
-                "error": f"APMC not available for state '{state}'.",
-            }
+        return docs
 
+    def _rank_market_docs(
+        docs: list[dict],
+        market_name: Optional[str],
+        lat: Optional[float],
+        long: Optional[float],
+        nearest_market: bool,
+        radius_km: Optional[float],
+    ) -> dict:
         mode = "state_exact"
         if lat is not None and long is not None:
             ranked = _rank_markets_by_distance(
@@ -544,6 +614,7 @@ def mandi_price_tool(
         to_date: Optional[str] = None,
         lookback_days: Optional[int] = None,
         latest_price_fallback: bool = False,
+        from_latest: bool = False,
     ) -> dict:
         """
         Orchestrated flow (avoids $near hangs):
@@ -552,6 +623,11 @@ def mandi_price_tool(
           3) Location priority cascade (first stage with price rows wins):
                market_name → lat/long nearest → whole state.
           4) Within each stage, optional latest-price fallback if date window empty.
+
+        from_latest=True (today/latest lookups) serves steps 2–4 from the
+        latest_prices collection: one indexed read, then in-memory filtering.
+        Falls back to markets_commodities/price_records when it is empty or
+        its watermark says no writer has kept it current.
         """
         missing = _require_state(state)
         if missing:
@@ -571,13 +647,34 @@ def mandi_price_tool(
         mc_coll = markets_commodities_col()
         pr_coll = price_records_col()
 
+        # latest_prices documents are markets_commodities entries + newest rows
+        latest_docs: Optional[list[dict]] = None
+        if from_latest and USE_LATEST_PRICES:
+            try:
+                if is_current(get_db()):
+                    latest_docs = find_latest_prices(
+                        latest_prices_col(), alias_ids, state_norm_values,
+                        max_time_ms=MONGO_MAX_TIME_MS,
+                    ) or None
+                    logger.info(
+                        "latest_prices returned %d documents for state+crop.",
+                        len(latest_docs) if latest_docs else 0,
+                    )
+                else:
+                    logger.warning("latest_prices watermark is missing or stale; using price_records cascade.")
+            except Exception:
+                logger.exception("latest_prices read failed; using price_records cascade.")
+
         # ── Step 2: state + crop on markets_commodities ──────────────────
         mc_filter: dict[str, Any] = {
             "commodity_alias_lookup_id": {"$in": alias_ids},
             "state": {"$in": state_norm_values},
         }
-        logger.info("Narrowing markets_commodities by state+crop: %s", mc_filter)
-        mc_docs_list = list(mc_coll.find(mc_filter).max_time_ms(MONGO_MAX_TIME_MS))
+        if latest_docs is not None:
+            mc_docs_list = latest_docs
+        else:
+            logger.info("Narrowing markets_commodities by state+crop: %s", mc_filter)
+            mc_docs_list = list(mc_coll.find(mc_filter).max_time_ms(MONGO_MAX_TIME_MS))
         logger.info("Found %d markets_commodities for state+crop.", len(mc_docs_list))
         if not mc_docs_list:
             return {
@@ -607,10 +704,16 @@ def mandi_price_tool(
                 {**pr_filter, "market_commodity_id": f"$in[{len(mc_ids)}]"},
             )
             # Distinct market_commodity_ids that have rows in the date window
-            active_mc_ids = pr_coll.distinct(
-                "market_commodity_id",
-                pr_filter,
-            )
+            if latest_docs is not None:
+                active_mc_ids = [
+                    d["_id"] for d in latest_docs
+                    if any(_in_date_window(r.get("date"), date_clause) for r in d.get("records") or [])
+                ]
+            else:
+                active_mc_ids = pr_coll.distinct(
+                    "market_commodity_id",
+                    pr_filter,
+                )
             # pymongo distinct may not take max_time_ms in older versions; wrap safely
             if active_mc_ids:
                 date_filtered_market_ids = list({
@@ -645,11 +748,18 @@ def mandi_price_tool(
             if market_ids_arg:
                 mc_filter_local["market_id"] = {"$in": list(market_ids_arg)}
 
-            logger.info("Querying markets_commodities with filter: %s", {
-                **mc_filter_local,
-                "market_id": f"$in[{len(market_ids_arg)}]" if market_ids_arg else None,
-            })
-            mc_docs = list(mc_coll.find(mc_filter_local).max_time_ms(MONGO_MAX_TIME_MS))
+            if latest_docs is not None:
+                market_id_set = set(market_ids_arg or [])
+                mc_docs = [
+                    d for d in latest_docs
+                    if not market_id_set or d.get("market_id") in market_id_set
+                ]
+            else:
+                logger.info("Querying markets_commodities with filter: %s", {
+                    **mc_filter_local,
+                    "market_id": f"$in[{len(market_ids_arg)}]" if market_ids_arg else None,
+                })
+                mc_docs = list(mc_coll.find(mc_filter_local).max_time_ms(MONGO_MAX_TIME_MS))
             logger.info("Found %d markets_commodities documents.", len(mc_docs))
             if not mc_docs:
                 return {
@@ -679,13 +789,23 @@ def mandi_price_tool(
             pr_query: dict[str, Any] = {"market_commodity_id": {"$in": list(mc_by_id.keys())}, **clause}
             resolution_meta["date_filter"] = local_date_meta
 
-            logger.info("Querying price_records with query: %s (limit: %d)", {
-                **pr_query,
-                "market_commodity_id": f"$in[{len(mc_by_id)}]",
-            }, PRICE_RECORD_LIMIT)
-            raw_records = list(
-                pr_coll.find(pr_query).sort("date", -1).limit(PRICE_RECORD_LIMIT).max_time_ms(MONGO_MAX_TIME_MS)
-            )
+            if latest_docs is not None:
+                rows = [
+                    {**r, "market_commodity_id": d["_id"]}
+                    for d in mc_docs
+                    for r in d.get("records") or []
+                    if _in_date_window(r.get("date"), clause)
+                ]
+                rows.sort(key=lambda r: as_utc(r.get("date")) or _EPOCH, reverse=True)
+                raw_records = rows[:PRICE_RECORD_LIMIT]
+            else:
+                logger.info("Querying price_records with query: %s (limit: %d)", {
+                    **pr_query,
+                    "market_commodity_id": f"$in[{len(mc_by_id)}]",
+                }, PRICE_RECORD_LIMIT)
+                raw_records = list(
+                    pr_coll.find(pr_query).sort("date", -1).limit(PRICE_RECORD_LIMIT).max_time_ms(MONGO_MAX_TIME_MS)
+                )
             logger.info("Found %d raw price records.", len(raw_records))
             formatted: list[dict] = []
             for pr in raw_records:
@@ -850,6 +970,7 @@ def mandi_price_tool(
             nearest_market=nearest_market, radius_km=radius_km,
             lookback_days=1,
             latest_price_fallback=True,
+            from_latest=True,
         )
         if not result.get("error"):
             result["action"] = "get_today_price"
@@ -954,6 +1075,7 @@ def mandi_price_tool(
             lat=lat, long=long,
             nearest_market=nearest_market, radius_km=radius_km,
             lookback_days=1,
+            from_latest=True,
         )
         if result.get("error"):
             return result
@@ -0,0 +1,279 @@
+"""
+Materialized ``latest_prices`` collection for "today / latest price" lookups.
+
+One document per markets_commodities entry (market + commodity + variety/grade),
+keyed by its ``_id``. It carries the commodity metadata the tool serializes and
+the newest ``MARKET_LATEST_PRICES_KEEP`` price_records rows, newest first, so a
+latest-price query is a single indexed read instead of a distinct plus a
+date-descending query per location stage.
+
+Keep it current by calling :func:`apply_price_records` from whatever ingests
+price_records, or run ``python latest_prices.py watch`` (follows inserts through
+a change stream; needs a replica set). ``python latest_prices.py rebuild``
+recomputes everything from price_records.
+
+Every writer stamps a ``current_as_of`` watermark in ``latest_prices_meta``;
+readers treat the collection as stale, and use price_records instead, once
+that watermark is older than ``MARKET_LATEST_PRICES_MAX_AGE_SEC`` or missing.
+The watcher refreshes it while its change stream is open.
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
+
+from pymongo import ASCENDING, DESCENDING, MongoClient
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+logger = logging.getLogger("mandi_price_tool")
+
+LATEST_PRICES_COLLECTION = "latest_prices"
+LATEST_PRICES_META_COLLECTION = "latest_prices_meta"
+LATEST_PRICES_KEEP = int(os.getenv("MARKET_LATEST_PRICES_KEEP", 10))
+# Older watermark than this means no writer has kept latest_prices in step
+LATEST_PRICES_MAX_AGE_SEC = int(os.getenv("MARKET_LATEST_PRICES_MAX_AGE_SEC", 3 * 3600))
+# How often the watcher refreshes the watermark while its stream is idle
+WATCH_HEARTBEAT_SEC = 60
+
+# markets_commodities fields copied onto each latest_prices document
+_MC_FIELDS = (
+    "market_id",
+    "commodity_alias_lookup_id",
+    "state",
+    "market_name",
+    "commodity_name",
+    "variety",
+    "grade",
+    "commodity_group",
+    "source_url",
+    "source_system",
+)
+_PRICE_FIELDS = ("date", "min_price", "max_price", "modal_price", "arrival_quantity")
+
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def as_utc(value: Any) -> Optional[datetime]:
+    """pymongo returns naive UTC datetimes unless the client is tz_aware."""
+    if not isinstance(value, datetime):
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _date_key(record: dict) -> datetime:
+    return as_utc(record.get("date")) or _EPOCH
+
+
+def ensure_indexes(db: Database) -> None:
+    coll = db[LATEST_PRICES_COLLECTION]
+    coll.create_index(
+        [("commodity_alias_lookup_id", ASCENDING), ("state", ASCENDING), ("market_id", ASCENDING)],
+        name="crop_state_market",
+    )
+    db["price_records"].create_index(
+        [("market_commodity_id", ASCENDING), ("date", DESCENDING)],
+        name="market_commodity_date",
+    )
+
+
+def mark_current(db: Database, as_of: Optional[datetime] = None) -> None:
+    """Record that latest_prices reflects every price_records row up to ``as_of`` (default: now)."""
+    db[LATEST_PRICES_META_COLLECTION].update_one(
+        {"_id": LATEST_PRICES_COLLECTION},
+        {"$set": {"current_as_of": as_of or datetime.now(timezone.utc)}},
+        upsert=True,
+    )
+
+
+def current_as_of(db: Database) -> Optional[datetime]:
+    doc = db[LATEST_PRICES_META_COLLECTION].find_one({"_id": LATEST_PRICES_COLLECTION})
+    return as_utc((doc or {}).get("current_as_of"))
+
+
+def is_current(
+    db: Database,
+    *,
+    max_age_sec: float = LATEST_PRICES_MAX_AGE_SEC,
+    now: Optional[datetime] = None,
+) -> bool:
+    """True when a writer has stamped the watermark within ``max_age_sec``."""
+    as_of = current_as_of(db)
+    if as_of is None:
+        return False
+    return (now or datetime.now(timezone.utc)) - as_of <= timedelta(seconds=max_age_sec)
+
+
+def _snapshot(price_record: dict) -> dict:
+    snap = {"_id": price_record.get("_id")}
+    for field in _PRICE_FIELDS:
+        snap[field] = price_record.get(field)
+    return snap
+
+
+def _latest_doc(mc: dict, records: list[dict]) -> dict:
+    doc: dict[str, Any] = {"_id": mc["_id"]}
+    for field in _MC_FIELDS:
+        doc[field] = mc.get(field)
+    doc["records"] = records
+    doc["latest_date"] = records[0]["date"] if records else None
+    return doc
+
+
+def _merge(existing: Iterable[dict], incoming: Iterable[dict], keep: int) -> list[dict]:
+    """Newest ``keep`` rows, deduplicated by price_records ``_id`` (incoming wins)."""
+    by_id: dict[Any, dict] = {}
+    for rec in existing:
+        by_id[rec.get("_id")] = rec
+    for rec in incoming:
+        by_id[rec.get("_id")] = rec
+    return sorted(by_id.values(), key=_date_key, reverse=True)[:keep]
+
+
+def apply_price_records(
+    db: Database,
+    price_records: Iterable[dict],
+    *,
+    keep: int = LATEST_PRICES_KEEP,
+) -> int:
+    """Fold newly ingested price_records into latest_prices; returns documents written.
+
+    Also stamps the watermark, so ingesters should call it after every run,
+    even one that found no new rows.
+    """
+    grouped: dict[Any, list[dict]] = {}
+    for pr in price_records:
+        mc_id = pr.get("market_commodity_id")
+        if mc_id is not None and pr.get("date") is not None:
+            grouped.setdefault(mc_id, []).append(_snapshot(pr))
+    if not grouped:
+        mark_current(db)
+        return 0
+
+    mc_ids = list(grouped)
+    mc_by_id = {
+        mc["_id"]: mc
+        for mc in db["markets_commodities"].find({"_id": {"$in": mc_ids}})
+    }
+    current = {
+        doc["_id"]: doc.get("records") or []
+        for doc in db[LATEST_PRICES_COLLECTION].find(
+            {"_id": {"$in": mc_ids}}, {"records": 1}
+        )
+    }
+
+    coll = db[LATEST_PRICES_COLLECTION]
+    written = 0
+    for mc_id, incoming in grouped.items():
+        mc = mc_by_id.get(mc_id)
+        if mc is None:
+            logger.warning("latest_prices: price_records reference unknown market_commodity_id=%s", mc_id)
+            continue
+        records = _merge(current.get(mc_id, []), incoming, keep)
+        coll.replace_one({"_id": mc_id}, _latest_doc(mc, records), upsert=True)
+        written += 1
+    mark_current(db)
+    return written
+
+
+def rebuild_latest_prices(db: Database, *, keep: int = LATEST_PRICES_KEEP) -> int:
+    """Recompute latest_prices from price_records for every markets_commodities entry."""
+    ensure_indexes(db)
+    coll = db[LATEST_PRICES_COLLECTION]
+    pr_coll = db["price_records"]
+    token = uuid.uuid4().hex
+    # rows inserted while the rebuild runs may be missed, so date the watermark at its start
+    started = datetime.now(timezone.utc)
+    count = 0
+    for mc in db["markets_commodities"].find({}):
+        records = [
+            _snapshot(pr)
+            for pr in pr_coll.find({"market_commodity_id": mc["_id"]}).sort("date", -1).limit(keep)
+        ]
+        doc = _latest_doc(mc, records)
+        doc["rebuild_token"] = token
+        coll.replace_one({"_id": mc["_id"]}, doc, upsert=True)
+        count += 1
+        if count % 1000 == 0:
+            logger.info("latest_prices rebuild: %d market commodities done", count)
+    removed = coll.delete_many({"rebuild_token": {"$ne": token}}).deleted_count
+    mark_current(db, started)
+    logger.info("latest_prices rebuild complete: %d documents (%d stale removed)", count, removed)
+    return count
+
+
+def watch_price_records(db: Database, *, keep: int = LATEST_PRICES_KEEP) -> None:
+    """Follow price_records inserts/replacements and apply them as they land.
+
+    Rows written while no watcher ran are missed, so a stale collection is
+    rebuilt first; the stream is opened before that so nothing slips between.
+    """
+    ensure_indexes(db)
+    pipeline = [{"$match": {"operationType": {"$in": ["insert", "replace", "update"]}}}]
+    with db["price_records"].watch(
+        pipeline, full_document="updateLookup", max_await_time_ms=1000
+    ) as stream:
+        if not is_current(db):
+            logger.info("latest_prices: watermark is stale; rebuilding before watching")
+            rebuild_latest_prices(db, keep=keep)
+        logger.info("latest_prices: watching price_records for new rows")
+        last_mark = time.monotonic()
+        while stream.alive:
+            change = stream.try_next()
+            doc = change.get("fullDocument") if change else None
+            if doc:
+                apply_price_records(db, [doc], keep=keep)
+                last_mark = time.monotonic()
+            elif time.monotonic() - last_mark >= WATCH_HEARTBEAT_SEC:
+                mark_current(db)
+                last_mark = time.monotonic()
+
+
+def find_latest_prices(
+    coll: Collection,
+    alias_ids: list,
+    state_values: list[str],
+    *,
+    max_time_ms: int,
+) -> list[dict]:
+    """All latest_prices documents for the crops in a state (one indexed query)."""
+    query = {
+        "commodity_alias_lookup_id": {"$in": alias_ids},
+        "state": {"$in": state_values},
+    }
+    return list(coll.find(query).max_time_ms(max_time_ms))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("command", choices=("rebuild", "watch"))
+    parser.add_argument("--keep", type=int, default=LATEST_PRICES_KEEP, help="price rows kept per market commodity")
+    args = parser.parse_args(argv)
+
+    uri = os.getenv("MARKET_MONGO_URI")
+    if not uri:
+        parser.error("MARKET_MONGO_URI is not set")
+    db_name = os.getenv("MARKET_MONGO_DB_NAME") or os.getenv("MONGO_DB_NAME") or "Price"
+    db = MongoClient(uri)[db_name]
+
+    if args.command == "rebuild":
+        rebuild_latest_prices(db, keep=args.keep)
+    else:
+        watch_price_records(db, keep=args.keep)
+    return 0
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""Alias index parity with the Mongo-based commodity/market resolution (mongomock)."""
+
+import os
+import time
+
+import mongomock
+import pytest
+from bson import ObjectId
+
+import alias_index
+import daily_market_price as dmp
+from alias_index import AliasIndexHolder, load_alias_index
+
+
+COMMODITIES = [
+    {"canonical_name": "wheat", "aliases": ["gehun", "Gehu", "kanak"]},
+    {"canonical_name": "onion", "aliases": ["pyaz", "kanda"]},
+    {"canonical_name": "bhindi(ladies finger)", "aliases": ["okra", "lady's finger", "bhindi"]},
+    {"canonical_name": "green chilli", "aliases": ["hari mirch", "chilli"]},
+    {"canonical_name": "red chilli", "aliases": ["lal mirch", "chilli"]},
+    {"canonical_name": "paddy(dhan)", "aliases": ["dhan", "paddy"], "active": False},
+    {"canonical_name": "paddy(common)", "aliases": ["dhan", "paddy", "Paddy"]},
+    {"canonical_name": "tomato", "aliases": ["tamatar"]},
+]
+
+MARKETS = [
+    ("Ludhiana", "punjab", ["Ludhiana Grain Market"]),
+    ("Khanna", "punjab", ["Khanna Mandi"]),
+    ("Jalandhar Cantt", "punjab", ["Jalandhar"]),
+    ("Azadpur", "delhi", ["Azadpur APMC", "Azadpur Mandi"]),
+    ("Okhla", "nct of delhi", []),
+    ("Gorakhpur", "uttar pradesh", ["Mahewa"]),
+    ("Kanpur(Grain)", "uttar pradesh", ["Kanpur Grain", "Chakarpur Mandi"]),
+]
+
+
+@pytest.fixture
+def db(monkeypatch):
+    raw = mongomock.MongoClient()["Price"]
+    raw["commodity_alias_lookup"].insert_many(
+        [{"active": True, **doc} for doc in COMMODITIES]
+    )
+    raw["available_mandi"].insert_many([
+        {"name": name, "state": state, "aliases": aliases, "district": name,
+         "location": {"type": "Point", "coordinates": [77.0 + i, 28.0 + i]}}
+        for i, (name, state, aliases) in enumerate(MARKETS)
+    ])
+    monkeypatch.setattr(dmp, "get_db", lambda: raw)
+    monkeypatch.setattr(alias_index, "_holder", AliasIndexHolder(refresh_sec=0))
+    return raw
+
+
+def _with_and_without_index(monkeypatch, **kwargs) -> tuple[dict, dict]:
+    indexed = dmp.mandi_price_tool(**kwargs)
+    with monkeypatch.context() as m:
+        m.setattr(dmp, "get_alias_index", lambda db_getter: None)
+        mongo = dmp.mandi_price_tool(**kwargs)
+    return indexed, mongo
+
+
+COMMODITY_INPUTS = [
+    "wheat", "Wheat", "  gehun ", "Gehu", "kanak", "kanda", "pyaz", "okra", "lady's finger",
+    "bhindi", "chilli", "hari mirch", "dhan", "paddy", "Paddy", "tomato", "tamatar",
+]
+
+
+@pytest.mark.parametrize("name", COMMODITY_INPUTS)
+def test_commodity_resolution_matches_mongo(db, name):
+    index = load_alias_index(db)
+    doc, how = index.resolve_commodity(name)
+
+    # the pre-index Mongo resolution
+    coll = db["commodity_alias_lookup"]
+    expected = None
+    for key in dict.fromkeys([name.strip().lower(), name.strip()]):
+        expected = coll.find_one({"active": True, "$or": [{"canonical_name": key}, {"aliases": key}]})
+        if expected:
+            break
+
+    assert expected is not None
+    assert how == "exact"
+    assert doc["_id"] == expected["_id"]
+
+
+@pytest.mark.parametrize(
+    "name, canonical, how",
+    [
+        ("Lady's-Finger", "bhindi(ladies finger)", "normalized"),
+        ("tamat", "tomato", "prefix"),
+        ("GEHU", "wheat", "normalized"),
+        ("tamatr", "tomato", "fuzzy"),
+        ("dhaan", "paddy(common)", "fuzzy"),
+        # short-word typos stay below the cutoff rather than guess a crop
+        ("onoin", None, "none"),
+        ("potato", None, "none"),
+        ("", None, "none"),
+    ],
+)
+def test_commodity_fallbacks(db, name, canonical, how):
+    doc, kind = load_alias_index(db).resolve_commodity(name)
+    assert kind == how
+    assert (doc or {}).get("canonical_name") == canonical
+
+
+MARKET_QUERIES = [
+    dict(state="Punjab"),
+    dict(state="Punjab", market_name="ludhiana"),
+    dict(state="Punjab", market_name="Khanna mandi"),
+    dict(state="Punjab", market_name="Jalandhar", nearest_market=True),
+    dict(state="Delhi"),
+    dict(state="Delhi", market_name="azadpur apmc"),
+    dict(state="Delhi", market_name="okhla"),
+    dict(state="Uttar Pradesh", market_name="Kanpur(Grain)"),
+    dict(state="Uttar Pradesh", market_name="mahewa"),
+    dict(state="Uttar Pradesh", lat=28.0, long=82.0, nearest_market=True),
+    dict(state="Uttar Pradesh", lat=33.5, long=83.0, radius_km=50),
+    dict(state="Kerala"),
+]
+
+
+@pytest.mark.parametrize("query", MARKET_QUERIES)
+def test_market_search_matches_mongo(monkeypatch, db, query):
+    indexed, mongo = _with_and_without_index(monkeypatch, action="search_markets", **query)
+    assert indexed == mongo
+
+
+def test_market_typo_falls_back_to_fuzzy(monkeypatch, db):
+    indexed, mongo = _with_and_without_index(
+        monkeypatch, action="search_markets", state="Punjab", market_name="Ludhiyana"
+    )
+    assert [m["name"] for m in indexed["markets"]] == ["Ludhiana"]
+    assert mongo.get("count", 0) == 0
+
+
+def test_refresh_swaps_only_on_change(db):
+    holder = AliasIndexHolder(refresh_sec=0)
+    first = holder.get(lambda: db)
+    assert holder.refresh() is False
+    assert holder.get(lambda: db) is first
+
+    db["commodity_alias_lookup"].update_one({"canonical_name": "tomato"}, {"$push": {"aliases": "tamaatar"}})
+    assert holder.refresh() is True
+    second = holder.get(lambda: db)
+    assert second is not first
+    assert second.resolve_commodity("tamaatar")[1] == "exact"
+    # readers holding the old snapshot are unaffected
+    assert first.resolve_commodity("tamaatar")[1] != "exact"
+
+
+def test_polling_refresher_picks_up_changes(db):
+    holder = AliasIndexHolder(refresh_sec=0.05)
+    holder.get(lambda: db)
+    try:
+        db["commodity_alias_lookup"].insert_one({"canonical_name": "garlic", "aliases": ["lehsun"], "active": True})
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            if holder.get(lambda: db).resolve_commodity("lehsun")[1] == "exact":
+                break
+            time.sleep(0.02)
+        assert holder.get(lambda: db).resolve_commodity("lehsun")[1] == "exact"
+    finally:
+        holder.close()
+
+
+@pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run")
+def test_benchmark_alias_resolution(monkeypatch, db):
+    """Mongo resolution vs the in-process index, with 1 ms simulated round trips."""
+    for i in range(2000):
+        db["commodity_alias_lookup"].insert_one(
+            {"canonical_name": f"crop {i}", "aliases": [f"alias {i}", f"local {i}"], "active": True}
+        )
+    real_find_one = mongomock.collection.Collection.find_one
+
+    def slow_find_one(self, *args, **kwargs):
+        time.sleep(0.001)
+        return real_find_one(self, *args, **kwargs)
+
+    monkeypatch.setattr(mongomock.collection.Collection, "find_one", slow_find_one)
+    names = ["wheat", "Gehu", "alias 1500", "local 42", "onion"] * 40
+
+    index = load_alias_index(db)
+    start = time.perf_counter()
+    for name in names:
+        index.resolve_commodity(name)
+    indexed_s = time.perf_counter() - start
+
+    coll = db["commodity_alias_lookup"]
+    start = time.perf_counter()
+    for name in names:
+        for key in dict.fromkeys([name.strip().lower(), name.strip()]):
+            if coll.find_one({"active": True, "$or": [{"canonical_name": key}, {"aliases": key}]}):
+                break
+    mongo_s = time.perf_counter() - start
+
+    print(f"\n{len(names)} resolutions: mongo={mongo_s * 1000:.1f} ms, index={indexed_s * 1000:.2f} ms")
+    assert indexed_s * 20 < mongo_s
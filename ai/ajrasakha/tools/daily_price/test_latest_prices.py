@@ -0,0 +1,229 @@
+"""Parity between the latest_prices fast path and the price_records cascade (mongomock)."""
+
+from datetime import datetime, timedelta, timezone
+
+import mongomock
+import pytest
+from bson import ObjectId
+
+import alias_index
+import daily_market_price as dmp
+import latest_prices
+
+
+TODAY = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+WHEAT = ObjectId()
+ONION = ObjectId()
+MAIZE = ObjectId()
+
+
+class _CountingDB:
+    """mongomock database that counts find/distinct calls per collection."""
+
+    def __init__(self, db):
+        self._db = db
+        self.calls: list[tuple[str, str]] = []
+
+    def __getitem__(self, name):
+        db = self
+
+        class _Coll:
+            def __getattr__(self, attr):
+                target = getattr(db._db[name], attr)
+                if attr in ("find", "find_one", "distinct"):
+                    def counted(*args, **kwargs):
+                        db.calls.append((name, attr))
+                        return target(*args, **kwargs)
+                    return counted
+                return target
+
+        return _Coll()
+
+
+def _seed(db):
+    db["commodity_alias_lookup"].insert_many([
+        {"_id": WHEAT, "canonical_name": "wheat", "aliases": ["gehun"], "active": True},
+        {"_id": ONION, "canonical_name": "onion", "aliases": ["pyaz"], "active": True},
+        {"_id": MAIZE, "canonical_name": "maize", "aliases": ["makka"], "active": True},
+    ])
+    markets = {
+        "Khanna": (30.70, 76.22),
+        "Ludhiana": (30.90, 75.85),
+        "Jalandhar": (31.33, 75.58),
+        "Bathinda": (30.21, 74.95),
+    }
+    market_ids = {}
+    for name, (lat, lon) in markets.items():
+        market_ids[name] = db["available_mandi"].insert_one({
+            "name": name, "state": "punjab", "district": name,
+            "aliases": [f"{name} mandi"],
+            "location": {"type": "Point", "coordinates": [lon, lat]},
+        }).inserted_id
+
+    mc_ids = {}
+    for name in markets:
+        for crop, crop_id in (("Wheat", WHEAT), ("Onion", ONION), ("Maize", MAIZE)):
+            for variety in ("Desi", "Other"):
+                mc_ids[(name, crop, variety)] = db["markets_commodities"].insert_one({
+                    "market_id": market_ids[name], "market_name": name,
+                    "commodity_alias_lookup_id": crop_id, "commodity_name": crop,
+                    "variety": variety, "grade": "FAQ", "state": "punjab",
+                    "source_system": "agmarknet",
+                }).inserted_id
+
+    rows = []
+    for (name, crop, variety), mc_id in mc_ids.items():
+        # Bathinda has nothing today; Jalandhar onion and all maize only have old prices
+        newest = 0 if name not in ("Bathinda",) else 3
+        if name == "Jalandhar" and crop == "Onion":
+            newest = 6
+        if crop == "Maize":
+            newest = 4 + len(name) % 3
+        for age in range(newest, newest + 15):
+            base = 2000 if crop == "Wheat" else 1200
+            rows.append({
+                "market_commodity_id": mc_id,
+                "date": TODAY - timedelta(days=age),
+                "min_price": base - 50 + age, "max_price": base + 80 - age,
+                "modal_price": base + (7 * age) % 40 + len(name),
+                "arrival_quantity": 10 + age + len(variety),
+            })
+    db["price_records"].insert_many(rows)
+    return mc_ids
+
+
+@pytest.fixture
+def db(monkeypatch):
+    raw = mongomock.MongoClient()["Price"]
+    _seed(raw)
+    counting = _CountingDB(raw)
+    monkeypatch.setattr(dmp, "get_db", lambda: counting)
+    monkeypatch.setattr(alias_index, "_holder", alias_index.AliasIndexHolder(refresh_sec=0))
+    return counting
+
+
+def _normalize(result: dict) -> dict:
+    def _key(r):
+        return tuple(str(r.get(k)) for k in ("date", "market_name", "commodity_name", "variety"))
+
+    out = dict(result)
+    for key in ("price_records", "arrival_records"):
+        if key in out:
+            out[key] = sorted(out[key], key=_key)
+    return out
+
+
+def _both_paths(monkeypatch, db, **kwargs) -> tuple[dict, dict]:
+    monkeypatch.setattr(dmp, "USE_LATEST_PRICES", False)
+    legacy = dmp.mandi_price_tool(**kwargs)
+    monkeypatch.setattr(dmp, "USE_LATEST_PRICES", True)
+    db.calls.clear()
+    fast = dmp.mandi_price_tool(**kwargs)
+    return legacy, fast
+
+
+QUERIES = [
+    dict(action="get_today_price", commodity_name="wheat", state="Punjab"),
+    dict(action="get_today_price", commodity_name=["gehun", "pyaz"], state="Punjab"),
+    dict(action="get_today_price", commodity_name="onion", state="Punjab", market_name="Jalandhar"),
+    dict(action="get_today_price", commodity_name="wheat", state="Punjab", market_name="Khanna"),
+    dict(action="get_today_price", commodity_name="makka", state="Punjab"),
+    dict(action="get_today_price", commodity_name="maize", state="Punjab", market_name="Ludhiana"),
+    dict(action="get_today_price", commodity_name="wheat", state="Punjab", market_name="Bathinda mandi"),
+    dict(action="get_today_price", commodity_name="wheat", state="Punjab", lat=30.2, long=74.9),
+    dict(action="get_today_price", commodity_name="wheat", state="Punjab", lat=30.8, long=76.0,
+         nearest_market=True, radius_km=60),
+    dict(action="get_today_arrival", commodity_name="onion", state="Punjab"),
+    dict(action="get_today_arrival", commodity_name="onion", state="Punjab", market_name="Jalandhar"),
+    dict(action="get_today_arrival", commodity_name="maize", state="Punjab"),
+    dict(action=["get_today_price", "get_today_arrival"], commodity_name="wheat", state="Punjab"),
+    dict(action="get_today_price", commodity_name="rice", state="Punjab"),
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_latest_prices_matches_cascade(monkeypatch, db, query):
+    latest_prices.rebuild_latest_prices(db._db)
+    legacy, fast = _both_paths(monkeypatch, db, **query)
+    assert _normalize(fast) == _normalize(legacy)
+    assert ("price_records", "find") not in db.calls
+    assert ("price_records", "distinct") not in db.calls
+
+
+def test_fast_path_is_one_price_query(monkeypatch, db):
+    latest_prices.rebuild_latest_prices(db._db)
+    _, fast = _both_paths(monkeypatch, db, action="get_today_price", commodity_name="wheat", state="Punjab")
+    assert fast["price_records"]
+    assert db.calls.count(("latest_prices", "find")) == 1
+    assert not any(name in ("price_records", "markets_commodities") for name, _ in db.calls)
+
+
+def test_empty_materialization_falls_back_to_cascade(monkeypatch, db):
+    legacy, fast = _both_paths(monkeypatch, db, action="get_today_price", commodity_name="wheat", state="Punjab")
+    assert _normalize(fast) == _normalize(legacy)
+    assert ("price_records", "find") in db.calls
+
+
+def test_stale_watermark_falls_back_to_cascade(monkeypatch, db):
+    raw = db._db
+    latest_prices.rebuild_latest_prices(raw)
+    assert latest_prices.is_current(raw)
+    stale = datetime.now(timezone.utc) - timedelta(seconds=latest_prices.LATEST_PRICES_MAX_AGE_SEC + 60)
+    latest_prices.mark_current(raw, stale)
+
+    # a row the (dead) watcher never applied is still served
+    khanna = raw["markets_commodities"].find_one({"market_name": "Khanna", "commodity_name": "Wheat"})
+    raw["price_records"].insert_one({
+        "market_commodity_id": khanna["_id"], "date": TODAY + timedelta(days=1),
+        "min_price": 1900, "max_price": 2300, "modal_price": 2345, "arrival_quantity": 9,
+    })
+    query = dict(action="get_today_price", commodity_name="wheat", state="Punjab", market_name="Khanna")
+    legacy, fast = _both_paths(monkeypatch, db, **query)
+    assert _normalize(fast) == _normalize(legacy)
+    assert 2345.0 in {r["modal_price"] for r in fast["price_records"]}
+    assert ("latest_prices", "find") not in db.calls
+
+    # any writer run brings the fast path back
+    latest_prices.apply_price_records(raw, [])
+    assert latest_prices.is_current(raw)
+
+
+def test_missing_watermark_is_not_current(db):
+    raw = db._db
+    assert not latest_prices.is_current(raw)
+    latest_prices.rebuild_latest_prices(raw)
+    raw["latest_prices_meta"].delete_many({})
+    assert not latest_prices.is_current(raw)
+
+
+def test_incremental_ingest_keeps_parity(monkeypatch, db):
+    raw = db._db
+    latest_prices.rebuild_latest_prices(raw, keep=5)
+    bathinda = raw["markets_commodities"].find({"market_name": "Bathinda", "commodity_name": "Wheat"})
+    new_rows = [
+        {"market_commodity_id": mc["_id"], "date": TODAY, "min_price": 1900,
+         "max_price": 2300, "modal_price": 2222, "arrival_quantity": 42}
+        for mc in bathinda
+    ]
+    raw["price_records"].insert_many(new_rows)
+    assert latest_prices.apply_price_records(raw, new_rows, keep=5) == 2
+    # re-applying the same rows is idempotent
+    latest_prices.apply_price_records(raw, new_rows, keep=5)
+
+    doc = raw["latest_prices"].find_one({"_id": new_rows[0]["market_commodity_id"]})
+    assert len(doc["records"]) == 5
+    assert doc["records"][0]["modal_price"] == 2222
+    assert doc["latest_date"] == TODAY
+
+    query = dict(action="get_today_price", commodity_name="wheat", state="Punjab", market_name="Bathinda")
+    legacy, fast = _both_paths(monkeypatch, db, **query)
+    assert _normalize(fast) == _normalize(legacy)
+    assert {r["modal_price"] for r in fast["price_records"]} == {2222.0}
+
+
+def test_rebuild_removes_stale_documents(db):
+    raw = db._db
+    raw["latest_prices"].insert_one({"_id": ObjectId(), "records": []})
+    count = latest_prices.rebuild_latest_prices(raw)
+    assert count == raw["markets_commodities"].count_documents({})
+    assert raw["latest_prices"].count_documents({}) == count
@@ -2,23 +2,38 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from typing import Any, Optional
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field, model_validator
 
 try:
+    from .golden_cache import start_watchers, stop_watchers
+    from .golden_core import answers_collection, questions_collection
     from .golden_search import gdb_search, gdb_search_v2
-    from .golden_pending_duplicate import check_pending_duplicate
+    from .golden_pending_duplicate import check_pending_duplicate, check_pending_duplicates_batch
     from .query_refinement import refine_query_to_core_farming_question
 except ImportError:
+    from golden_cache import start_watchers, stop_watchers
+    from golden_core import answers_collection, questions_collection
     from golden_search import gdb_search, gdb_search_v2
-    from golden_pending_duplicate import check_pending_duplicate
+    from golden_pending_duplicate import check_pending_duplicate, check_pending_duplicates_batch
     from query_refinement import refine_query_to_core_farming_question
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Search result cache serves hits only while these change streams are open.
+    watchers = start_watchers(questions_collection, answers_collection)
+    yield
+    await stop_watchers(watchers)
+
+
 app = FastAPI(
     title="AjraSakha Golden API",
     version="1.0.0",
+    lifespan=lifespan,
     description=(
         "Golden DB retrieval: strict exact match, then vector RAG + Gemma classification. "
         "All steps use the planner `rephrased_query` (English, spelling/grammar cleaned)."
@@ -145,6 +160,28 @@ class PendingDuplicateCheckResponse(BaseModel):
     audit: dict[str, Any] = Field(default_factory=dict)
 
 
+class PendingDuplicateBatchRequest(BaseModel):
+    items: list[PendingDuplicateCheckRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Independent pending-duplicate checks; each item follows the single-check request rules.",
+    )
+
+
+class PendingDuplicateBatchItem(BaseModel):
+    index: int = Field(..., description="Position of the item in the request `items` list.")
+    result: Optional[PendingDuplicateCheckResponse] = None
+    error: Optional[str] = Field(
+        None,
+        description="Set instead of `result` when the item could not be checked (e.g. question_id not found).",
+    )
+
+
+class PendingDuplicateBatchResponse(BaseModel):
+    results: list[PendingDuplicateBatchItem] = Field(default_factory=list)
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok"}
@@ -202,6 +239,26 @@ async def check_pending_duplicate_endpoint(body: PendingDuplicateCheckRequest):
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
+@app.post(
+    "/v1/gdb/check-pending-duplicate/batch",
+    response_model=PendingDuplicateBatchResponse,
+    summary="Check pending duplicates for many questions",
+    description=(
+        "Same pipeline as `/v1/gdb/check-pending-duplicate`, run for every item with shared round trips:\n"
+        "1. `question_id` items are loaded with one MongoDB `$in` query.\n"
+        "2. Items without an exact hit are embedded over **one** pooled embedding client.\n"
+        "3. Vector searches run concurrently (bounded by `GOLDEN_PENDING_BATCH_CONCURRENCY`).\n"
+        "4. All vector hits are hydrated with one `$in` query, then Gemma verifies each item.\n"
+        "Per-item failures are reported in `error` without failing the batch."
+    ),
+)
+async def check_pending_duplicate_batch_endpoint(body: PendingDuplicateBatchRequest):
+    results = await check_pending_duplicates_batch(
+        [item.model_dump() for item in body.items]
+    )
+    return {"results": results}
+
+
 # === V2 ENDPOINTS ===
 # V2 endpoints use LLM to refine the query by removing crop/state names,
 # since these are filtered separately in database queries.
@@ -0,0 +1,359 @@
+"""Result cache for gdb_search / gdb_search_v2, invalidated by MongoDB change streams.
+
+Entries are keyed by a fingerprint of the normalized query, crop, state and
+search options. Each entry remembers the question ids it returned and the
+crop/state scope it searched, so a change event only drops the entries it can
+affect:
+
+- a question referenced by an entry changes or is deleted;
+- a closed question is inserted/updated inside an entry's crop/state scope;
+- the final answer of a referenced question changes.
+
+A TTL bounds staleness if a change event is missed, and the cache only serves
+hits while both change-stream watchers are connected (see ``start_watchers``).
+Results from a search where a retrieval source failed (see
+``golden_core.note_retrieval_failure``) are returned but never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import functools
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+try:
+    from .golden_core import _normalize_crop_state, _normalize_question_text, track_retrieval_failures
+except ImportError:
+    from golden_core import _normalize_crop_state, _normalize_question_text, track_retrieval_failures
+
+log = logging.getLogger(__name__)
+
+GOLDEN_SEARCH_CACHE_ENABLED = os.getenv("GOLDEN_SEARCH_CACHE_ENABLED", "true").lower() == "true"
+GOLDEN_SEARCH_CACHE_TTL_S = float(os.getenv("GOLDEN_SEARCH_CACHE_TTL_S", "900"))
+GOLDEN_SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("GOLDEN_SEARCH_CACHE_MAX_ENTRIES", "5000"))
+WATCH_RETRY_BACKOFF_S = float(os.getenv("GOLDEN_SEARCH_CACHE_WATCH_BACKOFF_S", "5"))
+
+QUESTION_EVENT_SOURCE = "questions"
+ANSWER_EVENT_SOURCE = "answers"
+
+
+@dataclass
+class _Entry:
+    result: dict[str, Any]
+    expires_at: float
+    crop: str
+    state: str
+    question_ids: frozenset[str] = field(default_factory=frozenset)
+
+
+def _referenced_question_ids(response: Any) -> set[str]:
+    """Every question id a search response mentions (matches, audit, v2 sources)."""
+    ids: set[str] = set()
+    stack = [response]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in ("question_id", "selected_question_id") and value:
+                    ids.add(str(value))
+                elif key == "retrieval_sources" and isinstance(value, dict):
+                    ids.update(str(k) for k in value)
+                else:
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(node)
+    return ids
+
+
+def search_fingerprint(
+    name: str,
+    rephrased_query: str,
+    crop: str,
+    state: str,
+    **options: Any,
+) -> tuple[str, str, str]:
+    """Return (fingerprint, normalized_crop, normalized_state) for a search call."""
+    crop_norm, state_norm = _normalize_crop_state(crop, state)
+    original_query = options.pop("original_query", None)
+    payload = {
+        "name": name,
+        "query": _normalize_question_text(rephrased_query or ""),
+        "original_query": _normalize_question_text(original_query or ""),
+        "crop": crop_norm,
+        "state": state_norm,
+        "options": {k: options[k] for k in sorted(options)},
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest(), crop_norm, state_norm
+
+
+class GoldenSearchCache:
+    def __init__(
+        self,
+        *,
+        ttl_s: float = GOLDEN_SEARCH_CACHE_TTL_S,
+        max_entries: int = GOLDEN_SEARCH_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._by_question: dict[str, set[str]] = {}
+        self._live_sources: set[str] = set()
+        # bumped on every change event so in-flight misses never store stale results
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def active(self) -> bool:
+        """Serve hits only while both change streams are open."""
+        return {QUESTION_EVENT_SOURCE, ANSWER_EVENT_SOURCE} <= self._live_sources
+
+    def mark_live(self, source: str) -> None:
+        self._live_sources.add(source)
+
+    def mark_down(self, source: str) -> None:
+        self._live_sources.discard(source)
+        self.clear()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= self._clock():
+            self._drop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry.result)
+
+    def put(
+        self,
+        key: str,
+        result: dict[str, Any],
+        *,
+        crop: str,
+        state: str,
+        generation: Optional[int] = None,
+    ) -> None:
+        if generation is not None and generation != self.generation:
+            return
+        if key in self._entries:
+            self._drop(key)
+        question_ids = frozenset(_referenced_question_ids(result))
+        # crop fallback widens the searched scope to every crop
+        scope_crop = "all" if result.get("crop_fallback") else crop
+        self._entries[key] = _Entry(
+            result=copy.deepcopy(result),
+            expires_at=self._clock() + self.ttl_s,
+            crop=scope_crop,
+            state=state,
+            question_ids=question_ids,
+        )
+        for question_id in question_ids:
+            self._by_question.setdefault(question_id, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        self.generation += 1
+        if self._entries:
+            self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._by_question.clear()
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for question_id in entry.question_ids:
+            keys = self._by_question.get(question_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_question[question_id]
+
+    def invalidate_question(self, question_id: str) -> int:
+        keys = list(self._by_question.get(str(question_id), ()))
+        for key in keys:
+            self._drop(key)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def invalidate_scope(self, crop: str, state: str) -> int:
+        """Drop entries whose crop/state filter would match a question in (crop, state)."""
+        keys = [
+            key
+            for key, entry in self._entries.items()
+            if (entry.crop == "all" or entry.crop == crop)
+            and (entry.state == "all" or entry.state == state)
+        ]
+        for key in keys:
+            self._drop(key)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def apply_change(self, source: str, change: dict[str, Any]) -> int:
+        """Invalidate entries affected by one change-stream event; returns entries dropped."""
+        self.generation += 1
+        op = change.get("operationType")
+        if op in ("drop", "rename", "dropDatabase", "invalidate"):
+            dropped = len(self._entries)
+            self.clear()
+            return dropped
+
+        doc_id = (change.get("documentKey") or {}).get("_id")
+        full_doc = change.get("fullDocument")
+
+        if source == ANSWER_EVENT_SOURCE:
+            question_id = (full_doc or {}).get("questionId")
+            if question_id is None:
+                # deleted answer: the owning question is unknown
+                dropped = len(self._entries)
+                self.clear()
+                return dropped
+            return self.invalidate_question(str(question_id))
+
+        dropped = self.invalidate_question(str(doc_id)) if doc_id is not None else 0
+        if op == "delete":
+            return dropped
+        if full_doc is None:
+            dropped += len(self._entries)
+            self.clear()
+            return dropped
+        if full_doc.get("status") != "closed":
+            # golden search only retrieves closed questions
+            return dropped
+        details = full_doc.get("details") or {}
+        return dropped + self.invalidate_scope(
+            str(details.get("normalised_crop") or ""),
+            str(details.get("state") or ""),
+        )
+
+    def cached(
+        self, name: str
+    ) -> Callable[[Callable[..., Awaitable[dict[str, Any]]]], Callable[..., Awaitable[dict[str, Any]]]]:
+        """Decorator for ``gdb_search``-style coroutines (query, crop, state, **options)."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(rephrased_query: str, crop: str, state: str, **options: Any):
+                if not (GOLDEN_SEARCH_CACHE_ENABLED and self.active):
+                    return await func(rephrased_query, crop, state, **options)
+                key, crop_norm, state_norm = search_fingerprint(
+                    name, rephrased_query, crop, state, **dict(options)
+                )
+                cached_result = self.get(key)
+                if cached_result is not None:
+                    log.info("%s cache hit key=%s", name, key[:12])
+                    return _echo_request(cached_result, rephrased_query, options.get("original_query"))
+                generation = self.generation
+                with track_retrieval_failures() as failures:
+                    result = await func(rephrased_query, crop, state, **options)
+                if failures:
+                    # a source failed and was treated as "no hits"; don't pin that for the TTL
+                    log.info("%s not cached: degraded retrieval (%s)", name, ", ".join(failures))
+                    return result
+                self.put(key, result, crop=crop_norm, state=state_norm, generation=generation)
+                return result
+
+            wrapper.uncached = func
+            return wrapper
+
+        return decorator
+
+
+def _echo_request(
+    result: dict[str, Any],
+    rephrased_query: str,
+    original_query: Optional[str],
+) -> dict[str, Any]:
+    """Restore the caller's own query text in echoed fields of a cached response."""
+    query = (rephrased_query or "").strip()
+    if "rephrased_query" in result:
+        result["rephrased_query"] = query
+    if "original_query" in result:
+        scoring_query = (original_query or rephrased_query or "").strip()
+        result["original_query"] = scoring_query if scoring_query != query else None
+    return result
+
+
+search_cache = GoldenSearchCache()
+
+
+async def watch_collection(
+    collection: Any,
+    source: str,
+    cache: GoldenSearchCache = search_cache,
+    *,
+    retry_backoff_s: float = WATCH_RETRY_BACKOFF_S,
+) -> None:
+    """Apply change events from ``collection`` to ``cache`` until cancelled.
+
+    While the stream is down the cache stops serving hits and is cleared
+    (events may have been missed); the watch re-opens after ``retry_backoff_s``.
+    """
+    while True:
+        try:
+            async with await collection.watch(full_document="updateLookup") as stream:
+                cache.mark_live(source)
+                log.info("golden search cache watching %s change stream", source)
+                async for change in stream:
+                    dropped = cache.apply_change(source, change)
+                    if dropped:
+                        log.info(
+                            "golden search cache: %s %s dropped %d entr%s",
+                            source,
+                            change.get("operationType"),
+                            dropped,
+                            "y" if dropped == 1 else "ies",
+                        )
+        except asyncio.CancelledError:
+            cache.mark_down(source)
+            raise
+        except Exception as exc:
+            log.warning(
+                "golden search cache %s watch failed: %s: %s; clearing cache",
+                source,
+                type(exc).__name__,
+                exc,
+            )
+        cache.mark_down(source)
+        await asyncio.sleep(retry_backoff_s)
+
+
+def start_watchers(
+    questions_collection: Any,
+    answers_collection: Any,
+    cache: GoldenSearchCache = search_cache,
+) -> list[asyncio.Task]:
+    """Start change-stream watchers; hits are served once both streams are open."""
+    if not GOLDEN_SEARCH_CACHE_ENABLED:
+        log.info("golden search cache disabled (GOLDEN_SEARCH_CACHE_ENABLED=false)")
+        return []
+    return [
+        asyncio.create_task(watch_collection(questions_collection, QUESTION_EVENT_SOURCE, cache)),
+        asyncio.create_task(watch_collection(answers_collection, ANSWER_EVENT_SOURCE, cache)),
+    ]
+
+
+async def stop_watchers(tasks: list[asyncio.Task]) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
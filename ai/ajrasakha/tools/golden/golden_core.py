@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
 import logging
 import os
 import re
@@ -56,6 +58,31 @@ RETRIEVAL_SOURCE_RAG = "rag"
 RETRIEVAL_SOURCE_STRICT_EXACT = "strict_exact"
 RETRIEVAL_SOURCE_BM25 = "bm25"
 
+# Retrieval sources that failed (and were degraded to no hits) during the
+# current search; None outside track_retrieval_failures().
+_retrieval_failures: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar(
+    "golden_retrieval_failures", default=None
+)
+
+
+def note_retrieval_failure(source: str) -> None:
+    """Record that ``source`` failed and its hits are missing from the current search."""
+    failures = _retrieval_failures.get()
+    if failures is not None:
+        failures.append(source)
+
+
+@contextlib.contextmanager
+def track_retrieval_failures():
+    """Collect note_retrieval_failure() calls made by the enclosed search (and its tasks)."""
+    failures: list[str] = []
+    token = _retrieval_failures.set(failures)
+    try:
+        yield failures
+    finally:
+        _retrieval_failures.reset(token)
+
+
 if not MONGODB_URI:
     raise RuntimeError("GOLDEN_MONGODB_URI is not set")
 if not MONGODB_VECTOR_INDEX:
@@ -92,6 +119,24 @@ class PendingQuestionCandidate(BaseModel):
 PENDING_DUPLICATE_SOURCES = ("AJRASAKHA", "WHATSAPP")
 PENDING_DUPLICATE_STATUSES = ("open", "delayed", "in-review")
 PENDING_VECTOR_TOP_K = 3
+PENDING_BATCH_CONCURRENCY = int(os.getenv("GOLDEN_PENDING_BATCH_CONCURRENCY", "8"))
+PENDING_QUESTION_PROJECTION = {
+    "_id": 1,
+    "question": 1,
+    "text": 1,
+    "details": 1,
+    "referenceQuestionId": 1,
+    "createdAt": 1,
+    "source": 1,
+}
+
+
+class PendingSearchInput(BaseModel):
+    query: str
+    crop: str
+    state: str
+    exclude_question_id: Optional[str] = None
+    created_before: Optional[datetime] = None
 
 
 def _truncate_text(text: str | None, max_len: int = 100) -> str:
@@ -160,23 +205,52 @@ def _author_display_name(user_document: dict | None) -> Optional[str]:
     return full or None
 
 
-async def _embed_text(text: str) -> list[float]:
-    payload = {"text": text}
-    timeout = httpx.Timeout(EMBEDDING_TIMEOUT_S)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        resp = await client.post(
-            EMBEDDING_ENDPOINT,
-            headers={"Content-Type": "application/json"},
-            json=payload,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+async def _post_embedding(client: httpx.AsyncClient, text: str) -> list[float]:
+    resp = await client.post(
+        EMBEDDING_ENDPOINT,
+        headers={"Content-Type": "application/json"},
+        json={"text": text},
+    )
+    resp.raise_for_status()
+    data = resp.json()
     embedding = data.get("embedding")
     if not isinstance(embedding, list) or not embedding:
         raise ValueError("Embedding endpoint returned invalid 'embedding'")
     return embedding
 
 
+async def _embed_text(text: str) -> list[float]:
+    timeout = httpx.Timeout(EMBEDDING_TIMEOUT_S)
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        return await _post_embedding(client, text)
+
+
+async def _embed_texts(texts: list[str]) -> list[list[float] | Exception]:
+    """Embed many texts over one pooled client, at most
+    ``PENDING_BATCH_CONCURRENCY`` requests in flight.
+
+    The embedding service takes one ``{"text": ...}`` per request. Returns one
+    entry per text, in order: its vector, or the exception that text failed with.
+    """
+    if not texts:
+        return []
+    concurrency = max(1, PENDING_BATCH_CONCURRENCY)
+    timeout = httpx.Timeout(EMBEDDING_TIMEOUT_S)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+
+        async def _one(text: str) -> list[float]:
+            async with semaphore:
+                return await _post_embedding(client, text)
+
+        results = await asyncio.gather(*(_one(t) for t in texts), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+    return results
+
+
 async def _vector_search_questions(
     *,
     query_vector: list[float],
@@ -382,6 +456,7 @@ async def vector_rag_search(
             log.info("vector search: questions=%d", len(question_docs))
     except Exception as exc:
         log.warning("vector search failed: %s: %s", type(exc).__name__, exc)
+        note_retrieval_failure(RETRIEVAL_SOURCE_RAG)
         return []
 
     result: list[QuestionAnswerPair] = []
@@ -689,6 +764,7 @@ async def bm25_search(
         
     except Exception as exc:
         log.warning("bm25 search failed: %s: %s", type(exc).__name__, exc)
+        note_retrieval_failure(RETRIEVAL_SOURCE_BM25)
         return []
 
 
@@ -794,6 +870,50 @@ async def _pending_vector_search_questions(
     return await cursor.to_list(length=k)
 
 
+async def _pending_vector_search_hits(
+    *,
+    query_vector: list[float],
+    k: int,
+    index_filter: dict[str, Any],
+    post_match: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Like ``_pending_vector_search_questions`` but returns only ``_id`` + score (hydrated later)."""
+    fetch_limit = max(30, k * 10)
+    pipeline: list[dict[str, Any]] = [
+        {
+            "$vectorSearch": {
+                "index": MONGODB_VECTOR_INDEX,
+                "path": "question_embedding",
+                "queryVector": query_vector,
+                "numCandidates": max(100, fetch_limit * 10),
+                "limit": fetch_limit,
+                "filter": index_filter,
+            }
+        },
+        {"$match": post_match},
+        {"$project": {"_id": 1, "vector_score": {"$meta": "vectorSearchScore"}}},
+        {"$limit": k},
+    ]
+    cursor = await questions_collection.aggregate(pipeline)
+    return await cursor.to_list(length=k)
+
+
+async def _hydrate_questions(
+    ids: list[Any],
+    projection: dict[str, Any] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Fetch question documents for ``ids`` with a single ``$in`` query, keyed by str(_id)."""
+    unique_ids = list(dict.fromkeys(ids))
+    if not unique_ids:
+        return {}
+    cursor = questions_collection.find(
+        {"_id": {"$in": unique_ids}},
+        projection or PENDING_QUESTION_PROJECTION,
+    )
+    docs = await cursor.to_list(length=None)
+    return {str(doc["_id"]): doc for doc in docs}
+
+
 def _crop_from_question_details(details: dict | None) -> str:
     details = details or {}
     normalised = (details.get("normalised_crop") or "").strip()
@@ -882,6 +1002,20 @@ async def get_question_by_id(question_id: str) -> dict[str, Any] | None:
     )
 
 
+async def get_questions_by_ids(question_ids: list[str]) -> dict[str, dict[str, Any]]:
+    """Batch form of ``get_question_by_id``; invalid or missing ids are absent from the result."""
+    oids = []
+    for question_id in question_ids:
+        try:
+            oids.append(ObjectId(question_id))
+        except Exception:
+            continue
+    return await _hydrate_questions(
+        oids,
+        {"question": 1, "text": 1, "details": 1, "createdAt": 1},
+    )
+
+
 async def pending_exact_search(
     query: str,
     crop: str,
@@ -993,6 +1127,100 @@ async def pending_vector_search(
     return result
 
 
+async def pending_vector_search_batch(
+    inputs: list[PendingSearchInput],
+    *,
+    top_k: int = PENDING_VECTOR_TOP_K,
+    concurrency: int = PENDING_BATCH_CONCURRENCY,
+) -> list[list[PendingQuestionCandidate] | Exception]:
+    """Batch ``pending_vector_search``: embeddings over one pooled client, bounded concurrent
+    vector queries, and a single ``$in`` hydration for all hits.
+
+    Returns one entry per input, in input order: its candidate list, or the
+    exception its embedding failed with (no vector query is run for it). A
+    failed vector query yields an empty list for that input only.
+    """
+    if not inputs:
+        return []
+
+    normalized = [_normalize_crop_state(item.crop, item.state) for item in inputs]
+    log.info(
+        "pending vector batch start inputs=%d top_k=%d concurrency=%d",
+        len(inputs),
+        top_k,
+        concurrency,
+    )
+    try:
+        vectors = await _embed_texts([item.query for item in inputs])
+    except Exception as exc:
+        vectors = [exc] * len(inputs)
+    for item, vector in zip(inputs, vectors):
+        if isinstance(vector, Exception):
+            log.warning(
+                "pending vector batch embedding failed query=%r: %s: %s",
+                _truncate_text(item.query, 80),
+                type(vector).__name__,
+                vector,
+            )
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _search(item: PendingSearchInput, crop: str, state: str, vector: list[float] | Exception):
+        if isinstance(vector, Exception):
+            return vector
+        async with semaphore:
+            try:
+                return await _pending_vector_search_hits(
+                    query_vector=vector,
+                    k=top_k,
+                    index_filter=_pending_vector_index_filter(crop, state),
+                    post_match=_pending_vector_post_match(
+                        exclude_question_id=item.exclude_question_id,
+                        created_before=item.created_before,
+                    ),
+                )
+            except Exception as exc:
+                log.warning(
+                    "pending vector batch search failed query=%r: %s: %s",
+                    _truncate_text(item.query, 80),
+                    type(exc).__name__,
+                    exc,
+                )
+                return []
+
+    hits_per_input = await asyncio.gather(
+        *(
+            _search(item, crop, state, vector)
+            for item, (crop, state), vector in zip(inputs, normalized, vectors)
+        )
+    )
+    docs_by_id = await _hydrate_questions(
+        [hit["_id"] for hits in hits_per_input if isinstance(hits, list) for hit in hits]
+    )
+
+    results: list[list[PendingQuestionCandidate] | Exception] = []
+    for item, (crop, state), hits in zip(inputs, normalized, hits_per_input):
+        if isinstance(hits, Exception):
+            results.append(hits)
+            continue
+        candidates = [
+            _doc_to_pending_candidate(
+                docs_by_id[str(hit["_id"])],
+                similarity_score=hit.get("vector_score"),
+            )
+            for hit in hits
+            if str(hit["_id"]) in docs_by_id
+        ]
+        _log_pending_hits("pending_vector_batch", item.query, crop, state, candidates)
+        results.append(candidates)
+    log.info(
+        "pending vector batch done inputs=%d hydrated=%d",
+        len(inputs),
+        len(docs_by_id),
+    )
+    return results
+
+
 def match_entry(pair: QuestionAnswerPair, retrieval_source: str, **extra: Any) -> dict:
     entry = {
         "question_id": pair.question_id or "",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Optional
@@ -9,28 +10,36 @@ from typing import Any, Optional
 try:
     from .gemma_classifier import GEMMA_MODEL, filter_pending_duplicate_batch
     from .golden_core import (
+        PENDING_BATCH_CONCURRENCY,
         PendingQuestionCandidate,
+        PendingSearchInput,
         _crop_from_question_details,
         _normalize_crop_state,
         _parse_created_at,
         _truncate_text,
         get_question_by_id,
+        get_questions_by_ids,
         parse_created_before,
         pending_exact_search,
         pending_vector_search,
+        pending_vector_search_batch,
     )
 except ImportError:
     from gemma_classifier import GEMMA_MODEL, filter_pending_duplicate_batch
     from golden_core import (
+        PENDING_BATCH_CONCURRENCY,
         PendingQuestionCandidate,
+        PendingSearchInput,
         _crop_from_question_details,
         _normalize_crop_state,
         _parse_created_at,
         _truncate_text,
         get_question_by_id,
+        get_questions_by_ids,
         parse_created_before,
         pending_exact_search,
         pending_vector_search,
+        pending_vector_search_batch,
     )
 
 log = logging.getLogger(__name__)
@@ -141,30 +150,31 @@ def _build_duplicate_response(
     }
 
 
-async def check_pending_duplicate(
+def _resolve_check_input(
     *,
-    question_id: str | None = None,
-    rephrased_query: str | None = None,
-    crop: str | None = None,
-    state: str | None = None,
-    created_before: str | None = None,
-) -> dict[str, Any]:
+    question_id: str | None,
+    question_doc: dict[str, Any] | None,
+    rephrased_query: str | None,
+    crop: str | None,
+    state: str | None,
+    created_before: str | None,
+) -> tuple[str, str, str, str | None, datetime | None]:
+    """Return (query, crop_norm, state_norm, exclude_id, created_before_dt) for one check."""
     exclude_id: str | None = None
     created_before_dt: datetime | None = None
 
     if question_id:
-        doc = await get_question_by_id(question_id)
-        if not doc:
+        if not question_doc:
             raise LookupError(f"Question not found: {question_id}")
-        query = (doc.get("question") or doc.get("text") or "").strip()
-        details = doc.get("details") or {}
+        query = (question_doc.get("question") or question_doc.get("text") or "").strip()
+        details = question_doc.get("details") or {}
         crop_raw = _crop_from_question_details(details)
         state_raw = (details.get("state") or "").strip()
         exclude_id = question_id
         if created_before:
             created_before_dt = parse_created_before(created_before)
         else:
-            created_before_dt = _parse_created_at(doc.get("createdAt"))
+            created_before_dt = _parse_created_at(question_doc.get("createdAt"))
     else:
         query = (rephrased_query or "").strip()
         crop_raw = crop or ""
@@ -176,60 +186,55 @@ async def check_pending_duplicate(
         raise ValueError("rephrased_query is required")
 
     crop_norm, state_norm = _normalize_crop_state(crop_raw, state_raw)
+    return query, crop_norm, state_norm, exclude_id, created_before_dt
 
+
+def _exact_match_response(
+    query: str,
+    crop_norm: str,
+    state_norm: str,
+    exact_matches: list[PendingQuestionCandidate],
+    *,
+    created_before: datetime | None = None,
+) -> dict[str, Any]:
+    winner = pick_duplicate_winner(exact_matches)
+    if winner is None:
+        return _build_no_duplicate_response(
+            query, crop_norm, state_norm, [], created_before=created_before
+        )
+    audit = [
+        _candidate_audit_entry(c, is_duplicate=True) for c in exact_matches
+    ]
     log.info(
-        "check_pending_duplicate start query=%r crop=%s state=%s exclude=%s created_before=%s",
-        _truncate_text(query, 80),
-        crop_norm,
-        state_norm,
-        exclude_id or "none",
-        created_before_dt.isoformat() if created_before_dt else "none",
+        "check_pending_duplicate done path=exact winner=%s returned_id=%s score=%s",
+        winner.question_id,
+        duplicate_return_id(winner),
+        winner.similarity_score,
     )
-
-    exact_matches = await pending_exact_search(
+    return _build_duplicate_response(
         query,
         crop_norm,
         state_norm,
-        exclude_question_id=exclude_id,
-        created_before=created_before_dt,
+        winner,
+        "exact",
+        audit,
+        audit_status="exact_match",
+        created_before=created_before,
     )
-    if exact_matches:
-        winner = pick_duplicate_winner(exact_matches)
-        if winner is None:
-            return _build_no_duplicate_response(
-                query, crop_norm, state_norm, [], created_before=created_before_dt
-            )
-        audit = [
-            _candidate_audit_entry(c, is_duplicate=True) for c in exact_matches
-        ]
-        log.info(
-            "check_pending_duplicate done path=exact winner=%s returned_id=%s score=%s",
-            winner.question_id,
-            duplicate_return_id(winner),
-            winner.similarity_score,
-        )
-        return _build_duplicate_response(
-            query,
-            crop_norm,
-            state_norm,
-            winner,
-            "exact",
-            audit,
-            audit_status="exact_match",
-            created_before=created_before_dt,
-        )
 
-    vector_matches = await pending_vector_search(
-        query,
-        crop_norm,
-        state_norm,
-        exclude_question_id=exclude_id,
-        created_before=created_before_dt,
-    )
+
+async def _similarity_match_response(
+    query: str,
+    crop_norm: str,
+    state_norm: str,
+    vector_matches: list[PendingQuestionCandidate],
+    *,
+    created_before: datetime | None = None,
+) -> dict[str, Any]:
     if not vector_matches:
         log.info("check_pending_duplicate done path=empty (no vector hits)")
         return _build_no_duplicate_response(
-            query, crop_norm, state_norm, [], created_before=created_before_dt
+            query, crop_norm, state_norm, [], created_before=created_before
         )
 
     filter_results = await filter_pending_duplicate_batch(
@@ -260,14 +265,14 @@ async def check_pending_duplicate(
         )
         return _build_no_duplicate_response(
             query, crop_norm, state_norm, candidates_checked,
-            created_before=created_before_dt,
+            created_before=created_before,
         )
 
     winner = pick_duplicate_winner(duplicate_candidates)
     if winner is None:
         return _build_no_duplicate_response(
             query, crop_norm, state_norm, candidates_checked,
-            created_before=created_before_dt,
+            created_before=created_before,
         )
 
     log.info(
@@ -284,5 +289,197 @@ async def check_pending_duplicate(
         "similarity",
         candidates_checked,
         audit_status="similarity_llm_verified",
+        created_before=created_before,
+    )
+
+
+async def check_pending_duplicate(
+    *,
+    question_id: str | None = None,
+    rephrased_query: str | None = None,
+    crop: str | None = None,
+    state: str | None = None,
+    created_before: str | None = None,
+) -> dict[str, Any]:
+    question_doc = await get_question_by_id(question_id) if question_id else None
+    query, crop_norm, state_norm, exclude_id, created_before_dt = _resolve_check_input(
+        question_id=question_id,
+        question_doc=question_doc,
+        rephrased_query=rephrased_query,
+        crop=crop,
+        state=state,
+        created_before=created_before,
+    )
+
+    log.info(
+        "check_pending_duplicate start query=%r crop=%s state=%s exclude=%s created_before=%s",
+        _truncate_text(query, 80),
+        crop_norm,
+        state_norm,
+        exclude_id or "none",
+        created_before_dt.isoformat() if created_before_dt else "none",
+    )
+
+    exact_matches = await pending_exact_search(
+        query,
+        crop_norm,
+        state_norm,
+        exclude_question_id=exclude_id,
+        created_before=created_before_dt,
+    )
+    if exact_matches:
+        return _exact_match_response(
+            query, crop_norm, state_norm, exact_matches, created_before=created_before_dt
+        )
+
+    vector_matches = await pending_vector_search(
+        query,
+        crop_norm,
+        state_norm,
+        exclude_question_id=exclude_id,
         created_before=created_before_dt,
     )
+    return await _similarity_match_response(
+        query, crop_norm, state_norm, vector_matches, created_before=created_before_dt
+    )
+
+
+async def check_pending_duplicates_batch(
+    items: list[dict[str, Any]],
+    *,
+    concurrency: int = PENDING_BATCH_CONCURRENCY,
+) -> list[dict[str, Any]]:
+    """Run ``check_pending_duplicate`` for many inputs with shared round trips.
+
+    Each item takes the same keyword fields as ``check_pending_duplicate``.
+    ``question_id`` items are loaded with one ``$in`` query, inputs without an
+    exact hit share one embedding client and one hydration query, and exact /
+    Gemma steps run concurrently under a semaphore.
+
+    Returns one entry per item, in order: ``{"index", "result", "error"}``.
+    A Mongo, embedding or Gemma failure is reported in that item's ``error`` only.
+    """
+    if not items:
+        return []
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    question_ids = [item["question_id"] for item in items if item.get("question_id")]
+    docs_lookup_error: str | None = None
+    try:
+        docs_by_id = await get_questions_by_ids(question_ids) if question_ids else {}
+    except Exception as exc:
+        log.warning("check_pending_duplicates_batch question lookup failed: %s: %s", type(exc).__name__, exc)
+        docs_by_id, docs_lookup_error = {}, str(exc) or type(exc).__name__
+
+    entries: list[dict[str, Any]] = [
+        {"index": i, "result": None, "error": None} for i in range(len(items))
+    ]
+    resolved: dict[int, tuple[str, str, str, str | None, datetime | None]] = {}
+    for i, item in enumerate(items):
+        question_id = item.get("question_id")
+        if question_id and docs_lookup_error:
+            entries[i]["error"] = docs_lookup_error
+            continue
+        try:
+            resolved[i] = _resolve_check_input(
+                question_id=question_id,
+                question_doc=docs_by_id.get(question_id) if question_id else None,
+                rephrased_query=item.get("rephrased_query"),
+                crop=item.get("crop"),
+                state=item.get("state"),
+                created_before=item.get("created_before"),
+            )
+        except (LookupError, ValueError) as exc:
+            entries[i]["error"] = str(exc)
+
+    log.info(
+        "check_pending_duplicates_batch start items=%d resolved=%d concurrency=%d",
+        len(items),
+        len(resolved),
+        concurrency,
+    )
+
+    async def _exact(i: int) -> list[PendingQuestionCandidate]:
+        query, crop_norm, state_norm, exclude_id, created_before_dt = resolved[i]
+        async with semaphore:
+            return await pending_exact_search(
+                query,
+                crop_norm,
+                state_norm,
+                exclude_question_id=exclude_id,
+                created_before=created_before_dt,
+            )
+
+    def _settle(index_list: list[int], outcomes: list[Any], step: str) -> dict[int, Any]:
+        """Outcomes by index; an exception becomes that item's error only."""
+        settled: dict[int, Any] = {}
+        for i, outcome in zip(index_list, outcomes):
+            if isinstance(outcome, Exception):
+                log.warning(
+                    "check_pending_duplicates_batch %s failed index=%d: %s: %s",
+                    step,
+                    i,
+                    type(outcome).__name__,
+                    outcome,
+                )
+                entries[i]["error"] = str(outcome) or type(outcome).__name__
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                settled[i] = outcome
+        return settled
+
+    indices = list(resolved)
+    exact_per_index = _settle(
+        indices,
+        await asyncio.gather(*(_exact(i) for i in indices), return_exceptions=True),
+        "exact search",
+    )
+    indices = list(exact_per_index)
+
+    vector_indices = [i for i in indices if not exact_per_index[i]]
+    vector_inputs = [
+        PendingSearchInput(
+            query=resolved[i][0],
+            crop=resolved[i][1],
+            state=resolved[i][2],
+            exclude_question_id=resolved[i][3],
+            created_before=resolved[i][4],
+        )
+        for i in vector_indices
+    ]
+    vector_per_index = _settle(
+        vector_indices,
+        await pending_vector_search_batch(vector_inputs, concurrency=concurrency),
+        "embedding",
+    )
+    indices = [i for i in indices if exact_per_index[i] or i in vector_per_index]
+
+    async def _decide(i: int) -> dict[str, Any]:
+        query, crop_norm, state_norm, _exclude_id, created_before_dt = resolved[i]
+        if exact_per_index[i]:
+            return _exact_match_response(
+                query, crop_norm, state_norm, exact_per_index[i],
+                created_before=created_before_dt,
+            )
+        async with semaphore:
+            return await _similarity_match_response(
+                query, crop_norm, state_norm, vector_per_index[i],
+                created_before=created_before_dt,
+            )
+
+    decided = _settle(
+        indices,
+        await asyncio.gather(*(_decide(i) for i in indices), return_exceptions=True),
+        "decision",
+    )
+    for i, result in decided.items():
+        entries[i]["result"] = result
+
+    log.info(
+        "check_pending_duplicates_batch done items=%d duplicates=%d errors=%d",
+        len(items),
+        sum(1 for e in entries if e["result"] and e["result"]["is_duplicate"]),
+        sum(1 for e in entries if e["error"]),
+    )
+    return entries
@@ -32,10 +32,12 @@ try:
         _truncate_text,
         _normalize_crop_state,
         match_entry,
+        note_retrieval_failure,
         strict_exact_search,
         vector_rag_search,
         bm25_search,
     )
+    from .golden_cache import search_cache
     from .keyword_extractor import extract_keywords, extract_keywords_for_bm25
 except ImportError:
     from gemma_classifier import (
@@ -53,10 +55,12 @@ except ImportError:
         _truncate_text,
         _normalize_crop_state,
         match_entry,
+        note_retrieval_failure,
         strict_exact_search,
         vector_rag_search,
         bm25_search,
     )
+    from golden_cache import search_cache
     from keyword_extractor import extract_keywords, extract_keywords_for_bm25
 
 log = logging.getLogger(__name__)
@@ -326,6 +330,7 @@ async def _run_gemma_pipeline(
     return response
 
 
+@search_cache.cached("gdb_search")
 async def gdb_search(
     rephrased_query: str,
     crop: str,
@@ -586,6 +591,7 @@ async def _semantic_answer_search(
     return result[:ANSWERS_TOP_K]  # Ensure strict limit
 
 
+@search_cache.cached("gdb_search_v2")
 async def gdb_search_v2(
     rephrased_query: str,
     crop: str,
@@ -690,6 +696,7 @@ async def gdb_search_v2(
     for (source_type, _), result in zip(all_tasks, search_results):
         if isinstance(result, Exception):
             log.warning("gdb_search_v2 %s search failed: %s", source_type, result)
+            note_retrieval_failure(source_type)
             continue
         
         for pair in result:
@@ -747,6 +754,8 @@ async def gdb_search_v2(
         
         for (source_type, _), result in zip(fallback_tasks, fallback_results):
             if isinstance(result, Exception):
+                log.warning("gdb_search_v2 %s fallback search failed: %s", source_type, result)
+                note_retrieval_failure(source_type)
                 continue
             for pair in result:
                 if pair.question_id not in seen_ids:
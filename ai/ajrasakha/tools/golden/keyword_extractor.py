@@ -8,10 +8,12 @@ This module extracts key agricultural terms from user queries using:
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import re
-from typing import Optional
+from collections import deque
+from typing import Iterable, Iterator, Optional
 
 from dotenv import load_dotenv
 
@@ -107,12 +109,95 @@ FERTILIZER_PATTERNS = [
     r"\biron\b",
 ]
 
+# Substring vocabularies used by _score_keyword
+PROBLEM_CONTEXT_TERMS = ("problem", "issue", "disease", "pest", "deficiency")
+SYMPTOM_TERMS = ("yellow", "spot", "curl", "blight", "rot", "mite", "aphid", "borer")
+PRODUCT_TERMS = ("urea", "dap", "mop", "fungicide", "insecticide", "pesticide")
+AGRI_MEANING_TERMS = (
+    "yellow", "pale", "spot", "rust", "mildew", "blight", "wilting",
+    "yellowing", "chlorosis", "tips", "leaves", "wheat", "rice", "cotton",
+    "deficiency", "nitrogen", "phosphorus", "potassium", "zinc", "iron",
+)
+
 # Pre-compile patterns for performance
 _COMPILED_DISEASE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in DISEASE_PATTERNS]
 _COMPILED_PEST_PATTERNS = [re.compile(p, re.IGNORECASE) for p in PEST_PATTERNS]
 _COMPILED_FERTILIZER_PATTERNS = [re.compile(p, re.IGNORECASE) for p in FERTILIZER_PATTERNS]
 
 
+class TermAutomaton:
+    """Aho-Corasick automaton over a fixed, labelled vocabulary.
+
+    Finds every vocabulary term occurring as a substring of the input in one
+    left-to-right pass, regardless of vocabulary size. Terms are matched
+    case-sensitively, so callers lowercase both vocabulary and text.
+    """
+
+    def __init__(self, labelled_terms: Iterable[tuple[str, str]] = ()):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[tuple[str, str], ...]] = [()]
+        for term, label in labelled_terms:
+            self._add(term, label)
+        self._build()
+
+    def _add(self, term: str, label: str) -> None:
+        if not term:
+            return
+        node = 0
+        for ch in term:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        if (term, label) not in self._out[node]:
+            self._out[node] = self._out[node] + ((term, label),)
+
+    def _build(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str, str]]:
+        """Yield (end_index, term, label) for every occurrence in ``text``."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for term, label in out[node]:
+                yield i, term, label
+
+    def labels_in(self, text: str) -> set[str]:
+        """Labels of all vocabulary terms occurring in ``text``."""
+        return {label for _, _, label in self.iter_matches(text)}
+
+
+_SCORING_AUTOMATON = TermAutomaton(
+    [(term, "context") for term in PROBLEM_CONTEXT_TERMS]
+    + [(term, "symptom") for term in SYMPTOM_TERMS]
+    + [(term, "product") for term in PRODUCT_TERMS]
+    + [(term, "agri_meaning") for term in AGRI_MEANING_TERMS]
+)
+
+
+def _has_problem_context(full_text: str) -> bool:
+    return "context" in _SCORING_AUTOMATON.labels_in(full_text.lower())
+
+
 def _normalize_text(text: str) -> str:
     """Normalize text for keyword extraction."""
     # Remove punctuation except hyphens in compound terms
@@ -142,19 +227,30 @@ def _extract_ngrams(text: str, max_n: int = 3) -> list[str]:
     return ngrams
 
 
-def _score_keyword(keyword: str, full_text: str) -> float:
-    """Score a keyword based on its importance."""
+def _score_keyword(
+    keyword: str,
+    full_text: str,
+    *,
+    problem_context: Optional[bool] = None,
+) -> float:
+    """Score a keyword based on its importance.
+
+    ``problem_context`` lets callers scoring many keywords of one query scan
+    ``full_text`` once instead of per keyword.
+    """
     score = 1.0
     keyword_lower = keyword.lower()
+    if problem_context is None:
+        problem_context = _has_problem_context(full_text)
+    labels = _SCORING_AUTOMATON.labels_in(keyword_lower)
     
     # Boost core farming terms
     if keyword_lower in CORE_FARMING_TERMS:
         score += 0.5
     
     # Boost terms appearing in specific agricultural contexts
-    if any(term in full_text.lower() for term in ["problem", "issue", "disease", "pest", "deficiency"]):
-        if any(term in keyword_lower for term in ["yellow", "spot", "curl", "blight", "rot", "mite", "aphid", "borer"]):
-            score += 0.5
+    if problem_context and "symptom" in labels:
+        score += 0.5
     
     # Boost compound terms (more specific) - but penalize if mostly stopwords
     if " " in keyword:
@@ -168,7 +264,7 @@ def _score_keyword(keyword: str, full_text: str) -> float:
             score -= 0.3  # Too many stopwords, penalize
     
     # Slight boost for pesticide/fertilizer names
-    if any(p in keyword_lower for p in ["urea", "dap", "mop", "fungicide", "insecticide", "pesticide"]):
+    if "product" in labels:
         score += 0.3
     
     # Penalize very short or generic terms
@@ -176,10 +272,7 @@ def _score_keyword(keyword: str, full_text: str) -> float:
         score -= 0.2
     
     # Boost terms with agricultural meaning
-    agri_meaning_terms = ["yellow", "pale", "spot", "rust", "mildew", "blight", "wilting", 
-                          "yellowing", "chlorosis", "tips", "leaves", "wheat", "rice", "cotton",
-                          "deficiency", "nitrogen", "phosphorus", "potassium", "zinc", "iron"]
-    if any(term in keyword_lower for term in agri_meaning_terms):
+    if "agri_meaning" in labels:
         score += 0.3
     
     return score
@@ -209,6 +302,7 @@ def extract_keywords(text: str, max_keywords: int = 5) -> list[str]:
     
     normalized = _normalize_text(text)
     words = normalized.split()
+    problem_context = _has_problem_context(text)
     
     keywords: list[tuple[str, float]] = []
     seen = set()
@@ -219,7 +313,7 @@ def extract_keywords(text: str, max_keywords: int = 5) -> list[str]:
         match_normalized = _normalize_text(match)
         if match_normalized not in seen:
             seen.add(match_normalized)
-            keywords.append((match_normalized, _score_keyword(match_normalized, text) + 0.5))
+            keywords.append((match_normalized, _score_keyword(match_normalized, text, problem_context=problem_context) + 0.5))
     
     # 2. Extract pest patterns
     pest_matches = _extract_by_patterns(text, _COMPILED_PEST_PATTERNS)
@@ -227,7 +321,7 @@ def extract_keywords(text: str, max_keywords: int = 5) -> list[str]:
         match_normalized = _normalize_text(match)
         if match_normalized not in seen:
             seen.add(match_normalized)
-            keywords.append((match_normalized, _score_keyword(match_normalized, text) + 0.5))
+            keywords.append((match_normalized, _score_keyword(match_normalized, text, problem_context=problem_context) + 0.5))
     
     # 3. Extract fertilizer patterns
     fertilizer_matches = _extract_by_patterns(text, _COMPILED_FERTILIZER_PATTERNS)
@@ -235,7 +329,7 @@ def extract_keywords(text: str, max_keywords: int = 5) -> list[str]:
         match_normalized = _normalize_text(match)
         if match_normalized not in seen:
             seen.add(match_normalized)
-            keywords.append((match_normalized, _score_keyword(match_normalized, text) + 0.4))
+            keywords.append((match_normalized, _score_keyword(match_normalized, text, problem_context=problem_context) + 0.4))
     
     # 4. Extract meaningful single-word terms (not stopwords, not generic)
     for word in words:
@@ -249,7 +343,7 @@ def extract_keywords(text: str, max_keywords: int = 5) -> list[str]:
             continue
         
         seen.add(word)
-        score = _score_keyword(word, text)
+        score = _score_keyword(word, text, problem_context=problem_context)
         keywords.append((word, score))
     
     # 5. Extract 2-gram phrases that are NOT mostly stopwords
@@ -271,7 +365,7 @@ def extract_keywords(text: str, max_keywords: int = 5) -> list[str]:
             continue
         
         seen.add(bigram)
-        score = _score_keyword(bigram, text)
+        score = _score_keyword(bigram, text, problem_context=problem_context)
         keywords.append((bigram, score))
     
     # Sort by score descending
@@ -316,7 +410,12 @@ class SchemaTaxonomyLoader:
     - Nutrients and fertilizers
     - Operations and practices
     - Weather and timing
+
+    Terms are compiled into a single ``TermAutomaton`` at load time, so
+    ``match_in_text`` is one pass over the text for all categories.
     """
+
+    CATEGORIES = ("crops", "growth_stages", "pests", "diseases", "nutrients", "operations")
     
     def __init__(self):
         self.crops: set[str] = set()
@@ -325,52 +424,68 @@ class SchemaTaxonomyLoader:
         self.diseases: set[str] = set()
         self.nutrients: set[str] = set()
         self.operations: set[str] = set()
+        self._automaton = TermAutomaton()
         self._loaded = False
     
     def load_from_schema(self, schema_path: Optional[str] = None) -> None:
         """
         Load taxonomy from schema file.
         
-        This is a placeholder for future implementation where
-        the schema.xlsx would be parsed and terms loaded.
+        A ``.json`` path is treated as a taxonomy snapshot (see
+        ``load_from_json``). Parsing schema.xlsx is a placeholder for future
+        implementation.
         """
         if schema_path is None:
             schema_path = os.getenv("RETRIEVAL_SCHEMA_PATH", "Retrieval Schema.xlsx")
+
+        if schema_path.lower().endswith(".json") and os.path.exists(schema_path):
+            self.load_from_json(schema_path)
+            return
         
         log.info("Schema taxonomy loader initialized (lazy loading)")
         # In production, parse schema.xlsx and populate sets
         # For now, use the hardcoded patterns above
+        self.compile()
         self._loaded = True
+
+    def load_from_json(self, snapshot_path: str) -> None:
+        """Load a ``{category: [terms, ...]}`` JSON snapshot and compile it."""
+        with open(snapshot_path, encoding="utf-8") as fh:
+            snapshot = json.load(fh)
+        for category in self.CATEGORIES:
+            terms = snapshot.get(category) or []
+            setattr(self, category, {t.strip().lower() for t in terms if t and t.strip()})
+        self.compile()
+        self._loaded = True
+        log.info(
+            "Schema taxonomy loaded from %s: %s",
+            snapshot_path,
+            {c: len(getattr(self, c)) for c in self.CATEGORIES},
+        )
+
+    def compile(self) -> None:
+        """Rebuild the automaton from the category sets (call after editing them)."""
+        self._automaton = TermAutomaton(
+            (term, category)
+            for category in self.CATEGORIES
+            for term in sorted(getattr(self, category))
+        )
     
     def match_in_text(self, text: str) -> dict[str, list[str]]:
         """
         Find all schema terms matching in text.
         
-        Returns a dict with category -> list of matched terms
+        Returns a dict with category -> list of matched terms (substring
+        matches, in order of first occurrence).
         """
-        text_lower = text.lower()
-        matches = {
-            "crops": [],
-            "growth_stages": [],
-            "pests": [],
-            "diseases": [],
-            "nutrients": [],
-            "operations": [],
-        }
-        
-        # Match against all sets
-        for term in self.crops:
-            if term in text_lower:
-                matches["crops"].append(term)
-        
-        for term in self.growth_stages:
-            if term in text_lower:
-                matches["growth_stages"].append(term)
-        
-        # ... similar for other categories
-        
+        matches: dict[str, list[str]] = {category: [] for category in self.CATEGORIES}
+        seen: set[tuple[str, str]] = set()
+        for _, term, category in self._automaton.iter_matches(text.lower()):
+            if (term, category) not in seen:
+                seen.add((term, category))
+                matches[category].append(term)
         return matches
 
 
 # Default instance for convenience
-default_extractor = extract_keywords
\ No newline at end of file
+default_extractor = extract_keywords
@@ -0,0 +1,322 @@
+"""Golden search result cache: fingerprinting, TTL and change-stream invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from bson import ObjectId
+
+from ajrasakha.tools.golden import golden_cache
+from ajrasakha.tools.golden.golden_cache import (
+    ANSWER_EVENT_SOURCE,
+    QUESTION_EVENT_SOURCE,
+    GoldenSearchCache,
+    watch_collection,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _ChangeFeed:
+    """Fake pymongo async change stream fed from a queue; ``None`` ends the stream with an error."""
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.opened = 0
+
+    async def watch(self, **_kwargs):
+        self.opened += 1
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        change = await self.queue.get()
+        if change is None:
+            raise RuntimeError("stream reset")
+        return change
+
+
+def _response(question_ids: list[str], *, crop: str = "Wheat", state: str = "Punjab", **extra) -> dict:
+    return {
+        "rephrased_query": "q",
+        "original_query": None,
+        "crop": crop,
+        "state": state,
+        "exact_match": {},
+        "selected_match": {"question_id": question_ids[0]} if question_ids else None,
+        "classification_audit": {
+            "evaluations": [{"question_id": qid} for qid in question_ids],
+        },
+        **extra,
+    }
+
+
+def _make_cached_search(cache: GoldenSearchCache):
+    calls: list[tuple] = []
+
+    @cache.cached("gdb_search")
+    async def search(rephrased_query, crop, state, **options):
+        calls.append((rephrased_query, crop, state))
+        qid = options.get("_qid", "q1")
+        return _response([qid], crop=crop, state=state)
+
+    return search, calls
+
+
+@pytest.fixture
+def live_cache():
+    clock = _Clock()
+    cache = GoldenSearchCache(ttl_s=60, clock=clock)
+    cache.mark_live(QUESTION_EVENT_SOURCE)
+    cache.mark_live(ANSWER_EVENT_SOURCE)
+    return cache, clock
+
+
+@pytest.mark.asyncio
+async def test_normalized_repeat_is_served_from_cache(live_cache):
+    cache, _ = live_cache
+    search, calls = _make_cached_search(cache)
+
+    first = await search("What causes wheat rust?", "wheat", "Punjab")
+    second = await search("  what causes WHEAT rust ", "Wheat", "punjab")
+
+    assert len(calls) == 1
+    assert second["selected_match"] == first["selected_match"]
+    assert second["rephrased_query"] == "what causes WHEAT rust"
+    second["selected_match"]["question_id"] = "mutated"
+    third = await search("What causes wheat rust?", "wheat", "Punjab")
+    assert third["selected_match"]["question_id"] == "q1"
+
+
+@pytest.mark.asyncio
+async def test_different_options_are_separate_entries(live_cache):
+    cache, _ = live_cache
+    search, calls = _make_cached_search(cache)
+    await search("q", "Wheat", "Punjab", season="rabi")
+    await search("q", "Wheat", "Punjab", season="kharif")
+    await search("q", "Wheat", "Punjab", season="rabi", original_query="other wording")
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_bypassed_until_both_streams_live():
+    cache = GoldenSearchCache()
+    search, calls = _make_cached_search(cache)
+    cache.mark_live(QUESTION_EVENT_SOURCE)
+    await search("q", "Wheat", "Punjab")
+    await search("q", "Wheat", "Punjab")
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_ttl_fallback_expires_entries(live_cache):
+    cache, clock = live_cache
+    search, calls = _make_cached_search(cache)
+    await search("q", "Wheat", "Punjab")
+    clock.now += 59
+    await search("q", "Wheat", "Punjab")
+    clock.now += 2
+    await search("q", "Wheat", "Punjab")
+    assert len(calls) == 2
+
+
+def test_question_change_invalidates_only_referencing_entries(live_cache):
+    cache, _ = live_cache
+    cache.put("a", _response(["q1", "q2"]), crop="Wheat", state="Punjab")
+    cache.put("b", _response(["q3"]), crop="Rice", state="Bihar")
+
+    dropped = cache.apply_change(
+        QUESTION_EVENT_SOURCE,
+        {"operationType": "delete", "documentKey": {"_id": "q2"}},
+    )
+    assert dropped == 1
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+
+
+def test_closed_question_in_scope_invalidates_scope_entries(live_cache):
+    cache, _ = live_cache
+    cache.put("wheat_pb", _response(["q1"]), crop="Wheat", state="Punjab")
+    cache.put("all_pb", _response(["q2"]), crop="all", state="Punjab")
+    cache.put("wheat_all", _response(["q3"]), crop="Wheat", state="all")
+    cache.put("rice_br", _response(["q4"]), crop="Rice", state="Bihar")
+    cache.put(
+        "fallback",
+        _response(["q5"], crop_fallback=True),
+        crop="Mango",
+        state="Punjab",
+    )
+
+    new_id = ObjectId()
+    cache.apply_change(
+        QUESTION_EVENT_SOURCE,
+        {
+            "operationType": "insert",
+            "documentKey": {"_id": new_id},
+            "fullDocument": {
+                "_id": new_id,
+                "status": "closed",
+                "details": {"normalised_crop": "Wheat", "state": "Punjab"},
+            },
+        },
+    )
+    assert cache.get("wheat_pb") is None
+    assert cache.get("all_pb") is None
+    assert cache.get("wheat_all") is None
+    assert cache.get("fallback") is None
+    assert cache.get("rice_br") is not None
+
+
+def test_open_question_insert_does_not_invalidate(live_cache):
+    cache, _ = live_cache
+    cache.put("wheat_pb", _response(["q1"]), crop="Wheat", state="Punjab")
+    cache.apply_change(
+        QUESTION_EVENT_SOURCE,
+        {
+            "operationType": "insert",
+            "documentKey": {"_id": "new"},
+            "fullDocument": {
+                "status": "open",
+                "details": {"normalised_crop": "Wheat", "state": "Punjab"},
+            },
+        },
+    )
+    assert cache.get("wheat_pb") is not None
+
+
+def test_answer_change_invalidates_by_question_id(live_cache):
+    cache, _ = live_cache
+    qid = ObjectId()
+    cache.put("a", _response([str(qid)]), crop="Wheat", state="Punjab")
+    cache.put("b", _response(["other"]), crop="Wheat", state="Punjab")
+    cache.apply_change(
+        ANSWER_EVENT_SOURCE,
+        {
+            "operationType": "update",
+            "documentKey": {"_id": ObjectId()},
+            "fullDocument": {"questionId": qid, "isFinalAnswer": True},
+        },
+    )
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+
+    cache.apply_change(
+        ANSWER_EVENT_SOURCE,
+        {"operationType": "delete", "documentKey": {"_id": ObjectId()}},
+    )
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_embedding_is_not_cached(live_cache, monkeypatch):
+    from ajrasakha.tools.golden import golden_core
+
+    cache, _ = live_cache
+    embeds = []
+
+    async def flaky_embed(query):
+        embeds.append(query)
+        if len(embeds) == 1:
+            raise RuntimeError("embedding service down")
+        return [0.1, 0.2]
+
+    async def vector_search(**_kwargs):
+        return [{"_id": ObjectId(), "question": "wheat rust?", "vector_score": 0.9}]
+
+    async def answer_for(_question_id):
+        return "spray propiconazole", [], "Expert"
+
+    monkeypatch.setattr(golden_core, "_embed_text", flaky_embed)
+    monkeypatch.setattr(golden_core, "_vector_search_questions", vector_search)
+    monkeypatch.setattr(golden_core, "_get_answer_text_sources_and_author_name", answer_for)
+
+    @cache.cached("gdb_search")
+    async def search(rephrased_query, crop, state, **options):
+        pairs = await golden_core.vector_rag_search(
+            rephrased_query, crop, state, season=None, domain=None, top_k=3
+        )
+        return _response([pair.question_id for pair in pairs])
+
+    assert (await search("wheat rust", "Wheat", "Punjab"))["selected_match"] is None
+    second = await search("wheat rust", "Wheat", "Punjab")
+    assert len(embeds) == 2
+    assert second["selected_match"] is not None
+    third = await search("wheat rust", "Wheat", "Punjab")
+    assert third["selected_match"] == second["selected_match"]
+    assert len(embeds) == 2
+
+
+@pytest.mark.asyncio
+async def test_change_during_miss_is_not_cached(live_cache):
+    cache, _ = live_cache
+    release = asyncio.Event()
+    calls = []
+
+    @cache.cached("gdb_search")
+    async def slow_search(rephrased_query, crop, state, **options):
+        calls.append(1)
+        await release.wait()
+        return _response(["q1"])
+
+    task = asyncio.create_task(slow_search("q", "Wheat", "Punjab"))
+    await asyncio.sleep(0)
+    cache.apply_change(
+        QUESTION_EVENT_SOURCE,
+        {"operationType": "delete", "documentKey": {"_id": "q1"}},
+    )
+    release.set()
+    await task
+    await slow_search("q", "Wheat", "Punjab")
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_watcher_applies_simulated_change_feed():
+    questions, answers = _ChangeFeed(), _ChangeFeed()
+    cache = GoldenSearchCache(ttl_s=60)
+    search, calls = _make_cached_search(cache)
+
+    tasks = [
+        asyncio.create_task(watch_collection(questions, QUESTION_EVENT_SOURCE, cache, retry_backoff_s=0)),
+        asyncio.create_task(watch_collection(answers, ANSWER_EVENT_SOURCE, cache, retry_backoff_s=0)),
+    ]
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert cache.active
+
+    await search("q", "Wheat", "Punjab", _qid="q1")
+    await search("q", "Wheat", "Punjab", _qid="q1")
+    assert len(calls) == 1
+
+    await answers.queue.put(
+        {"operationType": "replace", "documentKey": {"_id": "a1"}, "fullDocument": {"questionId": "q1"}}
+    )
+    await asyncio.sleep(0.01)
+    await search("q", "Wheat", "Punjab", _qid="q1")
+    assert len(calls) == 2
+
+    # a stream error stops serving hits until the watch reconnects
+    await questions.queue.put(None)
+    await asyncio.sleep(0.01)
+    assert questions.opened == 2
+    assert cache.active
+    assert len(cache) == 0
+
+    await golden_cache.stop_watchers(tasks)
+    assert not cache.active
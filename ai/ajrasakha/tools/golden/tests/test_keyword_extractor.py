@@ -0,0 +1,176 @@
+"""Parity tests for the automaton-based keyword scoring and taxonomy matching."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import time
+
+import pytest
+
+from ajrasakha.tools.golden import keyword_extractor as ke
+from ajrasakha.tools.golden.keyword_extractor import (
+    AGRI_STOPWORDS,
+    CORE_FARMING_TERMS,
+    SchemaTaxonomyLoader,
+    TermAutomaton,
+    _score_keyword,
+    extract_keywords,
+)
+
+QUERIES = [
+    "What causes pale tips on wheat leaves?",
+    "Yellow mosaic disease problem in moong, how to control whitefly",
+    "Dose of urea and DAP for paddy at tillering stage",
+    "Powdery mildew on mango flowering, which fungicide to spray?",
+    "Zinc deficiency issue in rice nursery, leaves turning yellow",
+    "Pod borer and aphid pest in chickpea",
+    "Cotton leaf curl virus spread by white fly",
+    "Best time for sowing mustard in rabi season",
+    "",
+]
+
+
+def _legacy_score_keyword(keyword: str, full_text: str) -> float:
+    """Pre-automaton implementation, kept verbatim as the parity reference."""
+    score = 1.0
+    keyword_lower = keyword.lower()
+    if keyword_lower in CORE_FARMING_TERMS:
+        score += 0.5
+    if any(term in full_text.lower() for term in ["problem", "issue", "disease", "pest", "deficiency"]):
+        if any(term in keyword_lower for term in ["yellow", "spot", "curl", "blight", "rot", "mite", "aphid", "borer"]):
+            score += 0.5
+    if " " in keyword:
+        words = keyword.split()
+        stopword_count = sum(1 for w in words if w in AGRI_STOPWORDS)
+        if stopword_count == 0:
+            score += 0.4
+        elif stopword_count == 1 and len(words) == 2:
+            score += 0.1
+        else:
+            score -= 0.3
+    if any(p in keyword_lower for p in ["urea", "dap", "mop", "fungicide", "insecticide", "pesticide"]):
+        score += 0.3
+    if len(keyword) < 4:
+        score -= 0.2
+    agri_meaning_terms = ["yellow", "pale", "spot", "rust", "mildew", "blight", "wilting",
+                          "yellowing", "chlorosis", "tips", "leaves", "wheat", "rice", "cotton",
+                          "deficiency", "nitrogen", "phosphorus", "potassium", "zinc", "iron"]
+    if any(term in keyword_lower for term in agri_meaning_terms):
+        score += 0.3
+    return score
+
+
+def _candidates(query: str) -> list[str]:
+    words = ke._normalize_text(query).split()
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_score_keyword_matches_legacy(query):
+    for keyword in _candidates(query) + ["mop", "rotting", "Spider Mite", "TERMITE"]:
+        assert _score_keyword(keyword, query) == pytest.approx(_legacy_score_keyword(keyword, query))
+
+
+def test_extract_keywords_matches_legacy_scoring(monkeypatch):
+    expected = {}
+    for query in QUERIES:
+        expected[query] = extract_keywords(query, max_keywords=10)
+
+    monkeypatch.setattr(
+        ke, "_score_keyword", lambda kw, text, **_kw: _legacy_score_keyword(kw, text)
+    )
+    for query in QUERIES:
+        assert extract_keywords(query, max_keywords=10) == expected[query]
+
+
+def test_automaton_finds_same_terms_as_substring_scan():
+    rng = random.Random(7)
+    vocab = ["he", "she", "his", "hers", "a", "ab", "bab", "bc", "abcab", "c"]
+    automaton = TermAutomaton((t, t) for t in vocab)
+    for _ in range(500):
+        text = "".join(rng.choice("abchers") for _ in range(rng.randint(0, 30)))
+        assert automaton.labels_in(text) == {t for t in vocab if t in text}
+
+
+def test_automaton_reports_overlapping_occurrences():
+    automaton = TermAutomaton([("rot", "d"), ("rotting", "s"), ("tti", "x")])
+    found = [(end, term) for end, term, _ in automaton.iter_matches("rotting")]
+    assert found == [(2, "rot"), (4, "tti"), (6, "rotting")]
+
+
+def _write_snapshot(tmp_path, data) -> str:
+    path = tmp_path / "taxonomy.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+def test_taxonomy_loader_json_snapshot_matches_set_scan(tmp_path):
+    snapshot = {
+        "crops": ["Wheat", "rice", "Bengal Gram", "gram"],
+        "growth_stages": ["tillering", "flowering"],
+        "pests": ["aphid", "pod borer"],
+        "diseases": ["yellow rust", "rust", "leaf curl"],
+        "nutrients": ["zinc", "nitrogen"],
+        "operations": ["irrigation"],
+    }
+    loader = SchemaTaxonomyLoader()
+    loader.load_from_schema(_write_snapshot(tmp_path, snapshot))
+
+    text = "Yellow rust and aphid on bengal gram at flowering; need zinc and irrigation"
+    matches = loader.match_in_text(text)
+    for category, terms in snapshot.items():
+        expected = {t.lower() for t in terms if t.lower() in text.lower()}
+        assert set(matches[category]) == expected
+    assert matches["crops"] == ["bengal gram", "gram"]
+
+
+def test_taxonomy_loader_recompiles_after_edit():
+    loader = SchemaTaxonomyLoader()
+    loader.load_from_schema("missing.xlsx")
+    assert loader.match_in_text("wheat") == {c: [] for c in SchemaTaxonomyLoader.CATEGORIES}
+    loader.crops.add("wheat")
+    loader.compile()
+    assert loader.match_in_text("Wheat rust")["crops"] == ["wheat"]
+
+
+@pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run")
+def test_benchmark_keyword_scoring_and_taxonomy(tmp_path):
+    rng = random.Random(1)
+    queries = [rng.choice(QUERIES[:-1]) + f" case {i}" for i in range(2000)]
+
+    started = time.perf_counter()
+    for query in queries:
+        for keyword in _candidates(query):
+            _legacy_score_keyword(keyword, query)
+    legacy_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for query in queries:
+        context = ke._has_problem_context(query)
+        for keyword in _candidates(query):
+            _score_keyword(keyword, query, problem_context=context)
+    current_s = time.perf_counter() - started
+
+    terms = {f"term{i:04d}" for i in range(2900)}
+    loader = SchemaTaxonomyLoader()
+    loader.load_from_json(_write_snapshot(tmp_path, {"crops": sorted(terms)}))
+    text = " ".join(rng.sample(sorted(terms), 20))
+
+    started = time.perf_counter()
+    for _ in range(200):
+        [t for t in terms if t in text]
+    scan_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(200):
+        loader.match_in_text(text)
+    automaton_s = time.perf_counter() - started
+
+    print(
+        f"\nscoring legacy={legacy_s * 1e3:.1f}ms automaton={current_s * 1e3:.1f}ms "
+        f"(2000 queries); taxonomy set-scan={scan_s * 1e3:.1f}ms "
+        f"automaton={automaton_s * 1e3:.1f}ms (200 texts x 2900 terms)"
+    )
+    assert automaton_s < scan_s
@@ -0,0 +1,366 @@
+"""Batch pending-duplicate search: one embed call, bounded vector fan-out, one $in hydration."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+from datetime import datetime
+
+import httpx
+import mongomock
+import pytest
+from bson import ObjectId
+
+from ajrasakha.tools.golden import golden_core, golden_pending_duplicate
+from ajrasakha.tools.golden.golden_core import PendingSearchInput, pending_vector_search_batch
+from ajrasakha.tools.golden.golden_pending_duplicate import check_pending_duplicates_batch
+
+_VOCAB = ["wheat", "rust", "rice", "blast", "aphid", "mustard", "yellow", "leaves"]
+
+
+def _fake_vector(text: str) -> list[float]:
+    words = text.lower().split()
+    return [float(sum(w.startswith(term) for w in words)) + 0.01 for term in _VOCAB]
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    return dot / (math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b)))
+
+
+class _AsyncCursor:
+    def __init__(self, docs):
+        self._docs = list(docs)
+
+    async def to_list(self, length=None):
+        return self._docs if length is None else self._docs[:length]
+
+
+class _AsyncCollection:
+    """Minimal pymongo-async facade over a mongomock collection that counts reads."""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.find_calls: list[dict] = []
+        self.find_one_calls = 0
+
+    def find(self, query, projection=None):
+        self.find_calls.append(query)
+        return _AsyncCursor(self._collection.find(query, projection))
+
+    async def find_one(self, query, projection=None):
+        self.find_one_calls += 1
+        return self._collection.find_one(query, projection)
+
+
+class _FakeEmbedder:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [_fake_vector(t) for t in texts]
+
+
+_QUESTIONS = [
+    ("Wheat rust on leaves", "Wheat", "Punjab", "open", "AJRASAKHA", datetime(2025, 1, 1)),
+    ("Yellow rust in wheat", "Wheat", "Punjab", "in-review", "WHATSAPP", datetime(2025, 2, 1)),
+    ("Rice blast control", "Rice", "Bihar", "delayed", "AJRASAKHA", datetime(2025, 3, 1)),
+    ("Mustard aphid spray", "Mustard", "Rajasthan", "open", "AJRASAKHA", datetime(2025, 4, 1)),
+    ("Wheat rust closed already", "Wheat", "Punjab", "closed", "AJRASAKHA", datetime(2025, 1, 5)),
+]
+
+
+@pytest.fixture
+def golden_db(monkeypatch):
+    raw = mongomock.MongoClient().db.questions
+    ids = []
+    for text, crop, state, status, source, created in _QUESTIONS:
+        oid = ObjectId()
+        ids.append(oid)
+        raw.insert_one(
+            {
+                "_id": oid,
+                "question": text,
+                "details": {"normalised_crop": crop, "state": state},
+                "status": status,
+                "source": source,
+                "createdAt": created,
+                "question_embedding": _fake_vector(text),
+            }
+        )
+    collection = _AsyncCollection(raw)
+    monkeypatch.setattr(golden_core, "questions_collection", collection)
+
+    embedder = _FakeEmbedder()
+    monkeypatch.setattr(golden_core, "_embed_texts", embedder)
+
+    in_flight = {"now": 0, "max": 0, "calls": 0}
+
+    async def fake_vector_hits(*, query_vector, k, index_filter, post_match):
+        in_flight["calls"] += 1
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        try:
+            await asyncio.sleep(0.01)
+            docs = list(raw.find({**index_filter, **post_match}))
+            scored = sorted(
+                (
+                    {"_id": d["_id"], "vector_score": _cosine(query_vector, d["question_embedding"])}
+                    for d in docs
+                ),
+                key=lambda hit: hit["vector_score"],
+                reverse=True,
+            )
+            return scored[:k]
+        finally:
+            in_flight["now"] -= 1
+
+    monkeypatch.setattr(golden_core, "_pending_vector_search_hits", fake_vector_hits)
+    return {"collection": collection, "embedder": embedder, "ids": ids, "in_flight": in_flight}
+
+
+@pytest.mark.asyncio
+async def test_vector_batch_embeds_once_and_hydrates_once(golden_db):
+    inputs = [
+        PendingSearchInput(query="wheat rust leaves", crop="wheat", state="Punjab"),
+        PendingSearchInput(query="rice blast", crop="Rice", state="Bihar"),
+        PendingSearchInput(query="mustard aphid", crop="all", state="all"),
+    ]
+    results = await pending_vector_search_batch(inputs, top_k=2, concurrency=2)
+
+    assert golden_db["embedder"].calls == [[i.query for i in inputs]]
+    assert golden_db["in_flight"]["calls"] == 3
+    assert golden_db["in_flight"]["max"] <= 2
+    assert len(golden_db["collection"].find_calls) == 1
+    assert "$in" in golden_db["collection"].find_calls[0]["_id"]
+
+    ids = golden_db["ids"]
+    assert [c.question_id for c in results[0]] == [str(ids[0]), str(ids[1])]
+    assert [c.question_id for c in results[1]] == [str(ids[2])]
+    assert results[2][0].question_id == str(ids[3])
+    assert all(c.similarity_score is not None for c in results[0])
+
+
+@pytest.mark.asyncio
+async def test_vector_batch_respects_exclude_and_created_before(golden_db):
+    ids = golden_db["ids"]
+    results = await pending_vector_search_batch(
+        [
+            PendingSearchInput(
+                query="wheat rust",
+                crop="Wheat",
+                state="Punjab",
+                exclude_question_id=str(ids[0]),
+            ),
+            PendingSearchInput(
+                query="wheat rust",
+                crop="Wheat",
+                state="Punjab",
+                created_before=datetime(2025, 1, 15),
+            ),
+        ]
+    )
+    assert [c.question_id for c in results[0]] == [str(ids[1])]
+    assert [c.question_id for c in results[1]] == [str(ids[0])]
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_uses_single_text_contract_over_one_client(monkeypatch):
+    requests: list[dict] = []
+    in_flight = {"now": 0, "max": 0}
+    clients: list[httpx.AsyncClient] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        requests.append(payload)
+        if set(payload) != {"text"}:
+            return httpx.Response(422, json={"detail": "text is required"})
+        if payload["text"] == "boom":
+            return httpx.Response(500)
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return httpx.Response(200, json={"embedding": _fake_vector(payload["text"])})
+
+    real_client = httpx.AsyncClient
+
+    def client_factory(**kwargs):
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(golden_core.httpx, "AsyncClient", client_factory)
+    monkeypatch.setattr(golden_core, "PENDING_BATCH_CONCURRENCY", 3)
+    texts = [f"wheat rust {i}" for i in range(10)]
+
+    assert await golden_core._embed_texts(texts) == [_fake_vector(t) for t in texts]
+    assert requests == [{"text": t} for t in texts]
+    assert len(clients) == 1
+    assert in_flight["max"] == 3
+
+    ok, boom = await golden_core._embed_texts(["ok", "boom"])  # one failed text fails only itself
+    assert ok == _fake_vector("ok")
+    assert isinstance(boom, httpx.HTTPStatusError)
+    assert await golden_core._embed_texts([]) == []
+
+
+@pytest.mark.asyncio
+async def test_vector_batch_embedding_failure_is_returned_per_input(golden_db, monkeypatch):
+    async def broken(_texts):
+        raise RuntimeError("embedding down")
+
+    monkeypatch.setattr(golden_core, "_embed_texts", broken)
+    results = await pending_vector_search_batch(
+        [PendingSearchInput(query="q1", crop="all", state="all")] * 2
+    )
+    assert [str(r) for r in results] == ["embedding down", "embedding down"]
+    assert golden_db["in_flight"]["calls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_check_batch_reports_one_failed_embedding(golden_db, monkeypatch):
+    async def partly_broken(texts):
+        return [
+            RuntimeError("embedding timeout") if t == "rice blast" else _fake_vector(t)
+            for t in texts
+        ]
+
+    async def no_exact(*_args, **_kwargs):
+        return []
+
+    llm_queries: list[str] = []
+
+    async def mock_llm(query, candidates, **_kwargs):
+        llm_queries.append(query)
+        return [{"relevance_decision": "NOT_SAME", "llm_parse_ok": True} for _ in candidates]
+
+    monkeypatch.setattr(golden_core, "_embed_texts", partly_broken)
+    monkeypatch.setattr(golden_pending_duplicate, "pending_exact_search", no_exact)
+    monkeypatch.setattr(golden_pending_duplicate, "filter_pending_duplicate_batch", mock_llm)
+
+    entries = await check_pending_duplicates_batch(
+        [
+            {"rephrased_query": "wheat rust", "crop": "Wheat", "state": "Punjab"},
+            {"rephrased_query": "rice blast", "crop": "Rice", "state": "Bihar"},
+            {"rephrased_query": "mustard aphid", "crop": "Mustard", "state": "Rajasthan"},
+        ]
+    )
+
+    # the failed text is an error, not a "no duplicate" verdict, and is never searched
+    assert entries[1] == {"index": 1, "result": None, "error": "embedding timeout"}
+    assert golden_db["in_flight"]["calls"] == 2
+    assert "rice blast" not in llm_queries
+    for entry in (entries[0], entries[2]):
+        assert entry["error"] is None
+        assert entry["result"]["is_duplicate"] is False
+
+
+@pytest.mark.asyncio
+async def test_check_batch_mixes_exact_vector_and_errors(golden_db, monkeypatch):
+    ids = golden_db["ids"]
+
+    async def mock_exact(query, *_args, **_kwargs):
+        if query == "Mustard aphid spray":
+            doc = golden_db["collection"]._collection.find_one({"_id": ids[3]})
+            return [golden_core._doc_to_pending_candidate(doc, similarity_score=1.0)]
+        return []
+
+    llm_calls: list[int] = []
+
+    async def mock_llm(_query, candidates, **_kwargs):
+        llm_calls.append(len(candidates))
+        return [
+            {"relevance_decision": "SAME" if i == 0 else "NOT_SAME", "llm_parse_ok": True}
+            for i in range(len(candidates))
+        ]
+
+    monkeypatch.setattr(golden_pending_duplicate, "pending_exact_search", mock_exact)
+    monkeypatch.setattr(golden_pending_duplicate, "filter_pending_duplicate_batch", mock_llm)
+
+    entries = await check_pending_duplicates_batch(
+        [
+            {"rephrased_query": "Mustard aphid spray", "crop": "Mustard", "state": "Rajasthan"},
+            {"question_id": str(ids[1])},
+            {"question_id": str(ObjectId())},
+            {"rephrased_query": "rice blast", "crop": "Rice", "state": "Bihar"},
+        ]
+    )
+
+    assert [e["index"] for e in entries] == [0, 1, 2, 3]
+    assert entries[0]["result"]["match_type"] == "exact"
+    assert entries[0]["result"]["matched_question_id"] == str(ids[3])
+
+    # question_id input excludes itself and only sees older questions
+    assert entries[1]["result"]["match_type"] == "similarity"
+    assert entries[1]["result"]["matched_question_id"] == str(ids[0])
+
+    assert entries[2]["result"] is None
+    assert "not found" in entries[2]["error"]
+
+    assert entries[3]["result"]["matched_question_id"] == str(ids[2])
+
+    # one _embed_texts call for the two non-exact inputs; one $in for question_ids + one for hits
+    assert len(golden_db["embedder"].calls) == 1
+    assert len(golden_db["embedder"].calls[0]) == 2
+    assert len(golden_db["collection"].find_calls) == 2
+    assert golden_db["collection"].find_one_calls == 0
+    assert len(llm_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_check_batch_isolates_per_item_failures(golden_db, monkeypatch):
+    async def flaky_exact(query, *_args, **_kwargs):
+        if query == "wheat rust":
+            raise RuntimeError("mongo timeout")
+        return []
+
+    async def flaky_llm(query, candidates, **_kwargs):
+        if query == "rice blast":
+            raise RuntimeError("gemma unavailable")
+        return [{"relevance_decision": "NOT_SAME", "llm_parse_ok": True} for _ in candidates]
+
+    monkeypatch.setattr(golden_pending_duplicate, "pending_exact_search", flaky_exact)
+    monkeypatch.setattr(golden_pending_duplicate, "filter_pending_duplicate_batch", flaky_llm)
+
+    entries = await check_pending_duplicates_batch(
+        [
+            {"rephrased_query": "wheat rust", "crop": "Wheat", "state": "Punjab"},
+            {"rephrased_query": "rice blast", "crop": "Rice", "state": "Bihar"},
+            {"rephrased_query": "mustard aphid", "crop": "Mustard", "state": "Rajasthan"},
+        ]
+    )
+
+    assert entries[0] == {"index": 0, "result": None, "error": "mongo timeout"}
+    assert entries[1] == {"index": 1, "result": None, "error": "gemma unavailable"}
+    assert entries[2]["error"] is None
+    assert entries[2]["result"]["is_duplicate"] is False
+    # the failed exact search is not retried through the vector path
+    assert golden_db["embedder"].calls == [["rice blast", "mustard aphid"]]
+
+
+@pytest.mark.asyncio
+async def test_check_batch_question_lookup_failure_only_fails_id_items(golden_db, monkeypatch):
+    async def broken_lookup(_ids):
+        raise RuntimeError("mongo down")
+
+    async def no_exact(*_args, **_kwargs):
+        return []
+
+    async def not_same(_query, candidates, **_kwargs):
+        return [{"relevance_decision": "NOT_SAME", "llm_parse_ok": True} for _ in candidates]
+
+    monkeypatch.setattr(golden_pending_duplicate, "get_questions_by_ids", broken_lookup)
+    monkeypatch.setattr(golden_pending_duplicate, "pending_exact_search", no_exact)
+    monkeypatch.setattr(golden_pending_duplicate, "filter_pending_duplicate_batch", not_same)
+
+    entries = await check_pending_duplicates_batch(
+        [
+            {"question_id": str(golden_db["ids"][0])},
+            {"rephrased_query": "rice blast", "crop": "Rice", "state": "Bihar"},
+        ]
+    )
+    assert entries[0]["error"] == "mongo down"
+    assert entries[1]["result"]["is_duplicate"] is False
@@ -0,0 +1,131 @@
+"""Response cache for the Soil Health GraphQL lookups.
+
+States, districts, crop registries and the fertilizer dosage for a given
+soil test rarely change, but every tool call went to soilhealth4.dac.gov.in.
+Responses now live in two tiers:
+
+  memory: a bounded LRU per process (SOIL_HEALTH_CACHE_MAX_ENTRIES)
+  disk:   an optional SQLite file shared by every worker on the host
+          (SOIL_HEALTH_CACHE_PATH; empty disables the disk tier)
+
+Keys are (query type, state, district, crop, extra) with each part
+normalized, where extra holds the soil test values for recommendations.
+Concurrent misses on the same key share one upstream call. Failed responses
+(transport errors or GraphQL ``errors``) are never cached; the last known
+value is served instead when one exists. ``invalidate_soil_cache`` drops
+entries by query type and/or portal state id, e.g. after the portal updates
+its GFRs. The tiers and single-flight live in ajrasakha.tiered_cache.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from ajrasakha.tiered_cache import ThreadedTieredCache, env_int
+
+logger = logging.getLogger(__name__)
+
+
+SOIL_CACHE_PATH = os.getenv("SOIL_HEALTH_CACHE_PATH", ".cache/soil_health.sqlite3").strip()
+SOIL_CACHE_MAX_ENTRIES = env_int("SOIL_HEALTH_CACHE_MAX_ENTRIES", 4096)
+# states / districts / crop registries
+CATALOG_TTL_SEC = env_int("SOIL_HEALTH_CATALOG_TTL_SEC", 7 * 24 * 3600)
+# fertilizer dosage for one (state, district, crop, soil test)
+RECOMMENDATION_TTL_SEC = env_int("SOIL_HEALTH_RECOMMENDATION_TTL_SEC", 3 * 24 * 3600)
+
+SoilKey = tuple[str, str, str, str, str]
+
+
+def _norm(value: Any) -> str:
+    if value is None:
+        return ""
+    return " ".join(str(value).strip().casefold().split())
+
+
+def _norm_extra(extra: dict[str, Any] | None) -> str:
+    if not extra:
+        return ""
+
+    def canon(value: Any) -> Any:
+        try:
+            return repr(float(value))  # 20, "20", "20.0" -> '20.0'
+        except (TypeError, ValueError):
+            return _norm(value)
+
+    return json.dumps({_norm(k): canon(v) for k, v in extra.items()}, sort_keys=True)
+
+
+def cache_key(
+    query_type: str,
+    state: str | None = None,
+    district: str | None = None,
+    crop: str | None = None,
+    extra: dict[str, Any] | None = None,
+) -> SoilKey:
+    return (_norm(query_type), _norm(state), _norm(district), _norm(crop), _norm_extra(extra))
+
+
+def is_failure(response: Any) -> bool:
+    """Transport failure from _execute_graphql, or a GraphQL-level error."""
+    if not isinstance(response, dict):
+        return True
+    return "error" in response or bool(response.get("errors"))
+
+
+class SoilHealthCache(ThreadedTieredCache):
+    """Soil health responses keyed by ``cache_key``; failed responses are not cached."""
+
+    def __init__(
+        self,
+        path: str | Path | None = SOIL_CACHE_PATH,
+        *,
+        max_entries: int = SOIL_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(
+            path,
+            table="soil_cache",
+            label="Soil health",
+            max_entries=max_entries,
+            clock=clock,
+            encode_key=lambda key: json.dumps(key, ensure_ascii=False),
+            key_columns={"query_type": lambda key: key[0], "state": lambda key: key[1]},
+            is_failure=is_failure,
+            on_error=lambda exc: {"error": str(exc), "success": False},
+        )
+
+    def invalidate(self, query_type: str | None = None, state_id: str | None = None) -> int:
+        """Drop entries matching the query type and/or state (all when both are None).
+
+        state_id is the portal's state ``_id`` that the tools are called with
+        (not the state name); it is normalized the same way as the cache key.
+        """
+        qt = _norm(query_type) if query_type else None
+        st = _norm(state_id) if state_id else None
+        removed = self.drop(query_type=qt, state=st)
+        logger.info("Soil health cache: invalidated %d entries (query_type=%s, state_id=%s)", removed, qt, st)
+        return removed
+
+
+_cache: SoilHealthCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_soil_cache() -> SoilHealthCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SoilHealthCache()
+    return _cache
+
+
+def invalidate_soil_cache(query_type: str | None = None, state_id: str | None = None) -> int:
+    """Invalidation hook for the shared cache; see SoilHealthCache.invalidate."""
+    return get_soil_cache().invalidate(query_type, state_id)
@@ -6,12 +6,17 @@ from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
 
+try:
+    from .soil_cache import CATALOG_TTL_SEC, RECOMMENDATION_TTL_SEC, cache_key, get_soil_cache
+except ImportError:
+    from soil_cache import CATALOG_TTL_SEC, RECOMMENDATION_TTL_SEC, cache_key, get_soil_cache
+
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 log = logging.getLogger(__name__)
 
-GRAPHQL_URL = "https://soilhealth4.dac.gov.in/"
+GRAPHQL_URL = os.getenv("SOIL_HEALTH_GRAPHQL_URL", "https://soilhealth4.dac.gov.in/")
 
 HEADERS = {
     "Content-Type": "application/json",
@@ -47,6 +52,12 @@ def _execute_graphql(operation_name: str, query: str, variables: Dict[str, Any])
         return {"error": err_msg, "success": False}
 
 
+def _cached_graphql(key, ttl: float, operation_name: str, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """_execute_graphql through the shared soil cache (failures are not cached)."""
+    return get_soil_cache().get_or_load(
+        key, lambda: _execute_graphql(operation_name, query, variables), ttl
+    )
+
 
 @mcp.tool()
 def get_states() -> Dict[str, Any]:
@@ -57,7 +68,7 @@ def get_states() -> Dict[str, Any]:
     # EXACT string from your trace
     query = "query GetState($getStateId: String, $code: String) {\n  getState(id: $getStateId, code: $code)\n}"
     
-    data = _execute_graphql("GetState", query, {})
+    data = _cached_graphql(cache_key("states"), CATALOG_TTL_SEC, "GetState", query, {})
     if "error" in data:
         return data
     
@@ -77,7 +88,10 @@ def get_districts(state_id: str) -> Dict[str, Any]:
     query = "query GetdistrictAndSubdistrictBystate($getdistrictAndSubdistrictBystateId: String, $name: String, $state: ID, $subdistrict: Boolean, $code: String, $aspirationaldistrict: Boolean) {\n  getdistrictAndSubdistrictBystate(\n    id: $getdistrictAndSubdistrictBystateId\n    name: $name\n    state: $state\n    subdistrict: $subdistrict\n    code: $code\n    aspirationaldistrict: $aspirationaldistrict\n  )\n}"
     
     variables = {"state": state_id}
-    data = _execute_graphql("GetdistrictAndSubdistrictBystate", query, variables)
+    data = _cached_graphql(
+        cache_key("districts", state_id), CATALOG_TTL_SEC,
+        "GetdistrictAndSubdistrictBystate", query, variables,
+    )
     
     if "error" in data:
         return data
@@ -99,7 +113,7 @@ def get_crops(state_id: str) -> Dict[str, Any]:
     query = "query GetCropRegistries($state: String) {\n  getCropRegistries(state: $state) {\n    GFRavailable\n    id\n    combinedName\n    __typename\n  }\n}"
     
     variables = {"state": state_id}
-    data = _execute_graphql("GetCropRegistries", query, variables)
+    data = _cached_graphql(cache_key("crops", state_id), CATALOG_TTL_SEC, "GetCropRegistries", query, variables)
     
     if "error" in data:
         return data
@@ -146,7 +160,8 @@ def get_fertilizer_dosage(
         }
     }
 
-    data = _execute_graphql("GetRecommendations", query, variables)
+    key = cache_key("recommendations", state_id, district_id, crop_id, extra=variables["results"])
+    data = _cached_graphql(key, RECOMMENDATION_TTL_SEC, "GetRecommendations", query, variables)
     
     if "error" in data:
         return data
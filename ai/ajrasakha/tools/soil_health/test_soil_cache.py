@@ -0,0 +1,191 @@
+"""Soil health response cache: LRU + SQLite tiers, TTLs, single-flight and invalidation, against a stub GraphQL server."""
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ajrasakha.tools.soil_health import soil_cache, soil_health_tool
+from ajrasakha.tools.soil_health.soil_cache import SoilHealthCache, cache_key
+
+STATE = "63f2495789e288769575a424"
+DISTRICT = "63f24a0b89e288769575b1c2"
+CROP = "662fe256b8ec1ea741b8c9b6"
+
+
+class _Stub(BaseHTTPRequestHandler):
+    hits: Counter
+    delay = 0.0
+    mode = "ok"  # ok | http_error | graphql_error
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length))
+        op = payload["operationName"]
+        self.hits[op] += 1
+        time.sleep(self.delay)
+        if self.mode == "http_error":
+            self.send_error(503, "busy")
+            return
+        if self.mode == "graphql_error":
+            body = {"errors": [{"message": "Invalid District"}], "data": {}}
+        else:
+            variables = payload["variables"]
+            data = {
+                "GetState": {"getState": [{"_id": STATE, "name": "PUNJAB"}]},
+                "GetdistrictAndSubdistrictBystate": {
+                    "getdistrictAndSubdistrictBystate": [{"_id": DISTRICT, "name": "Ludhiana", "state": variables.get("state")}]
+                },
+                "GetCropRegistries": {"getCropRegistries": [{"id": CROP, "combinedName": "Wheat", "GFRavailable": True}]},
+                "GetRecommendations": {"getRecommendations": [{"crop": CROP, "n": variables.get("results", {}).get("n")}]},
+            }[op]
+            body = {"data": data}
+        raw = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _tool(name):
+    fn = getattr(soil_health_tool, name)
+    return getattr(fn, "fn", fn)
+
+
+@pytest.fixture
+def graphql(monkeypatch, tmp_path):
+    hits: Counter = Counter()
+    handler = type("Handler", (_Stub,), {"hits": hits})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(soil_health_tool, "GRAPHQL_URL", f"http://127.0.0.1:{server.server_address[1]}/")
+
+    clock = _Clock()
+    cache = SoilHealthCache(tmp_path / "soil.sqlite3", clock=clock)
+    monkeypatch.setattr(soil_cache, "_cache", cache)
+    yield handler, hits, cache, clock, tmp_path
+    cache.close()
+    server.shutdown()
+    server.server_close()
+
+
+def _dosage(n=20.0, district=DISTRICT):
+    return _tool("get_fertilizer_dosage")(
+        state_id=STATE, district_id=district, crop_id=CROP, n=n, p=15.0, k=100.0, oc=0.5
+    )
+
+
+def test_catalog_lookups_hit_upstream_once_per_normalized_key(graphql):
+    _, hits, _, _, _ = graphql
+    for _ in range(3):
+        assert _tool("get_states")()["states"][0]["name"] == "PUNJAB"
+    assert _tool("get_districts")(STATE)["districts"][0]["name"] == "Ludhiana"
+    assert _tool("get_districts")(f"  {STATE.upper()} ")["success"] is True
+    _tool("get_crops")(STATE)
+    _tool("get_crops")(STATE)
+
+    assert hits == Counter({"GetState": 1, "GetdistrictAndSubdistrictBystate": 1, "GetCropRegistries": 1})
+
+
+def test_recommendations_keyed_by_soil_test(graphql):
+    _, hits, _, _, _ = graphql
+    first = _dosage(n=20)
+    assert first["recommendations"][0]["n"] == "20"
+    assert _dosage(n=20.0)["success"] is True  # same test values, different spelling
+    assert _dosage(n=25.0)["recommendations"][0]["n"] == "25.0"
+    assert _dosage(n=25.0, district="other")["success"] is True
+    assert hits["GetRecommendations"] == 3
+    assert cache_key("recommendations", STATE, extra={"n": "20"}) == cache_key(
+        "Recommendations", f" {STATE} ", extra={"N": 20.0}
+    )
+
+
+def test_disk_tier_survives_restart_and_ttl_expires(graphql):
+    _, hits, cache, clock, tmp_path = graphql
+    _tool("get_crops")(STATE)
+
+    restarted = SoilHealthCache(tmp_path / "soil.sqlite3", clock=clock)
+    assert restarted.get(cache_key("crops", STATE))["data"]["getCropRegistries"][0]["id"] == CROP
+    restarted.close()
+
+    cache.clear_memory()
+    _tool("get_crops")(STATE)
+    assert hits["GetCropRegistries"] == 1
+
+    clock.now += soil_cache.CATALOG_TTL_SEC + 1
+    _tool("get_crops")(STATE)
+    assert hits["GetCropRegistries"] == 2
+    assert cache.purge_expired() == 0  # refreshed row is live again
+
+
+def test_failures_are_not_cached_and_stale_is_served(graphql):
+    handler, hits, _, clock, _ = graphql
+    handler.mode = "http_error"
+    assert _tool("get_states")()["success"] is False
+    handler.mode = "graphql_error"
+    assert _dosage()["recommendations"] == []
+    handler.mode = "ok"
+    assert _tool("get_states")()["states"]
+    assert _dosage()["recommendations"][0]["crop"] == CROP
+    assert hits == Counter({"GetState": 2, "GetRecommendations": 2})
+
+    clock.now += soil_cache.CATALOG_TTL_SEC + 1
+    handler.mode = "http_error"
+    stale = _tool("get_states")()
+    assert stale["success"] is True and stale["states"][0]["name"] == "PUNJAB"
+    assert hits["GetState"] == 3
+
+
+def test_concurrent_misses_share_one_request(graphql):
+    handler, hits, _, _, _ = graphql
+    handler.delay = 0.2
+    results = []
+
+    def call():
+        results.append(_tool("get_districts")(STATE))
+
+    threads = [threading.Thread(target=call) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 10 and all(r["success"] for r in results)
+    assert hits["GetdistrictAndSubdistrictBystate"] == 1
+
+
+def test_invalidation_hook_drops_both_tiers(graphql):
+    _, hits, cache, _, _ = graphql
+    _tool("get_states")()
+    _tool("get_crops")(STATE)
+    _tool("get_crops")("63f5cef58cec41e6c95ce84e")
+    _dosage()
+
+    assert soil_cache.invalidate_soil_cache("crops", state_id=STATE.upper()) == 1
+    cache.clear_memory()  # force the disk tier to answer
+    _tool("get_crops")(STATE)
+    _tool("get_crops")("63f5cef58cec41e6c95ce84e")
+    _tool("get_states")()
+    assert hits["GetCropRegistries"] == 3
+
+    assert soil_cache.invalidate_soil_cache(state_id=STATE) == 2  # crops + recommendations
+    assert soil_cache.invalidate_soil_cache() == 2  # states + other state's crops
+    _tool("get_states")()
+    _dosage()
+    assert hits["GetState"] == 2 and hits["GetRecommendations"] == 2
@@ -62,6 +62,16 @@ app = FastAPI(
 client = IMDClient()
 
 
+@app.on_event("startup")
+def start_prefetch():
+    client.start_prefetch()
+
+
+@app.on_event("shutdown")
+def stop_prefetch():
+    client.close()
+
+
 # Health check 
 
 @app.get(
@@ -90,6 +100,7 @@ def health():
         "timestamp" : datetime.now().isoformat(),
         "wrapper"   : "IMDClient",
         "endpoints" : list(PRIORITY.keys()),
+        "cache"     : client.cache.stats() if client.cache else None,
     }
 
 
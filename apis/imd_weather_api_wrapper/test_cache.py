@@ -0,0 +1,207 @@
+"""Freshness-window cache and prefetcher for IMDClient, against a stub IMD server and a fake clock."""
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from wrapper import cache as cache_mod
+from wrapper import client as client_mod
+from wrapper.config import FRESHNESS_MINUTES
+
+CITY_PATH = "/city/api/cityweather.php"
+DISTRICT_PATH = "/mausam/api/nowcast_district_api.php"
+RAINFALL_PATH = "/mausam/api/districtwise_rainfall_api.php"
+
+
+class _StubImd:
+    def __init__(self):
+        self.delay = 0.0
+        self.fail = False
+        self.hits: Counter = Counter()
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def serve(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                place = query.get("city") or query.get("district")
+                with stub._lock:
+                    stub.hits[(url.path, place)] += 1
+                    version = stub.version
+                time.sleep(stub.delay)
+                if stub.fail:
+                    body, status = b"busy", 503
+                else:
+                    body = json.dumps({"temp": 30.0 + version, "rain": 1.0, "place": place}).encode()
+                    status = 200
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance_minutes(self, minutes):
+        self.now += minutes * 60
+
+
+@pytest.fixture
+def imd(monkeypatch):
+    stub = _StubImd()
+    server = stub.serve()
+    monkeypatch.setattr(client_mod, "BASE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(client_mod, "USE_MOCK", False)
+    clock = _Clock()
+    client = client_mod.IMDClient(max_retries=1, clock=clock)
+    yield stub, client, clock
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_served_from_cache_inside_freshness_window(imd):
+    stub, client, clock = imd
+    first = client.get_city_forecast("Ludhiana", "Punjab")
+    clock.advance_minutes(FRESHNESS_MINUTES["city_forecast"] - 1)
+    second = client.get_city_forecast("Ludhiana", "Punjab")
+
+    assert first["cache"]["status"] == "miss"
+    assert second["cache"] == {"status": "fresh", "age_sec": (FRESHNESS_MINUTES["city_forecast"] - 1) * 60}
+    assert second["temperature_c"] == first["temperature_c"]
+    assert stub.hits[(CITY_PATH, "Ludhiana")] == 1
+    # same URL, different endpoint key: cached separately
+    client.get_current_weather("Ludhiana", "Punjab")
+    assert stub.hits[(CITY_PATH, "Ludhiana")] == 2
+
+
+def test_stale_entry_served_while_one_background_refresh_runs(imd):
+    stub, client, clock = imd
+    client.get_nowcast("Ludhiana", "Punjab")
+    stub.version = 1
+    stub.delay = 0.2
+    clock.advance_minutes(FRESHNESS_MINUTES["nowcast"] + 1)
+
+    started = time.perf_counter()
+    stale = [client.get_nowcast("Ludhiana", "Punjab") for _ in range(20)]
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < stub.delay  # nobody waited on IMD
+    assert all(r["cache"]["status"] == "stale" and r["temperature_c"] == 30.0 for r in stale)
+    client.cache.wait_for_refreshes(timeout=5)
+    assert stub.hits[(DISTRICT_PATH, "Ludhiana")] == 2
+
+    refreshed = client.get_nowcast("Ludhiana", "Punjab")
+    assert refreshed["cache"]["status"] == "fresh"
+    assert refreshed["temperature_c"] == 31.0
+
+
+def test_expired_entry_is_fetched_and_failures_are_not_cached(imd):
+    stub, client, clock = imd
+    client.get_rainfall_forecast("Ludhiana", "Punjab", days=3)
+    clock.advance_minutes(FRESHNESS_MINUTES["rainfall_forecast"] * cache_mod.STALE_FACTOR)
+
+    stub.fail = True
+    with pytest.raises(RuntimeError, match="HTTP 503"):
+        client.get_rainfall_forecast("Ludhiana", "Punjab", days=3)
+
+    stub.fail = False
+    stub.version = 2
+    result = client.get_rainfall_forecast("Ludhiana", "Punjab", days=3)
+    assert result["cache"]["status"] == "miss"
+    assert result["temperature_c"] == 32.0
+    assert stub.hits[(RAINFALL_PATH, "Ludhiana")] == 3
+
+
+def test_failed_background_refresh_keeps_stale_copy(imd):
+    stub, client, clock = imd
+    client.get_district_forecast("Patiala", "Punjab")
+    clock.advance_minutes(FRESHNESS_MINUTES["district_forecast"] + 5)
+    stub.fail = True
+
+    assert client.get_district_forecast("Patiala", "Punjab")["cache"]["status"] == "stale"
+    client.cache.wait_for_refreshes(timeout=5)
+    again = client.get_district_forecast("Patiala", "Punjab")
+    assert again["cache"]["status"] == "stale"
+    assert again["temperature_c"] == 30.0
+
+
+def test_concurrent_misses_share_one_upstream_call(imd):
+    stub, client, _ = imd
+    stub.delay = 0.1
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.get_city_forecast("Pune", "Maharashtra")))
+        for _ in range(10)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 10
+    assert stub.hits[(CITY_PATH, "Pune")] == 1
+
+
+def test_prefetch_refreshes_hot_high_priority_keys_in_priority_order(imd):
+    stub, client, clock = imd
+    for _ in range(3):
+        client.get_district_forecast("Ludhiana", "Punjab")   # HIGH, hot
+    for _ in range(5):
+        client.get_city_forecast("Ludhiana", "Punjab")       # CRITICAL, hotter
+    client.get_city_forecast("Mansa", "Punjab")              # CRITICAL, cold
+    for _ in range(9):
+        client.get_nowcast("Ludhiana", "Punjab")             # LOW: never prefetched
+
+    prefetcher = cache_mod.PrefetchScheduler(client.cache, top_n=3)
+    assert prefetcher.run_once() == []  # everything just fetched
+
+    clock.advance_minutes(FRESHNESS_MINUTES["city_forecast"] * cache_mod.PREFETCH_LEAD)
+    due = prefetcher.due()
+    assert [(k[0], dict(k[1])["city" if k[0] == "city_forecast" else "district"]) for k in due] == [
+        ("city_forecast", "Ludhiana"),
+        ("district_forecast", "Ludhiana"),
+    ]
+
+    stub.version = 1
+    assert prefetcher.run_once() == due
+    assert stub.hits[(CITY_PATH, "Mansa")] == 1
+    # district_forecast + nowcast share a URL: one fetch each, plus the prefetch
+    assert stub.hits[(DISTRICT_PATH, "Ludhiana")] == 3
+    warm = client.get_city_forecast("Ludhiana", "Punjab")
+    assert warm["cache"]["status"] == "fresh" and warm["temperature_c"] == 31.0
+
+
+def test_prefetch_thread_starts_and_stops(imd):
+    _, client, _ = imd
+    client.get_city_forecast("Ludhiana", "Punjab")
+    prefetcher = client.start_prefetch(interval_sec=0.01)
+    assert client.start_prefetch() is prefetcher
+    deadline = time.time() + 2
+    while prefetcher.cycles < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    prefetcher.stop(timeout=2)
+    assert prefetcher.cycles >= 2
@@ -0,0 +1,111 @@
+"""Compiled keyword router: parity with the rule-by-rule scan, streaming CSV/Parquet routing."""
+
+import csv
+import random
+import re
+from collections import Counter
+
+import pytest
+
+from wrapper import router
+
+
+def _legacy_route(query_text):
+    text = query_text.lower()
+    text = re.sub(r"[^\w\s]", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    for need, keywords in router._RULES:
+        for kw in keywords:
+            if kw in text:
+                return need, kw
+    return "General Weather Forecast", None
+
+
+def _queries(n, seed=5):
+    rng = random.Random(seed)
+    vocab = [kw for _, kws in router._RULES for kw in kws] + [
+        "wheat", "aligarh", "kab", "hogi", "asked", "about", "paddy", "spray", "drainage", "tempo",
+    ]
+    out = []
+    for _ in range(n):
+        words = rng.sample(vocab, rng.randint(1, 5))
+        sep = rng.choice([" ", "  ", ", ", "?", "\t", "-"])
+        out.append(sep.join(w.upper() if rng.random() < 0.2 else w for w in words))
+    return out
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_matcher_parity_with_rule_scan(monkeypatch, use_automaton):
+    if use_automaton and router.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(router, "_MATCHER", router.KeywordMatcher(router._RULES, use_automaton))
+
+    queries = _queries(5000) + [kw for _, kws in router._RULES for kw in kws] + ["", "   ", "मौसम"]
+    for q in queries:
+        result = router.route_query(q)
+        assert (result["farmer_need"], result["matched_keyword"]) == _legacy_route(q), q
+
+
+def test_clean_matches_regex_version():
+    for q in _queries(2000) + ["  Rain, fall!!\n today ", "mausam​  kaisa"]:
+        legacy = re.sub(r"\s+", " ", re.sub(r"[^\w\s]", " ", q.lower())).strip()
+        assert router._clean(q) == legacy
+
+
+def test_dead_keywords_are_pruned():
+    kws = [kw for kw, _ in router._MATCHER.keywords]
+    assert "rainfall" not in kws  # "rain" always matches first
+    assert "weather conditions" not in kws
+    assert "weather report" not in kws
+    assert kws.index("district") < kws.index("dist")
+
+
+def test_route_batch_stream_csv(tmp_path):
+    queries = _queries(1200, seed=9) + ["", "nothing relevant here"]
+    src = tmp_path / "kcc.csv"
+    with open(src, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["id", "query"])
+        writer.writerows([i, q] for i, q in enumerate(queries))
+
+    out = tmp_path / "routed.csv"
+    summary = router.route_batch_stream(src, chunksize=100, workers=2, output_path=out)
+    assert summary["rows"] == len(queries)
+    assert summary["queries_per_sec"] > 0
+
+    expected = router.route_batch(queries)
+    with open(out, newline="", encoding="utf-8") as fh:
+        rows = list(csv.DictReader(fh))
+    assert [r["endpoint_key"] for r in rows] == [e["endpoint_key"] for e in expected]
+    assert [r["matched_keyword"] or None for r in rows] == [e["matched_keyword"] for e in expected]
+    assert sum(summary["by_endpoint"].values()) == len(queries)
+    assert summary["by_need"]["General Weather Forecast"] == sum(
+        e["farmer_need"] == "General Weather Forecast" for e in expected
+    )
+
+
+def test_route_batch_stream_rejects_missing_column(tmp_path):
+    src = tmp_path / "kcc.csv"
+    src.write_text("text\nrain\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Column 'query'"):
+        router.route_batch_stream(src, workers=1)
+
+
+def test_route_batch_stream_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    queries = _queries(300, seed=2) + [None]
+    src = tmp_path / "kcc.parquet"
+    pq.write_table(pa.table({"query": queries}), src)
+
+    summary = router.route_batch_stream(src, chunksize=64, workers=1)
+    expected = router.route_batch([q or "" for q in queries])
+    assert summary["rows"] == len(queries)
+    assert summary["by_endpoint"] == dict(Counter(e["endpoint_key"] for e in expected))
+
+
+def test_bench_cli_reports_throughput(capsys):
+    assert router.main(["bench", "--rows", "20000", "--workers", "1"]) == 0
+    out = capsys.readouterr().out
+    assert '"rows": 20000' in out
+    assert '"queries_per_sec"' in out
@@ -1,4 +1,5 @@
 from .client      import IMDClient
+from .cache       import FreshnessCache, PrefetchScheduler
 from .router      import route_query, route_batch
 from .api_mapping import (
     get_endpoint_for_cluster,
@@ -9,6 +10,8 @@ from .api_mapping import (
 
 __all__ = [
     "IMDClient",
+    "FreshnessCache",
+    "PrefetchScheduler",
     "route_query",
     "route_batch",
     "get_endpoint_for_cluster",
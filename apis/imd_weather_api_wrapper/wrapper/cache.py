@@ -0,0 +1,258 @@
+# imd_api_wrapper/wrapper/cache.py
+# ─────────────────────────────────────────────────────────────
+# Freshness-aware response cache for IMDClient.
+#
+# Each endpoint's FRESHNESS_MINUTES (config.py) is its window:
+#   age <  window                    → served from cache  ("fresh")
+#   window <= age < window × STALE_FACTOR
+#                                    → served as-is while one background
+#                                      refresh runs       ("stale")
+#   older, or never fetched          → fetched first      ("miss")
+#
+# PrefetchScheduler keeps the most requested (endpoint, location)
+# pairs of the high-priority tiers warm, CRITICAL first, so popular
+# districts are refreshed before their window runs out.
+# ─────────────────────────────────────────────────────────────
+
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Optional
+
+from .config import FRESHNESS_MINUTES, PRIORITY
+
+logger = logging.getLogger("IMDClient")
+
+# Tunables
+STALE_FACTOR          = 4      # serve stale data up to 4× the freshness window
+MAX_ENTRIES           = 5000   # cached (endpoint, params) responses
+REFRESH_WORKERS       = 4      # background refresh threads
+PREFETCH_TOP_N        = 50     # most requested keys kept warm
+PREFETCH_LEAD         = 0.8    # refresh once 80% of the window has passed
+PREFETCH_INTERVAL_SEC = 300
+PREFETCH_PRIORITIES   = ("CRITICAL", "HIGH")
+
+PRIORITY_RANK = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
+
+
+def cache_key(endpoint_key: str, params: dict) -> tuple:
+    return (endpoint_key, tuple(sorted(params.items())))
+
+
+def window_sec(endpoint_key: str) -> float:
+    return FRESHNESS_MINUTES[endpoint_key] * 60.0
+
+
+class FreshnessCache:
+    """
+    (endpoint, params) → normalised response, with per-endpoint freshness
+    windows, stale-while-revalidate and one upstream call per key at a time.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time,
+                 max_entries: int = MAX_ENTRIES,
+                 stale_factor: float = STALE_FACTOR,
+                 refresh_workers: int = REFRESH_WORKERS):
+        self.clock        = clock
+        self.max_entries  = max_entries
+        self.stale_factor = stale_factor
+        self.requests     = Counter()
+        self.outcomes     = Counter()
+        self.upstream_calls = 0
+
+        self._lock     = threading.Lock()
+        self._entries  = OrderedDict()   # key → (fetched_at, value)
+        self._loaders  = {}              # key → loader, for refreshes
+        self._loading  = {}              # key → threading.Event
+        self._pending  = set()           # background refresh futures
+        self._refreshing = set()         # keys with a refresh queued or running
+        self._executor = ThreadPoolExecutor(
+            max_workers=refresh_workers, thread_name_prefix="imd-refresh"
+        )
+
+    # Lookups
+
+    def get(self, endpoint_key: str, params: dict,
+            loader: Callable[[], dict]) -> dict:
+        key = cache_key(endpoint_key, params)
+        with self._lock:
+            self.requests[key] += 1
+            self._loaders[key] = loader
+            self._trim_counts()
+            entry = self._entries.get(key)
+
+        if entry is not None:
+            age    = self.clock() - entry[0]
+            window = window_sec(endpoint_key)
+            if age < window:
+                return self._tag(entry[1], "fresh", age)
+            if age < window * self.stale_factor:
+                self._refresh_in_background(key)
+                return self._tag(entry[1], "stale", age)
+
+        value = self._load(key, loader)
+        return self._tag(value, "miss", 0.0)
+
+    def age(self, key: tuple) -> Optional[float]:
+        entry = self._entries.get(key)
+        return None if entry is None else self.clock() - entry[0]
+
+    def hot_keys(self, n: int) -> list:
+        with self._lock:
+            return [key for key, _ in self.requests.most_common(n)]
+
+    def stats(self) -> dict:
+        return {
+            "entries"        : len(self._entries),
+            "upstream_calls" : self.upstream_calls,
+            **{f"{status}_hits": count for status, count in self.outcomes.items()},
+        }
+
+    # Loading
+
+    def refresh(self, key: tuple) -> dict:
+        """Fetch key now (used by the prefetcher); raises on upstream failure."""
+        return self._load(key, self._loaders[key])
+
+    def _load(self, key: tuple, loader: Callable[[], dict]) -> dict:
+        while True:
+            with self._lock:
+                event = self._loading.get(key)
+                owner = event is None
+                if owner:
+                    event = self._loading[key] = threading.Event()
+            if owner:
+                break
+            # another thread is fetching this key — use its result
+            event.wait()
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry[1]
+            # it failed; try ourselves
+
+        try:
+            self.upstream_calls += 1
+            value = loader()
+            with self._lock:
+                self._entries[key] = (self.clock(), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return value
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            event.set()
+
+    def _refresh_in_background(self, key: tuple) -> None:
+        with self._lock:
+            if key in self._refreshing or key in self._loading:
+                return
+            self._refreshing.add(key)
+            future = self._executor.submit(self._refresh_quietly, key)
+            self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    def _refresh_quietly(self, key: tuple) -> None:
+        try:
+            self.refresh(key)
+        except Exception as exc:
+            # keep serving the stale copy; the next request retries
+            logger.warning("[CACHE] refresh failed for %s: %s", key[0], exc)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> None:
+        wait(list(self._pending), timeout=timeout)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    # Helpers
+
+    def _tag(self, value: dict, status: str, age: float) -> dict:
+        self.outcomes[status] += 1
+        tagged = dict(value)
+        tagged["cache"] = {"status": status, "age_sec": round(age)}
+        return tagged
+
+    def _trim_counts(self) -> None:
+        # caller holds self._lock; keeps request counts bounded
+        if len(self.requests) <= self.max_entries * 2:
+            return
+        keep = dict(self.requests.most_common(self.max_entries))
+        self.requests = Counter(keep)
+        self._loaders = {k: v for k, v in self._loaders.items() if k in keep}
+
+
+class PrefetchScheduler:
+    """
+    Re-fetches the most requested high-priority keys before their window
+    runs out, in PRIORITY order (CRITICAL → HIGH), most requested first.
+    """
+
+    def __init__(self, cache: FreshnessCache,
+                 top_n: int = PREFETCH_TOP_N,
+                 lead: float = PREFETCH_LEAD,
+                 priorities: tuple = PREFETCH_PRIORITIES,
+                 interval_sec: float = PREFETCH_INTERVAL_SEC):
+        self.cache        = cache
+        self.top_n        = top_n
+        self.lead         = lead
+        self.priorities   = priorities
+        self.interval_sec = interval_sec
+        self.cycles       = 0
+        self._stop   = threading.Event()
+        self._thread = None
+
+    def due(self) -> list:
+        """Hot keys whose cached copy is missing or past lead × window, in fetch order."""
+        due = []
+        for key in self.cache.hot_keys(self.top_n):
+            endpoint_key = key[0]
+            if PRIORITY[endpoint_key] not in self.priorities:
+                continue
+            age = self.cache.age(key)
+            if age is None or age >= self.lead * window_sec(endpoint_key):
+                due.append(key)
+        return sorted(
+            due,
+            key=lambda k: (PRIORITY_RANK[PRIORITY[k[0]]], -self.cache.requests[k]),
+        )
+
+    def run_once(self) -> list:
+        refreshed = []
+        for key in self.due():
+            try:
+                self.cache.refresh(key)
+                refreshed.append(key)
+            except Exception as exc:
+                logger.warning("[PREFETCH] %s %s failed: %s", key[0], dict(key[1]), exc)
+        if refreshed:
+            logger.info("[PREFETCH] refreshed %d keys", len(refreshed))
+        return refreshed
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="imd-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("[PREFETCH] cycle failed")
+            self.cycles += 1
+            self._stop.wait(self.interval_sec)
@@ -17,6 +17,7 @@ from .config import (
     PRIORITY,
     FARMER_NEED,
 )
+from .cache import FreshnessCache, PrefetchScheduler
 
 logger = logging.getLogger("IMDClient")
 
@@ -254,11 +255,40 @@ class IMDClient:
     rainfall_forecast MEDIUM       248,633 queries   1.60%
     current_weather   MEDIUM       180,855 queries   1.16%
     nowcast           LOW           57,084 queries   0.37%
+
+    Responses are cached per endpoint for its FRESHNESS_MINUTES window
+    (see cache.py); pass cache=False to always hit IMD.
     """
 
-    def __init__(self):
+    def __init__(self, cache: bool = True, max_retries: int = 3,
+                 clock=time.time):
+        self.max_retries = max_retries
+        self.cache       = FreshnessCache(clock=clock) if cache else None
+        self.prefetcher  = None
         mode = "MOCK" if USE_MOCK else "LIVE"
-        logger.info("IMDClient initialised | mode=%s", mode)
+        logger.info("IMDClient initialised | mode=%s | cache=%s", mode, cache)
+
+    def _get(self, endpoint_key: str, params: dict) -> dict:
+        def load():
+            return _fetch(endpoint_key, params, max_retries=self.max_retries)
+        if self.cache is None:
+            return load()
+        return self.cache.get(endpoint_key, params, load)
+
+    def start_prefetch(self, **kwargs) -> PrefetchScheduler:
+        """Keeps the most requested CRITICAL / HIGH responses warm in the background."""
+        if self.cache is None:
+            raise RuntimeError("prefetch needs the response cache enabled")
+        if self.prefetcher is None:
+            self.prefetcher = PrefetchScheduler(self.cache, **kwargs)
+            self.prefetcher.start()
+        return self.prefetcher
+
+    def close(self) -> None:
+        if self.prefetcher is not None:
+            self.prefetcher.stop()
+        if self.cache is not None:
+            self.cache.close()
 
     # CRITICAL
 
@@ -269,7 +299,7 @@ class IMDClient:
         Freshness: every 6 hours.
         Clusters : 3,18,28,27,58,10,15,14,30,13,47
         """
-        return _fetch("city_forecast", {"city": city, "state": state})
+        return self._get("city_forecast", {"city": city, "state": state})
 
     # HIGH 
 
@@ -281,7 +311,7 @@ class IMDClient:
         Clusters : 54,36,41,8,9,12,40,52,17,7,26,1,53,32,22,45,48,
                    56,0,6,33,37,50,31,39,21,25,46,55,49,44,57,34,38,43,16
         """
-        return _fetch("district_forecast", {"district": district, "state": state})
+        return self._get("district_forecast", {"district": district, "state": state})
 
     # MEDIUM
 
@@ -295,8 +325,8 @@ class IMDClient:
         """
         if not 1 <= days <= 5:
             raise ValueError("days must be between 1 and 5")
-        return _fetch("rainfall_forecast",
-                      {"district": district, "state": state, "days": days})
+        return self._get("rainfall_forecast",
+                         {"district": district, "state": state, "days": days})
 
     def get_current_weather(self, city: str, state: str = "") -> dict:
         """
@@ -305,7 +335,7 @@ class IMDClient:
         Freshness: real-time / hourly.
         Clusters : 35, 29, 11
         """
-        return _fetch("current_weather", {"city": city, "state": state})
+        return self._get("current_weather", {"city": city, "state": state})
 
     # LOW
 
@@ -316,7 +346,7 @@ class IMDClient:
         Freshness: every 3 hours.
         Clusters : 24, 23
         """
-        return _fetch("nowcast", {"district": district, "state": state})
+        return self._get("nowcast", {"district": district, "state": state})
 
     # Convenience
 
@@ -9,11 +9,33 @@
 #   from wrapper.router import route_query
 #   result = route_query("will it rain tomorrow in Aligarh?")
 #   print(result["endpoint_key"])   # → rainfall_forecast
+#
+# Offline routing of a whole KCC export (CSV / Parquet, streamed
+# in chunks across worker processes):
+#   python -m wrapper.router route kcc_queries.csv --column query
+#   python -m wrapper.router bench --rows 1000000
 # ─────────────────────────────────────────────────────────────
 
+import argparse
+import csv
+import json
+import multiprocessing as mp
+import os
+import random
 import re
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, Optional
+
 from .config import NEED_TO_ENDPOINT, PRIORITY, FRESHNESS_MINUTES, FARMER_NEED
 
+try:
+    import ahocorasick
+except ImportError:  # ordered substring scan below
+    ahocorasick = None
+
 
 # Keyword rules (order = priority of matching)
 # Each rule: (farmer_need, list_of_keywords)
@@ -77,12 +99,76 @@ _RULES = [
 ]
 
 
+_PUNCT = re.compile(r"[^\w\s]")
+
+
 def _clean(text: str) -> str:
     """Lowercase and strip punctuation for matching."""
-    text = text.lower()
-    text = re.sub(r"[^\w\s]", " ", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    # str.split() collapses the same whitespace as \s+ and strips the ends
+    return " ".join(_PUNCT.sub(" ", text.lower()).split())
+
+
+def _compile_keywords(rules: list) -> list:
+    """
+    Flattens rules into [(keyword, rule_index)] in matching priority.
+    A keyword that contains a higher-priority keyword can never win
+    (the shorter one matches too), so it is dropped.
+    """
+    live = []
+    for rule_index, (_, keywords) in enumerate(rules):
+        for kw in keywords:
+            if any(prev in kw for prev, _ in live):
+                continue
+            live.append((kw, rule_index))
+    return live
+
+
+class KeywordMatcher:
+    """
+    All rule keywords compiled once. best() returns the index (into
+    .keywords) of the keyword the rule-by-rule scan would pick, or None.
+
+    With pyahocorasick installed this is a single Aho-Corasick pass over
+    the text; otherwise an ordered substring scan, which in CPython beats
+    a pure-Python automaton for a keyword list this small.
+    """
+
+    def __init__(self, rules: list, use_automaton: bool = True):
+        self.keywords = _compile_keywords(rules)
+        self._automaton = None
+        if use_automaton and ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for priority, (kw, _) in enumerate(self.keywords):
+                automaton.add_word(kw, priority)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def best(self, cleaned: str) -> Optional[int]:
+        if self._automaton is not None:
+            best = None
+            for _, priority in self._automaton.iter(cleaned):
+                if best is None or priority < best:
+                    best = priority
+            return best
+        for priority, (kw, _) in enumerate(self.keywords):
+            if kw in cleaned:
+                return priority
+        return None
+
+
+_MATCHER = KeywordMatcher(_RULES)
+
+
+def _route_result(query_text: str, keyword: Optional[str], need: str) -> dict:
+    endpoint_key = NEED_TO_ENDPOINT[need]
+    return {
+        "original_query"    : query_text,
+        "matched_keyword"   : keyword,
+        "farmer_need"       : need,
+        "endpoint_key"      : endpoint_key,
+        "priority"          : PRIORITY[endpoint_key],
+        "freshness_minutes" : FRESHNESS_MINUTES[endpoint_key],
+    }
 
 
 def route_query(query_text: str) -> dict:
@@ -100,30 +186,13 @@ def route_query(query_text: str) -> dict:
         original_query, matched_keyword, farmer_need,
         endpoint_key, priority, freshness_minutes
     """
-    cleaned = _clean(query_text)
-
-    for need, keywords in _RULES:
-        for kw in keywords:
-            if kw in cleaned:
-                endpoint_key = NEED_TO_ENDPOINT[need]
-                return {
-                    "original_query"    : query_text,
-                    "matched_keyword"   : kw,
-                    "farmer_need"       : need,
-                    "endpoint_key"      : endpoint_key,
-                    "priority"          : PRIORITY[endpoint_key],
-                    "freshness_minutes" : FRESHNESS_MINUTES[endpoint_key],
-                }
+    best = _MATCHER.best(_clean(query_text))
+    if best is not None:
+        kw, rule_index = _MATCHER.keywords[best]
+        return _route_result(query_text, kw, _RULES[rule_index][0])
 
     # fallback — no keyword matched
-    return {
-        "original_query"    : query_text,
-        "matched_keyword"   : None,
-        "farmer_need"       : "General Weather Forecast",
-        "endpoint_key"      : "city_forecast",
-        "priority"          : PRIORITY["city_forecast"],
-        "freshness_minutes" : FRESHNESS_MINUTES["city_forecast"],
-    }
+    return _route_result(query_text, None, "General Weather Forecast")
 
 
 def route_batch(queries: list) -> list:
@@ -138,4 +207,187 @@ def route_batch(queries: list) -> list:
     -------
     list of dicts (same structure as route_query)
     """
-    return [route_query(q) for q in queries]
\ No newline at end of file
+    return [route_query(q) for q in queries]
+
+
+# ── Streaming bulk routing ────────────────────────────────────
+
+_RULE_ENDPOINTS = [NEED_TO_ENDPOINT[need] for need, _ in _RULES]
+
+
+def _route_chunk(texts: list) -> list:
+    """
+    [(endpoint_key, matched_keyword)] per text — the compact form of
+    route_query used by worker processes (no per-row dicts).
+    """
+    best = _MATCHER.best
+    keywords = _MATCHER.keywords
+    out = []
+    for text in texts:
+        priority = best(_clean(text or ""))
+        if priority is None:
+            out.append(("city_forecast", None))
+        else:
+            kw, rule_index = keywords[priority]
+            out.append((_RULE_ENDPOINTS[rule_index], kw))
+    return out
+
+
+def iter_query_chunks(path, column: str = "query",
+                      chunksize: int = 50_000) -> Iterator[list]:
+    """
+    Yields lists of query strings from a CSV or Parquet file,
+    chunksize rows at a time. Missing values become "".
+    """
+    path = Path(path)
+    if path.suffix.lower() in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise RuntimeError("Reading Parquet needs pyarrow (pip install pyarrow)") from exc
+        parquet = pq.ParquetFile(path)
+        for batch in parquet.iter_batches(batch_size=chunksize, columns=[column]):
+            yield ["" if v is None else str(v) for v in batch.column(0).to_pylist()]
+        return
+
+    with path.open(newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        if header is None:
+            return
+        if column not in header:
+            raise ValueError(f"Column {column!r} not in {path.name} (columns: {header})")
+        col = header.index(column)
+        chunk = []
+        for row in reader:
+            chunk.append(row[col] if col < len(row) else "")
+            if len(chunk) >= chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def route_batch_stream(path, column: str = "query", *,
+                       chunksize: int = 50_000,
+                       workers: Optional[int] = None,
+                       output_path=None) -> dict:
+    """
+    Routes every query in a CSV / Parquet file without loading it whole.
+
+    Chunks are routed in a process pool (workers defaults to the CPU
+    count; 1 routes in-process). When output_path is given, one CSV
+    row per input row (same order) is written with endpoint_key,
+    farmer_need and matched_keyword.
+
+    Returns
+    -------
+    dict with keys:
+        rows, seconds, queries_per_sec, workers, by_endpoint, by_need
+    """
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    counts = Counter()
+    rows = 0
+
+    out_fh = writer = None
+    if output_path:
+        out_fh = open(output_path, "w", newline="", encoding="utf-8")
+        writer = csv.writer(out_fh)
+        writer.writerow(["endpoint_key", "farmer_need", "matched_keyword"])
+
+    pool = mp.Pool(workers) if workers > 1 else None
+    try:
+        chunks = iter_query_chunks(path, column, chunksize)
+        routed_chunks = pool.imap(_route_chunk, chunks) if pool else map(_route_chunk, chunks)
+        for routed in routed_chunks:
+            rows += len(routed)
+            counts.update(endpoint_key for endpoint_key, _ in routed)
+            if writer:
+                writer.writerows(
+                    (endpoint_key, FARMER_NEED[endpoint_key], kw or "")
+                    for endpoint_key, kw in routed
+                )
+        if pool:
+            pool.close()
+    finally:
+        if pool:
+            pool.terminate()
+            pool.join()
+        if out_fh:
+            out_fh.close()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "rows"            : rows,
+        "seconds"         : round(elapsed, 3),
+        "queries_per_sec" : round(rows / elapsed) if elapsed > 0 else None,
+        "workers"         : workers,
+        "by_endpoint"     : dict(counts),
+        "by_need"         : {FARMER_NEED[k]: v for k, v in counts.items()},
+    }
+
+
+# ── Synthetic benchmark ───────────────────────────────────────
+
+_SYNTHETIC_QUERIES = [
+    "asked about weather information",
+    "farmer asked about weather report of {place}",
+    "mausam ki jankari {place}",
+    "will it rain tomorrow in {place}?",
+    "barish kab hogi",
+    "weather forecast for next 5 days in {place}",
+    "current weather condition of {place} district",
+    "temperature and humidity today",
+    "asked about district weather of {place}",
+    "rainfall data of {place} tehsil",
+    "asked about fertilizer dose for paddy",
+    "wind speed information for spraying",
+]
+_SYNTHETIC_PLACES = ["Aligarh", "Sikar", "Kota", "Nashik", "Guntur", "Ludhiana", "Hisar", "Bhopal"]
+
+
+def write_synthetic_queries(path, rows: int, seed: int = 0) -> None:
+    """Writes a one-column ("query") CSV of KCC-like weather questions."""
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["query"])
+        for _ in range(rows):
+            template = rng.choice(_SYNTHETIC_QUERIES)
+            writer.writerow([template.format(place=rng.choice(_SYNTHETIC_PLACES))])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Route KCC weather queries offline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    route_p = sub.add_parser("route", help="route a CSV / Parquet file")
+    route_p.add_argument("path")
+    route_p.add_argument("--column", default="query")
+    route_p.add_argument("--out", default=None, help="per-row CSV output")
+
+    bench_p = sub.add_parser("bench", help="route a synthetic CSV and report queries/sec")
+    bench_p.add_argument("--rows", type=int, default=1_000_000)
+
+    for p in (route_p, bench_p):
+        p.add_argument("--chunksize", type=int, default=50_000)
+        p.add_argument("--workers", type=int, default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "route":
+        summary = route_batch_stream(args.path, args.column, chunksize=args.chunksize,
+                                     workers=args.workers, output_path=args.out)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "synthetic_queries.csv"
+            write_synthetic_queries(path, args.rows)
+            summary = route_batch_stream(path, chunksize=args.chunksize, workers=args.workers)
+        summary["matcher"] = "aho-corasick" if _MATCHER._automaton is not None else "ordered-scan"
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
\ No newline at end of file
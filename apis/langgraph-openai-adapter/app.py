@@ -1,6 +1,6 @@
-import asyncio
 import json
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
 import httpx
@@ -14,8 +14,12 @@ from config import (
     LANGGRAPH_BASE_URL,
     MONGO_URI,
 )
-from langgraph_bridge import complete_openai_from_langgraph, stream_openai_from_langgraph
-from mongo_user import get_user_context_headers
+from langgraph_bridge import (
+    close_http_client,
+    complete_openai_from_langgraph,
+    stream_openai_from_langgraph,
+)
+from mongo_user import close_mongo_user, get_user_context_headers
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,7 +27,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger("langgraph-openai-adapter")
 
-app = FastAPI(title="LangGraph OpenAI adapter")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_mongo_user()
+    await close_http_client()
+
+
+app = FastAPI(title="LangGraph OpenAI adapter", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -67,7 +79,7 @@ async def _user_context_headers(request: Request) -> dict[str, str]:
     user_id = request.headers.get("x-user-id")
     if not user_id:
         return {}
-    return await asyncio.to_thread(get_user_context_headers, user_id)
+    return await get_user_context_headers(user_id)
 
 
 @app.get("/health")
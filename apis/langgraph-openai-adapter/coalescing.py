@@ -0,0 +1,129 @@
+"""In-flight coalescing of duplicate chat requests (client retries, double taps)."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, AsyncIterator, Callable
+
+from config import COALESCE_WINDOW_SEC, REQUEST_COALESCING
+
+logger = logging.getLogger("langgraph-openai-adapter")
+
+
+def coalesce_key(
+    thread_id: str | None,
+    body: dict[str, Any],
+    request_headers: dict[str, str],
+) -> str | None:
+    """Key on thread id + user id + a hash of the request content; None disables coalescing."""
+    if not thread_id:
+        return None
+    user_id = ""
+    for name in ("x-user-id", "X-User-ID"):
+        if request_headers.get(name):
+            user_id = str(request_headers[name]).strip()
+            break
+    content = json.dumps(
+        {"model": body.get("model"), "messages": body.get("messages") or []},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return f"{thread_id}:{user_id}:{digest}"
+
+
+class _SharedRun:
+    """Output of one upstream run, buffered so late subscribers replay it from the start."""
+
+    def __init__(self) -> None:
+        self.chunks: list[str] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self.task: asyncio.Task | None = None
+        self._changed = asyncio.Condition()
+
+    async def publish(self, chunk: str) -> None:
+        async with self._changed:
+            self.chunks.append(chunk)
+            self._changed.notify_all()
+
+    async def finish(self, error: BaseException | None = None) -> None:
+        async with self._changed:
+            self.done = True
+            self.error = error
+            self._changed.notify_all()
+
+    async def subscribe(self) -> AsyncIterator[str]:
+        sent = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: sent < len(self.chunks) or self.done)
+                pending = self.chunks[sent:]
+                done = self.done
+            for chunk in pending:
+                yield chunk
+            sent += len(pending)
+            if done and sent >= len(self.chunks):
+                if self.error is not None:
+                    raise self.error
+                return
+
+
+class RequestCoalescer:
+    """Runs each distinct request once; duplicates attach to the same output stream.
+
+    The run executes in its own task, so a client disconnecting does not cancel
+    it for the others. A completed run stays attachable for ``window_sec``
+    (a retry that arrives just after the answer was sent gets the same answer);
+    a failed run is dropped at once so a retry starts fresh.
+    """
+
+    def __init__(self, *, window_sec: float = COALESCE_WINDOW_SEC) -> None:
+        self.window_sec = window_sec
+        self._runs: dict[str, _SharedRun] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def stream(self, key: str, factory: Callable[[], AsyncIterator[str]]) -> AsyncIterator[str]:
+        run = self._runs.get(key)
+        if run is None:
+            run = _SharedRun()
+            self._runs[key] = run
+            run.task = asyncio.create_task(self._produce(key, run, factory))
+            self.started += 1
+        else:
+            self.coalesced += 1
+            logger.info("coalesced duplicate request onto in-flight run (key=%s…)", key[:48])
+        return run.subscribe()
+
+    async def _produce(self, key: str, run: _SharedRun, factory: Callable[[], AsyncIterator[str]]) -> None:
+        try:
+            async for chunk in factory():
+                await run.publish(chunk)
+        except asyncio.CancelledError as exc:
+            self._drop(key, run)
+            await run.finish(exc)
+            raise
+        except Exception as exc:
+            self._drop(key, run)
+            await run.finish(exc)
+            return
+        await run.finish()
+        if self.window_sec > 0:
+            asyncio.get_running_loop().call_later(self.window_sec, self._drop, key, run)
+        else:
+            self._drop(key, run)
+
+    def _drop(self, key: str, run: _SharedRun) -> None:
+        if self._runs.get(key) is run:
+            del self._runs[key]
+
+
+coalescer = RequestCoalescer() if REQUEST_COALESCING else None
@@ -14,6 +14,13 @@ REQUEST_TIMEOUT = float(os.getenv("REQUEST_TIMEOUT", "300"))
 LANGGRAPH_BASE_URL = os.getenv("LANGGRAPH_BASE_URL", "http://127.0.0.1:2024").rstrip("/")
 LANGGRAPH_ASSISTANT_ID = os.getenv("LANGGRAPH_ASSISTANT_ID", "ajrasakha_agent")
 LANGGRAPH_API_KEY = os.getenv("LANGGRAPH_API_KEY", "not_required")
+# Threads known to have messages (skips the per-request thread state lookup)
+THREAD_CACHE_MAX_ENTRIES = int(os.getenv("THREAD_CACHE_MAX_ENTRIES", "10000"))
+THREAD_CACHE_TTL_SEC = float(os.getenv("THREAD_CACHE_TTL_SEC", "3600"))
+# Identical in-flight requests (same thread + messages) share one agent run.
+# A finished run stays attachable for COALESCE_WINDOW_SEC to absorb late retries.
+REQUEST_COALESCING = os.getenv("REQUEST_COALESCING", "true").strip().lower() in ("1", "true", "yes")
+COALESCE_WINDOW_SEC = float(os.getenv("COALESCE_WINDOW_SEC", "5"))
 
 # Source sent to upload_question_to_reviewer_system (adapter sets this; client does not)
 QUESTION_SOURCE = os.getenv("QUESTION_SOURCE", "AJRASAKHA").strip()
@@ -23,6 +30,10 @@ MONGO_URI = os.getenv("MONGO_URI", "").strip()
 MONGO_DB_NAME = os.getenv("MONGO_DB_NAME", "").strip()
 MONGO_USERS_COLLECTION = os.getenv("MONGO_USERS_COLLECTION", "users")
 LOCATION_CACHE_TTL_SEC = float(os.getenv("LOCATION_CACHE_TTL_SEC", "60"))
+LOCATION_CACHE_MAX_ENTRIES = int(os.getenv("LOCATION_CACHE_MAX_ENTRIES", "10000"))
+# Live GPS updates are written behind the request; updates for the same user
+# within this window collapse into one write.
+LOCATION_WRITE_DELAY_SEC = float(os.getenv("LOCATION_WRITE_DELAY_SEC", "2"))
 # When live GPS is parsed from the system prompt, update farmerProfile.location in MongoDB.
 LOCATION_SYNC_TO_DB = os.getenv("LOCATION_SYNC_TO_DB", "true").strip().lower() in (
     "1",
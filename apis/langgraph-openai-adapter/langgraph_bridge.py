@@ -7,6 +7,7 @@ import logging
 import re
 import time
 import uuid
+from collections import OrderedDict
 from typing import Any, AsyncIterator, Optional
 
 import httpx
@@ -18,8 +19,11 @@ from config import (
     LOCATION_SYNC_TO_DB,
     QUESTION_SOURCE,
     REQUEST_TIMEOUT,
+    THREAD_CACHE_MAX_ENTRIES,
+    THREAD_CACHE_TTL_SEC,
 )
-from mongo_user import update_user_location_if_changed
+from coalescing import coalesce_key, coalescer
+from mongo_user import enqueue_location_update
 
 logger = logging.getLogger("langgraph-openai-adapter")
 
@@ -35,6 +39,64 @@ _BLOCK_STREAM_NODES = frozenset({
 })
 
 
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared pooled client for all LangGraph calls."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=10.0))
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class _KnownThreads:
+    """Thread ids known to exist with messages, bounded by size and TTL.
+
+    Lets follow-up turns skip the thread state lookup that decides whether to
+    send the full history or only the new user message.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = THREAD_CACHE_MAX_ENTRIES,
+        ttl_sec: float = THREAD_CACHE_TTL_SEC,
+    ):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+    def __contains__(self, thread_id: str) -> bool:
+        expires_at = self._entries.get(thread_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._entries[thread_id]
+            return False
+        self._entries.move_to_end(thread_id)
+        return True
+
+    def add(self, thread_id: str) -> None:
+        self._entries[thread_id] = time.monotonic() + self.ttl_sec
+        self._entries.move_to_end(thread_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, thread_id: str) -> None:
+        self._entries.pop(thread_id, None)
+
+
+_known_threads = _KnownThreads()
+
+
 def _langgraph_headers() -> dict[str, str]:
     headers = {"Content-Type": "application/json"}
     if LANGGRAPH_API_KEY and LANGGRAPH_API_KEY != "not_required":
@@ -251,7 +313,7 @@ def _last_user_message(messages: list[dict[str, Any]]) -> dict[str, Any] | None:
     return None
 
 
-def resolve_thread_id(body: dict[str, Any], request_headers: dict[str, str]) -> str:
+def _explicit_thread_id(body: dict[str, Any], request_headers: dict[str, str]) -> str | None:
     explicit = body.get("thread_id")
     if isinstance(explicit, str) and explicit.strip():
         return explicit.strip()
@@ -259,7 +321,11 @@ def resolve_thread_id(body: dict[str, Any], request_headers: dict[str, str]) ->
         value = request_headers.get(key)
         if value and value.strip():
             return value.strip()
-    return str(uuid.uuid4())
+    return None
+
+
+def resolve_thread_id(body: dict[str, Any], request_headers: dict[str, str]) -> str:
+    return _explicit_thread_id(body, request_headers) or str(uuid.uuid4())
 
 
 def build_run_config(
@@ -317,7 +383,7 @@ def build_run_input(
         if live_location and LOCATION_SYNC_TO_DB:
             user_id = _user_id_from_headers(request_headers)
             if user_id:
-                update_user_location_if_changed(
+                enqueue_location_update(
                     user_id,
                     float(location["latitude"]),
                     float(location["longitude"]),
@@ -325,21 +391,6 @@ def build_run_input(
     return run_input
 
 
-async def _ensure_thread(client: httpx.AsyncClient, thread_id: str) -> None:
-    response = await client.post(
-        f"{LANGGRAPH_BASE_URL}/threads",
-        json={"thread_id": thread_id},
-        headers=_langgraph_headers(),
-    )
-    if response.status_code in (200, 201, 409):
-        return
-    # Thread may already exist from a prior run; continue if state endpoint works.
-    if response.status_code == 422:
-        logger.warning("thread create returned 422 for %s: %s", thread_id, response.text)
-        return
-    response.raise_for_status()
-
-
 async def fetch_thread_messages(
     client: httpx.AsyncClient,
     thread_id: str,
@@ -534,12 +585,55 @@ def _parse_langgraph_sse_line(line: str, current_event: str | None) -> tuple[str
     return current_event, None
 
 
+def _messages_from_values_event(data: Any) -> list[Any] | None:
+    if not isinstance(data, dict):
+        return None
+    messages = data.get("messages")
+    return messages if isinstance(messages, list) else None
+
+
 async def stream_openai_from_langgraph(
     body: dict[str, Any],
     *,
     request_headers: dict[str, str],
     context_headers: dict[str, str],
     run_meta: dict[str, Any] | None = None,
+) -> AsyncIterator[str]:
+    """Yield OpenAI-style SSE lines for one request, coalescing duplicates.
+
+    Identical requests (same thread, user and messages) that arrive while a run
+    is in flight attach to it and receive the same lines; the agent runs once.
+    """
+    # Without an explicit thread id every request gets a fresh thread, so there is nothing to share.
+    thread_id = _explicit_thread_id(body, request_headers)
+    key = coalesce_key(thread_id, body, request_headers) if coalescer is not None else None
+
+    if key is None:
+        async for line in _stream_run(
+            body,
+            request_headers=request_headers,
+            context_headers=context_headers,
+            run_meta=run_meta,
+        ):
+            yield line
+        return
+
+    if run_meta is not None:
+        run_meta["thread_id"] = thread_id
+    shared = coalescer.stream(
+        key,
+        lambda: _stream_run(body, request_headers=request_headers, context_headers=context_headers),
+    )
+    async for line in shared:
+        yield line
+
+
+async def _stream_run(
+    body: dict[str, Any],
+    *,
+    request_headers: dict[str, str],
+    context_headers: dict[str, str],
+    run_meta: dict[str, Any] | None = None,
 ) -> AsyncIterator[str]:
     """Yield OpenAI-style SSE lines (`data: {...}`).
 
@@ -547,82 +641,97 @@ async def stream_openai_from_langgraph(
     LangGraph thread state. We do not forward intermediate node output because graph
     node ordering/names may change and some nodes may overwrite the final message,
     which can otherwise cause duplicated/bilingual replies at the client.
+
+    The run streams ``values`` events (full thread state after each step), so the
+    final reply is read from the last one instead of a separate state fetch. The
+    thread is created by the run itself (``if_not_exists``); its state is only
+    looked up for threads not already known to have messages.
     """
     model = body.get("model") or LANGGRAPH_ASSISTANT_ID
     chunk_id = f"chatcmpl-{uuid.uuid4().hex}"
     thread_id = resolve_thread_id(body, request_headers)
     run_config = build_run_config(request_headers, thread_id)
     lg_headers = _langgraph_headers()
-    timeout = httpx.Timeout(REQUEST_TIMEOUT, connect=10.0)
+    client = _get_http_client()
 
     if run_meta is not None:
         run_meta["thread_id"] = thread_id
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        await _ensure_thread(client, thread_id)
-        has_prior = await _thread_has_messages(client, thread_id)
-        run_input = build_run_input(
-            body,
-            context_headers,
-            append_only=has_prior,
-            request_headers=request_headers,
-        )
+    has_prior = thread_id in _known_threads or await _thread_has_messages(client, thread_id)
+    run_input = build_run_input(
+        body,
+        context_headers,
+        append_only=has_prior,
+        request_headers=request_headers,
+    )
 
-        payload = {
-            "assistant_id": LANGGRAPH_ASSISTANT_ID,
-            "input": run_input,
-            "config": run_config,
-            "stream_mode": ["messages-tuple"],
-        }
+    payload = {
+        "assistant_id": LANGGRAPH_ASSISTANT_ID,
+        "input": run_input,
+        "config": run_config,
+        "stream_mode": ["values"],
+        "if_not_exists": "create",
+    }
 
-        url = f"{LANGGRAPH_BASE_URL}/threads/{thread_id}/runs/stream"
-        logger.info(
-            "langgraph bridge stream thread_id=%s assistant=%s append_only=%s",
+    url = f"{LANGGRAPH_BASE_URL}/threads/{thread_id}/runs/stream"
+    logger.info(
+        "langgraph bridge stream thread_id=%s assistant=%s append_only=%s",
+        thread_id,
+        LANGGRAPH_ASSISTANT_ID,
+        has_prior,
+    )
+
+    final_messages: list[Any] | None = None
+    async with client.stream(
+        "POST",
+        url,
+        json=payload,
+        headers=lg_headers,
+    ) as response:
+        if response.status_code >= 400:
+            await response.aread()
+            _known_threads.discard(thread_id)
+            response.raise_for_status()
+
+        # Consume the run stream fully, but do not emit any intermediate text.
+        # The final assistant reply is taken from the last values event.
+        current_event: str | None = None
+        async for line in response.aiter_lines():
+            current_event, data = _parse_langgraph_sse_line(line, current_event)
+            if current_event == "values":
+                messages = _messages_from_values_event(data)
+                if messages is not None:
+                    final_messages = messages
+
+    _known_threads.add(thread_id)
+
+    final_reply = _final_ai_reply_from_messages(final_messages or [])
+    if not final_reply:
+        # No values event (or no reply in it): read the thread state once.
+        try:
+            messages = await fetch_thread_messages(
+                client,
+                thread_id,
+                langgraph_base_url=LANGGRAPH_BASE_URL,
+                langgraph_headers=lg_headers,
+            )
+            final_reply = _final_ai_reply_from_messages(messages)
+        except httpx.HTTPError as exc:
+            logger.warning(
+                "Failed to fetch thread state for stream tail (thread=%s): %s",
+                thread_id,
+                exc,
+            )
+
+    if final_reply:
+        chunk = _openai_chunk(content=final_reply, model=model, chunk_id=chunk_id)
+        yield f"data: {json.dumps(chunk)}\n\n"
+    else:
+        logger.warning(
+            "LangGraph run completed with no assistant text in thread state (thread=%s)",
             thread_id,
-            LANGGRAPH_ASSISTANT_ID,
-            has_prior,
         )
 
-        async with client.stream(
-            "POST",
-            url,
-            json=payload,
-            headers=lg_headers,
-        ) as response:
-            if response.status_code >= 400:
-                await response.aread()
-                response.raise_for_status()
-
-            # Consume the run stream fully, but do not emit any intermediate text.
-            # The final assistant reply is taken from thread state.
-            async for _line in response.aiter_lines():
-                pass
-
-            final_reply = ""
-            try:
-                messages = await fetch_thread_messages(
-                    client,
-                    thread_id,
-                    langgraph_base_url=LANGGRAPH_BASE_URL,
-                    langgraph_headers=lg_headers,
-                )
-                final_reply = _final_ai_reply_from_messages(messages)
-            except httpx.HTTPError as exc:
-                logger.warning(
-                    "Failed to fetch thread state for stream tail (thread=%s): %s",
-                    thread_id,
-                    exc,
-                )
-
-            if final_reply:
-                chunk = _openai_chunk(content=final_reply, model=model, chunk_id=chunk_id)
-                yield f"data: {json.dumps(chunk)}\n\n"
-            else:
-                logger.warning(
-                    "LangGraph run completed with no assistant text in thread state (thread=%s)",
-                    thread_id,
-                )
-
     yield f"data: {json.dumps(_openai_chunk(model=model, chunk_id=chunk_id, finish_reason='stop'))}\n\n"
     yield "data: [DONE]\n\n"
 
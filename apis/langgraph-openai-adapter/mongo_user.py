@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections import OrderedDict
 from functools import lru_cache
+from typing import Awaitable, Callable
+
 from bson import ObjectId
 from bson.errors import InvalidId
-from pymongo import MongoClient
-from pymongo.collection import Collection
-from pymongo.database import Database
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
 
 from config import (
+    LOCATION_CACHE_MAX_ENTRIES,
     LOCATION_CACHE_TTL_SEC,
+    LOCATION_WRITE_DELAY_SEC,
     MONGO_URI,
     MONGO_USERS_COLLECTION,
     resolve_mongo_db_name,
@@ -20,20 +24,101 @@ from config import (
 
 logger = logging.getLogger("langgraph-openai-adapter")
 
-_cache: dict[str, tuple[float, dict[str, str] | None]] = {}
+_PROFILE_PROJECTION = {
+    "farmerProfile.location": 1,
+    "farmerProfile.state": 1,
+    "farmerProfile.district": 1,
+}
+
+
+class _UserContextCache:
+    """Size- and TTL-bounded LRU of user context headers with single-flight loading.
+
+    Concurrent misses for the same user share one in-flight lookup instead of
+    each querying MongoDB.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = LOCATION_CACHE_MAX_ENTRIES,
+        ttl_sec: float = LOCATION_CACHE_TTL_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, dict[str, str] | None]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, key: str) -> dict[str, str] | None:
+        """Return a fresh cached value without loading or touching LRU order."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            return None
+        return entry[1]
+
+    def put(self, key: str, value: dict[str, str] | None) -> None:
+        self._entries[key] = (self._clock() + self.ttl_sec, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[dict[str, str] | None]],
+    ) -> dict[str, str] | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                return entry[1]
+            del self._entries[key]
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except BaseException as exc:
+            future.set_exception(exc)
+            # mark retrieved so an unawaited failure is not reported at GC
+            future.exception()
+            raise
+        else:
+            self.put(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+
+_user_cache = _UserContextCache()
 
 
 @lru_cache(maxsize=1)
-def _users_collection() -> Collection | None:
+def _users_collection() -> AsyncIOMotorCollection | None:
     if not MONGO_URI:
         logger.warning("MONGO_URI is not set; user location headers will be omitted")
         return None
 
-    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
+    client = AsyncIOMotorClient(MONGO_URI, serverSelectionTimeoutMS=5000)
     db_name = resolve_mongo_db_name()
-    db: Database = client[db_name]
     logger.info("MongoDB user lookup enabled (db=%s, collection=%s)", db_name, MONGO_USERS_COLLECTION)
-    return db[MONGO_USERS_COLLECTION]
+    return client[db_name][MONGO_USERS_COLLECTION]
 
 
 def _parse_user_id(user_id: str) -> ObjectId | str | None:
@@ -70,16 +155,30 @@ def _location_from_doc(doc: dict | None) -> dict[str, str] | None:
     return headers or None
 
 
-def get_user_context_headers(user_id: str | None) -> dict[str, str]:
+def _same_location(existing: dict | None, latitude: float, longitude: float, tolerance: float) -> bool:
+    try:
+        return (
+            abs(float(existing["latitude"]) - latitude) <= tolerance
+            and abs(float(existing["longitude"]) - longitude) <= tolerance
+        )
+    except (TypeError, ValueError, KeyError):
+        return False
+
+
+async def _load_user_headers(collection: AsyncIOMotorCollection, user_id: str, parsed_id) -> dict[str, str] | None:
+    try:
+        doc = await collection.find_one({"_id": parsed_id}, projection=_PROFILE_PROJECTION)
+    except Exception:
+        logger.exception("MongoDB lookup failed for user_id=%s", user_id)
+        return None
+    return _location_from_doc(doc)
+
+
+async def get_user_context_headers(user_id: str | None) -> dict[str, str]:
     """Return upstream headers derived from the user's MongoDB farmer profile."""
     if not user_id:
         return {}
 
-    now = time.monotonic()
-    cached = _cache.get(user_id)
-    if cached and now - cached[0] < LOCATION_CACHE_TTL_SEC:
-        return cached[1] or {}
-
     collection = _users_collection()
     if collection is None:
         return {}
@@ -88,26 +187,80 @@ def get_user_context_headers(user_id: str | None) -> dict[str, str]:
     if parsed_id is None:
         return {}
 
+    headers = await _user_cache.get_or_load(
+        user_id, lambda: _load_user_headers(collection, user_id, parsed_id)
+    )
+    return dict(headers) if headers else {}
+
+
+async def _write_locations(
+    updates: dict[str, tuple[float, float]],
+    *,
+    tolerance: float = 1e-5,
+) -> set[str]:
+    """Persist changed locations for many users; returns the user ids written.
+
+    Stored locations are read with one ``$in`` query; only users whose stored
+    coordinates differ by more than ``tolerance`` are updated.
+    """
+    collection = _users_collection()
+    if collection is None or not updates:
+        return set()
+
+    parsed = {user_id: _parse_user_id(user_id) for user_id in updates}
+    parsed = {user_id: pid for user_id, pid in parsed.items() if pid is not None}
+    if not parsed:
+        return set()
+
     try:
-        doc = collection.find_one(
-            {"_id": parsed_id},
-            projection={
-                "farmerProfile.location": 1,
-                "farmerProfile.state": 1,
-                "farmerProfile.district": 1,
-            },
-        )
+        docs = await collection.find(
+            {"_id": {"$in": list(parsed.values())}},
+            projection={"farmerProfile.location": 1},
+        ).to_list(length=None)
     except Exception:
-        logger.exception("MongoDB lookup failed for user_id=%s", user_id)
-        _cache[user_id] = (now, None)
-        return {}
+        logger.exception("MongoDB read failed before location update (%d users)", len(parsed))
+        return set()
+    stored = {
+        str(doc["_id"]): ((doc.get("farmerProfile") or {}).get("location") or {}) for doc in docs
+    }
 
-    headers = _location_from_doc(doc) or {}
-    _cache[user_id] = (now, headers)
-    return headers
+    changed = [
+        user_id
+        for user_id in parsed
+        if not _same_location(stored.get(str(parsed[user_id])), *updates[user_id], tolerance)
+    ]
+
+    async def _update(user_id: str) -> bool:
+        latitude, longitude = updates[user_id]
+        try:
+            await collection.update_one(
+                {"_id": parsed[user_id]},
+                {
+                    "$set": {
+                        "farmerProfile.location": {
+                            "latitude": latitude,
+                            "longitude": longitude,
+                        }
+                    }
+                },
+            )
+        except Exception:
+            logger.exception("MongoDB location update failed user_id=%s", user_id)
+            return False
+        _user_cache.invalidate(user_id)
+        logger.info(
+            "Updated farmerProfile.location for user_id=%s (lat=%s, lon=%s)",
+            user_id,
+            latitude,
+            longitude,
+        )
+        return True
+
+    results = await asyncio.gather(*(_update(user_id) for user_id in changed))
+    return {user_id for user_id, ok in zip(changed, results) if ok}
 
 
-def update_user_location_if_changed(
+async def update_user_location_if_changed(
     user_id: str,
     latitude: float,
     longitude: float,
@@ -115,53 +268,115 @@ def update_user_location_if_changed(
     tolerance: float = 1e-5,
 ) -> bool:
     """Persist farmerProfile.location when live GPS differs from the stored profile."""
-    collection = _users_collection()
-    if collection is None:
-        return False
+    written = await _write_locations({user_id: (latitude, longitude)}, tolerance=tolerance)
+    return user_id in written
 
-    parsed_id = _parse_user_id(user_id)
-    if parsed_id is None:
-        return False
 
-    try:
-        doc = collection.find_one(
-            {"_id": parsed_id},
-            projection={"farmerProfile.location": 1},
-        )
-    except Exception:
-        logger.exception("MongoDB read failed before location update user_id=%s", user_id)
-        return False
+class _LocationWriteBehind:
+    """Coalescing write-behind queue for live GPS location updates.
 
-    existing = ((doc or {}).get("farmerProfile") or {}).get("location") or {}
-    try:
-        ex_lat = float(existing["latitude"])
-        ex_lon = float(existing["longitude"])
-        if abs(ex_lat - latitude) <= tolerance and abs(ex_lon - longitude) <= tolerance:
-            return False
-    except (TypeError, ValueError, KeyError):
-        pass
+    Updates are keyed by user id, so repeated updates for one user within the
+    flush delay collapse into a single write of the latest coordinates (and
+    the tolerance that came with them). ``close`` lets a flush that is already
+    writing finish before the final flush, so no batch is dropped mid-write.
+    """
 
-    try:
-        collection.update_one(
-            {"_id": parsed_id},
-            {
-                "$set": {
-                    "farmerProfile.location": {
-                        "latitude": latitude,
-                        "longitude": longitude,
-                    }
-                }
-            },
-        )
-    except Exception:
-        logger.exception("MongoDB location update failed user_id=%s", user_id)
-        return False
+    def __init__(self, *, delay_sec: float = LOCATION_WRITE_DELAY_SEC):
+        self.delay_sec = delay_sec
+        self._pending: dict[str, tuple[float, float, float]] = {}
+        self._wakeup: asyncio.Event | None = None
+        self._stopping: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def enqueue(
+        self,
+        user_id: str,
+        latitude: float,
+        longitude: float,
+        *,
+        tolerance: float = 1e-5,
+    ) -> None:
+        self._pending[user_id] = (latitude, longitude, tolerance)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # no loop (sync caller): picked up by the next flush
+            return
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._stopping = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+
+    async def flush(self) -> set[str]:
+        if not self._pending:
+            return set()
+        batch, self._pending = self._pending, {}
+        # one read per tolerance; callers almost always share the default
+        by_tolerance: dict[float, dict[str, tuple[float, float]]] = {}
+        for user_id, (latitude, longitude, tolerance) in batch.items():
+            by_tolerance.setdefault(tolerance, {})[user_id] = (latitude, longitude)
+        written: set[str] = set()
+        for tolerance, updates in by_tolerance.items():
+            try:
+                written |= await _write_locations(updates, tolerance=tolerance)
+            except Exception:
+                logger.exception("location write-behind flush failed (%d users)", len(updates))
+        return written
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if self.delay_sec > 0 and not self._stopping.is_set():
+                # the coalescing delay, cut short by close()
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.delay_sec)
+                except asyncio.TimeoutError:
+                    pass
+            await self.flush()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._stopping.set()
+            self._wakeup.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
 
-    _cache.pop(user_id, None)
-    logger.info(
-        "Updated farmerProfile.location for user_id=%s (lat=%s, lon=%s)",
-        user_id,
+
+_location_writer = _LocationWriteBehind()
+
+
+def enqueue_location_update(
+    user_id: str,
+    latitude: float,
+    longitude: float,
+    *,
+    tolerance: float = 1e-5,
+) -> bool:
+    """Queue a farmerProfile.location update; returns False when it is known to be unchanged.
+
+    ``tolerance`` applies both to this cache check and to the stored-location
+    comparison made when the queued update is flushed.
+    """
+    if _parse_user_id(user_id) is None:
+        return False
+    cached = _user_cache.peek(user_id)
+    if cached and _same_location(
+        {"latitude": cached.get("X-Latitude"), "longitude": cached.get("X-Longitude")},
         latitude,
         longitude,
-    )
+        tolerance,
+    ):
+        return False
+    _location_writer.enqueue(user_id, latitude, longitude, tolerance=tolerance)
     return True
+
+
+async def close_mongo_user() -> None:
+    """Flush pending location writes (call on shutdown)."""
+    await _location_writer.close()
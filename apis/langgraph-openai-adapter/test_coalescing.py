@@ -0,0 +1,150 @@
+"""Duplicate in-flight requests share one LangGraph run and receive the same chunks."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import langgraph_bridge
+from coalescing import RequestCoalescer
+
+
+class _SlowLangGraph:
+    """Fake LangGraph whose runs stream a values event after a short delay."""
+
+    def __init__(self, *, delay: float = 0.05, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.runs: list[dict] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(404)
+        payload = json.loads(request.content)
+        self.runs.append(payload)
+        if self.fail:
+            return httpx.Response(500, json={"detail": "agent crashed"})
+        question = payload["input"]["messages"][-1]["content"]
+        run_no = len(self.runs)
+
+        async def body():
+            await asyncio.sleep(self.delay)
+            state = {"messages": [
+                {"type": "human", "content": question},
+                {"type": "ai", "content": f"run {run_no}: {question}"},
+            ]}
+            yield f"event: values\ndata: {json.dumps(state)}\n\n".encode()
+
+        return httpx.Response(200, content=body(), headers={"content-type": "text/event-stream"})
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    server = _SlowLangGraph()
+    monkeypatch.setattr(
+        langgraph_bridge, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(server))
+    )
+    monkeypatch.setattr(langgraph_bridge, "_known_threads", langgraph_bridge._KnownThreads())
+    monkeypatch.setattr(langgraph_bridge, "coalescer", RequestCoalescer(window_sec=0.2))
+    return server
+
+
+def _request(question: str, thread_id: str = "conv-1"):
+    body = {"model": "m", "messages": [{"role": "user", "content": question}]}
+    return body, {"x-conversation-id": thread_id, "x-user-id": "u-1"}
+
+
+async def _collect(question: str, thread_id: str = "conv-1") -> list[str]:
+    body, headers = _request(question, thread_id)
+    return [
+        line
+        async for line in langgraph_bridge.stream_openai_from_langgraph(
+            body, request_headers=headers, context_headers={}
+        )
+    ]
+
+
+def _content(lines: list[str]) -> str:
+    text = ""
+    for line in lines:
+        data = line[len("data: "):].strip()
+        if data == "[DONE]":
+            continue
+        text += json.loads(data)["choices"][0]["delta"].get("content", "")
+    return text
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_run_once(backend):
+    results = await asyncio.gather(*(_collect("wheat rust?") for _ in range(5)))
+    assert len(backend.runs) == 1
+    assert all(r == results[0] for r in results)
+    assert _content(results[0]) == "run 1: wheat rust?"
+    assert results[0][-1] == "data: [DONE]\n\n"
+    assert langgraph_bridge.coalescer.coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_different_content_or_thread_runs_separately(backend):
+    await asyncio.gather(
+        _collect("wheat rust?"),
+        _collect("rice blast?"),
+        _collect("wheat rust?", thread_id="conv-2"),
+    )
+    assert len(backend.runs) == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_within_window_reuses_answer_then_expires(backend):
+    first = await _collect("wheat rust?")
+    second = await _collect("wheat rust?")
+    assert second == first
+    assert len(backend.runs) == 1
+
+    await asyncio.sleep(0.25)
+    third = await _collect("wheat rust?")
+    assert len(backend.runs) == 2
+    assert _content(third) == "run 2: wheat rust?"
+
+
+@pytest.mark.asyncio
+async def test_disconnecting_client_does_not_cancel_shared_run(backend):
+    body, headers = _request("wheat rust?")
+    quitter = langgraph_bridge.stream_openai_from_langgraph(body, request_headers=headers, context_headers={})
+    stayer = asyncio.create_task(_collect("wheat rust?"))
+    await asyncio.sleep(0.01)
+    await quitter.aclose()
+
+    lines = await stayer
+    assert _content(lines) == "run 1: wheat rust?"
+    assert len(backend.runs) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_run_reaches_all_subscribers_and_is_not_reused(backend):
+    backend.fail = True
+    results = await asyncio.gather(
+        *(_collect("wheat rust?") for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+    assert len(backend.runs) == 1
+
+    backend.fail = False
+    assert _content(await _collect("wheat rust?")) == "run 2: wheat rust?"
+
+
+@pytest.mark.asyncio
+async def test_requests_without_thread_id_are_not_coalesced(backend):
+    body = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+
+    async def run():
+        return [
+            line
+            async for line in langgraph_bridge.stream_openai_from_langgraph(
+                body, request_headers={}, context_headers={}
+            )
+        ]
+
+    await asyncio.gather(run(), run())
+    assert len(backend.runs) == 2
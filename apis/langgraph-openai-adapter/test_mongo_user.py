@@ -0,0 +1,227 @@
+"""Tests for the async user-context cache and location write-behind queue."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from bson import ObjectId
+from mongomock_motor import AsyncMongoMockClient
+
+import mongo_user
+from mongo_user import (
+    _LocationWriteBehind,
+    _UserContextCache,
+    enqueue_location_update,
+    get_user_context_headers,
+    update_user_location_if_changed,
+)
+
+
+class _CountingCollection:
+    """Wraps a mongomock-motor collection, counting reads and writes."""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.find_one_calls = 0
+        self.find_calls = 0
+        self.update_calls = 0
+
+    async def find_one(self, *args, **kwargs):
+        self.find_one_calls += 1
+        await asyncio.sleep(0.01)
+        return await self._collection.find_one(*args, **kwargs)
+
+    def find(self, *args, **kwargs):
+        self.find_calls += 1
+        return self._collection.find(*args, **kwargs)
+
+    async def update_one(self, *args, **kwargs):
+        self.update_calls += 1
+        return await self._collection.update_one(*args, **kwargs)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+USER = ObjectId()
+OTHER = ObjectId()
+
+
+@pytest_asyncio.fixture
+async def users(monkeypatch):
+    raw = AsyncMongoMockClient()["LibreChat"]["users"]
+    await raw.insert_many([
+        {
+            "_id": USER,
+            "farmerProfile": {
+                "location": {"latitude": 27.1, "longitude": 83.5},
+                "state": "Uttar Pradesh",
+                "district": "Gorakhpur",
+            },
+        },
+        {"_id": OTHER, "farmerProfile": {"state": "Punjab"}},
+    ])
+    collection = _CountingCollection(raw)
+    monkeypatch.setattr(mongo_user, "_users_collection", lambda: collection)
+    monkeypatch.setattr(mongo_user, "_user_cache", _UserContextCache())
+    monkeypatch.setattr(mongo_user, "_location_writer", _LocationWriteBehind(delay_sec=0.02))
+    yield collection
+    await mongo_user.close_mongo_user()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_query(users):
+    results = await asyncio.gather(*(get_user_context_headers(str(USER)) for _ in range(50)))
+    assert users.find_one_calls == 1
+    assert all(r == results[0] for r in results)
+    assert results[0] == {
+        "X-Latitude": "27.1",
+        "X-Longitude": "83.5",
+        "X-State": "Uttar Pradesh",
+        "X-District": "Gorakhpur",
+    }
+
+    results[0]["X-State"] = "mutated"
+    assert (await get_user_context_headers(str(USER)))["X-State"] == "Uttar Pradesh"
+    assert users.find_one_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_user_and_blank_id(users):
+    assert await get_user_context_headers(str(ObjectId())) == {}
+    assert await get_user_context_headers("   ") == {}
+    assert await get_user_context_headers(None) == {}
+    assert users.find_one_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_is_bounded_and_expires():
+    clock = _Clock()
+    cache = _UserContextCache(max_entries=2, ttl_sec=10, clock=clock)
+    loads = []
+
+    def loader(key):
+        async def load():
+            loads.append(key)
+            return {"X-State": key}
+        return load
+
+    for key in ("a", "b", "a", "c"):
+        await cache.get_or_load(key, loader(key))
+    assert loads == ["a", "b", "c"]
+    assert len(cache) == 2
+    await cache.get_or_load("b", loader("b"))
+    assert loads == ["a", "b", "c", "b"]
+
+    clock.now += 11
+    await cache.get_or_load("c", loader("c"))
+    assert loads[-1] == "c"
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_shared_and_not_cached():
+    cache = _UserContextCache()
+    calls = []
+
+    async def broken():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("mongo down")
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("u", broken) for _ in range(5)), return_exceptions=True
+    )
+    assert len(calls) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_write_behind_coalesces_updates(users):
+    for i in range(10):
+        assert enqueue_location_update(str(USER), 19.0 + i, 72.0)
+    enqueue_location_update(str(OTHER), 30.0, 75.0)
+    assert len(mongo_user._location_writer) == 2
+
+    await asyncio.sleep(0.1)
+    assert users.update_calls == 2
+    assert users.find_calls == 1
+
+    doc = await users._collection.find_one({"_id": USER})
+    assert doc["farmerProfile"]["location"] == {"latitude": 28.0, "longitude": 72.0}
+    assert (await get_user_context_headers(str(USER)))["X-Latitude"] == "28.0"
+
+
+@pytest.mark.asyncio
+async def test_unchanged_location_is_not_written(users):
+    await get_user_context_headers(str(USER))
+    assert not enqueue_location_update(str(USER), 27.1, 83.5)
+
+    mongo_user._user_cache.clear()
+    assert enqueue_location_update(str(USER), 27.1, 83.5)
+    await mongo_user.close_mongo_user()
+    assert users.update_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_update_keeps_its_tolerance(users):
+    # cache is cold, so the pre-check cannot tell; the flush must use the caller's tolerance
+    assert enqueue_location_update(str(USER), 27.15, 83.5, tolerance=0.1)
+    await mongo_user.close_mongo_user()
+    assert users.update_calls == 0
+
+    enqueue_location_update(str(USER), 27.15, 83.5)
+    await mongo_user.close_mongo_user()
+    assert users.update_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_updates(users):
+    enqueue_location_update(str(USER), 10.0, 20.0)
+    await mongo_user.close_mongo_user()
+    assert users.update_calls == 1
+    assert len(mongo_user._location_writer) == 0
+
+
+@pytest.mark.asyncio
+async def test_close_during_slow_write_keeps_the_batch(users, monkeypatch):
+    writing = asyncio.Event()
+    release = asyncio.Event()
+    real_update = users.update_one
+
+    async def slow_update(*args, **kwargs):
+        writing.set()
+        await release.wait()
+        return await real_update(*args, **kwargs)
+
+    monkeypatch.setattr(users, "update_one", slow_update)
+    enqueue_location_update(str(USER), 10.0, 20.0)
+    await asyncio.wait_for(writing.wait(), 1)
+    enqueue_location_update(str(OTHER), 30.0, 75.0)
+
+    closing = asyncio.create_task(mongo_user.close_mongo_user())
+    await asyncio.sleep(0.01)
+    assert not closing.done()
+    release.set()
+    await closing
+
+    assert users.update_calls == 2
+    doc = await users._collection.find_one({"_id": USER})
+    assert doc["farmerProfile"]["location"] == {"latitude": 10.0, "longitude": 20.0}
+    other = await users._collection.find_one({"_id": OTHER})
+    assert other["farmerProfile"]["location"] == {"latitude": 30.0, "longitude": 75.0}
+
+
+@pytest.mark.asyncio
+async def test_direct_update_invalidates_cache(users):
+    await get_user_context_headers(str(USER))
+    assert await update_user_location_if_changed(str(USER), 12.5, 77.5)
+    assert not await update_user_location_if_changed(str(USER), 12.5, 77.5)
+    headers = await get_user_context_headers(str(USER))
+    assert headers["X-Latitude"] == "12.5"
+    assert users.find_one_calls == 2
@@ -0,0 +1,116 @@
+"""LangGraph round trips per adapter request, counted against a fake LangGraph server."""
+
+import json
+
+import httpx
+import pytest
+
+import langgraph_bridge
+
+
+class _FakeLangGraph:
+    """Minimal LangGraph server: thread state + runs/stream emitting values events."""
+
+    def __init__(self, *, emit_values: bool = True):
+        self.threads: dict[str, list[dict]] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.run_payloads: list[dict] = []
+        self.emit_values = emit_values
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requests.append((request.method, path))
+        parts = path.strip("/").split("/")
+        thread_id = parts[1]
+
+        if request.method == "GET" and path.endswith("/state"):
+            if thread_id not in self.threads:
+                return httpx.Response(404, json={"detail": "not found"})
+            return httpx.Response(200, json={"values": {"messages": self.threads[thread_id]}})
+
+        if request.method == "POST" and path.endswith("/runs/stream"):
+            payload = json.loads(request.content)
+            self.run_payloads.append(payload)
+            if thread_id not in self.threads:
+                if payload.get("if_not_exists") != "create":
+                    return httpx.Response(404, json={"detail": "thread not found"})
+                self.threads[thread_id] = []
+            messages = self.threads[thread_id]
+            messages.extend(payload["input"]["messages"])
+            lines = []
+            if self.emit_values:
+                lines.append(f"event: values\ndata: {json.dumps({'messages': list(messages)})}\n\n")
+            messages.append({"type": "ai", "content": f"answer {len(messages)}"})
+            if self.emit_values:
+                lines.append(f"event: values\ndata: {json.dumps({'messages': list(messages)})}\n\n")
+            return httpx.Response(
+                200, content="".join(lines).encode(), headers={"content-type": "text/event-stream"}
+            )
+
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def fake_langgraph(monkeypatch):
+    server = _FakeLangGraph()
+    monkeypatch.setattr(
+        langgraph_bridge, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(server))
+    )
+    monkeypatch.setattr(langgraph_bridge, "_known_threads", langgraph_bridge._KnownThreads())
+    return server
+
+
+async def _ask(question: str, history: list[dict], thread_id: str = "t-1") -> str:
+    body = {"model": "m", "messages": history + [{"role": "user", "content": question}]}
+    result = await langgraph_bridge.complete_openai_from_langgraph(
+        body, request_headers={"x-conversation-id": thread_id}, context_headers={}
+    )
+    return result["choices"][0]["message"]["content"]
+
+
+@pytest.mark.asyncio
+async def test_new_thread_then_follow_up_round_trips(fake_langgraph):
+    assert await _ask("first question", []) == "answer 1"
+    assert fake_langgraph.requests == [
+        ("GET", "/threads/t-1/state"),
+        ("POST", "/threads/t-1/runs/stream"),
+    ]
+    first = fake_langgraph.run_payloads[0]
+    assert first["if_not_exists"] == "create"
+    assert first["stream_mode"] == ["values"]
+
+    fake_langgraph.requests.clear()
+    history = [
+        {"role": "user", "content": "first question"},
+        {"role": "assistant", "content": "answer 1"},
+    ]
+    assert await _ask("second question", history) == "answer 3"
+    # known thread: a single run call, and only the new message is sent
+    assert fake_langgraph.requests == [("POST", "/threads/t-1/runs/stream")]
+    assert fake_langgraph.run_payloads[1]["input"]["messages"] == [
+        {"type": "human", "content": "second question"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unknown_existing_thread_is_looked_up_once(fake_langgraph):
+    fake_langgraph.threads["t-2"] = [
+        {"type": "human", "content": "old"},
+        {"type": "ai", "content": "old answer"},
+    ]
+    history = [{"role": "user", "content": "old"}, {"role": "assistant", "content": "old answer"}]
+    await _ask("new", history, thread_id="t-2")
+    await _ask("newer", history, thread_id="t-2")
+    assert fake_langgraph.requests.count(("GET", "/threads/t-2/state")) == 1
+    assert all(len(p["input"]["messages"]) == 1 for p in fake_langgraph.run_payloads)
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_state_fetch_without_values_events(fake_langgraph):
+    fake_langgraph.emit_values = False
+    assert await _ask("question", [], thread_id="t-3") == "answer 1"
+    assert fake_langgraph.requests == [
+        ("GET", "/threads/t-3/state"),
+        ("POST", "/threads/t-3/runs/stream"),
+        ("GET", "/threads/t-3/state"),
+    ]
@@ -6,7 +6,10 @@ Caches the LLM's final text response (not raw tool output).
 Storage layout in Redis:
   - Key: "response_cache:{state_lower}:{crop_lower}" (a Redis Hash)
   - Each field in the hash is a UUID entry ID.
-  - Each value is a JSON blob: {"embedding": [...], "result": ..., "ts": epoch}
+  - Each value is a JSON blob: {"embedding": [...], "result": ..., "sse": [...], "ts": epoch}
+    where "sse" holds the result pre-serialized as OpenAI streaming frames
+    with the completion id / created time left as placeholders that are
+    stamped per replay (see sse_stream.py); older entries may not have it.
   
 We also set a TTL on the entire hash key so stale buckets auto-expire.
 """
@@ -65,6 +68,22 @@ async def get_cached_result(
     
     Returns (cached_result, similarity_score) or None.
     """
+    found = await get_cached_entry(bucket_key, query_embedding)
+    if found is None:
+        return None
+    entry, score = found
+    return entry.get("result"), score
+
+
+async def get_cached_entry(
+    bucket_key: str, query_embedding: List[float]
+) -> Optional[Tuple[dict, float]]:
+    """
+    Like get_cached_result, but returns the whole stored entry
+    (result, sse frames, ts) so callers can use the pre-built frames.
+
+    Returns (entry, similarity_score) or None.
+    """
     r = await get_redis()
     entries = await r.hgetall(bucket_key)
 
@@ -72,7 +91,7 @@ async def get_cached_result(
         return None
 
     best_score = -1.0
-    best_result = None
+    best_entry = None
 
     for _entry_id, entry_json in entries.items():
         try:
@@ -87,13 +106,17 @@ async def get_cached_result(
         score = cosine_similarity(query_embedding, stored_embedding)
         if score > best_score:
             best_score = score
-            best_result = entry.get("result")
+            best_entry = entry
 
-    if best_score >= SIMILARITY_THRESHOLD and best_result is not None:
+    if (
+        best_score >= SIMILARITY_THRESHOLD
+        and best_entry is not None
+        and best_entry.get("result") is not None
+    ):
         logger.info(
             f"CACHE HIT — bucket={bucket_key}, similarity={best_score:.4f}"
         )
-        return best_result, best_score
+        return best_entry, best_score
 
     logger.info(
         f"CACHE MISS — bucket={bucket_key}, best_similarity={best_score:.4f} "
@@ -102,20 +125,37 @@ async def get_cached_result(
     return None
 
 
+def serialize_entry(
+    query_embedding: List[float],
+    result: Any,
+    sse_frames: Optional[List[str]] = None,
+    **extra: Any,
+) -> str:
+    """Build the JSON blob stored as a bucket hash value."""
+    entry = {
+        "embedding": query_embedding,
+        "result": result,
+        "ts": time.time(),
+    }
+    if sse_frames:
+        entry["sse"] = sse_frames
+    entry.update(extra)
+    return json.dumps(entry)
+
+
 async def store_result(
-    bucket_key: str, query_embedding: List[float], result: Any
+    bucket_key: str,
+    query_embedding: List[float],
+    result: Any,
+    sse_frames: Optional[List[str]] = None,
 ) -> None:
     """
     Store an embedding + result in the bucket hash, and refresh the TTL.
+    sse_frames, if given, is the result pre-serialized for streaming replay.
     """
     r = await get_redis()
     entry_id = str(uuid.uuid4())
-    entry = {
-        "embedding": query_embedding,
-        "result": result,
-        "ts": time.time(),
-    }
-    await r.hset(bucket_key, entry_id, json.dumps(entry))
+    await r.hset(bucket_key, entry_id, serialize_entry(query_embedding, result, sse_frames))
     await r.expire(bucket_key, CACHE_TTL_SECONDS)
     logger.info(f"CACHE STORE — bucket={bucket_key}, entry_id={entry_id}")
 
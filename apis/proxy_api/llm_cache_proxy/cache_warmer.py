@@ -0,0 +1,308 @@
+"""
+Warm the semantic response cache from the reviewed golden dataset.
+
+Streams approved golden Q&A pairs (closed questions with a final answer)
+from MongoDB or a JSONL export, embeds each batch's questions concurrently and
+bulk-loads them into the "response_cache:{state}:{crop}:{lang}" buckets
+with one Redis pipeline per batch. The golden answer is stored as the
+cached final response, pre-chunked for streaming replay like normal writes.
+
+Usage:
+  python cache_warmer.py --jsonl golden_export.jsonl
+  python cache_warmer.py --mongo-uri mongodb://localhost:27017 --database agriai
+
+JSONL lines look like:
+  {"question_id": "...", "question": "...", "answer": "...",
+   "state": "Punjab", "crop": "Wheat", "lang": "english"}
+("lang" and "question_id" are optional.)
+
+Resuming: entries are written under a deterministic field ("golden:<id>"),
+so re-loading a pair overwrites it instead of duplicating it, and the last
+loaded position is saved to --checkpoint after every batch. Re-running the
+same command continues from there; pass --restart to start over.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Optional, Tuple
+
+from config import CACHE_TTL_SECONDS, logger
+from cache_store import build_bucket_key, get_redis, close_redis, serialize_entry
+from embedding_client import get_embeddings, close_embedding_client
+from sse_stream import build_sse_frames
+
+DEFAULT_BATCH_SIZE = int(os.getenv("CACHE_WARM_BATCH_SIZE", "64"))
+DEFAULT_CHECKPOINT = os.getenv("CACHE_WARM_CHECKPOINT", ".cache_warm_checkpoint.json")
+
+
+@dataclass
+class GoldenPair:
+    question_id: str
+    question: str
+    answer: str
+    state: Optional[str]
+    crop: Optional[str]
+    lang: Optional[str] = None
+
+    @property
+    def entry_id(self) -> str:
+        return f"golden:{self.question_id}"
+
+
+@dataclass
+class WarmStats:
+    loaded: int = 0
+    skipped: int = 0
+    batches: int = 0
+    buckets: set = field(default_factory=set)
+    elapsed_s: float = 0.0
+
+
+# -------------------------------------------------------------------
+# Checkpoint
+# -------------------------------------------------------------------
+
+class Checkpoint:
+    """Last loaded position for one source, persisted as a small JSON file."""
+
+    def __init__(self, path: Optional[str], source: str):
+        self.path = path
+        self.source = source
+        self.position = None
+        self.loaded = 0
+
+    def load(self) -> "Checkpoint":
+        if not self.path or not os.path.exists(self.path):
+            return self
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("source") != self.source:
+            logger.info(f"[WARM] Checkpoint {self.path} is for another source — starting from the beginning")
+            return self
+        self.position = data.get("position")
+        self.loaded = data.get("loaded", 0)
+        return self
+
+    def save(self, position, loaded: int) -> None:
+        self.position = position
+        self.loaded = loaded
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"source": self.source, "position": position, "loaded": loaded}, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        self.position = None
+        self.loaded = 0
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# -------------------------------------------------------------------
+# Sources: async iterators of (position, GoldenPair)
+# -------------------------------------------------------------------
+
+def _text_id(question: str) -> str:
+    return hashlib.sha1(" ".join(question.lower().split()).encode("utf-8")).hexdigest()[:24]
+
+
+async def iter_jsonl_pairs(path: str, after_line: Optional[int] = None) -> AsyncIterator[Tuple[int, GoldenPair]]:
+    """Yield (line_number, pair) for each line after `after_line`."""
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if after_line is not None and line_no <= after_line:
+                continue
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                logger.error(f"[WARM] {path}:{line_no} is not valid JSON — skipping")
+                continue
+            question = (row.get("question") or "").strip()
+            yield line_no, GoldenPair(
+                question_id=str(row.get("question_id") or row.get("_id") or _text_id(question)),
+                question=question,
+                answer=(row.get("answer") or "").strip(),
+                state=row.get("state"),
+                crop=row.get("crop"),
+                lang=row.get("lang"),
+            )
+
+
+async def iter_mongo_pairs(
+    uri: str, database: str, after_id: Optional[str] = None
+) -> AsyncIterator[Tuple[str, GoldenPair]]:
+    """
+    Yield (question_id, pair) for closed questions that have a final answer,
+    in _id order, starting after `after_id`.
+    """
+    from bson import ObjectId
+    from pymongo import AsyncMongoClient
+
+    client = AsyncMongoClient(uri)
+    try:
+        match = {"status": "closed"}
+        if after_id:
+            match["_id"] = {"$gt": ObjectId(after_id)}
+        pipeline = [
+            {"$match": match},
+            {"$sort": {"_id": 1}},
+            {"$project": {"question": 1, "text": 1, "details": 1}},
+            {"$lookup": {
+                "from": "answers",
+                "let": {"qid": "$_id"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$questionId", "$$qid"]}, "isFinalAnswer": True}},
+                    {"$project": {"answer": 1}},
+                    {"$limit": 1},
+                ],
+                "as": "final_answer",
+            }},
+            {"$unwind": "$final_answer"},
+        ]
+        cursor = await client[database]["questions"].aggregate(pipeline)
+        async for doc in cursor:
+            details = doc.get("details") or {}
+            question_id = str(doc["_id"])
+            yield question_id, GoldenPair(
+                question_id=question_id,
+                question=(doc.get("question") or doc.get("text") or "").strip(),
+                answer=(doc["final_answer"].get("answer") or "").strip(),
+                state=details.get("state"),
+                crop=details.get("normalised_crop") or details.get("crop"),
+            )
+    finally:
+        await client.close()
+
+
+# -------------------------------------------------------------------
+# Loader
+# -------------------------------------------------------------------
+
+async def _load_batch(redis_client, batch: List[GoldenPair], default_lang: str, stats: WarmStats) -> None:
+    embeddings = await get_embeddings([p.question for p in batch])
+    pipe = redis_client.pipeline(transaction=False)
+    touched = set()
+    for pair, embedding in zip(batch, embeddings):
+        bucket_key = build_bucket_key(pair.state, pair.crop, pair.lang or default_lang)
+        pipe.hset(
+            bucket_key,
+            pair.entry_id,
+            serialize_entry(embedding, pair.answer, build_sse_frames(pair.answer), source="golden"),
+        )
+        touched.add(bucket_key)
+    for bucket_key in touched:
+        pipe.expire(bucket_key, CACHE_TTL_SECONDS)
+    await pipe.execute()
+    stats.buckets.update(touched)
+
+
+async def warm_cache(
+    pairs: AsyncIterator[Tuple[object, GoldenPair]],
+    checkpoint: Checkpoint,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    lang: str = "english",
+    limit: Optional[int] = None,
+    redis_client=None,
+) -> WarmStats:
+    """
+    Load pairs into the cache, one embedding request and one Redis pipeline
+    per batch. The checkpoint advances only after a batch is written, so an
+    interrupted run re-loads at most one batch on resume. `loaded` in the
+    returned stats counts across resumed runs.
+    """
+    redis_client = redis_client or await get_redis()
+    stats = WarmStats(loaded=checkpoint.loaded)
+    started = time.perf_counter()
+    batch: List[GoldenPair] = []
+    position = checkpoint.position
+    processed = 0
+
+    async def flush():
+        await _load_batch(redis_client, batch, lang, stats)
+        stats.loaded += len(batch)
+        stats.batches += 1
+        checkpoint.save(position, stats.loaded)
+        logger.info(f"[WARM] batch {stats.batches}: loaded={stats.loaded} position={position}")
+        batch.clear()
+
+    async for row_position, pair in pairs:
+        if limit is not None and processed >= limit:
+            break
+        processed += 1
+        position = row_position
+        if not pair.question or not pair.answer:
+            stats.skipped += 1
+            continue
+        batch.append(pair)
+        if len(batch) >= batch_size:
+            await flush()
+
+    if batch:
+        await flush()
+    elif position != checkpoint.position:
+        # trailing skipped rows still move the checkpoint forward
+        checkpoint.save(position, stats.loaded)
+
+    stats.elapsed_s = time.perf_counter() - started
+    return stats
+
+
+async def _main(args) -> None:
+    if args.jsonl:
+        source = f"jsonl:{os.path.abspath(args.jsonl)}"
+    else:
+        source = f"mongo:{args.mongo_uri}/{args.database}"
+
+    checkpoint = Checkpoint(args.checkpoint, source)
+    if args.restart:
+        checkpoint.clear()
+    else:
+        checkpoint.load()
+    if checkpoint.position is not None:
+        logger.info(f"[WARM] Resuming {source} after position={checkpoint.position} (loaded={checkpoint.loaded})")
+
+    if args.jsonl:
+        pairs = iter_jsonl_pairs(args.jsonl, checkpoint.position)
+    else:
+        pairs = iter_mongo_pairs(args.mongo_uri, args.database, checkpoint.position)
+
+    try:
+        stats = await warm_cache(
+            pairs, checkpoint, batch_size=args.batch_size, lang=args.lang, limit=args.limit,
+        )
+    finally:
+        await close_embedding_client()
+        await close_redis()
+
+    logger.info(
+        f"[WARM] Done: loaded={stats.loaded} skipped={stats.skipped} batches={stats.batches} "
+        f"buckets={len(stats.buckets)} in {stats.elapsed_s:.1f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm the LLM response cache from golden Q&A pairs")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--jsonl", help="Path to a JSONL export of golden pairs")
+    source.add_argument("--mongo-uri", help="MongoDB URI of the golden dataset")
+    parser.add_argument("--database", default=os.getenv("GOLDEN_MONGODB_DATABASE", "agriai"))
+    parser.add_argument("--lang", default="english", help="Language bucket for pairs without a 'lang'")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many source rows")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT)
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start over")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,22 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# LOG_LEVEL=DEBUG enables per-request payload logging (embedding previews etc.)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger("mcp-cache-proxy")
+logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
 
 # LLM endpoint (vLLM or existing proxy API)
 TARGET_URL = os.getenv("TARGET_URL")
 
 # Embedding API
 EMBEDDING_API_URL = os.getenv("EMBEDDING_API_URL", "http://100.100.108.43:6001/embed")
+EMBEDDING_TIMEOUT = float(os.getenv("EMBEDDING_TIMEOUT", "30.0"))
+# Recent query embeddings kept in-process, so the cache write after a tool
+# round trip reuses the vector computed for the cache lookup.
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "1024"))
 
 # Redis
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
@@ -23,6 +31,12 @@ REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 SIMILARITY_THRESHOLD = float(os.getenv("SIMILARITY_THRESHOLD", "0.92"))
 CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "86400"))
 
+# Streaming cache hits: cached answers are stored as pre-built SSE chunks of
+# ~CACHE_STREAM_CHUNK_CHARS characters, replayed with CACHE_STREAM_DELAY_MS
+# between chunks (0 sends them back-to-back).
+CACHE_STREAM_CHUNK_CHARS = int(os.getenv("CACHE_STREAM_CHUNK_CHARS", "48"))
+CACHE_STREAM_DELAY_MS = float(os.getenv("CACHE_STREAM_DELAY_MS", "0"))
+
 # Language detection
 LANG_DETECTION_MODEL_URL = os.getenv("LANG_DETECTION_MODEL_URL", "http://100.100.108.43:8013/v1/chat/completions")
 LANG_DETECTION_MODEL_NAME = os.getenv("LANG_DETECTION_MODEL_NAME", "google/gemma-3-12b-it")
@@ -1,43 +1,126 @@
 """
 Async client to get embeddings from the hosted embedding API.
+
+A single pooled httpx client is reused for all calls, and the most recent
+query embeddings are kept in a small in-process LRU. The cache lookup (on
+the tool_call turn) and the cache write (on the following final-answer turn)
+embed the same query text, so the write reuses the lookup's vector instead
+of calling the embedding API again.
 """
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import List, Optional
+
 import httpx
-from typing import List
 
-from config import EMBEDDING_API_URL, logger
+from config import EMBEDDING_API_URL, EMBEDDING_CACHE_SIZE, EMBEDDING_TIMEOUT, logger
 
+_client: Optional[httpx.AsyncClient] = None
+_recent: "OrderedDict[str, List[float]]" = OrderedDict()
+_stats = {"calls": 0, "lru_hits": 0}
 
-async def get_embedding(text: str) -> List[float]:
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(timeout=httpx.Timeout(EMBEDDING_TIMEOUT))
+    return _client
+
+
+def _cache_key(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+def remember_embedding(text: str, embedding: List[float]) -> None:
+    """Record an embedding for `text` in the LRU (no-op when the LRU is disabled)."""
+    if EMBEDDING_CACHE_SIZE <= 0:
+        return
+    key = _cache_key(text)
+    _recent[key] = embedding
+    _recent.move_to_end(key)
+    while len(_recent) > EMBEDDING_CACHE_SIZE:
+        _recent.popitem(last=False)
+
+
+def recent_embedding(text: str) -> Optional[List[float]]:
+    """Return the remembered embedding for `text`, if any."""
+    key = _cache_key(text)
+    embedding = _recent.get(key)
+    if embedding is not None:
+        _recent.move_to_end(key)
+    return embedding
+
+
+async def _request_embedding(text: str) -> List[float]:
     """
-    Call the embedding API and return the embedding vector.
-    
     POST http://<host>:6001/embed
     Body: {"text": "..."}
     Response: {"embedding": [float, ...]}
     """
+    _stats["calls"] += 1
+    logger.debug(f"[EMBED] Calling {EMBEDDING_API_URL} with text='{text[:60]}'")
+    response = await _get_client().post(
+        EMBEDDING_API_URL,
+        json={"text": text},
+    )
+    response.raise_for_status()
+    data = response.json()
+
+    if "embedding" not in data:
+        logger.error(f"[EMBED] Missing 'embedding' key! Available keys: {list(data.keys())}")
+        raise ValueError(f"Unexpected response format: keys={list(data.keys())}")
+
+    embedding = data["embedding"]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[EMBED] Success: dim={len(embedding)}, first_3={embedding[:3]}")
+    return embedding
+
+
+async def get_embedding(text: str) -> List[float]:
+    """Call the embedding API and return the embedding vector (LRU first)."""
+    cached = recent_embedding(text)
+    if cached is not None:
+        _stats["lru_hits"] += 1
+        logger.debug(f"[EMBED] LRU hit for text='{text[:60]}'")
+        return cached
+
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            logger.info(f"[EMBED] Calling {EMBEDDING_API_URL} with text='{text[:60]}'")
-            response = await client.post(
-                EMBEDDING_API_URL,
-                json={"text": text},
-            )
-            logger.info(f"[EMBED] Response status={response.status_code}, content-type={response.headers.get('content-type', '?')}")
-            response.raise_for_status()
-            
-            raw_body = response.text
-            logger.info(f"[EMBED] Raw response body (first 300 chars): {raw_body[:300]}")
-            
-            data = response.json()
-            logger.info(f"[EMBED] Parsed JSON keys: {list(data.keys())}")
-            
-            if "embedding" not in data:
-                logger.error(f"[EMBED] Missing 'embedding' key! Available keys: {list(data.keys())}")
-                raise ValueError(f"Unexpected response format: keys={list(data.keys())}")
-            
-            embedding = data["embedding"]
-            logger.info(f"[EMBED] Success: dim={len(embedding)}, first_3={embedding[:3]}")
-            return embedding
+        embedding = await _request_embedding(text)
     except Exception as e:
         logger.error(f"[EMBED] FAILED — type={type(e).__name__}, error='{e}'")
         raise
+    remember_embedding(text, embedding)
+    return embedding
+
+
+async def get_embeddings(texts: List[str], concurrency: int = 8) -> List[List[float]]:
+    """
+    Embed many texts over the pooled client, `concurrency` requests at a time.
+
+    The embedding API takes one text per request. Batch vectors skip the
+    query LRU so warm-up jobs do not evict live lookups. Any failed text
+    fails the whole call.
+    """
+    if not texts:
+        return []
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _one(text: str) -> List[float]:
+        async with semaphore:
+            return await _request_embedding(text)
+
+    results = await asyncio.gather(*(_one(t) for t in texts), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.error(f"[EMBED] Batch FAILED — type={type(result).__name__}, error='{result}'")
+            raise result
+    return results
+
+
+async def close_embedding_client() -> None:
+    """Close the pooled HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
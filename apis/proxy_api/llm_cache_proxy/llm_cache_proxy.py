@@ -29,13 +29,14 @@ from fastapi import FastAPI, Request
 from fastapi.responses import Response, StreamingResponse
 
 from config import logger, TARGET_URL, PORT, TIMEOUT
-from embedding_client import get_embedding
+from embedding_client import get_embedding, close_embedding_client
 from cache_store import (
     build_bucket_key,
-    get_cached_result,
+    get_cached_entry,
     store_result,
     close_redis,
 )
+from sse_stream import build_sse_frames, replay_sse_frames
 from language_utils import get_user_query_language
 
 CACHEABLE_TOOL_PREFIXES = (
@@ -59,6 +60,7 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("Cache Proxy shutting down")
     await close_redis()
+    await close_embedding_client()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -174,9 +176,11 @@ async def _maybe_cache_final_response(messages: list, final_text: str, lang: Opt
     query, state, crop = params
     try:
         logger.info(f"[CACHE_WRITE] STORING: query='{query[:60]}', state={state}, crop={crop}, lang={lang}, response_len={len(final_text)}")
+        # Same query text as the tool_call lookup turn, so this is normally
+        # served from embedding_client's LRU rather than a second API call.
         embedding = await get_embedding(query)
         bucket_key = build_bucket_key(state, crop, lang)
-        await store_result(bucket_key, embedding, final_text)
+        await store_result(bucket_key, embedding, final_text, build_sse_frames(final_text))
         logger.info(f"[CACHE_WRITE] SUCCESS — stored in bucket={bucket_key}")
     except Exception as e:
         logger.error(f"[CACHE_WRITE] FAILED: {e}")
@@ -190,7 +194,7 @@ async def try_resolve_from_cache(tool_calls: list, lang: Optional[str] = "englis
     """
     Check if any cacheable tool_call has a cache hit.
     Non-cacheable tools are skipped (not treated as a miss).
-    Returns (cached_text, similarity_score) on hit, None on miss.
+    Returns (cached_text, similarity_score, sse_frames) on hit, None on miss.
     Language is included in the cache key to avoid cross-language hits.
     """
     if not lang:
@@ -234,15 +238,18 @@ async def try_resolve_from_cache(tool_calls: list, lang: Optional[str] = "englis
             return None
 
         bucket_key = build_bucket_key(args.get("state"), args.get("crop"), lang)
-        cached = await get_cached_result(bucket_key, embedding)
+        cached = await get_cached_entry(bucket_key, embedding)
 
         if cached is None:
             logger.info(f"[CACHE_READ] MISS — no match in bucket={bucket_key}")
             return None
 
-        cached_text, score = cached
+        entry, score = cached
+        cached_text = entry["result"]
+        # Entries written before frames were stored get framed on the fly
+        sse_frames = entry.get("sse") or build_sse_frames(cached_text)
         logger.info(f"[CACHE_READ] HIT! similarity={score:.4f}, cached_response_len={len(cached_text)}")
-        return cached_text, score
+        return cached_text, score, sse_frames
 
     return None
 
@@ -383,7 +390,7 @@ async def _handle_non_streaming(upstream, parsed, request, path, lang: Optional[
             logger.info(f"[NON_STREAM] LLM wants tool calls — checking cache (lang={lang})")
             cached = await try_resolve_from_cache(tool_calls, lang)
             if cached is not None:
-                cached_text, score = cached
+                cached_text, score, _ = cached
                 logger.info(f"[NON_STREAM] Returning CACHED response (sim={score:.4f}, lang={lang})")
                 return _build_non_streaming_response(cached_text)
             else:
@@ -454,36 +461,18 @@ async def _handle_streaming(upstream, parsed, request, path, lang: Optional[str]
         if tool_calls:
             cached = await try_resolve_from_cache(tool_calls, lang)
             if cached is not None:
-                cached_text, score = cached
+                cached_text, score, sse_frames = cached
                 logger.info(f"[STREAM] CACHE HIT! Returning cached response "
-                             f"(sim={score:.4f}, len={len(cached_text)}, lang={lang})")
-
-                # Return synthetic SSE stream with cached response
-                async def cached_stream():
-                    completion_id = f"chatcmpl-cache-{uuid.uuid4().hex[:12]}"
-                    created = int(time.time())
-
-                    chunk1 = {"id": completion_id, "object": "chat.completion.chunk",
-                              "created": created, "model": "cache-proxy",
-                              "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""},
-                                           "finish_reason": None}]}
-                    yield f"data: {json.dumps(chunk1)}\n\n".encode("utf-8")
-
-                    chunk2 = {"id": completion_id, "object": "chat.completion.chunk",
-                              "created": created, "model": "cache-proxy",
-                              "choices": [{"index": 0, "delta": {"content": cached_text},
-                                           "finish_reason": None}]}
-                    yield f"data: {json.dumps(chunk2)}\n\n".encode("utf-8")
-
-                    chunk3 = {"id": completion_id, "object": "chat.completion.chunk",
-                              "created": created, "model": "cache-proxy",
-                              "choices": [{"index": 0, "delta": {},
-                                           "finish_reason": "stop"}]}
-                    yield f"data: {json.dumps(chunk3)}\n\n".encode("utf-8")
-                    yield b"data: [DONE]\n\n"
-
-                return StreamingResponse(cached_stream(), status_code=200,
-                                         media_type="text/event-stream")
+                             f"(sim={score:.4f}, len={len(cached_text)}, "
+                             f"chunks={len(sse_frames)}, lang={lang})")
+
+                # Replay the stored SSE frames; first frame is sent immediately
+                return StreamingResponse(
+                    replay_sse_frames(sse_frames),
+                    status_code=200,
+                    media_type="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+                )
             else:
                 logger.info("[STREAM] CACHE MISS — replaying buffered tool_call lines to client")
         else:
@@ -0,0 +1,130 @@
+"""
+OpenAI-compatible SSE framing for cached final responses.
+
+Cached answers are split into chat.completion.chunk frames once, at cache
+write time, and stored alongside the plain text. The stored frames hold
+placeholders for the completion id and "created" timestamp; a streaming cache
+hit stamps a fresh pair into each frame while replaying it instead of
+re-serializing the response:
+
+  frame 0:    delta {"role": "assistant", "content": ""}   (sent immediately)
+  frame 1..n: delta {"content": "<piece>"}                 (optionally paced)
+  frame n+1:  delta {}, finish_reason "stop"
+  data: [DONE]
+"""
+import asyncio
+import json
+import time
+import uuid
+from typing import AsyncIterator, List, Optional
+
+from config import CACHE_STREAM_CHUNK_CHARS, CACHE_STREAM_DELAY_MS
+
+SSE_DONE = "data: [DONE]\n\n"
+
+# Placeholders in stored frames, filled per response by stamp_sse_frames
+_ID_SLOT = "__cache_completion_id__"
+_CREATED_SLOT = "__cache_created__"
+_TEMPLATE_PREFIX = f'data: {{"id": "{_ID_SLOT}", '
+
+
+def split_text(text: str, chunk_chars: int = CACHE_STREAM_CHUNK_CHARS) -> List[str]:
+    """
+    Split text into pieces of roughly chunk_chars, breaking after whitespace
+    where possible. Joining the pieces gives back the original text.
+    """
+    if not text:
+        return []
+    if chunk_chars <= 0 or len(text) <= chunk_chars:
+        return [text]
+
+    pieces = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_chars, len(text))
+        if end < len(text):
+            # prefer to end the piece right after the last whitespace in the window
+            cut = max(text.rfind(" ", start, end), text.rfind("\n", start, end))
+            if cut > start:
+                end = cut + 1
+        pieces.append(text[start:end])
+        start = end
+    return pieces
+
+
+def _frame(completion_id: str, created, delta: dict, finish_reason: Optional[str] = None) -> str:
+    chunk = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": "cache-proxy",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(chunk)}\n\n"
+
+
+def new_completion_id() -> str:
+    return f"chatcmpl-cache-{uuid.uuid4().hex[:12]}"
+
+
+def build_sse_frames(
+    text: str,
+    chunk_chars: int = CACHE_STREAM_CHUNK_CHARS,
+    completion_id: Optional[str] = None,
+    created: Optional[int] = None,
+) -> List[str]:
+    """
+    Serialize text into the full list of SSE frames, including the [DONE]
+    terminator. Without completion_id / created the frames are templates for
+    storage; stamp_sse_frames (or replay_sse_frames) fills them in.
+    """
+    completion_id = completion_id or _ID_SLOT
+    created = created if created is not None else _CREATED_SLOT
+
+    frames = [_frame(completion_id, created, {"role": "assistant", "content": ""})]
+    for piece in split_text(text, chunk_chars):
+        frames.append(_frame(completion_id, created, {"content": piece}))
+    frames.append(_frame(completion_id, created, {}, finish_reason="stop"))
+    frames.append(SSE_DONE)
+    return frames
+
+
+def _stamp(frame: str, completion_id: str, created: int) -> str:
+    # Only the chunk header is templated; frames stored already stamped pass through.
+    if not frame.startswith(_TEMPLATE_PREFIX):
+        return frame
+    return frame.replace(_ID_SLOT, completion_id, 1).replace(f'"{_CREATED_SLOT}"', str(created), 1)
+
+
+def stamp_sse_frames(
+    frames: List[str],
+    completion_id: Optional[str] = None,
+    created: Optional[int] = None,
+) -> List[str]:
+    """Fill the id / timestamp placeholders (a new id and the current time by default)."""
+    completion_id = completion_id or new_completion_id()
+    created = created if created is not None else int(time.time())
+    return [_stamp(frame, completion_id, created) for frame in frames]
+
+
+async def replay_sse_frames(
+    frames: List[str],
+    delay_ms: Optional[float] = None,
+    completion_id: Optional[str] = None,
+    created: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Yield stored frames as bytes, stamped with a fresh completion id and
+    "created" time per replay. The first frame goes out without delay so
+    the client gets its first byte immediately; content frames after it are
+    spaced by delay_ms (default CACHE_STREAM_DELAY_MS; 0 disables pacing).
+    """
+    if delay_ms is None:
+        delay_ms = CACHE_STREAM_DELAY_MS
+    delay_s = max(delay_ms, 0) / 1000.0
+    completion_id = completion_id or new_completion_id()
+    created = created if created is not None else int(time.time())
+    for i, frame in enumerate(frames):
+        if i > 1 and delay_s and frame != SSE_DONE:
+            await asyncio.sleep(delay_s)
+        yield _stamp(frame, completion_id, created).encode("utf-8")
@@ -0,0 +1,176 @@
+"""Cache warming from golden pairs: concurrent per-batch embeds, pipelined loads, resumable checkpoints."""
+
+import json
+import os
+import time
+
+import fakeredis.aioredis
+import httpx
+import pytest
+
+import cache_store
+import embedding_client
+from cache_warmer import Checkpoint, iter_jsonl_pairs, warm_cache
+from llm_cache_proxy import try_resolve_from_cache
+
+ROWS = [
+    {"question_id": f"q{i}", "question": f"wheat rust question {i}", "answer": f"answer {i}",
+     "state": "Punjab", "crop": "Wheat"}
+    for i in range(7)
+] + [
+    {"question_id": "r1", "question": "rice blast control", "answer": "tricyclazole",
+     "state": "Bihar", "crop": "Rice", "lang": "hindi"},
+    {"question_id": "empty", "question": "no answer yet", "answer": ""},
+]
+
+
+def _vector(text: str) -> list:
+    return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+
+class _Embedder:
+    """Fake embedding API with the real contract: one {"text"} per request.
+
+    Goes down from request `fail_on_call` on.
+    """
+
+    def __init__(self, fail_on_call=None):
+        self.texts = []
+        self.fail_on_call = fail_on_call
+        self.down = False
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if set(body) != {"text"}:
+            return httpx.Response(422, json={"detail": "field 'text' required"})
+        self.texts.append(body["text"])
+        self.down = self.down or self.fail_on_call == len(self.texts)
+        if self.down:
+            return httpx.Response(503, json={"error": "down"})
+        return httpx.Response(200, json={"embedding": _vector(body["text"])})
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(cache_store, "_redis_pool", client)
+    monkeypatch.setattr(embedding_client, "_recent", embedding_client.OrderedDict())
+    return client
+
+
+def _use_embedder(monkeypatch, embedder):
+    monkeypatch.setattr(
+        embedding_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(embedder))
+    )
+
+
+@pytest.fixture
+def export(tmp_path):
+    path = tmp_path / "golden.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in ROWS) + "\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_jsonl_warm_loads_buckets_in_batches(redis_client, export, tmp_path, monkeypatch):
+    embedder = _Embedder()
+    _use_embedder(monkeypatch, embedder)
+    checkpoint = Checkpoint(str(tmp_path / "ckpt.json"), "jsonl:test")
+
+    stats = await warm_cache(iter_jsonl_pairs(export), checkpoint, batch_size=3)
+
+    assert stats.loaded == 8
+    assert stats.skipped == 1
+    assert sorted(embedder.texts) == sorted(r["question"] for r in ROWS if r["answer"])
+    assert not embedding_client._recent  # warm-up vectors stay out of the query LRU
+    wheat = cache_store.build_bucket_key("Punjab", "Wheat", "english")
+    rice = cache_store.build_bucket_key("Bihar", "Rice", "hindi")
+    assert stats.buckets == {wheat, rice}
+    assert await redis_client.hlen(wheat) == 7
+    assert 0 < await redis_client.ttl(wheat) <= cache_store.CACHE_TTL_SECONDS
+
+    entry = json.loads(await redis_client.hget(rice, "golden:r1"))
+    assert entry["result"] == "tricyclazole"
+    assert entry["source"] == "golden"
+    assert entry["sse"][-1] == "data: [DONE]\n\n"
+    assert json.load(open(checkpoint.path)) == {"source": "jsonl:test", "position": 9, "loaded": 8}
+
+
+@pytest.mark.asyncio
+async def test_warmed_entry_is_served_by_proxy_lookup(redis_client, export, monkeypatch):
+    _use_embedder(monkeypatch, _Embedder())
+    await warm_cache(iter_jsonl_pairs(export), Checkpoint(None, "jsonl:test"), batch_size=4)
+
+    tool_call = {
+        "id": "call_1",
+        "type": "function",
+        "function": {
+            "name": "get_context_from_reviewer_dataset",
+            "arguments": json.dumps({"query": "wheat rust question 3", "state": "punjab", "crop": "WHEAT"}),
+        },
+    }
+    cached_text, score, frames = await try_resolve_from_cache([tool_call])
+    assert cached_text == "answer 3"
+    assert score == pytest.approx(1.0)
+    assert frames[-1] == "data: [DONE]\n\n"
+
+
+@pytest.mark.asyncio
+async def test_interrupted_warm_resumes_from_checkpoint(redis_client, export, tmp_path, monkeypatch):
+    path = str(tmp_path / "ckpt.json")
+    _use_embedder(monkeypatch, _Embedder(fail_on_call=4))  # first request of batch 2
+    with pytest.raises(httpx.HTTPStatusError):
+        await warm_cache(iter_jsonl_pairs(export), Checkpoint(path, "jsonl:test").load(), batch_size=3)
+
+    checkpoint = Checkpoint(path, "jsonl:test").load()
+    assert (checkpoint.position, checkpoint.loaded) == (3, 3)
+
+    embedder = _Embedder()
+    _use_embedder(monkeypatch, embedder)
+    stats = await warm_cache(
+        iter_jsonl_pairs(export, checkpoint.position), checkpoint, batch_size=3
+    )
+    assert stats.loaded == 8
+    assert set(embedder.texts[:3]) == {f"wheat rust question {i}" for i in (3, 4, 5)}
+    assert len(embedder.texts) == 5
+
+    # a full re-run overwrites the same fields instead of duplicating them
+    await warm_cache(iter_jsonl_pairs(export), Checkpoint(None, "jsonl:test"), batch_size=3)
+    assert await redis_client.hlen(cache_store.build_bucket_key("Punjab", "Wheat", "english")) == 7
+
+
+def test_checkpoint_for_other_source_is_ignored(tmp_path):
+    path = str(tmp_path / "ckpt.json")
+    Checkpoint(path, "jsonl:a").save(5, 5)
+    assert Checkpoint(path, "jsonl:b").load().position is None
+    assert Checkpoint(path, "jsonl:a").load().position == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run")
+async def test_benchmark_pipelined_warm_vs_per_entry_store(redis_client, tmp_path, monkeypatch):
+    _use_embedder(monkeypatch, _Embedder())
+    rows = [
+        {"question_id": f"b{i}", "question": f"question {i}", "answer": "a" * 400,
+         "state": f"state{i % 20}", "crop": f"crop{i % 15}"}
+        for i in range(3000)
+    ]
+    path = tmp_path / "bench.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in rows), encoding="utf-8")
+
+    started = time.perf_counter()
+    for row in rows:
+        embedding = await embedding_client.get_embedding(row["question"])
+        await cache_store.store_result(
+            cache_store.build_bucket_key(row["state"], row["crop"], "english"), embedding, row["answer"]
+        )
+    per_entry_s = time.perf_counter() - started
+    await redis_client.flushall()
+
+    stats = await warm_cache(iter_jsonl_pairs(str(path)), Checkpoint(None, "bench"), batch_size=128)
+    print(
+        f"\nwarm 3000 pairs: per-entry store_result={per_entry_s * 1e3:.0f}ms "
+        f"pipelined batches={stats.elapsed_s * 1e3:.0f}ms"
+    )
+    assert stats.loaded == 3000
+    assert stats.elapsed_s < per_entry_s
@@ -0,0 +1,206 @@
+"""Streaming cache hits replay pre-built SSE frames, paced, with an immediate first byte."""
+
+import json
+import socket
+import threading
+import time
+
+import fakeredis.aioredis
+import httpx
+import pytest
+import uvicorn
+
+import cache_store
+import embedding_client
+import llm_cache_proxy
+import sse_stream
+from sse_stream import SSE_DONE, build_sse_frames, split_text, stamp_sse_frames
+
+TOOL = "get_context_from_reviewer_dataset"
+ARGS = {"query": "How to control wheat rust?", "state": "Punjab", "crop": "Wheat"}
+ANSWER = (
+    "Spray propiconazole 25 EC at 0.1 percent as soon as rust pustules appear. "
+    "Repeat after fifteen days if the infection persists, and grow resistant "
+    "varieties next season."
+)
+
+
+def _tool_call_stream() -> bytes:
+    chunk = {
+        "id": "chatcmpl-upstream",
+        "object": "chat.completion.chunk",
+        "choices": [{
+            "index": 0,
+            "delta": {"tool_calls": [{
+                "index": 0,
+                "id": "call_1",
+                "type": "function",
+                "function": {"name": TOOL, "arguments": json.dumps(ARGS)},
+            }]},
+            "finish_reason": None,
+        }],
+    }
+    return f"data: {json.dumps(chunk)}\n\n{SSE_DONE}".encode("utf-8")
+
+
+def _parse_events(raw: str) -> list:
+    assert raw.endswith("\n\n")
+    events = raw[:-2].split("\n\n")
+    assert all(e.startswith("data: ") and "\n" not in e for e in events)
+    return [e[len("data: "):] for e in events]
+
+
+def test_split_text_round_trips_and_breaks_on_whitespace():
+    pieces = split_text(ANSWER, 40)
+    assert "".join(pieces) == ANSWER
+    assert all(len(p) <= 40 for p in pieces)
+    assert all(p.endswith(" ") for p in pieces[:-1])
+    assert split_text("x" * 100, 40) == ["x" * 40, "x" * 40, "x" * 20]
+    assert split_text("", 40) == []
+
+
+def test_frames_are_openai_chunks():
+    frames = build_sse_frames(ANSWER, chunk_chars=40, completion_id="chatcmpl-cache-abc", created=1)
+    payloads = [json.loads(f[len("data: "):]) for f in frames[:-1]]
+    assert frames[-1] == SSE_DONE
+    assert payloads[0]["choices"][0]["delta"] == {"role": "assistant", "content": ""}
+    assert payloads[-1]["choices"][0] == {"index": 0, "delta": {}, "finish_reason": "stop"}
+    assert "".join(p["choices"][0]["delta"].get("content", "") for p in payloads) == ANSWER
+    assert {p["id"] for p in payloads} == {"chatcmpl-cache-abc"}
+    assert all(p["object"] == "chat.completion.chunk" for p in payloads)
+
+
+def test_stored_frames_are_stamped_per_response():
+    stored = build_sse_frames(ANSWER, chunk_chars=40)
+    first = stamp_sse_frames(stored, created=100)
+    second = stamp_sse_frames(stored, created=200)
+    ids = [{json.loads(f[len("data: "):])["id"] for f in frames[:-1]} for frames in (first, second)]
+    assert len(ids[0]) == len(ids[1]) == 1 and ids[0] != ids[1]
+    first_id = ids[0].pop()
+    assert first_id.startswith("chatcmpl-cache-")
+    assert {json.loads(f[len("data: "):])["created"] for f in second[:-1]} == {200}
+    assert first == build_sse_frames(ANSWER, chunk_chars=40, completion_id=first_id, created=100)
+
+    # frames stored before templating, and content quoting the placeholder, are left alone
+    legacy = build_sse_frames(ANSWER, completion_id="chatcmpl-cache-old", created=1)
+    assert stamp_sse_frames(legacy) == legacy
+    quoted = stamp_sse_frames(build_sse_frames('say "__cache_created__"'), "chatcmpl-cache-x", 5)
+    assert json.loads(quoted[1][len("data: "):])["choices"][0]["delta"]["content"] == 'say "__cache_created__"'
+
+
+@pytest.mark.asyncio
+async def test_cache_write_stores_frames(monkeypatch):
+    def embed(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"embedding": [1.0, 0.0, 0.5]})
+
+    monkeypatch.setattr(embedding_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(embed)))
+    monkeypatch.setattr(embedding_client, "_recent", embedding_client.OrderedDict())
+    monkeypatch.setattr(cache_store, "_redis_pool", fakeredis.aioredis.FakeRedis(decode_responses=True))
+
+    tc = {"id": "call_1", "type": "function", "function": {"name": TOOL, "arguments": json.dumps(ARGS)}}
+    messages = [
+        {"role": "user", "content": ARGS["query"]},
+        {"role": "assistant", "content": None, "tool_calls": [tc]},
+        {"role": "tool", "tool_call_id": "call_1", "content": "context"},
+    ]
+    await llm_cache_proxy._maybe_cache_final_response(messages, ANSWER)
+
+    cached_text, _, frames = await llm_cache_proxy.try_resolve_from_cache([tc])
+    assert cached_text == ANSWER
+    assert frames[-1] == SSE_DONE
+    assert len(frames) > 4
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def proxy_server(monkeypatch):
+    """Run the proxy under uvicorn with a fake upstream LLM and a canned cache hit."""
+    frames = build_sse_frames(ANSWER, chunk_chars=24)
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=_tool_call_stream(), headers={"content-type": "text/event-stream"}
+        )
+
+    async def fake_resolve(tool_calls, lang="english"):
+        return ANSWER, 0.99, frames
+
+    async def fake_language(messages):
+        return "english"
+
+    monkeypatch.setattr(llm_cache_proxy, "TARGET_URL", "http://upstream.test/v1")
+    monkeypatch.setattr(llm_cache_proxy, "http_client", httpx.AsyncClient(transport=httpx.MockTransport(upstream)))
+    monkeypatch.setattr(llm_cache_proxy, "try_resolve_from_cache", fake_resolve)
+    monkeypatch.setattr(llm_cache_proxy, "get_user_query_language", fake_language)
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(llm_cache_proxy.app, port=port, log_level="warning", lifespan="off"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{port}", frames
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+def _stream_hit(base_url: str):
+    body = {"stream": True, "messages": [{"role": "user", "content": ARGS["query"]}]}
+    received = []
+    started = time.perf_counter()
+    with httpx.Client(timeout=10) as client:
+        with client.stream("POST", f"{base_url}/v1/chat/completions", json=body) as resp:
+            assert resp.status_code == 200
+            assert resp.headers["content-type"].startswith("text/event-stream")
+            for chunk in resp.iter_raw():
+                received.append((time.perf_counter() - started, chunk.decode("utf-8")))
+    return received
+
+
+def _stamped_as(raw: str, frames: list) -> str:
+    first = json.loads(_parse_events(raw)[0])
+    return "".join(stamp_sse_frames(frames, first["id"], first["created"]))
+
+
+def test_paced_replay_framing_and_first_byte(proxy_server, monkeypatch):
+    base_url, frames = proxy_server
+    delay_ms = 40
+    monkeypatch.setattr(sse_stream, "CACHE_STREAM_DELAY_MS", delay_ms)
+
+    received = _stream_hit(base_url)
+    raw = "".join(chunk for _, chunk in received)
+    assert raw == _stamped_as(raw, frames)
+
+    events = _parse_events(raw)
+    assert events[-1] == "[DONE]"
+    text = "".join(
+        json.loads(e)["choices"][0]["delta"].get("content", "") for e in events[:-1]
+    )
+    assert text == ANSWER
+
+    # first byte arrives well before the paced stream finishes
+    paced_total_s = (len(frames) - 3) * delay_ms / 1000
+    first_byte_s, last_byte_s = received[0][0], received[-1][0]
+    assert len(received) > 1
+    assert first_byte_s < paced_total_s / 2
+    assert last_byte_s - first_byte_s >= paced_total_s * 0.8
+
+
+def test_unpaced_replay_is_immediate(proxy_server):
+    base_url, frames = proxy_server
+    started = int(time.time())
+    received = _stream_hit(base_url)
+    raw = "".join(chunk for _, chunk in received)
+    assert raw == _stamped_as(raw, frames)
+    assert received[-1][0] < 1.0
+
+    # each hit on the same entry gets its own id and a current timestamp
+    again = "".join(chunk for _, chunk in _stream_hit(base_url))
+    first, second = (json.loads(_parse_events(r)[0]) for r in (raw, again))
+    assert first["id"] != second["id"]
+    assert first["created"] >= started
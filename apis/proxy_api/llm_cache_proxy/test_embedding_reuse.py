@@ -0,0 +1,73 @@
+"""A cache lookup miss followed by the cache write embeds the query only once."""
+
+import json
+
+import fakeredis.aioredis
+import httpx
+import pytest
+
+import cache_store
+import embedding_client
+from llm_cache_proxy import _maybe_cache_final_response, try_resolve_from_cache
+
+TOOL = "get_context_from_reviewer_dataset"
+ARGS = {"query": "How to control wheat rust?", "state": "Punjab", "crop": "Wheat"}
+
+
+@pytest.fixture
+def embed_calls(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(json.loads(request.content)["text"])
+        return httpx.Response(200, json={"embedding": [1.0, 0.5, 0.25]})
+
+    monkeypatch.setattr(
+        embedding_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(embedding_client, "_recent", embedding_client.OrderedDict())
+    monkeypatch.setattr(cache_store, "_redis_pool", fakeredis.aioredis.FakeRedis(decode_responses=True))
+    return calls
+
+
+def _tool_call(args=ARGS):
+    return {"id": "call_1", "type": "function", "function": {"name": TOOL, "arguments": json.dumps(args)}}
+
+
+def _messages_after_tool(args=ARGS):
+    return [
+        {"role": "user", "content": args["query"]},
+        {"role": "assistant", "content": None, "tool_calls": [_tool_call(args)]},
+        {"role": "tool", "tool_call_id": "call_1", "content": "context"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_lookup_miss_then_write_embeds_once(embed_calls):
+    assert await try_resolve_from_cache([_tool_call()]) is None
+    await _maybe_cache_final_response(_messages_after_tool(), "Spray propiconazole.")
+
+    assert embed_calls == [ARGS["query"]]
+    r = await cache_store.get_redis()
+    assert await r.hlen(cache_store.build_bucket_key("Punjab", "Wheat", "english")) == 1
+
+    hit = await try_resolve_from_cache([_tool_call()])
+    assert hit is not None and hit[0] == "Spray propiconazole."
+    assert len(embed_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_distinct_queries_are_embedded_separately(embed_calls):
+    other = {**ARGS, "query": "Best sowing time for mustard"}
+    await try_resolve_from_cache([_tool_call()])
+    await _maybe_cache_final_response(_messages_after_tool(other), "Mid October.")
+    assert embed_calls == [ARGS["query"], other["query"]]
+
+
+@pytest.mark.asyncio
+async def test_lru_is_bounded(embed_calls, monkeypatch):
+    monkeypatch.setattr(embedding_client, "EMBEDDING_CACHE_SIZE", 2)
+    for text in ("a", "b", "c", "a"):
+        await embedding_client.get_embedding(text)
+    assert embed_calls == ["a", "b", "c", "a"]
+    assert list(embedding_client._recent) == ["c", "a"]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
 import sys
@@ -11,7 +10,7 @@ from dotenv import load_dotenv
 from fastapi import Body, FastAPI, Query
 from pydantic import BaseModel, Field
 
-from common import get_service
+from common import get_async_service
 
 load_dotenv()
 
@@ -48,8 +47,7 @@ class ImdWeatherRequest(BaseModel):
 
 
 async def _imd_weather(latitude: float, longitude: float, data_type: str):
-    svc = get_service()
-    return await asyncio.to_thread(svc.fetch_by_type, latitude, longitude, data_type)
+    return await get_async_service().fetch_by_type(latitude, longitude, data_type)
 
 
 @app.get("/health", tags=["meta"])
@@ -1,10 +1,11 @@
-"""Shared LatLonWeatherService singleton for API and MCP."""
+"""Shared LatLonWeatherService singletons for API and MCP."""
 
 from __future__ import annotations
 
-from service import LatLonWeatherService
+from service import AsyncLatLonWeatherService, LatLonWeatherService
 
 _service: LatLonWeatherService | None = None
+_async_service: AsyncLatLonWeatherService | None = None
 
 
 def get_service() -> LatLonWeatherService:
@@ -12,3 +13,10 @@ def get_service() -> LatLonWeatherService:
     if _service is None:
         _service = LatLonWeatherService()
     return _service
+
+
+def get_async_service() -> AsyncLatLonWeatherService:
+    global _async_service
+    if _async_service is None:
+        _async_service = AsyncLatLonWeatherService()
+    return _async_service
@@ -0,0 +1,192 @@
+# mcp_containers/imd_weather/lookup_index.py
+# Load-time indexes for nearest-station and district-name lookups.
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from difflib import get_close_matches
+from typing import Any, Callable, Hashable
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # pure-Python KD-tree below
+    cKDTree = None
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # plain difflib over the pooled names
+    fuzz = process = None
+
+
+def _unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    # Chord length between unit vectors grows monotonically with great-circle
+    # distance, so the Euclidean nearest neighbour is the haversine nearest.
+    p, l = math.radians(lat), math.radians(lon)
+    return (math.cos(p) * math.cos(l), math.cos(p) * math.sin(l), math.sin(p))
+
+
+class _KDTree:
+    """Minimal 3-d KD-tree; ties go to the lowest point index (like a linear scan)."""
+
+    def __init__(self, points: list[tuple[float, float, float]]):
+        self._points = points
+        self._root = self._build(list(range(len(points))), 0)
+
+    def _build(self, idx: list[int], depth: int):
+        if not idx:
+            return None
+        axis = depth % 3
+        idx.sort(key=lambda i: self._points[i][axis])
+        mid = len(idx) // 2
+        return (
+            idx[mid],
+            axis,
+            self._build(idx[:mid], depth + 1),
+            self._build(idx[mid + 1:], depth + 1),
+        )
+
+    def nearest(self, q: tuple[float, float, float]) -> int:
+        best = [math.inf, -1]
+        points = self._points
+
+        def visit(node):
+            if node is None:
+                return
+            i, axis, left, right = node
+            p = points[i]
+            d2 = (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2 + (p[2] - q[2]) ** 2
+            if d2 < best[0] or (d2 == best[0] and i < best[1]):
+                best[0], best[1] = d2, i
+            diff = q[axis] - p[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            visit(near)
+            if diff * diff <= best[0]:
+                visit(far)
+
+        visit(self._root)
+        return best[1]
+
+
+class StationIndex:
+    """
+    Nearest-station lookup over (lat, lon) points; positions map each point
+    back to its record in the source list.
+    """
+
+    def __init__(self, coords: list[tuple[float, float]], positions: list[int]):
+        self.positions = positions
+        vectors = [_unit_vector(lat, lon) for lat, lon in coords]
+        if not vectors:
+            self._tree = None
+        elif cKDTree is not None:
+            self._tree = cKDTree(vectors)
+        else:
+            self._tree = _KDTree(vectors)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def nearest(self, lat: float, lon: float) -> int | None:
+        """Position (in the source list) of the closest station, or None."""
+        if self._tree is None:
+            return None
+        q = _unit_vector(lat, lon)
+        if cKDTree is not None and isinstance(self._tree, cKDTree):
+            _, i = self._tree.query(q)
+            return self.positions[int(i)]
+        return self.positions[self._tree.nearest(q)]
+
+
+class DistrictIndex:
+    """
+    IMD district rows grouped once by state (sid or normalized name), each
+    group with its normalized-name lookup table for exact / fuzzy matching.
+    """
+
+    def __init__(
+        self,
+        rows: list[dict[str, Any]],
+        keys: list[tuple[str, str, int | None]],
+    ):
+        # keys[i] = (normalized district, normalized state, state sid) of rows[i]
+        self.rows = rows
+        self._keys = keys
+        self._pools: dict[tuple, tuple[dict[str, dict[str, Any]], list[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _build_pool(self, sid: int | None, state_key: str | None):
+        if sid is not None:
+            members = [i for i, k in enumerate(self._keys) if k[2] == sid]
+        elif state_key:
+            members = [i for i, k in enumerate(self._keys) if k[1] == state_key]
+        else:
+            members = []
+        if not members:
+            members = range(len(self.rows))
+        by_district = {self._keys[i][0]: self.rows[i] for i in members}
+        return by_district, list(by_district)
+
+    def pool(
+        self, sid: int | None, state_key: str | None
+    ) -> tuple[dict[str, dict[str, Any]], list[str]]:
+        """(name -> row, names) for rows in the state; all rows if none match."""
+        key = (sid, state_key if sid is None else None)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._build_pool(*key)
+            with self._lock:
+                pool = self._pools.setdefault(key, pool)
+        return pool
+
+    @staticmethod
+    def closest(hint: str, names: list[str], cutoff: float = 0.72) -> str | None:
+        """
+        Same answer as difflib.get_close_matches(hint, names, n=1, cutoff).
+        rapidfuzz's ratio (LCS-based) never scores below difflib's, so it
+        prefilters candidates and difflib only ranks the few survivors.
+        """
+        if process is not None:
+            candidates = [
+                name
+                for name, _, _ in process.extract(
+                    hint,
+                    names,
+                    scorer=fuzz.ratio,
+                    score_cutoff=cutoff * 100 - 1e-6,
+                    limit=None,
+                )
+            ]
+        else:
+            candidates = names
+        matches = get_close_matches(hint, candidates, n=1, cutoff=cutoff)
+        return matches[0] if matches else None
+
+
+class IdentityMemo:
+    """
+    One derived object (e.g. an index) per source object, keyed by identity.
+    Cached IMD responses are reused as-is, so their indexes are built once.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._data: OrderedDict[int, tuple[Any, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, source: Any, build: Callable[[Any], Any]) -> Any:
+        key: Hashable = id(source)
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[0] is source:
+                self._data.move_to_end(key)
+                return item[1]
+        value = build(source)
+        with self._lock:
+            # holding `source` keeps its id from being reused while cached
+            self._data[key] = (source, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+        return value
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
 import sys
@@ -10,7 +9,7 @@ import sys
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
-from common import get_service
+from common import get_async_service
 
 load_dotenv()
 
@@ -58,13 +57,8 @@ async def imd_weather(
 
     Environment: `IMD_CITY_BASE`, `IMD_MAUSAM_BASE`, optional `NOMINATIM_USER_AGENT`.
     """
-    svc = get_service()
-
-    def _run():
-        return svc.fetch_by_type(latitude, longitude, data_type)
-
     try:
-        return await asyncio.to_thread(_run)
+        return await get_async_service().fetch_by_type(latitude, longitude, data_type)
     except Exception as e:
         logger.exception("imd_weather failed")
         return {
@@ -3,17 +3,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 import os
 import re
 import threading
 import time
-from difflib import get_close_matches
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
 
+import httpx
 import requests
 
+from lookup_index import DistrictIndex, IdentityMemo, StationIndex
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CITY_BASE = os.getenv(
@@ -23,9 +27,17 @@ DEFAULT_MAUSAM_BASE = os.getenv(
     "IMD_MAUSAM_BASE", "http://100.100.108.101:18080/mausam/api"
 ).rstrip("/")
 
-NOMINATIM_URL = "https://nominatim.openstreetmap.org/reverse"
+NOMINATIM_URL = os.getenv(
+    "NOMINATIM_URL", "https://nominatim.openstreetmap.org/reverse"
+)
 NOMINATIM_UA = os.getenv("NOMINATIM_USER_AGENT", "IMD-Weather-Wrapper/1.0 (internal)")
 
+# Upstream response cache: IMD products refresh a few times a day, and
+# reverse geocodes practically never change for a coordinate.
+CACHE_TTL_SEC = float(os.getenv("IMD_CACHE_TTL_SEC", "600"))
+GEOCODE_TTL_SEC = float(os.getenv("IMD_GEOCODE_TTL_SEC", "86400"))
+CACHE_MAX_ENTRIES = int(os.getenv("IMD_CACHE_MAX_ENTRIES", "2048"))
+
 # IMD AWS state id (sid) — same numbering as official IMD AWS mapping.
 STATE_NAME_TO_SID: dict[str, int] = {
     "TELANGANA": 1,
@@ -151,29 +163,392 @@ def _safe_float(x: Any) -> float | None:
         return None
 
 
+
+
 class _TTLCache:
-    def __init__(self, ttl_seconds: float):
+    """
+    Bounded TTL cache (LRU eviction). Concurrent misses on one key share a
+    single load: other threads wait for it instead of hitting IMD again.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = CACHE_MAX_ENTRIES):
         self.ttl = ttl_seconds
+        self.max_entries = max_entries
         self._lock = threading.Lock()
-        self._data: Any = None
-        self._exp: float = 0.0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._loading: dict[Hashable, threading.Event] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _lookup(self, key: Hashable) -> tuple[bool, Any]:
+        # caller holds self._lock
+        item = self._data.get(key)
+        if item is None:
+            return False, None
+        if time.monotonic() >= item[0]:
+            del self._data[key]
+            return False, None
+        self._data.move_to_end(key)
+        return True, item[1]
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        if value is None:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
 
-    def get(self, loader):
-        now = time.monotonic()
+    def clear(self) -> None:
         with self._lock:
-            if self._data is not None and now < self._exp:
-                return self._data
-        fresh = loader()
+            self._data.clear()
+
+    def get(self, loader: Callable[[], Any], key: Hashable = None) -> Any:
+        while True:
+            with self._lock:
+                hit, value = self._lookup(key)
+                if hit:
+                    return value
+                event = self._loading.get(key)
+                owner = event is None
+                if owner:
+                    event = self._loading[key] = threading.Event()
+            if not owner:
+                # the owner stored its result, or failed and we retry ourselves
+                event.wait()
+                continue
+            try:
+                fresh = loader()
+                self._store(key, fresh)
+                return fresh
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+                event.set()
+
+
+class _AsyncTTLCache(_TTLCache):
+    """_TTLCache for coroutine loaders; misses are coalesced per key on the running loop."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = CACHE_MAX_ENTRIES):
+        super().__init__(ttl_seconds, max_entries)
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def get(self, loader: Callable[[], Awaitable[Any]], key: Hashable = None) -> Any:
         with self._lock:
-            self._data = fresh
-            self._exp = time.monotonic() + self.ttl
-        return fresh
+            hit, value = self._lookup(key)
+        if hit:
+            return value
+
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            return await asyncio.shield(pending)
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            fresh = await loader()
+            self._store(key, fresh)
+            future.set_result(fresh)
+            return fresh
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                # mark retrieved; waiters (if any) re-raise it themselves
+                future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+
+# ---------------------------------------------------------------------------
+# Response shaping (shared by the sync and async services)
+# ---------------------------------------------------------------------------
+
+DATA_TYPES = frozenset(
+    {
+        "forecast",
+        "current_aws",
+        "district_warnings",
+        "district_rainfall",
+        "district",
+        "subdivision_warnings",
+        "subdivision_rainfall",
+        "bundle",
+    }
+)
+
+DATA_TYPE_ALIASES = {
+    "current": "current_aws",
+    "aws": "current_aws",
+    "live": "current_aws",
+    "warnings": "district_warnings",
+    "rainfall": "district_rainfall",
+    "district_all": "district",
+    "sub_warnings": "subdivision_warnings",
+    "subdivision_warning": "subdivision_warnings",
+    "sub_rainfall": "subdivision_rainfall",
+    "subdivision_rf": "subdivision_rainfall",
+    "all": "bundle",
+    "full": "bundle",
+}
+
+
+def _normalize_data_type(data_type: str | None) -> str:
+    raw = (data_type or "").strip().lower().replace("-", "_")
+    return DATA_TYPE_ALIASES.get(raw, raw)
+
+
+def _unknown_data_type(data_type: str | None) -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": f"Unknown data_type {data_type!r}. Use one of: {sorted(DATA_TYPES)}",
+    }
+
+
+def _as_list(raw: Any) -> list:
+    return raw if isinstance(raw, list) else [raw] if raw else []
+
+
+def _build_station_index(records: list[dict[str, Any]]) -> StationIndex:
+    coords: list[tuple[float, float]] = []
+    positions: list[int] = []
+    for i, rec in enumerate(records):
+        slat = _safe_float(rec.get("Latitude"))
+        slon = _safe_float(rec.get("Longitude"))
+        if slat is None or slon is None:
+            continue
+        coords.append((slat, slon))
+        positions.append(i)
+    return StationIndex(coords, positions)
+
+
+# Station lists come from cached responses, so each list is indexed once.
+_station_indexes = IdentityMemo(CACHE_MAX_ENTRIES)
+
+
+def _nearest(
+    lat: float, lon: float, records: list[dict[str, Any]]
+) -> tuple[float, dict[str, Any]] | None:
+    pos = _station_indexes.get(records, _build_station_index).nearest(lat, lon)
+    if pos is None:
+        return None
+    rec = records[pos]
+    d = _haversine_km(
+        lat, lon, float(rec.get("Latitude")), float(rec.get("Longitude"))
+    )
+    return d, rec
+
+
+def _geocode_result(data: dict[str, Any]) -> dict[str, Any]:
+    addr = data.get("address") or {}
+    district_guess = (
+        addr.get("state_district")
+        or addr.get("county")
+        or addr.get("city")
+        or addr.get("town")
+        or addr.get("village")
+        or addr.get("suburb")
+    )
+    return {
+        "display_name": data.get("display_name"),
+        "state": addr.get("state"),
+        "iso_3166_2": addr.get("ISO3166-2-lvl4"),
+        "district_guess": district_guess,
+        "country": addr.get("country"),
+        "raw_address": addr,
+    }
+
+
+def _forecast_result(lat: float, lon: float, raw: Any) -> dict[str, Any]:
+    if not raw:
+        return {"success": False, "error": "No weather station data for location"}
+    records = raw if isinstance(raw, list) else [raw]
+    best = _nearest(lat, lon, records)
+    station = best[1] if best else records[0]
+    if not station:
+        return {"success": False, "error": "Could not parse forecast records"}
+
+    slat = _safe_float(station.get("Latitude"))
+    slon = _safe_float(station.get("Longitude"))
+    dist_km = (
+        _haversine_km(lat, lon, slat, slon)
+        if slat is not None and slon is not None
+        else None
+    )
+
+    today = {
+        "date": station.get("Date"),
+        "station": station.get("Station_Name"),
+        "station_code": station.get("Station_Code"),
+        "observed_min_temp": station.get("Today_Min_temp"),
+        "observed_max_temp": station.get("Today_Max_temp"),
+        "past_24hrs_rainfall": station.get("Past_24_hrs_Rainfall"),
+        "humidity_0830": station.get("Relative_Humidity_at_0830"),
+        "humidity_1730": station.get("Relative_Humidity_at_1730"),
+        "sunrise": station.get("Sunrise_time"),
+        "sunset": station.get("Sunset_time"),
+        "forecast_max_temp": station.get("Todays_Forecast_Max_Temp"),
+        "forecast_min_temp": station.get("Todays_Forecast_Min_temp"),
+        "forecast": station.get("Todays_Forecast"),
+        "nearest_station_lat": station.get("Latitude"),
+        "nearest_station_lon": station.get("Longitude"),
+        "distance_to_station_km": round(dist_km, 2) if dist_km is not None else None,
+    }
+    forecast_days = []
+    for day in range(2, 8):
+        forecast_days.append(
+            {
+                "day": day,
+                "max_temp": station.get(f"Day_{day}_Max_Temp"),
+                "min_temp": station.get(f"Day_{day}_Min_temp"),
+                "forecast": station.get(f"Day_{day}_Forecast"),
+            }
+        )
+    return {
+        "success": True,
+        "today": today,
+        "forecast": forecast_days,
+        "stations_returned": len(records),
+    }
+
+
+def _aws_result(lat: float, lon: float, sid: int, raw: Any) -> dict[str, Any]:
+    stations = _as_list(raw)
+    if not stations:
+        return {"success": False, "error": f"No AWS stations for sid={sid}"}
+
+    best = _nearest(lat, lon, stations)
+    if not best:
+        return {"success": False, "error": "No stations with coordinates in AWS feed"}
+
+    dkm, s = best
+    return {
+        "success": True,
+        "imd_state_sid": sid,
+        "distance_km": round(dkm, 2),
+        "station": {
+            "name": s.get("STATION"),
+            "district": s.get("DISTRICT"),
+            "state": s.get("STATE"),
+            "call_sign": s.get("CALL_SIGN"),
+            "date": s.get("DATE"),
+            "time": s.get("TIME"),
+            "temperature_c": s.get("CURR_TEMP"),
+            "feel_like_c": s.get("Feel Like"),
+            "humidity_pct": s.get("RH"),
+            "wind_speed_kmph": s.get("WIND_SPEED"),
+            "wind_direction_deg": s.get("WIND_DIRECTION"),
+            "mslp": s.get("MSLP"),
+            "weather_message": s.get("WEATHER_MESSAGE"),
+            "latitude": s.get("Latitude"),
+            "longitude": s.get("Longitude"),
+        },
+    }
+
+
+def _record_result(data: Any, empty_error: str) -> dict[str, Any]:
+    if not data:
+        return {"success": False, "error": empty_error}
+    rec = data[0] if isinstance(data, list) else data
+    return {"success": True, "record": rec}
+
+
+def _subdivision_warnings_result(data: Any) -> dict[str, Any]:
+    subdivisions = _as_list(data)
+    return {
+        "success": True,
+        "date": subdivisions[0].get("date_obs") if subdivisions else None,
+        "total_subdivisions": len(subdivisions),
+        "data": [
+            {
+                "subdivision": s.get("SUBDIV"),
+                "warnings": [
+                    {
+                        "day": f"Day {d}",
+                        "warning": s.get(f"day{d}_warning"),
+                        "color": s.get(f"day{d}_color"),
+                    }
+                    for d in range(1, 8)
+                ],
+            }
+            for s in subdivisions
+        ],
+    }
+
+
+def _subdivision_rainfall_result(data: Any) -> dict[str, Any]:
+    subdivisions = _as_list(data)
+    return {
+        "success": True,
+        "date": subdivisions[0].get("date_obs") if subdivisions else None,
+        "total_subdivisions": len(subdivisions),
+        "data": [
+            {
+                "subdivision": s.get("SUBDIV"),
+                "forecast": [
+                    {
+                        "day": f"Day {d}",
+                        "distribution": s.get(f"day{d}_distribution"),
+                        "coverage": s.get(f"day{d}_distribution_percentage"),
+                    }
+                    for d in range(1, 8)
+                ],
+            }
+            for s in subdivisions
+        ],
+    }
+
+
+def _district_result(
+    obj_id: int, matched: str | None, w: dict[str, Any], rf: dict[str, Any]
+) -> dict[str, Any]:
+    return {
+        "success": w["success"] and rf["success"],
+        "obj_id": obj_id,
+        "matched_district": matched,
+        "warnings": w,
+        "rainfall": rf,
+    }
+
 
+def _unresolved_district(hint: str | None, state_name: str | None) -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": "Could not resolve IMD district OBJ_ID from geocoder hint",
+        "hint": hint,
+        "state": state_name,
+    }
 
-class LatLonWeatherService:
+
+def _geocode_state(geo: Any) -> tuple[str | None, dict | None]:
+    if isinstance(geo, dict):
+        return geo.get("state"), geo.get("raw_address")
+    return None, None
+
+
+def _cache_key(base: str, path: str, params: dict | None) -> tuple:
+    return (base, path, tuple(sorted((params or {}).items())))
+
+
+def _httpx_json(r: httpx.Response) -> Any:
     """
-    Aggregates IMD mirror endpoints using only latitude/longitude.
-    Reverse geocoding via OSM Nominatim (no API key).
+    r.json(); a non-JSON body (e.g. an HTML error page with 200) raises
+    httpx.DecodingError, as requests' JSONDecodeError is a RequestException.
+    """
+    try:
+        return r.json()
+    except ValueError as e:
+        raise httpx.DecodingError(f"Invalid JSON from {r.url}: {e}", request=r.request) from e
+
+
+class _BaseService:
+    """
+    Configuration and pure lookups shared by the sync and async services.
     """
 
     def __init__(
@@ -182,46 +557,23 @@ class LatLonWeatherService:
         mausam_base: str | None = None,
         timeout: float = 25.0,
         district_index_ttl: float = 3600.0,
+        cache_ttl: float = CACHE_TTL_SEC,
+        geocode_ttl: float = GEOCODE_TTL_SEC,
+        max_cache_entries: int = CACHE_MAX_ENTRIES,
+        nominatim_url: str | None = None,
     ):
         self.city_base = (city_base or DEFAULT_CITY_BASE).rstrip("/")
         self.mausam_base = (mausam_base or DEFAULT_MAUSAM_BASE).rstrip("/")
+        self.nominatim_url = nominatim_url or NOMINATIM_URL
         self.timeout = timeout
-        self._district_rows = _TTLCache(district_index_ttl)
+        self._district_rows = self._cache_class(district_index_ttl, 1)
+        self._responses = self._cache_class(cache_ttl, max_cache_entries)
+        self._geocodes = self._cache_class(geocode_ttl, max_cache_entries)
 
-    def _get_json(self, base: str, path: str, params: dict | None = None) -> Any:
-        url = f"{base.rstrip('/')}/{path.lstrip('/')}"
-        r = requests.get(url, params=params or {}, timeout=self.timeout)
-        r.raise_for_status()
-        return r.json()
+    _cache_class: type[_TTLCache] = _TTLCache
 
-    def reverse_geocode(self, lat: float, lon: float) -> dict[str, Any]:
-        """OSM Nominatim reverse — India-focused address parts."""
-        headers = {"User-Agent": NOMINATIM_UA}
-        params = {"lat": lat, "lon": lon, "format": "json", "zoom": 10}
-        r = requests.get(
-            NOMINATIM_URL, params=params, headers=headers, timeout=self.timeout
-        )
-        r.raise_for_status()
-        data = r.json()
-        addr = data.get("address") or {}
-        district_guess = (
-            addr.get("state_district")
-            or addr.get("county")
-            or addr.get("city")
-            or addr.get("town")
-            or addr.get("village")
-            or addr.get("suburb")
-        )
-        state = addr.get("state")
-        iso = addr.get("ISO3166-2-lvl4")
-        return {
-            "display_name": data.get("display_name"),
-            "state": state,
-            "iso_3166_2": iso,
-            "district_guess": district_guess,
-            "country": addr.get("country"),
-            "raw_address": addr,
-        }
+    def _url(self, base: str, path: str) -> str:
+        return f"{base.rstrip('/')}/{path.lstrip('/')}"
 
     def resolve_state_sid(self, state_name: str | None, raw_address: dict | None = None) -> int | None:
         if raw_address:
@@ -240,29 +592,27 @@ class LatLonWeatherService:
         spaced = key2.replace("_", " ")
         return STATE_NAME_TO_SID.get(spaced)
 
-    def _load_district_rows(self) -> list[dict[str, Any]]:
-        data = self._get_json(self.mausam_base, "districtwise_rainfall_api.php")
-        if not isinstance(data, list):
-            return []
-        return data
-
-    def get_district_rows_cached(self) -> list[dict[str, Any]]:
-        return self._district_rows.get(self._load_district_rows)
+    def _build_district_index(self, rows: list[dict[str, Any]]) -> DistrictIndex:
+        keys = []
+        for r in rows:
+            row_state = str(r.get("State", ""))
+            keys.append(
+                (
+                    _norm_name(str(r.get("District", ""))),
+                    _norm_name(row_state),
+                    self.resolve_state_sid(row_state, None),
+                )
+            )
+        return DistrictIndex(rows, keys)
 
-    def resolve_district_obj_id(
+    def _match_district(
         self,
+        index: DistrictIndex,
         district_hint: str | None,
         state_name: str | None,
         geocode: dict[str, Any] | None = None,
     ) -> tuple[int | None, str | None]:
-        """
-        Match geocoder district hint to IMD OBJ_ID using cached rainfall list (has State).
-        Returns (obj_id, matched_district_label).
-        """
-        if not district_hint:
-            return None, None
-        rows = self.get_district_rows_cached()
-        if not rows:
+        if not district_hint or not index.rows:
             return None, None
 
         hint = _norm_name(district_hint)
@@ -274,27 +624,18 @@ class LatLonWeatherService:
         sid_from_name = self.resolve_state_sid(state_name, None) if state_name else None
         effective_sid = inferred_sid if inferred_sid is not None else sid_from_name
 
-        def state_match(row_state: str) -> bool:
-            if effective_sid is None:
-                if state_name:
-                    return _norm_name(row_state) == _norm_name(state_name)
-                return True
-            rsid = self.resolve_state_sid(row_state, None)
-            return rsid == effective_sid
-
-        in_state = [r for r in rows if state_match(str(r.get("State", "")))]
-        pool = in_state if in_state else rows
-
-        by_district = {_norm_name(str(r.get("District", ""))): r for r in pool}
+        # rows in the same state (all rows when none match)
+        by_district, names = index.pool(
+            effective_sid, _norm_name(state_name) if state_name else None
+        )
 
         if hint in by_district:
             r = by_district[hint]
             return int(str(r["OBJ_ID"])), str(r.get("District"))
 
-        names = list(by_district.keys())
-        matches = get_close_matches(hint, names, n=1, cutoff=0.72)
-        if matches:
-            r = by_district[matches[0]]
+        match = index.closest(hint, names, cutoff=0.72)
+        if match:
+            r = by_district[match]
             return int(str(r["OBJ_ID"])), str(r.get("District"))
 
         # substring fallback (e.g. "North West Delhi" vs "NORTH WEST DELHI")
@@ -306,72 +647,77 @@ class LatLonWeatherService:
     def pick_nearest_forecast_station(
         self, lat: float, lon: float, records: list[dict[str, Any]]
     ) -> dict[str, Any] | None:
-        best: tuple[float, dict[str, Any]] | None = None
-        for rec in records:
-            slat = _safe_float(rec.get("Latitude"))
-            slon = _safe_float(rec.get("Longitude"))
-            if slat is None or slon is None:
-                continue
-            d = _haversine_km(lat, lon, slat, slon)
-            if best is None or d < best[0]:
-                best = (d, rec)
+        best = _nearest(lat, lon, records)
         if best:
             return best[1]
         return records[0] if records else None
 
+
+class LatLonWeatherService(_BaseService):
+    """
+    Aggregates IMD mirror endpoints using only latitude/longitude.
+    Reverse geocoding via OSM Nominatim (no API key).
+    """
+
+    def _get_json(self, base: str, path: str, params: dict | None = None) -> Any:
+        def load():
+            r = requests.get(
+                self._url(base, path), params=params or {}, timeout=self.timeout
+            )
+            r.raise_for_status()
+            return r.json()
+
+        return self._responses.get(load, _cache_key(base, path, params))
+
+    def reverse_geocode(self, lat: float, lon: float) -> dict[str, Any]:
+        """OSM Nominatim reverse — India-focused address parts."""
+
+        def load():
+            headers = {"User-Agent": NOMINATIM_UA}
+            params = {"lat": lat, "lon": lon, "format": "json", "zoom": 10}
+            r = requests.get(
+                self.nominatim_url, params=params, headers=headers, timeout=self.timeout
+            )
+            r.raise_for_status()
+            return _geocode_result(r.json())
+
+        return self._geocodes.get(load, (lat, lon))
+
+    def _load_district_rows(self) -> list[dict[str, Any]]:
+        data = self._get_json(self.mausam_base, "districtwise_rainfall_api.php")
+        if not isinstance(data, list):
+            return []
+        return data
+
+    def _load_district_index(self) -> DistrictIndex:
+        return self._build_district_index(self._load_district_rows())
+
+    def get_district_index(self) -> DistrictIndex:
+        return self._district_rows.get(self._load_district_index)
+
+    def get_district_rows_cached(self) -> list[dict[str, Any]]:
+        return self.get_district_index().rows
+
+    def resolve_district_obj_id(
+        self,
+        district_hint: str | None,
+        state_name: str | None,
+        geocode: dict[str, Any] | None = None,
+    ) -> tuple[int | None, str | None]:
+        """
+        Match geocoder district hint to IMD OBJ_ID using cached rainfall list (has State).
+        Returns (obj_id, matched_district_label).
+        """
+        if not district_hint:
+            return None, None
+        index = self.get_district_index()
+        return self._match_district(index, district_hint, state_name, geocode)
+
     def get_forecast_bundle(self, lat: float, lon: float) -> dict[str, Any]:
         raw = self._get_json(
             self.city_base, "cityweather_loc.php", {"lat": lat, "lon": lon}
         )
-        if not raw:
-            return {"success": False, "error": "No weather station data for location"}
-        records = raw if isinstance(raw, list) else [raw]
-        station = self.pick_nearest_forecast_station(lat, lon, records)
-        if not station:
-            return {"success": False, "error": "Could not parse forecast records"}
-
-        slat = _safe_float(station.get("Latitude"))
-        slon = _safe_float(station.get("Longitude"))
-        dist_km = (
-            _haversine_km(lat, lon, slat, slon)
-            if slat is not None and slon is not None
-            else None
-        )
-
-        today = {
-            "date": station.get("Date"),
-            "station": station.get("Station_Name"),
-            "station_code": station.get("Station_Code"),
-            "observed_min_temp": station.get("Today_Min_temp"),
-            "observed_max_temp": station.get("Today_Max_temp"),
-            "past_24hrs_rainfall": station.get("Past_24_hrs_Rainfall"),
-            "humidity_0830": station.get("Relative_Humidity_at_0830"),
-            "humidity_1730": station.get("Relative_Humidity_at_1730"),
-            "sunrise": station.get("Sunrise_time"),
-            "sunset": station.get("Sunset_time"),
-            "forecast_max_temp": station.get("Todays_Forecast_Max_Temp"),
-            "forecast_min_temp": station.get("Todays_Forecast_Min_temp"),
-            "forecast": station.get("Todays_Forecast"),
-            "nearest_station_lat": station.get("Latitude"),
-            "nearest_station_lon": station.get("Longitude"),
-            "distance_to_station_km": round(dist_km, 2) if dist_km is not None else None,
-        }
-        forecast_days = []
-        for day in range(2, 8):
-            forecast_days.append(
-                {
-                    "day": day,
-                    "max_temp": station.get(f"Day_{day}_Max_Temp"),
-                    "min_temp": station.get(f"Day_{day}_Min_temp"),
-                    "forecast": station.get(f"Day_{day}_Forecast"),
-                }
-            )
-        return {
-            "success": True,
-            "today": today,
-            "forecast": forecast_days,
-            "stations_returned": len(records),
-        }
+        return _forecast_result(lat, lon, raw)
 
     def get_nearest_aws(
         self,
@@ -390,46 +736,7 @@ class LatLonWeatherService:
             raw = self._get_json(self.city_base, "aws_data_api.php", {"sid": sid})
         except requests.RequestException as e:
             return {"success": False, "error": str(e)}
-
-        stations = raw if isinstance(raw, list) else [raw] if raw else []
-        if not stations:
-            return {"success": False, "error": f"No AWS stations for sid={sid}"}
-
-        best: tuple[float, dict[str, Any]] | None = None
-        for s in stations:
-            slat = _safe_float(s.get("Latitude"))
-            slon = _safe_float(s.get("Longitude"))
-            if slat is None or slon is None:
-                continue
-            d = _haversine_km(lat, lon, slat, slon)
-            if best is None or d < best[0]:
-                best = (d, s)
-        if not best:
-            return {"success": False, "error": "No stations with coordinates in AWS feed"}
-
-        dkm, s = best
-        return {
-            "success": True,
-            "imd_state_sid": sid,
-            "distance_km": round(dkm, 2),
-            "station": {
-                "name": s.get("STATION"),
-                "district": s.get("DISTRICT"),
-                "state": s.get("STATE"),
-                "call_sign": s.get("CALL_SIGN"),
-                "date": s.get("DATE"),
-                "time": s.get("TIME"),
-                "temperature_c": s.get("CURR_TEMP"),
-                "feel_like_c": s.get("Feel Like"),
-                "humidity_pct": s.get("RH"),
-                "wind_speed_kmph": s.get("WIND_SPEED"),
-                "wind_direction_deg": s.get("WIND_DIRECTION"),
-                "mslp": s.get("MSLP"),
-                "weather_message": s.get("WEATHER_MESSAGE"),
-                "latitude": s.get("Latitude"),
-                "longitude": s.get("Longitude"),
-            },
-        }
+        return _aws_result(lat, lon, sid, raw)
 
     def get_district_warnings_raw(self, obj_id: int) -> dict[str, Any]:
         try:
@@ -438,10 +745,7 @@ class LatLonWeatherService:
             )
         except requests.RequestException as e:
             return {"success": False, "error": str(e)}
-        if not data:
-            return {"success": False, "error": f"No warnings for district id={obj_id}"}
-        rec = data[0] if isinstance(data, list) else data
-        return {"success": True, "record": rec}
+        return _record_result(data, f"No warnings for district id={obj_id}")
 
     def get_district_rainfall_raw(self, obj_id: int) -> dict[str, Any]:
         try:
@@ -450,10 +754,7 @@ class LatLonWeatherService:
             )
         except requests.RequestException as e:
             return {"success": False, "error": str(e)}
-        if not data:
-            return {"success": False, "error": f"No rainfall row for district id={obj_id}"}
-        rec = data[0] if isinstance(data, list) else data
-        return {"success": True, "record": rec}
+        return _record_result(data, f"No rainfall row for district id={obj_id}")
 
     def get_subdivision_warnings(self) -> dict[str, Any]:
         """All-India meteorological subdivision warnings (7 days)."""
@@ -461,26 +762,7 @@ class LatLonWeatherService:
             data = self._get_json(self.mausam_base, "api_subDivisionWiseWarning.php")
         except requests.RequestException as e:
             return {"success": False, "error": str(e)}
-        subdivisions = data if isinstance(data, list) else [data] if data else []
-        return {
-            "success": True,
-            "date": subdivisions[0].get("date_obs") if subdivisions else None,
-            "total_subdivisions": len(subdivisions),
-            "data": [
-                {
-                    "subdivision": s.get("SUBDIV"),
-                    "warnings": [
-                        {
-                            "day": f"Day {d}",
-                            "warning": s.get(f"day{d}_warning"),
-                            "color": s.get(f"day{d}_color"),
-                        }
-                        for d in range(1, 8)
-                    ],
-                }
-                for s in subdivisions
-            ],
-        }
+        return _subdivision_warnings_result(data)
 
     def get_subdivision_rainfall_forecast(self) -> dict[str, Any]:
         """All-India 7-day rainfall distribution forecast by subdivision."""
@@ -488,26 +770,7 @@ class LatLonWeatherService:
             data = self._get_json(self.mausam_base, "api_5d_subdivisional_rf.php")
         except requests.RequestException as e:
             return {"success": False, "error": str(e)}
-        subdivisions = data if isinstance(data, list) else [data] if data else []
-        return {
-            "success": True,
-            "date": subdivisions[0].get("date_obs") if subdivisions else None,
-            "total_subdivisions": len(subdivisions),
-            "data": [
-                {
-                    "subdivision": s.get("SUBDIV"),
-                    "forecast": [
-                        {
-                            "day": f"Day {d}",
-                            "distribution": s.get(f"day{d}_distribution"),
-                            "coverage": s.get(f"day{d}_distribution_percentage"),
-                        }
-                        for d in range(1, 8)
-                    ],
-                }
-                for s in subdivisions
-            ],
-        }
+        return _subdivision_rainfall_result(data)
 
     def bundle(
         self,
@@ -537,11 +800,7 @@ class LatLonWeatherService:
         except requests.RequestException as e:
             out["forecast"] = {"success": False, "error": str(e)}
 
-        state_name = None
-        raw_addr = None
-        if isinstance(out["geocode"], dict):
-            state_name = out["geocode"].get("state")
-            raw_addr = out["geocode"].get("raw_address")
+        state_name, raw_addr = _geocode_state(out["geocode"])
 
         if include_aws:
             try:
@@ -558,22 +817,11 @@ class LatLonWeatherService:
                     hint, state_name, out["geocode"]
                 )
                 if obj_id is None:
-                    out["district"] = {
-                        "success": False,
-                        "error": "Could not resolve IMD district OBJ_ID from geocoder hint",
-                        "hint": hint,
-                        "state": state_name,
-                    }
+                    out["district"] = _unresolved_district(hint, state_name)
                 else:
                     w = self.get_district_warnings_raw(obj_id)
                     rf = self.get_district_rainfall_raw(obj_id)
-                    out["district"] = {
-                        "success": w["success"] and rf["success"],
-                        "obj_id": obj_id,
-                        "matched_district": matched,
-                        "warnings": w,
-                        "rainfall": rf,
-                    }
+                    out["district"] = _district_result(obj_id, matched, w, rf)
             except Exception as e:
                 out["district"] = {"success": False, "error": str(e)}
 
@@ -583,39 +831,9 @@ class LatLonWeatherService:
         """
         Single entrypoint for MCP: dispatch by normalized data_type string.
         """
-        raw = (data_type or "").strip().lower().replace("-", "_")
-        aliases = {
-            "current": "current_aws",
-            "aws": "current_aws",
-            "live": "current_aws",
-            "warnings": "district_warnings",
-            "rainfall": "district_rainfall",
-            "district_all": "district",
-            "sub_warnings": "subdivision_warnings",
-            "subdivision_warning": "subdivision_warnings",
-            "sub_rainfall": "subdivision_rainfall",
-            "subdivision_rf": "subdivision_rainfall",
-            "all": "bundle",
-            "full": "bundle",
-        }
-        dt = aliases.get(raw, raw)
-        allowed = frozenset(
-            {
-                "forecast",
-                "current_aws",
-                "district_warnings",
-                "district_rainfall",
-                "district",
-                "subdivision_warnings",
-                "subdivision_rainfall",
-                "bundle",
-            }
-        )
-        if dt not in allowed:
-            return {
-                "success": False,
-                "error": f"Unknown data_type {data_type!r}. Use one of: {sorted(allowed)}",
-            }
+        dt = _normalize_data_type(data_type)
+        if dt not in DATA_TYPES:
+            return _unknown_data_type(data_type)
 
         base_meta: dict[str, Any] = {
             "success": True,
@@ -705,5 +923,328 @@ class LatLonWeatherService:
         return {"success": False, "error": "internal dispatch error", "data_type": dt}
 
 
+class AsyncLatLonWeatherService(_BaseService):
+    """
+    Async variant of LatLonWeatherService (same payloads) for the FastAPI and
+    MCP event loops. Independent IMD calls run concurrently; concurrent misses
+    on the same endpoint + params share one upstream request.
+    """
+
+    _cache_class = _AsyncTTLCache
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # one pooled client per event loop (tests and CLI runs spin up fresh loops)
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    async def _get_json(self, base: str, path: str, params: dict | None = None) -> Any:
+        async def load():
+            r = await self._get_client().get(self._url(base, path), params=params or {})
+            r.raise_for_status()
+            return _httpx_json(r)
+
+        return await self._responses.get(load, _cache_key(base, path, params))
+
+    async def reverse_geocode(self, lat: float, lon: float) -> dict[str, Any]:
+        """OSM Nominatim reverse — India-focused address parts."""
+
+        async def load():
+            headers = {"User-Agent": NOMINATIM_UA}
+            params = {"lat": lat, "lon": lon, "format": "json", "zoom": 10}
+            r = await self._get_client().get(
+                self.nominatim_url, params=params, headers=headers
+            )
+            r.raise_for_status()
+            return _geocode_result(_httpx_json(r))
+
+        return await self._geocodes.get(load, (lat, lon))
+
+    async def _load_district_rows(self) -> list[dict[str, Any]]:
+        data = await self._get_json(self.mausam_base, "districtwise_rainfall_api.php")
+        if not isinstance(data, list):
+            return []
+        return data
+
+    async def _load_district_index(self) -> DistrictIndex:
+        return self._build_district_index(await self._load_district_rows())
+
+    async def get_district_index(self) -> DistrictIndex:
+        return await self._district_rows.get(self._load_district_index)
+
+    async def get_district_rows_cached(self) -> list[dict[str, Any]]:
+        return (await self.get_district_index()).rows
+
+    async def resolve_district_obj_id(
+        self,
+        district_hint: str | None,
+        state_name: str | None,
+        geocode: dict[str, Any] | None = None,
+    ) -> tuple[int | None, str | None]:
+        if not district_hint:
+            return None, None
+        index = await self.get_district_index()
+        return self._match_district(index, district_hint, state_name, geocode)
+
+    async def get_forecast_bundle(self, lat: float, lon: float) -> dict[str, Any]:
+        raw = await self._get_json(
+            self.city_base, "cityweather_loc.php", {"lat": lat, "lon": lon}
+        )
+        return _forecast_result(lat, lon, raw)
+
+    async def get_nearest_aws(
+        self,
+        lat: float,
+        lon: float,
+        state_name: str | None,
+        raw_address: dict | None = None,
+    ) -> dict[str, Any]:
+        sid = self.resolve_state_sid(state_name or "", raw_address)
+        if sid is None:
+            return {
+                "success": False,
+                "error": "Could not map geocoded state to IMD AWS state id (sid)",
+            }
+        try:
+            raw = await self._get_json(self.city_base, "aws_data_api.php", {"sid": sid})
+        except httpx.HTTPError as e:
+            return {"success": False, "error": str(e)}
+        return _aws_result(lat, lon, sid, raw)
+
+    async def get_district_warnings_raw(self, obj_id: int) -> dict[str, Any]:
+        try:
+            data = await self._get_json(
+                self.mausam_base, "warnings_district_api.php", {"id": obj_id}
+            )
+        except httpx.HTTPError as e:
+            return {"success": False, "error": str(e)}
+        return _record_result(data, f"No warnings for district id={obj_id}")
+
+    async def get_district_rainfall_raw(self, obj_id: int) -> dict[str, Any]:
+        try:
+            data = await self._get_json(
+                self.mausam_base, "districtwise_rainfall_api.php", {"id": obj_id}
+            )
+        except httpx.HTTPError as e:
+            return {"success": False, "error": str(e)}
+        return _record_result(data, f"No rainfall row for district id={obj_id}")
+
+    async def get_subdivision_warnings(self) -> dict[str, Any]:
+        """All-India meteorological subdivision warnings (7 days)."""
+        try:
+            data = await self._get_json(self.mausam_base, "api_subDivisionWiseWarning.php")
+        except httpx.HTTPError as e:
+            return {"success": False, "error": str(e)}
+        return _subdivision_warnings_result(data)
+
+    async def get_subdivision_rainfall_forecast(self) -> dict[str, Any]:
+        """All-India 7-day rainfall distribution forecast by subdivision."""
+        try:
+            data = await self._get_json(self.mausam_base, "api_5d_subdivisional_rf.php")
+        except httpx.HTTPError as e:
+            return {"success": False, "error": str(e)}
+        return _subdivision_rainfall_result(data)
+
+    async def _warm_district_index(self) -> None:
+        try:
+            await self.get_district_index()
+        except Exception:
+            pass  # resolve_district_obj_id retries the load and reports the error
+
+    async def _district(self, obj_id: int, matched: str | None) -> dict[str, Any]:
+        w, rf = await asyncio.gather(
+            self.get_district_warnings_raw(obj_id),
+            self.get_district_rainfall_raw(obj_id),
+        )
+        return _district_result(obj_id, matched, w, rf)
+
+    async def bundle(
+        self,
+        lat: float,
+        lon: float,
+        *,
+        include_aws: bool = True,
+        include_district: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Same payload as LatLonWeatherService.bundle in two round trips:
+        geocode, forecast and the district index together, then AWS and the
+        district warnings/rainfall together.
+        """
+        out: dict[str, Any] = {
+            "latitude": lat,
+            "longitude": lon,
+            "geocode": None,
+            "forecast": None,
+            "nearest_aws": None,
+            "district": None,
+        }
+
+        async def geocode():
+            try:
+                out["geocode"] = await self.reverse_geocode(lat, lon)
+            except Exception as e:
+                logger.warning("reverse_geocode failed: %s", e)
+                out["geocode"] = {"error": str(e)}
+
+        async def forecast():
+            try:
+                out["forecast"] = await self.get_forecast_bundle(lat, lon)
+            except httpx.HTTPError as e:
+                out["forecast"] = {"success": False, "error": str(e)}
+
+        first = [geocode(), forecast()]
+        if include_district:
+            first.append(self._warm_district_index())
+        await asyncio.gather(*first)
+
+        state_name, raw_addr = _geocode_state(out["geocode"])
+
+        async def aws():
+            try:
+                out["nearest_aws"] = await self.get_nearest_aws(
+                    lat, lon, state_name, raw_addr
+                )
+            except Exception as e:
+                out["nearest_aws"] = {"success": False, "error": str(e)}
+
+        async def district():
+            hint = out["geocode"].get("district_guess")
+            try:
+                obj_id, matched = await self.resolve_district_obj_id(
+                    hint, state_name, out["geocode"]
+                )
+                if obj_id is None:
+                    out["district"] = _unresolved_district(hint, state_name)
+                else:
+                    out["district"] = await self._district(obj_id, matched)
+            except Exception as e:
+                out["district"] = {"success": False, "error": str(e)}
+
+        second = []
+        if include_aws:
+            second.append(aws())
+        if include_district and isinstance(out["geocode"], dict):
+            second.append(district())
+        await asyncio.gather(*second)
+
+        return out
+
+    async def fetch_by_type(self, latitude: float, longitude: float, data_type: str) -> dict[str, Any]:
+        """
+        Single entrypoint for MCP: dispatch by normalized data_type string.
+        """
+        dt = _normalize_data_type(data_type)
+        if dt not in DATA_TYPES:
+            return _unknown_data_type(data_type)
+
+        base_meta: dict[str, Any] = {
+            "success": True,
+            "data_type": dt,
+            "latitude": latitude,
+            "longitude": longitude,
+        }
+
+        if dt == "forecast":
+            base_meta["result"] = await self.get_forecast_bundle(latitude, longitude)
+            return base_meta
+
+        if dt == "subdivision_warnings":
+            base_meta["note"] = "National product; coordinates are not used."
+            base_meta["result"] = await self.get_subdivision_warnings()
+            return base_meta
+
+        if dt == "subdivision_rainfall":
+            base_meta["note"] = "National product; coordinates are not used."
+            base_meta["result"] = await self.get_subdivision_rainfall_forecast()
+            return base_meta
+
+        if dt == "bundle":
+            base_meta["result"] = await self.bundle(
+                latitude, longitude, include_aws=True, include_district=True
+            )
+            fc = base_meta["result"].get("forecast") or {}
+            base_meta["success"] = bool(fc.get("success", False))
+            return base_meta
+
+        # Remaining types need reverse geocode (+ district resolution)
+        try:
+            if dt == "current_aws":
+                geo = await self.reverse_geocode(latitude, longitude)
+            else:
+                # warm the district index while Nominatim answers
+                geo, _ = await asyncio.gather(
+                    self.reverse_geocode(latitude, longitude),
+                    self._warm_district_index(),
+                )
+        except Exception as e:
+            return {
+                "success": False,
+                "data_type": dt,
+                "latitude": latitude,
+                "longitude": longitude,
+                "error": f"Reverse geocode failed: {e}",
+            }
+
+        state_name = geo.get("state")
+        raw_addr = geo.get("raw_address")
+
+        if dt == "current_aws":
+            base_meta["geocode"] = geo
+            base_meta["result"] = await self.get_nearest_aws(
+                latitude, longitude, state_name, raw_addr
+            )
+            base_meta["success"] = bool(base_meta["result"].get("success"))
+            return base_meta
+
+        hint = geo.get("district_guess")
+        obj_id, matched = await self.resolve_district_obj_id(hint, state_name, geo)
+        base_meta["geocode"] = geo
+        base_meta["district_obj_id"] = obj_id
+        base_meta["matched_district"] = matched
+
+        if obj_id is None:
+            return {
+                "success": False,
+                "data_type": dt,
+                "latitude": latitude,
+                "longitude": longitude,
+                "geocode": geo,
+                "error": "Could not resolve IMD district OBJ_ID for this location",
+            }
+
+        if dt == "district_warnings":
+            base_meta["result"] = await self.get_district_warnings_raw(obj_id)
+            base_meta["success"] = bool(base_meta["result"].get("success"))
+            return base_meta
+
+        if dt == "district_rainfall":
+            base_meta["result"] = await self.get_district_rainfall_raw(obj_id)
+            base_meta["success"] = bool(base_meta["result"].get("success"))
+            return base_meta
+
+        if dt == "district":
+            district = await self._district(obj_id, matched)
+            w, rf = district["warnings"], district["rainfall"]
+            base_meta["result"] = {"warnings": w, "rainfall": rf}
+            base_meta["success"] = bool(w.get("success") and rf.get("success"))
+            return base_meta
+
+        return {"success": False, "error": "internal dispatch error", "data_type": dt}
+
+
 def build_service_from_env() -> LatLonWeatherService:
     return LatLonWeatherService()
@@ -0,0 +1,171 @@
+"""Station / district indexes: parity with the linear scans they replace, plus per-lookup latency."""
+
+import random
+import time
+from difflib import get_close_matches
+
+import pytest
+
+import lookup_index
+import service
+
+STATES = [
+    "PUNJAB", "HARYANA", "RAJASTHAN", "GUJARAT", "MAHARASHTRA", "KARNATAKA",
+    "KERALA", "TAMIL NADU", "ODISHA", "BIHAR", "ASSAM", "UTTAR PRADESH",
+]
+SYLLABLES = ["pur", "ga", "nag", "ban", "kot", "ma", "ra", "li", "dha", "war", "sa", "an", "ja", "bad", "hi"]
+
+
+def _linear_nearest(lat, lon, records):
+    best = None
+    for rec in records:
+        slat = service._safe_float(rec.get("Latitude"))
+        slon = service._safe_float(rec.get("Longitude"))
+        if slat is None or slon is None:
+            continue
+        d = service._haversine_km(lat, lon, slat, slon)
+        if best is None or d < best[0]:
+            best = (d, rec)
+    return best
+
+
+def _linear_match(svc, rows, district_hint, state_name, geocode=None):
+    if not district_hint or not rows:
+        return None, None
+    hint = service._norm_name(district_hint)
+    inferred_sid = None
+    if geocode and isinstance(geocode.get("raw_address"), dict):
+        inferred_sid = svc.resolve_state_sid(geocode.get("state"), geocode["raw_address"])
+    sid_from_name = svc.resolve_state_sid(state_name, None) if state_name else None
+    effective_sid = inferred_sid if inferred_sid is not None else sid_from_name
+
+    def state_match(row_state):
+        if effective_sid is None:
+            if state_name:
+                return service._norm_name(row_state) == service._norm_name(state_name)
+            return True
+        return svc.resolve_state_sid(row_state, None) == effective_sid
+
+    in_state = [r for r in rows if state_match(str(r.get("State", "")))]
+    pool = in_state if in_state else rows
+    by_district = {service._norm_name(str(r.get("District", ""))): r for r in pool}
+    if hint in by_district:
+        r = by_district[hint]
+        return int(str(r["OBJ_ID"])), str(r.get("District"))
+    matches = get_close_matches(hint, list(by_district), n=1, cutoff=0.72)
+    if matches:
+        r = by_district[matches[0]]
+        return int(str(r["OBJ_ID"])), str(r.get("District"))
+    for n, r in by_district.items():
+        if hint in n or n in hint:
+            return int(str(r["OBJ_ID"])), str(r.get("District"))
+    return None, None
+
+
+def _stations(rng, n):
+    records = [
+        {"STATION": f"S{i}", "Latitude": f"{rng.uniform(6, 36):.4f}", "Longitude": f"{rng.uniform(68, 97):.4f}"}
+        for i in range(n)
+    ]
+    records[3]["Latitude"] = ""  # unparseable rows are skipped, as before
+    records[7]["Longitude"] = None
+    return records
+
+
+def _districts(rng, n):
+    names = set()
+    while len(names) < n:
+        names.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).upper())
+    return [
+        {"OBJ_ID": str(100 + i), "District": name, "State": rng.choice(STATES)}
+        for i, name in enumerate(sorted(names))
+    ]
+
+
+def _typo(rng, name):
+    chars = list(name)
+    op = rng.choice(["drop", "swap", "sub", "none", "suffix", "prefix"])
+    i = rng.randrange(len(chars))
+    if op == "drop" and len(chars) > 3:
+        del chars[i]
+    elif op == "swap" and i + 1 < len(chars):
+        chars[i], chars[i + 1] = chars[i + 1], chars[i]
+    elif op == "sub":
+        chars[i] = rng.choice("AEIOUK")
+    elif op == "suffix":
+        chars += list(" RURAL")
+    elif op == "prefix":
+        return "District " + name.title()
+    return "".join(chars)
+
+
+@pytest.mark.parametrize("use_python_tree", [False, True])
+def test_nearest_station_parity(monkeypatch, use_python_tree):
+    if use_python_tree:
+        monkeypatch.setattr(lookup_index, "cKDTree", None)
+    rng = random.Random(7)
+    records = _stations(rng, 2000)
+    for _ in range(300):
+        lat, lon = rng.uniform(5, 37), rng.uniform(67, 98)
+        got = service._nearest(lat, lon, records)
+        want = _linear_nearest(lat, lon, records)
+        assert got[1] is want[1]
+        assert got[0] == pytest.approx(want[0])
+
+    assert service._nearest(20.0, 78.0, [{"Latitude": None, "Longitude": "1"}]) is None
+    assert service._forecast_result(20.0, 78.0, [{"Station_Name": "only"}])["today"]["station"] == "only"
+
+
+def test_district_match_parity():
+    rng = random.Random(11)
+    rows = _districts(rng, 700)
+    svc = service.LatLonWeatherService(city_base="http://unused", mausam_base="http://unused")
+    index = svc._build_district_index(rows)
+
+    state_names = STATES + ["Tamil_Nadu", "Unknown Land", None, ""]
+    for _ in range(800):
+        row = rng.choice(rows)
+        hint = _typo(rng, row["District"]) if rng.random() < 0.9 else "".join(rng.choice("ABCDEFGH") for _ in range(6))
+        state = rng.choice(state_names)
+        geocode = rng.choice([None, {"state": state, "raw_address": {"ISO3166-2-lvl4": rng.choice(["IN-PB", "IN-KL", "XX"])}}])
+        assert svc._match_district(index, hint, state, geocode) == _linear_match(svc, rows, hint, state, geocode)
+
+    assert svc._match_district(index, None, "PUNJAB") == (None, None)
+
+
+def test_closest_without_rapidfuzz_matches(monkeypatch):
+    names = ["LUDHIANA", "LUCKNOW", "LATUR", "LALITPUR"]
+    with_rf = lookup_index.DistrictIndex.closest("LUDIANA", names)
+    monkeypatch.setattr(lookup_index, "process", None)
+    assert lookup_index.DistrictIndex.closest("LUDIANA", names) == with_rf == "LUDHIANA"
+
+
+def _per_lookup_us(fn, queries):
+    started = time.perf_counter()
+    for q in queries:
+        fn(*q)
+    return (time.perf_counter() - started) / len(queries) * 1e6
+
+
+def test_indexed_lookups_are_faster_than_linear_scans():
+    rng = random.Random(3)
+    records = _stations(rng, 3000)
+    station_queries = [(rng.uniform(6, 36), rng.uniform(68, 97)) for _ in range(300)]
+    service._nearest(*station_queries[0], records)  # build once, as on first request
+
+    rows = _districts(rng, 700)
+    svc = service.LatLonWeatherService(city_base="http://unused", mausam_base="http://unused")
+    index = svc._build_district_index(rows)
+    district_queries = [(_typo(rng, r["District"]), r["State"]) for r in rng.sample(rows, 200)]
+
+    linear_station = _per_lookup_us(lambda lat, lon: _linear_nearest(lat, lon, records), station_queries)
+    indexed_station = _per_lookup_us(lambda lat, lon: service._nearest(lat, lon, records), station_queries)
+    linear_district = _per_lookup_us(lambda h, s: _linear_match(svc, rows, h, s), district_queries)
+    indexed_district = _per_lookup_us(lambda h, s: svc._match_district(index, h, s), district_queries)
+
+    print(
+        f"\nnearest station (3000): linear {linear_station:.0f}us, indexed {indexed_station:.0f}us"
+        f"\ndistrict match (700):   linear {linear_district:.0f}us, indexed {indexed_district:.0f}us"
+    )
+    assert indexed_station * 5 < linear_station
+    assert indexed_district * 2 < linear_district
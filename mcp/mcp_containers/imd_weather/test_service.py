@@ -0,0 +1,256 @@
+"""LatLonWeatherService / AsyncLatLonWeatherService against a stub IMD mirror + Nominatim."""
+
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import service
+
+LAT, LON = 30.91, 75.85
+
+RESPONSES = {
+    "/reverse": {
+        "display_name": "Ludhiana, Punjab, India",
+        "address": {
+            "state_district": "Ludhiana",
+            "state": "Punjab",
+            "ISO3166-2-lvl4": "IN-PB",
+            "country": "India",
+        },
+    },
+    "/city/api/cityweather_loc.php": [
+        {"Station_Name": "Ludhiana", "Station_Code": "42099", "Latitude": "30.93",
+         "Longitude": "75.87", "Date": "2026-10-19", "Todays_Forecast": "Clear sky"},
+        {"Station_Name": "Amritsar", "Station_Code": "42071", "Latitude": "31.63",
+         "Longitude": "74.87", "Date": "2026-10-19", "Todays_Forecast": "Haze"},
+    ],
+    "/city/api/aws_data_api.php": [
+        {"STATION": "LUDHIANA_PAU", "DISTRICT": "LUDHIANA", "STATE": "PUNJAB",
+         "Latitude": "30.90", "Longitude": "75.80", "CURR_TEMP": "29.4"},
+    ],
+    "/mausam/api/districtwise_rainfall_api.php": [
+        {"OBJ_ID": "404", "District": "LUDHIANA", "State": "PUNJAB", "Actual": "0.0"},
+        {"OBJ_ID": "405", "District": "AMRITSAR", "State": "PUNJAB", "Actual": "1.2"},
+    ],
+    "/mausam/api/warnings_district_api.php": [
+        {"Obj_id": "404", "District": "LUDHIANA", "Day_1": "1", "Day_2": "2"},
+    ],
+    "/mausam/api/api_subDivisionWiseWarning.php": [
+        {"SUBDIV": "Punjab", "date_obs": "2026-10-19", "day1_warning": "No warning", "day1_color": "4"},
+    ],
+}
+
+
+class _StubImd:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.fail_next = 0
+        self.html_paths: set[str] = set()
+        self.hits: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def serve(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                with stub._lock:
+                    stub.hits[(url.path, query.get("id"))] += 1
+                    fail = stub.fail_next > 0
+                    if fail:
+                        stub.fail_next -= 1
+                time.sleep(stub.delay)
+                html = url.path in stub.html_paths
+                if fail:
+                    body, status = b"busy", 503
+                elif html:
+                    body, status = b"<html><body>Service Unavailable</body></html>", 200
+                else:
+                    data = RESPONSES.get(url.path)
+                    if url.path.endswith("districtwise_rainfall_api.php") and "id" in query:
+                        data = [r for r in data if r["OBJ_ID"] == query["id"]]
+                    body, status = json.dumps(data).encode(), 200 if data is not None else 404
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html" if html else "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def count(self, path: str, obj_id: str | None = None) -> int:
+        return self.hits[(path, obj_id)]
+
+
+@pytest.fixture
+def imd():
+    stub = _StubImd()
+    server = stub.serve()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    kwargs = dict(
+        city_base=f"{base}/city/api",
+        mausam_base=f"{base}/mausam/api",
+        nominatim_url=f"{base}/reverse",
+        timeout=5,
+    )
+    yield stub, kwargs
+    server.shutdown()
+    server.server_close()
+
+
+def _run_async(svc, coro_factory):
+    async def main():
+        try:
+            return await coro_factory()
+        finally:
+            await svc.aclose()
+
+    return asyncio.run(main())
+
+
+def test_async_bundle_matches_sync_and_fetches_concurrently(imd):
+    stub, kwargs = imd
+    stub.delay = 0.15
+
+    started = time.perf_counter()
+    expected = service.LatLonWeatherService(**kwargs).bundle(LAT, LON)
+    sync_elapsed = time.perf_counter() - started
+
+    svc = service.AsyncLatLonWeatherService(**kwargs)
+    started = time.perf_counter()
+    got = _run_async(svc, lambda: svc.bundle(LAT, LON))
+    async_elapsed = time.perf_counter() - started
+
+    assert got == expected
+    assert got["forecast"]["today"]["station"] == "Ludhiana"
+    assert got["nearest_aws"]["station"]["name"] == "LUDHIANA_PAU"
+    assert got["district"]["success"] is True
+    assert got["district"]["obj_id"] == 404
+    # six upstream calls: sequential vs two concurrent rounds
+    assert sync_elapsed >= 6 * stub.delay
+    assert async_elapsed < 3.5 * stub.delay
+
+
+def test_concurrent_misses_share_one_request_per_endpoint(imd):
+    stub, kwargs = imd
+    stub.delay = 0.1
+    svc = service.AsyncLatLonWeatherService(**kwargs)
+
+    async def burst():
+        return await asyncio.gather(
+            *(svc.fetch_by_type(LAT, LON, "warnings") for _ in range(25)),
+            *(svc.fetch_by_type(LAT, LON, "bundle") for _ in range(25)),
+        )
+
+    results = _run_async(svc, burst)
+    assert all(r["success"] for r in results)
+    assert results[0]["result"]["record"]["District"] == "LUDHIANA"
+    assert stub.count("/reverse") == 1
+    assert stub.count("/mausam/api/districtwise_rainfall_api.php") == 1  # index
+    assert stub.count("/mausam/api/districtwise_rainfall_api.php", "404") == 1
+    assert stub.count("/mausam/api/warnings_district_api.php", "404") == 1
+    assert stub.count("/city/api/cityweather_loc.php") == 1
+    assert stub.count("/city/api/aws_data_api.php") == 1
+
+
+def test_sync_service_coalesces_threads(imd):
+    stub, kwargs = imd
+    stub.delay = 0.1
+    svc = service.LatLonWeatherService(**kwargs)
+    results = []
+
+    def call():
+        results.append(svc.get_district_warnings_raw(404))
+
+    threads = [threading.Thread(target=call) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 10 and all(r["success"] for r in results)
+    assert stub.count("/mausam/api/warnings_district_api.php", "404") == 1
+
+
+def test_failures_are_not_cached(imd):
+    stub, kwargs = imd
+    stub.fail_next = 1
+    svc = service.AsyncLatLonWeatherService(**kwargs)
+
+    async def twice():
+        first = await svc.fetch_by_type(LAT, LON, "sub_warnings")
+        second = await svc.fetch_by_type(LAT, LON, "sub_warnings")
+        return first, second
+
+    first, second = _run_async(svc, twice)
+    assert first["result"]["success"] is False
+    assert second["result"]["success"] is True
+    assert second["result"]["data"][0]["subdivision"] == "Punjab"
+    assert stub.count("/mausam/api/api_subDivisionWiseWarning.php") == 2
+
+
+def test_non_json_body_degrades_like_sync(imd):
+    stub, kwargs = imd
+    stub.html_paths = {
+        "/city/api/cityweather_loc.php",
+        "/mausam/api/api_subDivisionWiseWarning.php",
+        "/mausam/api/warnings_district_api.php",
+    }
+    expected = service.LatLonWeatherService(**kwargs).bundle(LAT, LON)
+    svc = service.AsyncLatLonWeatherService(**kwargs)
+
+    async def calls():
+        return (
+            await svc.bundle(LAT, LON),
+            await svc.fetch_by_type(LAT, LON, "sub_warnings"),
+            await svc.fetch_by_type(LAT, LON, "district"),
+        )
+
+    bundle, warnings, district = _run_async(svc, calls)
+    assert bundle["forecast"]["success"] is False
+    assert "Invalid JSON" in bundle["forecast"]["error"]
+    assert bundle["forecast"].keys() == expected["forecast"].keys()
+    assert bundle["district"]["success"] is expected["district"]["success"] is False
+    assert bundle["nearest_aws"] == expected["nearest_aws"]
+    assert warnings["result"]["success"] is False
+    assert district["result"]["warnings"]["success"] is False
+    assert district["result"]["rainfall"]["success"] is True
+
+
+def test_unknown_data_type():
+    svc = service.AsyncLatLonWeatherService(city_base="http://unused", mausam_base="http://unused")
+    result = asyncio.run(svc.fetch_by_type(LAT, LON, "pollen"))
+    assert result["success"] is False
+    assert "Unknown data_type 'pollen'" in result["error"]
+
+
+def test_cache_is_bounded_and_expires():
+    cache = service._TTLCache(ttl_seconds=60, max_entries=2)
+    loads = []
+
+    def loader(key):
+        return lambda: loads.append(key) or key
+
+    for key in ("a", "b", "a", "c", "a", "b"):
+        cache.get(loader(key), key)
+    assert loads == ["a", "b", "c", "b"]  # "b" was the least recently used when "c" arrived
+    assert len(cache) == 2
+
+    cache.ttl = 0
+    cache.get(loader("d"), "d")
+    cache.get(loader("d"), "d")
+    assert loads[-2:] == ["d", "d"]
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 import re
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
 import xml.etree.ElementTree as ET
 import zipfile
 
@@ -12,7 +13,10 @@ from models import ContextPOP, RestrictedChemicalFlag
 
 
 _XML_NS = {"a": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-_WORD_BOUNDARY = r"(^|[^a-z0-9]){token}([^a-z0-9]|$)"
+# Zero-width so every boundary position is tried and overlapping aliases are all seen.
+_ALIAS_SCAN = r"(?:^|(?<=[^a-z0-9]))(?=({alternation})(?:[^a-z0-9]|$))"
+# Normalized text never contains a newline, and a newline is a word boundary.
+_BATCH_SEPARATOR = "\n"
 
 
 @dataclass(frozen=True)
@@ -24,6 +28,58 @@ class ChemicalPolicy:
     restriction_text: str
 
 
+@dataclass(frozen=True)
+class _CategoryMatcher:
+    """One compiled alternation over the aliases of a policy category (e.g. "banned")."""
+
+    category: str
+    pattern: re.Pattern[str]
+    aliases: Tuple[str, ...]
+    index_by_alias: Dict[str, int]
+    # aliases[i] matching at a position means these shorter aliases match there too
+    implied: Tuple[Tuple[int, ...], ...]
+
+    def _alias_index(self, matched_text: str) -> int:
+        index = self.index_by_alias.get(matched_text)
+        if index is not None:
+            return index
+        # matched case-insensitively (text and aliases are both lower-cased already)
+        return next(
+            i for i, alias in enumerate(self.aliases)
+            if re.fullmatch(re.escape(alias), matched_text, flags=re.IGNORECASE)
+        )
+
+    def scan(self, lowered_text: str) -> Iterable[Tuple[int, str]]:
+        """(position, alias) for every alias occurrence in the text."""
+        for match in self.pattern.finditer(lowered_text):
+            index = self._alias_index(match.group(1))
+            yield match.start(), self.aliases[index]
+            for other in self.implied[index]:
+                yield match.start(), self.aliases[other]
+
+
+@dataclass(frozen=True)
+class _PolicyMatcher:
+    categories: Tuple[_CategoryMatcher, ...]
+    alias_order: Dict[str, int]  # alias -> position in the alias sheet
+
+    def matched_aliases(self, lowered_texts: Sequence[str]) -> List[Set[str]]:
+        """Aliases found in each text, scanning all texts in one pass per category."""
+        found: List[Set[str]] = [set() for _ in lowered_texts]
+        if not lowered_texts:
+            return found
+        joined = _BATCH_SEPARATOR.join(lowered_texts)
+        starts: List[int] = []
+        offset = 0
+        for text in lowered_texts:
+            starts.append(offset)
+            offset += len(text) + len(_BATCH_SEPARATOR)
+        for matcher in self.categories:
+            for position, alias in matcher.scan(joined):
+                found[bisect_right(starts, position) - 1].add(alias)
+        return found
+
+
 def _normalize(value: str) -> str:
     return re.sub(r"\s+", " ", str(value or "").strip().lower())
 
@@ -91,8 +147,81 @@ def _read_sheet_rows(path: Path) -> List[List[str]]:
     return rows
 
 
+def _trie_alternation(aliases: Iterable[str]) -> str:
+    """
+    Aliases as a prefix-tree regex ("ald(?:icarb(?: sulfo(?:ne|xide)|)|rin)"),
+    so each position branches per character instead of trying every alias.
+    The end-of-alias branch comes last: the longest alias is tried first.
+    """
+    trie: Dict[str, dict] = {}
+    for alias in aliases:
+        node = trie
+        for character in alias:
+            node = node.setdefault(character, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(character) + emit(child) for character, child in sorted(node.items()) if character]
+        if "" in node:
+            branches.append("")
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return emit(trie)
+
+
+def _compile_category(category: str, aliases: Iterable[str]) -> _CategoryMatcher:
+    ordered = tuple(sorted(set(aliases), key=lambda alias: (-len(alias), alias)))
+    pattern = re.compile(
+        _ALIAS_SCAN.format(alternation=_trie_alternation(ordered)), flags=re.IGNORECASE
+    )
+
+    # The scan reports the longest alias at each position; a shorter alias that
+    # matches the start of a longer one (followed by a boundary) is implied by it.
+    heads = [
+        re.compile(re.escape(alias) + r"(?=[^a-z0-9]|$)", flags=re.IGNORECASE)
+        for alias in ordered
+    ]
+    implied = tuple(
+        tuple(
+            j
+            for j in range(len(ordered))
+            if j != i and len(ordered[j]) <= len(alias) and heads[j].match(alias)
+        )
+        for i, alias in enumerate(ordered)
+    )
+    return _CategoryMatcher(
+        category=category,
+        pattern=pattern,
+        aliases=ordered,
+        index_by_alias={alias: index for index, alias in enumerate(ordered)},
+        implied=implied,
+    )
+
+
+def _compile_policy_matcher(
+    alias_to_ids: Dict[str, Set[str]],
+    policies_by_id: Dict[str, ChemicalPolicy],
+) -> _PolicyMatcher:
+    aliases_by_category: Dict[str, Set[str]] = {}
+    for alias, chemical_ids in alias_to_ids.items():
+        for chemical_id in chemical_ids:
+            policy = policies_by_id.get(chemical_id)
+            if policy:
+                aliases_by_category.setdefault(_normalize(policy.status), set()).add(alias)
+
+    return _PolicyMatcher(
+        categories=tuple(
+            _compile_category(category, aliases)
+            for category, aliases in sorted(aliases_by_category.items())
+        ),
+        alias_order={alias: index for index, alias in enumerate(alias_to_ids)},
+    )
+
+
 @lru_cache(maxsize=1)
-def _build_lookup() -> Tuple[Dict[str, Set[str]], Dict[str, ChemicalPolicy]]:
+def _build_lookup() -> Tuple[Dict[str, Set[str]], Dict[str, ChemicalPolicy], _PolicyMatcher]:
     base_path = Path(__file__).resolve().parent
     alias_path = base_path / "data" / "chemical_name_alias.xlsx"
     banned_path = base_path / "data" / "banned_chemicals.xlsx"
@@ -139,25 +268,29 @@ def _build_lookup() -> Tuple[Dict[str, Set[str]], Dict[str, ChemicalPolicy]]:
                 continue
             alias_to_ids.setdefault(normalized, set()).add(chemical_id)
 
-    return alias_to_ids, policies_by_id
+    return alias_to_ids, policies_by_id, _compile_policy_matcher(alias_to_ids, policies_by_id)
 
 
-def _find_policy_matches(text: str) -> Dict[str, ChemicalPolicy]:
-    alias_to_ids, policies_by_id = _build_lookup()
-    lowered_text = _normalize(text)
-    matched: Dict[str, ChemicalPolicy] = {}
+def _find_policy_matches_batch(texts: Sequence[str]) -> List[Dict[str, ChemicalPolicy]]:
+    """Policies whose chemical name or alias appears (as a whole word) in each text."""
+    alias_to_ids, policies_by_id, matcher = _build_lookup()
+    results: List[Dict[str, ChemicalPolicy]] = []
 
-    for alias, chemical_ids in alias_to_ids.items():
-        pattern = _WORD_BOUNDARY.format(token=re.escape(alias))
-        if not re.search(pattern, lowered_text, flags=re.IGNORECASE):
-            continue
+    for aliases in matcher.matched_aliases([_normalize(text) for text in texts]):
+        matched: Dict[str, ChemicalPolicy] = {}
+        # alias-sheet order, as the per-alias scan reported them
+        for alias in sorted(aliases, key=matcher.alias_order.__getitem__):
+            for chemical_id in sorted(alias_to_ids[alias]):
+                policy = policies_by_id.get(chemical_id)
+                if policy:
+                    matched[chemical_id] = policy
+        results.append(matched)
 
-        for chemical_id in sorted(chemical_ids):
-            policy = policies_by_id.get(chemical_id)
-            if policy:
-                matched[chemical_id] = policy
+    return results
 
-    return matched
+
+def _find_policy_matches(text: str) -> Dict[str, ChemicalPolicy]:
+    return _find_policy_matches_batch([text])[0]
 
 
 def _compliance_from_matched_policies(
@@ -190,14 +323,29 @@ def analyze_text_for_chemical_compliance(
     """
     Apply the same chemical policy rules as retrieved POP context, but to arbitrary text (e.g. the user query).
     """
-    matched = _find_policy_matches(text)
-    if not matched:
-        return [], []
-    restricted, blocked, _ = _compliance_from_matched_policies(matched)
-    return (
-        sorted(restricted.values(), key=lambda flag: flag.chemical_name.lower()),
-        sorted(blocked, key=str.lower),
-    )
+    return analyze_texts_for_chemical_compliance([text])[0]
+
+
+def analyze_texts_for_chemical_compliance(
+    texts: Sequence[str],
+) -> List[Tuple[List[RestrictedChemicalFlag], List[str]]]:
+    """
+    Batch form of analyze_text_for_chemical_compliance: one (restricted, blocked) pair per text,
+    with all texts scanned together.
+    """
+    results: List[Tuple[List[RestrictedChemicalFlag], List[str]]] = []
+    for matched in _find_policy_matches_batch(texts):
+        if not matched:
+            results.append(([], []))
+            continue
+        restricted, blocked, _ = _compliance_from_matched_policies(matched)
+        results.append(
+            (
+                sorted(restricted.values(), key=lambda flag: flag.chemical_name.lower()),
+                sorted(blocked, key=str.lower),
+            )
+        )
+    return results
 
 
 def filter_pop_contexts_for_chemical_compliance(
@@ -207,8 +355,9 @@ def filter_pop_contexts_for_chemical_compliance(
     restricted_flags: Dict[str, RestrictedChemicalFlag] = {}
     blocked_chemical_names: Set[str] = set()
 
-    for context in contexts:
-        matched_policies = _find_policy_matches(context.text)
+    for context, matched_policies in zip(
+        contexts, _find_policy_matches_batch([context.text for context in contexts])
+    ):
         if not matched_policies:
             filtered_contexts.append(context)
             continue
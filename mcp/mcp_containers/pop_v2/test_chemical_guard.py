@@ -0,0 +1,118 @@
+"""Chemical guard: compiled per-category alias scan vs the per-alias regex loop it replaces, plus a benchmark."""
+
+import random
+import re
+import time
+
+import pytest
+
+import chemical_guard as cg
+from models import ContextPOP
+
+_LEGACY_BOUNDARY = r"(^|[^a-z0-9]){token}([^a-z0-9]|$)"
+FILLER = [
+    "apply", "spray", "before", "sowing", "per", "acre", "ml", "litre", "water", "crop", "paddy",
+    "wheat", "mixed", "with", "dose", "2.5", "kg/ha", "(", ")", "-", ",", "x", "b", "ec", "wp",
+]
+
+
+def _legacy_find_policy_matches(text):
+    alias_to_ids, policies_by_id, _ = cg._build_lookup()
+    lowered_text = cg._normalize(text)
+    matched = {}
+    for alias, chemical_ids in alias_to_ids.items():
+        pattern = _LEGACY_BOUNDARY.format(token=re.escape(alias))
+        if not re.search(pattern, lowered_text, flags=re.IGNORECASE):
+            continue
+        for chemical_id in sorted(chemical_ids):
+            policy = policies_by_id.get(chemical_id)
+            if policy:
+                matched[chemical_id] = policy
+    return matched
+
+
+def _texts(n, seed=3):
+    rng = random.Random(seed)
+    aliases = list(cg._build_lookup()[0])
+    out = ["", "   ", "no chemicals here", "xlindane", "lindanex", "lindane.", "(bhc)"]
+    for _ in range(n):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(3, 30))]
+        for _ in range(rng.randint(0, 3)):
+            alias = rng.choice(aliases)
+            if rng.random() < 0.3:
+                alias = alias.upper()
+            if rng.random() < 0.15:
+                alias = alias[: max(1, len(alias) - 2)]  # near miss
+            words.insert(rng.randrange(len(words) + 1), alias)
+        joiner = rng.choice([" ", "  ", "\n", ", ", "-"])
+        out.append(joiner.join(words))
+    return out
+
+
+def test_matches_legacy_scan():
+    for text in _texts(1500):
+        got = cg._find_policy_matches(text)
+        want = _legacy_find_policy_matches(text)
+        assert list(got) == list(want), text
+
+
+def test_overlapping_and_prefix_aliases():
+    # "aldicarb" is a prefix of "aldicarb sulfoxide"; "hch" sits inside "gamma-hch"
+    for text in ["aldicarb sulfoxide", "use aldicarb sulfone or temik", "Lindane (Gamma-HCH)", "aldicarbsulfoxide"]:
+        assert list(cg._find_policy_matches(text)) == list(_legacy_find_policy_matches(text))
+    assert cg._trie_alternation(["aldicarb", "aldicarb sulfone", "aldicarb sulfoxide", "aldrin"]) == (
+        "ald(?:icarb(?:\\ sulfo(?:ne|xide)|)|rin)"
+    )
+
+
+def test_batch_matches_single_text_calls():
+    texts = _texts(300, seed=8)
+    assert cg._find_policy_matches_batch(texts) == [cg._find_policy_matches(t) for t in texts]
+    assert cg._find_policy_matches_batch([]) == []
+    assert cg.analyze_texts_for_chemical_compliance(texts[:50]) == [
+        cg.analyze_text_for_chemical_compliance(t) for t in texts[:50]
+    ]
+
+
+def test_context_filter_unchanged():
+    texts = _texts(200, seed=13)
+    contexts = [ContextPOP.model_construct(text=t, meta_data=None) for t in texts]
+    kept, restricted, blocked = cg.filter_pop_contexts_for_chemical_compliance(contexts)
+
+    want_kept, want_restricted, want_blocked = [], {}, set()
+    for context in contexts:
+        matched = _legacy_find_policy_matches(context.text)
+        ctx_restricted, ctx_blocked, has_blocked = cg._compliance_from_matched_policies(matched)
+        want_restricted.update(ctx_restricted)
+        want_blocked.update(ctx_blocked)
+        if not has_blocked:
+            want_kept.append(context)
+
+    assert kept == want_kept
+    assert [f.chemical_id for f in restricted] == [
+        f.chemical_id for f in sorted(want_restricted.values(), key=lambda f: f.chemical_name.lower())
+    ]
+    assert blocked == sorted(want_blocked, key=str.lower)
+
+
+def test_compiled_scan_is_faster():
+    texts = _texts(200, seed=21)
+    cg._build_lookup()
+
+    started = time.perf_counter()
+    for text in texts:
+        _legacy_find_policy_matches(text)
+    legacy = (time.perf_counter() - started) / len(texts) * 1e6
+
+    started = time.perf_counter()
+    for text in texts:
+        cg._find_policy_matches(text)
+    compiled = (time.perf_counter() - started) / len(texts) * 1e6
+
+    started = time.perf_counter()
+    cg._find_policy_matches_batch(texts)
+    batch = (time.perf_counter() - started) / len(texts) * 1e6
+
+    print(f"\nper text: legacy {legacy:.0f}us, compiled {compiled:.0f}us, batch {batch:.0f}us")
+    assert compiled * 3 < legacy
+    assert batch < legacy
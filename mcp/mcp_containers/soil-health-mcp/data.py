@@ -1,9776 +1,30 @@
-# Hardcoded Soil Health Data
-SOILHEALTH_DATA = {
-    "states": {
-        "ANDAMAN & NICOBAR": "63f9ce47519359b7438e76fa",
-        "ANDHRA PRADESH": "63f957b089d86ca9e2c00e14",
-        "ARUNACHAL PRADESH": "63f86a1cd2e83876f03e7d32",
-        "ASSAM": "63f87b48d2e83876f040050d",
-        "BIHAR": "63f86570d2e83876f03e015b",
-        "CHHATTISGARH": "63f8e35adbc0f7fe06708342",
-        "DELHI": "63f5ceb98cec41e6c95ce3a8",
-        "GOA": "63f9bcdc519359b7438cdeb3",
-        "GUJARAT": "63f922a6dbc0f7fe06751641",
-        "HARYANA": "63f5c2cf98d5e0c03dba5507",
-        "HIMACHAL PRADESH": "63f21f6089e2887695740385",
-        "JAMMU & KASHMIR": "63f20ca84fadd776ffd9d608",
-        "JHARKHAND": "63f893d236497c055ce2e09a",
-        "KARNATAKA": "63f99fbd519359b7438a84ca",
-        "KERALA": "63f9bd39519359b7438ce777",
-        "LADAKH": "63f878a8c660ddb223461a90",
-        "MADHYA PRADESH": "63f8e729dbc0f7fe0670d050",
-        "MAHARASHTRA": "63f9322a89d86ca9e2bca5df",
-        "MANIPUR": "63f870acd2e83876f03f0b46",
-        "MEGHALAYA": "63f87562d2e83876f03f7a2c",
-        "MIZORAM": "63f873e5d2e83876f03f573a",
-        "NAGALAND": "63f86f4dd2e83876f03eea29",
-        "ODISHA": "63f8bb7b36497c055ce5624b",
-        "PUDUCHERRY": "63f9ce2c519359b7438e746d",
-        "PUNJAB": "63f2495789e288769575a424",
-        "RAJASTHAN": "63f5cef58cec41e6c95ce84e",
-        "SIKKIM": "63f869bfd2e83876f03e7396",
-        "TAMIL NADU": "63f9be9f519359b7438d08bb",
-        "TELANGANA": "63f871f5c660ddb223457dca",
-        "TRIPURA": "63f874a0d2e83876f03f6866",
-        "UTTAR PRADESH": "63f600f38cec41e6c9607e6b",
-        "UTTARAKHAND": "63f37f20491ca1c6048696ce",
-        "WEST BENGAL": "63f87a1836497c055ce09df5"
-    },
-    "districts": {
-        "63f9ce47519359b7438e76fa": {
-            "Car Nicobar": "63f9ce61519359b7438e799c",
-            "Diglipur": "63f9ce89519359b7438e7d8c",
-            "Ferrargunj": "63f9ce47519359b7438e7700",
-            "Great Nicobar": "63f9ce7a519359b7438e7c20",
-            "Little Andaman": "63f9ce5d519359b7438e7939",
-            "Mayabunder": "63f9ce9a519359b7438e7f23",
-            "Nancowry": "63f9ce64519359b7438e79ee",
-            "Port Blair": "63f9ce56519359b7438e7888",
-            "Rangat": "63f9cea4519359b7438e801f",
-            "SOUTH ANDAMANS": "63f9ce47519359b7438e76fd",
-            "NICOBARS": "63f9ce61519359b7438e7999"
-        },
-        "63f957b089d86ca9e2c00e14": {
-            "A.Konduru": "63f99c52519359b7438a4432",
-            "Achanta": "63f9976a519359b74389bec3",
-            "Addanki": "63f99cba519359b7438a4be6",
-            "Addateegala": "63f99ac4519359b7438a1c7c",
-            "Adoni": "63f95a9489d86ca9e2c05066",
-            "Agali": "63f99f0c519359b7438a779b",
-            "Agiripalle": "63f99c03519359b7438a3e43",
-            "Ainavilli": "63f99b74519359b7438a2fcc",
-            "Akividu": "63f99757519359b74389bcc3",
-            "Alamuru": "63f99b60519359b7438a2dac",
-            "Allagadda": "63f99f9f519359b7438a8293",
-            "Allavaram": "63f99b85519359b7438a31bf",
-            "Allur": "63f95b1789d86ca9e2c05c11",
-            "Alur": "63f95aa789d86ca9e2c0522e",
-            "Amadagur": "63f99f27519359b7438a7998",
-            "Amadalavalasa": "63f95d0e89d86ca9e2c08aa6",
-            "Amalapuram": "63f99b88519359b7438a3207",
-            "Amarapuram": "63f99f04519359b7438a7704",
-            "Amaravathi": "63f99cec519359b7438a4fa0",
-            "Ambajipeta": "63f99b7a519359b7438a307f",
-            "Amruthalur": "63f99c7d519359b7438a476c",
-            "Anakapalle": "63f99877519359b74389dbb0",
-            "Anandapuram": "63f95d6089d86ca9e2c09246",
-            "Anantapur": "63f9581189d86ca9e2c016ee",
-            "Ananthagiri": "6492b7d1882c8da847736f16",
-            "Ananthasagaram": "63f95b2a89d86ca9e2c05ddf",
-            "Anaparthy": "63f9599689d86ca9e2c03984",
-            "Anumasamudrampeta": "63f95b0c89d86ca9e2c05b2c",
-            "Araku Valley": "63f99956519359b74389f490",
-            "Ardhaveedu": "63f95b9d89d86ca9e2c06869",
-            "Aspari": "63f95aab89d86ca9e2c0528a",
-            "Atchampet": "63f99ce3519359b7438a4ef7",
-            "Atchutapuram": "63f9989c519359b74389dfd3",
-            "Atlur": "63f9595b89d86ca9e2c03444",
-            "Atmakur": "6492b7d3882c8da847736f20",
-            "Atreyapuram": "63f99b56519359b7438a2c6e",
-            "Attili": "63f99755519359b74389bc7b",
-            "Avanigadda": "63f95a5789d86ca9e2c04ae2",
-            "B.Kodur": "63f9591289d86ca9e2c02d6f",
-            "B.Kothakota": "63f99eb6519359b7438a714b",
-            "Badangi": "63f95db789d86ca9e2c09a01",
-            "Badvel": "63f9591689d86ca9e2c02dd0",
-            "Baireddipalle": "63f9588789d86ca9e2c02147",
-            "Balayapalle": "63f99d51519359b7438a571f",
-            "Balijipeta": "63f99814519359b74389d0c2",
-            "Ballikurava": "63f99ca4519359b7438a4a43",
-            "Banaganapalle": "63f99f7c519359b7438a7ff3",
-            "Bandi Atmakur": "63f99f69519359b7438a7e86",
-            "Bangarupalem": "63f958c489d86ca9e2c02699",
-            "Bantumilli": "63f95a0789d86ca9e2c043bd",
-            "Bapatla": "63f99c91519359b7438a48dd",
-            "Bapulapadu": "63f959ed89d86ca9e2c04156",
-            "Bathalapalle": "63f99ecb519359b7438a72e4",
-            "Bellamkonda": "63f99ce0519359b7438a4eb4",
-            "Beluguppa": "63f957e989d86ca9e2c01363",
-            "Bestawaripeta": "63f95bd289d86ca9e2c06d6b",
-            "Bethamcherla": "63f99f5b519359b7438a7d7a",
-            "Bhamini": "63f9979f519359b74389c467",
-            "Bhattiprolu": "63f99c88519359b7438a4830",
-            "Bheemunipatnam": "63f95d6d89d86ca9e2c0936c",
-            "Bhimadole": "63f99bce519359b7438a39d4",
-            "Bhimavaram": "63f99771519359b74389bf8c",
-            "Bhogapuram": "63f95e4f89d86ca9e2c0a81b",
-            "Biccavolu": "63f9599389d86ca9e2c0393c",
-            "Bobbili": "63f95da789d86ca9e2c0987c",
-            "Bogole": "63f95af489d86ca9e2c05915",
-            "Bollapalle": "63f99cfe519359b7438a50fc",
-            "Bommanahal": "63f957bc89d86ca9e2c00f1a",
-            "Bondapalle": "63f95e0189d86ca9e2c0a0df",
-            "Brahmamgarimattam": "63f958fc89d86ca9e2c02b8c",
-            "Brahmasamudram": "63f957ee89d86ca9e2c013e4",
-            "Buchinaidu Kandriga": "63f99df9519359b7438a6360",
-            "Buchireddipalem": "63f95b1f89d86ca9e2c05ce4",
-            "Bukkapatnam": "63f99ee9519359b7438a7529",
-            "Bukkaraya Samudram": "63f9580e89d86ca9e2c016a6",
-            "Burja": "63f95cf789d86ca9e2c08881",
-            "Butchayyapeta": "63f99883519359b74389dcfe",
-            "Buttayagudem": "63f99bae519359b7438a3635",
-            "C.Belagal": "63f95a7d89d86ca9e2c04e39",
-            "Chagalamarri": "63f99fb8519359b7438a8464",
-            "Chagallu": "63f959ab89d86ca9e2c03b86",
-            "Chakrayapet": "63f9597989d86ca9e2c036e6",
-            "Challapalle": "63f95a5189d86ca9e2c04a4d",
-            "Chandarlapadu": "63f99c67519359b7438a45c2",
-            "Chandra Sekhara Puram": "63f95c1189d86ca9e2c0734a",
-            "Chandragiri": "63f99e15519359b7438a6561",
-            "Chapad": "63f9592389d86ca9e2c02f07",
-            "Chatrai": "63f99bf3519359b7438a3d16",
-            "Chebrolu": "63f959dc89d86ca9e2c03fb1",
-            "Cheedikada": "63f99859519359b74389d85b",
-            "Cheepurupalle": "63f95df289d86ca9e2c09f78",
-            "Chejerla": "63f95b2689d86ca9e2c05d83",
-            "Chennekothapalle": "63f99ef2519359b7438a75c8",
-            "Chennur": "6492b7d7882c8da847736f4a",
-            "Cherukupalle H/O Arumbaka": "63f99c8b519359b7438a486e",
-            "Chilakaluripet H/O.Purushotha Patnam": "63f99d21519359b7438a5391",
-            "Chilamathur": "63f99f3d519359b7438a7b3c",
-            "Chillakur": "63f99d6c519359b7438a5917",
-            "Chimakurthi": "63f95bc289d86ca9e2c06be4",
-            "Chinaganjam": "63f99cc5519359b7438a4cb1",
-            "Chinnagottigallu": "63f99e1b519359b7438a65d6",
-            "Chinnamandem": "63f99e49519359b7438a6946",
-            "Chintalapudi": "63f99b99519359b7438a33ee",
-            "Chintapalle": "63f99a2c519359b7438a0c08",
-            "Chinthakommadinne": "63f9596c89d86ca9e2c035af",
-            "Chintur": "63f998c3519359b74389e40a",
-            "Chippagiri": "63f95abb89d86ca9e2c05415",
-            "Chirala": "63f99cc2519359b7438a4c7b",
-            "Chittamur": "63f99d84519359b7438a5add",
-            "Chittoor": "63f9587b89d86ca9e2c02021",
-            "Chitvel": "63f99e6d519359b7438a6bfb",
-            "Chodavaram": "63f9987d519359b74389dc61",
-            "Chowdepalle": "63f9585789d86ca9e2c01cc6",
-            "Cumbum": "63f95b9f89d86ca9e2c068ac",
-            "D.Hirehal": "63f957b189d86ca9e2c00e1a",
-            "Dachepalle": "63f99cd4519359b7438a4dd5",
-            "Dagadarthi": "63f95b1289d86ca9e2c05ba1",
-            "Dakkili": "63f99d30519359b7438a54a0",
-            "Darsi": "63f95b9089d86ca9e2c06734",
-            "Dattirajeru": "63f95dd189d86ca9e2c09c5f",
-            "Denduluru": "63f99bde519359b7438a3b99",
-            "Denkada": "63f95e4989d86ca9e2c0a78d",
-            "Devanakonda": "63f95aaf89d86ca9e2c052f0",
-            "Devarapalle": "6492b7d3882c8da847736f1c",
-            "Devipatnam": "63f99aa4519359b7438a18e5",
-            "Dharmavaram": "63f99ec7519359b7438a729c",
-            "Dhone": "63f99f87519359b7438a80b8",
-            "Donakonda": "63f95b7d89d86ca9e2c065a8",
-            "Doravarisatram": "63f99da0519359b7438a5ce1",
-            "Dornala": "63f95b7689d86ca9e2c064f5",
-            "Dornipadu": "63f99fa5519359b7438a82f9",
-            "Duggirala": "63f959d389d86ca9e2c03ede",
-            "Dumbriguda": "63f99946519359b74389f2d6",
-            "Durgi": "63f99ccc519359b7438a4d39",
-            "Duttalur": "63f95aff89d86ca9e2c05a06",
-            "Duvvur": "63f958f489d86ca9e2c02ad4",
-            "Dwarakatirumala": "63f99bc5519359b7438a38d3",
-            "Edlapadu": "63f99d25519359b7438a53e3",
-            "Eluru": "63f99bda519359b7438a3b29",
-            "Etcherla": "63f95d5589d86ca9e2c09132",
-            "G.Konduru": "63f99c5c519359b7438a44e7",
-            "G.Madugula": "63f999f1519359b7438a059e",
-            "GUNTUR EAST": "63f959ec89d86ca9e2c0413e",
-            "Gadivemula": "63f99f63519359b7438a7e14",
-            "Gajapathinagaram": "63f95de289d86ca9e2c09e02",
-            "Gajuwaka": "63f95d7889d86ca9e2c09462",
-            "Galiveedu": "63f99e46519359b7438a68fe",
-            "Gampalagudem": "63f99c47519359b7438a4361",
-            "Ganapavaram": "63f99bec519359b7438a3c97",
-            "Gandepalle": "63f99b36519359b7438a28e3",
-            "Gandlapenta": "63f99ede519359b7438a7456",
-            "Gangadhara Nellore": "63f9587389d86ca9e2c01f70",
-            "Gangavaram": "6492b7d3882c8da847736f1a",
-            "Ganguvarisigadam": "63f95d0589d86ca9e2c089cd",
-            "Gannavaram": "63f959f389d86ca9e2c041e9",
-            "Gantyada": "63f95e0889d86ca9e2c0a186",
-            "Gara": "63f95d2c89d86ca9e2c08d63",
-            "Garividi": "63f95dea89d86ca9e2c09eb3",
-            "Garladinne": "63f957f989d86ca9e2c014e4",
-            "Garugubilli": "63f997f2519359b74389cd1a",
-            "Ghantasala": "63f95a4689d86ca9e2c0494a",
-            "Giddalur": "63f95bda89d86ca9e2c06e1e",
-            "Gokavaram": "63f9598189d86ca9e2c03796",
-            "Gollaprolu": "63f99b30519359b7438a2830",
-            "Golugonda": "63f9983b519359b74389d513",
-            "Gonegandla": "63f95a9189d86ca9e2c05014",
-            "Gooty": "63f957c689d86ca9e2c01015",
-            "Gopalapatnam": "63f95d7d89d86ca9e2c094e5",
-            "Gopalapuram": "63f9599e89d86ca9e2c03a43",
-            "Gopavaram": "63f9591b89d86ca9e2c02e4a",
-            "Gorantla": "63f99f2b519359b7438a79e5",
-            "Gospadu": "63f99f78519359b7438a7fa6",
-            "Gudem Kotha Veedhi": "63f99a5a519359b7438a10e2",
-            "Gudibanda": "63f99f06519359b7438a7733",
-            "Gudipala": "63f958cf89d86ca9e2c0279c",
-            "Gudivada": "63f95a0b89d86ca9e2c0441e",
-            "Gudlavalleru": "63f95a3189d86ca9e2c0475d",
-            "Gudluru": "63f95ad389d86ca9e2c0561e",
-            "Gudupalle": "63f958a189d86ca9e2c023a0",
-            "Gudur": "6492b7d4882c8da847736f2a",
-            "Guduru": "63f95a3d89d86ca9e2c04874",
-            "Gummagatta": "63f957ec89d86ca9e2c013ab",
-            "Gummalakshmipuram": "63f997c0519359b74389c7ab",
-            "Guntakal": "63f957c289d86ca9e2c00fb4",
-            "Guntur": "63f959cf89d86ca9e2c03e7b",
-            "Gurazala": "63f99cd1519359b7438a4da1",
-            "Gurla": "63f95df989d86ca9e2c0a01a",
-            "Gurramkonda": "63f99e94519359b7438a6ec0",
-            "Halaharvi": "63f95aa289d86ca9e2c051b4",
-            "Hanumanthuni Padu": "63f95bcc89d86ca9e2c06ce2",
-            "Hindupur": "63f99f36519359b7438a7ab6",
-            "Hiramandalam": "63f95ca989d86ca9e2c0814b",
-            "Holagunda": "63f95a9e89d86ca9e2c0514e",
-            "Hukumpeta": "63f999ae519359b74389fe2e",
-            "I. Polavaram": "63f99b6f519359b7438a2f5a",
-            "Ibrahimpatnam": "6492b7d5882c8da847736f30",
-            "Ichchapuram": "63f95c7289d86ca9e2c07c32",
-            "Indukurpet": "63f95b4c89d86ca9e2c06101",
-            "Inkollu": "63f99cb3519359b7438a4b6a",
-            "Ipur": "63f99d10519359b7438a5244",
-            "Iragavaram": "63f99764519359b74389be10",
-            "Irala": "63f9585089d86ca9e2c01c27",
-            "Jaggampeta": "63f99b1f519359b7438a264f",
-            "Jaggayyapeta": "63f99c2b519359b7438a413f",
-            "Jaladanki": "63f95aee89d86ca9e2c0588a",
-            "Jalumuru": "63f95ce189d86ca9e2c08689",
-            "Jami": "63f95e2f89d86ca9e2c0a528",
-            "Jammalamadugu": "63f9592b89d86ca9e2c02fc4",
-            "Janakavarampanguluru": "63f99cb6519359b7438a4b99",
-            "Jangareddigudem": "63f99bbe519359b7438a380c",
-            "Jeelugu Milli": "63f99ba8519359b7438a35a2",
-            "Jiyyammavalasa": "63f997e7519359b74389cbf6",
-            "Jupadu Bungalow": "63f99f48519359b7438a7c1b",
-            "K Gangavaram": "63f99b6b519359b7438a2edb",
-            "K.Kotapadu": "63f99867519359b74389d9de",
-            "K.V.B.Puram": "63f99e09519359b7438a6472",
-            "Kadapa": "63f9596a89d86ca9e2c03576",
-            "Kadiam": "63f9599889d86ca9e2c039bd",
-            "Kadiri": "63f99ee2519359b7438a7499",
-            "Kaikalur": "63f99c11519359b7438a3f55",
-            "Kajuluru": "63f99b4e519359b7438a2ba5",
-            "Kakinada (Rural)": "63f99b44519359b7438a2a71",
-            "Kakinada (Urban)": "63f99b47519359b7438a2ae1",
-            "Kakumanu": "63f959e689d86ca9e2c0409f",
-            "Kalakada": "63f99e98519359b7438a6f17",
-            "Kalasapadu": "63f9590689d86ca9e2c02c58",
-            "Kalidindi": "63f99c18519359b7438a3fca",
-            "Kaligiri": "63f95af789d86ca9e2c05953",
-            "Kalikiri": "63f99ea7519359b7438a7021",
-            "Kalla": "63f99774519359b74389bfde",
-            "Kallur": "63f95a8189d86ca9e2c04ea4",
-            "Kaluvoya": "63f95b2e89d86ca9e2c05e40",
-            "Kalyandurg": "63f957f189d86ca9e2c01427",
-            "Kamalapuram": "63f9594f89d86ca9e2c03319",
-            "Kamavarapukota": "63f99bc2519359b7438a387c",
-            "Kambadur": "63f9581c89d86ca9e2c017fa",
-            "Kambhamvaripalle": "63f99e9c519359b7438a6f69",
-            "Kanaganapalle": "63f99ec4519359b7438a7268",
-            "Kanchikacherla": "63f99c63519359b7438a4570",
-            "Kanchili": "63f95c6689d86ca9e2c07b0e",
-            "Kandukur": "63f95ac889d86ca9e2c0554d",
-            "Kanekal": "63f957b889d86ca9e2c00ec3",
-            "Kanigiri": "63f95be889d86ca9e2c06f7d",
-            "Kankipadu": "63f95a1689d86ca9e2c0451c",
-            "Kapileswarapuram": "63f99b67519359b7438a2e75",
-            "Karamchedu": "63f99cb1519359b7438a4b45",
-            "Karapa": "63f99b4b519359b7438a2b44",
-            "Karempudi": "63f99cd7519359b7438a4e13",
-            "Karlapalem": "63f99c8f519359b7438a48c2",
-            "Karvetinagar": "63f9583a89d86ca9e2c01ad7",
-            "Kasimkota": "63f99893519359b74389deb7",
-            "Katrenikona": "63f99b8e519359b7438a32b5",
-            "Kavali": "63f95af189d86ca9e2c058c8",
-            "Kaviti": "63f95c7889d86ca9e2c07cc0",
-            "Khajipet": "63f9591f89d86ca9e2c02eb0",
-            "Kirlampudi": "63f99b22519359b7438a26b0",
-            "Kodavalur": "63f95b1c89d86ca9e2c05c92",
-            "Kodumur": "63f95a8f89d86ca9e2c04fe0",
-            "Kodur": "63f99e84519359b7438a6d9b",
-            "Koduru": "63f95a5c89d86ca9e2c04b40",
-            "Koilkuntla": "63f99f96519359b7438a81d6",
-            "Kolimigundla": "63f99fad519359b7438a8393",
-            "Kollipara": "63f959d689d86ca9e2c03f26",
-            "Kollur": "63f99c84519359b7438a47f2",
-            "Komarada": "63f997ac519359b74389c5ba",
-            "Komarolu": "63f95bde89d86ca9e2c06e8e",
-            "Konakanamitla": "63f95ba889d86ca9e2c06982",
-            "Kondapi": "63f95bf189d86ca9e2c07047",
-            "Kondapuram": "6492b7d6882c8da847736f40",
-            "Korisapadu": "63f99cbf519359b7438a4c47",
-            "Korukonda": "63f9598589d86ca9e2c037f7",
-            "Kosigi": "63f95a6289d86ca9e2c04bd7",
-            "Kota": "6492b7d7882c8da847736f46",
-            "Kotabommali": "63f95cd889d86ca9e2c085b0",
-            "Kotananduru": "63f99b07519359b7438a23c0",
-            "Kotauratla": "63f9988a519359b74389ddc8",
-            "Kotha Patnam": "63f95bfd89d86ca9e2c0716a",
-            "Kothacheruvu": "63f99eec519359b7438a7553",
-            "Kothapalle": "6492b7d5882c8da847736f2e",
-            "Kothapeta": "63f99b65519359b7438a2e41",
-            "Kothavalasa": "63f95e2989d86ca9e2c0a49a",
-            "Kothuru": "63f95c2189d86ca9e2c074d3",
-            "Kovur": "63f95b4989d86ca9e2c060cd",
-            "Kovvur": "63f959a889d86ca9e2c03b2f",
-            "Kowthalam": "63f95a6989d86ca9e2c04c65",
-            "Koyyalagudem": "63f99bbb519359b7438a37b0",
-            "Koyyuru": "63f99a79519359b7438a1445",
-            "Krishnagiri": "63f95ab389d86ca9e2c0533d",
-            "Krosuru": "63f99ce8519359b7438a4f53",
-            "Kruthivennu": "63f95a0489d86ca9e2c04370",
-            "Kudair": "63f957f689d86ca9e2c014a1",
-            "Kukunoor": "63f99b95519359b7438a3365",
-            "Kunavaram": "63f998b9519359b74389e2eb",
-            "Kundurpi": "63f9581a89d86ca9e2c017c6",
-            "Kuppam": "63f958ac89d86ca9e2c02492",
-            "Kurabalakota": "63f99eae519359b7438a70c0",
-            "Kurichedu": "63f95b8689d86ca9e2c06640",
-            "Kurnool Rural": "63f95a8689d86ca9e2c04f0f",
-            "Kurnool Urban": "63f95ac389d86ca9e2c054c5",
-            "Kurupam": "63f997d6519359b74389ca19",
-            "Lakkavarapukota": "63f95e2289d86ca9e2c0a3f8",
-            "Lakkireddipalle": "63f99e57519359b7438a6a57",
-            "Lakshminarsupeta": "63f95cb189d86ca9e2c08215",
-            "Laveru": "63f95d4089d86ca9e2c08f49",
-            "Lepakshi": "63f99f3a519359b7438a7b08",
-            "Lingala": "63f9593989d86ca9e2c0310f",
-            "Lingapalem": "63f99ba0519359b7438a34ae",
-            "Lingasamudram": "63f95acf89d86ca9e2c055b8",
-            "Machavaram": "63f99cdd519359b7438a4e85",
-            "Macherla": "63f99cc7519359b7438a4cd8",
-            "Machilipatnam": "63f95a4a89d86ca9e2c049b5",
-            "Madakasira": "63f99efe519359b7438a769e",
-            "Madanapalle": "63f99eb8519359b7438a717a",
-            "Maddikera (East)": "63f95abe89d86ca9e2c0545d",
-            "Maddipadu": "63f95bbe89d86ca9e2c06b7e",
-            "Madugula": "63f9984f519359b74389d750",
-            "Mahanandi": "63f99f72519359b7438a7f39",
-            "Maharanipeta": "63f95d7d89d86ca9e2c094de",
-            "Makavarapalem": "63f9988e519359b74389de38",
-            "Makkuva": "63f99801519359b74389ced6",
-            "Malikipuram": "63f99b82519359b7438a315c",
-            "Mamidikuduru": "63f99b7c519359b7438a30c2",
-            "Mandapeta": "63f99b58519359b7438a2cbb",
-            "Mandasa": "63f95c5489d86ca9e2c0796d",
-            "Mandavalli": "63f99c09519359b7438a3eb8",
-            "Mangalagiri": "63f959c389d86ca9e2c03d74",
-            "Mantralayam": "63f95a5e89d86ca9e2c04b71",
-            "Manubolu": "63f95b5b89d86ca9e2c0626c",
-            "Maredumilli": "63f99a97519359b7438a1780",
-            "Markapur": "63f95b9889d86ca9e2c067f4",
-            "Marripadu": "63f95b0389d86ca9e2c05a58",
-            "Marripudi": "63f95bc789d86ca9e2c06c5e",
-            "Martur": "63f99ca8519359b7438a4a8b",
-            "Medikonduru": "63f959cc89d86ca9e2c03e38",
-            "Meliaputti": "63f95c3389d86ca9e2c07680",
-            "Mentada": "63f95ddb89d86ca9e2c09d47",
-            "Merakamudidam": "63f95dc889d86ca9e2c09b90",
-            "Midthur": "63f99f56519359b7438a7d23",
-            "Mogalthur": "63f99777519359b74389c021",
-            "Mopidevi": "63f95a5489d86ca9e2c04a8b",
-            "Movva": "63f95a4289d86ca9e2c048f3",
-            "Muddanur": "63f9592f89d86ca9e2c03034",
-            "Mudigubba": "63f99ed1519359b7438a7356",
-            "Mudinepalle": "63f99c1b519359b7438a4012",
-            "Mulagada": "63f95d7f89d86ca9e2c0950f",
-            "Mulakalacheruvu": "63f99e88519359b7438a6de3",
-            "Mummidivaram": "63f99b71519359b7438a2f93",
-            "Munagapaka": "63f99898519359b74389df45",
-            "Munchingi Puttu": "63f998dd519359b74389e70b",
-            "Mundlamuru": "63f95b8a89d86ca9e2c066a1",
-            "Muppalla": "63f99d1c519359b7438a5324",
-            "Musunuru": "63f99bf7519359b7438a3d68",
-            "Muthukur": "63f95b5389d86ca9e2c061b9",
-            "Mylavaram": "6492b7d5882c8da847736f32",
-            "Nadendla": "63f99d1e519359b7438a5358",
-            "Nagalapuram": "63f99e3d519359b7438a6862",
-            "Nagaram": "6492b7d4882c8da847736f24",
-            "Nagari": "63f9583489d86ca9e2c01a3f",
-            "Nagayalanka": "63f95a5989d86ca9e2c04b07",
-            "Naguluppala Padu": "63f95bba89d86ca9e2c06b22",
-            "Naidupet": "63f99d90519359b7438a5bac",
-            "Nakkapalle": "63f998a5519359b74389e0cf",
-            "Nallacheruvu": "63f99f1e519359b7438a78f9",
-            "Nallajerla": "63f959a289d86ca9e2c03aa4",
-            "Nallamada": "63f99ee6519359b7438a74f5",
-            "Nambulipulikunta": "63f99edb519359b7438a7418",
-            "Nandalur": "63f99e60519359b7438a6b02",
-            "Nandavaram": "63f95a7989d86ca9e2c04dd8",
-            "Nandigam": "63f95c9189d86ca9e2c07f19",
-            "Nandigama": "6492b7d5882c8da847736f34",
-            "Nandikotkur": "63f99f43519359b7438a7ba9",
-            "Nandivada": "63f959ff89d86ca9e2c04300",
-            "Nandyal": "63f99f6d519359b7438a7ed3",
-            "Narasannapeta": "63f95d1989d86ca9e2c08ba7",
-            "Narasapuram": "63f99778519359b74389c041",
-            "Narasaraopet": "63f99d17519359b7438a52cd",
-            "Narayanavanam": "63f99e2c519359b7438a671c",
-            "Narpala": "63f9580b89d86ca9e2c01668",
-            "Narsipatnam": "63f99841519359b74389d5c9",
-            "Nathavaram": "63f99834519359b74389d449",
-            "Nekarikallu": "63f99cfc519359b7438a50c8",
-            "Nellimarla": "63f95e3a89d86ca9e2c0a62b",
-            "Nellore Rural": "63f95b4389d86ca9e2c06026",
-            "Nellore Urban": "63f95b6789d86ca9e2c06383",
-            "Nidadavole": "63f959ae89d86ca9e2c03bbf",
-            "Nidamarru": "63f99be5519359b7438a3c1d",
-            "Nimmanapalle": "63f99ebd519359b7438a71e5",
-            "Nindra": "63f9582d89d86ca9e2c01996",
-            "Nizampatnam": "63f99c96519359b7438a4943",
-            "Nuzendla": "63f99d09519359b7438a51b9",
-            "Nuzvid": "63f99bfb519359b7438a3dba",
-            "Obuladevaracheruvu": "63f99f1b519359b7438a78b1",
-            "Obulavaripalle": "63f99e80519359b7438a6d4e",
-            "Ojili": "63f99d5f519359b7438a5820",
-            "Ongole": "63f95bf989d86ca9e2c07109",
-            "Orvakal": "63f95a8a89d86ca9e2c04f7a",
-            "Owk": "63f99f91519359b7438a8170",
-            "P.Gannavaram": "63f99b77519359b7438a3023",
-            "Pachipenta": "63f9982a519359b74389d337",
-            "Paderu": "63f999cb519359b7438a017d",
-            "Padmanabham": "63f95d6889d86ca9e2c092ed",
-            "Pagidyala": "63f99f46519359b7438a7be7",
-            "Pakala": "63f99e1e519359b7438a660a",
-            "Palacoderu": "63f9975e519359b74389bd76",
-            "Palacole": "63f9977b519359b74389c098",
-            "Palakonda": "63f997a3519359b74389c4d7",
-            "Palamaner": "63f9588389d86ca9e2c020f0",
-            "Palasa": "63f95c4389d86ca9e2c077e0",
-            "Palasamudram": "63f958d689d86ca9e2c0283e",
-            "Pamarru": "63f95a2c89d86ca9e2c046d9",
-            "Pamidi": "63f957dd89d86ca9e2c01231",
-            "Pamidimukkala": "63f95a2289d86ca9e2c04603",
-            "Pamulapadu": "63f99f53519359b7438a7cea",
-            "Pamur": "63f95c1989d86ca9e2c0740a",
-            "Panyam": "63f99f5e519359b7438a7db8",
-            "Paravada": "63f99872519359b74389db2c",
-            "Parchur": "63f99cad519359b7438a4afd",
-            "Parigi": "63f99f0f519359b7438a77ca",
-            "Parvathipuram": "63f997f8519359b74389cdc6",
-            "Pathapatnam": "63f95c2989d86ca9e2c07589",
-            "Pattikonda": "63f95ab989d86ca9e2c053dc",
-            "Payakaraopeta": "63f998ab519359b74389e16c",
-            "Peapally": "63f99f8c519359b7438a810f",
-            "Peda Araveedu": "63f95b7a89d86ca9e2c06556",
-            "Peda Bayalu": "63f99917519359b74389ed7a",
-            "Pedacherlo Palle": "63f95c0c89d86ca9e2c072da",
-            "Pedagantyada": "63f95d7689d86ca9e2c09438",
-            "Pedakakani": "63f959d189d86ca9e2c03eaa",
-            "Pedakurapadu": "63f99cf1519359b7438a4ff7",
-            "Pedana": "63f95a3689d86ca9e2c047d7",
-            "Pedanandipadu": "63f959e389d86ca9e2c04061",
-            "Pedapadu": "63f99bd5519359b7438a3a9b",
-            "Pedaparupudi": "63f95a1289d86ca9e2c044bb",
-            "Pedapudi": "63f99b48519359b7438a2aed",
-            "Pedavegi": "63f99bd0519359b7438a3a0d",
-            "Pedda Kadubur": "63f95a7189d86ca9e2c04d16",
-            "Pedda Thippasamudram": "63f99eb0519359b7438a70ea",
-            "Peddamandyam": "63f99e91519359b7438a6e91",
-            "Peddamudium": "63f958e989d86ca9e2c029ef",
-            "Peddapanjani": "63f9585e89d86ca9e2c01d74",
-            "Peddapappur": "63f957d989d86ca9e2c011da",
-            "Peddapuram": "63f99b32519359b7438a2873",
-            "Peddavadugur": "63f957cb89d86ca9e2c0108f",
-            "Pellakur": "63f99d99519359b7438a5c53",
-            "Penagalur": "63f99e65519359b7438a6b6d",
-            "Penamaluru": "63f95a1c89d86ca9e2c0457d",
-            "Pendlimarri": "63f9597189d86ca9e2c03629",
-            "Pendurthi": "63f95d5c89d86ca9e2c091d1",
-            "Pentapadu": "63f9974e519359b74389bbd2",
-            "Penuganchiprolu": "63f99c31519359b7438a41be",
-            "Penugonda": "63f99768519359b74389be7b",
-            "Penukonda": "63f99f13519359b7438a781c",
-            "Penumantra": "63f99761519359b74389bdbe",
-            "Penumuru": "63f9584589d86ca9e2c01b60",
-            "Peravali": "63f959b689d86ca9e2c03c90",
-            "Phirangipuram": "63f959c989d86ca9e2c03df0",
-            "Pichatur": "63f99e31519359b7438a676e",
-            "Piduguralla": "63f99cdb519359b7438a4e51",
-            "Pileru": "63f99ea2519359b7438a6fd4",
-            "Pithapuram": "63f99b3c519359b7438a2987",
-            "Pittalavanipalem": "63f99c8d519359b7438a48a2",
-            "Podalakur": "63f95b3b89d86ca9e2c05f70",
-            "Podili": "63f95bb089d86ca9e2c06a2e",
-            "Poduru": "63f9976c519359b74389befc",
-            "Polaki": "63f95d2389d86ca9e2c08c8f",
-            "Polavaram": "63f99bb7519359b7438a3740",
-            "Ponduru": "63f95d3889d86ca9e2c08e89",
-            "Ponnaluru": "63f95c0789d86ca9e2c0726a",
-            "Ponnur": "63f959e889d86ca9e2c040d8",
-            "Porumamilla": "63f9590b89d86ca9e2c02cd2",
-            "Prathipadu": "6492b7d4882c8da847736f28",
-            "Proddatur": "63f9592789d86ca9e2c02f68",
-            "Pulicherla": "63f9582389d86ca9e2c018a2",
-            "Pulivendla": "63f9593d89d86ca9e2c0316b",
-            "Pullalacheruvu": "63f95b6e89d86ca9e2c06438",
-            "Pullampeta": "63f99e79519359b7438a6ccf",
-            "Punganur": "63f9585a89d86ca9e2c01d13",
-            "Pusapatirega": "63f95e4189d86ca9e2c0a6d2",
-            "Puthalapattu": "63f9584b89d86ca9e2c01bb7",
-            "Putlur": "63f9580489d86ca9e2c015b0",
-            "Puttaparthi": "63f99f17519359b7438a7873",
-            "Puttur": "63f99e41519359b7438a68a0",
-            "Racherla": "63f95bd789d86ca9e2c06dd6",
-            "Rajahmundry (Urban)": "63f9598989d86ca9e2c03858",
-            "Rajahmundry Rural": "63f9598989d86ca9e2c0385f",
-            "Rajam": "63f95da089d86ca9e2c097df",
-            "Rajampet": "6492b7d4882c8da847736f22",
-            "Rajanagaram": "63f9598c89d86ca9e2c03898",
-            "Rajavommangi": "63f99ad6519359b7438a1e6d",
-            "Rajupalem": "6492b7d5882c8da847736f36",
-            "Ramabhadrapuram": "63f95db089d86ca9e2c0995f",
-            "Ramachandrapuram": "6492b7d7882c8da847736f48",
-            "Ramagiri": "6492b7d6882c8da847736f42",
-            "Ramakuppam": "63f958bc89d86ca9e2c025d9",
-            "Ramapuram": "63f99e5a519359b7438a6a95",
-            "Ramasamudram": "63f99ec0519359b7438a7219",
-            "Rambilli": "63f998b2519359b74389e23d",
-            "Rampachodavaram": "63f99aec519359b7438a20d1",
-            "Ranastalam": "63f95d4989d86ca9e2c0901d",
-            "Rangampeta": "63f9598f89d86ca9e2c038ef",
-            "Raptadu": "63f9581589d86ca9e2c01759",
-            "Rapur": "63f95b3389d86ca9e2c05eab",
-            "Ravikamatham": "63f99849519359b74389d6a9",
-            "Ravulapalem": "63f99b63519359b7438a2e08",
-            "Rayachoti": "63f99e52519359b7438a69f6",
-            "Rayadurg": "63f957b489d86ca9e2c00e76",
-            "Rayavaram": "63f99b5b519359b7438a2d03",
-            "Razole": "63f99b80519359b7438a3119",
-            "Reddigudem": "63f99c56519359b7438a447a",
-            "Regidi Amadalavalasa": "63f95d8789d86ca9e2c095d8",
-            "Renigunta": "63f99dcb519359b7438a5ff2",
-            "Rentachintala": "63f99cce519359b7438a4d6d",
-            "Repalle": "63f99c9c519359b7438a49ae",
-            "Roddam": "63f99ef8519359b7438a7633",
-            "Rolla": "63f99f0a519359b7438a7776",
-            "Rolugunta": "63f99844519359b74389d611",
-            "Rompicherla": "6492b7d5882c8da847736f38",
-            "Rowthulapudi": "63f99b0e519359b7438a2487",
-            "Rudravaram": "63f99f9b519359b7438a8232",
-            "S.Mydukur": "63f958f889d86ca9e2c02b3a",
-            "S.Rayavaram": "63f998ae519359b74389e1cd",
-            "Sabbavaram": "63f9986c519359b74389da80",
-            "Sakhinetipalle": "63f99b84519359b7438a3195",
-            "Salur": "63f9981a519359b74389d173",
-            "Samalkota": "63f99b38519359b7438a2926",
-            "Sambepalle": "63f99e4c519359b7438a6975",
-            "Sangam": "63f95b2389d86ca9e2c05d2c",
-            "Sanjamala": "63f99fa7519359b7438a8328",
-            "Sankhavaram": "63f99b17519359b7438a2565",
-            "Santhabommali": "63f95ccf89d86ca9e2c084eb",
-            "Santhakaviti": "63f95d9389d86ca9e2c096d9",
-            "Santhamaguluru": "63f99ca1519359b7438a4a0a",
-            "Santhanuthala Padu": "63f95bf689d86ca9e2c070b7",
-            "Santhipuram": "63f9589489d86ca9e2c02272",
-            "Saravakota": "63f95cbb89d86ca9e2c08302",
-            "Sarubujjili": "63f95cee89d86ca9e2c08799",
-            "Sattenapalle": "63f99cf4519359b7438a503f",
-            "Satyavedu": "63f99e35519359b7438a67c5",
-            "Savalyapuram H/O Kanamarlapudi": "63f99d0e519359b7438a521f",
-            "Seethammadhara": "63f95d7c89d86ca9e2c094be",
-            "Seethampeta": "63f99789519359b74389c217",
-            "Seethanagaram": "6492b7d5882c8da847736f3c",
-            "Seetharamapuram": "63f95ad989d86ca9e2c056b8",
-            "Settur": "63f9581889d86ca9e2c01792",
-            "Sidhout": "63f9596689d86ca9e2c0351a",
-            "Simhadripuram": "63f9593589d86ca9e2c030a9",
-            "Singanamala": "63f957ff89d86ca9e2c01540",
-            "Singarayakonda": "63f95c1f89d86ca9e2c074a2",
-            "Sirvel": "63f99f75519359b7438a7f68",
-            "Sodam": "63f9582089d86ca9e2c0185f",
-            "Somala": "63f9585489d86ca9e2c01c83",
-            "Somandepalle": "63f99f31519359b7438a7a50",
-            "Sompeta": "63f95c7c89d86ca9e2c07d2b",
-            "Sri Avadhutha Kasinayana": "63f9590289d86ca9e2c02bf2",
-            "Srikakulam": "63f95d3189d86ca9e2c08de2",
-            "Srikalahasti": "63f99ddc519359b7438a6140",
-            "Srirangarajapuram": "63f9586c89d86ca9e2c01eb0",
-            "Srisailam": "63f99fbd519359b7438a84c5",
-            "Srungavarapukota": "63f95e1189d86ca9e2c0a269",
-            "Sullurpeta": "63f99dac519359b7438a5dc4",
-            "Sydapuram": "63f95b5f89d86ca9e2c062cd",
-            "T Sundupalle": "63f99e4f519359b7438a69ae",
-            "T.Narasapuram": "63f99ba4519359b7438a352d",
-            "Tada": "63f99db8519359b7438a5ea2",
-            "Tadepalle": "63f959c189d86ca9e2c03d45",
-            "Tadepalligudem": "63f9974a519359b74389bb62",
-            "Tadikonda": "63f959c689d86ca9e2c03db2",
-            "Tadimarri": "63f99ece519359b7438a731d",
-            "Tadpatri": "63f957d389d86ca9e2c01151",
-            "Tallapudi": "63f9599a89d86ca9e2c039e2",
-            "Tallur": "63f95bb789d86ca9e2c06ad0",
-            "Talupula": "63f99ed8519359b7438a73df",
-            "Tanakal": "63f99f22519359b7438a7932",
-            "Tangutur": "63f95bff89d86ca9e2c07194",
-            "Tanuku": "63f99752519359b74389bc42",
-            "Tarlupadu": "63f95ba389d86ca9e2c068fe",
-            "Tekkali": "63f95cc489d86ca9e2c083db",
-            "Tenali": "63f959d989d86ca9e2c03f6e",
-            "Thallarevu": "63f99b53519359b7438a2c29",
-            "Thamballapalle": "63f99e8c519359b7438a6e3a",
-            "Thavanampalle": "63f9586789d86ca9e2c01e36",
-            "Therlam": "63f95dbd89d86ca9e2c09a94",
-            "Thondangi": "63f99b2d519359b7438a27e3",
-            "Thondur": "63f9594489d86ca9e2c0320f",
-            "Thotapalligudur": "63f95b4f89d86ca9e2c06153",
-            "Thotlavalluru": "63f95a1f89d86ca9e2c045b1",
-            "Thottambedu": "63f99dee519359b7438a6291",
-            "Thullur": "63f959ba89d86ca9e2c03cda",
-            "Tirupati (Rural)": "63f99dc3519359b7438a5f55",
-            "Tirupati (Urban)": "63f99e13519359b7438a6537",
-            "Tiruvuru": "63f99c4d519359b7438a43cc",
-            "Tripuranthakam": "63f95b7289d86ca9e2c06499",
-            "Tsundur": "63f99c7a519359b7438a472e",
-            "Tuggali": "63f95ac089d86ca9e2c05487",
-            "Tuni": "63f99b09519359b7438a2412",
-            "Udayagiri": "63f95ade89d86ca9e2c05723",
-            "Ulavapadu": "63f95ad789d86ca9e2c0567a",
-            "Undi": "63f9975a519359b74389bd10",
-            "Undrajavaram": "63f959b389d86ca9e2c03c43",
-            "Unguturu": "6492b7d4882c8da847736f26",
-            "Uppalaguptam": "63f99b8b519359b7438a326d",
-            "Uravakonda": "63f957e589d86ca9e2c012f3",
-            "Uyyalawada": "63f99fb3519359b7438a83fe",
-            "VIJAYAWADA EAST": "63f99c77519359b7438a46f9",
-            "VIJAYAWADA NORTH": "63f99c78519359b7438a4705",
-            "VIJAYAWADA WEST": "63f99c79519359b7438a4720",
-            "Vadamalapeta": "63f99e26519359b7438a66ac",
-            "Vajrakarur": "63f957e189d86ca9e2c012a1",
-            "Vajrapukothuru": "63f95c8589d86ca9e2c07df0",
-            "Vakadu": "63f99d79519359b7438a5a0e",
-            "Vallur": "63f9595489d86ca9e2c03393",
-            "Valmikipuram": "63f99eaa519359b7438a7069",
-            "Vangara": "63f95d8089d86ca9e2c09522",
-            "Varadaiahpalem": "63f99e00519359b7438a63da",
-            "Vararamachandrapuram": "63f998d2519359b74389e5d3",
-            "Varikuntapadu": "63f95ae189d86ca9e2c0577a",
-            "Vatsavai": "63f99c24519359b7438a40bb",
-            "Vatticherukuru": "63f959de89d86ca9e2c03fea",
-            "Vedurukuppam": "63f9582689d86ca9e2c018ef",
-            "Veeraballe": "63f99e5e519359b7438a6ad3",
-            "Veeraghattam": "63f99782519359b74389c148",
-            "Veerapunayunipalle": "63f9594789d86ca9e2c03266",
-            "Veeravasaram": "63f9976f519359b74389bf44",
-            "Veerullapadu": "63f99c3c519359b7438a4283",
-            "Velairpadu": "63f99b91519359b7438a32ff",
-            "Veldurthi": "6492b7d5882c8da847736f3a",
-            "Velgode": "63f99f67519359b7438a7e5c",
-            "Veligandla": "63f95be389d86ca9e2c06ef9",
-            "Vempalle": "63f9597789d86ca9e2c036ad",
-            "Vemula": "63f9594189d86ca9e2c031d1",
-            "Vemuru": "63f99c81519359b7438a47af",
-            "Venkatachalam": "63f95b5789d86ca9e2c06206",
-            "Venkatagiri": "63f99d3d519359b7438a559c",
-            "Venkatagirikota": "63f9588c89d86ca9e2c021c6",
-            "Vepada": "63f95e1a89d86ca9e2c0a333",
-            "Vetapalem": "63f99cc3519359b7438a4c96",
-            "Vidapanakal": "63f957bf89d86ca9e2c00f6c",
-            "Vidavalur": "63f95b1a89d86ca9e2c05c5e",
-            "Vijayapuram": "63f9583089d86ca9e2c019e3",
-            "Vijayawada (Rural)": "63f99c72519359b7438a4698",
-            "Vijayawada (Urban)": "63f99c72519359b7438a4691",
-            "Vinjamur": "63f95afc89d86ca9e2c059b9",
-            "Vinukonda": "63f99d02519359b7438a5144",
-            "Visakhapatnam (Rural)": "63f95d7489d86ca9e2c09404",
-            "Vissannapet": "63f99c59519359b7438a44b3",
-            "Vizianagaram": "63f95e3589d86ca9e2c0a5b6",
-            "Voletivaripalem": "63f95ac489d86ca9e2c054dd",
-            "Vontimitta": "63f9596089d86ca9e2c034b9",
-            "Vuyyuru": "63f95a2989d86ca9e2c04696",
-            "Y. Ramavaram": "63f99aac519359b7438a19cd",
-            "Yadamarri": "63f958ca89d86ca9e2c02722",
-            "Yadiki": "63f957d089d86ca9e2c01109",
-            "Yeddana Pudi": "63f99cab519359b7438a4ace",
-            "Yelamanchili": "6492b7d3882c8da847736f1e",
-            "Yeleswaram": "63f99b1c519359b7438a2607",
-            "Yellanur": "63f9580889d86ca9e2c01607",
-            "Yemmiganur": "63f95a7489d86ca9e2c04d72",
-            "Yerpedu": "63f99dd3519359b7438a6094",
-            "Yerragondapalem": "63f95b6789d86ca9e2c06391",
-            "Yerraguntla": "63f9594b89d86ca9e2c032c7",
-            "Yerravaripalem": "63f99dbf519359b7438a5f21",
-            "Yetapaka": "63f99afa519359b7438a2254",
-            "Zarugumalli": "63f95c0289d86ca9e2c071eb",
-            "Tirupati": "63f99d29519359b7438a5425",
-            "Y.S.R.": "63f958da89d86ca9e2c0289e",
-            "NTR": "63f99c24519359b7438a40b8",
-            "Kakinada": "63f99b06519359b7438a23bd",
-            "PRAKASAM": "63f95b6789d86ca9e2c0638e",
-            "Anakapalli": "63f99834519359b74389d446",
-            "Palnadu": "63f99cc7519359b7438a4cd5",
-            "SPSR NELLORE": "63f95ac489d86ca9e2c054da",
-            "EAST GODAVARI": "63f9597d89d86ca9e2c0373c",
-            "VISAKHAPATANAM": "63f95d5b89d86ca9e2c091ce",
-            "WEST GODAVARI": "63f9974a519359b74389bb5f",
-            "KURNOOL": "63f95a5e89d86ca9e2c04b6e",
-            "KRISHNA": "63f959ed89d86ca9e2c04153",
-            "Annamayya": "63f99e46519359b7438a68fb",
-            "Alluri Sitharama Raju": "63f998b9519359b74389e2e8",
-            "Parvathipuram Manyam": "63f99781519359b74389c145",
-            "Konaseema": "63f99b56519359b7438a2c6b",
-            "Sri Sathya Sai": "63f99ec4519359b7438a7265"
-        },
-        "63f86a1cd2e83876f03e7d32": {
-            "Aalo HQ": "63f86da4d2e83876f03ec8b9",
-            "Anelih": "63f86a6ad2e83876f03e84fe",
-            "Anini": "63f86a5fd2e83876f03e83f1",
-            "BORUM": "63f86bf4d2e83876f03eac69",
-            "BURAGAON EAC": "63f86d95d2e83876f03ec783",
-            "Bagra Circle": "63f86db6d2e83876f03eca5b",
-            "Balemu Circle": "63f86d8ad2e83876f03ec6b1",
-            "Balijan ADC": "63f86bb6d2e83876f03ea5fc",
-            "Bameng ADC": "63f86a7fd2e83876f03e8701",
-            "Bana EAC": "63f86aa7d2e83876f03e8ae8",
-            "Banderdewa Circle": "63f86c04d2e83876f03eae01",
-            "Baririjo Circle": "63f86d06d2e83876f03ebf45",
-            "Basar ADC": "63f86f2dd2e83876f03ee705",
-            "Bhalukpong EAC": "63f86d84d2e83876f03ec667",
-            "Bilat Circle": "63f86ab6d2e83876f03e8c64",
-            "Boleng ADC": "63f86ec2d2e83876f03edcab",
-            "Bomdila HQ": "63f86d94d2e83876f03ec777",
-            "Bongkhar Circle": "63f86c44d2e83876f03eb3f7",
-            "Bordumsa ADC": "63f86a3ed2e83876f03e80a9",
-            "Borduria Circle": "63f86c57d2e83876f03eb59a",
-            "Chaglagam Circle": "63f86dd7d2e83876f03ecd94",
-            "Chambang Circle": "63f86e34d2e83876f03ed433",
-            "Changlang HQ": "63f86a1fd2e83876f03e7d85",
-            "Chayangtajo ADC": "63f86a93d2e83876f03e88bf",
-            "Chetam Peer Yapu Circle": "63f86cf0d2e83876f03ebdb4",
-            "Chongkham EAC": "63f86e7fd2e83876f03ed908",
-            "DAMIN CIRCLE": "63f86ae5d2e83876f03e912a",
-            "DEBEYAR CO CIRCLE": "63f86ab3d2e83876f03e8c29",
-            "DEED CIRCLE": "63f86bb4d2e83876f03ea5b7",
-            "Dadam Circle": "63f86c50d2e83876f03eb4fb",
-            "Dambuen Circle": "63f86a73d2e83876f03e85e3",
-            "Dambuk ADC": "63f86b46d2e83876f03e9ab4",
-            "Daporijo Hq": "63f86cfad2e83876f03ebe5b",
-            "Darak Circle": "63f86d96d2e83876f03ec7a5",
-            "Daring Circle": "63f86f31d2e83876f03ee789",
-            "Deomali ADC": "63f86c47d2e83876f03eb441",
-            "Desali Circle": "63f86b5bd2e83876f03e9cc4",
-            "Dirang ADC": "63f86d2dd2e83876f03ec205",
-            "Dissing Passo Circle": "63f86f1bd2e83876f03ee52d",
-            "Diyun EAC": "63f86a3bd2e83876f03e8066",
-            "Doimukh SDO": "63f86bc6d2e83876f03ea797",
-            "Dollungmukh Circle": "63f86ef0d2e83876f03ee10b",
-            "Dudunghar Circle": "63f86c32d2e83876f03eb2cf",
-            "Dumporijo ADC": "63f86d01d2e83876f03ebedf",
-            "Etalin": "63f86a62d2e83876f03e8443",
-            "Gangte Circle": "63f86e40d2e83876f03ed552",
-            "Geku EAC": "63f86c83d2e83876f03eb7c2",
-            "Gelling Circle": "63f86c75d2e83876f03eb706",
-            "Gensi EAC": "63f86f03d2e83876f03ee2bc",
-            "Gepen Circle": "63f86efed2e83876f03ee24f",
-            "Giba Circle": "63f86cddd2e83876f03ebd08",
-            "Gite Ripa Circle": "63f86d11d2e83876f03ebfdf",
-            "Goiliang Circle": "63f86dd1d2e83876f03eccf7",
-            "Gumto Circle": "63f86c02d2e83876f03eade1",
-            "Gyawe Purang Circle": "63f86a8fd2e83876f03e8868",
-            "Hawai HQ": "63f86de8d2e83876f03ecf3b",
-            "Hayuliang ADC": "63f86db8d2e83876f03eca96",
-            "Hunli SDO": "63f86b52d2e83876f03e9bf0",
-            "Itanagar EAC": "63f86c0ed2e83876f03eaf07",
-            "Jairampur ADC": "63f86a53d2e83876f03e82bd",
-            "Jamiri Circle": "63f86d87d2e83876f03ec68c",
-            "Jang ADC": "63f86c30d2e83876f03eb280",
-            "Jengging Circle": "63f86c7ed2e83876f03eb78e",
-            "Jomlo Mobuk Circle": "63f86ecbd2e83876f03edd8c",
-            "KOLORIANG HQ": "63f86af0d2e83876f03e9235",
-            "Kakoi Circle": "63f86c01d2e83876f03eadb2",
-            "Kalaktang ADC": "63f86d4cd2e83876f03ec466",
-            "Kamba ADC": "63f86da9d2e83876f03ec93d",
-            "Kamengbari Doimara Circle": "63f86d93d2e83876f03ec75c",
-            "Kamporijo Circle": "63f86edbd2e83876f03edf29",
-            "Kangku Circle": "63f86f0cd2e83876f03ee3b4",
-            "Kantang Circle": "63f86a56d2e83876f03e8305",
-            "Kanubari ADC": "63f86e01d2e83876f03ed075",
-            "Katan Circle": "63f86c8ed2e83876f03eb85e",
-            "Katang Circle": "63f86c60d2e83876f03eb600",
-            "Kaying EAC": "63f86ebed2e83876f03edc43",
-            "Kebang Circle": "63f86ec7d2e83876f03edd33",
-            "Kharsang Circle": "63f86a36d2e83876f03e7fce",
-            "Khenawa Circle": "63f86aa9d2e83876f03e8b0d",
-            "Khimiyang EAC": "63f86a1dd2e83876f03e7d38",
-            "Khonsa HQ": "63f86c4fd2e83876f03eb4db",
-            "Kibithoo Circle": "63f86de0d2e83876f03ece7e",
-            "Kimin SDO": "63f86befd2e83876f03eabe5",
-            "Kitpi Circle": "63f86c29d2e83876f03eb1e3",
-            "Kombo Circle": "63f86db1d2e83876f03ec9da",
-            "Kora Circle": "63f86f14d2e83876f03ee48a",
-            "Koronu Circle": "63f86b4ed2e83876f03e9b8a",
-            "Koyu EAC": "63f86f0ad2e83876f03ee365",
-            "Kronli (Arzoo circle)": "63f86a6ed2e83876f03e8555",
-            "Lada Circle": "63f86a9ed2e83876f03e89f4",
-            "Laju SDO": "63f86c53d2e83876f03eb539",
-            "Lathao Circle": "63f86e99d2e83876f03eda6a",
-            "Lawnu Circle": "63f86e04d2e83876f03ed0bd",
-            "Lekang Mahadevpur Circle": "63f86ea3d2e83876f03edabc",
-            "Leporiang Circle": "63f86be1d2e83876f03eaa74",
-            "Lhou Circle": "63f86c38d2e83876f03eb358",
-            "Likabali SDO": "63f86f05d2e83876f03ee2f0",
-            "Limeking Circle": "63f86c91d2e83876f03eb88a",
-            "Liromoba EAC": "63f86d99d2e83876f03ec7e3",
-            "Longding HQ": "63f86e17d2e83876f03ed19f",
-            "Longo Circle": "63f86c6ad2e83876f03eb657",
-            "Lumla ADC": "63f86c17d2e83876f03eaffa",
-            "Lyngok Longtoi Circle": "63f86a47d2e83876f03e8189",
-            "Manchal Circle": "63f86dc5d2e83876f03ecbd3",
-            "Manmao EAC": "63f86a25d2e83876f03e7e27",
-            "Mariyang ADC": "63f86c89d2e83876f03eb805",
-            "Maro Circle": "63f86d27d2e83876f03ec184",
-            "Mebo ADC": "63f86abcd2e83876f03e8d14",
-            "Mechuka ADC": "63f86f35d2e83876f03ee7df",
-            "Mengio EAC": "63f86be9d2e83876f03eab48",
-            "Metengliang Circle": "63f86ddad2e83876f03ecde6",
-            "Miao ADC": "63f86a30d2e83876f03e7f36",
-            "Migging Circle": "63f86c74d2e83876f03eb6e9",
-            "Mipi": "63f86a5cd2e83876f03e8395",
-            "Monigong EAC": "63f86f3cd2e83876f03ee88b",
-            "Mopom Adipasi Circle": "63f86c8dd2e83876f03eb848",
-            "Mukto Circle": "63f86c31d2e83876f03eb2aa",
-            "NYAPIN ADC": "63f86ad3d2e83876f03e8f49",
-            "NYOBIA CIRCLE": "63f86b0cd2e83876f03e94f5",
-            "Nacho SDO": "63f86c97d2e83876f03eb8fa",
-            "Nafra EAC": "63f86d44d2e83876f03ec3bf",
-            "Naharlagun EAC": "63f86bc2d2e83876f03ea727",
-            "Nampong SDO": "63f86a28d2e83876f03e7e7e",
-            "Namsai HQ": "63f86e8bd2e83876f03ed9d2",
-            "Namsing Circle": "63f86abed2e83876f03e8d48",
-            "Namtok EAC": "63f86a4cd2e83876f03e820f",
-            "Nari ADC": "63f86f0cd2e83876f03ee399",
-            "New Seren Circle": "63f86f16d2e83876f03ee4aa",
-            "Nikte Kodum Circle": "63f86db3d2e83876f03eca13",
-            "Nilling Circle": "63f86d16d2e83876f03ec054",
-            "Old Ziro SDO": "63f86b9cd2e83876f03ea338",
-            "Oyan Circle": "63f86abad2e83876f03e8cd6",
-            "PAKOTI CIRCLE": "63f86aafd2e83876f03e8bb4",
-            "PARBUK SDO": "63f86b65d2e83876f03e9dca",
-            "PASSA VALLEY CIRCLE": "63f86f26d2e83876f03ee64b",
-            "PATUK ADC": "63f86afdd2e83876f03e93ae",
-            "PHASSANG CIRCLE": "63f86adbd2e83876f03e9027",
-            "POLOSANG CIRCLE": "63f86b0dd2e83876f03e951a",
-            "Pakke Kessang EAC": "63f86f18d2e83876f03ee4d6",
-            "Palin Circle": "63f86e1bd2e83876f03ed204",
-            "Palling Circle": "63f86c74d2e83876f03eb6f5",
-            "Pangchao SDO": "63f86e08d2e83876f03ed119",
-            "Pangin EAC": "63f86ec6d2e83876f03edd04",
-            "Parang Circle": "63f86bded2e83876f03eaa1d",
-            "Pasighat HQ": "63f86ac0d2e83876f03e8d77",
-            "Payeng Circle": "63f86cc4d2e83876f03ebc07",
-            "Payum Circle": "63f86ecfd2e83876f03eddde",
-            "Pidi Circle": "63f86f4ad2e83876f03ee9e8",
-            "Pipsorang Circle": "63f86e65d2e83876f03ed786",
-            "Pipu Dipu Circle": "63f86a88d2e83876f03e87bc",
-            "Pistana Circle": "63f86bacd2e83876f03ea4de",
-            "Piyong Circle": "63f86eb7d2e83876f03edbc2",
-            "Pizirang Veo Circle": "63f86f1ed2e83876f03ee57a",
-            "Puchi Geko Circle": "63f86ed2d2e83876f03ede2d",
-            "Pumao Circle": "63f86e19d2e83876f03ed1e7",
-            "Raga ADC": "63f86ef4d2e83876f03ee176",
-            "Rebo Perging Circle": "63f86ecad2e83876f03edd67",
-            "Renuk Circle": "63f86a46d2e83876f03e8169",
-            "Richukrong Circle": "63f86aa3d2e83876f03e8a7d",
-            "Riga EAC": "63f86ec4d2e83876f03edcdf",
-            "Roing HQ": "63f86b28d2e83876f03e97bf",
-            "Ruksin ADC": "63f86ab7d2e83876f03e8c8e",
-            "Rumgong ADC": "63f86ec0d2e83876f03edc81",
-            "Rupa SDO": "63f86d7dd2e83876f03ec601",
-            "SAGO": "63f86f34d2e83876f03ee7c7",
-            "SANGRAM SDO": "63f86ac6d2e83876f03e8dfd",
-            "SARLI CIRCLE": "63f86ae1d2e83876f03e90ba",
-            "SILSANGO CIRCLE": "63f86c11d2e83876f03eaf5e",
-            "Sagalee ADC": "63f86bd2d2e83876f03ea8ea",
-            "Sangdupota Basar Nello Circle": "63f86bf7d2e83876f03eacc0",
-            "Sawa CIrcle": "63f86a9ad2e83876f03e8970",
-            "Segi Gusar Circle": "63f86d1dd2e83876f03ec0d3",
-            "Seijosa ADC": "63f86f22d2e83876f03ee5e0",
-            "Seppa HQ": "63f86a79d2e83876f03e8669",
-            "Shergaon Circle": "63f86d90d2e83876f03ec728",
-            "Sibe Circle": "63f86f11d2e83876f03ee433",
-            "Singa Circle": "63f86c76d2e83876f03eb70d",
-            "Singchung ADC": "63f86d55d2e83876f03ec4f9",
-            "Siyum ADC": "63f86caad2e83876f03eb9fb",
-            "Soha Circle": "63f86c4ad2e83876f03eb493",
-            "Sunpura Circle": "63f86b11d2e83876f03e9573",
-            "TAWANG HQ": "63f86c1bd2e83876f03eb06f",
-            "Taksing Circle": "63f86d0cd2e83876f03ebf97",
-            "Tali ADC": "63f86e76d2e83876f03ed837",
-            "Taliha ADC": "63f86cb6d2e83876f03ebaf2",
-            "Tarak Lengdi Cicle": "63f86e50d2e83876f03ed6a3",
-            "Taraso Circle": "63f86bbcd2e83876f03ea68f",
-            "Tato EAC": "63f86f46d2e83876f03ee973",
-            "Tezu HQ": "63f86b15d2e83876f03e95c5",
-            "Thembang Circle": "63f86d8dd2e83876f03ec6ea",
-            "Thingbu Circle": "63f86c41d2e83876f03eb3d7",
-            "Thrizino ADC": "63f86d6cd2e83876f03ec596",
-            "Tikhak Rima Putok Circle": "63f86a50d2e83876f03e8266",
-            "Tinali Paglam Circle": "63f86b4bd2e83876f03e9b47",
-            "Tirbin EAC": "63f86f27d2e83876f03ee66d",
-            "Toru Circle": "63f86bcbd2e83876f03ea816",
-            "Tuting ADC": "63f86c6dd2e83876f03eb688",
-            "Vijoynagar EAC": "63f86a2ed2e83876f03e7ef3",
-            "Wakka SDO": "63f86e13d2e83876f03ed15c",
-            "Wakro Circle": "63f86b1ed2e83876f03e96b2",
-            "Walong Circle": "63f86de3d2e83876f03ecebc",
-            "Yachuli ADC": "63f86b83d2e83876f03ea0be",
-            "Yangte Circle": "63f86e2bd2e83876f03ed36e",
-            "Yatdam Circle": "63f86a48d2e83876f03e81a9",
-            "Yazali Circle": "63f86b8fd2e83876f03ea1e2",
-            "Yingkiong Circle": "63f86c7cd2e83876f03eb76e",
-            "Yomcha ADC": "63f86da0d2e83876f03ec862",
-            "Zemithang Circle": "63f86c13d2e83876f03eaf9e",
-            "Ziro HQ": "63f86b66d2e83876f03e9dec",
-            "NAMSAI": "63f86e7ed2e83876f03ed905",
-            "PAPUM PARE": "63f86bb6d2e83876f03ea5f9",
-            "UPPER SIANG": "63f86c6dd2e83876f03eb685",
-            "EAST SIANG": "63f86ab6d2e83876f03e8c61",
-            "EAST KAMENG": "63f86a79d2e83876f03e8666",
-            "LOWER SUBANSIRI": "63f86b66d2e83876f03e9de9",
-            "WEST KAMENG": "63f86d2dd2e83876f03ec202",
-            "LOWER DIBANG VALLEY": "63f86b28d2e83876f03e97bc",
-            "TIRAP": "63f86c47d2e83876f03eb43e",
-            "TAWANG": "63f86c13d2e83876f03eaf9b",
-            "CHANGLANG": "63f86a1cd2e83876f03e7d35",
-            "UPPER SUBANSIRI": "63f86c91d2e83876f03eb887"
-        },
-        "63f87b48d2e83876f040050d": {
-            "ATHANI": "63f88026d2e83876f0407cc8",
-            "Agamoni": "63f87f7dd2e83876f0406a97",
-            "Algapur": "63f8829cd2e83876f040be4e",
-            "Amguri": "63f88b15d2e83876f041943d",
-            "Azara": "63f88fcfd2e83876f041e603",
-            "Badarpur": "63f88620d2e83876f0411bf4",
-            "Baghbor": "63f87b73d2e83876f04008c3",
-            "Bagribari (Pt)": "63f88730d2e83876f041377a",
-            "Bajali (Pt)": "63f89331d2e83876f042200c",
-            "Balijana": "63f88168d2e83876f0409d1b",
-            "Banekuchi": "63f88a0dd2e83876f0417e63",
-            "Barama Pt": "63f88ea2d2e83876f041d52c",
-            "Barbhag": "63f889f0d2e83876f0417b80",
-            "Barkhetri": "63f889d8d2e83876f0417912",
-            "Barnagar (Pt)": "63f87b48d2e83876f0400513",
-            "Barpeta": "63f87bb5d2e83876f0400cf5",
-            "Baska": "63f88e42d2e83876f041ce27",
-            "Bengtol": "63f88d96d2e83876f041c265",
-            "Bhowraguri": "63f886f5d2e83876f0413186",
-            "Bhuragaon": "63f8889bd2e83876f0415a9f",
-            "Bihpuria": "63f887b1d2e83876f04143ec",
-            "Bijni (Pt)": "63f88dd0d2e83876f041c697",
-            "Bilasipara Pt": "63f87fe9d2e83876f0407632",
-            "Biswanath": "63f8903cd2e83876f041ec7c",
-            "Boitamari": "63f87c01d2e83876f0401464",
-            "Bokakhat": "63f881ced2e83876f040a847",
-            "Boko": "63f883bed2e83876f040ddab",
-            "Bongaigaon (Pt)": "63f87be6d2e83876f040118d",
-            "Chabua": "63f88060d2e83876f04082c5",
-            "Chamaria": "63f883afd2e83876f040dbef",
-            "Chandrapur": "63f8900ed2e83876f041e979",
-            "Chapar Pt": "63f88011d2e83876f0407a85",
-            "Chariduar": "63f88baed2e83876f041a070",
-            "Chenga": "63f87b9dd2e83876f0400b8b",
-            "Chhaygaon": "63f88384d2e83876f040d77c",
-            "Dalgaon (Pt)": "63f87dbad2e83876f0403c67",
-            "Dangtal Revenue Circle": "63f87c65d2e83876f0401bf2",
-            "Dergaon": "63f881f1d2e83876f040abed",
-            "Dhakuakhana (Pt-I)": "63f88842d2e83876f041519b",
-            "Dhekiajuli (Pt)": "63f88b4ed2e83876f04198ee",
-            "Dhemaji": "63f87dcfd2e83876f0403ea0",
-            "Dhing": "63f88957d2e83876f0416cf7",
-            "Dhubri": "63f87f8bd2e83876f0406c1a",
-            "Dibrugarh East": "63f8804bd2e83876f04080c5",
-            "Dibrugarh West": "63f88028d2e83876f0407d12",
-            "Dimow": "63f88ac4d2e83876f0418e2b",
-            "Diphu": "63f88411d2e83876f040e689",
-            "Dispur": "63f88fd8d2e83876f041e682",
-            "Doboka": "63f8923cd2e83876f0420ed7",
-            "Donka": "63f89273d2e83876f04212c0",
-            "Doom Dooma": "63f88c6dd2e83876f041aebc",
-            "Dotoma": "63f8870dd2e83876f0413412",
-            "Dudhnai": "63f881add2e83876f040a481",
-            "GAURIPUR": "63f88024d2e83876f0407c99",
-            "Ghograpar (Pt)": "63f88a12d2e83876f0417eec",
-            "Gogamukh": "63f87f2fd2e83876f0406241",
-            "Gohpur": "63f890ebd2e83876f041f83d",
-            "Golaghat": "63f88200d2e83876f040ad84",
-            "Golakganj Pt": "63f87fd5d2e83876f0407428",
-            "Goreswar (Pt)": "63f88e29d2e83876f041cc4a",
-            "Goroimari": "63f883a1d2e83876f040da67",
-            "Gossaigaon (Pt)": "63f886b3d2e83876f0412ad1",
-            "Haflong": "63f88a22d2e83876f0418094",
-            "Hailakandi": "63f882a9d2e83876f040bfcc",
-            "Hajo": "63f88369d2e83876f040d4cd",
-            "Harisinga": "63f88eb3d2e83876f041d625",
-            "Helem": "63f890aad2e83876f041f3db",
-            "Hojai": "63f891fed2e83876f0420ade",
-            "Jonai": "63f87eb9d2e83876f0405551",
-            "Jorhat East": "63f882f7d2e83876f040c819",
-            "Jorhat West": "63f882dcd2e83876f040c556",
-            "Kadam": "63f887f4d2e83876f0414a35",
-            "Kalaigaon": "63f88f96d2e83876f041e2ba",
-            "Kalgachia": "63f87b59d2e83876f04006d2",
-            "Kaliabor": "63f888f6d2e83876f041639b",
-            "Kamalpur": "6492b7d7882c8da847736f4e",
-            "Kampur": "63f889a9d2e83876f0417496",
-            "Karimganj": "63f885fdd2e83876f0411869",
-            "Katigora": "63f87c6ed2e83876f0401cde",
-            "Katlichara": "63f882c5d2e83876f040c2dc",
-            "Khoirabari": "63f88fb3d2e83876f041e460",
-            "Khumtai": "63f881e4d2e83876f040aa92",
-            "Kokrajhar": "63f88764d2e83876f0413c4a",
-            "Koya": "63f88349d2e83876f040d133",
-            "Laharighat": "63f888b1d2e83876f0415d03",
-            "Lakhipur": "6492b7d7882c8da847736f4c",
-            "Lala": "63f882b5d2e83876f040c127",
-            "Lanka": "63f8925dd2e83876f0421113",
-            "Mahmora": "63f891b4d2e83876f04205e2",
-            "Majuli": "63f8912dd2e83876f041fcc4",
-            "Mangaldoi (Pt)": "63f87da0d2e83876f04039a4",
-            "Manikpur": "63f87c6bd2e83876f0401c8a",
-            "Mankachar": "63f8917dd2e83876f042021c",
-            "Margherita": "63f88d32d2e83876f041bc30",
-            "Mariani": "63f8833dd2e83876f040cfcc",
-            "Marigaon": "63f888c6d2e83876f0415f08",
-            "Matia": "63f88190d2e83876f040a173",
-            "Mayong": "63f88878d2e83876f0415719",
-            "Mazbat": "63f88f68d2e83876f041e001",
-            "Mikirbheta": "63f888e8d2e83876f041624d",
-            "Moran": "63f880a2d2e83876f04089b8",
-            "Morangi": "63f8823bd2e83876f040b402",
-            "Na-Duar": "63f8901bd2e83876f041ea54",
-            "Nagaon": "63f8896ed2e83876f0416eed",
-            "Nagarbera": "63f883b9d2e83876f040dd1d",
-            "Naharkatiya": "63f88114d2e83876f0409439",
-            "Nalbari": "63f889fcd2e83876f0417cb8",
-            "Naobaicha": "63f887d2d2e83876f041474f",
-            "Narayanpur": "6492b7d7882c8da847736f50",
-            "Nazira": "63f88b30d2e83876f0419665",
-            "Nilambazar": "63f88630d2e83876f0411d9a",
-            "North Guwahati (Pt)": "63f883fcd2e83876f040e458",
-            "North Lakhimpur": "63f88815d2e83876f0414d34",
-            "Pachim Nalbari": "63f889cfd2e83876f0417816",
-            "Palasbari": "63f883d7d2e83876f040e069",
-            "Patharkandi": "63f88653d2e83876f0412120",
-            "Pathorighat (Pt)": "63f87d6ad2e83876f0403405",
-            "Phuloni": "63f884ced2e83876f040f9e1",
-            "Raha": "63f8898fd2e83876f041721e",
-            "Ramkrishna Nagar": "63f8867bd2e83876f0412528",
-            "Rangia Pt": "63f88403d2e83876f040e522",
-            "Rangjuli": "63f881b8d2e83876f040a5c8",
-            "Rupahi": "63f8894ad2e83876f0416bb5",
-            "Sadiya": "63f88c3bd2e83876f041ab5e",
-            "Samaguri": "63f88921d2e83876f04167fd",
-            "Sapekhati": "63f891d6d2e83876f0420837",
-            "Sarthebari": "63f87bd1d2e83876f0400f8b",
-            "Sarupathar": "63f8824cd2e83876f040b5f8",
-            "Sarupeta (Pt)": "63f89356d2e83876f04222c0",
-            "Sibsagar": "63f88af2d2e83876f0419143",
-            "Sidli (Pt)": "63f88dacd2e83876f041c41a",
-            "Silchar": "63f87c9ed2e83876f0402186",
-            "Silonijan": "63f885aad2e83876f0411077",
-            "Sipajhar": "63f87d7fd2e83876f040360f",
-            "Sissibargaon": "63f87e40d2e83876f0404893",
-            "Sonai": "63f87cedd2e83876f040297d",
-            "Sonapur": "63f88fdad2e83876f041e6a2",
-            "Sonari": "63f8919ed2e83876f0420464",
-            "South Salmara": "63f89172d2e83876f042015c",
-            "Srijangram": "63f87c24d2e83876f04017d1",
-            "Subansiri (Pt-I)": "63f88863d2e83876f04154cc",
-            "Tamulpur": "63f8936bd2e83876f0422454",
-            "Tengakhat": "63f88079d2e83876f0408551",
-            "Teok": "63f88304d2e83876f040c988",
-            "Tezpur": "63f88c18d2e83876f041a8a6",
-            "Thelamara": "63f88c3bd2e83876f041ab55",
-            "Tihu (Pt)": "63f889c6d2e83876f0417756",
-            "Tingkhong": "63f880e3d2e83876f0408fbe",
-            "Tinsukia": "63f88ce7d2e83876f041b71a",
-            "Titabor": "63f88320d2e83876f040cc96",
-            "UJANI MAJULI CIRCLE": "63f8916ed2e83876f0420121",
-            "Udalguri": "63f88effd2e83876f041da6e",
-            "Udarbond": "63f87cd2d2e83876f04026a6",
-            "KARBI ANGLONG": "63f88411d2e83876f040e686",
-            "JORHAT": "63f882dcd2e83876f040c553",
-            "DIMA HASAO": "63f88a22d2e83876f0418091",
-            "KAMRUP METRO": "63f88fcfd2e83876f041e600",
-            "LAKHIMPUR": "63f88788d2e83876f0413ffc",
-            "BAKSA": "63f88e28d2e83876f041cc47",
-            "BONGAIGAON": "63f87be5d2e83876f040118a",
-            "CACHAR": "63f87c6ed2e83876f0401cdb",
-            "DARRANG": "63f87d6ad2e83876f0403402",
-            "SONITPUR": "63f88b4ed2e83876f04198eb",
-            "SIVASAGAR": "63f88ac4d2e83876f0418e28",
-            "CHIRANG": "63f88d96d2e83876f041c262",
-            "DIBRUGARH": "63f88028d2e83876f0407d0f",
-            "GOALPARA": "63f88138d2e83876f04097dc"
-        },
-        "63f86570d2e83876f03e015b": {
-            "Adapur": "63fa0e9cc969ead893b4aa49",
-            "Adhaura": "63fa03d3c969ead893b3b3e9",
-            "Agiaon": "63f9fa87c969ead893b2e205",
-            "Akbarpur": "6492b7e4882c8da847736fb4",
-            "Akorhi Gola": "63fa1215c969ead893b50304",
-            "Alamnagar": "63fa06a7c969ead893b3fa69",
-            "Alauli": "63fa0520c969ead893b3d4d1",
-            "Alinagar": "63f9fc23c969ead893b306dd",
-            "Amarpur": "6492b7d9882c8da847736f6a",
-            "Amas": "63f9fdbcc969ead893b32d27",
-            "Amdabad": "63fa0516c969ead893b3d3ce",
-            "Amnour": "63fa1434c969ead893b53dec",
-            "Amour": "63fa102ec969ead893b4d34c",
-            "Andar": "63f86795d2e83876f03e3b24",
-            "Andhratharhi": "63fa075ec969ead893b40c1d",
-            "Araria": "63f9f13d03196b93ff466484",
-            "Areraj": "63fa0f21c969ead893b4b800",
-            "Ariari": "63f865fbd2e83876f03e0fa7",
-            "Arrah": "63f9f9d6c969ead893b2d19a",
-            "Arwal": "63f86978d2e83876f03e6d5d",
-            "Asarganj": "63fa0895c969ead893b41d7a",
-            "Asthawan": "63fa0ab9c969ead893b44d90",
-            "Athmalgola": "63fa0e68c969ead893b4a4bc",
-            "Atri": "63f9fd44c969ead893b321dd",
-            "Aurai": "6492b7e3882c8da847736fae",
-            "Aurangabad": "6492b7d8882c8da847736f54",
-            "Azamnagar": "63fa0498c969ead893b3c719",
-            "Babubarhi": "63fa06fac969ead893b4024b",
-            "Bachhwara": "63f9f79fc969ead893b29d49",
-            "Bagaha": "63fa0ccac969ead893b480e1",
-            "Bahadurganj": "63fa05bac969ead893b3e376",
-            "Bahadurpur": "6492b7da882c8da847736f76",
-            "Baheri": "6492b7db882c8da847736f78",
-            "Baikunthpur": "6492b7dd882c8da847736f84",
-            "Bairgania": "63f8662ed2e83876f03e1511",
-            "Bairia": "6492b7e4882c8da847736fb8",
-            "Baisa": "63fa1048c969ead893b4d678",
-            "Baisi": "63fa105ec969ead893b4d90e",
-            "Bajpatti": "63f866aad2e83876f03e21fe",
-            "Bakhri": "63f9f807c969ead893b2a660",
-            "Bakhtiarpur": "63fa0e5ec969ead893b4a393",
-            "Balia": "63f9f823c969ead893b2a8f5",
-            "Balrampur": "6492b7e2882c8da847736f98",
-            "Bandra": "63fa0a05c969ead893b43c96",
-            "Baniapur": "63fa13a8c969ead893b52eb1",
-            "Banjaria": "63fa0ebec969ead893b4ad56",
-            "Banka": "63f9f652c969ead893b27d60",
-            "Bankatwa": "63fa0ed0c969ead893b4af30",
-            "Banke Bazar": "63f9fdd0c969ead893b32f27",
-            "Banma Itahri": "63fa128cc969ead893b51026",
-            "Banmankhi": "63fa0f9dc969ead893b4c586",
-            "Barachatti": "63f9fef6c969ead893b34b19",
-            "Barahat": "63f9f643c969ead893b27bf1",
-            "Barahiya": "63fa05fcc969ead893b3e9df",
-            "Barari": "63fa04ecc969ead893b3cf75",
-            "Barauli": "63fa008cc969ead893b3675d",
-            "Barauni": "63f9f7ccc969ead893b2a185",
-            "Barbigha": "63f865cdd2e83876f03e0acf",
-            "Barh": "63fa0e71c969ead893b4a5ce",
-            "Barhampur": "63f9fadfc969ead893b2ea36",
-            "Barhara": "6492b7e5882c8da847736fc6",
-            "Barharia": "63f866e1d2e83876f03e2812",
-            "Barhat": "63fa011cc969ead893b37090",
-            "Bariarpur": "63fa07b8c969ead893b414a0",
-            "Barsoi": "63fa0467c969ead893b3c280",
-            "Barun": "6492b7d8882c8da847736f56",
-            "Baruraj (Motipur)": "63fa0910c969ead893b42575",
-            "Basantpur": "6492b7e7882c8da847736fe2",
-            "Basopatti": "63fa06c6c969ead893b3fd8c",
-            "Bathnaha": "63f86666d2e83876f03e1ab8",
-            "Bausi": "63f9f730c969ead893b292c8",
-            "Begusarai": "63f9f7ecc969ead893b2a41d",
-            "Behea": "63f9fa2cc969ead893b2d95b",
-            "Belaganj": "63f9fd01c969ead893b31b68",
-            "Belchhi": "63fa0e6cc969ead893b4a53b",
-            "Beldaur": "63fa053ec969ead893b3d781",
-            "Belhar": "63f9f67fc969ead893b2817e",
-            "Belsand": "63f86682d2e83876f03e1dc0",
-            "Ben": "63fa0b1bc969ead893b45721",
-            "Benipatti": "63fa0711c969ead893b4049a",
-            "Benipur": "63f9fc2cc969ead893b307bb",
-            "Bettiah": "63fa0d34c969ead893b48b19",
-            "Bhabua": "63fa0362c969ead893b3a901",
-            "Bhagwanpur": "6492b7d9882c8da847736f6c",
-            "Bhagwanpur Hat": "63f86718d2e83876f03e2e00",
-            "Bhargama": "63f9f12003196b93ff466176",
-            "Bhawanipur": "63fa0fbec969ead893b4c8d5",
-            "Bhitaha": "63fa0cefc969ead893b48432",
-            "Bhorey": "63f9ff4bc969ead893b35346",
-            "Bibhutpur": "63fa1340c969ead893b52398",
-            "Bidupur": "63f86941d2e83876f03e6763",
-            "Bihar": "63fa0ac6c969ead893b44eb9",
-            "Bihariganj": "63fa0694c969ead893b3f87b",
-            "Bihpur": "63f9f860c969ead893b2aea2",
-            "Bihta": "63fa0d7bc969ead893b491d5",
-            "Bijaipur": "63f9ff2fc969ead893b35079",
-            "Bikram": "63fa0dcac969ead893b495cb",
-            "Bikramganj": "63fa1125c969ead893b4e916",
-            "Bind": "63fa0aa7c969ead893b44c2e",
-            "Biraul": "63f9fc8ac969ead893b31022",
-            "Birpur": "63f9f7e4c969ead893b2a367",
-            "Bisfi": "63fa0725c969ead893b406a4",
-            "Bithan": "63fa1368c969ead893b527f9",
-            "Bochaha": "63fa09b0c969ead893b4347c",
-            "Bodh Gaya": "63f9fe4fc969ead893b33b91",
-            "Bokhara": "63f866c4d2e83876f03e24fe",
-            "Buxar": "63f9fb21c969ead893b2eed5",
-            "Chainpur": "6492b7e1882c8da847736f90",
-            "Chakai": "63fa01a6c969ead893b37e06",
-            "Chakia(Pipra)": "63fa0f59c969ead893b4be61",
-            "Chakki": "63f9fadbc969ead893b2e9da",
-            "Chanan": "63f9f6a1c969ead893b284dc",
-            "Chanan*": "63fa063ac969ead893b3eff8",
-            "Chand": "6492b7e1882c8da847736f92",
-            "Chandi": "63fa0a8bc969ead893b4497d",
-            "Chanpatia": "63fa0d0ac969ead893b486f9",
-            "Chapra": "6492b7e6882c8da847736fdc",
-            "Charaut": "63f866b4d2e83876f03e2322",
-            "Charpokhari": "63f9fa6ac969ead893b2df31",
-            "Chaugain": "63f9faf5c969ead893b2ec40",
-            "Chausa": "6492b7e2882c8da847736fa0",
-            "Chautham": "63fa0539c969ead893b3d6f3",
-            "Chehra Kalan": "63f8689ad2e83876f03e5762",
-            "Chenari": "63fa11a6c969ead893b4f767",
-            "Cheria Bariarpur": "63f9f76ac969ead893b2982c",
-            "Chewara": "63f865f4d2e83876f03e0ee2",
-            "Chhatapur": "63f867f7d2e83876f03e45e1",
-            "Chhorahi": "63f9f754c969ead893b29639",
-            "Chiraia": "63fa0ee9c969ead893b4b198",
-            "Dagarua": "63fa109dc969ead893b4db9a",
-            "Dalsinghsarai": "63fa1327c969ead893b52169",
-            "Dandari": "63f9f815c969ead893b2a784",
-            "Dandkhora": "63fa04d5c969ead893b3cd58",
-            "Daniawan": "63fa0e52c969ead893b4a240",
-            "Darauli": "63f8677fd2e83876f03e38e3",
-            "Daraundha": "63f867c2d2e83876f03e4039",
-            "Darbhanga": "63f9fbf4c969ead893b30254",
-            "Dariapur": "63f86575d2e83876f03e01e7",
-            "Daudnagar": "6492b7d8882c8da847736f58",
-            "Dawath": "63fa1110c969ead893b4e6d8",
-            "Dehri": "63fa121fc969ead893b5041e",
-            "Deo": "6492b7d8882c8da847736f5a",
-            "Desri": "63f86958d2e83876f03e69fe",
-            "Dhaka": "63fa0edac969ead893b4b03d",
-            "Dhamdaha": "63fa0fe9c969ead893b4cba4",
-            "Dhanarua": "63fa0e1bc969ead893b49c86",
-            "Dharhara": "63fa07d3c969ead893b41759",
-            "Dholi (Moraul)": "63fa0a0ec969ead893b43d6f",
-            "Dhuraiya": "63f9f35203196b93ff469bfb",
-            "Dighalbank": "63fa056fc969ead893b3dc59",
-            "Dighwara": "63f865b1d2e83876f03e07f4",
-            "Dinapur-Cum-Khagaul": "63fa0d56c969ead893b48e58",
-            "Dinara": "63fa10e8c969ead893b4e25d",
-            "Dobhi": "63f9fe36c969ead893b33905",
-            "Dulhin Bazar": "63fa0dd8c969ead893b49726",
-            "Dumaria": "6492b7db882c8da847736f7a",
-            "Dumra": "63f8669cd2e83876f03e2080",
-            "Dumraon": "63f9fafdc969ead893b2ed02",
-            "Dumri Katsari": "63f8661ad2e83876f03e12f4",
-            "Durgawati": "63fa030dc969ead893b3a0b2",
-            "Ekangarsarai": "63fa0af6c969ead893b45396",
-            "Ekma": "63fa13c4c969ead893b531b2",
-            "Falka": "63fa03ecc969ead893b3b66d",
-            "Fatehpur": "6492b7dc882c8da847736f7c",
-            "Fatwah": "63fa0e44c969ead893b4a09a",
-            "Forbesganj": "63f9f10c03196b93ff465f58",
-            "Gaighat": "63fa09f4c969ead893b43af0",
-            "Gamharia": "63fa065cc969ead893b3f325",
-            "Garhani": "63f9fa7cc969ead893b2e0f5",
-            "Garhpura": "63f9f762c969ead893b2976c",
-            "Garkha": "63f8659bd2e83876f03e05bd",
-            "Gaunaha": "63fa0c63c969ead893b476ac",
-            "Gaya Town C.D.Block": "63f9fd60c969ead893b32496",
-            "Ghailarh": "63fa0664c969ead893b3f3ec",
-            "Ghanshyampur": "63f9fc97c969ead893b31182",
-            "Ghat Kusumbha": "63f865efd2e83876f03e0e68",
-            "Ghoghardiha": "63fa0775c969ead893b40e60",
-            "Ghorasahan": "63fa0ed5c969ead893b4afa5",
-            "Ghoshi": "63fa026ac969ead893b390f0",
-            "Ghoswari": "63fa0e87c969ead893b4a843",
-            "Gidhaur": "6492b7df882c8da847736f86",
-            "Giriak": "63fa0b35c969ead893b459b6",
-            "Gobindpur": "6492b7e4882c8da847736fb6",
-            "Gogri": "63fa0544c969ead893b3d814",
-            "Goh": "6492b7d8882c8da847736f5c",
-            "Gopalganj": "63f9fffdc969ead893b363c6",
-            "Gopalpur": "63f9f87dc969ead893b2b175",
-            "Gora Bauram": "63f9fca2c969ead893b31271",
-            "Goradih": "63f9f94dc969ead893b2c517",
-            "Goraul": "63f86889d2e83876f03e55ad",
-            "Goriakothi": "63f866fad2e83876f03e2ad0",
-            "Guraru": "63f9fd86c969ead893b32800",
-            "Gurua": "63f9fd96c969ead893b32997",
-            "Guthani": "63f8676bd2e83876f03e36d4",
-            "Gwalpara": "63fa0689c969ead893b3f77a",
-            "Hajipur": "63f86910d2e83876f03e61d0",
-            "Halsi": "63fa064fc969ead893b3f1f0",
-            "Hanumannagar": "63f9fc5ac969ead893b30bf5",
-            "Harlakhi": "63fa06bdc969ead893b3fcae",
-            "Harnaut": "63fa0a79c969ead893b447e6",
-            "Harsidhi": "63fa0f0dc969ead893b4b5a4",
-            "Hasanganj": "6492b7e2882c8da847736f9a",
-            "Hasanpur": "6492b7e6882c8da847736fd4",
-            "Hasanpura": "63f867b7d2e83876f03e3ef2",
-            "Haspura": "6492b7d8882c8da847736f5e",
-            "Hathua": "63f9ffcac969ead893b35f01",
-            "Hayaghat": "63f9fc6fc969ead893b30da0",
-            "Hilsa": "63fa0aebc969ead893b45277",
-            "Hisua": "63fa0bcbc969ead893b467cb",
-            "Hulasganj": "63fa028cc969ead893b39446",
-            "Hussainganj": "63f8674ad2e83876f03e334a",
-            "Imamganj": "63f9fde3c969ead893b33118",
-            "Ishupur": "63fa139dc969ead893b52d74",
-            "Islamnagar Aliganj": "63fa00ebc969ead893b36c4a",
-            "Islampur": "6492b7e3882c8da847736fb2",
-            "Ismailpur": "63f9f8cbc969ead893b2b8f6",
-            "Itarhi": "63f9fb82c969ead893b2f7a8",
-            "Jagdishpur": "6492b7d9882c8da847736f70",
-            "Jainagar": "6492b7e2882c8da847736fa4",
-            "Jalalgarh": "63fa1026c969ead893b4d25f",
-            "Jalalpur": "6492b7e6882c8da847736fde",
-            "Jale": "63f9fbbdc969ead893b2fd08",
-            "Jamalpur": "6492b7e3882c8da847736fa8",
-            "Jamui": "63fa010bc969ead893b36ef9",
-            "Jandaha": "63f868e8d2e83876f03e5df8",
-            "Jehanabad": "63fa0234c969ead893b38ba9",
-            "Jhajha": "63fa0137c969ead893b37303",
-            "Jhanjharpur": "63fa0768c969ead893b40d0f",
-            "Jogapatti": "63fa0cf6c969ead893b484ea",
-            "Jokihat": "63f9f17603196b93ff466aae",
-            "Kadwa": "63fa0413c969ead893b3ba4f",
-            "Kahalgaon": "63f9f89bc969ead893b2b467",
-            "Kahara": "6492b7e6882c8da847736fce",
-            "Kako": "63fa024ac969ead893b38de5",
-            "Kaler": "63f86984d2e83876f03e6e6d",
-            "Kaluahi": "63fa070dc969ead893b40434",
-            "Kalyanpur": "6492b7e6882c8da847736fd6",
-            "Kanti": "63fa0979c969ead893b42f50",
-            "Karai Parsurai": "63fa0a67c969ead893b44616",
-            "Karakat": "63fa1135c969ead893b4eb0c",
-            "Kargahar": "63fa1179c969ead893b4f260",
-            "Karpi": "63f86993d2e83876f03e6fa0",
-            "Kasba": "63fa1017c969ead893b4d0a5",
-            "Kashi Chak": "63fa0b6bc969ead893b45edb",
-            "Katihar": "63fa04dfc969ead893b3ce54",
-            "Katiya": "63f9ff18c969ead893b34e33",
-            "Katoria": "63f9f6e4c969ead893b28b5f",
-            "Katra": "6492b7e3882c8da847736fb0",
-            "Katrisarai": "63fa0b3ec969ead893b45a94",
-            "Kawakol": "63fa0b80c969ead893b460d8",
-            "Keotiranway": "63f9fbdfc969ead893b3002c",
-            "Kesaria": "63fa0f32c969ead893b4b9bf",
-            "Kesath": "63f9fafac969ead893b2ecb5",
-            "Khagaria": "63fa052cc969ead893b3d5b4",
-            "Khaira": "6492b7e1882c8da847736f88",
-            "Khajauli": "63fa0706c969ead893b4038d",
-            "Khanpur": "6492b7e6882c8da847736fd8",
-            "Kharagpur": "63fa07f9c969ead893b41afd",
-            "Kharik": "63f9f86bc969ead893b2afcb",
-            "Khizirsarai": "63f9fd1ac969ead893b31db8",
-            "Khudabandpur": "63f9f74fc969ead893b295c9",
-            "Khusrupur": "63fa0e58c969ead893b4a2e7",
-            "Kiratpur": "63f9fc9ec969ead893b31215",
-            "Kishanganj": "6492b7e2882c8da847736f9c",
-            "Kishanpur": "63f86816d2e83876f03e4954",
-            "Kochadhamin": "63fa05cfc969ead893b3e585",
-            "Kochas": "63fa10c7c969ead893b4dea0",
-            "Koilwar": "63f9fa01c969ead893b2d568",
-            "Konch": "6492b7dc882c8da847736f7e",
-            "Korha": "63fa03fac969ead893b3b7dc",
-            "Kotwa": "63fa0f4cc969ead893b4bcdc",
-            "Krityanand Nagar": "63fa0ff8c969ead893b4cd3b",
-            "Kuchaikote": "63f9ff81c969ead893b35895",
-            "Kudra": "63fa02c1c969ead893b3997e",
-            "Kumarkhand": "63fa0672c969ead893b3f550",
-            "Kurhani": "63fa0a2dc969ead893b44075",
-            "Kursakatta": "63f9f14b03196b93ff46661b",
-            "Kursela": "63fa0503c969ead893b3d1e5",
-            "Kurtha": "63f869afd2e83876f03e722e",
-            "Kusheshwar Asthan": "63f9fcadc969ead893b31377",
-            "Kusheshwar Asthan Purbi": "63f9fcbfc969ead893b314e6",
-            "Kutumba": "6492b7d8882c8da847736f60",
-            "Ladania": "63fa06d3c969ead893b3fea6",
-            "Lahladpur": "63fa13bdc969ead893b530ed",
-            "Lakhisarai": "63fa062dc969ead893b3eea7",
-            "Lakhnaur": "63fa077fc969ead893b40f57",
-            "Lakri Nabiganj": "63f86708d2e83876f03e2c67",
-            "Lakshmipur": "6492b7e1882c8da847736f8a",
-            "Lalganj": "6492b7e7882c8da847736fe6",
-            "Laukaha": "63fa06d8c969ead893b3ff39",
-            "Laukahi": "63fa06e5c969ead893b4002b",
-            "Lauriya": "63fa0cb6c969ead893b47eff",
-            "Madanpur": "6492b7d8882c8da847736f62",
-            "Madhepur": "63fa0789c969ead893b4103f",
-            "Madhepura": "63fa0667c969ead893b3f43e",
-            "Madhuban": "6492b7e5882c8da847736fc2",
-            "Madhubani": "6492b7e4882c8da847736fba",
-            "Madhwapur": "63fa06b5c969ead893b3fbd5",
-            "Maharajganj": "6492b7e7882c8da847736fe0",
-            "Mahishi": "63fa124dc969ead893b50923",
-            "Mahnar": "63f8696cd2e83876f03e6c23",
-            "Mahua": "63f868ced2e83876f03e5b4e",
-            "Mainatanr": "63fa0c83c969ead893b479f6",
-            "Mairwa": "63f86762d2e83876f03e35c9",
-            "Majhaulia": "63fa0d25c969ead893b48991",
-            "Majorganj": "63f8663cd2e83876f03e1641",
-            "Maker": "63fa1449c969ead893b5403c",
-            "Makhdumpur": "63fa0275c969ead893b391fb",
-            "Maner": "63fa0d4cc969ead893b48d6b",
-            "Manigachhi": "63f9fc11c969ead893b30503",
-            "Manihari": "63fa0509c969ead893b3d27d",
-            "Manjha": "63fa000bc969ead893b36530",
-            "Manjhi": "63fa13d4c969ead893b53385",
-            "Manpur": "6492b7dd882c8da847736f80",
-            "Mansahi": "63fa04e5c969ead893b3cef1",
-            "Mansi": "63fa0536c969ead893b3d6b0",
-            "Mansurchak": "63f9f793c969ead893b29c2a",
-            "Marauna": "63f8681ed2e83876f03e4a32",
-            "Marhaura": "63fa1421c969ead893b53bd8",
-            "Marwan": "63fa096bc969ead893b42e18",
-            "Masaurhi": "63fa0df9c969ead893b49a86",
-            "Mashrakh": "63fa1373c969ead893b52913",
-            "Matihani": "63f9f83dc969ead893b2ab63",
-            "Mehsi": "63fa0f8dc969ead893b4c3ac",
-            "Meskaur": "63fa0be1c969ead893b46a13",
-            "Minapur": "63fa0992c969ead893b43178",
-            "Modanganj": "63fa0260c969ead893b38fdb",
-            "Mohania": "63fa02e4c969ead893b39c9b",
-            "Mohanpur": "6492b7dd882c8da847736f82",
-            "Mohiuddinagar": "63fa130dc969ead893b51e8e",
-            "Mokameh": "63fa0e8bc969ead893b4a8bd",
-            "Morwa": "63fa12f2c969ead893b51ba1",
-            "Motihari": "63fa0ef4c969ead893b4b2bc",
-            "Muhra": "63f9fd39c969ead893b320cd",
-            "Munger": "63fa079bc969ead893b411f1",
-            "Murliganj": "63fa0681c969ead893b3f6b5",
-            "Musahri": "63fa0a15c969ead893b43e2a",
-            "Nabinagar": "6492b7d8882c8da847736f64",
-            "Nagar Nausa": "63fa0a70c969ead893b446f9",
-            "Nagra": "63fa1416c969ead893b53aaf",
-            "Nanpur": "63f866bed2e83876f03e245c",
-            "Naokothi": "63f9f7ffc969ead893b2a5aa",
-            "Narayanpur": "6492b7d9882c8da847736f6e",
-            "Nardiganj": "63fa0b41c969ead893b45ade",
-            "Narhat": "63fa0bd5c969ead893b468cc",
-            "Narkatia": "63fa0ec6c969ead893b4ae20",
-            "Narkatiaganj": "63fa0c96c969ead893b47bdd",
-            "Narpatganj": "63f9f10103196b93ff465e11",
-            "Nasriganj": "63fa1150c969ead893b4edfc",
-            "Nathnagar": "63f9f8e2c969ead893b2bb25",
-            "Naubatpur": "63fa0d92c969ead893b493d5",
-            "Naugachhia": "63f9f873c969ead893b2b09a",
-            "Nauhatta": "63fa11c6c969ead893b4fa70",
-            "Nautan": "6492b7e4882c8da847736fbc",
-            "Nawada": "63fa0b4cc969ead893b45bf3",
-            "Nawanagar": "63f9fba7c969ead893b2faed",
-            "Neem Chak Bathani": "63f9fd31c969ead893b31ff9",
-            "Nirmali": "63f867e2d2e83876f03e439b",
-            "Nokha": "6492b7e5882c8da847736fca",
-            "Noorsarai": "63fa0ad5c969ead893b45032",
-            "Nuaon": "63fa02afc969ead893b397b0",
-            "Obra": "6492b7d9882c8da847736f66",
-            "Pach Deuri": "63f9ff6ec969ead893b356a4",
-            "Pachrukhi": "63f8673ad2e83876f03e31a4",
-            "Paharpur": "63fa0f17c969ead893b4b6d7",
-            "Pakri Dayal": "63fa0f67c969ead893b4bfe9",
-            "Pakribarawan": "63fa0b72c969ead893b45f82",
-            "Palasi": "63f9f16303196b93ff466895",
-            "Paliganj": "63fa0de3c969ead893b49836",
-            "Panapur": "63fa1381c969ead893b52a69",
-            "Pandarak": "63fa0e7ac969ead893b4a6cf",
-            "Pandaul": "63fa0742c969ead893b4095a",
-            "Paraiya": "63f9fd73c969ead893b32655",
-            "Parbalpur": "63fa0ae7c969ead893b45202",
-            "Parbatta": "63fa0551c969ead893b3d965",
-            "Parihar": "63f8664dd2e83876f03e180c",
-            "Paroo": "63fa092dc969ead893b427fc",
-            "Parsa": "63f86570d2e83876f03e0163",
-            "Parsauni": "63f8667ed2e83876f03e1d50",
-            "Patahi": "63fa0f6bc969ead893b4c05e",
-            "Patarghat": "63fa126ec969ead893b50cab",
-            "Patepur": "63f868a8d2e83876f03e586d",
-            "Paterhi Belsar": "63f86859d2e83876f03e50bf",
-            "Patna Rural": "63fa0d5fc969ead893b48f2c",
-            "Patori": "63fa12fdc969ead893b51cd4",
-            "Phenhara": "63fa0f74c969ead893b4c128",
-            "Phulidumar": "63f9f665c969ead893b27f15",
-            "Phulparas": "63fa06f1c969ead893b40177",
-            "Phulwari": "63fa0d6dc969ead893b4909d",
-            "Phulwaria": "63f9ffb3c969ead893b35ced",
-            "Pipariya": "6492b7e2882c8da847736f9e",
-            "Pipra": "63f86831d2e83876f03e4c6b",
-            "Piprakothi": "63fa0f56c969ead893b4bdfb",
-            "Piprarhi": "63f8660cd2e83876f03e1183",
-            "Piprasi": "63fa0ce7c969ead893b4838b",
-            "Piro": "63f9fa52c969ead893b2dd0e",
-            "Pirpainti": "63f9f883c969ead893b2b203",
-            "Pothia": "63fa0599c969ead893b3e08b",
-            "Pranpur": "63fa04c5c969ead893b3cbad",
-            "Pratapganj": "63f86802d2e83876f03e4728",
-            "Punpun": "63fa0e32c969ead893b49eea",
-            "Pupri": "63f866b7d2e83876f03e2379",
-            "Puraini": "63fa06a1c969ead893b3f9cc",
-            "Purnahiya": "63f86607d2e83876f03e10ff",
-            "Purnia East": "63fa1006c969ead893b4cee1",
-            "Pusa": "63fa12e0c969ead893b5198b",
-            "Rafiganj": "6492b7d9882c8da847736f68",
-            "Raghopur": "6492b7e7882c8da847736fe8",
-            "Raghunathpur": "63f867a1d2e83876f03e3c75",
-            "Rahui": "63fa0a99c969ead893b44ae2",
-            "Raja Pakar": "63f86901d2e83876f03e6066",
-            "Rajauli": "63fa0bfec969ead893b46cf6",
-            "Rajaun": "63f9f32d03196b93ff4697ee",
-            "Rajgir": "63fa0b21c969ead893b457c3",
-            "Rajnagar": "6492b7e3882c8da847736fa6",
-            "Rajpur": "6492b7da882c8da847736f74",
-            "Ramgarh": "6492b7e1882c8da847736f94",
-            "Ramgarh Chowk": "63fa0648c969ead893b3f14e",
-            "Ramgarhwa": "63fa0ea7c969ead893b4ab77",
-            "Ramnagar": "6492b7e4882c8da847736fbe",
-            "Rampur": "6492b7e2882c8da847736f96",
-            "Rangra Chowk": "63f9f878c969ead893b2b10f",
-            "Raniganj": "6492b7d7882c8da847736f52",
-            "Ratni Faridpur": "63fa021fc969ead893b389c2",
-            "Raxaul": "63fa0e91c969ead893b4a970",
-            "Revelganj": "63fa13fac969ead893b53783",
-            "Riga": "63f86677d2e83876f03e1c7c",
-            "Roh": "63fa0b8bc969ead893b461ca",
-            "Rohtas": "63fa1235c969ead893b5068e",
-            "Rosera": "63fa1348c969ead893b52476",
-            "Runisaidpur": "63f86689d2e83876f03e1e80",
-            "Rupauli": "63fa0fdec969ead893b4ca8f",
-            "Sabour": "63f9f8cfc969ead893b2b95c",
-            "Sahar": "63f9faadc969ead893b2e5b0",
-            "Sahdai Buzurg": "63f86960d2e83876f03e6ad7",
-            "Sahebganj": "63fa08f7c969ead893b422fd",
-            "Sahebpur Kamal": "63f9f81ac969ead893b2a817",
-            "Sakra": "63fa0a4ec969ead893b443b5",
-            "Salkhua": "63fa1285c969ead893b50f4d",
-            "Samastipur": "63fa12cfc969ead893b5179f",
-            "Sameli": "63fa04fcc969ead893b3d12f",
-            "Sampatchak": "63fa0d65c969ead893b48fd8",
-            "Sandesh": "63f9fa10c969ead893b2d6cd",
-            "Sangrampur": "6492b7e5882c8da847736fc4",
-            "Sanjhauli": "63fa1160c969ead893b4efca",
-            "Saraigarh Bhaptiyahi": "63f8680fd2e83876f03e488f",
-            "Sarairanjan": "63fa1316c969ead893b51f80",
-            "Saraiya": "63fa094dc969ead893b42b14",
-            "Sarmera": "63fa0ab1c969ead893b44cdf",
-            "Sasaram": "63fa11f6c969ead893b4ffab",
-            "Satar Kataiya": "63fa1246c969ead893b50863",
-            "Saur Bazar": "63fa1263c969ead893b50b91",
-            "Shahkund": "63f9f924c969ead893b2c173",
-            "Shahpur": "6492b7da882c8da847736f72",
-            "Shambhuganj": "63f9f2eb03196b93ff4690da",
-            "Shamho Akha Kurha": "63f9f84ac969ead893b2ac9b",
-            "Shankarpur": "63fa0671c969ead893b3f521",
-            "Sheikhpura": "63f865dfd2e83876f03e0ca4",
-            "Shekhopur Sarai": "63f865dad2e83876f03e0c0c",
-            "Sheohar": "63f86611d2e83876f03e1207",
-            "Sheosagar": "63fa11d2c969ead893b4fbc6",
-            "Sherghati": "63f9fe24c969ead893b33755",
-            "Shivaji Nagar": "63fa12b5c969ead893b514ff",
-            "Sidhaw": "63fa0c21c969ead893b47047",
-            "Sidhwalia": "63fa00c8c969ead893b368ef",
-            "Sikandra": "6492b7e1882c8da847736f8c",
-            "Sikta": "63fa0d18c969ead893b4885e",
-            "Sikti": "63f9f15703196b93ff466776",
-            "Silao": "63fa0b2bc969ead893b458bf",
-            "Simri": "63f9fabac969ead893b2e6cc",
-            "Simri Bakhtiarpur": "63fa127ac969ead893b50e1f",
-            "Singheshwar": "63fa065fc969ead893b3f363",
-            "Singhia": "63fa1350c969ead893b52559",
-            "Singhwara": "63f9fbcac969ead893b2fe36",
-            "Sirdala": "63fa0bedc969ead893b46b41",
-            "Siswan": "63f867d1d2e83876f03e41d5",
-            "Siwan": "63f866d2d2e83876f03e267b",
-            "Sonbarsa": "6492b7e6882c8da847736fd2",
-            "Sonbhadra Banshi Suryapur": "63f869a5d2e83876f03e7146",
-            "Sonepur": "63f865b9d2e83876f03e08e1",
-            "Sonhaula": "63f9f993c969ead893b2cb24",
-            "Sono": "63fa0174c969ead893b37922",
-            "Srinagar": "6492b7e5882c8da847736fc8",
-            "Sugauli": "63fa0eb2c969ead893b4ac55",
-            "Sultanganj": "63f9f903c969ead893b2be42",
-            "Supaul": "63f86824d2e83876f03e4af2",
-            "Suppi": "63f86635d2e83876f03e1586",
-            "Surajgarha": "63fa0608c969ead893b3eb0d",
-            "Sursand": "63f8665dd2e83876f03e19ad",
-            "Suryapura": "63fa111cc969ead893b4e824",
-            "Tajpur": "63fa12e7c969ead893b51a46",
-            "Tan Kuppa": "63f9fe6cc969ead893b33e4a",
-            "Taraiya": "63fa138dc969ead893b52bc4",
-            "Tarapur": "6492b7e3882c8da847736fac",
-            "Tarari": "63f9fa96c969ead893b2e36f",
-            "Tardih": "63f9fc1ac969ead893b305fa",
-            "Tariani Chowk": "63f86620d2e83876f03e1387",
-            "Teghra": "63f9f7b3c969ead893b29f2b",
-            "Terhagachh": "63fa055ec969ead893b3dac2",
-            "Tetaria": "63fa0f84c969ead893b4c2c4",
-            "Tetiha Bambor": "63fa08cfc969ead893b4206a",
-            "Thakrahan": "63fa0cf3c969ead893b484a7",
-            "Thakurganj": "63fa057fc969ead893b3ddf0",
-            "Tharthari": "63fa0ae1c969ead893b4516a",
-            "Thawe": "63f9fff2c969ead893b362bb",
-            "Tikari": "63f9fce2c969ead893b3185f",
-            "Tilouthu": "63fa1228c969ead893b50542",
-            "Tribeniganj": "63f86837d2e83876f03e4d30",
-            "Turkaulia": "63fa0f03c969ead893b4b471",
-            "Uchkagaon": "63f9ffe1c969ead893b3611f",
-            "Udwant Nagar": "63f9fa1cc969ead893b2d7dd",
-            "Ujiarpur": "63fa1331c969ead893b52256",
-            "Vaishali": "63f86843d2e83876f03e4e74",
-            "Vidyapati Nagar": "63fa1321c969ead893b520b3",
-            "Warisaliganj": "63fa0b5bc969ead893b45d62",
-            "Warisnagar": "63fa12a8c969ead893b51381",
-            "Wazirganj": "63f9fe81c969ead893b3404f",
-            "Ziradei": "63f86753d2e83876f03e3432",
-            "PATNA": "63fa0d4cc969ead893b48d68",
-            "KAIMUR (BHABUA)": "63fa0296c969ead893b39537",
-            "BHOJPUR": "63f9f9bbc969ead893b2ceea",
-            "GAYA": "63f9fcc6c969ead893b3159b",
-            "MUZAFFARPUR": "63fa08f7c969ead893b422fa",
-            "NALANDA": "63fa0a67c969ead893b44613",
-            "PURBI CHAMPARAN": "63fa0e91c969ead893b4a96d",
-            "PURNIA": "63fa0f9dc969ead893b4c583",
-            "SAHARSA": "63fa123cc969ead893b5074d",
-            "BHAGALPUR": "63f9f857c969ead893b2adcd",
-            "SITAMARHI": "63f8662ed2e83876f03e150e",
-            "PASHCHIM CHAMPARAN": "63fa0c21c969ead893b47044",
-            "SARAN": "63f86570d2e83876f03e0160"
-        },
-        "63f8e35adbc0f7fe06708342": {
-            "ARJUNDA": "63f91e8276742aaa3ce75486",
-            "Abhanpur": "63f918a176742aaa3ce6e23c",
-            "Adbhar": "63f8e657dbc0f7fe0670bfda",
-            "Ahiwara": "6492b7ea882c8da847737000",
-            "Ajgarbahar": "63f9166776742aaa3ce6ae0d",
-            "Akaltara": "63f9128776742aaa3ce66361",
-            "Ambagarh": "63f8e5bddbc0f7fe0670b39a",
-            "Ambikapur": "63f9199976742aaa3ce6f7c8",
-            "Amlipadar": "63f91def76742aaa3ce74839",
-            "Antagarh": "63f9143576742aaa3ce68518",
-            "Arang": "63f9188d76742aaa3ce6e064",
-            "Aundhi": "63f8e5ebdbc0f7fe0670b768",
-            "BADE BACHELI": "63f9117d76742aaa3ce64b21",
-            "BARSUR": "63f9118676742aaa3ce64c04",
-            "BIHARPUR": "63f9206a76742aaa3ce76ecb",
-            "Bade Rajpur": "63f91be376742aaa3ce723ef",
-            "Bagbahra": "63f9178976742aaa3ce6c8d2",
-            "Bagicha": "63f912e876742aaa3ce66add",
-            "Baikunthpur": "63f9168676742aaa3ce6b119",
-            "Bakavand": "63f9108076742aaa3ce63384",
-            "Balod": "63f91e3176742aaa3ce74dff",
-            "Baloda": "63f9129876742aaa3ce664f8",
-            "Baloda Bazar": "63f91c9a76742aaa3ce7309b",
-            "Balrampur": "641dacff523a9a8b4d9c8fe5",
-            "Bamhnidih": "63f912d376742aaa3ce66951",
-            "Baradwar": "63f8e663dbc0f7fe0670c0cc",
-            "Baramkela": "63f8e6b4dbc0f7fe0670c721",
-            "Barpali": "63f9163976742aaa3ce6aac6",
-            "Basna": "63f916c576742aaa3ce6b6b9",
-            "Bastanar": "63f9106876742aaa3ce6315a",
-            "Bastar": "63f9107276742aaa3ce63256",
-            "Batouli": "63f919f976742aaa3ce70057",
-            "Belargaon": "63f9120c76742aaa3ce65888",
-            "Belgahana": "6492b7e9882c8da847736ff6",
-            "Beltara": "641daed6523a9a8b4d9cac10",
-            "Bemetara": "63f8e3dadbc0f7fe06708d46",
-            "Berla": "63f8e430dbc0f7fe067093eb",
-            "Bhairamgarh": "63f91a8476742aaa3ce70abf",
-            "Bhaisma": "6492b7ed882c8da847737014",
-            "Bhaiyathan": "63f9203976742aaa3ce76a31",
-            "Bhakhara": "63f911fd76742aaa3ce65719",
-            "Bhanpuri": "63f910b776742aaa3ce6389e",
-            "Bhanupratappur": "63f913c176742aaa3ce67ba1",
-            "Bharatpur": "6492b7ee882c8da84773701a",
-            "Bhatapara": "63f91c7876742aaa3ce72e64",
-            "Bhatgaon": "6492b7f2882c8da847737026",
-            "Bhilai": "6492b7ea882c8da847737002",
-            "Bhimbhauri": "63f8e467dbc0f7fe06709860",
-            "Bhopalpattnam": "63f91a2076742aaa3ce70352",
-            "Bijapur": "63f91a7376742aaa3ce70987",
-            "Bilaigarh": "63f8e6dfdbc0f7fe0670ca61",
-            "Bilaspur": "641daee4523a9a8b4d9cacee",
-            "Bilha": "641daef4523a9a8b4d9cadfe",
-            "Bindranavagarh(Gariyaband)": "63f91d3976742aaa3ce73db4",
-            "Bodla": "63f914e676742aaa3ce692a4",
-            "Bodri": "6492b7e9882c8da847736ff8",
-            "Bori": "6492b7ea882c8da847737004",
-            "CHANDO": "6492b7e8882c8da847736fec",
-            "CHHAL": "63f9187d76742aaa3ce6dedd",
-            "Chalgali": "6492b7e7882c8da847736fea",
-            "Champa": "63f912b176742aaa3ce6671b",
-            "Charama": "63f913a676742aaa3ce679ba",
-            "Chhindgarh": "63f91b9076742aaa3ce71e9d",
-            "Chhotedongar": "63f91b4676742aaa3ce7187f",
-            "Chhuikhadan": "63f8e4a6dbc0f7fe06709d87",
-            "Chhura": "63f91d6e76742aaa3ce74117",
-            "Chhuriya": "63f9193876742aaa3ce6efbe",
-            "Chirmiri": "63f8e555dbc0f7fe0670ab73",
-            "DARRI": "63f9166f76742aaa3ce6aed2",
-            "DAURAKOCHALI": "6492b7e8882c8da847736fee",
-            "Dabhra": "63f8e60fdbc0f7fe0670ba39",
-            "Dantewada": "63f9115c76742aaa3ce647ea",
-            "Darbha": "63f910aa76742aaa3ce63761",
-            "Darima": "63f91a1076742aaa3ce7024f",
-            "Deobhog": "63f91dca76742aaa3ce74661",
-            "Devkar": "63f8e45cdbc0f7fe06709782",
-            "Dhamdha": "63f9121976742aaa3ce659b3",
-            "Dhamtari": "63f911b776742aaa3ce65085",
-            "Dhanora": "6492b7ec882c8da847737010",
-            "Dharsiwa": "63f918da76742aaa3ce6e767",
-            "Dipka": "63f9167c76742aaa3ce6b020",
-            "Dondi": "63f91e4576742aaa3ce74fc8",
-            "Dondi Luhara": "63f91e1876742aaa3ce74bbe",
-            "Dongargaon": "63f9196d76742aaa3ce6f42a",
-            "Dongargarh": "63f918fa76742aaa3ce6ea24",
-            "Duldula": "63f9135176742aaa3ce67320",
-            "Durg": "63f9123b76742aaa3ce65d0c",
-            "Durgkondal": "63f913dd76742aaa3ce67dc9",
-            "Farasgaon": "63f91c4b76742aaa3ce72ad0",
-            "Farsabahar": "63f9136376742aaa3ce6746c",
-            "GADIRAS": "63f91baf76742aaa3ce72077",
-            "GANDAI": "63f8e4fbdbc0f7fe0670a42f",
-            "GANGALOOR": "63f91adf76742aaa3ce71081",
-            "GOBRA NAVAPARA": "63f918c176742aaa3ce6e506",
-            "Gharghoda": "63f917f376742aaa3ce6d23a",
-            "Gidam": "63f9116776742aaa3ce648e6",
-            "Gunderdehi": "63f91dff76742aaa3ce749c3",
-            "Gurur": "63f91e6076742aaa3ce75222",
-            "Hardibazar": "63f9167376742aaa3ce6af2e",
-            "Hasaud": "6492b7f0882c8da847737024",
-            "Jagdalpur": "63f9104676742aaa3ce62e13",
-            "Jaijaipur": "63f8e63ddbc0f7fe0670bdda",
-            "Janjgir": "63f9127d76742aaa3ce6626a",
-            "Jarhagaon": "63f91feb76742aaa3ce764bb",
-            "Jashpur": "63f9130a76742aaa3ce66d89",
-            "KELHARI": "63f8e558dbc0f7fe0670abac",
-            "KHARORA": "63f918cb76742aaa3ce6e60c",
-            "KOTADOL": "63f8e56ddbc0f7fe0670ad1b",
-            "KUTRU": "63f91ac676742aaa3ce70ea4",
-            "Kanker": "63f9140276742aaa3ce680b9",
-            "Kansabel": "63f912fb76742aaa3ce66c51",
-            "Kartala": "63f9163076742aaa3ce6aa06",
-            "Kasdol": "63f91cd276742aaa3ce734af",
-            "Katekalyan": "63f9116f76742aaa3ce649ba",
-            "Katghora": "63f915ca76742aaa3ce6a2ee",
-            "Kawardha": "63f914b576742aaa3ce68ef6",
-            "Keskal": "63f91bbc76742aaa3ce72190",
-            "Khadganva": "63f8e54adbc0f7fe0670aa8b",
-            "Khadgaon": "63f8e5e3dbc0f7fe0670b6b7",
-            "Khairagarh": "63f8e4c3dbc0f7fe06709faa",
-            "Kharsia": "63f9186176742aaa3ce6dc29",
-            "Kohkameta": "6492b7f0882c8da84773701e",
-            "Komakhan": "6492b7ed882c8da847737018",
-            "Kondagaon": "63f91bf976742aaa3ce72531",
-            "Konta": "63f91b5176742aaa3ce71996",
-            "Korba": "63f9160c76742aaa3ce6a815",
-            "Kota": "641daf11523a9a8b4d9cafc2",
-            "Kuakonda": "63f9117876742aaa3ce64a9d",
-            "Kukrel": "63f911f676742aaa3ce65659",
-            "Kunda": "6492b7eb882c8da84773700a",
-            "Kunkuri": "63f9133c76742aaa3ce6715c",
-            "Kurud": "63f9118c76742aaa3ce64c9e",
-            "Kusami": "641dacf9523a9a8b4d9c8f93",
-            "LATORI": "63f9205e76742aaa3ce76d8e",
-            "LAWAN": "63f91cfa76742aaa3ce737f9",
-            "Lailunga": "63f917de76742aaa3ce6d062",
-            "Lakhanpur": "6492b7f2882c8da84773702a",
-            "Lalbahadur Nagar": "63f9198876742aaa3ce6f66b",
-            "Lalpur Thana": "63f91fd076742aaa3ce762e8",
-            "Lohandiguda": "63f9105676742aaa3ce62f9b",
-            "Lormi": "63f91ed476742aaa3ce757a2",
-            "Lundra": "63f919d576742aaa3ce6fd21",
-            "Magarlod": "63f9119e76742aaa3ce64e3f",
-            "Mahasamund": "63f9172c76742aaa3ce6c02c",
-            "Mainpat": "63f91a0676742aaa3ce70167",
-            "Mainpur": "63f91da876742aaa3ce74466",
-            "Makdi": "63f91c2d76742aaa3ce728da",
-            "Malkharoda": "63f8e62edbc0f7fe0670bca7",
-            "Mandir Hasaud": "63f918ea76742aaa3ce6e8b8",
-            "Manendragarh": "63f8e53bdbc0f7fe0670a953",
-            "Manora": "63f9132476742aaa3ce66f75",
-            "Manpur": "63f8e5a9dbc0f7fe0670b1ef",
-            "Mardapal": "6492b7ec882c8da847737012",
-            "Marri Bangla Dewri": "63f91ebe76742aaa3ce755be",
-            "Marwahi": "63f8e485dbc0f7fe06709ad2",
-            "Masturi": "641daf5f523a9a8b4d9cb45a",
-            "Mohla": "63f8e580dbc0f7fe0670ae96",
-            "Mukdega": "63f9188776742aaa3ce6dfcf",
-            "Mungeli": "63f91f4576742aaa3ce75b28",
-            "NANDGHAT": "63f8e448dbc0f7fe067095d7",
-            "Nagri": "6492b7ea882c8da847736ffe",
-            "Nangur": "63f910c376742aaa3ce639bd",
-            "Narayanpur": "6492b7f0882c8da847737020",
-            "Narharpur": "63f9141a76742aaa3ce682c8",
-            "Nawagarh": "6492b7eb882c8da847737008",
-            "Orchha": "63f91b0c76742aaa3ce713a5",
-            "Oudgi": "63f9202a76742aaa3ce768ef",
-            "Pakhanjur": "63f9146676742aaa3ce688e4",
-            "Palari": "63f91cae76742aaa3ce73219",
-            "Pali": "6492b7ed882c8da847737016",
-            "Pamgarh": "63f912b376742aaa3ce66745",
-            "Pandariya": "63f9156876742aaa3ce69b81",
-            "Pasan": "63f9165476742aaa3ce6ac71",
-            "Patan": "6492b7eb882c8da847737006",
-            "Pathalgaon": "63f9137b76742aaa3ce6765d",
-            "Pathariya": "63f91f8b76742aaa3ce75fd0",
-            "Patna": "63f916bb76742aaa3ce6b5c5",
-            "Pendra": "63f8e498dbc0f7fe06709c64",
-            "Pendra Road Gorella": "63f8e470dbc0f7fe06709927",
-            "Pipariya": "6492b7ec882c8da84773700c",
-            "Pithora": "63f9175576742aaa3ce6c3f8",
-            "Pondi Bachra": "63f916b376742aaa3ce6b50f",
-            "Poundi-Uproda": "63f915d376742aaa3ce6a3b8",
-            "Pratappur": "6492b7f2882c8da847737028",
-            "Premnagar": "63f9205476742aaa3ce76ca6",
-            "Pusour": "63f9184376742aaa3ce6d93e",
-            "RAGHUNATHNAGAR": "6492b7e8882c8da847736ff0",
-            "RAMCHANDRAPUR": "63f8e387dbc0f7fe06708680",
-            "RENGAKHARKALA": "63f915b176742aaa3ce6a11e",
-            "Raigarh": "63f9182076742aaa3ce6d62b",
-            "Raipur": "6492b7f0882c8da847737022",
-            "Rajim": "63f91d2476742aaa3ce73bb9",
-            "Rajnandgaon": "63f9191076742aaa3ce6ec4c",
-            "Rajpur": "641dacfb523a9a8b4d9c8fb2",
-            "Ramanujganj": "641dad00523a9a8b4d9c9000",
-            "Ramanujnagar": "63f9204576742aaa3ce76b28",
-            "Ramchandrapur": "641dacfe523a9a8b4d9c8fde",
-            "Ratanpur": "641daf17523a9a8b4d9cb014",
-            "SAMRI": "6492b7e8882c8da847736ff2",
-            "SANNA": "63f9139776742aaa3ce6787b",
-            "SARIYA": "63f8e6f1dbc0f7fe0670cbd0",
-            "SUHELA": "63f91d0b76742aaa3ce73972",
-            "Sahaspur Lohara": "63f9153676742aaa3ce6979c",
-            "Saja": "63f8e40cdbc0f7fe0670910d",
-            "Sakeri": "641dafa5523a9a8b4d9cb8a0",
-            "Sakola": "63f8e49edbc0f7fe06709cd9",
-            "Sakri": "6492b7e9882c8da847736ffa",
-            "Sakti": "63f8e5f8dbc0f7fe0670b866",
-            "Salhewara": "63f8e50ddbc0f7fe0670a5ad",
-            "Samari": "641dacfa523a9a8b4d9c8fa4",
-            "Samri(kusmi)": "6492b7e9882c8da847736ff4",
-            "Saragaon": "63f912de76742aaa3ce66a16",
-            "Saraipali": "63f916f876742aaa3ce6bb7f",
-            "Sarangarh": "63f8e66cdbc0f7fe0670c17a",
-            "Sargaon": "6492b7ee882c8da84773701c",
-            "Sarona": "6492b7ec882c8da84773700e",
-            "Seepat": "6492b7ea882c8da847736ffc",
-            "Shankargarh": "641dacfe523a9a8b4d9c8fd7",
-            "Shivrinarayan": "63f912c376742aaa3ce668af",
-            "Simga": "63f91c6676742aaa3ce72cdc",
-            "Sipat": "641daf49523a9a8b4d9cb2ff",
-            "Sitapur": "6492b7f2882c8da84773702c",
-            "Sonakhan": "63f91d1a76742aaa3ce73ad4",
-            "Sonhat": "63f9169d76742aaa3ce6b300",
-            "Sukma": "63f91ba776742aaa3ce71fda",
-            "Surajpur": "63f9201d76742aaa3ce767da",
-            "Takhatpur": "641daf81523a9a8b4d9cb65f",
-            "Tamnar": "63f9180776742aaa3ce6d3e0",
-            "Thanakhamria": "63f8e41cdbc0f7fe06709263",
-            "Tilda": "63f918b176742aaa3ce6e3c4",
-            "Tokapal": "63f9109976742aaa3ce635de",
-            "Tongpal": "63f91bb476742aaa3ce720e7",
-            "Tundra": "63f91d1676742aaa3ce73a6e",
-            "Udaipur (Dharamjaigarh)": "63f917bf76742aaa3ce6cd90",
-            "Udaypur": "63f919c176742aaa3ce6fb53",
-            "Usur": "63f91a5276742aaa3ce706f1",
-            "Wadrafnagar": "641dacfa523a9a8b4d9c8fab",
-            "KABIRDHAM": "63f914b576742aaa3ce68ef3",
-            "SURGUJA": "63f9199776742aaa3ce6f7c5",
-            "KOREA": "63f9168576742aaa3ce6b116",
-            "GARIYABAND": "63f91d2476742aaa3ce73bb6",
-            "JANJGIR-CHAMPA": "63f9127d76742aaa3ce66267",
-            "MOHLA MANPUR AMBAGARH CHOUKI": "63f8e57fdbc0f7fe0670ae93",
-            "KHAIRGARH CHHUIKHADAN GANDAI": "63f8e4a6dbc0f7fe06709d84",
-            "SARANGARH BILAIGARH": "63f8e66cdbc0f7fe0670c177",
-            "MANENDRAGARH CHIRIMIRI BHARATPUR": "63f8e520dbc0f7fe0670a734",
-            "Gaurella Pendra Marwahi": "63f8e470dbc0f7fe06709924"
-        },
-        "63f5ceb98cec41e6c95ce3a8": {
-            "Alipur": "63f5cec78cec41e6c95ce4cd",
-            "Civil Lines": "63f5ceb98cec41e6c95ce3ae",
-            "Defence Colony": "63f5cef28cec41e6c95ce80d",
-            "Delhi Cantonment": "63f5cebd8cec41e6c95ce40a",
-            "Dwarka": "63f5ceee8cec41e6c95ce7bd",
-            "Gandhi Nagar": "63f5cebb8cec41e6c95ce3da",
-            "Hauz Khas": "63f5cedc8cec41e6c95ce65d",
-            "Kalkaji": "63f5cef28cec41e6c95ce814",
-            "Kanjhawala": "63f5ced88cec41e6c95ce60e",
-            "Kapeshera": "63f5cee78cec41e6c95ce743",
-            "Karawal Nagar": "63f5ced28cec41e6c95ce59d",
-            "Mayur Vihar": "63f5cebc8cec41e6c95ce3ed",
-            "Mehrauli": "63f5cedf8cec41e6c95ce698",
-            "Model Town": "63f5cec78cec41e6c95ce4c1",
-            "Najafgarh": "63f5cee18cec41e6c95ce6bf",
-            "Narela": "63f5cebf8cec41e6c95ce433",
-            "Patel Nagar": "63f5ceee8cec41e6c95ce7c6",
-            "Preet Vihar": "63f5cebb8cec41e6c95ce3e1",
-            "Punjabi Bagh": "63f5ceef8cec41e6c95ce7d2",
-            "Rohini": "63f5ced58cec41e6c95ce5df",
-            "Saket": "63f5cedc8cec41e6c95ce669",
-            "Saraswati Vihar": "63f5ced58cec41e6c95ce5d8",
-            "Sarita Vihar": "63f5cef38cec41e6c95ce81b",
-            "Seelam Pur": "63f5cecf8cec41e6c95ce567",
-            "Seema Puri": "63f5cef58cec41e6c95ce849",
-            "Shahdara": "63f5cef48cec41e6c95ce83d",
-            "Vasant Vihar": "63f5cebe8cec41e6c95ce411",
-            "Yamuna Vihar": "63f5ced18cec41e6c95ce58c",
-            "SOUTH": "63f5cedc8cec41e6c95ce65a",
-            "NORTH": "63f5cebf8cec41e6c95ce430"
-        },
-        "63f9bcdc519359b7438cdeb3": {
-            "Bardez": "63f9bce2519359b7438cdf42",
-            "Bicholim": "63f9bcf3519359b7438ce0db",
-            "Canacona": "63f9bd2d519359b7438ce654",
-            "Dharbandora": "63f9bd30519359b7438ce688",
-            "Mormugao": "63f9bd11519359b7438ce39f",
-            "Pernem": "63f9bcdd519359b7438cdeb9",
-            "Ponda": "63f9bd0b519359b7438ce302",
-            "Quepem": "63f9bd1e519359b7438ce4de",
-            "Salcete": "63f9bd14519359b7438ce3e7",
-            "Sanguem": "63f9bd26519359b7438ce5a8",
-            "Satari": "63f9bcf9519359b7438ce169",
-            "Tiswadi": "63f9bceb519359b7438ce01b",
-            "NORTH GOA": "63f9bcdd519359b7438cdeb6",
-            "SOUTH GOA": "63f9bd0a519359b7438ce2ff"
-        },
-        "63f922a6dbc0f7fe06751641": {
-            "Abdasa": "63f926e389d86ca9e2bbbc49",
-            "Adajan": "63f92d1189d86ca9e2bc31a5",
-            "Ahwa": "63f9268adbc0f7fe0675683d",
-            "Amirgadh": "63f92451dbc0f7fe06753b5c",
-            "Amod": "63f92531dbc0f7fe06754ef7",
-            "Amreli": "63f9234ddbc0f7fe0675250e",
-            "Anand City": "63f92404dbc0f7fe067534b6",
-            "Anand Rural": "63f923c8dbc0f7fe06752fa2",
-            "Anjar": "63f9268289d86ca9e2bbb4a0",
-            "Anklav": "63f923fcdbc0f7fe06753414",
-            "Anklesvar": "63f925a9dbc0f7fe067555ad",
-            "Asarva": "63f92315dbc0f7fe06752013",
-            "BODELI": "63f92fb689d86ca9e2bc6d92",
-            "Babra": "63f9232cdbc0f7fe0675222e",
-            "Bagasara": "63f92360dbc0f7fe06752678",
-            "Balasinor": "63f92fe289d86ca9e2bc719e",
-            "Bansda": "63f9295f89d86ca9e2bbeb75",
-            "Bardoli": "63f92cef89d86ca9e2bc2e9c",
-            "Barwala": "6492b7f3882c8da847737034",
-            "Bavla": "63f922fadbc0f7fe06751d9c",
-            "Bayad": "63f930ef89d86ca9e2bc898b",
-            "Becharaji": "63f9283189d86ca9e2bbd5b0",
-            "Bhabhar": "63f924e4dbc0f7fe06754865",
-            "Bhachau": "63f9267289d86ca9e2bbb331",
-            "Bhanvad": "63f9318489d86ca9e2bc96bc",
-            "Bharuch": "63f92563dbc0f7fe06755158",
-            "Bhavnagar": "63f92602dbc0f7fe06755c87",
-            "Bhesan": "63f925ec89d86ca9e2bba78f",
-            "Bhiloda": "63f9307389d86ca9e2bc7eaf",
-            "Bhuj": "63f9269189d86ca9e2bbb600",
-            "Borsad": "63f923ecdbc0f7fe067532cd",
-            "Botad": "63f9320f89d86ca9e2bca358",
-            "Chanasma": "63f92aba89d86ca9e2bc0141",
-            "Chhota Udaipur": "63f92f2f89d86ca9e2bc6182",
-            "Chikhli": "63f9294689d86ca9e2bbea06",
-            "Chorasi": "63f92cd389d86ca9e2bc2c90",
-            "Chotila": "63f92d5e89d86ca9e2bc3880",
-            "Chuda": "63f92d7f89d86ca9e2bc3b89",
-            "DESAR": "63f92e2889d86ca9e2bc4a31",
-            "Dabhoi": "63f92ddc89d86ca9e2bc438f",
-            "Danta": "63f92460dbc0f7fe06753cb7",
-            "Dantiwada": "63f92443dbc0f7fe06753a3d",
-            "Dasada": "63f92d2b89d86ca9e2bc33e6",
-            "Daskroi": "63f922dcdbc0f7fe06751af5",
-            "Dediapada": "63f9289989d86ca9e2bbddb4",
-            "Deesa": "63f924bbdbc0f7fe067544d8",
-            "Dehgam": "63f927b8dbc0f7fe06758031",
-            "Deodar": "63f924d5dbc0f7fe06754728",
-            "Detroj-Rampura": "63f922afdbc0f7fe06751700",
-            "Devgadbaria": "63f92744dbc0f7fe06757650",
-            "Dhandhuka": "63f92304dbc0f7fe06751e8e",
-            "Dhanera": "63f92432dbc0f7fe067538b5",
-            "Dhanpur": "63f92758dbc0f7fe0675780a",
-            "Dhansura": "63f930c789d86ca9e2bc8626",
-            "Dharampur": "63f92e5289d86ca9e2bc4df5",
-            "Dhari": "6492b7f2882c8da847737030",
-            "Dholera": "63f9230edbc0f7fe06751f6c",
-            "Dholka": "63f922eadbc0f7fe06751c37",
-            "Dhoraji": "63f92b9889d86ca9e2bc11c4",
-            "Dhrangadhra": "63f92d1d89d86ca9e2bc329f",
-            "Dhrol": "63f927fddbc0f7fe067584dd",
-            "Dohad": "63f92724dbc0f7fe067573e5",
-            "Dolvan": "63f92f0689d86ca9e2bc5dd0",
-            "Fatepura": "63f926d6dbc0f7fe06756e58",
-            "GARUDESHWAR": "63f928de89d86ca9e2bbe3d0",
-            "Gadhada": "63f9321a89d86ca9e2bca463",
-            "Galteshwar": "63f927a889d86ca9e2bbcc3a",
-            "Gandevi": "63f9293189d86ca9e2bbe8ab",
-            "Gandhidham": "63f9273389d86ca9e2bbc28a",
-            "Gandhinagar": "63f927a7dbc0f7fe06757ea4",
-            "Garbada": "63f92737dbc0f7fe067575a4",
-            "Gariadhar": "63f92632dbc0f7fe0675604d",
-            "Ghatlodiya": "63f92317dbc0f7fe06752047",
-            "Ghogha": "63f92612dbc0f7fe06755dc4",
-            "Ghoghamba": "63f929f989d86ca9e2bbf491",
-            "Gir Gadhda": "63f931e489d86ca9e2bc9fa6",
-            "Godhra": "63f929c189d86ca9e2bbf0b1",
-            "Gondal": "63f92b6d89d86ca9e2bc0e3a",
-            "Halol": "63f92a1489d86ca9e2bbf687",
-            "Halvad": "63f9310b89d86ca9e2bc8bf6",
-            "Hansot": "63f925bcdbc0f7fe067556e0",
-            "Harij": "63f92a9a89d86ca9e2bbff3a",
-            "Himatnagar": "63f92c0a89d86ca9e2bc1b83",
-            "Idar": "63f92bea89d86ca9e2bc18b1",
-            "Jafrabad": "63f92395dbc0f7fe06752b5b",
-            "Jalalpore": "63f9291389d86ca9e2bbe728",
-            "Jambughoda": "63f92a3889d86ca9e2bbf927",
-            "Jambusar": "63f9251bdbc0f7fe06754d56",
-            "Jamjodhpur": "63f925a889d86ca9e2bba2b0",
-            "Jamkandorna": "63f92b7f89d86ca9e2bc0fd6",
-            "Jamnagar City": "63f925be89d86ca9e2bba410",
-            "Jamnagar Rural": "63f927dcdbc0f7fe06758213",
-            "Jasdan": "63f92b5f89d86ca9e2bc0cfd",
-            "Jesar": "63f92682dbc0f7fe0675677b",
-            "Jetpur": "63f92b9f89d86ca9e2bc1261",
-            "Jetpur Pavi": "63f92f1389d86ca9e2bc5ef6",
-            "Jhagadia": "63f92582dbc0f7fe06755335",
-            "Jhalod": "63f926f5dbc0f7fe0675703a",
-            "Jodiya": "63f927f5dbc0f7fe06758422",
-            "Jotana": "63f9286589d86ca9e2bbd8e3",
-            "Junagadh": "63f925dc89d86ca9e2bba62a",
-            "Junagadh City": "63f9264589d86ca9e2bbaf0a",
-            "Kadana": "63f9300189d86ca9e2bc743e",
-            "Kadi": "63f9284289d86ca9e2bbd6b6",
-            "Kalavad": "63f9280bdbc0f7fe067585b1",
-            "Kalol": "6492b7f4882c8da84773703e",
-            "Kalol Gandhinagar": "63f9278ddbc0f7fe06757c4f",
-            "Kalyanpur": "63f9317589d86ca9e2bc956b",
-            "Kamrej": "63f92cbd89d86ca9e2bc2aac",
-            "Kankrej": "63f924f0dbc0f7fe06754970",
-            "Kapadvanj": "63f9273589d86ca9e2bbc2c0",
-            "Kaprada": "63f92e7589d86ca9e2bc5123",
-            "Karjan": "63f92e0889d86ca9e2bc478a",
-            "Katargam": "63f92d1389d86ca9e2bc31e8",
-            "Kathlal": "63f9275189d86ca9e2bbc4d9",
-            "Kavant": "63f92f5189d86ca9e2bc6459",
-            "Keshod": "63f9261889d86ca9e2bbab73",
-            "Khambha": "63f92389dbc0f7fe06752a3c",
-            "Khambhalia": "63f9316289d86ca9e2bc93a2",
-            "Khambhat": "63f923dedbc0f7fe0675319a",
-            "Khanpur": "6492b7f3882c8da84773703c",
-            "Kheda": "63f9276f89d86ca9e2bbc74e",
-            "Khedbrahma": "63f92bb989d86ca9e2bc1457",
-            "Kheralu": "63f927cc89d86ca9e2bbced3",
-            "Khergam": "63f9298189d86ca9e2bbed57",
-            "Kodinar": "63f931c389d86ca9e2bc9c8e",
-            "Kotda Sangani": "63f92b5789d86ca9e2bc0c2e",
-            "Kukarmunda": "63f92efc89d86ca9e2bc5cd9",
-            "Kunkavav Vadia": "63f92322dbc0f7fe0675214b",
-            "Kutiyana": "63f92b1189d86ca9e2bc074c",
-            "Lakhani": "63f9250edbc0f7fe06754c49",
-            "Lakhpat": "63f9264789d86ca9e2bbaf40",
-            "Lakhtar": "63f92d3f89d86ca9e2bc35a5",
-            "Lalpur": "63f9259789d86ca9e2bba17d",
-            "Lathi": "63f92339dbc0f7fe06752352",
-            "Lilia": "63f92345dbc0f7fe06752453",
-            "Limbdi": "63f92d8789d86ca9e2bc3c3f",
-            "Limkheda": "63f92712dbc0f7fe06757249",
-            "Lodhika": "63f92b4e89d86ca9e2bc0b6e",
-            "Lunawada": "63f9303e89d86ca9e2bc79e7",
-            "Mahesana": "63f9281089d86ca9e2bbd3c9",
-            "Mahudha": "63f9279089d86ca9e2bbca06",
-            "Mahuva": "6492b7f4882c8da847737044",
-            "Majura": "63f92ccc89d86ca9e2bc2c0c",
-            "Malia Hatina": "63f9263589d86ca9e2bbadaf",
-            "Maliya": "63f9311a89d86ca9e2bc8d47",
-            "Malpur": "63f930da89d86ca9e2bc8795",
-            "Manavadar": "63f925bf89d86ca9e2bba419",
-            "Mandal": "6492b7f2882c8da84773702e",
-            "Mandvi": "63f9271089d86ca9e2bbbf5c",
-            "Mandvi surat": "63f92c9d89d86ca9e2bc27b7",
-            "Mangrol": "6492b7f3882c8da84773703a",
-            "Maninagar": "63f9231ddbc0f7fe067520cd",
-            "Mansa": "6492b7f3882c8da847737036",
-            "Matar": "63f9277a89d86ca9e2bbc818",
-            "Meghraj": "63f9309289d86ca9e2bc818b",
-            "Mehmedabad": "63f9275e89d86ca9e2bbc602",
-            "Mendarda": "63f9260c89d86ca9e2bbaa72",
-            "Modasa": "63f930af89d86ca9e2bc8417",
-            "Morvi": "63f9312389d86ca9e2bc8e2f",
-            "Morwa (Hadaf)": "63f929ac89d86ca9e2bbefa1",
-            "Muli": "63f92d5389d86ca9e2bc3770",
-            "Mundra": "63f9272589d86ca9e2bbc148",
-            "Nadiad": "63f9278589d86ca9e2bbc90f",
-            "Nadiad City": "63f927b389d86ca9e2bbcd38",
-            "Nakhatrana": "63f926bf89d86ca9e2bbb9a9",
-            "Nandod": "63f9288189d86ca9e2bbdb7d",
-            "Nasvadi": "63f92f6e89d86ca9e2bc66f9",
-            "Navsari": "63f928f989d86ca9e2bbe5a0",
-            "Netrang": "63f925dbdbc0f7fe067558f6",
-            "Nizar": "63f92ea489d86ca9e2bc5536",
-            "Okhamandal": "63f9315989d86ca9e2bc92d8",
-            "Olpad": "63f92c6189d86ca9e2bc2286",
-            "POSHINA": "63f92c4d89d86ca9e2bc215b",
-            "Paddhari": "63f92b2489d86ca9e2bc084a",
-            "Padra": "63f92df689d86ca9e2bc45e9",
-            "Palanpur": "63f9249fdbc0f7fe06754283",
-            "Palitana": "63f9263ddbc0f7fe06756144",
-            "Palsana": "63f92ce489d86ca9e2bc2da5",
-            "Pardi": "63f92e6989d86ca9e2bc5018",
-            "Patan": "6492b7f4882c8da847737040",
-            "Patan-Veraval": "63f931ad89d86ca9e2bc9a8c",
-            "Petlad": "63f923d2dbc0f7fe06753080",
-            "Porbandar": "63f92aec89d86ca9e2bc0491",
-            "Prantij": "63f92c2f89d86ca9e2bc1e9b",
-            "Puna": "63f92d1789d86ca9e2bc3235",
-            "RAJKOT EAST": "63f92bb789d86ca9e2bc1436",
-            "RAJKOT SOUTH": "63f92bb989d86ca9e2bc144e",
-            "RAJKOT WEST": "63f92bb889d86ca9e2bc1442",
-            "Radhanpur": "63f92a5e89d86ca9e2bbfbad",
-            "Rajkot": "63f92b3589d86ca9e2bc096e",
-            "Rajula": "63f9239fdbc0f7fe06752c34",
-            "Ranavav": "63f92b0389d86ca9e2bc061e",
-            "Ranpur": "63f9320089d86ca9e2bca225",
-            "Rapar": "63f9265c89d86ca9e2bbb13b",
-            "SUIGAM": "63f92505dbc0f7fe06754b70",
-            "Sabarmati": "63f922d9dbc0f7fe06751aad",
-            "Sagbara": "63f928c989d86ca9e2bbe1e4",
-            "Sami": "63f92aa489d86ca9e2bc0004",
-            "Sanand": "63f922cbdbc0f7fe06751961",
-            "Sanjeli": "63f9276fdbc0f7fe067579ce",
-            "Sankheda": "63f92f9c89d86ca9e2bc6b42",
-            "Santalpur": "63f92a4c89d86ca9e2bbfa3e",
-            "Santrampur": "63f9301e89d86ca9e2bc76e8",
-            "Saraswati": "63f92ac689d86ca9e2bc026a",
-            "Satlasana": "63f927b589d86ca9e2bbcd64",
-            "Savar Kundla": "63f92379dbc0f7fe067528b4",
-            "Savli": "63f92d9b89d86ca9e2bc3e02",
-            "Sayla": "6492b7f4882c8da847737048",
-            "Shankheshvar": "63f92ad789d86ca9e2bc03d9",
-            "Shehera": "63f9298a89d86ca9e2bbedc9",
-            "Sidhpur": "63f92a7289d86ca9e2bbfcc7",
-            "Sihor": "63f9261cdbc0f7fe06755eb6",
-            "Singvad": "63f9277edbc0f7fe06757ae8",
-            "Sinor": "63f92e1f89d86ca9e2bc4962",
-            "Sojitra": "63f923bcdbc0f7fe06752e79",
-            "Songadh": "63f92eb489d86ca9e2bc56b6",
-            "Subir": "63f926c0dbc0f7fe06756c88",
-            "Sutrapada": "63f931b989d86ca9e2bc9ba1",
-            "Talaja": "63f9264fdbc0f7fe067562e0",
-            "Talala": "63f9319889d86ca9e2bc98a0",
-            "Talod": "63f92c3d89d86ca9e2bc1fe2",
-            "Tankara": "63f9313789d86ca9e2bc9007",
-            "Tarapur": "63f923afdbc0f7fe06752da5",
-            "Thangadh": "63f92d9589d86ca9e2bc3d6d",
-            "Tharad": "63f92416dbc0f7fe06753647",
-            "Thasra": "63f9279989d86ca9e2bbcada",
-            "Tilakwada": "63f9286d89d86ca9e2bbd996",
-            "Uchchhal": "63f92eaa89d86ca9e2bc55ce",
-            "Udhna": "63f92d1b89d86ca9e2bc326e",
-            "Umarpada": "63f92c8d89d86ca9e2bc2675",
-            "Umbergaon": "63f92e9389d86ca9e2bc53aa",
-            "Umrala": "63f925f9dbc0f7fe06755bae",
-            "Umreth": "6492b7f3882c8da847737032",
-            "Una": "6492b7f3882c8da847737038",
-            "Unjha": "63f927df89d86ca9e2bbcfcf",
-            "Upleta": "63f92b8889d86ca9e2bc10c3",
-            "VAPI": "63f92e9e89d86ca9e2bc54a6",
-            "Vadali": "63f92bdd89d86ca9e2bc179c",
-            "Vadgam": "63f92488dbc0f7fe0675405b",
-            "Vadnagar": "63f927f389d86ca9e2bbd195",
-            "Vadodara East": "63f92e3a89d86ca9e2bc4bba",
-            "Vadodara North": "63f92e3489d86ca9e2bc4b57",
-            "Vadodara Rural": "63f92dad89d86ca9e2bc3fc1",
-            "Vadodara South": "63f92e3289d86ca9e2bc4b28",
-            "Vadodara West": "63f92e3789d86ca9e2bc4b8b",
-            "Vaghodia": "63f92dc489d86ca9e2bc41ad",
-            "Vagra": "63f92542dbc0f7fe06755002",
-            "Valia": "63f925ccdbc0f7fe067557c8",
-            "Vallabhipur": "63f925ecdbc0f7fe06755a80",
-            "Valod": "63f92ef389d86ca9e2bc5c0f",
-            "Valsad": "63f92e3c89d86ca9e2bc4be6",
-            "Vanthali": "63f925d089d86ca9e2bba53d",
-            "Vaso": "63f927ae89d86ca9e2bbccc8",
-            "Vatva": "63f9231fdbc0f7fe06752106",
-            "Vav": "63f92404dbc0f7fe067534bf",
-            "Vejalpur": "63f9231adbc0f7fe06752094",
-            "Vijapur": "63f927fd89d86ca9e2bbd282",
-            "Vijaynagar": "6492b7f4882c8da847737042",
-            "Vinchchiya": "63f92bab89d86ca9e2bc135d",
-            "Viramgam": "63f922bbdbc0f7fe0675180b",
-            "Virpur": "63f92fd689d86ca9e2bc708e",
-            "Visavadar": "63f925f589d86ca9e2bba877",
-            "Visnagar": "63f927e789d86ca9e2bbd071",
-            "Vyara": "63f92edb89d86ca9e2bc5a41",
-            "Wadhwan": "63f92d4889d86ca9e2bc367e",
-            "Waghai": "63f926a8dbc0f7fe06756aa6",
-            "Wankaner": "63f9314089d86ca9e2bc90db",
-            "SABAR KANTHA": "63f92bb989d86ca9e2bc1454",
-            "AHMADABAD": "63f922a6dbc0f7fe06751644",
-            "ANAND": "63f923afdbc0f7fe06752da2",
-            "JAMNAGAR": "63f9259789d86ca9e2bba178",
-            "BANAS KANTHA": "63f92404dbc0f7fe067534bc",
-            "KACHCHH": "63f9264789d86ca9e2bbaf3d",
-            "SURAT": "63f92c6189d86ca9e2bc2283",
-            "TAPI": "63f92ea489d86ca9e2bc5533",
-            "CHHOTAUDEPUR": "63f92f1389d86ca9e2bc5ef3",
-            "SURENDRANAGAR": "63f92d1d89d86ca9e2bc329c",
-            "NARMADA": "63f9286d89d86ca9e2bbd993",
-            "DEVBHUMI DWARKA": "63f9315989d86ca9e2bc92d5",
-            "MORBI": "63f9310b89d86ca9e2bc8bf3",
-            "GIR SOMNATH": "63f9319889d86ca9e2bc989d",
-            "Mahisagar": "63f92fd589d86ca9e2bc708b",
-            "DANG": "63f9268adbc0f7fe0675683a",
-            "VADODARA": "63f92d9b89d86ca9e2bc3dff",
-            "ARVALLI": "63f9307389d86ca9e2bc7eac",
-            "PANCH MAHALS": "63f9298989d86ca9e2bbedc6"
-        },
-        "63f5c2cf98d5e0c03dba5507": {
-            "Adampur": "6492b7f4882c8da84773704a",
-            "Alewa": "63f5c58d98d5e0c03dba84fa",
-            "Ambala": "63f5c2f298d5e0c03dba5794",
-            "Ambala Cantonment": "63f5c32698d5e0c03dba5b53",
-            "Assandh": "63f5c65d98d5e0c03dba930f",
-            "Ateli": "63f5c76d98d5e0c03dbaa51d",
-            "Babain ST": "63f5c71198d5e0c03dba9f0f",
-            "Badhra": "63f5cea58cec41e6c95ce220",
-            "Badkhal": "63f5c3ca98d5e0c03dba6745",
-            "Badli": "63f5c54198d5e0c03dba800c",
-            "Badshahpur ST": "63f5c48b98d5e0c03dba74e9",
-            "Bahadurgarh": "63f5c50998d5e0c03dba7c58",
-            "Bahal ST": "63f5c3ac98d5e0c03dba6521",
-            "Bahin ST": "63f5ce828cec41e6c95cdfcc",
-            "Ballabgarh": "63f5c3c198d5e0c03dba668a",
-            "Ballah ST": "63f5c69598d5e0c03dba96c3",
-            "Balsamand ST": "63f5c4e398d5e0c03dba7b1c",
-            "Bapoli": "63f5c81e98d5e0c03dbab06a",
-            "Barara": "63f5c31898d5e0c03dba5a43",
-            "Barwala": "63f5c4d598d5e0c03dba7a41",
-            "Barwala ST": "63f5c7e198d5e0c03dbaac6f",
-            "Bass": "63f5c4c898d5e0c03dba7966",
-            "Bawal": "63f5c85f98d5e0c03dbab473",
-            "Bawani Khera": "63f5c35e98d5e0c03dba5f6d",
-            "Beri": "63f5c4f298d5e0c03dba7b7f",
-            "Bhattukalan ST": "63f5c42a98d5e0c03dba6e07",
-            "Bhiwani": "63f5c36698d5e0c03dba600f",
-            "Bhuna ST": "63f5c42e98d5e0c03dba6e63",
-            "Bilaspur": "63f5c9dd98d5e0c03dbacdce",
-            "Bondkalan ST": "63f5ceb38cec41e6c95ce33f",
-            "Chhachhrauli": "63f5ca0598d5e0c03dbad055",
-            "Dabwali": "63f5c8d998d5e0c03dbabca1",
-            "Dadri": "63f5ce888cec41e6c95ce02a",
-            "Dahina ST": "63f5c88e98d5e0c03dbab78f",
-            "Dayalpur ST": "63f5c3d598d5e0c03dba67f3",
-            "Dhand ST": "63f5c5f398d5e0c03dba8bf6",
-            "Dharuhera ST": "63f5c88498d5e0c03dbab6d4",
-            "Dhauj ST": "63f5c3d198d5e0c03dba67a6",
-            "Ellenabad": "63f5c90a98d5e0c03dbac017",
-            "Faridabad": "63f5c3b598d5e0c03dba65c5",
-            "Farrukhnagar": "63f5c45798d5e0c03dba7153",
-            "Fatehabad": "63f5c40f98d5e0c03dba6c0c",
-            "Fatehpur Pundri": "63f5c5de98d5e0c03dba8a7e",
-            "Ferozepur Jhirka": "63f5caa498d5e0c03dbadb5f",
-            "Ganaur": "63f5c95a98d5e0c03dbac4b0",
-            "Gaunchi ST": "63f5c3dd98d5e0c03dba689a",
-            "Gharaunda": "63f5c66e98d5e0c03dba944c",
-            "Gohana": "63f5c93d98d5e0c03dbac364",
-            "Goriwala ST": "63f5c93298d5e0c03dbac2fc",
-            "Guhla": "63f5c5ac98d5e0c03dba8700",
-            "Gurgaon": "63f5c45198d5e0c03dba70e3",
-            "Hansi": "63f5c4bd98d5e0c03dba789c",
-            "Harsaru ST": "63f5c49398d5e0c03dba7583",
-            "Hassanpur ST": "63f5ce7e8cec41e6c95cdf6b",
-            "Hathin": "63f5cb2798d5e0c03dbae47e",
-            "Hisar": "63f5c49e98d5e0c03dba7677",
-            "Hodal": "63f5ce768cec41e6c95cdece",
-            "Indri": "6492b7f5882c8da84773704c",
-            "Ismailabad ST": "63f5c70998d5e0c03dba9e77",
-            "Israna": "63f5c7ff98d5e0c03dbaae6b",
-            "Jagadhri": "63f5c9af98d5e0c03dbaca93",
-            "Jakhal ST": "63f5c43398d5e0c03dba6ebf",
-            "Jhajjar": "63f5c51898d5e0c03dba7d4a",
-            "Jind": "63f5c56098d5e0c03dba8201",
-            "Julana": "63f5c57698d5e0c03dba8375",
-            "Kadipur ST": "63f5c48f98d5e0c03dba752c",
-            "Kaithal": "63f5c5c998d5e0c03dba8914",
-            "Kalanaur": "6492b7f5882c8da84773704e",
-            "Kalanwali": "63f5c91398d5e0c03dbac0b9",
-            "Kalayat": "63f5c5e798d5e0c03dba8b11",
-            "Kalka": "63f5c79298d5e0c03dbaa778",
-            "Kanina": "63f5c77e98d5e0c03dbaa623",
-            "Karnal": "63f5c63398d5e0c03dba9038",
-            "Khanpur ST": "63f5c99c98d5e0c03dbac94d",
-            "Kharkhoda": "63f5c98f98d5e0c03dbac860",
-            "Kheri Jalab ST": "63f5c4cf98d5e0c03dba79e5",
-            "Kosli": "63f5c82d98d5e0c03dbab15e",
-            "Kulan ST": "63f5c43998d5e0c03dba6f2a",
-            "Ladwa": "63f5c6f898d5e0c03dba9d4e",
-            "Lakhan Majra ST": "63f5c8d798d5e0c03dbabc7a",
-            "Loharu": "63f5c39f98d5e0c03dba642a",
-            "Maham": "63f5c8ad98d5e0c03dbab9b8",
-            "Mahendragarh": "63f5c71e98d5e0c03dba9ff4",
-            "Manesar": "63f5c46998d5e0c03dba7290",
-            "Manethi ST": "63f5c89e98d5e0c03dbab8b5",
-            "Matenhail": "63f5c53098d5e0c03dba7eeb",
-            "Matlauda": "63f5c81398d5e0c03dbaafbe",
-            "Mohna ST": "63f5c3e898d5e0c03dba694d",
-            "Morni ST": "63f5c7e998d5e0c03dbaad07",
-            "Mulana ST": "63f5c34498d5e0c03dba5d78",
-            "Nagina ST": "63f5cad898d5e0c03dbadef6",
-            "Nahar ST": "63f5c89798d5e0c03dbab836",
-            "Nangal Chawdhary": "63f5c75798d5e0c03dbaa3a9",
-            "Naraingarh": "63f5c2cf98d5e0c03dba550d",
-            "Narnaul": "63f5c73898d5e0c03dbaa1b8",
-            "Narnaund": "63f5c4b698d5e0c03dba783b",
-            "Narwana": "63f5c54d98d5e0c03dba80d8",
-            "Nathusari Chopta": "63f5c92498d5e0c03dbac205",
-            "Nigdu ST": "63f5c68b98d5e0c03dba961c",
-            "Nilokheri": "63f5c60398d5e0c03dba8ce7",
-            "Nising ST": "63f5c68698d5e0c03dba95bb",
-            "Nuh": "63f5ca8d98d5e0c03dbad9d7",
-            "Palhawas ST": "63f5c87898d5e0c03dbab60f",
-            "Palwal": "63f5caf998d5e0c03dbae12a",
-            "Panchkula": "63f5c7bd98d5e0c03dbaaa18",
-            "Panipat": "63f5c7ee98d5e0c03dbaad51",
-            "Pataudi": "63f5c44098d5e0c03dba6fab",
-            "Pehowa": "63f5c6ad98d5e0c03dba9863",
-            "Pillukhera ST": "63f5c5a398d5e0c03dba8675",
-            "Pratap Nagar ST": "63f5ca2598d5e0c03dbad282",
-            "Punahana": "63f5cabc98d5e0c03dbadcf6",
-            "Radaur": "63f5ca3398d5e0c03dbad388",
-            "Rai ST": "63f5c9a298d5e0c03dbac9b3",
-            "Raipur Rani": "63f5c7d498d5e0c03dbaab96",
-            "Rajaund ST": "63f5c5ef98d5e0c03dba8b9f",
-            "Rania": "63f5c8fd98d5e0c03dbabf25",
-            "Ratia": "63f5c3ed98d5e0c03dba69ab",
-            "Rewari": "63f5c83698d5e0c03dbab200",
-            "Rohtak": "63f5c8b498d5e0c03dbaba32",
-            "Sadhaura ST": "63f5ca5098d5e0c03dbad597",
-            "Safidon": "63f5c57f98d5e0c03dba840d",
-            "Saha ST": "63f5c33898d5e0c03dba5c9a",
-            "Salhawas ST": "63f5c53c98d5e0c03dba7fba",
-            "Samalkha": "63f5c80798d5e0c03dbaaefe",
-            "Sampla": "63f5c8c798d5e0c03dbabb79",
-            "Saraswati Nagar ST": "63f5ca6198d5e0c03dbad6ca",
-            "Satnali ST": "63f5c78c98d5e0c03dbaa710",
-            "Shahbad": "63f5c69a98d5e0c03dba9712",
-            "Shahzadpur ST": "63f5c34f98d5e0c03dba5e4c",
-            "Sirsa": "63f5c8e298d5e0c03dbabd3e",
-            "Siwan ST": "63f5c5fb98d5e0c03dba8c75",
-            "Siwani": "63f5c39598d5e0c03dba6360",
-            "Sohna": "63f5c47498d5e0c03dba735a",
-            "Sonipat": "63f5c96d98d5e0c03dbac5fc",
-            "Taoru": "63f5ca7698d5e0c03dbad831",
-            "Thanesar": "63f5c6c998d5e0c03dba9a40",
-            "Tigaon ST": "63f5c3e098d5e0c03dba68ce",
-            "Tohana": "63f5c40298d5e0c03dba6b29",
-            "Tosham": "63f5c38198d5e0c03dba6205",
-            "Uchana": "63f5c59598d5e0c03dba8588",
-            "Uklana ST": "63f5c4dd98d5e0c03dba7acf",
-            "Wazirabad ST": "63f5c48698d5e0c03dba7488",
-            "YAMUNANAGAR": "63f5c9af98d5e0c03dbaca90",
-            "KURUKSHETRA": "63f5c69a98d5e0c03dba970f",
-            "GURUGRAM": "63f5c44098d5e0c03dba6fa8",
-            "CHARKI DADRI": "63f5ce878cec41e6c95ce027"
-        },
-        "63f21f6089e2887695740385": {
-            "Alampur": "63f2305789e2887695749935",
-            "Amb": "63f247c489e288769575940c",
-            "Ani": "63f2335789e288769574bc31",
-            "Arki": "63f242f289e2887695755fc3",
-            "Aut": "63f2373889e288769574e099",
-            "Baddi": "63f2447089e288769575710f",
-            "Bagachnogi": "63f2397289e288769574f504",
-            "Bagshad": "63f23b0f89e28876957504c4",
-            "Baijnath": "63f22fa289e2887695749118",
-            "Baldwara": "63f2366389e288769574d88e",
-            "Balh": "63f239c689e288769574f7fd",
-            "Bali Chowki": "63f2376989e288769574e253",
-            "Bangana": "63f2481289e2887695759729",
-            "Banjar": "63f2334b89e288769574bb94",
-            "Baroh": "63f22d6589e288769574789f",
-            "Barsar": "63f228fb89e28876957449f2",
-            "Bhadrota": "63f2363189e288769574d6d4",
-            "Bhalai": "63f224a789e288769574246b",
-            "Bharari": "63f21ff989e288769574070c",
-            "Bharmour": "63f2269d89e288769574316a",
-            "Bharwain": "63f247a989e288769575931a",
-            "Bhattiyat": "63f2255889e2887695742820",
-            "Bhawarna": "63f2314889e288769574a412",
-            "Bhoranj": "63f2299489e2887695745009",
-            "Bhota": "63f22a7789e28876957458a7",
-            "Bhuntar": "63f2336889e288769574bd0e",
-            "Bilaspur Sadar": "63f2212d89e2887695740f19",
-            "Birhu Kalan": "63f2490b89e288769575a0f6",
-            "Chachyot": "63f237ed89e288769574e72a",
-            "Chadiyar": "63f2302589e28876957496e8",
-            "Chamba": "63f225f889e2887695742b94",
-            "Chaupal": "63f23e4589e2887695752845",
-            "Chhatri": "63f23a4889e288769574fd0d",
-            "Chirgaon": "63f23ff889e2887695753ae9",
-            "Churah": "63f2234c89e2887695741b0c",
-            "Dadahu": "63f241e689e2887695755305",
-            "Dadasiba": "63f230a989e2887695749cee",
-            "Dalhousie": "63f224df89e2887695742594",
-            "Dareeni": "63f2307089e2887695749a54",
-            "Darlaghat": "63f2434f89e28876957563e9",
-            "Deha": "63f2404c89e2887695753f83",
-            "Dehar": "63f23a2989e288769574fbd0",
-            "Dera Gopipur": "63f22dbc89e2887695747bee",
-            "Dhalwan": "63f23b6489e2887695750836",
-            "Dhami": "63f240e889e288769575473c",
-            "Dharmpur": "63f2359d89e288769574d16f",
-            "Dharmsala": "63f22c8589e2887695746e3f",
-            "Dharwala": "63f2270189e28876957435c6",
-            "Dhatwal": "63f2294e89e2887695744d41",
-            "Dhira": "63f22edb89e2887695748889",
-            "Dodra Kwar": "63f2402089e2887695753cc6",
-            "Dulahar": "63f248fe89e288769575a077",
-            "Fatehpur": "63f22b6a89e28876957461e4",
-            "Gagret": "63f2493189e288769575a288",
-            "Galore": "63f2282a89e28876957441bf",
-            "Gangath": "63f2311189e288769574a19a",
-            "Ghanari": "63f248b289e2887695759d5b",
-            "Ghumarwin": "63f21f6189e288769574038b",
-            "Hamirpur": "63f2285a89e288769574438d",
-            "Hangrang": "63f2319889e288769574a7c9",
-            "Harchakian": "63f22c3489e2887695746a76",
-            "Haripur": "63f230e089e2887695749f6d",
-            "Haripurdhar": "63f242a889e2887695755c30",
-            "Harlog": "63f2229889e28876957416cc",
-            "Haroli": "63f248a189e2887695759caf",
-            "Holi": "63f2264f89e2887695742ed4",
-            "Indora": "63f22b3289e2887695745fd0",
-            "Ispur": "63f248d189e2887695759e9d",
-            "Jaisinghpur": "63f22f0c89e2887695748aca",
-            "Jalog": "63f2408889e28876957542f9",
-            "Jangla": "63f2403a89e2887695753e64",
-            "Jari": "63f2336e89e288769574bd60",
-            "Jaswan": "63f22e4889e28876957481b5",
-            "Jawalamukhi": "63f22dfb89e2887695747e7f",
-            "Jawali": "63f22c0189e2887695746803",
-            "Jhanduta": "63f2204a89e288769574090c",
-            "Jogindarnagar": "63f234d989e288769574cab6",
-            "Jol": "63f248dd89e2887695759f30",
-            "Jubbal": "63f23f2389e2887695753163",
-            "Junga": "63f23d6e89e2887695751ebe",
-            "Kakira": "63f226e789e28876957434b1",
-            "Kalbog": "63f2413489e2887695754ae5",
-            "Kalol": "63f2224789e28876957414e5",
-            "Kalpa": "63f2321c89e288769574ad3d",
-            "Kamrau": "63f2428189e2887695755a4f",
-            "Kandaghat": "63f2469789e288769575881e",
-            "Kangoo": "63f22a4189e2887695745693",
-            "Kangra": "63f22ccb89e2887695747193",
-            "Karsog": "63f238d789e288769574ef3a",
-            "Kasauli": "63f2452e89e28876957579c4",
-            "Katoula": "63f2398689e288769574f5a6",
-            "Khundian": "63f22e8289e2887695748466",
-            "Kotgarh": "63f2402689e2887695753d2c",
-            "Kotkhai": "63f23f5389e2887695753359",
-            "Kotla": "63f2300789e288769574958d",
-            "Kotli": "63f235c489e288769574d2e8",
-            "Krishangarh": "63f244cd89e2887695757549",
-            "Kullu": "63f232dc89e288769574b659",
-            "Kumarsain": "63f23bfc89e2887695750e6c",
-            "Kunihar": "63f2476489e288769575904e",
-            "Kupvi": "63f2409d89e288769575442c",
-            "Lad Bharol": "63f2353189e288769574cd9c",
-            "Lagru": "63f2308089e2887695749b0f",
-            "Lahul": "63f233c089e288769574c086",
-            "Lambloo": "63f22aa289e2887695745a52",
-            "Majheen": "63f230c589e2887695749e3a",
-            "Majra": "63f242e889e2887695755f42",
-            "Makridi": "63f23ad889e288769575029a",
-            "Mamlig": "63f2472a89e2887695758df4",
-            "Manali": "63f232ba89e288769574b4bd",
-            "Mandap": "63f23afe89e288769575040e",
-            "Mandi": "6492b7f5882c8da847737050",
-            "Mehatpur": "63f2494089e288769575a325",
-            "Morang": "63f231ea89e288769574aacf",
-            "Multhan": "63f22fe889e2887695749435",
-            "Nadaun": "63f2279d89e2887695743c40",
-            "Nagrota Bagwan": "63f22d1789e2887695747523",
-            "Nagrota Surian": "63f22ffe89e288769574952c",
-            "Nahan": "63f2421589e288769575553c",
-            "Naina Devi": "63f220ac89e2887695740bb1",
-            "Nalagarh": "63f2442989e2887695756dbb",
-            "Namhol": "63f2221989e288769574142f",
-            "Nankhari": "63f23bcd89e2887695750c8a",
-            "Narag": "63f242af89e2887695755c8c",
-            "Nerwa": "63f23eae89e2887695752c89",
-            "Nichar": "63f2323d89e288769574aee3",
-            "Nihri": "63f2386689e288769574eb41",
-            "Nirmand": "63f2335d89e288769574bc83",
-            "Nither": "63f2336589e288769574bcee",
-            "Nohra": "63f2417489e2887695754dd2",
-            "Nurpur": "63f22ab989e2887695745b2d",
-            "PARWANOO": "63f2478489e2887695759195",
-            "Pachhad": "63f2418b89e2887695754eb5",
-            "Padhar": "63f2348d89e288769574c7cb",
-            "Pajhota": "63f242d389e2887695755e37",
-            "Palampur": "63f22f5089e2887695748e05",
-            "Panchrukhi": "63f2303889e28876957497cb",
-            "Pangi": "63f2230f89e28876957418f8",
-            "Pangna": "63f23a7389e288769574fec2",
-            "Panjehra": "63f246ea89e2887695758b4f",
-            "Paonta Sahib": "63f2425289e2887695755827",
-            "Poo": "63f231b389e288769574a8e8",
-            "Pragpur": "63f2309389e2887695749bde",
-            "Pukhri": "63f226d289e28876957433c4",
-            "Rajgarh": "6492b7f5882c8da847737052",
-            "Rakkar": "63f22e6089e28876957482cf",
-            "Rampur": "63f23b8a89e28876957509cc",
-            "Ramshahr": "63f243bf89e2887695756904",
-            "Renuka": "63f241d489e2887695755236",
-            "Rewalsar": "63f23ab489e288769575013f",
-            "Rohru": "63f23fbd89e288769575380d",
-            "Ronhat": "63f2429f89e2887695755bc0",
-            "Sainj": "63f2334589e288769574bb4c",
-            "Saluni": "63f2243a89e2887695742126",
-            "Sandhol": "63f2358489e288769574d07d",
-            "Sangla": "63f2327689e288769574b192",
-            "Sarahan": "63f2406789e288769575410b",
-            "Sarawati Nagar": "63f2407089e288769575418f",
-            "Sarkaghat": "63f235e789e288769574d434",
-            "Shahpur": "63f22c4f89e2887695746bae",
-            "Shalai": "63f2429389e2887695755b32",
-            "Shimla ( Rural )": "63f23c7689e2887695751375",
-            "Shimla (urban)": "63f23d5b89e2887695751dc2",
-            "Sihunta": "63f2259f89e28876957429ad",
-            "Solan": "63f245a589e2887695757e7b",
-            "Spiti": "63f2341589e288769574c344",
-            "Sulah": "63f2317789e288769574a644",
-            "Sundarnagar": "63f2369989e288769574daa7",
-            "Sunni": "63f23c3a89e28876957510df",
-            "Taklech": "63f240ce89e28876957545f5",
-            "Talai": "63f222d889e28876957417f0",
-            "Tapri": "63f232a489e288769574b3ba",
-            "Tauni Devi Bamson": "63f22a0889e2887695745475",
-            "Telka": "63f2272d89e28876957437a8",
-            "Thachi": "63f23b7389e28876957508d8",
-            "Theog": "63f23d8c89e2887695752037",
-            "Thunag": "63f237a389e288769574e471",
-            "Thural": "63f22eb889e28876957486e3",
-            "Tihra": "63f239a889e288769574f6de",
-            "Tikar": "63f23fac89e2887695753725",
-            "Tikken": "63f23a0789e288769574fa89",
-            "Tira Sujanpur": "63f2273c89e288769574384c",
-            "Udaipur": "63f2337289e288769574bd96",
-            "Una": "63f2487b89e2887695759b27",
-            "BILASPUR": "63f21f6089e2887695740388",
-            "SHIMLA": "63f23b8a89e28876957509c9",
-            "SIRMAUR": "63f2414c89e2887695754c0d",
-            "KINNAUR": "63f2319889e288769574a7c6",
-            "LAHUL AND SPITI": "63f2337289e288769574bd93"
-        },
-        "63f20ca84fadd776ffd9d608": {
-            "Ajas": "63f21cfe89e288769573ee8d",
-            "Akhnoor": "63f214b689e288769573a073",
-            "Aloosa": "63f21cfa89e288769573ee6d",
-            "Anantnag": "63f2108889e2887695737da8",
-            "Anantnag East": "63f2111b89e28876957382d8",
-            "Aripal": "63f219ab89e288769573cd6c",
-            "Arnas": "63f21efc89e288769573ffca",
-            "Arnia": "63f216ab89e288769573b11a",
-            "Assar": "63f2142a89e2887695739c5b",
-            "Atholi (Paddar)": "63f21bc989e288769573e1ea",
-            "Awantipora": "63f2192f89e288769573c8a3",
-            "BK Pora": "63f2123789e2887695738cf4",
-            "Bahu": "63f2158c89e288769573a848",
-            "Balakote": "63f2191189e288769573c783",
-            "Bandipora": "63f21cda89e288769573ed29",
-            "Bani": "63f216ec89e288769573b395",
-            "Banihal": "63f21bf589e288769573e431",
-            "Baramulla": "63f2127a89e2887695738f5e",
-            "Barbugh": "63f21e4c89e288769573fa04",
-            "Bari Brahamana": "63f21d7789e288769573f303",
-            "Basantgarh": "63f21baf89e288769573e08a",
-            "Basohli": "63f216de89e288769573b30c",
-            "Batote": "63f21c2789e288769573e637",
-            "Beerwah": "63f2114889e2887695738467",
-            "Beri Pattan": "63f21a8389e288769573d576",
-            "Bhaderwah": "63f213d389e28876957399c8",
-            "Bhagwah": "63f2140189e2887695739b7f",
-            "Bhalessa": "63f2143789e2887695739ca3",
-            "Bhalla": "63f2145c89e2887695739df1",
-            "Bhalwal": "63f2159c89e288769573a8e7",
-            "Bharath Bagla": "63f213fb89e2887695739b46",
-            "Bhella": "63f2149e89e2887695739ffc",
-            "Bhomag": "63f21f3589e28876957401e7",
-            "Bijbehara": "63f2106989e2887695737cb1",
-            "Billawar": "63f216ce89e288769573b27e",
-            "Bishnah": "63f2151389e288769573a3a3",
-            "Boniyar": "63f212b689e2887695739176",
-            "Bounjwah": "63f21bf189e288769573e400",
-            "Budgam": "63f211a989e28876957387d1",
-            "Chadoora": "63f211e689e28876957389f4",
-            "Channapora": "63f21ac889e288769573d7ff",
-            "Charar- E- Shrief": "63f2121489e2887695738b9a",
-            "Chassana": "63f21eee89e288769573ff3f",
-            "Chenani": "63f21b3b89e288769573dcb6",
-            "Chhatroo": "63f21bc789e288769573e1cf",
-            "Chilly Pingal": "63f2145389e2887695739d95",
-            "Chiralla": "63f2148989e2887695739f87",
-            "Chitragam": "63f21e6a89e288769573faab",
-            "Chowki Choura": "63f2155c89e288769573a674",
-            "D H Pora": "63f21c8d89e288769573ea2d",
-            "Dachhan": "63f21bd689e288769573e2a2",
-            "Dangarpora": "63f2134689e28876957395bf",
-            "Danghiwacha": "63f2131089e2887695739424",
-            "Dansal": "63f215bc89e288769573aa21",
-            "Darhal": "63f219e289e288769573cf86",
-            "Devsar": "63f21c7489e288769573e93b",
-            "Dinga Amb": "63f2179689e288769573b9ba",
-            "Doda": "63f213af89e2887695739875",
-            "Dooru": "63f210d889e2887695738079",
-            "Drabshalla": "63f21be389e288769573e34a",
-            "Drugmulla": "63f2185d89e288769573c0d2",
-            "Eidgah": "63f21acc89e288769573d82e",
-            "Frisal": "63f21cbb89e288769573ec04",
-            "Ganderbal": "63f21ea889e288769573fcb8",
-            "Ghagwal": "63f21d8589e288769573f396",
-            "Gool": "63f21c3589e288769573e6bd",
-            "Gund": "63f21ebc89e288769573fd6e",
-            "Gundna": "63f2140f89e2887695739bc9",
-            "Gurez": "63f21cd589e288769573ecf5",
-            "Hajin": "63f21cff89e288769573ee99",
-            "Handwara": "63f2180889e288769573bdbf",
-            "Haveli": "63f218c289e288769573c492",
-            "Hermain": "63f21e7f89e288769573fb2a",
-            "Hiranagar": "63f2175489e288769573b745",
-            "Jammu": "63f214cf89e288769573a12e",
-            "Jammu North": "63f2159389e288769573a895",
-            "Jammu South": "63f2158089e288769573a7d3",
-            "Jammu West": "63f216c689e288769573b220",
-            "Jourian": "63f2153c89e288769573a53a",
-            "Kahara": "63f2147389e2887695739ec5",
-            "Kakapora": "63f2198189e288769573cbe2",
-            "Kalakote": "63f21a1e89e288769573d1ba",
-            "Kangan": "63f21e9989e288769573fc16",
-            "Karnah": "63f2182989e288769573bef2",
-            "Kashtigarh": "63f2140389e2887695739b9a",
-            "Kathua": "63f216fe89e288769573b43c",
-            "Katra": "63f21f0289e2887695740008",
-            "Kawarhama": "63f2135789e288769573965e",
-            "Keegam": "63f21e2d89e288769573f91a",
-            "Keller": "63f21e2189e288769573f8b4",
-            "Keran": "63f2184089e288769573bfcb",
-            "Khag": "63f2113489e28876957383ac",
-            "Khansahib": "63f2117589e28876957385f9",
-            "Khanyar": "63f21abd89e288769573d799",
-            "Kharah Balli": "63f2156989e288769573a6f8",
-            "Khari": "63f21c1a89e288769573e5b1",
-            "Khawas": "63f21a6189e288769573d440",
-            "Khoie": "63f2135089e288769573961b",
-            "Khour": "63f215ef89e288769573ac05",
-            "Kishtwar": "63f21bb989e288769573e10d",
-            "Kokernag": "63f210c589e2887695737fc3",
-            "Koteranka": "63f21a8d89e288769573d5d4",
-            "Kralpora": "63f2184489e288769573bfeb",
-            "Kreeri": "63f2128c89e288769573900a",
-            "Kulgam": "63f21c4c89e288769573e79a",
-            "Kunzar": "63f2136f89e28876957396d3",
-            "Kupwara": "63f217f189e288769573bceb",
-            "Lalpora": "63f218a489e288769573c35e",
-            "Langate": "63f2188389e288769573c227",
-            "Lar": "63f21e8c89e288769573fb9c",
-            "Larnoo": "63f2111389e288769573828b",
-            "Laroka": "63f21a7789e288769573d50e",
-            "Latti": "63f21bb589e288769573e0d7",
-            "Lohai Malhar": "63f217b789e288769573bae7",
-            "Lolab": "63f2189b89e288769573c30c",
-            "Machail": "63f21bdd89e288769573e2f6",
-            "Machil": "63f2185989e288769573c0ad",
-            "Magam": "63f2122a89e2887695738c6b",
-            "Mahanpur": "63f2178c89e288769573b963",
-            "Mahore": "63f21f5589e288769574031c",
-            "Maira Mandrian": "63f2154e89e288769573a5eb",
-            "Majalta": "63f21b7b89e288769573deea",
-            "Mandal": "63f215d789e288769573ab13",
-            "Mandi": "63f218de89e288769573c593",
-            "Manjakote": "63f21a6a89e288769573d492",
-            "Mankote": "63f2191789e288769573c7c6",
-            "Marh": "63f2161b89e288769573ad2e",
-            "Marheen": "63f217bf89e288769573bb25",
-            "Marmat": "63f2142189e2887695739c31",
-            "Marwah": "63f21bc389e288769573e196",
-            "Mendhar": "63f218f189e288769573c64e",
-            "Mohalla": "63f2141689e2887695739bf3",
-            "Moungri": "63f21b9d89e288769573dfc3",
-            "Mughalmaidan": "63f21bd389e288769573e273",
-            "Nagri": "63f2179b89e288769573b9e9",
-            "Nagrota": "63f215af89e288769573a9a7",
-            "Nagseni": "63f21bdf89e288769573e311",
-            "Narbal": "63f2122189e2887695738c14",
-            "Narvaw": "63f2139189e2887695739798",
-            "Nowshera": "63f21a4089e288769573d2de",
-            "Pahalgam": "63f2104e89e2887695737bdd",
-            "Pahloo": "63f21cb189e288769573ebad",
-            "Pampore": "63f2191f89e288769573c81a",
-            "Panchari": "63f21ba489e288769573e015",
-            "Panthachowk": "63f21ad989e288769573d8b2",
-            "Pargwal": "63f2157389e288769573a754",
-            "Pattan": "63f2126089e2887695738e67",
-            "Phigsoo": "63f2148389e2887695739f58",
-            "Pogal Paristan": "63f21c2089e288769573e5ea",
-            "Pouni": "63f21f1889e28876957400d7",
-            "Pulwama": "63f2195c89e288769573ca64",
-            "Qaimoh": "63f21ca689e288769573eb33",
-            "Qalamabad": "63f218ac89e288769573c3b0",
-            "Qaziabad": "63f2186989e288769573c144",
-            "Qazigund": "63f210f389e288769573817c",
-            "Qila Darhal": "63f21a7489e288769573d4f3",
-            "Rafiabad": "63f2125389e2887695738df2",
-            "Rajgarh": "63f21c3089e288769573e689",
-            "Rajouri": "63f219e889e288769573cfbf",
-            "Rajpora": "63f219b689e288769573cdd7",
-            "Rajpura": "63f21d6689e288769573f25c",
-            "Ramban": "63f21c0089e288769573e4c9",
-            "Ramgarh": "63f21dc189e288769573f4f3",
-            "Ramhal": "63f2186189e288769573c0f7",
-            "Ramkote": "63f217a989e288769573ba77",
-            "Ramnagar": "63f21b5089e288769573dd94",
-            "Ramsoo": "63f21c4489e288769573e75a",
-            "Ranbir Singh Pura": "63f214e489e288769573a1ee",
-            "Reasi": "63f21ed989e288769573fe61",
-            "Sallar": "63f210fc89e28876957381c9",
-            "Samba": "63f21d1b89e288769573ef76",
-            "Shahbad Bala": "63f210ec89e2887695738134",
-            "Shahoora": "63f2199889e288769573ccb6",
-            "Shangus": "63f210b789e2887695737f3f",
-            "Shopian": "63f21df489e288769573f6f5",
-            "Singhpora": "63f2139e89e2887695739808",
-            "Siot": "63f21a8b89e288769573d5c3",
-            "Sonawari": "63f21cf089e288769573ee02",
-            "Sopore": "63f2124a89e2887695738daf",
-            "Srigufwara": "63f2110989e288769573822f",
-            "Srinagar (North)": "63f21a9f89e288769573d68c",
-            "Srinagar (South)": "63f21ab389e288769573d73d",
-            "Srinagar Central": "63f21ade89e288769573d8eb",
-            "Suchetgarh": "63f2165a89e288769573af10",
-            "Sundarbani": "63f21a5489e288769573d3b7",
-            "Surankote": "63f2190089e288769573c6dc",
-            "Tangmarg": "63f212d789e288769573926d",
-            "Taryath": "63f21a7d89e288769573d542",
-            "Thakrakote": "63f21f4589e2887695740275",
-            "Thana Mandi": "63f219d289e288769573cedf",
-            "Thathri": "63f213cf89e288769573999e",
-            "Thuroo": "63f21ef989e288769573ffa5",
-            "Tral": "63f2194489e288769573c977",
-            "Trehgam": "63f2185089e288769573c056",
-            "Tulail": "63f21d0b89e288769573ef18",
-            "Tullamulla Khirbhawani": "63f21ec489e288769573fd9d",
-            "Udhampur": "63f21ae889e288769573d949",
-            "Uri": "63f2129889e2887695739089",
-            "Vijaypur": "63f21da089e288769573f429",
-            "Villgam": "63f218ba89e288769573c43e",
-            "Wagoora": "63f2130289e28876957393b4",
-            "Wakoora": "63f21ece89e288769573fdfe",
-            "Warwan": "63f21bd989e288769573e2bd",
-            "Watergam": "63f2132a89e28876957394e9",
-            "Yaripora": "63f21cc289e288769573ec42",
-            "Zachaldara": "63f2189089e288769573c29c",
-            "Zainapora": "63f21e4389e288769573f9c1",
-            "Zaingeer": "63f2133789e2887695739554",
-            "SRINAGAR": "63f21a9f89e288769573d689",
-            "POONCH": "63f218c289e288769573c48f"
-        },
-        "63f893d236497c055ce2e09a": {
-            "Adityapur(Gamharia)": "63f8b72f36497c055ce515c4",
-            "Albert Ekka(Jari)": "63f8a8f536497c055ce436a2",
-            "Amrapara": "63f8af3e36497c055ce495a6",
-            "Anandpur": "63f8b94f36497c055ce53aec",
-            "Angara": "63f8b32536497c055ce4d27b",
-            "BARGARH": "63f8a2ad36497c055ce3c5c0",
-            "BHARNO": "63f8a86336497c055ce42d1a",
-            "Baghmara-Cum-Katras": "63f89b1936497c055ce3486a",
-            "Bagodar": "63f8a52636497c055ce3f191",
-            "Baharagora": "63f8a13e36497c055ce3ab71",
-            "Baliapur": "63f89ba436497c055ce3519e",
-            "Balumath": "63f8adbe36497c055ce483a6",
-            "Bandgaon": "63f8b8a036497c055ce52ed2",
-            "Bano": "63f8b84d36497c055ce5294d",
-            "Bansjor": "63f8b84536497c055ce528ec",
-            "Bardiha": "63f8a20036497c055ce3b893",
-            "Barhait": "63f8b50236497c055ce4f2e6",
-            "Barharwa": "63f8b63436497c055ce505fb",
-            "Barhi": "63f8a98036497c055ce43f85",
-            "Bariyatu": "63f8add336497c055ce484f7",
-            "Barkagaon": "63f8aa8736497c055ce45145",
-            "Barkatha": "63f8a9f136497c055ce446f1",
-            "Barwadih": "63f8ad3d36497c055ce47b3d",
-            "Bashant Rai*": "63f8a72236497c055ce416e9",
-            "Basia": "63f8a88636497c055ce42fe4",
-            "Bengabad": "63f8a43736497c055ce3df19",
-            "Bermo": "63f893f336497c055ce2e2c5",
-            "Bero": "63f8b3d536497c055ce4df06",
-            "Bhandaria": "63f8a29936497c055ce3c43d",
-            "Bhandra": "63f8ae8936497c055ce48ecf",
-            "Bhawnathpur": "63f8a1cd36497c055ce3b4aa",
-            "Birni": "63f8a4fb36497c055ce3ee01",
-            "Bishrampur": "63f8b16836497c055ce4b75a",
-            "Bishungarh": "63f8aa1036497c055ce4495c",
-            "Bishunpur": "63f8a81c36497c055ce427b0",
-            "Bishunpura": "63f8a20f36497c055ce3b9c8",
-            "Boarijor": "63f8a62736497c055ce4041e",
-            "Bolba": "63f8b80936497c055ce524fc",
-            "Boram": "63f89fa136497c055ce3930e",
-            "Borio": "63f8b4a536497c055ce4ec2c",
-            "Bundu": "63f8b42236497c055ce4e2d1",
-            "Burmu": "63f8b2d436497c055ce4ccfb",
-            "Chaibasa": "63f8b9ba36497c055ce5428a",
-            "Chainpur": "6492b7fa882c8da847737064",
-            "Chakradharpur": "63f8b8db36497c055ce53311",
-            "Chakulia": "63f8a0ed36497c055ce3a62e",
-            "Chalkusa": "63f8aa0536497c055ce44892",
-            "Chandankiyari": "63f8948d36497c055ce2ec9a",
-            "Chandil": "63f8b6b936497c055ce50f4a",
-            "Chandrapura": "63f893e936497c055ce2e228",
-            "Chandwa": "63f8adf236497c055ce48712",
-            "Chandwara": "63f8accd36497c055ce475b8",
-            "Chanho": "63f8b3c236497c055ce4ddb5",
-            "Chas": "63f8946036497c055ce2e9a0",
-            "Chatra": "63f8957c36497c055ce2fb6d",
-            "Chauparan": "63f8a93e36497c055ce43a4c",
-            "Chhatarpur": "63f8b10136497c055ce4b108",
-            "Chinia": "63f8a23d36497c055ce3bd56",
-            "Chitarpur": "63f8bb5c36497c055ce56011",
-            "Churchu": "63f8aa9b36497c055ce452eb",
-            "Dadi": "63f8aaa536497c055ce453ba",
-            "Danda": "63f8a27b36497c055ce3c1da",
-            "Dandai": "63f8a23636497c055ce3bcc8",
-            "Daru": "63f8a9e436497c055ce445e6",
-            "Deoghar": "63f896b936497c055ce30c00",
-            "Deori": "63f8a31e36497c055ce3cd11",
-            "Devipur": "63f8988036497c055ce32402",
-            "Dhalbhumgarh": "63f8a0af36497c055ce3a238",
-            "Dhanbad-Cum-Kenduadih-Cum-Jagata": "63f89b9b36497c055ce35101",
-            "Dhanwar": "63f8a36f36497c055ce3d2fe",
-            "Dhurki": "63f8a22b36497c055ce3bbe3",
-            "Domchanch": "63f8ac8236497c055ce47082",
-            "Dulmi": "63f8bb5036497c055ce55f47",
-            "Dumaria": "63f8a09336497c055ce3a074",
-            "Dumka": "63f89e5e36497c055ce37f72",
-            "Dumri": "6492b7f5882c8da84773705c",
-            "EGARKUND": "63f89be036497c055ce3557b",
-            "Erki(Tamar II)": "63f8baf636497c055ce55891",
-            "Fatehpur": "6492b7f7882c8da84773705e",
-            "Gandey": "63f8a47636497c055ce3e425",
-            "Garhwa": "63f8a25a36497c055ce3bf76",
-            "Garu": "63f8ad7736497c055ce47ef2",
-            "Gawan": "63f8a2ae36497c055ce3c5c9",
-            "Ghaghra": "63f8a82e36497c055ce42906",
-            "Ghatshila": "63f89fe136497c055ce39673",
-            "Gidhaur": "63f8964f36497c055ce306d8",
-            "Giridih": "63f8a4be36497c055ce3e986",
-            "Gobindpur": "63f89b5836497c055ce34c9f",
-            "Gobindpur(Rajnagar)": "63f8b79a36497c055ce51d39",
-            "Godda": "63f8a74336497c055ce41920",
-            "Goilkera": "63f8b92b36497c055ce538b0",
-            "Gola": "6492b7fb882c8da84773706a",
-            "Golmuri-Cum-Jugsalai": "63f89fbd36497c055ce3947d",
-            "Gomia": "63f893f936497c055ce2e330",
-            "Gopikandar": "63f89d6d36497c055ce36fb6",
-            "Gudri": "63f8b88936497c055ce52d3b",
-            "Gumla": "63f8a89b36497c055ce4319e",
-            "Gurbandha": "63f8a0d136497c055ce3a45b",
-            "Haidernagar": "63f8b0aa36497c055ce4ab99",
-            "Hariharganj": "63f8b0c936497c055ce4ad8c",
-            "Hat Gamharia": "63f8b9ab36497c055ce5417a",
-            "Hazaribag": "63f8aa2936497c055ce44b57",
-            "Herhanj": "63f8ade436497c055ce48611",
-            "Hiranpur": "63f8af6336497c055ce4980f",
-            "Hussainabad": "63f8b07736497c055ce4a82c",
-            "Ichagarh": "63f8b6d736497c055ce51168",
-            "Ichak": "63f8a9bb36497c055ce442cc",
-            "Itkhori": "63f895d736497c055ce3016b",
-            "Itki": "63f8b40236497c055ce4e0ac",
-            "Jagannathpur": "63f8ba0336497c055ce54797",
-            "Jainagar": "63f8aca636497c055ce47313",
-            "Jaldega": "63f8b83336497c055ce527be",
-            "Jama": "63f89eb036497c055ce384d8",
-            "Jamtara": "63f8ab4c36497c055ce45c7b",
-            "Jamua": "63f8a3d136497c055ce3d8f0",
-            "Jaridih": "63f8944f36497c055ce2e89f",
-            "Jarmundi": "63f89c6e36497c055ce35eed",
-            "Jhinkpani": "63f8b9fb36497c055ce54704",
-            "KARIASOL": "63f89bea36497c055ce35627",
-            "Kairo": "63f8ae6636497c055ce48c80",
-            "Kamdara": "63f8a87436497c055ce42e75",
-            "Kandi": "6492b7f5882c8da84773705a",
-            "Kanha Chatti": "63f895b336497c055ce2fefd",
-            "Kanke": "63f8b2f136497c055ce4cee9",
-            "Karma Tanr Vidyasagar*": "63f8ab0536497c055ce45972",
-            "Karon": "63f8997536497c055ce32fca",
-            "Karra": "63f8ba4636497c055ce54c40",
-            "Kasmar": "63f8943b36497c055ce2e749",
-            "Katamdag": "63f8aa6936497c055ce44ed5",
-            "Kathikund": "63f89d9236497c055ce3723d",
-            "Katkamsandi": "63f8aa5336497c055ce44d39",
-            "Keredari": "63f8aa7536497c055ce44fc7",
-            "Kersai": "63f8b80336497c055ce52491",
-            "Ketar*": "63f8a1d236497c055ce3b510",
-            "Kharaundhi": "63f8a1c836497c055ce3b444",
-            "Kharsawan": "63f8b69436497c055ce50caa",
-            "Khelari": "63f8b2ea36497c055ce4ce7e",
-            "Khunti": "63f8bacc36497c055ce555ab",
-            "Khuntpani": "63f8b90e36497c055ce536a1",
-            "Kisko": "63f8ae1b36497c055ce488bf",
-            "Koderma": "63f8ac6936497c055ce46ea0",
-            "Kolebira": "63f8b82336497c055ce526b3",
-            "Kuchai": "63f8b67636497c055ce50ab4",
-            "Kukru": "63f8b6f936497c055ce51395",
-            "Kumardungi": "63f8ba1b36497c055ce54956",
-            "Kunda": "6492b7f5882c8da847737054",
-            "Kundhit": "63f8ac0f36497c055ce46846",
-            "Kurdeg": "63f8b7fc36497c055ce52412",
-            "Kuru": "63f8ae5136497c055ce48b39",
-            "Lapung": "63f8b40b36497c055ce4e144",
-            "Latehar": "63f8ad8c36497c055ce48066",
-            "Lawalaung": "63f8955d36497c055ce2f968",
-            "Litipara": "63f8ae9836497c055ce48fb4",
-            "Lohardaga": "63f8ae6d36497c055ce48d04",
-            "Madhupur": "63f898e036497c055ce32913",
-            "Mahagama": "63f8a69a36497c055ce40c3b",
-            "Maheshpur": "63f8afc936497c055ce49e5d",
-            "Mahuadanr": "63f8ad5a36497c055ce47cde",
-            "Majhgaon": "63f8ba2e36497c055ce54a84",
-            "Majhiaon": "63f8a1f436497c055ce3b7a6",
-            "Manatu": "63f8b1c636497c055ce4bd32",
-            "Mandar": "63f8b3af36497c055ce4dc5a",
-            "Mandro": "63f8b46836497c055ce4e7b6",
-            "Mandu": "63f8bb3136497c055ce55cfc",
-            "Manika": "63f8ad0936497c055ce47997",
-            "Manjhari": "63f8b9e936497c055ce545c2",
-            "Manoharpur": "63f8b96936497c055ce53ca1",
-            "Margo Munda": "63f8994a36497c055ce32d66",
-            "Markacho": "63f8ace736497c055ce47777",
-            "Masalia": "63f89f1636497c055ce38b1a",
-            "Mayur Hand": "63f8961736497c055ce30488",
-            "Medininagar(Daltonganj)": "63f8b28d36497c055ce4c84f",
-            "Meherma": "63f8a5bb36497c055ce3fc36",
-            "Meral (Pipra Kalan)": "63f8a24536497c055ce3bdf3",
-            "Mohammad Ganj": "63f8b0bc36497c055ce4acb3",
-            "Mohanpur": "6492b7f5882c8da847737056",
-            "Murhu": "63f8baa236497c055ce552e8",
-            "Musabani": "63f8a08336497c055ce39f6e",
-            "Nagaruntari": "63f8a21636497c055ce3ba5b",
-            "Nagri": "6492b7fb882c8da84773706e",
-            "Nala": "63f8ab7536497c055ce45f48",
-            "Namkum": "63f8b37936497c055ce4d873",
-            "Narayanpur": "6492b7f8882c8da847737060",
-            "Nawa Bazar": "63f8b17b36497c055ce4b8a1",
-            "Nawadih": "63f893d236497c055ce2e0a0",
-            "Nawadiha Bazar/Nawadiha*": "63f8b12f36497c055ce4b3d0",
-            "Nilambar-Pitambarpur(Lesliganj)": "63f8b26636497c055ce4c5ff",
-            "Nimdih": "63f8b71e36497c055ce5147d",
-            "Nirsa-Cum-Chirkunda": "63f89bb936497c055ce352f4",
-            "Noamundi": "63f8b98436497c055ce53e9c",
-            "Ormanjhi": "63f8b30a36497c055ce4d0b2",
-            "Padma": "63f8a9aa36497c055ce441f3",
-            "Padwa": "63f8b1b236497c055ce4bc86",
-            "Pakar Tanr": "63f8b7f336497c055ce52375",
-            "Pakaur": "63f8af9036497c055ce49aaa",
-            "Pakuria": "63f8b03136497c055ce4a51c",
-            "Palkot": "63f8a92236497c055ce438db",
-            "Palojori": "63f89a3d36497c055ce33a64",
-            "Pandu": "63f8b14f36497c055ce4b5bc",
-            "Panki": "63f8b20f36497c055ce4c0f1",
-            "Patamda": "63f89f7c36497c055ce3914f",
-            "Patan": "6492b7fa882c8da847737066",
-            "Pathalgora": "63f8965c36497c055ce30798",
-            "Pathargama": "63f8a6f036497c055ce41318",
-            "Pathna": "63f8b5f736497c055ce5030b",
-            "Patratu": "63f8bb1836497c055ce55b15",
-            "Peshrar": "63f8ae3836497c055ce489c5",
-            "Peterwar": "63f8942836497c055ce2e5fd",
-            "Pipra": "6492b7fa882c8da847737068",
-            "Pirtanr": "63f8a57e36497c055ce3f84f",
-            "Poreyahat": "63f8a79936497c055ce41e13",
-            "Potka": "63f8a02036497c055ce399b3",
-            "Pratappur": "63f8950d36497c055ce2f470",
-            "Purbi Tundi*": "63f89ad936497c055ce34438",
-            "RAMGARH": "63f8b2d336497c055ce4ccf2",
-            "Rahe": "63f8b33c36497c055ce4d41c",
-            "Raidih": "63f8a90336497c055ce437a8",
-            "Rajmahal": "63f8b5aa36497c055ce4fda3",
-            "Ramgarh": "6492b7f5882c8da847737058",
-            "Ramkanda": "63f8a29236497c055ce3c396",
-            "Ramna": "63f8a20536497c055ce3b903",
-            "Rania": "6492b7f9882c8da847737062",
-            "Ranishwar": "63f89e1c36497c055ce37b33",
-            "Ranka": "63f8a27d36497c055ce3c1ff",
-            "Ratu": "63f8b39436497c055ce4da6e",
-            "Sagma": "63f8a23236497c055ce3bc71",
-            "Sahibganj": "63f8b45f36497c055ce4e714",
-            "Saraikela": "63f8b76836497c055ce519c7",
-            "Saraiyahat": "63f89c0636497c055ce3580b",
-            "Sarath": "63f899ae36497c055ce332c4",
-            "Sarwan": "63f897de36497c055ce31b0c",
-            "Satbarwa": "63f8b25636497c055ce4c4db",
-            "Satgawan": "63f8ac4036497c055ce46bce",
-            "Senha": "63f8ae7836497c055ce48dc4",
-            "Shaligram Ram Narayanpur(Hunterganj)": "63f894b536497c055ce2ef28",
-            "Shikaripara": "63f89dce36497c055ce37618",
-            "Silli": "63f8b34c36497c055ce4d545",
-            "Simaria": "63f8966836497c055ce30830",
-            "Simdega": "63f8b7e336497c055ce52242",
-            "Sisai": "63f8a84d36497c055ce42b60",
-            "Sona Rai Tharhi": "63f8983436497c055ce31fd2",
-            "Sonahatu": "63f8b36736497c055ce4d731",
-            "Sonua": "63f8b86a36497c055ce52b22",
-            "Sundarpahari": "63f8a7d636497c055ce42234",
-            "Suriya": "63f8a53a36497c055ce3f30f",
-            "Taljhari": "63f8b55e36497c055ce4f84c",
-            "Tamar I": "63f8b43a36497c055ce4e48b",
-            "Tandwa": "63f8968e36497c055ce30a26",
-            "Tantnagar": "63f8b9d536497c055ce54444",
-            "Tarhasi": "63f8b1e336497c055ce4bed8",
-            "Tati Jhariya": "63f8a9d636497c055ce444b8",
-            "Thakurgangti": "63f8a5f936497c055ce4005c",
-            "Thethaitangar": "63f8b81036497c055ce52580",
-            "Tisri": "63f8a2e636497c055ce3c8f0",
-            "Tonto": "63f8b99736497c055ce54001",
-            "Topchanchi": "63f89af436497c055ce34606",
-            "Torpa": "63f8ba7636497c055ce54fbc",
-            "Tundi": "63f89a9b36497c055ce34017",
-            "Udhwa": "63f8b5d436497c055ce50084",
-            "Untari Road": "63f8b16036497c055ce4b6d1",
-            "DHANBAD": "63f89a9b36497c055ce34014",
-            "SAHEBGANJ": "63f8b45f36497c055ce4e711",
-            "RANCHI": "63f8b2d436497c055ce4ccf8",
-            "EAST SINGHBUM": "63f89f7b36497c055ce3914c",
-            "PAKUR": "63f8ae9836497c055ce48fb1",
-            "HAZARIBAGH": "63f8a93e36497c055ce43a49",
-            "WEST SINGHBHUM": "63f8b86a36497c055ce52b1f",
-            "SARAIKELA KHARSAWAN": "63f8b67636497c055ce50ab1",
-            "BOKARO": "63f893d236497c055ce2e09d",
-            "PALAMU": "63f8b07736497c055ce4a829"
-        },
-        "63f99fbd519359b7438a84ca": {
-            "AJJAMPURA": "63f9a6f8519359b7438b1126",
-            "ALMEL": "63f9a574519359b7438af34e",
-            "ALNAVAR": "63f9aa05519359b7438b4b0b",
-            "ANNIGERI": "63f9aa00519359b7438b4aa0",
-            "Afzalpur": "63f9aa81519359b7438b5470",
-            "Aland": "63f9aa61519359b7438b5211",
-            "Alur": "6492b7fc882c8da847737078",
-            "Anekal": "63f9a0fb519359b7438a9c0f",
-            "Ankola": "63f9b989519359b7438c92af",
-            "Arkalgud": "63f9acfb519359b7438b84a4",
-            "Arsikere": "63f9abf4519359b7438b706e",
-            "Athni": "63f9a290519359b7438abb02",
-            "Aurad": "63f9a45c519359b7438ade33",
-            "BABALESHWAR": "63f9a527519359b7438aed73",
-            "BAINDURU": "63f9b8c2519359b7438c81a2",
-            "BELAGAVI": "63f9a2f0519359b7438ac249",
-            "BRAHMAVARA": "63f9b8cf519359b7438c82be",
-            "Badami": "63f99ff2519359b7438a8887",
-            "Bagalkot": "63f9a00f519359b7438a8ab4",
-            "Bagepalli": "63f9baa7519359b7438caa81",
-            "Bailahongala": "63f9a34d519359b7438ac994",
-            "Ballari": "63f9a3e9519359b7438ad551",
-            "Bangarapet": "63f9b00d519359b7438bc439",
-            "Bantval": "63f9a85d519359b7438b2b59",
-            "Basavakalyan": "63f9a421519359b7438ad9ac",
-            "Basavana Bagevadi": "63f9a4fe519359b7438aea54",
-            "Beltangadi": "63f9a873519359b7438b2cd2",
-            "Belur": "63f9ab8f519359b7438b68ec",
-            "Bengaluru East": "63f9a0d2519359b7438a991a",
-            "Bengaluru North": "63f9a066519359b7438a9123",
-            "Bengaluru South": "63f9a09c519359b7438a950d",
-            "Bhadravati": "6492b7fc882c8da84773707e",
-            "Bhalki": "63f9a43a519359b7438adb98",
-            "Bhatkal": "63f9ba04519359b7438c9ca8",
-            "Bidar": "63f9a476519359b7438ae024",
-            "Bilgi": "63f99fcb519359b7438a85cc",
-            "Byadgi": "63f9ae41519359b7438b9ef4",
-            "CHADACHAN": "63f9a534519359b7438aee79",
-            "CHITAGUPPA": "63f9a4ab519359b7438ae424",
-            "Challakere": "63f9a734519359b7438b15e3",
-            "Chamarajanagar": "63f9a5a6519359b7438af737",
-            "Channagiri": "63f9a946519359b7438b3cb5",
-            "Channapatna": "63f9bbcb519359b7438cc545",
-            "Channarayapatna": "63f9ad7c519359b7438b8f70",
-            "Chikkaballapura": "63f9ba53519359b7438ca354",
-            "Chikkamagaluru": "63f9a69a519359b7438b09fc",
-            "Chiknayakanhalli": "63f9b627519359b7438c48ea",
-            "Chikodi": "63f9a27b519359b7438ab970",
-            "Chincholi": "63f9aab4519359b7438b5843",
-            "Chintamani": "63f9bb1d519359b7438cb4d0",
-            "Chitradurga": "63f9a768519359b7438b19be",
-            "Chittapur": "63f9aaf4519359b7438b5d06",
-            "DANDELI": "63f9ba12519359b7438c9de0",
-            "DEVARA HIPPARAGI": "63f9a53f519359b7438aef52",
-            "Davanagere": "63f9a8fe519359b7438b3743",
-            "Devadurga": "63f9b409519359b7438c1a79",
-            "Devanahalli": "63f9a1f3519359b7438aaeed",
-            "Dharwad": "63f9a99b519359b7438b4314",
-            "Dodda Ballapur": "63f9a1a0519359b7438aa8ba",
-            "GAJENDRAGAD": "63f9aa4e519359b7438b508f",
-            "GULEDGUDDA": "63f9a040519359b7438a8e55",
-            "GURUMITKAL": "63f9bc60519359b7438cd32a",
-            "Gadag": "63f9aa21519359b7438b4d28",
-            "Gangawati": "63f9b0f6519359b7438bd81d",
-            "Gauribidanur": "63f9ba19519359b7438c9e7a",
-            "Gokak": "63f9a2b6519359b7438abde5",
-            "Gubbi": "63f9b797519359b7438c683b",
-            "Gudibanda": "6492b7fb882c8da847737072",
-            "Gundlupet": "63f9a57c519359b7438af3f2",
-            "HANUR": "63f9a5eb519359b7438afc74",
-            "HAROHALLI": "63f9bc0f519359b7438ccb89",
-            "HEBRI": "63f9b8bd519359b7438c8150",
-            "HUBBALLI URBAN": "63f9a9fa519359b7438b4a21",
-            "HULSOOR": "63f9a4c3519359b7438ae5ea",
-            "HUNASAGI": "63f9bc7c519359b7438cd5cc",
-            "Hadagalli": "63f9bc90519359b7438cd792",
-            "Hagaribommanahalli": "63f9bc9d519359b7438cd8b6",
-            "Haliyal": "63f9b909519359b7438c87b7",
-            "Hangal": "63f9ae07519359b7438b9a22",
-            "Harapanahalli": "63f9bcc4519359b7438cdc77",
-            "Harihar": "63f9a8b9519359b7438b3226",
-            "Hassan": "63f9ac53519359b7438b77af",
-            "Haveri": "63f9ae2a519359b7438b9d26",
-            "Heggadadevankote": "63f9b347519359b7438c09cc",
-            "Hirekerur": "63f9ae51519359b7438ba040",
-            "Hiriyur": "63f9a813519359b7438b26a8",
-            "Holalkere": "63f9a79e519359b7438b1dfd",
-            "Hole Narsipur": "63f9ad42519359b7438b8a8c",
-            "Homnabad": "63f9a49d519359b7438ae319",
-            "Honavar": "63f9b9ee519359b7438c9ad0",
-            "Honnali": "63f9a92d519359b7438b3ac9",
-            "Hosakote": "63f9a22e519359b7438ab381",
-            "Hosanagara": "63f9b55e519359b7438c37f8",
-            "Hosapete": "63f9bca9519359b7438cd9df",
-            "Hosdurga": "63f9a7d4519359b7438b220a",
-            "Hubballi": "63f9a9c6519359b7438b4642",
-            "Hukeri": "63f9a2cd519359b7438abf9f",
-            "Hungund": "63f9a029519359b7438a8c96",
-            "Hunsur": "63f9b2d9519359b7438c008e",
-            "ILKAL": "63f9a04a519359b7438a8f15",
-            "Indi": "63f9a4d6519359b7438ae73f",
-            "Jagalur": "63f9a8d1519359b7438b33d6",
-            "Jamkhandi": "63f99fbd519359b7438a84d0",
-            "Jevargi": "63f9ab09519359b7438b5e9d",
-            "KADABA": "63f9a8a2519359b7438b3048",
-            "KAGWAD": "63f9a3b5519359b7438ad17d",
-            "KALAGI": "63f9ab22519359b7438b607a",
-            "KALASA": "63f9a718519359b7438b13b7",
-            "KAMALAPUR": "63f9ab45519359b7438b632d",
-            "KAMALNAGAR": "63f9a4b4519359b7438ae4df",
-            "KAMPLI": "63f9a414519359b7438ad8a2",
-            "KANAKAGIRI": "63f9b127519359b7438bdc59",
-            "KAPU": "63f9b8c8519359b7438c8226",
-            "KARATAGI": "63f9b136519359b7438bdd9b",
-            "KITTUR": "63f9a39e519359b7438acfb2",
-            "KOLAR GOLD FIELD": "63f9b08e519359b7438bcf4b",
-            "KOLHAR": "63f9a54a519359b7438af021",
-            "KOTTURU": "63f9bcd6519359b7438cde0e",
-            "KUKUNOOR": "63f9b13d519359b7438bde38",
-            "KURUGODU": "63f9a41a519359b7438ad921",
-            "KUSHALANAGAR": "63f9aeef519359b7438bacbf",
-            "Kadur": "63f9a650519359b7438b0441",
-            "Kalaburagi": "63f9aa99519359b7438b5643",
-            "Kalghatgi": "63f9a9d2519359b7438b472a",
-            "Kanakapura": "63f9bbe9519359b7438cc826",
-            "Karkal": "63f9b8b5519359b7438c808b",
-            "Karwar": "63f9b8da519359b7438c83c1",
-            "Khanapur": "6492b7fb882c8da847737070",
-            "Kolar": "6492b7fc882c8da84773707a",
-            "Kollegal": "63f9a5e0519359b7438afbaa",
-            "Koppa": "63f9a604519359b7438afe69",
-            "Koppal": "63f9b105519359b7438bd95f",
-            "Koratagere": "63f9b704519359b7438c5b8a",
-            "Krishnarajanagara": "63f9b30b519359b7438c04c3",
-            "Krishnarajpet": "63f9b14a519359b7438bdf5e",
-            "Kudligi": "63f9bcb5519359b7438cdb12",
-            "Kumta": "63f9b99e519359b7438c9469",
-            "Kundapura": "63f9b89c519359b7438c7e7a",
-            "Kundgol": "63f9a9ea519359b7438b48f8",
-            "Kunigal": "63f9b853519359b7438c784f",
-            "Kushtagi": "63f9b0cd519359b7438bd48d",
-            "LAXMESHWAR": "63f9aa58519359b7438b514f",
-            "Lingsugur": "63f9b3e9519359b7438c17ac",
-            "MASKI": "63f9b492519359b7438c2640",
-            "MOODUBIDIRE": "63f9a89a519359b7438b2fba",
-            "MUDALGI": "63f9a3aa519359b7438ad09a",
-            "MULKI": "63f9a8b2519359b7438b3191",
-            "Maddur": "6492b7fc882c8da84773707c",
-            "Madhugiri": "63f9b6ba519359b7438c5539",
-            "Madikeri": "63f9ae8e519359b7438ba4ee",
-            "Magadi": "63f9bb71519359b7438cbcea",
-            "Malavalli": "63f9b279519359b7438bf8ea",
-            "Malur": "63f9afb1519359b7438bbd11",
-            "Mandya": "63f9b229519359b7438bf230",
-            "Mangaluru": "63f9a844519359b7438b29d6",
-            "Manvi": "63f9b45a519359b7438c2149",
-            "Molakalmuru": "63f9a71c519359b7438b13f7",
-            "Muddebihal": "63f9a50c519359b7438aeb5f",
-            "Mudhol": "63f99fde519359b7438a8731",
-            "Mudigere": "63f9a6d6519359b7438b0ea4",
-            "Mulbagal": "63f9b03f519359b7438bc87d",
-            "Mundargi": "63f9aa3e519359b7438b4f66",
-            "Mundgod": "63f9b940519359b7438c8c61",
-            "Mysuru": "63f9b31f519359b7438c0673",
-            "NIDAGUNDI": "63f9a569519359b7438af275",
-            "NIPPANI": "63f9a3bb519359b7438ad206",
-            "NYAMATHI": "63f9a987519359b7438b4199",
-            "Nagamangala": "63f9b193519359b7438be5a5",
-            "Nanjangud": "63f9b372519359b7438c0d70",
-            "Narasimharajapura": "63f9a617519359b7438afffb",
-            "Nargund": "63f9aa08519359b7438b4b50",
-            "Navalgund": "63f9a9bb519359b7438b4582",
-            "Nelamangala": "63f9a161519359b7438aa3ef",
-            "PONNAMPET": "63f9aefc519359b7438bade3",
-            "Pandavapura": "63f9b1e8519359b7438becd2",
-            "Pavagada": "63f9b699519359b7438c525d",
-            "Piriyapatna": "63f9b2a5519359b7438bfc95",
-            "Puttur": "6492b7fc882c8da847737074",
-            "RABAKAVI BANAHATTI": "63f9a05d519359b7438a9084",
-            "RATTIHALLI": "63f9ae7d519359b7438ba3aa",
-            "Raichur": "63f9b435519359b7438c1e27",
-            "Ramanagara": "63f9bbaf519359b7438cc2a5",
-            "Ramdurg": "63f9a381519359b7438acd71",
-            "Ranibennur": "63f9ae5f519359b7438ba187",
-            "Raybag": "63f9a2a6519359b7438abcbc",
-            "Ron": "6492b7fc882c8da847737076",
-            "SALIGRAMA": "63f9b3d4519359b7438c15c3",
-            "SARAGURU": "63f9b3bf519359b7438c13d7",
-            "SAVADATTI": "63f9a364519359b7438acb3f",
-            "SHAHABAD": "63f9ab31519359b7438b61ad",
-            "SIRWAR": "63f9b485519359b7438c2521",
-            "Sagar": "6492b7fc882c8da847737080",
-            "Sakleshpur": "63f9ab56519359b7438b647b",
-            "Sandur": "63f9a3fd519359b7438ad6cf",
-            "Savanur": "63f9adf8519359b7438b98db",
-            "Sedam": "63f9aad5519359b7438b5ab1",
-            "Shahpur": "6492b7fd882c8da847737084",
-            "Shiggaon": "63f9addf519359b7438b970d",
-            "Shikarpur": "6492b7fd882c8da847737082",
-            "Shirhatti": "63f9aa32519359b7438b4e6f",
-            "Shivamogga": "63f9b5c9519359b7438c40e4",
-            "Shorapur": "63f9bc21519359b7438ccd3b",
-            "Shrirangapattana": "63f9b212519359b7438bf044",
-            "Siddapur": "63f9b9bb519359b7438c96e1",
-            "Sidlaghatta": "63f9bada519359b7438caf01",
-            "Sindgi": "63f9a4ee519359b7438ae90d",
-            "Sindhnur": "63f9b46a519359b7438c22ae",
-            "Sira": "63f9b65e519359b7438c4d7e",
-            "Sirsi": "63f9b955519359b7438c8e39",
-            "Siruguppa": "63f9a3d1519359b7438ad3a1",
-            "Somvarpet": "63f9aea7519359b7438ba6da",
-            "Sorab": "63f9b4ef519359b7438c2e6e",
-            "Sringeri": "63f9a5f7519359b7438afd72",
-            "Srinivaspur": "63f9af0c519359b7438baf2c",
-            "Sulya": "63f9a891519359b7438b2f0e",
-            "Supa": "63f9b8e8519359b7438c84f4",
-            "TALIKOTI": "63f9a551519359b7438af0af",
-            "TIKOTA": "63f9a561519359b7438af1d3",
-            "Tarikere": "63f9a628519359b7438b0142",
-            "Tiptur": "63f9b7e7519359b7438c6f09",
-            "Tirthahalli": "63f9b591519359b7438c3c0f",
-            "Tirumakudal - Narsipur": "63f9b39e519359b7438c1123",
-            "Tumakuru": "63f9b73d519359b7438c6073",
-            "Turuvekere": "63f9b81c519359b7438c738e",
-            "ULLALA": "63f9a8ac519359b7438b311c",
-            "Udupi": "63f9b8ad519359b7438c7fdf",
-            "Vijayapura": "63f9a4c8519359b7438ae648",
-            "Virajpet": "63f9aee1519359b7438bab96",
-            "WADAGERA": "63f9bc6e519359b7438cd48a",
-            "YADRAMI": "63f9ab34519359b7438b61eb",
-            "YARAGATTI": "63f9a3c9519359b7438ad316",
-            "YELAHANKA": "63f9a137519359b7438aa0ad",
-            "Yadgir": "63f9bc4d519359b7438cd152",
-            "Yelandur": "63f9a5d8519359b7438afb1c",
-            "Yelbarga": "63f9b0b8519359b7438bd2dd",
-            "Yellapur": "63f9b922519359b7438c89c6",
-            "UTTARA KANNADA": "63f9b8da519359b7438c83be",
-            "BENGALURU URBAN": "63f9a066519359b7438a9120",
-            "CHAMARAJANAGARA": "63f9a57c519359b7438af3ef",
-            "DAVANGERE": "63f9a8b9519359b7438b3223",
-            "DAKSHINA KANNADA": "63f9a844519359b7438b29d3",
-            "BENGALURU RURAL": "63f9a161519359b7438aa3ec",
-            "BAGALKOTE": "63f99fbd519359b7438a84cd",
-            "KODAGU": "63f9ae8e519359b7438ba4eb",
-            "VIJAYANAGAR": "63f9bc90519359b7438cd78f"
-        },
-        "63f9bd39519359b7438ce777": {
-            "Adoor": "63f9be3f519359b7438cffab",
-            "Alathur": "63f9be2b519359b7438cfdbb",
-            "Aluva": "63f9bd52519359b7438ce9d1",
-            "Ambalappuzha": "63f9bd3e519359b7438ce7e8",
-            "Attappadi": "63f9be35519359b7438cfeaf",
-            "Chalakkudy": "63f9be88519359b7438d0690",
-            "Changanassery": "63f9bdd6519359b7438cf604",
-            "Chavakkad": "63f9be68519359b7438d039a",
-            "Chengannur": "63f9bd48519359b7438ce8d4",
-            "Cherthala": "63f9bd39519359b7438ce77d",
-            "Chirayinkeezhu": "63f9be45519359b7438d003d",
-            "Chittur": "63f9be25519359b7438cfd23",
-            "Devikulam": "63f9bd6a519359b7438cebe7",
-            "Ernad": "63f9bdf5519359b7438cf8ee",
-            "Hosdurg": "63f9bd9d519359b7438cf098",
-            "Idukki": "63f9bd78519359b7438ced16",
-            "Iritty": "63f9bd8d519359b7438cef14",
-            "Kanayannur": "63f9bd5d519359b7438ceac7",
-            "Kanjirappally": "63f9bdd9519359b7438cf651",
-            "Kannur": "63f9bd80519359b7438cedd5",
-            "Karthikappally": "63f9bd44519359b7438ce878",
-            "Karunagappally": "63f9bdb1519359b7438cf27b",
-            "Kasaragod": "63f9bd96519359b7438cefec",
-            "Kattakkada": "63f9be59519359b7438d0234",
-            "Kochi": "63f9bd59519359b7438cea7a",
-            "Kodungallur": "63f9be7e519359b7438d05a1",
-            "Kollam": "63f9bdbd519359b7438cf3aa",
-            "Kondotty": "63f9be10519359b7438cfb70",
-            "Konni": "63f9be42519359b7438cfff3",
-            "Kothamangalam": "63f9bd66519359b7438ceba2",
-            "Kottarakkara": "63f9bdb8519359b7438cf321",
-            "Kottayam": "63f9bdd0519359b7438cf580",
-            "Koyilandi": "63f9bde2519359b7438cf724",
-            "Kozhenchery": "63f9be3d519359b7438cff72",
-            "Kozhikode": "63f9bde9519359b7438cf7c1",
-            "Kunnamkulam": "63f9be8e519359b7438d072d",
-            "Kunnathunad": "63f9bd4d519359b7438ce95c",
-            "Kunnathur": "63f9bdb5519359b7438cf2d2",
-            "Kuttanad": "63f9bd41519359b7438ce830",
-            "Mallappally": "63f9be38519359b7438cff0f",
-            "Mananthavady": "63f9be94519359b7438d07c2",
-            "Manjeswaram": "63f9bda4519359b7438cf13a",
-            "Mannarkad": "63f9be18519359b7438cfc2a",
-            "Mavelikkara": "63f9bd4a519359b7438ce90d",
-            "Meenachil": "63f9bdc7519359b7438cf496",
-            "Mukundapuram": "63f9be81519359b7438d05fd",
-            "Muvattupuzha": "63f9bd62519359b7438ceb46",
-            "Nedumangad": "63f9be49519359b7438d00ad",
-            "Neyyattinkara": "63f9be55519359b7438d01c9",
-            "Nilambur": "63f9bdfa519359b7438cf963",
-            "Ottappalam": "63f9be13519359b7438cfbb0",
-            "Palakkad": "63f9be1c519359b7438cfc8b",
-            "Paravur": "63f9bd56519359b7438cea37",
-            "Pathanapuram": "63f9bdb6519359b7438cf2f7",
-            "Pattambi": "63f9be31519359b7438cfe53",
-            "Payyannur": "63f9bd91519359b7438cef7a",
-            "Peerumade": "63f9bd75519359b7438cece2",
-            "Perinthalmanna": "63f9bdff519359b7438cf9ce",
-            "Ponnani": "63f9be0e519359b7438cfb37",
-            "Punalur": "63f9bdc4519359b7438cf447",
-            "Ranni": "63f9be3a519359b7438cff3e",
-            "Sulthanbathery": "63f9be99519359b7438d0814",
-            "Talappilly": "63f9be5e519359b7438d02b7",
-            "Taliparamba": "63f9bd7a519359b7438ced47",
-            "Thalassery": "63f9bd86519359b7438cee63",
-            "Thamarassery": "63f9bdf1519359b7438cf886",
-            "Thiruvalla": "63f9be36519359b7438cfed1",
-            "Thiruvananthapuram": "63f9be4e519359b7438d012c",
-            "Thodupuzha": "63f9bd72519359b7438cec8b",
-            "Thrissur": "63f9be6e519359b7438d042d",
-            "Tirur": "63f9be04519359b7438cfa48",
-            "Tirurangadi": "63f9be0b519359b7438cfae0",
-            "Udumbanchola": "63f9bd6e519359b7438cec2f",
-            "Vaikom": "63f9bdcd519359b7438cf524",
-            "Varkala": "63f9be5c519359b7438d0277",
-            "Vatakara": "63f9bddc519359b7438cf696",
-            "Vellarikkundu": "63f9bdae519359b7438cf22c",
-            "Vythiri": "63f9be9c519359b7438d0861",
-            "ALAPPUZHA": "63f9bd39519359b7438ce77a",
-            "MALAPPURAM": "63f9bdf5519359b7438cf8eb",
-            "PATHANAMTHITTA": "63f9be36519359b7438cfece",
-            "WAYANAD": "63f9be94519359b7438d07bf",
-            "ERNAKULAM": "63f9bd4d519359b7438ce959"
-        },
-        "63f878a8c660ddb223461a90": {
-            "Diskit": "63f878d5c660ddb223461f1e",
-            "Drass": "63f878b5c660ddb223461beb",
-            "Durbuk": "63f878cac660ddb223461e35",
-            "Kargil": "63f878a8c660ddb223461a96",
-            "Khalsi": "63f878c7c660ddb223461dcf",
-            "Khaltsi": "6492b7fd882c8da847737086",
-            "Kharu": "63f878ccc660ddb223461e5a",
-            "Leh": "63f878c0c660ddb223461d21",
-            "Nyoma": "63f878d1c660ddb223461ec2",
-            "Sankoo": "63f878acc660ddb223461b06",
-            "Saspol": "63f878cec660ddb223461ea7",
-            "Shakar Chiktan": "63f878b9c660ddb223461c4c",
-            "Shergole": "63f878bbc660ddb223461c85",
-            "Sumoor": "63f878c5c660ddb223461daa",
-            "Taisuru": "63f878bec660ddb223461ccd",
-            "Zanskar": "63f878b0c660ddb223461b6c",
-            "LEH LADAKH": "63f878c0c660ddb223461d1e"
-        },
-        "63f8e729dbc0f7fe0670d050": {
-            "Adhartal": "63f8ff85dbc0f7fe06727ed2",
-            "Agar": "63f92247dbc0f7fe06750df3",
-            "Ajaigarh": "63f908dedbc0f7fe06731f5e",
-            "Alirajpur": "63f921a7dbc0f7fe0675002f",
-            "Alot": "63f90d13dbc0f7fe06737850",
-            "Amanganj": "63f90954dbc0f7fe06732998",
-            "Amarpatan": "63f91378dbc0f7fe067400af",
-            "Amarwara": "63f8ef9adbc0f7fe06717385",
-            "Ambah": "63f90652dbc0f7fe0672e972",
-            "Amla": "63f8ebc6dbc0f7fe06712ba0",
-            "Anjad": "63f8ea40dbc0f7fe06710dd8",
-            "Anuppur": "63f8e73edbc0f7fe0670d1f7",
-            "Aron": "63f8f8fddbc0f7fe0672261a",
-            "Ashoknagar": "63f8e803dbc0f7fe0670e11c",
-            "Ashta": "63f91493dbc0f7fe06741524",
-            "Ater": "63f8ec35dbc0f7fe067133a2",
-            "Athner": "63f8eaeadbc0f7fe06711b06",
-            "Awantipur Badodiya": "63f9186adbc0f7fe06745f91",
-            "BAJAG": "63f8f70adbc0f7fe06720029",
-            "Babai": "63f8faf3dbc0f7fe06724b52",
-            "Bada Malhera": "63f8eed1dbc0f7fe067164db",
-            "Badarwas": "63f919d5dbc0f7fe06747cf0",
-            "Badgaon Dhasan": "63f91c6adbc0f7fe0674a954",
-            "Badi": "63f90aacdbc0f7fe06734678",
-            "Badnagar": "63f91d35dbc0f7fe0674b84b",
-            "Badnawar": "63f8f4a8dbc0f7fe0671d2aa",
-            "Badod": "63f92228dbc0f7fe06750b30",
-            "Badoda": "63f918d8dbc0f7fe067468d6",
-            "Badoni": "63f8f367dbc0f7fe0671bb1b",
-            "Badwara": "63f9019edbc0f7fe06729394",
-            "Bagli": "63f8f425dbc0f7fe0671c90c",
-            "Bahadurpur": "63f8e878dbc0f7fe0670ea16",
-            "Bahari": "63f91b75dbc0f7fe06749a0b",
-            "Bahoriband": "63f901f3dbc0f7fe0672985c",
-            "Baihar": "63f8e960dbc0f7fe0670fc36",
-            "Bairad": "63f91a3fdbc0f7fe06748502",
-            "Bajna": "63f90d76dbc0f7fe0673810c",
-            "Balaghat": "63f8e911dbc0f7fe0670f601",
-            "Baldeogarh": "63f91bfddbc0f7fe0674a253",
-            "Bamor": "63f9071fdbc0f7fe0672f8e2",
-            "Bamori": "63f8f839dbc0f7fe0672177b",
-            "Banda": "6492b803882c8da8477370ae",
-            "Bandhogarh": "63f91dc3dbc0f7fe0674c05c",
-            "Bankhedi": "63f8fb66dbc0f7fe06725382",
-            "Baraily": "63f90a90dbc0f7fe06734437",
-            "Barghat": "63f916c4dbc0f7fe06743c5a",
-            "Barhi": "6492b7fe882c8da84773709e",
-            "Barwaha": "63f90273dbc0f7fe0672a1d0",
-            "Barwani": "63f8e9fedbc0f7fe0671089d",
-            "Basoda": "63f91fc5dbc0f7fe0674da48",
-            "Batiyagarh": "63f8f1dedbc0f7fe06719dc6",
-            "Beerpur": "6492b805882c8da8477370b8",
-            "Begamganj": "63f90a33dbc0f7fe06733bdc",
-            "Beohari": "63f91720dbc0f7fe06744414",
-            "Berasia": "63f8ed36dbc0f7fe06714662",
-            "Betul": "63f8eb08dbc0f7fe06711d42",
-            "Betul Nagar": "63f8ebf6dbc0f7fe06712f12",
-            "Bhagwanpura": "63f90390dbc0f7fe0672b647",
-            "Bhainsdehi": "63f8eab8dbc0f7fe067116f4",
-            "Bhander": "63f8f339dbc0f7fe0671b789",
-            "Bhanpura": "63f90562dbc0f7fe0672d6b7",
-            "Bhavra": "63f9217cdbc0f7fe0674fc48",
-            "BhicholiHapsi": "63f8fc1adbc0f7fe067260aa",
-            "Bhikangaon": "63f90336dbc0f7fe0672af52",
-            "Bhimpur": "63f8ec18dbc0f7fe06713187",
-            "Bhind": "63f8ec51dbc0f7fe067135c0",
-            "Bhind Nagar": "63f8ed18dbc0f7fe0671444c",
-            "Bhitarwar": "63f8f97ddbc0f7fe06722fe5",
-            "Biaora": "63f90c16dbc0f7fe0673621d",
-            "Bichhiya": "63f904cbdbc0f7fe0672cc7f",
-            "Bichhua": "63f8f116dbc0f7fe06718ef9",
-            "Bijawar": "63f8ef00dbc0f7fe06716845",
-            "Bilaspur": "6492b805882c8da8477370bc",
-            "Bina": "63f9104edbc0f7fe0673bf13",
-            "Birsa": "63f8e9d8dbc0f7fe067105a1",
-            "Birsinghpur": "63f91286dbc0f7fe0673ef2f",
-            "Budar": "63f917d6dbc0f7fe0674533a",
-            "Budni": "63f91546dbc0f7fe067420c1",
-            "Burhanpur": "6492b7fd882c8da847737090",
-            "Burhanpur nagar": "63f8ee0edbc0f7fe0671564f",
-            "Buxwaha": "63f8ef2cdbc0f7fe06716b99",
-            "Chachaura": "63f8f925dbc0f7fe06722905",
-            "Chand": "63f8f169dbc0f7fe06719533",
-            "Chanderi": "63f8e7e7dbc0f7fe0670dee0",
-            "Chandia": "63f91de7dbc0f7fe0674c1b2",
-            "Chandla": "63f8ee50dbc0f7fe06715b70",
-            "Chaurai": "63f8f00edbc0f7fe06717b0e",
-            "Chhapara": "63f915cbdbc0f7fe06742a2b",
-            "Chhatarpur": "6492b7fe882c8da847737092",
-            "Chhatarpur Nagar": "63f8ef53dbc0f7fe06716e48",
-            "Chhindwara": "63f8f0a0dbc0f7fe0671863d",
-            "Chhindwara Nagar": "63f8f186dbc0f7fe06719738",
-            "Chicholi": "63f8eb35dbc0f7fe067120f0",
-            "Chinour": "63f8f991dbc0f7fe06723181",
-            "Chitrangi": "63f920d2dbc0f7fe0674ed94",
-            "Churhat": "63f91aa2dbc0f7fe06748b4c",
-            "City center": "63f8f9e3dbc0f7fe06723747",
-            "Dahi": "63f8f5b2dbc0f7fe0671e669",
-            "Daloda": "63f90600dbc0f7fe0672e279",
-            "Damoh": "63f8f228dbc0f7fe0671a34c",
-            "Danyantinagar": "63f8f2c5dbc0f7fe0671aeec",
-            "Datia": "63f8f309dbc0f7fe0671b3f4",
-            "Datia Nagar": "63f8f360dbc0f7fe0671ba97",
-            "Deori": "6492b803882c8da8477370b0",
-            "Deosar": "63f92118dbc0f7fe0674f3ae",
-            "Depalpur": "63f8fb89dbc0f7fe06725608",
-            "Devendranagar": "63f9091ddbc0f7fe067324f3",
-            "Dewas": "63f8f3bcdbc0f7fe0671c14f",
-            "Dewas Nagar": "63f8f4a5dbc0f7fe0671d26f",
-            "Dhanora": "63f91642dbc0f7fe067431d2",
-            "Dhar": "63f8f510dbc0f7fe0671da65",
-            "Dharampuri": "63f8f5f7dbc0f7fe0671ebc2",
-            "Dhimarkheda": "63f9021bdbc0f7fe06729b2e",
-            "Dindori": "63f8f69edbc0f7fe0671f7df",
-            "Dolariya": "63f8fae4dbc0f7fe06724a42",
-            "Gadarwara": "63f9076bdbc0f7fe0672ff55",
-            "Gairatganj": "63f90a0ddbc0f7fe0673388d",
-            "Gandhwani": "63f8f551dbc0f7fe0671df6c",
-            "Garhakota": "63f9116adbc0f7fe0673d74b",
-            "Garoth": "63f905a0dbc0f7fe0672dc1a",
-            "Gaurihar": "63f8ee15dbc0f7fe067156e4",
-            "Ghansaur": "63f915f8dbc0f7fe06742d43",
-            "Ghatigaon": "63f8f9a5dbc0f7fe06723318",
-            "Ghatiya": "63f91cdbdbc0f7fe0674b115",
-            "Ghoda Dongri": "63f8eb4bdbc0f7fe067122b4",
-            "Ghughari": "63f9049ddbc0f7fe0672c8e0",
-            "Ghuwara": "63f8eef0dbc0f7fe06716712",
-            "Gird": "63f8f94edbc0f7fe06722c3a",
-            "Gogaon": "63f90375dbc0f7fe0672b438",
-            "Gohad": "63f8ecb4dbc0f7fe06713cdd",
-            "Goharganj": "63f90a66dbc0f7fe06734061",
-            "Gohparu": "63f917b6dbc0f7fe067450b3",
-            "Gopadbanas": "63f91acedbc0f7fe06748de7",
-            "Gorakhpur": "6492b7fe882c8da847737098",
-            "Gormi": "63f8eca4dbc0f7fe06713ba5",
-            "Gotegaon": "63f90732dbc0f7fe0672fa71",
-            "Gulabganj": "63f9206bdbc0f7fe0674e619",
-            "Gulana": "63f9180cdbc0f7fe0674579b",
-            "Guna": "63f8f7f3dbc0f7fe067211e8",
-            "Guna Nagar": "63f8f94adbc0f7fe06722bf5",
-            "Gunnor": "63f9092ddbc0f7fe0673266c",
-            "Gurh": "63f91020dbc0f7fe0673bb4d",
-            "Gyaraspur": "63f9204fdbc0f7fe0674e392",
-            "Handiya": "63f8fa30dbc0f7fe06723d46",
-            "Hanumana": "63f90eefdbc0f7fe0673a114",
-            "Harda": "63f8fa1adbc0f7fe06723b91",
-            "Harrai": "63f8efd3dbc0f7fe067176a2",
-            "Harsud": "63f8f73bdbc0f7fe067203d4",
-            "Hatod": "63f8fbafdbc0f7fe067258da",
-            "Hatpiplya": "63f8f447dbc0f7fe0671cb5c",
-            "Hatta": "63f8f18adbc0f7fe06719791",
-            "Hoshangabad": "63f8fad9dbc0f7fe06724969",
-            "Hoshangabad nagar": "63f8fb89dbc0f7fe067255ff",
-            "Huzur": "6492b802882c8da8477370ac",
-            "Huzur nagar": "63f91040dbc0f7fe0673bdf7",
-            "Ichhawar": "63f914e5dbc0f7fe06741aeb",
-            "Indergarh": "63f8f2e8dbc0f7fe0671b1ae",
-            "Indore": "63f8fbdddbc0f7fe06725c49",
-            "Isagarh": "63f8e7c3dbc0f7fe0670dc22",
-            "Itarsi": "63f8fab2dbc0f7fe0672469c",
-            "Jabalpur": "63f8fd12dbc0f7fe067273a0",
-            "Jabera": "63f8f262dbc0f7fe0671a795",
-            "Jaisinagar": "63f91207dbc0f7fe0673e4df",
-            "Jaisinghnagar": "63f91741dbc0f7fe067446fa",
-            "Jaithari": "63f8e76adbc0f7fe0670d569",
-            "Jaitpur": "63f9178ddbc0f7fe06744d5a",
-            "Jamai": "63f8f026dbc0f7fe06717cd2",
-            "Jaora": "63f90cf3dbc0f7fe06737565",
-            "Jatara": "63f91ba9dbc0f7fe06749d2f",
-            "Jawa": "63f90e15dbc0f7fe06738eab",
-            "Jawad": "63f90825dbc0f7fe06730f5e",
-            "Jawar": "63f914c8dbc0f7fe067418fa",
-            "Jhabua": "63f9010ddbc0f7fe06728843",
-            "Jharda": "63f91d77dbc0f7fe0674bc12",
-            "Jhiranya": "63f903afdbc0f7fe0672b888",
-            "Jiran": "63f90886dbc0f7fe067317b6",
-            "Jirapur": "63f90b26dbc0f7fe06735189",
-            "Jobat": "63f92187dbc0f7fe0674fd44",
-            "Joura": "63f906aedbc0f7fe0672eef5",
-            "Kailaras": "63f906eadbc0f7fe0672f3fc",
-            "Kalapipal": "63f9184edbc0f7fe06745d19",
-            "Kanadiya": "63f8fc12dbc0f7fe06726017",
-            "Kannod": "63f8f3f5dbc0f7fe0671c57f",
-            "Karahal": "63f918f1dbc0f7fe06746ac2",
-            "Kareli": "63f907d8dbc0f7fe0673088c",
-            "Karera": "63f91987dbc0f7fe067476b1",
-            "Karkeli": "63f91e5adbc0f7fe0674caee",
-            "Kasrawad": "63f902efdbc0f7fe0672a9d6",
-            "Katangi": "63f8e8aadbc0f7fe0670edf0",
-            "Kathiwara": "63f921b9dbc0f7fe067501df",
-            "Katni Nagar": "63f90262dbc0f7fe0672a082",
-            "Keolari": "63f91663dbc0f7fe0674340e",
-            "Kesli": "63f911a1dbc0f7fe0673dc22",
-            "Khacharod": "63f91c81dbc0f7fe0674aa93",
-            "Khairlanji": "63f8e8dedbc0f7fe0670f224",
-            "Khaknar": "63f8ede2dbc0f7fe067152fe",
-            "Khalwa": "63f8f752dbc0f7fe067205a7",
-            "Khandwa": "63f8f77adbc0f7fe067208ab",
-            "Khandwa Nagar": "63f8f7f1dbc0f7fe067211c1",
-            "Khaniyadhana": "63f91a14dbc0f7fe06748230",
-            "Khargapur": "63f91c17dbc0f7fe0674a435",
-            "Khargone": "63f9035ddbc0f7fe0672b25b",
-            "Khargone Nagar": "63f903eedbc0f7fe0672bd78",
-            "Khategaon": "63f8f461dbc0f7fe0671cd52",
-            "Khilchipur": "63f90b55dbc0f7fe067355d7",
-            "Khirkiya": "63f8f9eadbc0f7fe067237be",
-            "Khudel": "63f8fc24dbc0f7fe0672617b",
-            "Khujner": "63f90cc7dbc0f7fe06737195",
-            "Khurai": "63f91077dbc0f7fe0673c28f",
-            "Kirnapur": "63f8e93cdbc0f7fe0670f946",
-            "Kolar": "63f8edc2dbc0f7fe067150b1",
-            "Kolaras": "63f919a1dbc0f7fe067478bb",
-            "Kotar": "63f91362dbc0f7fe0673fefa",
-            "Kothi": "63f9122fdbc0f7fe0673e855",
-            "Kothi Mahal": "63f91dc2dbc0f7fe0674c035",
-            "Kotma": "63f8e729dbc0f7fe0670d056",
-            "Kukshi": "63f8f57bdbc0f7fe0671e25c",
-            "Kumbhraj": "63f8f8d5dbc0f7fe0672232a",
-            "Kundam": "63f8fe8edbc0f7fe06727ab1",
-            "Kurai": "63f916e5dbc0f7fe06743f2c",
-            "Kurwai": "63f91f72dbc0f7fe0674d72b",
-            "Kusmi": "63f91b52dbc0f7fe06749757",
-            "Lahar": "63f8ecf2dbc0f7fe0671416b",
-            "Lakhnadon": "63f9157bdbc0f7fe06742489",
-            "Lalbarra": "63f8e8f5dbc0f7fe0670f3cf",
-            "Lanji": "63f8e9b0dbc0f7fe06710270",
-            "Lateri": "63f91e73dbc0f7fe0674cd40",
-            "Laundi": "63f8ee3fdbc0f7fe06715a10",
-            "Lidhora": "63f91c56dbc0f7fe0674a7ae",
-            "Mada": "63f92168dbc0f7fe0674fa71",
-            "Maharajpur": "63f8ee7cdbc0f7fe06715ed5",
-            "Maheshwar": "63f902a6dbc0f7fe0672a5c9",
-            "Mahidpur": "63f91cbfdbc0f7fe0674aede",
-            "Maihar": "63f913e3dbc0f7fe06740822",
-            "Majhauli": "63f91b30dbc0f7fe067494da",
-            "Majhgawan": "63f91251dbc0f7fe0673eb63",
-            "Majholi": "63f8fc5edbc0f7fe067265fc",
-            "Makdon": "63f91d9fdbc0f7fe0674be49",
-            "Maksoodangarh": "63f8f8a6dbc0f7fe06721f95",
-            "Malharganj": "63f8fc20dbc0f7fe06726129",
-            "Malhargarh": "63f90579dbc0f7fe0672d8c6",
-            "Malthon": "63f910a1dbc0f7fe0673c638",
-            "Manasa": "63f9089bdbc0f7fe06731970",
-            "Manawar": "63f8f5c3dbc0f7fe0671e7a1",
-            "Mandla": "63f90466dbc0f7fe0672c550",
-            "Mandsaur": "63f905e6dbc0f7fe0672e01f",
-            "Mandsaur Nagar": "63f90649dbc0f7fe0672e888",
-            "Mangawan": "63f90e7fdbc0f7fe06739788",
-            "Manpur": "6492b805882c8da8477370be",
-            "Mau": "6492b7fd882c8da84773708e",
-            "Mauganj": "63f90f3adbc0f7fe0673a797",
-            "Meghnagar": "63f900f1dbc0f7fe06728607",
-            "Mehgaon": "63f8ec7edbc0f7fe067138ce",
-            "Mhow": "63f8fbe4dbc0f7fe06725cbe",
-            "Mihona": "63f8ece3dbc0f7fe06714065",
-            "Mohangarh": "63f91bbcdbc0f7fe06749e9e",
-            "Mohkhed": "63f8f0bfdbc0f7fe0671887e",
-            "Moman Badodiya": "63f9181fdbc0f7fe06745932",
-            "Morena": "63f90695dbc0f7fe0672ecf0",
-            "Multai": "63f8eb9ddbc0f7fe067128b0",
-            "Mungaoli": "63f8e84cdbc0f7fe0670e698",
-            "Murar": "63f8f9d3dbc0f7fe06723646",
-            "Murwara or Katni": "63f90164dbc0f7fe06728f30",
-            "Nagda": "63f91c9ddbc0f7fe0674acb6",
-            "Nagod": "63f912b0dbc0f7fe0673f28d",
-            "Nai Sarai": "63f8e867dbc0f7fe0670e8c5",
-            "Naigarhi": "63f90f86dbc0f7fe0673ae38",
-            "Nainpur": "63f9053cdbc0f7fe0672d352",
-            "Nalkheda": "63f92213dbc0f7fe0675094e",
-            "Narayanganj": "63f90433dbc0f7fe0672c189",
-            "Narsimhapur": "63f907a8dbc0f7fe06730493",
-            "Narsinghgarh": "63f90c59dbc0f7fe06736802",
-            "Narwar": "63f91964dbc0f7fe0674742f",
-            "Nasrullaganj": "63f91516dbc0f7fe06741e08",
-            "Nateran": "63f92020dbc0f7fe0674dfec",
-            "Neemuch": "63f9086fdbc0f7fe067315c5",
-            "Neemuch Nagar": "63f908dadbc0f7fe06731efb",
-            "Nepanagar": "63f8edf7dbc0f7fe06715495",
-            "Niwali": "63f8ea82dbc0f7fe067112af",
-            "Niwari": "63f92266dbc0f7fe067510c2",
-            "Niwas": "63f903f4dbc0f7fe0672bde0",
-            "Nowgong": "63f8ee67dbc0f7fe06715d2a",
-            "Nowrozabad": "63f91e4adbc0f7fe0674c9bb",
-            "Orchha": "6492b800882c8da8477370a4",
-            "Pachore": "63f90c8fdbc0f7fe06736caf",
-            "Palera": "63f91bd6dbc0f7fe0674a058",
-            "Pali": "6492b806882c8da8477370c0",
-            "Panagar": "63f8fd55dbc0f7fe0672770d",
-            "Pandhana": "63f8f7dcdbc0f7fe06721011",
-            "Pandhurna": "63f8f13ddbc0f7fe067191e4",
-            "Panna": "63f908fadbc0f7fe067321db",
-            "Pansemal": "63f8ea66dbc0f7fe067110aa",
-            "Parasia": "63f8f06cdbc0f7fe06718229",
-            "Paraswada": "63f8e984dbc0f7fe0670ff17",
-            "Patan": "6492b7fe882c8da84773709a",
-            "Patera": "63f8f1b3dbc0f7fe06719aa9",
-            "Pathari": "63f920badbc0f7fe0674eb68",
-            "Patharia": "63f8f204dbc0f7fe0671a0b6",
-            "Pati": "6492b7fd882c8da847737088",
-            "Pawai": "63f9096fdbc0f7fe06732bf2",
-            "Petlawad": "63f900b2dbc0f7fe0672814b",
-            "Pichhore": "63f919e9dbc0f7fe06747e87",
-            "Pichhore Or Dabra": "63f8f956dbc0f7fe06722ce6",
-            "Pipariya": "63f8fb42dbc0f7fe067250ec",
-            "Piploda": "63f90cdcdbc0f7fe06737374",
-            "Piprai": "63f8e88fdbc0f7fe0670ebda",
-            "Pithampur": "63f8f614dbc0f7fe0671edf4",
-            "Pohri": "63f9190ddbc0f7fe06746d28",
-            "Polaykala": "63f91871dbc0f7fe06746010",
-            "Porsa": "63f90664dbc0f7fe0672eafa",
-            "PrabhatPattan": "63f8ebf7dbc0f7fe06712f28",
-            "Prithvipur": "63f92285dbc0f7fe0675137b",
-            "Punasa": "63f8f7b1dbc0f7fe06720ce0",
-            "Pushparajgarh": "63f8e77edbc0f7fe0670d6bf",
-            "Raghogarh": "63f8f87cdbc0f7fe06721c73",
-            "Raghurajnagar Nagareey": "63f91424dbc0f7fe06740d15",
-            "Rahatgarh": "63f91119dbc0f7fe0673d03c",
-            "Raipur - Karchuliyan": "63f91008dbc0f7fe0673b916",
-            "Raipura": "63f909afdbc0f7fe067330ba",
-            "Raisen": "63f909d9dbc0f7fe06733421",
-            "Rajgarh": "6492b802882c8da8477370aa",
-            "Rajnagar": "6492b7fe882c8da847737094",
-            "Rajpur": "6492b7fd882c8da84773708a",
-            "Rama": "63f90146dbc0f7fe06728cbb",
-            "Ramnagar": "6492b803882c8da8477370b4",
-            "Rampur Baghelan": "63f9133cdbc0f7fe0673fc46",
-            "Rampur Naikin": "63f91a73dbc0f7fe06748884",
-            "Rampura": "63f908c6dbc0f7fe06731d37",
-            "Ranapur": "63f9012edbc0f7fe06728ade",
-            "Ranjhi": "63f8ff90dbc0f7fe06727ef7",
-            "Rannod": "63f91a63dbc0f7fe0674873e",
-            "Ratlam": "63f90daadbc0f7fe06738561",
-            "Ratlam Nagar": "63f90dc3dbc0f7fe067387a7",
-            "Rau": "63f8fc31dbc0f7fe0672626d",
-            "Rawti": "63f90d93dbc0f7fe0673838e",
-            "Rehatgaon": "63f8fa5ddbc0f7fe067240a1",
-            "Rehli": "63f91182dbc0f7fe0673d973",
-            "Rehti": "63f9155ddbc0f7fe06742271",
-            "Rithi": "63f90172dbc0f7fe06729054",
-            "Ron": "63f8ecd6dbc0f7fe06713f69",
-            "Sabalgarh": "63f90700dbc0f7fe0672f610",
-            "Sagar": "6492b803882c8da8477370b2",
-            "Sagar Nagar": "63f91229dbc0f7fe0673e7ca",
-            "Saikheda": "63f90812dbc0f7fe06730da7",
-            "Sailana": "63f90d3fdbc0f7fe06737c2d",
-            "Sanawad": "63f903d0dbc0f7fe0672bb1e",
-            "Sarai": "63f9214cdbc0f7fe0674f808",
-            "Sarangpur": "63f90c3adbc0f7fe0673654e",
-            "Sardarpur": "63f8f4d6dbc0f7fe0671d626",
-            "Satwas": "63f8f406dbc0f7fe0671c6d0",
-            "Sausar": "63f8f0f0dbc0f7fe06718c27",
-            "Sawer": "63f8fbbddbc0f7fe067259f4",
-            "Segaon": "63f90329dbc0f7fe0672ae47",
-            "Sehore": "63f91444dbc0f7fe06740f3f",
-            "Sehore Nagar": "63f9157adbc0f7fe06742476",
-            "Semaria": "63f90ec2dbc0f7fe06739d61",
-            "Sendhwa": "63f8ea96dbc0f7fe0671143c",
-            "Seondha": "63f8f2ccdbc0f7fe0671af81",
-            "Seoni": "63f9168edbc0f7fe067437bc",
-            "Seoni Malwa": "6492b7ff882c8da8477370a0",
-            "Seoni Nagar": "63f91711dbc0f7fe067442d0",
-            "Seoni-Malwa": "63f8fa81dbc0f7fe067242f3",
-            "Shadhora": "63f8e834dbc0f7fe0670e4c5",
-            "Shahgarh": "63f910fbdbc0f7fe0673cdb5",
-            "Shahnagar": "63f9098bdbc0f7fe06732e4c",
-            "Shahpur": "6492b7fd882c8da84773708c",
-            "Shahpura": "6492b7fe882c8da847737096",
-            "Shajapur": "63f917e5dbc0f7fe06745492",
-            "Shamgarh": "63f905d0dbc0f7fe0672de33",
-            "Shamshabad": "63f92036dbc0f7fe0674e19c",
-            "Sheopur": "63f918aadbc0f7fe0674650f",
-            "Shivpuri": "63f91930dbc0f7fe06746ffa",
-            "Shivpuri nagar": "63f91a72dbc0f7fe0674887b",
-            "Shujalpur": "63f9183adbc0f7fe06745b50",
-            "Shyampur": "63f9146bdbc0f7fe06741248",
-            "Sihawal": "63f91b0cdbc0f7fe067491db",
-            "Sihora": "63f8fc37dbc0f7fe067262e9",
-            "Silwani": "63f90abfdbc0f7fe06734832",
-            "Simariya": "63f909c7dbc0f7fe067332dd",
-            "Singoli": "63f90842dbc0f7fe067311f9",
-            "Singrauli": "63f92139dbc0f7fe0674f667",
-            "Singrauli Nagar": "63f9217adbc0f7fe0674fc21",
-            "Sirali": "63f8fa00dbc0f7fe06723978",
-            "Sirmour": "63f90e51dbc0f7fe067393da",
-            "Sironj": "63f91edddbc0f7fe0674d148",
-            "Sitamau": "63f9060ddbc0f7fe0672e3a7",
-            "Sleemnbad": "63f9024edbc0f7fe06729eeb",
-            "Sohagpur": "6492b805882c8da8477370b6",
-            "Sondawa": "63f921d4dbc0f7fe06750452",
-            "Sonkatch": "63f8f39cdbc0f7fe0671beb9",
-            "Sultanpur": "6492b802882c8da8477370a8",
-            "Susner": "63f921f7dbc0f7fe067506f4",
-            "Suthaliya": "63f90caadbc0f7fe06736f13",
-            "Suwasara": "63f90638dbc0f7fe0672e705",
-            "Tal": "63f90d2cdbc0f7fe06737a78",
-            "Tamia": "63f8ef63dbc0f7fe06716f69",
-            "Tansen": "63f8f9bddbc0f7fe067234d7",
-            "Tarana": "63f91cfddbc0f7fe0674b397",
-            "Tendukheda": "6492b800882c8da8477370a2",
-            "Teonthar": "63f90dd0dbc0f7fe067388c8",
-            "Thandla": "63f8ff97dbc0f7fe06727f19",
-            "Thikri": "63f8ea32dbc0f7fe06710cb9",
-            "Tikamgarh": "63f91c30dbc0f7fe0674a581",
-            "Timarni": "63f8fa4edbc0f7fe06723f6e",
-            "Tirodi": "63f8e8badbc0f7fe0670ef28",
-            "Tonk Khurd": "63f8f37ddbc0f7fe0671bc8c",
-            "Tyonda": "63f92008dbc0f7fe0674dde2",
-            "Udainagar": "63f8f48cdbc0f7fe0671d09c",
-            "Udaipura": "63f90af6dbc0f7fe06734d25",
-            "Ujjain": "63f91d19dbc0f7fe0674b5dd",
-            "Umreth": "63f8f087dbc0f7fe06718442",
-            "Unchahara": "63f912fcdbc0f7fe0673f7ad",
-            "Varla": "63f8eaacdbc0f7fe06711605",
-            "Vidisha": "63f92084dbc0f7fe0674e797",
-            "Vidisha Nagar": "63f920c9dbc0f7fe0674ecb9",
-            "Vijaypur": "6492b805882c8da8477370ba",
-            "Vijayraghavgarh": "63f901badbc0f7fe067295c1",
-            "Waraseoni": "63f8e8cbdbc0f7fe0670f097",
-            "KHARGON(WEST NIMAR)": "63f90272dbc0f7fe0672a1cd",
-            "KHANDWA (EAST NIMAR)": "63f8f73bdbc0f7fe067203d1",
-            "REWA": "63f90dd0dbc0f7fe067388c5",
-            "KATNI": "63f90164dbc0f7fe06728f2d",
-            "SATNA": "63f9122fdbc0f7fe0673e852",
-            "BHOPAL": "63f8ed36dbc0f7fe0671465f",
-            "SHAHDOL": "63f91720dbc0f7fe06744411",
-            "GWALIOR": "63f8f94edbc0f7fe06722c37",
-            "NARMADAPURAM": "63f8fa80dbc0f7fe067242f0",
-            "UMARIA": "63f91dc3dbc0f7fe0674c059",
-            "SIDHI": "63f91a73dbc0f7fe06748881",
-            "NARSINGHPUR": "63f90732dbc0f7fe0672fa6e",
-            "AGAR MALWA": "63f921f6dbc0f7fe067506f1"
-        },
-        "63f9322a89d86ca9e2bca5df": {
-            "Achalpur": "63f934cb89d86ca9e2bce283",
-            "Aheri": "63f93d9689d86ca9e2bdaf42",
-            "Ahmadpur": "63f9427989d86ca9e2be2203",
-            "Ajra": "63f9420589d86ca9e2be1789",
-            "Akkalkot": "63f9523689d86ca9e2bf8f45",
-            "Akkalkuwa": "63f9461f89d86ca9e2be77b2",
-            "Akola": "63f933e289d86ca9e2bccd83",
-            "Akole": "63f9322b89d86ca9e2bca5e5",
-            "Akot": "63f933a189d86ca9e2bcc78c",
-            "Akrani": "63f9464789d86ca9e2be7b79",
-            "Alibag": "63f94c1b89d86ca9e2bf03b5",
-            "Amalner": "63f93fda89d86ca9e2bde49b",
-            "Ambad": "63f940e489d86ca9e2bdfcec",
-            "Ambarnath": "63f952e989d86ca9e2bf9f7a",
-            "Ambegaon": "63f949fa89d86ca9e2bed1f2",
-            "Ambejogai": "63f9384889d86ca9e2bd32b5",
-            "Amgaon": "63f93e2b89d86ca9e2bdbcf0",
-            "Amravati": "63f9357089d86ca9e2bcf15b",
-            "Andheri": "63f9431689d86ca9e2be307a",
-            "Anjangaon Surji": "63f934ae89d86ca9e2bce001",
-            "Ardhapur": "63f9453489d86ca9e2be623f",
-            "Arjuni Morgaon": "63f93e6689d86ca9e2bdc27d",
-            "Armori": "63f93c7e89d86ca9e2bd9583",
-            "Arni": "63f9561489d86ca9e2bfe8ad",
-            "Arvi": "63f9536889d86ca9e2bfaae0",
-            "Ashti": "6492b809882c8da8477370e6",
-            "Atpadi": "63f94ed189d86ca9e2bf42ea",
-            "Aundha (Nagnath)": "63f93ee189d86ca9e2bdcd9d",
-            "Aurangabad": "63f9369089d86ca9e2bd0b2f",
-            "Ausa": "63f942b789d86ca9e2be27d3",
-            "Babulgaon": "63f9552589d86ca9e2bfd332",
-            "Badnapur": "63f940d189d86ca9e2bdfb3c",
-            "Baglan": "63f9473089d86ca9e2be90ad",
-            "Balapur": "6492b806882c8da8477370c4",
-            "Ballarpur": "63f93b8a89d86ca9e2bd7eca",
-            "Baramati": "63f94b3589d86ca9e2beeed0",
-            "Barshi": "63f9518789d86ca9e2bf8008",
-            "Barshitakli": "63f9344a89d86ca9e2bcd6ad",
-            "Beed": "63f937d889d86ca9e2bd285f",
-            "Bhadgaon": "63f9401289d86ca9e2bde9e0",
-            "Bhadravati": "63f93b2c89d86ca9e2bd7609",
-            "Bhamragad": "63f93d7b89d86ca9e2bdacc0",
-            "Bhandara": "63f9389989d86ca9e2bd39d4",
-            "Bhatkuli": "63f9359389d86ca9e2bcf446",
-            "Bhiwandi": "63f9526a89d86ca9e2bf93d8",
-            "Bhiwapur": "63f944b189d86ca9e2be5644",
-            "Bhokar": "63f9456389d86ca9e2be669b",
-            "Bhokardan": "63f9407a89d86ca9e2bdf35e",
-            "Bhor": "63f94b0b89d86ca9e2beeae6",
-            "Bhudargad": "63f941ec89d86ca9e2be154d",
-            "Bhum": "63f9489789d86ca9e2beb19c",
-            "Bhusawal": "63f93f9a89d86ca9e2bddeb2",
-            "Biloli": "63f9458d89d86ca9e2be6a7f",
-            "Bodvad": "63f93f8f89d86ca9e2bdddac",
-            "Borivali": "63f9432289d86ca9e2be318c",
-            "Brahmapuri": "63f93adc89d86ca9e2bd6edd",
-            "Buldana": "63f93a0f89d86ca9e2bd5c03",
-            "Chakur": "63f9429c89d86ca9e2be254a",
-            "Chalisgaon": "63f9402189d86ca9e2bdeb1d",
-            "Chamorshi": "63f93d1789d86ca9e2bda396",
-            "Chandgad": "63f9422d89d86ca9e2be1b4d",
-            "Chandrapur": "6492b807882c8da8477370ce",
-            "Chandur Railway": "63f935f589d86ca9e2bcfd43",
-            "Chandurbazar": "63f934f489d86ca9e2bce627",
-            "Chandvad": "63f9478a89d86ca9e2be98fb",
-            "Chikhaldara": "63f9348c89d86ca9e2bcdcda",
-            "Chikhli": "6492b807882c8da8477370cc",
-            "Chimur": "63f93a8989d86ca9e2bd6718",
-            "Chiplun": "63f94d9e89d86ca9e2bf26e3",
-            "Chopda": "63f93f3a89d86ca9e2bdd5de",
-            "Dahanu": "63f956df89d86ca9e2bffb25",
-            "Dapoli": "63f94d4c89d86ca9e2bf1f84",
-            "Darwha": "63f9558189d86ca9e2bfdb74",
-            "Daryapur": "63f935b189d86ca9e2bcf70e",
-            "Daund": "63f94ac489d86ca9e2bee469",
-            "Deglur": "63f9460889d86ca9e2be7592",
-            "Deola": "63f9472689d86ca9e2be8fc5",
-            "Deolgaon Raja": "63f93a2589d86ca9e2bd5e08",
-            "Deoli": "6492b80a882c8da8477370e8",
-            "Deoni": "63f942f789d86ca9e2be2d90",
-            "Deori": "6492b808882c8da8477370d4",
-            "Desaiganj (Vadasa)": "63f93c7689d86ca9e2bd94be",
-            "Devgad": "63f950a989d86ca9e2bf6c65",
-            "Dhamangaon Railway": "63f9360989d86ca9e2bcff1b",
-            "Dhanora": "6492b807882c8da8477370d2",
-            "Dharangaon": "63f93fc689d86ca9e2bde2d7",
-            "Dharashiv": "63f948cb89d86ca9e2beb666",
-            "Dharmabad": "63f9458289d86ca9e2be6965",
-            "Dharni": "63f9346c89d86ca9e2bcd9e0",
-            "Dharur": "6492b806882c8da8477370c8",
-            "Dhule": "63f93c5389d86ca9e2bd9168",
-            "Digras": "63f955a389d86ca9e2bfde64",
-            "Dindori": "6492b808882c8da8477370d8",
-            "Dodamarg": "63f9514689d86ca9e2bf7a15",
-            "Erandol": "63f93fb989d86ca9e2bde190",
-            "Etapalli": "63f93d5289d86ca9e2bda8ea",
-            "Gadchiroli": "63f93cfd89d86ca9e2bda119",
-            "Gadhinglaj": "63f9421989d86ca9e2be197a",
-            "Gaganbawada": "63f941b689d86ca9e2be103d",
-            "Gangakhed": "63f9499689d86ca9e2bec8d8",
-            "Gangapur": "6492b806882c8da8477370c6",
-            "Georai": "63f9378f89d86ca9e2bd21fb",
-            "Ghansawangi": "63f9410189d86ca9e2bdffa0",
-            "Ghatanji": "63f9562b89d86ca9e2bfeada",
-            "Gondiya": "63f93e0b89d86ca9e2bdba05",
-            "Gondpipri": "63f93bd189d86ca9e2bd8580",
-            "Goregaon": "63f93df589d86ca9e2bdb81e",
-            "Guhagar": "63f94dc189d86ca9e2bf2a2d",
-            "Hadgaon": "63f9451789d86ca9e2be5f9a",
-            "Hatkanangle": "63f9418289d86ca9e2be0b64",
-            "Haveli": "6492b808882c8da8477370da",
-            "Himayatnagar": "63f9450989d86ca9e2be5e44",
-            "Hinganghat": "63f9540589d86ca9e2bfb8f1",
-            "Hingna": "63f9443b89d86ca9e2be4b80",
-            "Hingoli": "63f93ec089d86ca9e2bdcab2",
-            "Igatpuri": "63f9481489d86ca9e2bea5a6",
-            "Indapur": "63f94b4f89d86ca9e2bef125",
-            "Jafrabad": "6492b808882c8da8477370d6",
-            "Jalgaon": "63f93fa589d86ca9e2bddfc2",
-            "Jalgaon (Jamod)": "63f9392489d86ca9e2bd4659",
-            "Jalkot": "63f9429289d86ca9e2be2462",
-            "Jalna": "63f940b189d86ca9e2bdf86a",
-            "Jamkhed": "63f9337889d86ca9e2bcc3b7",
-            "Jamner": "63f9405989d86ca9e2bdf053",
-            "Jaoli": "63f9500d89d86ca9e2bf5eb8",
-            "Jat": "63f94f0c89d86ca9e2bf481a",
-            "Jawhar": "63f9571989d86ca9e2c00097",
-            "Jintur": "63f9493289d86ca9e2bebfd2",
-            "Jiwati": "63f93ba889d86ca9e2bd81b2",
-            "Junnar": "63f949d189d86ca9e2bece53",
-            "Kadegaon": "63f94eb689d86ca9e2bf405e",
-            "Kagal": "63f941da89d86ca9e2be13a2",
-            "Kaij": "63f9380a89d86ca9e2bd2cfd",
-            "Kalamb": "6492b80a882c8da8477370f0",
-            "Kalameshwar": "63f9437189d86ca9e2be38ec",
-            "Kalamnuri": "63f93efb89d86ca9e2bdd001",
-            "Kalwan": "63f9470489d86ca9e2be8ccb",
-            "Kalyan": "63f952cf89d86ca9e2bf9d00",
-            "Kamptee": "63f943fd89d86ca9e2be45c6",
-            "Kandhar": "63f945d089d86ca9e2be7084",
-            "Kankavli": "63f950ca89d86ca9e2bf6f7a",
-            "Kannad": "63f9362289d86ca9e2bd015e",
-            "Karad": "63f9507989d86ca9e2bf6810",
-            "Karanja": "6492b80a882c8da8477370ea",
-            "Karjat": "6492b808882c8da8477370dc",
-            "Karmala": "63f9515389d86ca9e2bf7b4f",
-            "Karvir": "63f9419a89d86ca9e2be0da7",
-            "Katol": "63f9434989d86ca9e2be3539",
-            "Kavathemahankal": "63f94efe89d86ca9e2bf46ec",
-            "Kelapur": "63f9564689d86ca9e2bfed57",
-            "Khalapur": "63f94bd189d86ca9e2befcef",
-            "Khamgaon": "63f939a889d86ca9e2bd529a",
-            "Khanapur": "6492b808882c8da8477370e2",
-            "Khandala": "63f94f5789d86ca9e2bf4f07",
-            "Khatav": "63f94f9d89d86ca9e2bf550c",
-            "Khed": "6492b808882c8da8477370de",
-            "Khuldabad": "63f936be89d86ca9e2bd0f64",
-            "Kinwat": "63f944e289d86ca9e2be5ad2",
-            "Kopargaon": "63f9327c89d86ca9e2bcad14",
-            "Korchi": "63f93cb189d86ca9e2bd9a0a",
-            "Koregaon": "63f94fba89d86ca9e2bf57ca",
-            "Korpana": "63f93b9189d86ca9e2bd7f7b",
-            "Kudal": "63f9511689d86ca9e2bf75de",
-            "Kuhi": "63f9448689d86ca9e2be5250",
-            "Kurkheda": "63f93c9689d86ca9e2bd9788",
-            "Kurla": "63f9431c89d86ca9e2be30f9",
-            "Lakhandur": "63f9391189d86ca9e2bd4498",
-            "Lakhani": "6492b807882c8da8477370ca",
-            "Lanja": "63f94e3489d86ca9e2bf3479",
-            "Latur": "63f9425089d86ca9e2be1e58",
-            "Loha": "63f945b489d86ca9e2be6e0c",
-            "Lohara": "63f948ff89d86ca9e2bebb24",
-            "Lonar": "63f93a4c89d86ca9e2bd61a4",
-            "Madha": "63f9516d89d86ca9e2bf7db8",
-            "Mahabaleshwar": "63f94f2689d86ca9e2bf4a85",
-            "Mahad": "63f94cfa89d86ca9e2bf17f7",
-            "Mahagaon": "63f955fc89d86ca9e2bfe671",
-            "Mahur": "63f944d189d86ca9e2be5931",
-            "Majalgaon": "63f937b889d86ca9e2bd2590",
-            "Malegaon": "6492b80a882c8da8477370ec",
-            "Malkapur": "63f9397d89d86ca9e2bd4ea9",
-            "Malshiras": "63f951e189d86ca9e2bf87ae",
-            "Malwan": "63f950e289d86ca9e2bf718e",
-            "Man": "63f94f8289d86ca9e2bf52e9",
-            "Mandangad": "63f94d3689d86ca9e2bf1d61",
-            "Mangalvedhe": "63f9520f89d86ca9e2bf8bdb",
-            "Mangaon": "63f94c9a89d86ca9e2bf0f61",
-            "Mangrulpir": "63f9547a89d86ca9e2bfc374",
-            "Manora": "6492b80a882c8da8477370ee",
-            "Mantha": "63f9412e89d86ca9e2be03d7",
-            "Manwath": "63f9497489d86ca9e2bec5ad",
-            "Maregaon": "63f9568089d86ca9e2bff297",
-            "Mauda": "63f943e289d86ca9e2be434e",
-            "Mawal": "63f94a5789d86ca9e2beda8b",
-            "Mehkar": "63f939ca89d86ca9e2bd559e",
-            "Mhasla": "63f94ce789d86ca9e2bf164c",
-            "Miraj": "63f94eee89d86ca9e2bf4569",
-            "Mohadi": "63f9388189d86ca9e2bd37b6",
-            "Mohol": "63f951b289d86ca9e2bf83c7",
-            "Mokhada": "63f9573089d86ca9e2c002ba",
-            "Morshi": "63f9351a89d86ca9e2bce980",
-            "Motala": "63f9398e89d86ca9e2bd5031",
-            "Mudkhed": "63f9455789d86ca9e2be658b",
-            "Mukhed": "63f945eb89d86ca9e2be72ed",
-            "Muktainagar (Edlabad)": "63f93f7e89d86ca9e2bddc15",
-            "Mul": "63f93b6489d86ca9e2bd7b38",
-            "Mulchera": "63f93d4289d86ca9e2bda794",
-            "Mulshi": "63f94a7f89d86ca9e2bede48",
-            "Murbad": "63f952fe89d86ca9e2bfa166",
-            "Murtijapur": "63f9340d89d86ca9e2bcd17c",
-            "Murud": "63f94c4d89d86ca9e2bf083a",
-            "Nagar": "6492b806882c8da8477370c2",
-            "Nagbhid": "63f93ac089d86ca9e2bd6c29",
-            "Nagpur (Rural)": "63f9440e89d86ca9e2be4749",
-            "Nagpur (Urban)": "63f9442f89d86ca9e2be4a70",
-            "Naigaon (Khairgaon)": "63f945a189d86ca9e2be6c4d",
-            "Nanded": "63f9454289d86ca9e2be6381",
-            "Nandgaon": "63f9477489d86ca9e2be9700",
-            "Nandgaon-Khandeshwar": "63f935d389d86ca9e2bcfa1c",
-            "Nandura": "63f9396589d86ca9e2bd4c72",
-            "Nandurbar": "63f9469989d86ca9e2be82c8",
-            "Narkhed": "63f9432889d86ca9e2be3230",
-            "Nashik": "63f947fd89d86ca9e2bea388",
-            "Nawapur": "63f946b989d86ca9e2be85d1",
-            "Ner": "63f9550b89d86ca9e2bfd0ce",
-            "Nevasa": "63f932a489d86ca9e2bcb0ee",
-            "Nilanga": "63f942d289d86ca9e2be2a64",
-            "Niphad": "63f9484a89d86ca9e2beaaaf",
-            "Omarga": "63f9490989d86ca9e2bebc11",
-            "Pachora": "63f9403e89d86ca9e2bdedcc",
-            "Paithan": "63f9372589d86ca9e2bd1873",
-            "Palam": "63f949ad89d86ca9e2becae7",
-            "Palghar": "63f9576489d86ca9e2c00741",
-            "Palus": "63f94eaf89d86ca9e2bf3fad",
-            "Pandharpur": "63f951c989d86ca9e2bf85d1",
-            "Panhala": "63f9416589d86ca9e2be08e2",
-            "Panvel": "63f94b7c89d86ca9e2bef531",
-            "Paranda": "63f9488389d86ca9e2beafd3",
-            "Parbhani": "63f9495889d86ca9e2bec321",
-            "Parli": "63f9383289d86ca9e2bd30ab",
-            "Parner": "63f9332689d86ca9e2bcbc90",
-            "Parola": "63f93ffa89d86ca9e2bde7a4",
-            "Parseoni": "63f943a689d86ca9e2be3db4",
-            "Partur": "63f9411989d86ca9e2be01eb",
-            "Patan": "6492b809882c8da8477370e4",
-            "Pathardi": "63f932db89d86ca9e2bcb5a2",
-            "Pathri": "63f9497f89d86ca9e2bec6b8",
-            "Patoda": "63f9377289d86ca9e2bd1f4f",
-            "Patur": "63f9343489d86ca9e2bcd4bc",
-            "Pauni": "63f938ed89d86ca9e2bd416c",
-            "Pen": "63f94bf289d86ca9e2bf0002",
-            "Peth": "63f947c289d86ca9e2be9e3e",
-            "Phaltan": "63f94f6589d86ca9e2bf5058",
-            "Phulambri": "63f9367d89d86ca9e2bd0966",
-            "Poladpur": "63f94d2289d86ca9e2bf1ba5",
-            "Pombhurna": "63f93b7b89d86ca9e2bd7d65",
-            "Pune City": "63f94ac389d86ca9e2bee449",
-            "Purandhar": "63f94ada89d86ca9e2bee655",
-            "Purna": "63f949bd89d86ca9e2becc79",
-            "Pusad": "63f955b489d86ca9e2bfe000",
-            "Radhanagari": "63f941bf89d86ca9e2be1111",
-            "Rahta": "63f9328c89d86ca9e2bcaea1",
-            "Rahuri": "63f9331289d86ca9e2bcbaae",
-            "Rajapur": "6492b808882c8da8477370e0",
-            "Rajura": "63f93bba89d86ca9e2bd8353",
-            "Ralegaon": "63f9566389d86ca9e2bfeff2",
-            "Ramtek": "63f943c089d86ca9e2be4018",
-            "Ratnagiri": "63f94ddc89d86ca9e2bf2c91",
-            "Raver": "63f93f6689d86ca9e2bdd9ca",
-            "Renapur": "63f9426b89d86ca9e2be20ad",
-            "Risod": "63f954f589d86ca9e2bfcebd",
-            "Roha": "63f94c5d89d86ca9e2bf09b8",
-            "Sadak-Arjuni": "63f93e4f89d86ca9e2bdc05f",
-            "Sakoli": "63f938c289d86ca9e2bd3d82",
-            "Sakri": "6492b807882c8da8477370d0",
-            "Salekasa": "63f93e3c89d86ca9e2bdbe91",
-            "Samudrapur": "63f9542d89d86ca9e2bfbc9f",
-            "Sangameshwar": "63f94e0789d86ca9e2bf3099",
-            "Sangamner": "63f9325689d86ca9e2bca9ac",
-            "Sangole": "63f951fa89d86ca9e2bf89ea",
-            "Sangrampur": "63f9393d89d86ca9e2bd48bd",
-            "Satara": "63f94fda89d86ca9e2bf5a74",
-            "Savner": "63f9438889d86ca9e2be3b0a",
-            "Sawali": "63f93af989d86ca9e2bd719b",
-            "Sawantwadi": "63f9513389d86ca9e2bf7851",
-            "Seloo": "63f9539a89d86ca9e2bfaf88",
-            "Selu": "63f9491d89d86ca9e2bebdf5",
-            "Sengaon": "63f93ea289d86ca9e2bdc821",
-            "Shahade": "63f9467389d86ca9e2be7f42",
-            "Shahapur": "63f9529e89d86ca9e2bf988a",
-            "Shahuwadi": "63f9414689d86ca9e2be0610",
-            "Shegaon": "63f9395489d86ca9e2bd4ae0",
-            "Shevgaon": "63f932c389d86ca9e2bcb36b",
-            "Shirala": "63f94e8089d86ca9e2bf3b85",
-            "Shirol": "63f9418f89d86ca9e2be0c9c",
-            "Shirpur": "63f93be889d86ca9e2bd876e",
-            "Shirur": "63f94a1789d86ca9e2bed4ba",
-            "Shirur (Kasar)": "63f9378089d86ca9e2bd2087",
-            "Shirur Anantpal": "63f942ad89d86ca9e2be26e1",
-            "Shrigonda": "63f9334389d86ca9e2bcbf21",
-            "Shrirampur": "63f9329989d86ca9e2bcafd4",
-            "Shrivardhan": "63f94cd689d86ca9e2bf14c4",
-            "Sillod": "63f9366089d86ca9e2bd06d5",
-            "Sindewahi": "63f93b1189d86ca9e2bd73c8",
-            "Sindkhed Raja": "63f93a3389d86ca9e2bd5f59",
-            "Sindkhede": "63f93c0589d86ca9e2bd8a22",
-            "Sinnar": "63f9482e89d86ca9e2bea81e",
-            "Sironcha": "63f93dbd89d86ca9e2bdb2d2",
-            "Soegaon": "63f9364e89d86ca9e2bd0534",
-            "Solapur North": "63f951a589d86ca9e2bf82b7",
-            "Solapur South": "63f9522389d86ca9e2bf8d7c",
-            "Sonpeth": "63f9498b89d86ca9e2bec7d2",
-            "Sudhagad": "63f94c8489d86ca9e2bf0d57",
-            "Surgana": "63f946dc89d86ca9e2be890e",
-            "Tala": "63f94cc789d86ca9e2bf1369",
-            "Talasari": "63f956d789d86ca9e2bffa51",
-            "Talode": "63f9465d89d86ca9e2be7d6a",
-            "Tasgaon": "63f94edf89d86ca9e2bf440e",
-            "Telhara": "63f9338a89d86ca9e2bcc56e",
-            "Thane": "63f9525389d86ca9e2bf91e2",
-            "Tiosa": "63f9355b89d86ca9e2bcef6a",
-            "Tirora": "63f93ddb89d86ca9e2bdb5ab",
-            "Trimbakeshwar": "63f947e389d86ca9e2bea115",
-            "Tuljapur": "63f948e689d86ca9e2beb8de",
-            "Tumsar": "63f9386189d86ca9e2bd34c1",
-            "Udgir": "63f9430189d86ca9e2be2e91",
-            "Ulhasnagar": "63f952e989d86ca9e2bf9f73",
-            "Umarkhed": "63f955dd89d86ca9e2bfe3ae",
-            "Umred": "63f9445e89d86ca9e2be4e8e",
-            "Umri": "63f9457589d86ca9e2be6828",
-            "Uran": "63f94b6f89d86ca9e2bef3ea",
-            "Vaibhavvadi": "63f950be89d86ca9e2bf6e51",
-            "Vaijapur": "63f936cd89d86ca9e2bd10d3",
-            "Vasai": "63f9579689d86ca9e2c00ba3",
-            "Vasmath": "63f93f1a89d86ca9e2bdd2e7",
-            "Velhe": "63f94af089d86ca9e2bee85a",
-            "Vengurla": "63f9510489d86ca9e2bf7438",
-            "Vikramgad": "63f9570589d86ca9e2bffeba",
-            "Wada": "63f9573e89d86ca9e2c003e3",
-            "Wadwani": "63f937cf89d86ca9e2bd278b",
-            "Wai": "63f94f3d89d86ca9e2bf4cbc",
-            "Walwa": "63f94e9a89d86ca9e2bf3dbc",
-            "Wani": "63f956b489d86ca9e2bff70a",
-            "Wardha": "63f953c089d86ca9e2bfb2f5",
-            "Warora": "63f93a5f89d86ca9e2bd6379",
-            "Warud": "63f9353c89d86ca9e2bceca2",
-            "Washi": "63f948ab89d86ca9e2beb36f",
-            "Washim": "63f954d789d86ca9e2bfcc22",
-            "Yavatmal": "63f9556489d86ca9e2bfd8c0",
-            "Yawal": "63f93f5289d86ca9e2bdd824",
-            "Yevla": "63f9486889d86ca9e2bead63",
-            "Zari-Jamani": "63f9569b89d86ca9e2bff4ba",
-            "NAGPUR": "63f9432889d86ca9e2be322d",
-            "SANGLI": "63f94e8089d86ca9e2bf3b82",
-            "BULDHANA": "63f9392489d86ca9e2bd4656",
-            "AHILYANAGAR": "63f9322a89d86ca9e2bca5e2",
-            "Chhatrapati Sambhajinagar": "63f9362189d86ca9e2bd015b",
-            "SOLAPUR": "63f9515389d86ca9e2bf7b4c",
-            "KOLHAPUR": "63f9414689d86ca9e2be060d",
-            "RAIGAD": "63f94b6f89d86ca9e2bef3e7",
-            "PUNE": "63f949d189d86ca9e2bece50",
-            "SINDHUDURG": "63f950a889d86ca9e2bf6c62",
-            "GONDIA": "63f93ddb89d86ca9e2bdb5a8",
-            "MUMBAI SUBURBAN": "63f9431689d86ca9e2be3077"
-        },
-        "63f870acd2e83876f03f0b46": {
-            "BOROBEKRA": "63f8735dd2e83876f03f4abe",
-            "BUNGTE CHIRU": "63f872edd2e83876f03f40db",
-            "Bishnupur": "63f870b2d2e83876f03f0bdf",
-            "CHAMPHAI": "63f872f4d2e83876f03f4164",
-            "CHILIVAI PHAIBUNG": "63f87237d2e83876f03f3054",
-            "Chakpikarong": "63f870e0d2e83876f03f1051",
-            "Chandel": "63f870c3d2e83876f03f0d7f",
-            "Chingai": "63f8728ad2e83876f03f37e2",
-            "Churachandpur": "63f8714bd2e83876f03f1a3b",
-            "HENGLEP": "63f87192d2e83876f03f208d",
-            "Haochong": "63f87367d2e83876f03f4bb6",
-            "ISLAND": "63f872dad2e83876f03f3f2b",
-            "JESSAMI": "63f87295d2e83876f03f38ea",
-            "Jiribam": "63f8734cd2e83876f03f4936",
-            "KANGCHUP GELJANG": "63f87333d2e83876f03f46c4",
-            "KANGPOKPI": "63f872aed2e83876f03f3b0d",
-            "KANGVAI": "63f8716bd2e83876f03f1d2d",
-            "KHENGJOY": "63f8710cd2e83876f03f147c",
-            "Kakching": "63f8729fd2e83876f03f39b8",
-            "Kamjong": "63f873c9d2e83876f03f54a0",
-            "Kasom Khullen": "63f873d6d2e83876f03f55df",
-            "Keirao Bitra": "63f871fcd2e83876f03f2abb",
-            "Khoupum": "63f87364d2e83876f03f4b69",
-            "LHUNGTIN": "63f87342d2e83876f03f4824",
-            "LM": "63f87298d2e83876f03f3928",
-            "LONGMAI": "63f8736cd2e83876f03f4c08",
-            "Lamphelpat": "63f8721dd2e83876f03f2dc0",
-            "Lamsang": "63f87207d2e83876f03f2b9b",
-            "Lilong": "63f8726fd2e83876f03f3561",
-            "MOREH": "63f873b2d2e83876f03f5271",
-            "MUALNUAM": "63f871bcd2e83876f03f24a6",
-            "Machi": "63f87383d2e83876f03f4e3a",
-            "Moirang": "63f870b5d2e83876f03f0c2c",
-            "Nambol": "63f870acd2e83876f03f0b4c",
-            "Nungba": "63f8735dd2e83876f03f4ac7",
-            "Paomata": "63f87230d2e83876f03f2f92",
-            "Patsoi": "63f87216d2e83876f03f2d00",
-            "Phungyar": "63f873ced2e83876f03f551a",
-            "Porompat": "63f871e9d2e83876f03f28e3",
-            "Purul": "63f87235d2e83876f03f300c",
-            "SAHAMPHUNG": "63f873dfd2e83876f03f56bd",
-            "SAIKOT": "63f87186d2e83876f03f1fb4",
-            "SAIKUL": "63f87319d2e83876f03f44b0",
-            "SAMULAMLAN": "63f871c0d2e83876f03f2507",
-            "SANGAIKOT": "63f871a8d2e83876f03f22b0",
-            "SONG SONG": "63f8723bd2e83876f03f30b0",
-            "SUANGDOH": "63f871d0d2e83876f03f267b",
-            "Saitu-Gamphazol": "63f872b6d2e83876f03f3bd2",
-            "Sawombung": "63f871d6d2e83876f03f270b",
-            "Singngat": "63f8715cd2e83876f03f1bc8",
-            "T VAICHONG": "63f8730bd2e83876f03f4382",
-            "TADUBI": "63f87243d2e83876f03f3168",
-            "TUIBONG": "63f87121d2e83876f03f1683",
-            "Tamenglong": "63f87267d2e83876f03f3490",
-            "Tamenglong North": "63f8725ed2e83876f03f33c1",
-            "Tamenglong West": "63f8724fd2e83876f03f327f",
-            "Tengnoupal": "63f87396d2e83876f03f4fef",
-            "Thanlon": "63f87371d2e83876f03f4c9a",
-            "Thoubal": "63f87273d2e83876f03f35c7",
-            "Tipaimukh": "63f8736ed2e83876f03f4c3e",
-            "Ukhrul": "63f8728ed2e83876f03f3839",
-            "VANGAI RANGE": "63f8737bd2e83876f03f4d87",
-            "WAIKHONG": "63f872aad2e83876f03f3ab9",
-            "WILLONG": "63f8723ed2e83876f03f30f3",
-            "Wangoi": "63f87226d2e83876f03f2e8f",
-            "IMPHAL EAST": "63f871d6d2e83876f03f2708",
-            "PHERZAWL": "63f8736dd2e83876f03f4c3b",
-            "IMPHAL WEST": "63f87206d2e83876f03f2b98",
-            "SENAPATI": "63f87230d2e83876f03f2f8f",
-            "NONEY": "63f8735dd2e83876f03f4ac4"
-        },
-        "63f87562d2e83876f03f7a2c": {
-            "Adokgre": "6492b80a882c8da8477370f4",
-            "Amlarem": "63f876f8d2e83876f03f9e41",
-            "Baghmara": "63f8780cd2e83876f03fb70d",
-            "Bajengdoba": "63f87a19d2e83876f03fe842",
-            "Batabari": "6492b80b882c8da8477370f6",
-            "Betasing": "63f87a9fd2e83876f03ff65d",
-            "Bhoirymbong": "63f8778dd2e83876f03faa99",
-            "Chokpot": "63f877aad2e83876f03fad68",
-            "Dadenggiri": "63f8788cd2e83876f03fc1dd",
-            "Dalu": "63f87904d2e83876f03fce42",
-            "Dambo Rongjeng": "63f87562d2e83876f03f7a32",
-            "Demdema": "63f87929d2e83876f03fd1e6",
-            "Gambegre": "63f878ebd2e83876f03fcb93",
-            "Gasuapara": "63f877ead2e83876f03fb373",
-            "Jirang": "63f8773ad2e83876f03fa4c8",
-            "Kharkutta": "63f879f6d2e83876f03fe4b2",
-            "Khatarshnong Laitkroh": "63f87616d2e83876f03f8b2c",
-            "Laskein": "63f876e4d2e83876f03f9c4b",
-            "Lumshnong": "6492b80a882c8da8477370f2",
-            "Mairang": "63f87b2ed2e83876f040023d",
-            "Mawkynrew": "63f87608d2e83876f03f89c2",
-            "Mawkyrwat": "63f87a82d2e83876f03ff32a",
-            "Mawlai": "63f8768bd2e83876f03f9610",
-            "Mawpat": "63f87690d2e83876f03f968f",
-            "Mawphlang": "63f875d3d2e83876f03f8507",
-            "Mawryngkneng": "63f875f7d2e83876f03f8880",
-            "Mawshynrut": "63f87943d2e83876f03fd47e",
-            "Mawsynram": "63f8762cd2e83876f03f8d27",
-            "Mawthadraishan": "63f87b21d2e83876f0400119",
-            "Mylliem": "63f875ebd2e83876f03f875c",
-            "Namdong": "6492b80b882c8da8477370f8",
-            "Nongstoin": "63f8797fd2e83876f03fdac5",
-            "Pynursla": "63f8766cd2e83876f03f9302",
-            "RERAPARA": "63f87b03d2e83876f03ffe04",
-            "Rambrai": "6492b80b882c8da8477370fa",
-            "Ranikor": "63f87a61d2e83876f03feff4",
-            "Resubelpara": "63f879b6d2e83876f03fe05f",
-            "Ri Muliang": "6492b80b882c8da8477370fc",
-            "Rongara": "63f8782dd2e83876f03fba6b",
-            "Rongram": "63f878c6d2e83876f03fc7f4",
-            "Saipung": "63f87a51d2e83876f03fee10",
-            "Samanda": "63f875b1d2e83876f03f81b6",
-            "Selsella": "63f8785fd2e83876f03fbd3a",
-            "Shallang": "6492b80b882c8da8477370fe",
-            "Shella Bholaganj": "63f8764cd2e83876f03f900d",
-            "Sohiong": "63f87696d2e83876f03f9736",
-            "Songsak": "63f8758dd2e83876f03f7e21",
-            "Thadlaskein": "63f876c7d2e83876f03f99c9",
-            "Tikrikilla": "63f878a1d2e83876f03fc3f6",
-            "Umling": "63f8770bd2e83876f03fa043",
-            "Umsning": "63f87761d2e83876f03fa704",
-            "WAPUNG": "63f87a3cd2e83876f03febcf",
-            "Zikzak": "63f87abbd2e83876f03ff91b",
-            "WEST GARO HILLS": "63f8785fd2e83876f03fbd37",
-            "EAST KHASI HILLS": "63f875d3d2e83876f03f8504",
-            "WEST JAINTIA HILLS": "63f876c7d2e83876f03f99c6",
-            "WEST KHASI HILLS": "63f87943d2e83876f03fd47b",
-            "EAST GARO HILLS": "63f87562d2e83876f03f7a2f",
-            "RI BHOI": "63f8770bd2e83876f03fa040",
-            "EASTERN WEST KHASI HILLS": "63f87b21d2e83876f0400116",
-            "EAST JAINTIA HILLS": "63f87a3cd2e83876f03febcc"
-        },
-        "63f873e5d2e83876f03f573a": {
-            "'N' Thingdawl": "63f87402d2e83876f03f59e9",
-            "Aibawk": "63f873efd2e83876f03f5811",
-            "Bilkhawthlir": "63f87406d2e83876f03f5a4a",
-            "Champhai": "63f873f5d2e83876f03f58ad",
-            "Chawngte": "63f8740ed2e83876f03f5b07",
-            "Darlawn": "63f873e9d2e83876f03f5783",
-            "East Lungdar": "63f87486d2e83876f03f65e2",
-            "Hnahthial": "63f87488d2e83876f03f6622",
-            "Khawbung": "63f873fcd2e83876f03f5968",
-            "Khawzawl": "63f87497d2e83876f03f67a8",
-            "Lawngtlai": "63f87420d2e83876f03f5cc1",
-            "Lunglei": "63f87445d2e83876f03f6010",
-            "Lungsen": "63f8743bd2e83876f03f5f28",
-            "Ngopa": "63f87495d2e83876f03f6763",
-            "Phullen": "63f8748ed2e83876f03f66c6",
-            "Reiek": "63f87464d2e83876f03f62c5",
-            "S' Bungtlang": "63f8742ad2e83876f03f5d9f",
-            "Saiha": "63f87472d2e83876f03f6410",
-            "Sangau": "63f87430d2e83876f03f5e32",
-            "Serchhip": "63f8747dd2e83876f03f6509",
-            "Thingsulthliah": "63f873f3d2e83876f03f5877",
-            "Tlangnuam": "63f873e5d2e83876f03f5740",
-            "Tuipang": "63f87469d2e83876f03f6332",
-            "West Bunghmun": "63f87435d2e83876f03f5ea4",
-            "West Phaileng": "63f8745ad2e83876f03f621e",
-            "Zawlnuam": "63f87450d2e83876f03f6136",
-            "KOLASIB": "63f87402d2e83876f03f59e6",
-            "AIZAWL": "63f873e5d2e83876f03f573d",
-            "MAMIT": "63f87450d2e83876f03f6133"
-        },
-        "63f86f4dd2e83876f03eea29": {
-            "Aboi": "63f86f9dd2e83876f03ef15f",
-            "Aghunato": "63f87014d2e83876f03efcdd",
-            "Aitepyong": "63f86fead2e83876f03ef8b7",
-            "Akuhaito": "63f87020d2e83876f03efe0a",
-            "Akuluto": "63f87009d2e83876f03efbce",
-            "Alongkima": "63f86f76d2e83876f03eedb9",
-            "Amahator": "63f87050d2e83876f03f0273",
-            "Angjangyang": "63f86fa6d2e83876f03ef23e",
-            "Aquqhnaqua": "63f86f4dd2e83876f03eea2f",
-            "Asuto": "63f8700fd2e83876f03efc6d",
-            "Athibung": "63f8703dd2e83876f03f008a",
-            "Atoizu": "63f8701cd2e83876f03efdb8",
-            "Baghty": "63f86ff3d2e83876f03ef997",
-            "Bhandari": "63f86fecd2e83876f03ef8e1",
-            "Botsa": "63f86f65d2e83876f03eec52",
-            "CHUNLIKHA": "63f8708ad2e83876f03f0833",
-            "Changpang": "63f86fe5d2e83876f03ef847",
-            "Changtongya": "63f86f7bd2e83876f03eee2b",
-            "Chare": "63f86fd0d2e83876f03ef640",
-            "Chen": "63f86fa3d2e83876f03ef200",
-            "Chessore": "63f86fe1d2e83876f03ef7e2",
-            "Chetheba": "63f86fc0d2e83876f03ef4b8",
-            "Chiephobozou": "63f86f60d2e83876f03eebec",
-            "Chingmei": "63f86fddd2e83876f03ef77d",
-            "Chizami": "63f86fc8d2e83876f03ef56c",
-            "Chozuba": "63f86fbed2e83876f03ef493",
-            "Chuchuyimlang": "63f86f7dd2e83876f03eee5f",
-            "Chukitong": "63f87005d2e83876f03efb69",
-            "Chumukedima": "63f8708bd2e83876f03f0841",
-            "Dhansiripar": "63f87096d2e83876f03f0956",
-            "Dimapur Sadar": "63f86f5dd2e83876f03eebb1",
-            "Englan": "63f87003d2e83876f03efb3f",
-            "Ghathashi": "63f87024d2e83876f03efe68",
-            "Hunta": "63f86f92d2e83876f03ef062",
-            "Jakhama": "63f86f6ad2e83876f03eecc4",
-            "Jalukie": "63f87037d2e83876f03f000b",
-            "KIKRUMA": "63f86fcbd2e83876f03ef5ac",
-            "Kebai Khelma": "63f87043d2e83876f03f0122",
-            "Kezocha": "63f86f68d2e83876f03eec90",
-            "Khezhakeno": "63f86fc7d2e83876f03ef565",
-            "Khongsa": "63f87065d2e83876f03f0487",
-            "Khuza": "63f86fb8d2e83876f03ef3e6",
-            "Kiphire Sadar": "63f87053d2e83876f03f02bb",
-            "Kiusam": "63f87056d2e83876f03f030d",
-            "Kohima Sadar": "63f86f6cd2e83876f03eecf8",
-            "Kubolong": "63f86f7fd2e83876f03eee98",
-            "Kuhoboto": "63f86f55d2e83876f03eeaf4",
-            "Longchem": "63f86f72d2e83876f03eed62",
-            "Longkhim": "63f86fd4d2e83876f03ef68d",
-            "Longleng": "63f8706fd2e83876f03f0590",
-            "Longmatra": "63f8705bd2e83876f03f0393",
-            "Longshen": "63f86f9fd2e83876f03ef1a2",
-            "Lotsu": "63f86ff8d2e83876f03efa15",
-            "Mangko": "63f86fe4d2e83876f03ef82f",
-            "Mangkolemba": "63f86f82d2e83876f03eeecc",
-            "Medziphema": "63f8709dd2e83876f03f09f3",
-            "Meluri": "63f86fb8d2e83876f03ef3fc",
-            "Merangmen": "63f86f85d2e83876f03eef23",
-            "Mon Sadar": "63f86f95d2e83876f03ef0a2",
-            "Monyakshu": "63f86fadd2e83876f03ef2f8",
-            "Mopong": "63f86fa8d2e83876f03ef272",
-            "Naginimora": "63f86f8cd2e83876f03eefcd",
-            "Namsang": "63f8706bd2e83876f03f0523",
-            "Ngoungchung": "63f86fd8d2e83876f03ef6ff",
-            "Nihokhu": "63f86f5bd2e83876f03eeb7d",
-            "Niuland": "63f870a4d2e83876f03f0a97",
-            "Nokhu": "63f8707ad2e83876f03f06a6",
-            "Noklak": "63f87076d2e83876f03f0636",
-            "Noksen": "63f86fccd2e83876f03ef5d5",
-            "Nsong": "63f87045d2e83876f03f0156",
-            "ONGPANGKONG (N)": "63f86f8cd2e83876f03eefbd",
-            "Ongpangkong": "63f86f88d2e83876f03eef57",
-            "Panso": "63f8707cd2e83876f03f06c6",
-            "Pedi (Ngwalwa)": "63f87034d2e83876f03effc3",
-            "Peren": "63f8704bd2e83876f03f01eb",
-            "Pfutsero": "63f86fc4d2e83876f03ef51b",
-            "Phek Sadar": "63f86fb4d2e83876f03ef380",
-            "Phokhungri": "63f86fbdd2e83876f03ef469",
-            "Phomching": "63f86fa0d2e83876f03ef1bd",
-            "Phor": "63f86fbbd2e83876f03ef444",
-            "Pughoboto": "63f87021d2e83876f03efe2f",
-            "Pungro": "63f8705ed2e83876f03f03db",
-            "Ralan": "63f86ff9d2e83876f03efa35",
-            "Razieba": "63f86fc9d2e83876f03ef596",
-            "Sakraba": "63f86fc2d2e83876f03ef4e7",
-            "Sakshi": "63f87074d2e83876f03f0600",
-            "Sangsangnyu": "63f86fd9d2e83876f03ef71f",
-            "Sanis": "63f86ff5d2e83876f03ef9dc",
-            "Saptiqa": "63f8702ed2e83876f03eff34",
-            "Satakha": "63f87028d2e83876f03efeba",
-            "Satoi": "63f8702fd2e83876f03eff40",
-            "Sechu-Zubza": "63f86f6dd2e83876f03eed09",
-            "Sekruzu": "63f86fb0d2e83876f03ef333",
-            "Seyochung": "63f8704ed2e83876f03f023a",
-            "Shamator": "63f86fded2e83876f03ef798",
-            "Shangnyu": "63f86f94d2e83876f03ef08c",
-            "Sitimi": "63f87057d2e83876f03f0332",
-            "Sotokur": "63f86fdcd2e83876f03ef75d",
-            "Sungro": "63f86ff3d2e83876f03ef9a8",
-            "Suruhuto": "63f8700bd2e83876f03efc07",
-            "TOKIYE": "63f87031d2e83876f03eff79",
-            "TSURANGKONG": "63f86f8cd2e83876f03eefc4",
-            "Tamlu": "63f87068d2e83876f03f04cc",
-            "Tening": "63f87046d2e83876f03f0176",
-            "Thonoknyu": "63f8707ed2e83876f03f06fa",
-            "Tizit": "63f86f8dd2e83876f03eefe8",
-            "Tobu": "63f86faad2e83876f03ef2a1",
-            "Tseminyu": "63f87081d2e83876f03f0753",
-            "Tsogin": "63f87089d2e83876f03f080e",
-            "Tsurungto": "63f86fe0d2e83876f03ef7d6",
-            "Tuensang Sadar": "63f86fd6d2e83876f03ef6d5",
-            "Tuli": "63f86f78d2e83876f03eedd9",
-            "V.K.": "63f87007d2e83876f03efb9f",
-            "WEZIHO": "63f86fcbd2e83876f03ef5b3",
-            "Wakching": "63f86f9ad2e83876f03ef117",
-            "Wokha Sadar": "63f86fffd2e83876f03efad4",
-            "Wozhuro": "63f86ffcd2e83876f03efa8c",
-            "Yongnyah": "63f8706cd2e83876f03f0543",
-            "Zuketsa": "63f86fc6d2e83876f03ef54a",
-            "Zunheboto Sadar": "63f87018d2e83876f03efd43",
-            "MOKOKCHUNG": "63f86f72d2e83876f03eed5f",
-            "MON": "63f86f8cd2e83876f03eefca",
-            "DIMAPUR": "63f86f4dd2e83876f03eea2c",
-            "KIPHIRE": "63f8704ed2e83876f03f0237",
-            "PHEK": "63f86fafd2e83876f03ef330",
-            "WOKHA": "63f86fe5d2e83876f03ef844",
-            "ZUNHEBOTO": "63f87007d2e83876f03efb9c",
-            "TUENSANG": "63f86fccd2e83876f03ef5d2",
-            "KOHIMA": "63f86f60d2e83876f03eebe9",
-            "Chumoukedima": "63f8708bd2e83876f03f083e"
-        },
-        "63f8bb7b36497c055ce5624b": {
-            "ARJYAPALLI MARINE": "63f8efcd76742aaa3ce39798",
-            "ASIKA": "63f8eee276742aaa3ce38483",
-            "Aali": "63f8f88376742aaa3ce45d86",
-            "Abhyachandpur": "63f8f10976742aaa3ce3b426",
-            "Adava": "63f8eca576742aaa3ce35205",
-            "Agarpada": "63f8e6c676742aaa3ce2ca66",
-            "Ainthapali": "63f90d6276742aaa3ce5e8da",
-            "Airfield (Kapila Prasad)": "63f8fbf576742aaa3ce4ab04",
-            "Ambabhona": "63f8e69e76742aaa3ce2c69b",
-            "Ambadala": "63f90aa876742aaa3ce5aa17",
-            "Anandapur": "63f8faf276742aaa3ce49493",
-            "Andirakanch": "63f90bd376742aaa3ce5c716",
-            "Anugul": "63f8bc5b36497c055ce57243",
-            "Astaranga": "63f909cd76742aaa3ce59568",
-            "Athagad": "63f8e98276742aaa3ce30a30",
-            "Athmallik": "63f8bcfc36497c055ce57d7b",
-            "Attabira": "63f8e6b476742aaa3ce2c8cd",
-            "BADAGADA": "63f8eea176742aaa3ce37ef5",
-            "BHANJANAGAR": "63f8ee4e76742aaa3ce37792",
-            "BODEN": "63f9090276742aaa3ce58489",
-            "BRAHMAPUR SADAR": "63f8f03d76742aaa3ce3a17a",
-            "BUGUDA": "63f8ee2776742aaa3ce37400",
-            "Badachana": "63f8f31b76742aaa3ce3e25c",
-            "Badamba": "63f8e92d76742aaa3ce30230",
-            "Badampahar": "63f9033f76742aaa3ce50c12",
-            "Badmal": "63f8f3c976742aaa3ce3f1d0",
-            "Bahalda": "63f9028376742aaa3ce4fc91",
-            "Baidyeswar": "63f8e94a76742aaa3ce304fd",
-            "Baisinga": "63f9050976742aaa3ce53226",
-            "Balangir": "63f8bdbd36497c055ce58ab8",
-            "Balaramgadi Marine": "63f8e4a276742aaa3ce297ae",
-            "Baleshwar (M)": "63f8e5c376742aaa3ce2b282",
-            "Baleshwar Sadar": "63f8e46576742aaa3ce291d3",
-            "Balianta": "63f8fbcc76742aaa3ce4a74d",
-            "Baliapal": "63f8e3d376742aaa3ce28429",
-            "Balichandrapur": "63f8f34876742aaa3ce3e65f",
-            "Baliguda": "63f8f71876742aaa3ce43c91",
-            "Balikuda": "63f8f1d576742aaa3ce3c5fb",
-            "Balimi": "63f8ec4a76742aaa3ce34a26",
-            "Balipatna": "63f8fbde76742aaa3ce4a8f3",
-            "Balugaon": "63f8fc5c76742aaa3ce4b427",
-            "Bamebari": "63f8f98176742aaa3ce4746b",
-            "Bampada": "63f8e4a276742aaa3ce297bf",
-            "Banaharapali": "63f8f3b776742aaa3ce3f033",
-            "Banapur": "63f8fc7876742aaa3ce4b6ae",
-            "Banarpal": "63f8bc4536497c055ce570c0",
-            "Bandhugaon": "63f8fd3576742aaa3ce4c750",
-            "Banei": "63f9102276742aaa3ce62ae4",
-            "Bangiriposi": "63f9044276742aaa3ce52259",
-            "Bangomunda": "63f8e2c3672965a8ea0d0279",
-            "Banigochha": "63f9075c76742aaa3ce55fd5",
-            "Banki": "63f8e95776742aaa3ce30630",
-            "Bansada": "63f8e7c276742aaa3ce2e118",
-            "Bant": "63f8e6d876742aaa3ce2cbda",
-            "Bantala": "63f8bd6c36497c055ce585c1",
-            "Baragaon": "63f90f4c76742aaa3ce616c0",
-            "Barang": "63f8e9ad76742aaa3ce30e0b",
-            "Barapali": "63f8e65976742aaa3ce2c056",
-            "Barbil": "63f8f96f76742aaa3ce472bf",
-            "Bargarh": "63f8e68076742aaa3ce2c3b6",
-            "Bargarh Sadar": "63f8e68476742aaa3ce2c42b",
-            "Bari - Ramachandrapur": "63f8f37776742aaa3ce3ea55",
-            "Baria": "63f8f9b276742aaa3ce47903",
-            "Baripada (M)": "63f9062676742aaa3ce5479e",
-            "Baripada Sadar": "63f903e776742aaa3ce51b50",
-            "Baripada Town": "63f9040376742aaa3ce51e04",
-            "Barkot": "63f8eb0176742aaa3ce32cfc",
-            "Barsahi": "63f9056576742aaa3ce53883",
-            "Basta": "63f8e42076742aaa3ce28b3a",
-            "Basudebpur": "63f8e74c76742aaa3ce2d682",
-            "Baudh Sadar": "63f8e86e76742aaa3ce2f0ba",
-            "Baunsuni": "63f8e85b76742aaa3ce2eefb",
-            "Begunia": "63f8fb7476742aaa3ce49f9e",
-            "Belaghar": "63f8f78876742aaa3ce446bf",
-            "Belpahar": "63f8f3b676742aaa3ce3f01d",
-            "Belpara": "63f8bebe36497c055ce59cc9",
-            "Berhampur": "63f8e4ed76742aaa3ce29e91",
-            "Betanati": "63f9054a76742aaa3ce53629",
-            "Bhadrak Rural": "63f8e72576742aaa3ce2d306",
-            "Bhairabsingipur": "63f8fcd476742aaa3ce4bf19",
-            "Bhandari Pokhari": "63f8e6ef76742aaa3ce2cddf",
-            "Bhasma": "63f90f0676742aaa3ce61038",
-            "Bhatli": "63f8e68d76742aaa3ce2c4f5",
-            "Bheden": "63f8e66976742aaa3ce2c1ca",
-            "Bhograi": "63f8e38d76742aaa3ce27d59",
-            "Bhuban": "63f8ebe076742aaa3ce34100",
-            "Bhubaneswar (M.Corp.)": "63f8fca776742aaa3ce4bb01",
-            "Bhusan Steel Limited": "63f8ec4376742aaa3ce34993",
-            "Bijepur": "63f8e64276742aaa3ce2be2e",
-            "Bikrampur": "63f8bc3d36497c055ce5702b",
-            "Binika": "63f90e2c76742aaa3ce5fbba",
-            "Binjharpur": "63f8f35676742aaa3ce3e7a1",
-            "Biramaharajpur": "63f90e5376742aaa3ce5ff9c",
-            "Biramitrapur": "63f90f7e76742aaa3ce61b96",
-            "Biridi": "63f8f1b076742aaa3ce3c298",
-            "Bishamakatak": "63f90b2376742aaa3ce5b637",
-            "Bisoi": "63f9030576742aaa3ce506aa",
-            "Bisra": "63f90f9976742aaa3ce61e10",
-            "Biswanathpur": "63f8f4ad76742aaa3ce405a9",
-            "Boipariguda": "63f8ff6676742aaa3ce4d111",
-            "Bolagad": "63f8fb5076742aaa3ce49c81",
-            "Bolani": "63f8f97376742aaa3ce47325",
-            "Bondamunda": "63f90fb176742aaa3ce6204c",
-            "Boriguma": "63f8fcc376742aaa3ce4bd82",
-            "Brahmagiri": "63f90a6476742aaa3ce5a393",
-            "Brahmani Tarang": "63f90fb476742aaa3ce6208f",
-            "Brahmanigaon": "63f8f7c476742aaa3ce44c04",
-            "Brajarajnagar": "63f8f3be76742aaa3ce3f0d7",
-            "BurdenP.S.": "63f8e5ff76742aaa3ce2b822",
-            "Burla": "63f90d5a76742aaa3ce5e809",
-            "C.R.R.I.": "63f8eaa076742aaa3ce3243c",
-            "CHAMAKHANDI": "63f8efc676742aaa3ce396fb",
-            "CHHATRAPUR": "63f8efa576742aaa3ce39571",
-            "Chakapada": "63f8f6b576742aaa3ce4338f",
-            "Champua": "63f8f98e76742aaa3ce475a3",
-            "Chandabali": "63f8e7ab76742aaa3ce2defa",
-            "Chandahandi": "63f9065d76742aaa3ce54c0d",
-            "Chandaka": "63f8fbbc76742aaa3ce4a5ee",
-            "Chandanpur": "63f90a3b76742aaa3ce59fb3",
-            "Chandiposh": "63f90fc776742aaa3ce6224a",
-            "Chandipur": "6492b80b882c8da847737100",
-            "Chandrapur": "6492b80e882c8da847737114",
-            "Chandua": "63f9047f76742aaa3ce526cf",
-            "Charamal": "63f90dc276742aaa3ce5f1d6",
-            "Chhendipada": "63f8bc9236497c055ce5761d",
-            "Chitrakonda": "63f901c076742aaa3ce4ed5a",
-            "Choudwar": "63f8e9d076742aaa3ce31163",
-            "Colliery": "63f8bc2f36497c055ce56f2a",
-            "Cuttack Sadar": "63f8ea8476742aaa3ce321a9",
-            "DHARAKOTE": "63f8eefa76742aaa3ce38688",
-            "DIGAPAHANDI": "63f8f06476742aaa3ce3a4f0",
-            "Dabugan": "63f9069976742aaa3ce54eff",
-            "Daitari": "63f8facf76742aaa3ce4916f",
-            "Damonjodi": "63f9013e76742aaa3ce4e13f",
-            "Daringbadi": "63f8f7d876742aaa3ce44de1",
-            "Dasamantapur": "63f8fce576742aaa3ce4c0ba",
-            "Dasapalla": "63f9072a76742aaa3ce55b8c",
-            "Debagarh": "63f8ead076742aaa3ce328a9",
-            "Delanga": "63f9092d76742aaa3ce58881",
-            "Derabish": "63f8f8f876742aaa3ce46806",
-            "Dhama": "63f90db476742aaa3ce5f07b",
-            "Dhamanagar": "63f8e70e76742aaa3ce2d0c0",
-            "Dhamara Marine": "63f8e7e476742aaa3ce2e449",
-            "Dhanupali": "63f90d6176742aaa3ce5e8c4",
-            "Dharamgarh": "63f8f55d76742aaa3ce4155b",
-            "Dharmasala": "63f8f2b476742aaa3ce3d982",
-            "Dharuadihi": "63f90f1176742aaa3ce6113e",
-            "Dhenkanal Sadar": "63f8ec7076742aaa3ce34d65",
-            "Dhusuri": "63f8e79876742aaa3ce2dd54",
-            "Doraguda": "63f90c1d76742aaa3ce5c954",
-            "Dunguripali": "63f90e0776742aaa3ce5f848",
-            "Ersama": "63f8f10f76742aaa3ce3b4a0",
-            "Fategarh": "63f907c976742aaa3ce5696b",
-            "G.Udayagiri": "63f8f67476742aaa3ce42e2c",
-            "GANGAPUR": "63f8ee6c76742aaa3ce37a55",
-            "GANJAM": "63f8efaf76742aaa3ce39659",
-            "GOLANTHARA": "63f8f04f76742aaa3ce3a322",
-            "GOPALPUR": "63f8f04976742aaa3ce3a299",
-            "Gadisagada": "63f90a8476742aaa3ce5a6d3",
-            "Gaisilet": "63f8e60b76742aaa3ce2b93c",
-            "Gandia": "63f8ebf976742aaa3ce3431e",
-            "Gania": "63f9071076742aaa3ce55946",
-            "Garabandha": "63f8edde76742aaa3ce36d6d",
-            "Ghagarbeda": "63f903a676742aaa3ce51537",
-            "Ghasipura": "63f8fada76742aaa3ce4926b",
-            "Ghatgaon": "63f8fa9976742aaa3ce48cbb",
-            "Gobindpur": "6492b80b882c8da847737102",
-            "Gochhapada": "63f8f5e276742aaa3ce42118",
-            "Golamunda": "63f8f54e76742aaa3ce413ec",
-            "Gop": "63f909f376742aaa3ce598b9",
-            "Gorumahisani": "63f902a876742aaa3ce4fffd",
-            "Govindpur": "63f90cf876742aaa3ce5de64",
-            "Gudari": "63f90cae76742aaa3ce5d765",
-            "Gunupur": "63f90c8b76742aaa3ce5d3df",
-            "Gurandi": "63f8edb176742aaa3ce3697c",
-            "Gurudijhatia": "63f8e9bb76742aaa3ce30f6b",
-            "Gurundia": "63f9100a76742aaa3ce62883",
-            "HINJILI": "63f8efe376742aaa3ce399b8",
-            "Handapa": "63f8bcb236497c055ce57881",
-            "Harbhanga": "63f8e8c576742aaa3ce2f8b1",
-            "Harichandanpur": "63f8fab576742aaa3ce48f42",
-            "Hatibari": "63f90f8a76742aaa3ce61cce",
-            "Hemgir": "63f90ece76742aaa3ce60b25",
-            "Hindol": "63f8ec5476742aaa3ce34b13",
-            "Hirakud": "63f90d5876742aaa3ce5e7e9",
-            "Industrial": "63f8bc8336497c055ce5753f",
-            "Itamati": "63f907f876742aaa3ce56d52",
-            "JAGANNATH PRASAD": "63f8ee3d76742aaa3ce37605",
-            "JARADA": "63f8f0b476742aaa3ce3ac56",
-            "JONK": "63f9089b76742aaa3ce57b62",
-            "Jagatpur": "63f8ea7c76742aaa3ce320ee",
-            "Jagatsinghapur": "63f8f17876742aaa3ce3bddc",
-            "Jajapur": "63f8f27e76742aaa3ce3d465",
-            "Jajapur Road": "63f8f23d76742aaa3ce3cec9",
-            "Jajpur Sadar": "63f8f29376742aaa3ce3d66a",
-            "Jakhapura": "63f8f23a76742aaa3ce3ce86",
-            "Jaleswar": "63f8e36776742aaa3ce279dd",
-            "Jamankira": "63f90d6b76742aaa3ce5e9d6",
-            "Jamboo Marine": "63f8f87f76742aaa3ce45d1b",
-            "Jamda": "63f9029076742aaa3ce4fdce",
-            "Jankia": "63f8fc1976742aaa3ce4adf2",
-            "Jarapada": "63f8bc7436497c055ce57425",
-            "Jashipur": "63f9035176742aaa3ce50dae",
-            "Jatani": "63f8fc0876742aaa3ce4ac88",
-            "Jayapatna": "63f8f58076742aaa3ce41857",
-            "Jenapur": "63f8f2e776742aaa3ce3de0c",
-            "Jeypore": "63f8fea276742aaa3ce4cdbb",
-            "Jharbandha": "63f8e5da76742aaa3ce2b495",
-            "Jharigan": "63f9068b76742aaa3ce54dcc",
-            "Jharpokharia": "63f902c576742aaa3ce502c5",
-            "Jharsuguda": "63f8f3c576742aaa3ce3f17e",
-            "Jhumpura": "63f8f9a676742aaa3ce477ee",
-            "Joda": "63f8f97a76742aaa3ce473bf",
-            "Jodamba": "63f9020976742aaa3ce4f1dc",
-            "Jujomura": "63f90da076742aaa3ce5eea3",
-            "Junagarh": "63f8f52a76742aaa3ce410a7",
-            "KABISURYANAGAR": "63f8ef0776742aaa3ce387ca",
-            "KHALIKOTE": "63f8ef6476742aaa3ce38fd2",
-            "KHARIAR": "63f908e776742aaa3ce5822f",
-            "KODALA": "63f8ef3f76742aaa3ce38c88",
-            "KOMNA": "63f908c476742aaa3ce57f17",
-            "Kakatpur": "63f909ba76742aaa3ce593d1",
-            "Kakiriguma": "63f8fe4876742aaa3ce4ca6d",
-            "Kaliapani": "63f8f22a76742aaa3ce3cd24",
-            "Kalimela": "63f9023976742aaa3ce4f5be",
-            "Kalinganagar": "63f8f23176742aaa3ce3cdd0",
-            "Kalyanasingpur": "63f90b6376742aaa3ce5bc74",
-            "Kamakshyanagar": "63f8ebb176742aaa3ce33ce7",
-            "Kamarda": "63f8e3bb76742aaa3ce281e8",
-            "Kamarposh Balang": "63f90fcf76742aaa3ce6231e",
-            "Kandarpur": "63f8ea9a76742aaa3ce323a4",
-            "Kaniha": "63f8bbe136497c055ce56900",
-            "Kanjipani": "63f8fa5576742aaa3ce48733",
-            "Kankadahad": "63f8ebce76742aaa3ce33f64",
-            "Kanpur": "6492b80b882c8da847737104",
-            "Kantabanji": "63f8e2b7672965a8ea0d015f",
-            "Kantamal": "63f8e7e476742aaa3ce2e45c",
-            "Kaptipada": "63f905f876742aaa3ce5434c",
-            "Karanjia": "63f903af76742aaa3ce51615",
-            "Kashipur": "6492b80e882c8da847737116",
-            "Kasinagar": "63f8ed8f76742aaa3ce36662",
-            "Katarbaga": "63f90d4076742aaa3ce5e577",
-            "Kegaon": "63f8f51376742aaa3ce40e89",
-            "Kendrapara Sadar": "63f8f8c276742aaa3ce46339",
-            "Kendujhar Sadar": "63f8fa0a76742aaa3ce48070",
-            "Kendujhar Town": "63f8fa3976742aaa3ce484a5",
-            "Kesinga": "63f8f3ed76742aaa3ce3f4e9",
-            "Khaira": "63f8e50c76742aaa3ce2a19c",
-            "Khajuripada": "63f8f65076742aaa3ce42add",
-            "Khamar": "63f8bbac36497c055ce5654b",
-            "Khandagiri": "63f8fc0376742aaa3ce4ac11",
-            "Khandapada": "63f907a476742aaa3ce5660d",
-            "Khaprakhol": "63f8be8836497c055ce598f1",
-            "Khatiguda": "63f9070376742aaa3ce5580c",
-            "Khordha": "63f8fb9876742aaa3ce4a2a2",
-            "Khordha Sadar": "63f8fbac76742aaa3ce4a475",
-            "Khunta": "63f9059176742aaa3ce53c72",
-            "Khuntuni": "63f8e9c576742aaa3ce31062",
-            "Kiakata": "63f8bd2636497c055ce58025",
-            "Kinjirkela": "63f90f2c76742aaa3ce613e2",
-            "Kishannagar": "63f8ea6376742aaa3ce31ebc",
-            "Kishorenagar": "63f8bcd136497c055ce57a8b",
-            "Kisinda": "63f90d8b76742aaa3ce5ecdf",
-            "Kochinda": "63f90d2176742aaa3ce5e27d",
-            "Kodinga": "63f906cc76742aaa3ce5530e",
-            "Koida": "63f90fdb76742aaa3ce62442",
-            "Kokasara": "63f8f56976742aaa3ce41693",
-            "Kolabira": "63f8f3e476742aaa3ce3f413",
-            "Koliana": "63f9040676742aaa3ce51e47",
-            "Konark": "63f909e176742aaa3ce59727",
-            "Korai": "63f8f24976742aaa3ce3cfc5",
-            "Koraput": "63f8fe5376742aaa3ce4cb05",
-            "Koraput Town": "63f8fe9d76742aaa3ce4cd91",
-            "Kosagumuda": "63f906dc76742aaa3ce55469",
-            "Kotagarh": "63f8f7a576742aaa3ce44969",
-            "Kotiya": "63f9015b76742aaa3ce4e3fa",
-            "Kotpad": "63f8fcaa76742aaa3ce4bb4b",
-            "Krushna Prasad": "63f90a9276742aaa3ce5a833",
-            "Kuakhia": "63f8f2ff76742aaa3ce3dff8",
-            "Kujang": "63f8f0f176742aaa3ce3b1e0",
-            "Kundei": "63f9063d76742aaa3ce54925",
-            "Kundheigola": "63f8eb2c76742aaa3ce330ff",
-            "Kundura": "63f8fee376742aaa3ce4cfc0",
-            "Kutra": "63f90f5b76742aaa3ce61834",
-            "LINGARAJ": "63f8fbf476742aaa3ce4aaf3",
-            "Lahunipara": "63f90fe676742aaa3ce6255c",
-            "Laikera": "63f8f3ce76742aaa3ce3f245",
-            "Lakhanpur": "63f8f3af76742aaa3ce3ef71",
-            "Lakshmipur": "63f8fcff76742aaa3ce4c328",
-            "Lanjigarh": "63f8f47c76742aaa3ce4013d",
-            "Lathikata": "63f90fbf76742aaa3ce621a8",
-            "Lephripara": "63f90eef76742aaa3ce60e24",
-            "Loisinga": "63f8bd9036497c055ce5878c",
-            "M.V. 79": "63f9025776742aaa3ce4f874",
-            "Machh kund": "63f900d876742aaa3ce4d794",
-            "Madanpur Rampur": "63f8f40976742aaa3ce3f766",
-            "Mahakalapada": "63f8f94b76742aaa3ce46f73",
-            "Mahanga": "63f8e9f476742aaa3ce314be",
-            "Mahulapada": "63f9103c76742aaa3ce62d52",
-            "Mahuldiha": "63f9061976742aaa3ce54666",
-            "Mahulpalli": "63f90d0576742aaa3ce5dfb0",
-            "Malkangiri": "63f9016676742aaa3ce4e502",
-            "Manamunda": "63f8e81576742aaa3ce2e8c8",
-            "Mancheswar": "63f8fbcb76742aaa3ce4a732",
-            "Mangalpur": "63f8f38976742aaa3ce3ec00",
-            "Marsaghai": "63f8f93876742aaa3ce46daf",
-            "Mathili": "63f9019076742aaa3ce4e8c9",
-            "Melchhamunda": "63f8e61e76742aaa3ce2bae2",
-            "Mohana": "63f8ecd676742aaa3ce3567b",
-            "Motu": "63f9025d76742aaa3ce4f90c",
-            "Motunga": "63f8ec3576742aaa3ce34847",
-            "Mudulipada": "63f901ac76742aaa3ce4eb73",
-            "Muniguda": "63f90aea76742aaa3ce5b090",
-            "Muruda": "63f904ba76742aaa3ce52c55",
-            "N.T.P.C.": "63f8bbfc36497c055ce56b19",
-            "NALCO": "63f8bc4236497c055ce57078",
-            "NUAGAON": "63f8f08976742aaa3ce3a858",
-            "NUAPADA": "63f908ab76742aaa3ce57cc7",
-            "Nabarangapur P.S": "63f906eb76742aaa3ce555d8",
-            "Naikanidihi": "63f8e76176742aaa3ce2d878",
-            "Naktideul": "63f90df676742aaa3ce5f6ad",
-            "Nandankanan": "63f8fbc776742aaa3ce4a6ef",
-            "Nandapur": "63f9010876742aaa3ce4dc25",
-            "Nandipada": "63f8fb1c76742aaa3ce49834",
-            "Narala": "63f8f45276742aaa3ce3fd7b",
-            "Narasinghpur": "63f8e8e676742aaa3ce2fb99",
-            "Narayanpatana": "63f8fd1276742aaa3ce4c4b0",
-            "Naugaon": "6492b80c882c8da847737106",
-            "Nayagarh": "63f907ef76742aaa3ce56c79",
-            "Nayagarh Sadar": "63f9080576742aaa3ce56e71",
-            "Nayakote": "63f8fa4676742aaa3ce485d3",
-            "Nemalo": "63f8ea4776742aaa3ce31c67",
-            "Niali": "63f8eab376742aaa3ce32607",
-            "Nihalprasad": "63f8ec1876742aaa3ce345d7",
-            "Nikirai": "63f8f8ed76742aaa3ce466ec",
-            "Nilagiri": "63f8e4cb76742aaa3ce29b56",
-            "Nimapada": "63f9097c76742aaa3ce58f24",
-            "Nirakarpur": "63f8fc3276742aaa3ce4b038",
-            "Nischintakoili": "63f8ea3a76742aaa3ce31b2f",
-            "Nuagaon": "6492b80d882c8da84773710e",
-            "Odagaon": "63f9081876742aaa3ce5701c",
-            "Olatapur": "63f8eaaf76742aaa3ce32597",
-            "Orient": "63f8f3bd76742aaa3ce3f0d0",
-            "Orkel": "63f9021d76742aaa3ce4f364",
-            "Oupada": "63f8e4fc76742aaa3ce2a00f",
-            "PATAPUR": "63f8eff776742aaa3ce39b4a",
-            "POLASARA": "63f8ef2076742aaa3ce38a0b",
-            "PURUSOTTAMPUR": "63f8efcd76742aaa3ce3979f",
-            "Padmapur": "6492b80e882c8da847737118",
-            "Padua": "63f900f176742aaa3ce4d9fd",
-            "Paikamal": "63f8e5c476742aaa3ce2b28b",
-            "Palalahada": "63f8bb7b36497c055ce56251",
-            "Pandapara": "63f8fa8276742aaa3ce48aca",
-            "Panikoili": "63f8f26a76742aaa3ce3d2b0",
-            "Paparahandi": "63f906bd76742aaa3ce551b3",
-            "Paparmetla": "63f901f876742aaa3ce4f04a",
-            "Paradeep Lock": "63f8f0ea76742aaa3ce3b148",
-            "Paradip": "63f8f0e976742aaa3ce3b128",
-            "Parajang": "63f8eb9476742aaa3ce33a47",
-            "Paralakhemundi": "63f8eda276742aaa3ce36812",
-            "Patana": "63f8f9e776742aaa3ce47d3a",
-            "Patkura": "63f8f90c76742aaa3ce469de",
-            "Patnagarh": "63f8be5336497c055ce59539",
-            "Pattamundai": "63f8f8a176742aaa3ce46021",
-            "Phiringia": "63f8f6e076742aaa3ce437b2",
-            "Phulabani": "63f8f61576742aaa3ce425d4",
-            "Phulabani Town": "63f8f64e76742aaa3ce42ac2",
-            "Pipili": "63f9094d76742aaa3ce58b12",
-            "Podia": "63f9025076742aaa3ce4f7be",
-            "Pottangi": "63f9014176742aaa3ce4e187",
-            "Puruna Katak": "63f8e8ad76742aaa3ce2f666",
-            "Purunakot": "63f8bd5736497c055ce5840c",
-            "Puttasing": "63f90cea76742aaa3ce5dd2f",
-            "R.Udayagiri": "63f8ed1376742aaa3ce35bd7",
-            "RAMBHA": "63f8ef8d76742aaa3ce3934e",
-            "Raghunathapali": "63f90fbd76742aaa3ce62181",
-            "Raibania": "63f8e35576742aaa3ce27855",
-            "Raiboga": "63f90f7476742aaa3ce61aae",
-            "Raighar": "63f9062776742aaa3ce547ac",
-            "Raikia": "63f8f7fb76742aaa3ce45130",
-            "Rairakhol": "63f90dd876742aaa3ce5f3e0",
-            "Rairangpur": "63f9032776742aaa3ce509bd",
-            "Rairangpur Town": "63f9029e76742aaa3ce4ff1f",
-            "Rajagangapur": "63f90f6376742aaa3ce6190d",
-            "Rajkanika": "63f8f81976742aaa3ce453ff",
-            "Rajnagar": "6492b80c882c8da84773710a",
-            "Ramachandi": "63f90a1176742aaa3ce59bae",
-            "Ramagiri": "63f8edf776742aaa3ce36fae",
-            "Rampur": "6492b80e882c8da847737120",
-            "Ranapur": "6492b80d882c8da847737110",
-            "Raruan": "63f9038976742aaa3ce512dd",
-            "Rasagobindapur": "63f904df76742aaa3ce52eaf",
-            "Rasol": "63f8ec6076742aaa3ce34c23",
-            "Raurkela (ITS)P.S.": "63f9104676742aaa3ce62e0a",
-            "Raurkela (M)": "63f9104676742aaa3ce62e03",
-            "Rayagada": "6492b80e882c8da84773711a",
-            "Reamal": "63f8eb5b76742aaa3ce33557",
-            "Remuna": "63f8e4a776742aaa3ce29843",
-            "Rengali": "6492b80e882c8da84773711c",
-            "Rengali Damsite": "63f8bbd436497c055ce56822",
-            "Rugudi": "63f8f97676742aaa3ce47363",
-            "Rupsa": "63f8e45e76742aaa3ce29131",
-            "SERAGAD": "63f8f03176742aaa3ce3a06a",
-            "SINAPALI": "63f9091376742aaa3ce58616",
-            "SURADA": "63f8ee8776742aaa3ce37caf",
-            "Sadar": "6492b80d882c8da847737112",
-            "Sahadevkhunta": "63f8e49a76742aaa3ce296e9",
-            "Sainkul": "63f8fb3b76742aaa3ce49aa2",
-            "Saintala": "63f8beda36497c055ce59ee2",
-            "Salepur": "63f8ea1e76742aaa3ce31899",
-            "Samal Barrage": "63f8bc0036497c055ce56b75",
-            "Sambalpur (M)": "63f90e0676742aaa3ce5f83a",
-            "Sarangagarh": "63f8f6c876742aaa3ce43567",
-            "Sarankul": "63f9084976742aaa3ce5747e",
-            "Sasan": "63f90d4c76742aaa3ce5e6ac",
-            "Satyabadi": "63f90a1876742aaa3ce59c50",
-            "Serango": "63f8ed5b76742aaa3ce361ce",
-            "Seskhal": "63f90c6e76742aaa3ce5d0fe",
-            "Sharata": "63f9060c76742aaa3ce5453d",
-            "Similia": "63f8e59276742aaa3ce2adc1",
-            "Similiguda": "63f9013576742aaa3ce4e073",
-            "Sindhekela": "63f8e2d7672965a8ea0d044c",
-            "Singla": "63f8e40276742aaa3ce28845",
-            "Sohela": "63f8e62e76742aaa3ce2bc5b",
-            "Sonapur": "6492b80f882c8da847737122",
-            "Soro": "63f8e54776742aaa3ce2a70c",
-            "Soso": "63f8fb0b76742aaa3ce496a7",
-            "Subalaya": "63f90e7f76742aaa3ce60386",
-            "Sukinda": "63f8f20e76742aaa3ce3caaa",
-            "Suliapada": "63f9049976742aaa3ce52938",
-            "Sunabeda": "63f9013b76742aaa3ce4e101",
-            "Sundargarh": "63f90f1a76742aaa3ce6122d",
-            "Sundargarh Town": "63f90f1a76742aaa3ce61221",
-            "TARASINGI": "63f8ee1076742aaa3ce371e2",
-            "Talasara": "63f90f3876742aaa3ce6150b",
-            "Talcher Sadar": "63f8bc0b36497c055ce56c80",
-            "Tamando": "63f8fc0576742aaa3ce4ac31",
-            "Tangarapali": "63f90fbe76742aaa3ce62192",
-            "Tangi": "6492b80d882c8da84773710c",
-            "Tarbha": "63f90ea476742aaa3ce606fd",
-            "Telkoi": "63f8fa5d76742aaa3ce487f3",
-            "Tentulikhunti": "63f906f876742aaa3ce55710",
-            "Thakurgarh": "63f8bd3736497c055ce58171",
-            "Thakurmunda": "63f903cf76742aaa3ce51923",
-            "Thelkoloi": "63f90d4676742aaa3ce5e614",
-            "Thuamul Rampur": "63f8f5a276742aaa3ce41b42",
-            "Tigiria": "63f8e97776742aaa3ce3092f",
-            "Tihidi": "63f8e77376742aaa3ce2da2d",
-            "Tikabali": "63f8f69276742aaa3ce43054",
-            "Tikaetpali": "63f9101976742aaa3ce629fc",
-            "Tikiri": "63f90beb76742aaa3ce5c7e5",
-            "Tiring": "63f9026776742aaa3ce4f9f6",
-            "Tirtol": "63f8f13376742aaa3ce3b7b8",
-            "Titlagarh": "63f8e33576742aaa3ce27559",
-            "Tomka": "63f8f21e76742aaa3ce3cc23",
-            "Tumudibandha": "63f8f77476742aaa3ce444ec",
-            "Tumusingha": "63f8ec2776742aaa3ce34705",
-            "Turekela": "63f8beaa36497c055ce59b50",
-            "Turumunga": "63f8f9cd76742aaa3ce47b1c",
-            "Tushura": "63f8be0b36497c055ce5904b",
-            "Udala": "63f905dd76742aaa3ce540de",
-            "Ulunda": "63f90e3d76742aaa3ce5fd74",
-            "Umarkote": "63f9064776742aaa3ce549fe",
-            "Uttara P.S": "63f8fbfc76742aaa3ce4ab79",
-            "MAYURBHANJ": "63f9026776742aaa3ce4f9f3",
-            "SAMBALPUR": "63f90cf776742aaa3ce5de61",
-            "CUTTACK": "63f8e8e576742aaa3ce2fb96",
-            "BHADRAK": "63f8e6c676742aaa3ce2ca63",
-            "SONEPUR": "63f90e0676742aaa3ce5f845",
-            "DHENKANAL": "63f8eb9476742aaa3ce33a44",
-            "PURI": "63f9092d76742aaa3ce5887e",
-            "BOUDH": "63f8e7e476742aaa3ce2e459",
-            "DEOGARH": "63f8ead076742aaa3ce328a6",
-            "KANDHAMAL": "63f8f5e276742aaa3ce42115",
-            "KALAHANDI": "63f8f3ed76742aaa3ce3f4e6",
-            "KENDUJHAR": "63f8f96f76742aaa3ce472bc",
-            "KENDRAPARA": "63f8f81976742aaa3ce453fc",
-            "BALESHWAR": "63f8e35576742aaa3ce27852",
-            "NABARANGPUR": "63f9062776742aaa3ce547a9",
-            "GAJAPATI": "63f8eca576742aaa3ce35202"
-        },
-        "63f9ce2c519359b7438e746d": {
-            "Bahour Taluk": "63f9ce41519359b7438e7664",
-            "Karaikal Taluk": "63f9ce2c519359b7438e7473",
-            "MAHE": "6518182e12187de2042fef07",
-            "Ozhukarai Taluk": "63f9ce35519359b7438e7557",
-            "Puducherry Taluk": "63f9ce33519359b7438e7519",
-            "Thirunallar Taluk": "63f9ce2f519359b7438e74bb",
-            "Villianur Taluk": "63f9ce37519359b7438e7581",
-            "Yanam taluk": "6518187f12187de2042fef08",
-            "PONDICHERRY": "63f9ce33519359b7438e7516",
-            "KARAIKAL": "63f9ce2c519359b7438e7470"
-        },
-        "63f2495789e288769575a424": {
-            "AHMEDGARH": "63f37f0d491ca1c6048694e2",
-            "Abohar": "63f37e9d491ca1c60486898c",
-            "Adampur": "63f34f83e47767c632141ab2",
-            "Ajnala": "63f2495789e288769575a42a",
-            "Amargarh": "63f37f18491ca1c6048695e8",
-            "Amloh": "63f24c3d89e288769575c1a4",
-            "Amritsar -I": "63f249fc89e288769575aae4",
-            "Amritsar- II": "63f24a1489e288769575abe5",
-            "Anandpur Sahib": "63f36297e47767c632146815",
-            "BANGA": "63f35ea6e47767c63214534c",
-            "BHAWANIGARH": "63f3654be47767c632147a7f",
-            "BHIKHIWIND": "63f37e52491ca1c604868204",
-            "Baba Bakala": "63f24a5689e288769575ae67",
-            "Bagha Purana": "63f35a47e47767c6321441ef",
-            "Balachaur": "63f35df4e47767c632144fad",
-            "Barnala": "63f3686fe47767c632147bd7",
-            "Bassi Pathana": "63f24bb989e288769575bc5a",
-            "Batala": "63f24e3589e288769575d985",
-            "Bathinda": "63f24af489e288769575b475",
-            "Beas": "63f24ac889e288769575b2bc",
-            "Bhulath": "63f34fdde47767c632141c6e",
-            "Budhlada": "63f35992e47767c632143dc8",
-            "Chamkaur Sahib": "63f3643ae47767c632147072",
-            "DHARAMKOT": "63f35b08e47767c6321444af",
-            "DIRBA": "63f3652ce47767c6321479ce",
-            "DUDHAN SADHAN": "63f36276e47767c632146631",
-            "Dasua": "63f342e8e47767c63213edec",
-            "Dera Baba Nanak": "63f24edc89e288769575df90",
-            "Dera Bassi": "63f37ded491ca1c604867818",
-            "Dhar Kalan": "63f37eac491ca1c604868b0c",
-            "Dhuri": "63f3645fe47767c632147433",
-            "Dinanagar": "63f24f8689e288769575e43f",
-            "Faridkot": "63f24b6489e288769575b8f1",
-            "Fatehgarh Churian": "63f342a0e47767c63213ecb2",
-            "Fatehgarh Sahib": "63f24be989e288769575be50",
-            "Fazilka": "63f37e81491ca1c6048686a6",
-            "Firozpur": "63f24cfa89e288769575c963",
-            "GURUHARSAHAI": "63f24d5a89e288769575cdca",
-            "Garhshankar": "63f349dde47767c63214014d",
-            "Gidderbaha": "63f35c54e47767c632144965",
-            "Gurdaspur": "63f24dae89e288769575d235",
-            "Hoshiarpur": "63f3460de47767c63213f930",
-            "Jagraon": "63f35837e47767c6321439b2",
-            "Jaitu": "63f24b9389e288769575bad8",
-            "Jalalabad": "63f37e6b491ca1c604868474",
-            "Jalandhar - I": "63f34dc5e47767c6321414c8",
-            "Jalandhar - II": "63f34e96e47767c6321417a4",
-            "KOTAKPURA": "63f24ba889e288769575bbac",
-            "Kalanaur": "63f24f3889e288769575e1f9",
-            "Kapurthala": "63f3504de47767c632141e6e",
-            "Khadur Sahib": "63f37e3f491ca1c604868022",
-            "Khamanon": "63f24c7189e288769575c3b3",
-            "Khanna": "63f353ebe47767c632142e59",
-            "Kharar": "63f369fde47767c632147e5d",
-            "Lehra": "63f364dfe47767c632147821",
-            "Lopoke": "6492b80f882c8da847737124",
-            "Ludhiana (East)": "63f35636e47767c6321431f0",
-            "Ludhiana (West)": "63f35700e47767c63214358f",
-            "MORINDA": "63f36452e47767c6321472e0",
-            "Majitha": "63f24a9789e288769575b0ee",
-            "Malerkotla": "63f37efc491ca1c60486932d",
-            "Malout": "63f35bf9e47767c63214479c",
-            "Mamdot": "63f24d9389e288769575d0c9",
-            "Mansa": "63f359dde47767c632143f7d",
-            "Maur": "63f24b4c89e288769575b7f3",
-            "Moga": "63f35a87e47767c632144309",
-            "Moonak": "63f36503e47767c6321478e6",
-            "Mukerian": "63f34464e47767c63213f320",
-            "Muktsar": "63f35c6ae47767c632144a52",
-            "Nabha": "63f35fbae47767c63214583b",
-            "Nakodar": "63f34ceae47767c632140d3f",
-            "Nangal": "63f36346e47767c632146bcd",
-            "Nawanshahr": "63f35d01e47767c632144c36",
-            "Nihal Singhwala": "63f35a27e47767c632144125",
-            "Pathankot": "63f37eb2491ca1c604868b9a",
-            "Patiala": "63f36077e47767c632145b99",
-            "Patran": "63f35f69e47767c6321456e5",
-            "Patti": "63f37e31491ca1c604867eae",
-            "Payal": "63f3548be47767c632142fc3",
-            "Phagwara": "63f35291e47767c6321427d7",
-            "Phillaur": "63f34d32e47767c632141020",
-            "Raikot": "63f357c0e47767c632143834",
-            "Rajpura": "6492b80f882c8da847737126",
-            "Rampura Phul": "63f24ad789e288769575b34c",
-            "Rup Nagar": "63f363a1e47767c632146d00",
-            "SAS Nagar (Mohali)": "63f37ddd491ca1c60486767c",
-            "Samana": "63f35f33e47767c632145576",
-            "Samrala": "63f35320e47767c632142a6f",
-            "Sangrur": "63f36479e47767c632147615",
-            "Sardulgarh": "63f35942e47767c632143c6d",
-            "Shahkot": "63f34c50e47767c6321409c3",
-            "Sultanpur Lodhi": "63f3518de47767c6321423a2",
-            "Sunam": "63f364bbe47767c632147734",
-            "Talwandi Sabo": "63f24b3089e288769575b6d4",
-            "Tanda": "63f34be7e47767c63214072b",
-            "Tapa": "63f369c6e47767c632147d64",
-            "Tarn Taran": "63f37e08491ca1c604867ad3",
-            "Zira": "63f24c9389e288769575c524",
-            "Shahid Bhagat Singh Nagar": "63f35d01e47767c632144c33",
-            "FEROZEPUR": "63f24c9389e288769575c521",
-            "SRI MUKTSAR SAHIB": "63f35bf8e47767c632144799",
-            "AMRITSAR": "63f2495789e288769575a427",
-            "S.A.S Nagar": "63f369fde47767c632147e5a",
-            "LUDHIANA": "63f35320e47767c632142a6c",
-            "JALANDHAR": "63f34c4fe47767c6321409c0",
-            "RUPNAGAR": "63f36296e47767c632146812"
-        },
-        "63f5cef58cec41e6c95ce84e": {
-            "ANANDPURI": "63f5d3798cec41e6c95d3d3c",
-            "ASNAWAR": "63f5ef978cec41e6c95f3e22",
-            "Aandhi": "63f5ec3f8cec41e6c95eff24",
-            "Aau": "63f5f2e68cec41e6c95f7bae",
-            "Abapura": "63f5d3c78cec41e6c95d433c",
-            "Abu Road": "63f5fbf58cec41e6c9601c5c",
-            "Ahore": "63f5ed8a8cec41e6c95f17b3",
-            "Ajmer": "63f5cf0b8cec41e6c95ce98c",
-            "Aklera": "63f5eeb78cec41e6c95f2e0a",
-            "Alwar": "63f5d0cf8cec41e6c95d0c11",
-            "Amber": "63f5eb2d8cec41e6c95eea83",
-            "Amet": "63f5f8418cec41e6c95fdefc",
-            "Antah": "63f5d4118cec41e6c95d489e",
-            "Anupgarh": "63f5e6458cec41e6c95e935c",
-            "Arain": "63f5cffb8cec41e6c95cfbba",
-            "Arnod": "63f600cf8cec41e6c9607add",
-            "Artuna": "63f5d3e48cec41e6c95d455f",
-            "Asind": "63f5dae18cec41e6c95db7dd",
-            "Aspur": "63f5e3bb8cec41e6c95e6780",
-            "Atru": "63f5d4438cec41e6c95d4c17",
-            "BHOPALSAGAR": "63f5e07a8cec41e6c95e25ca",
-            "BICHIWARA": "63f5e41e8cec41e6c95e6f42",
-            "BIDASAR": "63f5e15b8cec41e6c95e37d2",
-            "Badgaon": "63f5ffa38cec41e6c9606397",
-            "Badnor": "63f5dcd08cec41e6c95dda87",
-            "Bagidora": "63f5d2cf8cec41e6c95d319a",
-            "Bagora": "63f5edbd8cec41e6c95f1b74",
-            "Bajju": "63f5de088cec41e6c95df395",
-            "Bakani": "63f5efa88cec41e6c95f3f4b",
-            "Balesar": "63f5f23f8cec41e6c95f6e5d",
-            "Bali": "63f5f7b48cec41e6c95fd597",
-            "Bamanwas": "63f5f9488cec41e6c95fef84",
-            "Bandikui": "63f5e2878cec41e6c95e4ecc",
-            "Banera": "63f5db588cec41e6c95dbe8c",
-            "Bansur": "63f5d0f28cec41e6c95d0ec5",
-            "Banswara": "63f5d2a98cec41e6c95d2ec8",
-            "Baori": "63f5f2048cec41e6c95f6a03",
-            "Bap": "63f5f2178cec41e6c95f6b72",
-            "Bapini": "63f5f2a18cec41e6c95f7635",
-            "Baran": "63f5d4288cec41e6c95d4a44",
-            "Bari": "63f5e2c58cec41e6c95e53f2",
-            "Bari Sadri": "63f5e0508cec41e6c95e2299",
-            "Barmer": "63f5d6ac8cec41e6c95d7390",
-            "Barnala": "6492b811882c8da84773714e",
-            "Baseri": "63f5e2ad8cec41e6c95e5215",
-            "Bassi": "6492b811882c8da84773713e",
-            "Baswa": "63f5e1908cec41e6c95e3bb8",
-            "Bayana": "63f5da438cec41e6c95dadfe",
-            "Baytoo": "63f5d5a98cec41e6c95d62bc",
-            "Beawar": "63f5cf2e8cec41e6c95cec29",
-            "Begun": "63f5df2a8cec41e6c95e0b02",
-            "Behrawanda": "63f5e2638cec41e6c95e4c23",
-            "Behror": "63f5d0258cec41e6c95cfef1",
-            "Bejupada": "63f5e26f8cec41e6c95e4ced",
-            "Bhadesar": "63f5dffb8cec41e6c95e1bc4",
-            "Bhadra": "63f5e9f98cec41e6c95ed366",
-            "Bhadrajun": "63f5ee4a8cec41e6c95f25d3",
-            "Bhanipura": "63f5e1808cec41e6c95e3a83",
-            "Bhaniyana": "63f5ed558cec41e6c95f13cf",
-            "Bharatpur": "63f5d9ed8cec41e6c95da887",
-            "Bhilwara": "63f5dbe08cec41e6c95dc73e",
-            "Bhim": "63f5f7ec8cec41e6c95fd949",
-            "Bhinay": "63f5cf948cec41e6c95cf3be",
-            "Bhindar": "63f5ffcc8cec41e6c96066b6",
-            "Bhinmal": "63f5edb48cec41e6c95f1acd",
-            "Bhopalgarh": "63f5f1678cec41e6c95f5ed7",
-            "Bhusawar": "63f5daa58cec41e6c95db41a",
-            "Bijoliya": "63f5dc958cec41e6c95dd583",
-            "Bikaner": "63f5dd028cec41e6c95dde72",
-            "Bilara": "63f5f1f38cec41e6c95f68b2",
-            "Bissau": "63f5f1178cec41e6c95f5948",
-            "Bonli": "63f5f97d8cec41e6c95ff307",
-            "Buhana": "63f5f03e8cec41e6c95f4a3d",
-            "Bundi": "63f5deb18cec41e6c95e013e",
-            "CHHOTI SARWAN": "63f5d3268cec41e6c95d374d",
-            "Chaksu": "63f5eba28cec41e6c95ef365",
-            "Chauth Ka Barwara": "63f5f9928cec41e6c95ff458",
-            "Chhabra": "63f5d50c8cec41e6c95d57c4",
-            "Chhatargarh": "63f5dddf8cec41e6c95df062",
-            "Chhipabarod": "63f5d5408cec41e6c95d5b90",
-            "Chhoti Sadri": "63f6005d8cec41e6c96071f1",
-            "Chikhali": "63f5e4388cec41e6c95e715b",
-            "Chirawa": "63f5f0268cec41e6c95f487e",
-            "Chitalwana": "63f5ee1d8cec41e6c95f2298",
-            "Chittaurgarh": "63f5dfa28cec41e6c95e1475",
-            "Chohtan": "63f5d7518cec41e6c95d7e52",
-            "Chomu": "63f5ea9d8cec41e6c95edf4b",
-            "Churu": "63f5e10f8cec41e6c95e319b",
-            "DHOD": "63f5fb308cec41e6c9600fa0",
-            "DHORIMANNA": "63f5d7bb8cec41e6c95d84fa",
-            "DUDU": "63f5ebdf8cec41e6c95ef7f6",
-            "Danta Ramgarh": "63f5fa778cec41e6c96003c2",
-            "Dausa": "63f5e1d98cec41e6c95e419f",
-            "Dechu": "63f5f2d48cec41e6c95f7a3a",
-            "Deeg": "63f5d9768cec41e6c95da0f7",
-            "Degana": "63f5f59a8cec41e6c95fb1bf",
-            "Deh": "63f5f69b8cec41e6c95fc3ce",
-            "Deldar": "63f5fc278cec41e6c9602011",
-            "Delwara": "63f5f9228cec41e6c95fed3f",
-            "Deogarh": "63f5f81b8cec41e6c95fdc75",
-            "Deoli": "63f5fd038cec41e6c96030aa",
-            "Desuri": "63f5f7858cec41e6c95fd2b4",
-            "Dhanaau": "63f5d8ce8cec41e6c95d9693",
-            "Dhariawad": "63f5fffe8cec41e6c9606a9a",
-            "Dhaulpur": "63f5e3188cec41e6c95e5a63",
-            "Didwana": "63f5f50a8cec41e6c95fa657",
-            "Digod": "63f5f4358cec41e6c95f9618",
-            "Dowda": "6492b810882c8da847737138",
-            "Dug": "63f5eff68cec41e6c95f4530",
-            "Dungarpur": "63f5e3898cec41e6c95e6350",
-            "Dungla": "63f5dfdd8cec41e6c95e1974",
-            "Duni": "63f5fd478cec41e6c96035f9",
-            "Fatehgarh": "63f5ed328cec41e6c95f112f",
-            "Fatehpur": "6492b812882c8da847737150",
-            "GARHBOR": "63f5f8e48cec41e6c95fe942",
-            "GOVINDGARH": "63f5d1f88cec41e6c95d21e8",
-            "Gadraroad": "63f5d85f8cec41e6c95d8f32",
-            "Galiyakot": "63f5e44d8cec41e6c95e7306",
-            "Gamdi Ahada": "6492b810882c8da84773713a",
-            "Gangadtalai": "63f5d39c8cec41e6c95d3fe6",
-            "Ganganagar": "63f5e4cd8cec41e6c95e7c11",
-            "Gangapur": "63f5f9378cec41e6c95fee8d",
-            "Gangdhar": "63f5ef7a8cec41e6c95f3be1",
-            "Gangrar": "63f5df0b8cec41e6c95e0867",
-            "Ganoda": "63f5d3b58cec41e6c95d41cd",
-            "Garhi": "63f5d2878cec41e6c95d2c3c",
-            "Ghantiyali": "63f5f31c8cec41e6c95f8002",
-            "Gharsana": "63f5e6c18cec41e6c95e9bd8",
-            "Ghatol": "63f5d2568cec41e6c95d28ac",
-            "Gida": "63f5d8928cec41e6c95d9281",
-            "Girwa": "63f5fe668cec41e6c9604bd8",
-            "Gogunda": "63f5fd9b8cec41e6c9603c5f",
-            "Gudha Malani": "63f5d6658cec41e6c95d6f33",
-            "Gudhagorji": "63f5f0f58cec41e6c95f5700",
-            "Hameergarh": "63f5dcf38cec41e6c95ddd79",
-            "Hanumangarh": "63f5e8a38cec41e6c95ebc0c",
-            "Harsauli": "6492b810882c8da847737128",
-            "Hindaun": "63f5f3698cec41e6c95f85fa",
-            "Hindoli": "63f5de1e8cec41e6c95df542",
-            "Hurda": "63f5db188cec41e6c95dbad2",
-            "Indragarh": "63f5de7a8cec41e6c95dfca8",
-            "JOTHARI": "63f5e47c8cec41e6c95e7625",
-            "Jahazpur": "63f5dc2e8cec41e6c95dcd19",
-            "Jaipur": "63f5eb2b8cec41e6c95eea4f",
-            "Jaisalmer": "63f5ec9a8cec41e6c95f05d7",
-            "Jaitaran": "63f5f6ab8cec41e6c95fc4bd",
-            "Jalor": "63f5eda18cec41e6c95f1959",
-            "Jamwa Ramgarh": "63f5eb5f8cec41e6c95eee59",
-            "Jaswantpura": "63f5ee098cec41e6c95f2124",
-            "Jayal": "63f5f52b8cec41e6c95fa8e8",
-            "Jhadol": "63f5fe1c8cec41e6c960464f",
-            "Jhallara": "6492b812882c8da847737154",
-            "Jhalrapatan": "63f5ee8e8cec41e6c95f2af7",
-            "Jhanwar": "63f5f3088cec41e6c95f7e75",
-            "Jhunjhunun": "63f5f00d8cec41e6c95f46c4",
-            "Jobner": "63f5ec5d8cec41e6c95f014c",
-            "Jodhpur": "63f5f17c8cec41e6c95f606e",
-            "KHAMNOR": "63f5f9008cec41e6c95feaf2",
-            "KHENDELA": "63f5fb088cec41e6c9600d28",
-            "KISHANGARH RENWAL": "63f5ebcb8cec41e6c95ef682",
-            "KOTKHAWDA": "63f5ebf08cec41e6c95ef93d",
-            "KUCHAMAN CITY": "63f5f6108cec41e6c95fbaf5",
-            "Kalwar": "63f5ec888cec41e6c95f0498",
-            "Kaman": "63f5d92d8cec41e6c95d9c7a",
-            "Kanod": "63f5ffe38cec41e6c9606875",
-            "Kanwas": "63f5f4d98cec41e6c95fa2b4",
-            "Kapasan": "63f5dfc08cec41e6c95e170b",
-            "Karanpur": "63f5e48d8cec41e6c95e775f",
-            "Karauli": "63f5f3858cec41e6c95f884a",
-            "Kareda": "63f5dcb48cec41e6c95dd82d",
-            "Kathumar": "63f5d1788cec41e6c95d190c",
-            "Kekri": "63f5cfc98cec41e6c95cf7a0",
-            "Keshoraipatan": "63f5de988cec41e6c95dff07",
-            "Khairthal": "6492b810882c8da84773712a",
-            "Khajuwala": "63f5ddb38cec41e6c95decb4",
-            "Khandar": "63f5f9d48cec41e6c95ff8cb",
-            "Khanpur": "63f5ee588cec41e6c95f26ea",
-            "Kheenvsar": "63f5f5658cec41e6c95fad6f",
-            "Kherwara": "63f5ff6d8cec41e6c9605fb7",
-            "Khetri": "63f5f0678cec41e6c95f4cf6",
-            "Kishanganj": "63f5d48b8cec41e6c95d4efd",
-            "Kishangarh": "63f5cef68cec41e6c95ce854",
-            "Kishangarh Bas": "63f5d0998cec41e6c95d07f0",
-            "Kolayat": "63f5dd678cec41e6c95de6a7",
-            "Kotkasim": "63f5d0638cec41e6c95d039b",
-            "Kotputli": "63f5ea488cec41e6c95ed902",
-            "Kotra": "63f5fdd88cec41e6c960412f",
-            "Kotri": "63f5dc018cec41e6c95dc989",
-            "Kudi Bhagtasni": "63f5f3028cec41e6c95f7dec",
-            "Kumbhalgarh": "63f5f8728cec41e6c95fe1f6",
-            "Kumher": "63f5d9c68cec41e6c95da5fb",
-            "Kurabad": "6492b813882c8da847737156",
-            "Kushalgarh": "63f5d2e28cec41e6c95d331d",
-            "Kuwaria": "63f5f9128cec41e6c95fec20",
-            "LOHAWAT": "63f5f2818cec41e6c95f739f",
-            "Lachhmangarh": "6492b812882c8da847737152",
-            "Ladnu": "63f5f4ee8cec41e6c95fa43e",
-            "Ladpura": "63f5f45f8cec41e6c95f9971",
-            "Lalsot": "63f5e1f08cec41e6c95e434f",
-            "Lasadiya": "63f5febc8cec41e6c9605267",
-            "Lawan": "63f5e2398cec41e6c95e48d7",
-            "Luni": "63f5f1d98cec41e6c95f66cb",
-            "Lunkaransar": "63f5dd448cec41e6c95de3d0",
-            "MALAKHERA": "63f5d1dd8cec41e6c95d2006",
-            "MALSISAR": "63f5f0ba8cec41e6c95f52d8",
-            "MUNDWA": "63f5f65d8cec41e6c95fbfea",
-            "Madhorajpura": "63f5ec288cec41e6c95efd6f",
-            "Mahwa": "63f5e1a28cec41e6c95e3d40",
-            "Makrana": "63f5f5cf8cec41e6c95fb61e",
-            "Malarna Doongar": "63f5f9668cec41e6c95ff184",
-            "Malpura": "63f5fc318cec41e6c96020e7",
-            "Mandal": "6492b810882c8da847737132",
-            "Mandalgarh": "63f5dc658cec41e6c95dd1e9",
-            "Mandawa": "63f5f1058cec41e6c95f5815",
-            "Mandawar": "6492b810882c8da847737136",
-            "Mandrayal": "63f5f3a48cec41e6c95f8abd",
-            "Mangrol": "63f5d3fb8cec41e6c95d4711",
-            "Mania": "63f5e3708cec41e6c95e6171",
-            "Manohar Thana": "63f5eeff8cec41e6c95f3348",
-            "Marwar Junction": "63f5f7528cec41e6c95fcf88",
-            "Masalpur": "63f5f3e68cec41e6c95f8fda",
-            "Masuda": "63f5cf618cec41e6c95cefd2",
-            "Maulasar": "63f5f6838cec41e6c95fc255",
-            "Mauzamabad": "63f5ead98cec41e6c95ee3dc",
-            "Mavli": "63f5fd6d8cec41e6c96038d9",
-            "Merta": "63f5f57b8cec41e6c95faf5b",
-            "Mitrapura": "63f5fa098cec41e6c95ffc49",
-            "NEEMRANA": "63f5d1a38cec41e6c95d1c1a",
-            "Nadbai": "63f5d9a38cec41e6c95da392",
-            "Nadoti": "63f5f34d8cec41e6c95f83e6",
-            "Nagar": "63f5d9568cec41e6c95d9efc",
-            "Nagarfort": "63f5fd578cec41e6c960373b",
-            "Nagaur": "63f5f5438cec41e6c95faac5",
-            "Nainwa": "63f5de4a8cec41e6c95df8eb",
-            "Nangal Rajawatan": "63f5e2148cec41e6c95e45fe",
-            "Narayanpur": "63f5d2098cec41e6c95d2316",
-            "Nasirabad": "63f5cf7c8cec41e6c95cf1f5",
-            "Nathdwara": "63f5f8c88cec41e6c95fe76a",
-            "Naugaon": "63f5d2438cec41e6c95d2754",
-            "Nawa": "63f5f5f28cec41e6c95fb8e1",
-            "Nawalgarh": "63f5f08d8cec41e6c95f4f87",
-            "Nayagaon": "6492b813882c8da847737158",
-            "Nechwa": "63f5fb538cec41e6c96011d4",
-            "Neem-Ka-Thana": "63f5faea8cec41e6c9600b2d",
-            "Nimbahera": "63f5e0258cec41e6c95e1f13",
-            "Nirjharna": "63f5e2a38cec41e6c95e5135",
-            "Niwai": "63f5fc7c8cec41e6c96026b3",
-            "Nohar": "63f5e9b78cec41e6c95ecef5",
-            "Nokha": "63f5dd928cec41e6c95de9dd",
-            "Osian": "63f5f14a8cec41e6c95f5cc8",
-            "Pachpadra": "63f5d5e88cec41e6c95d6700",
-            "Pachpahar": "63f5ef328cec41e6c95f3719",
-            "Padampur": "63f5e56e8cec41e6c95e8692",
-            "Pahari": "63f5d9018cec41e6c95d99c6",
-            "Paldewal": "6492b811882c8da84773713c",
-            "Pali": "63f5f7368cec41e6c95fcdd3",
-            "Pallu": "63f5ea338cec41e6c95ed79b",
-            "Parbatsar": "63f5f5b38cec41e6c95fb3d3",
-            "Patan": "63f5fb6d8cec41e6c960137c",
-            "Pavta": "63f5ec118cec41e6c95efbd3",
-            "Peepalkhoont": "63f600268cec41e6c9606de4",
-            "Peeplu": "63f5fc5b8cec41e6c960243b",
-            "Peesangan": "63f5cf1c8cec41e6c95ceae2",
-            "Phagi": "63f5eaf18cec41e6c95ee5b4",
-            "Phalodi": "63f5f1248cec41e6c95f5a32",
-            "Phalsund": "6492b811882c8da847737142",
-            "Phooliya Kalan": "63f5dce48cec41e6c95ddc32",
-            "Phulera (Hq.Sambhar)": "63f5eabe8cec41e6c95ee1dc",
-            "Pilibanga": "63f5e9178cec41e6c95ec3f7",
-            "Pindwara": "63f5fbd58cec41e6c96019ee",
-            "Pipalda": "63f5f4088cec41e6c95f92a1",
-            "Pipar shahar": "63f5f25b8cec41e6c95f70a8",
-            "Pirawa": "63f5ef618cec41e6c95f3a0e",
-            "Pokaran": "63f5ecfe8cec41e6c95f0d5e",
-            "Poogal": "63f5dd228cec41e6c95de0e5",
-            "Pratapgarh": "63f600858cec41e6c9607513",
-            "Pushkar": "63f5cfd78cec41e6c95cf8dd",
-            "RAMGARH SHEKAWATI": "63f5fb3d8cec41e6c9601092",
-            "RENI": "63f5d1bc8cec41e6c95d1dd9",
-            "RIYAN BADI": "63f5f6348cec41e6c95fbd5e",
-            "Rahuwas": "63f5e2538cec41e6c95e4ad7",
-            "Railmagra": "63f5f8ac8cec41e6c95fe5a1",
-            "Raipur": "6492b811882c8da84773714c",
-            "Raisinghnagar": "63f5e5b38cec41e6c95e8b67",
-            "Rajakhera": "63f5e3328cec41e6c95e5cb3",
-            "Rajgarh": "6492b810882c8da847737134",
-            "Rajsamand": "63f5f88c8cec41e6c95fe392",
-            "Ramganj Mandi": "63f5f4898cec41e6c95f9c98",
-            "Ramgarh": "6492b810882c8da84773712e",
-            "Ramgarh Pachwara": "63f5e2248cec41e6c95e475e",
-            "Ramsar": "63f5d71a8cec41e6c95d7aae",
-            "Rani": "63f5f7d68cec41e6c95fd7c9",
-            "Raniwara": "63f5edee8cec41e6c95f1f2e",
-            "Rashmi": "63f5def48cec41e6c95e068f",
-            "Ratangarh": "63f5e1288cec41e6c95e33c8",
-            "Ravla": "63f5e7ef8cec41e6c95eafac",
-            "Rawatbhata": "63f5df668cec41e6c95e0ff5",
-            "Rawatsar": "63f5e96d8cec41e6c95eca11",
-            "Reengus": "63f5fb678cec41e6c960131b",
-            "Reodar": "63f5fc048cec41e6c9601d6c",
-            "Rishabhdeo": "63f5ff498cec41e6c9605cfe",
-            "Rohat": "63f5f71e8cec41e6c95fcc41",
-            "Roopangarh": "63f5cfe88cec41e6c95cfa3f",
-            "Rupbas": "63f5da808cec41e6c95db1e3",
-            "SAJJANGARH": "63f5d3448cec41e6c95d3975",
-            "SARMATHURA": "63f5e3518cec41e6c95e5f3a",
-            "SEDWA": "63f5d78a8cec41e6c95d81f6",
-            "SURAJGARH": "63f5f0d28cec41e6c95f547e",
-            "Sabla": "63f5e4608cec41e6c95e744d",
-            "Sadulshahar": "63f5e52c8cec41e6c95e8267",
-            "Sagwara": "63f5e3d08cec41e6c95e6949",
-            "Sahara": "63f5dbc68cec41e6c95dc502",
-            "Sainthal": "63f5e27b8cec41e6c95e4dda",
-            "Salumbar": "63f5feda8cec41e6c96054a3",
-            "Samdari": "63f5d84c8cec41e6c95d8dfa",
-            "Sanchore": "63f5edcc8cec41e6c95f1c98",
-            "Sanganer": "63f5eb068cec41e6c95ee75f",
-            "Sangaria": "63f5e8238cec41e6c95eb366",
-            "Sangod": "63f5f4b58cec41e6c95f9fe2",
-            "Sanjhu": "63f5f6708cec41e6c95fc122",
-            "Sapotra": "63f5f3b88cec41e6c95f8c45",
-            "Sarada": "63f5ff208cec41e6c96059ff",
-            "Sardarshahar": "63f5e0ef8cec41e6c95e2f23",
-            "Sarwar": "63f5cfae8cec41e6c95cf59b",
-            "Sawai Madhopur": "63f5f9a68cec41e6c95ff5b3",
-            "Sawar": "63f5d0098cec41e6c95cfcd4",
-            "Sayla": "63f5ed7c8cec41e6c95f1699",
-            "Semari": "63f5ffc08cec41e6c96065d3",
-            "Sepau": "63f5e2f68cec41e6c95e57b4",
-            "Setrawa": "63f5f2f48cec41e6c95f7cd7",
-            "Shahbad": "6492b810882c8da847737130",
-            "Shahpura": "6492b811882c8da847737140",
-            "Shekhala": "63f5f2a98cec41e6c95f76e1",
-            "Sheo": "63f5d5768cec41e6c95d5f36",
-            "Sheoganj": "63f5fb9e8cec41e6c960169d",
-            "Shergarh": "63f5f1a48cec41e6c95f6327",
-            "ShriMahaveer Ji": "6492b811882c8da84773714a",
-            "Sidhmukh": "63f5e1708cec41e6c95e3941",
-            "Sikar": "63f5fa608cec41e6c9600221",
-            "Sikar Gramin": "63f5fb858cec41e6c96014fa",
-            "Sikrai": "63f5e1c08cec41e6c95e3fa9",
-            "Sikri": "63f5dacb8cec41e6c95db67b",
-            "Simalwara": "63f5e4018cec41e6c95e6cf2",
-            "Sindhari": "63f5d8058cec41e6c95d89a7",
-            "Sirohi": "63f5fbb88cec41e6c960182a",
-            "Siwana": "63f5d64a8cec41e6c95d6d74",
-            "Sojat": "63f5f6f98cec41e6c95fc9d3",
-            "Sri Madhopur": "63f5fac48cec41e6c96008c4",
-            "Sridungargarh": "63f5ddee8cec41e6c95df1a9",
-            "Sujangarh": "63f5e1408cec41e6c95e35d7",
-            "Sum": "6492b811882c8da847737146",
-            "Sumerpur": "63f5f79f8cec41e6c95fd43c",
-            "Sunel": "63f5efd58cec41e6c95f42b8",
-            "Suratgarh": "63f5e7638cec41e6c95ea640",
-            "Suroth": "63f5f3fc8cec41e6c95f91ad",
-            "TALERA": "63f5ded88cec41e6c95e0479",
-            "TINWARI": "63f5f26e8cec41e6c95f7226",
-            "Talawara": "63f5fa248cec41e6c95ffe1c",
-            "Tantoli": "63f5cff88cec41e6c95cfb77",
-            "Tapukara": "63f5d22b8cec41e6c95d2586",
-            "Taranagar": "63f5e0a98cec41e6c95e29ae",
-            "Tatgarh": "63f5cfdc8cec41e6c95cf94d",
-            "Tehla": "63f5d2178cec41e6c95d242b",
-            "Thanagazi": "63f5d1138cec41e6c95d112e",
-            "Tibi": "63f5e85c8cec41e6c95eb714",
-            "Tijara": "63f5d07f8cec41e6c95d05eb",
-            "Todabhim": "63f5f3288cec41e6c95f80ec",
-            "Todaraisingh": "63f5fcdb8cec41e6c9602db5",
-            "Tonk": "63f5fcb68cec41e6c9602aed",
-            "Tunga": "63f5ec708cec41e6c95f02cf",
-            "Uchhain": "63f5dabb8cec41e6c95db57a",
-            "Udaipurwati": "63f5f0ae8cec41e6c95f51eb",
-            "Uniara": "63f5fd1c8cec41e6c9603296",
-            "Vallabhnagar": "63f5fe9f8cec41e6c960503a",
-            "Vijainagar": "63f5e70f8cec41e6c95ea0f3",
-            "Vijaynagar": "63f5d0168cec41e6c95cfdd0",
-            "Viratnagar": "63f5ea618cec41e6c95edac6",
-            "WAZEERPUR": "63f5f9fb8cec41e6c95ffb6b",
-            "Weir": "63f5da2a8cec41e6c95dac4e",
-            "KOTA": "63f5f4088cec41e6c95f929e",
-            "JHUNJHUNU": "63f5f00c8cec41e6c95f46c1",
-            "CHITTORGARH": "63f5def38cec41e6c95e068c",
-            "UDAIPUR": "63f5fd6d8cec41e6c96038d6",
-            "JALORE": "63f5ed7b8cec41e6c95f1696",
-            "JHALAWAR": "63f5ee588cec41e6c95f26e7",
-            "DHOLPUR": "63f5e2ad8cec41e6c95e5212",
-            "Didwana Kuchaman": "6557432c25b718149fed3876",
-            "Kotputli-Behror": "6557432c25b718149fed3884",
-            "Khairthal-Tijara": "6557432c25b718149fed3878",
-            "Neem Ka Thana": "6557432c25b718149fed387b",
-            "Anoopgarh": "6557432c25b718149fed387e",
-            "Balotra": "6557432c25b718149fed387d",
-            "Sanchor": "6557432c25b718149fed3881"
-        },
-        "63f869bfd2e83876f03e7396": {
-            "Chungthang": "63f869ced2e83876f03e7519",
-            "Dentam": "63f86a00d2e83876f03e7a54",
-            "Dzongu": "63f869d7d2e83876f03e760f",
-            "Gangtok": "63f869bfd2e83876f03e739c",
-            "Gyalshing": "63f869f7d2e83876f03e7965",
-            "Jorethang": "63f869f0d2e83876f03e7892",
-            "Kabi": "63f869d2d2e83876f03e7590",
-            "Mangalbarey": "63f86a19d2e83876f03e7cd3",
-            "Mangan": "63f869d0d2e83876f03e7552",
-            "Namchi": "63f869dad2e83876f03e765e",
-            "Pakyong": "63f86a06d2e83876f03e7ad0",
-            "Rabdang": "63f869c9d2e83876f03e74a2",
-            "Rangpo": "63f86a10d2e83876f03e7bdd",
-            "Ravangla": "6492b813882c8da84773715a",
-            "Ravong": "63f869ebd2e83876f03e7804",
-            "Rongli": "63f86a0bd2e83876f03e7b6d",
-            "Soreng": "63f86a13d2e83876f03e7c27",
-            "Yangang": "63f869f4d2e83876f03e7902",
-            "Yuksom": "63f869fbd2e83876f03e79d0"
-        },
-        "63f9be9f519359b7438d08bb": {
-            "Agastheeswaram": "63f9c170519359b7438d4b70",
-            "Alandur": "63f9bea4519359b7438d0929",
-            "Alangudi": "63f9c3e5519359b7438d856a",
-            "Alangulam": "63f9cdd8519359b7438e6c4e",
-            "Alathur": "6492b813882c8da847737160",
-            "Ambasamudram": "63f9c868519359b7438ded10",
-            "Ambattur": "63f9bea0519359b7438d08c1",
-            "Ambur": "63f9cd8b519359b7438e653e",
-            "Aminjikarai": "63f9beac519359b7438d09ea",
-            "Anaicut": "63f9ca1a519359b7438e162b",
-            "Anaimalai": "63f9bee9519359b7438d0faf",
-            "Anchetty": "63f9c24a519359b7438d5fa3",
-            "Andimadam": "63f9cbb4519359b7438e3bed",
-            "Andipatti": "63f9c691519359b7438dc416",
-            "Anthiyur": "63f9c0b7519359b7438d3a81",
-            "Arakonam": "63f9cd3e519359b7438e5e6e",
-            "Arani": "63f9c89e519359b7438df23c",
-            "Aranthangi": "63f9c400519359b7438d87e4",
-            "Aravakurichi": "63f9c18b519359b7438d4e07",
-            "Arcot": "63f9cd4f519359b7438e5fd3",
-            "Ariyalur": "63f9cba5519359b7438e3a97",
-            "Aruppukkottai": "63f9cb5c519359b7438e3462",
-            "Athoor": "63f9c06a519359b7438d33aa",
-            "Attur": "63f9c4f2519359b7438d9e89",
-            "Avadi": "63f9c73c519359b7438dd314",
-            "Avanashi": "63f9cbd7519359b7438e3eed",
-            "Avudayarkoil": "63f9c425519359b7438d8b76",
-            "Ayanavaram": "63f9beac519359b7438d09fb",
-            "Bargur": "63f9c230519359b7438d5d38",
-            "Bhavani": "63f9c084519359b7438d35ce",
-            "Bhuvanagiri": "63f9bf98519359b7438d201c",
-            "Bodinayakanur": "63f9c67a519359b7438dc20b",
-            "Budalur": "63f9c653519359b7438dbea2",
-            "Chengalpattu": "63f9cc99519359b7438e4ff2",
-            "Chengam": "63f9c900519359b7438dfb2c",
-            "Cheranmahadevi": "63f9c88f519359b7438df0c4",
-            "Chetpet": "63f9c950519359b7438e02d2",
-            "Cheyyar": "63f9c8a8519359b7438df338",
-            "Cheyyur": "63f9ccf0519359b7438e5791",
-            "Chidambaram": "63f9bf28519359b7438d1581",
-            "Chinnasalem": "63f9cc7b519359b7438e4d47",
-            "Coimbatore North": "63f9bebc519359b7438d0b76",
-            "Coimbatore South": "63f9bec1519359b7438d0bff",
-            "Coonoor": "63f9c674519359b7438dc183",
-            "Cuddalore": "63f9bf08519359b7438d1285",
-            "Denkanikottai": "63f9c1ea519359b7438d56b1",
-            "Devakottai": "63f9c544519359b7438da645",
-            "Dharapuram": "63f9cbc6519359b7438e3d88",
-            "Dharmapuri": "6492b813882c8da84773715c",
-            "DindigulEast": "63f9c061519359b7438d32d1",
-            "DindigulWest": "63f9c05a519359b7438d322f",
-            "Edappadi": "63f9c4b2519359b7438d9896",
-            "Egmore": "63f9beac519359b7438d0a02",
-            "Eral": "63f9c9e3519359b7438e10cc",
-            "Erode": "63f9c0ac519359b7438d3994",
-            "Ettayapuram": "63f9c98f519359b7438e08d3",
-            "Gandarvakkottai": "63f9c3b7519359b7438d8157",
-            "Gangavalli": "63f9c4fb519359b7438d9f53",
-            "Gingee": "63f9ca3a519359b7438e194e",
-            "Gobichettipalayam": "63f9c08c519359b7438d3698",
-            "Gudalur": "63f9c665519359b7438dc02e",
-            "Gudiyatham": "63f9c9ec519359b7438e11b1",
-            "Guindy": "63f9beae519359b7438d0a25",
-            "Gujiliamparai": "63f9c070519359b7438d341a",
-            "Gummidipoondi": "63f9c696519359b7438dc49c",
-            "Harur": "63f9bfc1519359b7438d23f3",
-            "Hosur": "63f9c1b6519359b7438d520e",
-            "Ilayangudi": "63f9c56e519359b7438daa2e",
-            "Iluppur": "63f9c39d519359b7438d7edd",
-            "Jamunamarathoor": "63f9c982519359b7438e079c",
-            "K V Kuppam": "63f9ca31519359b7438e186e",
-            "KALVARAYAN HILLS": "63f9cc89519359b7438e4e84",
-            "KARIMANGALAM": "63f9c011519359b7438d2b5b",
-            "KILAKARAI": "63f9c492519359b7438d9591",
-            "KINATHUKADAVU": "63f9bed8519359b7438d0e0f",
-            "KOLLI HILLS": "63f9c35a519359b7438d78ae",
-            "KUMARAPALAYAM": "63f9c36c519359b7438d7a60",
-            "KUNDRATHUR": "63f9c141519359b7438d46fc",
-            "Kadaladi": "63f9c476519359b7438d92fa",
-            "Kadavur": "63f9c1a7519359b7438d50a3",
-            "Kadayampatti": "63f9c51b519359b7438da271",
-            "Kadayanallur": "63f9cde0519359b7438e6d13",
-            "Kalaiyarkoil": "63f9c58a519359b7438dacdc",
-            "Kalasapakkam": "63f9c946519359b7438e01db",
-            "Kalavai": "63f9cd6a519359b7438e6243",
-            "Kalkulam": "63f9c15c519359b7438d49af",
-            "Kallakkurichi": "63f9cc40519359b7438e482a",
-            "Kalligudi": "63f9c2d9519359b7438d6c7c",
-            "Kamuthi": "63f9c46b519359b7438d9203",
-            "Kancheepuram": "63f9c0f5519359b7438d4011",
-            "Kandachipuram": "63f9cad6519359b7438e27dd",
-            "Kangeyam": "63f9cbbc519359b7438e3caa",
-            "Karaikkudi": "63f9c536519359b7438da503",
-            "Karambakudi": "63f9c3f4519359b7438d86e3",
-            "Kariapatti": "63f9cb24519359b7438e2f59",
-            "Karur": "63f9c194519359b7438d4ed1",
-            "Katpadi": "63f9c9fc519359b7438e1348",
-            "Kattumannarkoil": "63f9bf40519359b7438d17ea",
-            "Kayathar": "63f9c9d7519359b7438e0fa3",
-            "Killiyoor": "63f9c183519359b7438d4d31",
-            "Kilpennathur": "63f9c973519359b7438e0619",
-            "Kilvelur": "63f9c2f5519359b7438d6f1b",
-            "Kodaikanal": "63f9c04c519359b7438d30f0",
-            "Kodumudi": "63f9c0ce519359b7438d3cb2",
-            "Koothanallur": "63f9c7c6519359b7438ddea9",
-            "Kotagiri": "63f9c66f519359b7438dc104",
-            "Kovilpatti": "63f9c989519359b7438e084f",
-            "Krishnagiri": "6492b813882c8da84773715e",
-            "Krishnarayapuram": "63f9c198519359b7438d4f41",
-            "Kudavasal": "63f9c75e519359b7438dd5d3",
-            "Kulathur": "63f9c3a9519359b7438d800b",
-            "Kulithalai": "63f9c19d519359b7438d4fc0",
-            "Kumbakonam": "63f9c5ab519359b7438dafda",
-            "Kundah": "63f9c678519359b7438dc1d5",
-            "Kunnam": "63f9c393519359b7438d7dee",
-            "Kurinjipadi": "63f9bf1a519359b7438d1435",
-            "Kuthalam": "63f9ce12519359b7438e71e6",
-            "Lalgudi": "63f9c807519359b7438de43c",
-            "MADURAI EAST": "63f9c2b7519359b7438d696a",
-            "MADURAI WEST": "63f9c2cd519359b7438d6b83",
-            "MARAKANAM": "63f9cac9519359b7438e26af",
-            "MARUNGAPURI": "63f9c840519359b7438de98c",
-            "MOHANUR": "63f9c370519359b7438d7ad0",
-            "Madathukulam": "63f9cbf7519359b7438e41cd",
-            "Madukkari": "63f9bee5519359b7438d0f49",
-            "Madurai North": "63f9c260519359b7438d61a2",
-            "Madurai South": "63f9c2b1519359b7438d68cd",
-            "Maduranthakam": "63f9ccc4519359b7438e53c0",
-            "Maduravoyal": "63f9bea8519359b7438d0996",
-            "Mambalam": "63f9bead519359b7438d0a09",
-            "Manachanallur": "63f9c7fd519359b7438de354",
-            "Manamadurai": "63f9c565519359b7438da95f",
-            "Manamelkudi": "63f9c416519359b7438d8a02",
-            "Manapparai": "63f9c830519359b7438de83b",
-            "Manmangalam": "63f9c1ac519359b7438d5118",
-            "Mannargudi": "63f9c799519359b7438ddad6",
-            "Manur": "63f9c888519359b7438df022",
-            "Mathavaram": "63f9bea2519359b7438d08f0",
-            "Mayiladuthurai": "63f9ce04519359b7438e70a4",
-            "Melmalaiyanur": "63f9cae4519359b7438e2933",
-            "Melur": "63f9c24d519359b7438d5fe8",
-            "Mettupalayam": "63f9beaf519359b7438d0a3c",
-            "Mettur": "63f9c497519359b7438d9617",
-            "Modakkurichi": "63f9c0c4519359b7438d3bb6",
-            "Mudukulathur": "63f9c462519359b7438d911b",
-            "Musiri": "63f9c7db519359b7438de058",
-            "Mylapore": "63f9beae519359b7438d0a2c",
-            "Nagapattinam": "63f9c2e3519359b7438d6d6b",
-            "Nallampalli": "63f9c019519359b7438d2c25",
-            "Namakkal": "63f9c33f519359b7438d7634",
-            "Nambiyur": "63f9c0d7519359b7438d3d6d",
-            "Nanguneri": "63f9c871519359b7438dede4",
-            "Nannilam": "63f9c76d519359b7438dd710",
-            "Natham": "63f9c044519359b7438d3017",
-            "Natrampalli": "63f9cdb1519359b7438e688f",
-            "Needamangalam": "63f9c78e519359b7438dd9d5",
-            "Nemili": "63f9cd5c519359b7438e6106",
-            "Nilakkottai": "63f9c050519359b7438d314c",
-            "Oddanchatram": "63f9c02d519359b7438d2e01",
-            "Omalur": "63f9c4a2519359b7438d9722",
-            "Orathanadu": "63f9c5fd519359b7438db6f9",
-            "Ottapidaram": "63f9c9ad519359b7438e0bac",
-            "Palakkodu": "63f9bfb2519359b7438d228e",
-            "Palani": "63f9c020519359b7438d2cc4",
-            "Palayamkottai": "63f9c85b519359b7438debe2",
-            "Palladam": "63f9cbe0519359b7438e3fbc",
-            "Pallavaram": "63f9cd22519359b7438e5bff",
-            "Pallipattu": "63f9c701519359b7438dcdff",
-            "Panruti": "63f9bef0519359b7438d104e",
-            "Panthalur": "63f9c662519359b7438dbfe1",
-            "Papanasam": "63f9c5c6519359b7438db248",
-            "Pappireddipatti": "63f9bfe5519359b7438d2756",
-            "Paramakudi": "63f9c44e519359b7438d8f4d",
-            "Paramathi-Velur": "63f9c34e519359b7438d7794",
-            "Pattukkottai": "63f9c618519359b7438db96c",
-            "Pennagaram": "63f9c005519359b7438d2a37",
-            "Peraiyur": "63f9c293519359b7438d6617",
-            "Perambalur": "63f9c381519359b7438d7c69",
-            "Perambur": "63f9bead519359b7438d0a10",
-            "Peravurani": "63f9c63f519359b7438dbcd9",
-            "Periyakulam": "63f9c67d519359b7438dc258",
-            "Pernambut": "63f9ca2a519359b7438e17bd",
-            "Perundurai": "63f9c099519359b7438d37cb",
-            "Perur": "63f9bedf519359b7438d0ec0",
-            "Pethanaickanpalayam": "63f9c511519359b7438da184",
-            "Pochampalli": "63f9c201519359b7438d58cf",
-            "Pollachi": "63f9bec3519359b7438d0c1a",
-            "Polur": "63f9c8ea519359b7438df918",
-            "Ponnamaravathi": "63f9c3da519359b7438d8473",
-            "Ponneri": "63f9c6ab519359b7438dc66a",
-            "Poonamallee": "63f9c731519359b7438dd20e",
-            "Pudukkottai": "63f9c3c0519359b7438d8212",
-            "Pugalur": "63f9c1b0519359b7438d5183",
-            "Purasawalkam": "63f9bead519359b7438d0a17",
-            "R K PET": "63f9c743519359b7438dd3ac",
-            "RAJASINGAMANGALAM": "63f9c48a519359b7438d94cc",
-            "Radhapuram": "63f9c880519359b7438def5d",
-            "Rajapalayam": "63f9cb02519359b7438e2c13",
-            "Ramanathapuram": "63f9c480519359b7438d93d3",
-            "Rameswaram": "63f9c489519359b7438d94c0",
-            "Rasipuram": "63f9c329519359b7438d7425",
-            "SENDAMANGALAM": "63f9c35f519359b7438d793c",
-            "Salem": "63f9c4c2519359b7438d9a23",
-            "Salem South": "63f9c502519359b7438da009",
-            "Salem West": "63f9c50b519359b7438da0f1",
-            "Sankarankoil": "63f9cdbc519359b7438e699e",
-            "Sankarapuram": "63f9cc20519359b7438e455d",
-            "Sankari": "6492b813882c8da847737162",
-            "Sathankulam": "63f9c9d1519359b7438e0f24",
-            "Sathyamangalam": "63f9c075519359b7438d3496",
-            "Sattur": "63f9cb6f519359b7438e3603",
-            "Sendurai": "63f9cb8c519359b7438e3859",
-            "Shenkottai": "63f9cdd4519359b7438e6bd9",
-            "Sholinganallur": "63f9bea5519359b7438d094e",
-            "Sholinghur": "63f9cd75519359b7438e633a",
-            "Shoolagiri": "63f9c237519359b7438d5dd0",
-            "Singampunari": "63f9c581519359b7438dac0d",
-            "Sirkali": "63f9cdf1519359b7438e6ecc",
-            "Sivaganga": "63f9c557519359b7438da80e",
-            "Sivagiri": "63f9cdb7519359b7438e692e",
-            "Sivakasi": "63f9cb10519359b7438e2d75",
-            "Srimushnam": "63f9bfa8519359b7438d218b",
-            "Sriperumbudur": "63f9c0de519359b7438d3e16",
-            "Srirangam": "63f9c81a519359b7438de62d",
-            "Srivaikuntam": "63f9c9c0519359b7438e0d72",
-            "Srivilliputhur": "63f9cb0a519359b7438e2cd8",
-            "Sulur": "63f9beb3519359b7438d0a9d",
-            "THANDRAMPET": "63f9c91a519359b7438dfda4",
-            "THIRUPPARANKUNDRAM": "63f9c2d4519359b7438d6bf3",
-            "THIRUVENNAINALLUR": "63f9caf4519359b7438e2ac5",
-            "Tambaram": "63f9cc93519359b7438e4f64",
-            "Tenkasi": "63f9cdcc519359b7438e6b14",
-            "Thalaivasal": "63f9c521519359b7438da304",
-            "Thalavadi": "63f9c0c0519359b7438d3b41",
-            "Thanjavur": "63f9c5ef519359b7438db5bc",
-            "Tharangambadi": "63f9ce1e519359b7438e730f",
-            "Theni": "63f9c683519359b7438dc2d7",
-            "Thirukkuvalai": "63f9c300519359b7438d7030",
-            "Thirumangalam": "63f9c2a4519359b7438d679a",
-            "Thirumayam": "63f9c3c8519359b7438d82dc",
-            "Thiruppathur": "63f9c52a519359b7438da3da",
-            "Thiruppuvanam": "63f9c578519359b7438dab34",
-            "Thiruthuraipoondi": "63f9c7b4519359b7438ddd17",
-            "Thiruvaiyaru": "63f9c5e2519359b7438db4a2",
-            "Thiruvallur": "63f9c70a519359b7438dceb0",
-            "Thiruvarur": "63f9c77e519359b7438dd87f",
-            "Thiruvattar": "63f9c17c519359b7438d4c8f",
-            "Thiruverumbur": "63f9c82a519359b7438de79e",
-            "Thiruvidaimarudur": "63f9c597519359b7438dae1b",
-            "Thoothukkudi": "63f9c9b9519359b7438e0ccb",
-            "Thottiyam": "63f9c7d4519359b7438ddfc0",
-            "Thovala": "63f9c168519359b7438d4ab5",
-            "Thuraiyur": "63f9c7e9519359b7438de18b",
-            "Tindivanam": "63f9ca60519359b7438e1ccf",
-            "Tiruchendur": "63f9c9c9519359b7438e0e64",
-            "Tiruchengode": "63f9c315519359b7438d722a",
-            "Tiruchirappalli East": "63f9c84a519359b7438dea6f",
-            "Tiruchirappalli West": "63f9c827519359b7438de75b",
-            "Tiruchuli": "63f9cb3a519359b7438e3172",
-            "Tirukalukundram": "63f9ccaa519359b7438e517a",
-            "Tirukkoyilur": "63f9cc0d519359b7438e43ad",
-            "Tirunelveli": "63f9c84c519359b7438deaaa",
-            "Tirupathur": "63f9cd9e519359b7438e66da",
-            "Tiruporur": "63f9cd0c519359b7438e5a18",
-            "TiruppurNorth": "63f9cbfc519359b7438e4229",
-            "Tiruppursouth": "63f9cbfd519359b7438e424e",
-            "Tiruttani": "63f9c6f0519359b7438dcc6d",
-            "Tiruvadanai": "63f9c441519359b7438d8e10",
-            "Tiruvannamalai": "63f9c929519359b7438dff13",
-            "Tiruvengadam": "63f9cde6519359b7438e6dbf",
-            "Tiruvottiyur": "63f9beaa519359b7438d09b6",
-            "Tisayanvilai": "63f9c899519359b7438df1ca",
-            "Tittakudi": "63f9bf75519359b7438d1cd0",
-            "Tondiarpet": "63f9bead519359b7438d0a1e",
-            "Udayarpalayam": "63f9cb92519359b7438e38e7",
-            "Udhagamandalam": "63f9c66a519359b7438dc0a3",
-            "Udumalaipettai": "63f9cbe7519359b7438e404f",
-            "Ulundurpettai": "63f9cc59519359b7438e4a3e",
-            "Usilampatti": "63f9c285519359b7438d64f8",
-            "Uthamapalayam": "63f9c687519359b7438dc329",
-            "Uthangarai": "63f9c209519359b7438d598f",
-            "Uthiramerur": "63f9c115519359b7438d42f7",
-            "Uthukkottai": "63f9c6d8519359b7438dca5e",
-            "Uthukuli": "63f9cc02519359b7438e42b4",
-            "VEMBAKOTTAI": "63f9cb7d519359b7438e3718",
-            "Vadipatti": "63f9c273519359b7438d6348",
-            "Valangaiman": "63f9c74c519359b7438dd46e",
-            "Valparai": "63f9bed1519359b7438d0d70",
-            "Vandalur": "63f9cd25519359b7438e5c4c",
-            "Vandavasi": "63f9c8c6519359b7438df5d3",
-            "Vaniyambadi": "63f9cd80519359b7438e6438",
-            "Vanur": "63f9ca83519359b7438e204b",
-            "Vazhapadi": "63f9c4e2519359b7438d9d1f",
-            "Vedaranyam": "63f9c307519359b7438d70e1",
-            "Vedasandur": "63f9c038519359b7438d2f20",
-            "Veerakeralamputhur": "63f9cdc6519359b7438e6a90",
-            "Velachery": "63f9beae519359b7438d0a33",
-            "Vellore": "63f9ca0a519359b7438e1499",
-            "Vembakkam": "63f9c960519359b7438e0450",
-            "Veppanthattai": "63f9c38a519359b7438d7d10",
-            "Vikravandi": "63f9cab1519359b7438e245f",
-            "Vilathikulam": "63f9c99a519359b7438e09ed",
-            "Vilavancode": "63f9c154519359b7438d48e5",
-            "Viluppuram": "63f9ca96519359b7438e21e2",
-            "Viralimalai": "63f9c43a519359b7438d8d58",
-            "Virudhachalam": "63f9bf5b519359b7438d1a53",
-            "Virudhunagar": "63f9cb19519359b7438e2e49",
-            "WATRAP": "63f9cb86519359b7438e37d3",
-            "Walajabad": "63f9c130519359b7438d4565",
-            "Wallajah": "63f9cd2f519359b7438e5d27",
-            "Yercaud": "63f9c4ce519359b7438d9b51",
-            "annur": "63f9bed1519359b7438d0d77",
-            "veppur": "63f9bf8d519359b7438d1f02",
-            "COIMBATORE": "63f9beae519359b7438d0a39",
-            "THE NILGIRIS": "63f9c662519359b7438dbfde",
-            "KALLAKURICHI": "63f9cc0d519359b7438e43aa",
-            "TUTICORIN": "63f9c989519359b7438e084c",
-            "VILLUPURAM": "63f9ca3a519359b7438e194b",
-            "KANCHIPURAM": "63f9c0de519359b7438d3e13",
-            "KANNIYAKUMARI": "63f9c154519359b7438d48e2",
-            "TIRUPPUR": "63f9cbbc519359b7438e3ca7",
-            "MADURAI": "63f9c24d519359b7438d5fe5",
-            "TIRUCHIRAPPALLI": "63f9c7d4519359b7438ddfbd",
-            "DINDIGUL": "63f9c020519359b7438d2cc1",
-            "Ranipet": "63f9cd2f519359b7438e5d24"
-        },
-        "63f871f5c660ddb223457dca": {
-            "ADILABAD RURAL": "63f9cf0e519359b7438e89fc",
-            "ADILABAD URBAN": "63f9cebb519359b7438e824b",
-            "ANTHERGAON": "63f8730ec660ddb2234597a4",
-            "Abdullapurmet": "63f87215c660ddb223458097",
-            "Achampet": "63f87614c660ddb22345e030",
-            "Adavidevulapalli": "63f9d0c1519359b7438eb3cb",
-            "Adda Guduru": "63f8772ec660ddb22345f8d8",
-            "Addakal": "63f9cfdf519359b7438e9df8",
-            "Akkannapet": "63f875c9c660ddb22345d925",
-            "Alair": "63f876f6c660ddb22345f351",
-            "Alampur": "6492b813882c8da847737166",
-            "Alladurg": "63f9d013519359b7438ea30d",
-            "Allapalli": "63f874f3c660ddb22345c522",
-            "Alwal": "63f8781ac660ddb223460e1d",
-            "Amangal": "63f8720ec660ddb223457ffd",
-            "Amarchintha": "63f875fcc660ddb22345de06",
-            "Amberpet": "63f9cf29519359b7438e8c9e",
-            "Ameenpur": "63f87567c660ddb22345cfbd",
-            "Ameerpet": "63f9cf24519359b7438e8c26",
-            "Amrabad": "63f87612c660ddb22345dff7",
-            "Ananthagiri": "63f876ddc660ddb22345f113",
-            "Andole": "63f8753dc660ddb22345cbf5",
-            "Annapureddypalli": "63f874f5c660ddb22345c54c",
-            "Anumula": "63f9d0a8519359b7438eb16e",
-            "Armoor": "63f9d0dc519359b7438eb676",
-            "Asif Nagar": "63f9cf2c519359b7438e8ce5",
-            "Asifabad": "63f877cdc660ddb223460697",
-            "Aswapuram": "63f874bdc660ddb22345c04a",
-            "Aswaraopeta": "63f874e6c660ddb22345c3fd",
-            "Athmakur": "63f87409c660ddb22345af50",
-            "Atmakur": "63f875d2c660ddb22345da1a",
-            "Atmakur (M)": "63f876ffc660ddb22345f445",
-            "Atmakur (S)": "63f8768bc660ddb22345eb4f",
-            "B Pochampally": "63f87719c660ddb22345f6d7",
-            "BAZARHATNOOR": "63f9cef6519359b7438e87c1",
-            "BHEEMPUR": "63f9cf16519359b7438e8acd",
-            "Bachannapet": "63f87486c660ddb22345bada",
-            "Bachupally": "63f87814c660ddb223460d8c",
-            "Bahadurpura": "63f9cf2e519359b7438e8d11",
-            "Balanagar": "6492b814882c8da847737168",
-            "Balapur": "63f87224c660ddb223458207",
-            "Balkonda": "63f9d0e0519359b7438eb6e6",
-            "Balmoor": "63f87632c660ddb22345e307",
-            "Bandlaguda": "63f9cf2f519359b7438e8d31",
-            "Banswada": "63f873b6c660ddb22345a7a7",
-            "Bantwaram": "63f87758c660ddb22345fbd4",
-            "Basar": "63f87296c660ddb223458c9b",
-            "Basheerabad": "63f87773c660ddb22345fd5e",
-            "Bayyaram": "63f87476c660ddb22345b95a",
-            "Beerpur": "63f872e6c660ddb2234593e8",
-            "Bejjanki": "63f8757dc660ddb22345d1da",
-            "Bejjur": "63f877c2c660ddb223460576",
-            "Bela": "63f9cec7519359b7438e836c",
-            "Bellampally": "63f87362c660ddb223459fab",
-            "Bhadrachalam": "63f874cfc660ddb22345c224",
-            "Bhainsa": "63f87268c660ddb223458858",
-            "Bheemadevarpalli": "63f873f8c660ddb22345adb4",
-            "Bheemaram": "63f87386c660ddb22345a301",
-            "Bheemgal": "63f9d0e8519359b7438eb7b9",
-            "Bheemini": "63f8733cc660ddb223459c0a",
-            "Bhiknoor": "63f873e0c660ddb22345ab81",
-            "Bhongir": "63f8770ac660ddb22345f57f",
-            "Bhoothpur": "63f9cfdc519359b7438e9da6",
-            "Bhupalpally": "63f87436c660ddb22345b368",
-            "Bibinagar": "63f87712c660ddb22345f63f",
-            "Bibipet": "63f873e9c660ddb22345ac45",
-            "Bichkunda": "63f8739cc660ddb22345a52c",
-            "Bijinapally": "63f8762ec660ddb22345e288",
-            "Birkur": "63f873a2c660ddb22345a5c4",
-            "Boath": "63f9cefd519359b7438e885e",
-            "Bodhan": "63f9d0fd519359b7438eb9c8",
-            "Boinpalli": "63f8731ac660ddb2234598d0",
-            "Bomaraspeta": "63f8779ac660ddb22346014f",
-            "Bommalaramaram": "63f876e3c660ddb22345f17d",
-            "Bonakal": "63f9cf9c519359b7438e9799",
-            "Buggaram": "63f872e9c660ddb223459421",
-            "Burgampahad": "63f874d0c660ddb22345c230",
-            "ChandamPeta": "63f9d080519359b7438eadaa",
-            "Chandrugonda": "63f874e1c660ddb22345c381",
-            "Chandur": "6492b816882c8da84773717e",
-            "Chandurthi": "63f87317c660ddb223459897",
-            "Charakonda": "63f8764ec660ddb22345e584",
-            "Charminar": "63f9cf31519359b7438e8d56",
-            "Chegunta": "63f9d002519359b7438ea175",
-            "Chennaraopet": "63f87244c660ddb22345851c",
-            "Chennur": "63f87379c660ddb22345a1d6",
-            "Cherial": "63f875bac660ddb22345d7c5",
-            "Cherla": "63f874adc660ddb22345bebb",
-            "Chevella": "63f9d140519359b7438ec029",
-            "Chigurumamidi": "63f9cf4f519359b7438e9007",
-            "Chilkur": "63f876c8c660ddb22345ef23",
-            "Chilpched": "63f9d03e519359b7438ea738",
-            "Chilpur": "63f874a7c660ddb22345be1f",
-            "Chinnachintakunta": "63f9cfe2519359b7438e9e45",
-            "Chinnagudur": "63f87480c660ddb22345ba55",
-            "Chinnakodur": "63f87590c660ddb22345d388",
-            "Chinnambavi": "63f875f3c660ddb22345dd47",
-            "Chintalamanepally": "63f877fdc660ddb223460b11",
-            "ChinthaPally": "63f9d076519359b7438eacb1",
-            "Chinthakani": "63f9cf88519359b7438e95a5",
-            "Chinthalapalem": "63f876e0c660ddb22345f147",
-            "Chityal": "6492b814882c8da847737176",
-            "Chivemla": "63f87697c660ddb22345ec81",
-            "Choppadandi": "63f9cf3b519359b7438e8e46",
-            "Choutuppal": "63f8771ec660ddb22345f75b",
-            "Chowdapur": "63f877a8c660ddb2234602a9",
-            "Chowtakur": "63f8757bc660ddb22345d190",
-            "Chunchupalli": "63f874f9c660ddb22345c5af",
-            "Dahegoan": "63f877eac660ddb22346091a",
-            "Damargidda": "63f8787dc660ddb2234615ee",
-            "Damera": "63f87412c660ddb22345b036",
-            "Dameracherla": "63f9d0b7519359b7438eb2e1",
-            "Dammapeta": "63f874ebc660ddb22345c463",
-            "Dandepally": "63f87357c660ddb223459ea3",
-            "Danthalapalle": "63f87481c660ddb22345ba6b",
-            "Dasturabad": "63f8729dc660ddb223458d30",
-            "Devarakadra": "63f9cfd7519359b7438e9d22",
-            "Devarakonda": "63f9d083519359b7438eae01",
-            "Devaruppula": "63f874a1c660ddb22345bd83",
-            "Dhanwada": "63f87893c660ddb22346183d",
-            "Dharmapuri": "63f872bec660ddb223459015",
-            "Dharmaram": "63f87304c660ddb2234596a9",
-            "Dharmasagar": "63f873fdc660ddb22345ae35",
-            "Dharoor": "63f87654c660ddb22345e613",
-            "Dharpally": "63f9d114519359b7438ebc03",
-            "Dharur": "63f87745c660ddb22345fb28",
-            "Dhoolmitta": "63f875ccc660ddb22345d988",
-            "Dichpally": "63f9d110519359b7438ebb93",
-            "Dilawarpur": "63f87282c660ddb223458ab8",
-            "Doma": "63f87780c660ddb22345fea7",
-            "Domakonda": "63f873e3c660ddb22345abce",
-            "Dornakal": "63f87473c660ddb22345b917",
-            "Doulathabad": "63f8779ec660ddb2234601ce",
-            "Doultabad": "63f875a3c660ddb22345d563",
-            "Dubbak": "63f87587c660ddb22345d2b7",
-            "Duggondi": "63f8722cc660ddb2234582dc",
-            "Dummugudem": "63f874bfc660ddb22345c083",
-            "Eligaid": "63f87302c660ddb22345967a",
-            "Elkathurthy": "63f873fac660ddb22345adf2",
-            "Ellandakunta": "63f9cf5e519359b7438e9185",
-            "Enkoor": "63f9cf6c519359b7438e92ea",
-            "Eturunagaram": "63f87821c660ddb223460ede",
-            "Farooqnagar": "63f871f7c660ddb223457e01",
-            "GADIGUDA": "63f9cf1d519359b7438e8b7b",
-            "GUDIHATNOOR": "63f9ced6519359b7438e84e7",
-            "Gadwal": "63f87657c660ddb22345e66f",
-            "Gajwel": "63f875a7c660ddb22345d5c9",
-            "Gambhiraopet": "63f87327c660ddb223459a13",
-            "Gandeed": "63f9cfad519359b7438e9938",
-            "Gandhari": "63f873b0c660ddb22345a700",
-            "Gandimaisamma Dundigal": "63f87815c660ddb223460d98",
-            "Gandipet": "63f8721ac660ddb223458120",
-            "Gangadhara": "63f9cf33519359b7438e8d84",
-            "Gangaram": "63f8747cc660ddb22345b9ea",
-            "Ganneruvaram": "63f9cf5c519359b7438e9151",
-            "GaridePally": "63f876c5c660ddb22345eec7",
-            "Garla": "63f8747ac660ddb22345b9b1",
-            "Geesugonda": "63f8723ac660ddb223458435",
-            "Ghanpur": "63f875cec660ddb22345d9b4",
-            "Ghanpur (Mulug)": "63f8743ac660ddb22345b3d3",
-            "Ghanpur (Station)": "63f8748cc660ddb22345bb79",
-            "Ghatkesar": "63f8780dc660ddb223460ce3",
-            "Ghattu": "63f87661c660ddb22345e74a",
-            "Golconda": "63f9cf2d519359b7438e8d00",
-            "Gollapalli": "63f872c5c660ddb2234590d2",
-            "Gopalpeta": "63f875e3c660ddb22345dba8",
-            "Govindaraopet": "63f87839c660ddb223461182",
-            "Gudur": "63f87451c660ddb22345b60f",
-            "Gummadidala": "63f87568c660ddb22345cfdd",
-            "Gundala": "6492b819882c8da84773718a",
-            "GundlaPally": "63f9d07b519359b7438ead3a",
-            "Gurrampode": "63f9d099519359b7438eb005",
-            "Hajipur": "6492b814882c8da847737170",
-            "Hanamkonda": "63f8740bc660ddb22345af8e",
-            "Hanwada": "63f9cfb1519359b7438e9999",
-            "Hasanparthy": "63f87400c660ddb22345ae78",
-            "Hathnoora": "63f87542c660ddb22345cc7e",
-            "Havelighanapur": "63f9d033519359b7438ea627",
-            "Hayathnagar": "63f9d134519359b7438ebf0e",
-            "Husnabad": "63f87585c660ddb22345d27e",
-            "Huzurabad": "63f9cf54519359b7438e9088",
-            "Huzurnagar": "63f876cdc660ddb22345efa4",
-            "Ibrahimpatnam": "6492b818882c8da847737182",
-            "Ichoda": "63f9ceee519359b7438e8710",
-            "Ieeja": "63f87666c660ddb22345e7ba",
-            "Illanthakunta": "63f8732fc660ddb223459adc",
-            "Inavole": "63f8740ec660ddb22345afd8",
-            "Indalwai": "63f9d123519359b7438ebd6e",
-            "Inderavelly": "63f9cedb519359b7438e8552",
-            "Itikyala": "63f8766ac660ddb22345e81b",
-            "JAINATH": "63f9cebb519359b7438e8257",
-            "JILLED CHOWDERGUDEM": "63f87220c660ddb2234581b5",
-            "Jadcherla": "63f9cfc3519359b7438e9b50",
-            "Jagdevpur": "63f875acc660ddb22345d652",
-            "Jagitial": "63f872ccc660ddb223459180",
-            "Jagitial Rural": "63f872e1c660ddb223459382",
-            "Jainoor": "63f877d9c660ddb2234607cf",
-            "Jaipur": "6492b814882c8da847737172",
-            "JajiReddyGudem": "63f87690c660ddb22345ebbf",
-            "Jakranpally": "63f9d0f1519359b7438eb88a",
-            "Jammikunta": "63f9cf49519359b7438e8f81",
-            "Jangoan": "63f8749ac660ddb22345bcda",
-            "Jannaram": "63f87351c660ddb223459e1f",
-            "Jharasangam": "63f87529c660ddb22345ca46",
-            "Jinnaram": "63f8755ac660ddb22345ce7a",
-            "Jukkal": "63f87396c660ddb22345a48f",
-            "Julapalli": "63f87301c660ddb223459655",
-            "Julurpadu": "63f874dfc660ddb22345c357",
-            "Kaddam Peddur": "63f87250c660ddb22345862a",
-            "Kadthal": "63f87225c660ddb223458231",
-            "Kagaznagar": "63f877c6c660ddb2234605e6",
-            "Kalher": "63f8750cc660ddb22345c785",
-            "Kalluru": "63f9cf93519359b7438e96b4",
-            "Kaloor Thimmandoddi": "63f8767bc660ddb22345e9d1",
-            "Kalwakurthy": "63f87609c660ddb22345df17",
-            "Kamalapur": "63f873f4c660ddb22345ad62",
-            "Kamanpur": "63f872ebc660ddb223459457",
-            "Kamareddy": "63f873dbc660ddb22345ab16",
-            "Kamepalli": "63f9cf62519359b7438e91f4",
-            "Kammarpally": "63f9d0e5519359b7438eb762",
-            "Kanagal": "63f9d092519359b7438eaf68",
-            "Kandi": "63f87564c660ddb22345cf6b",
-            "Kandukur": "6492b818882c8da847737184",
-            "Kangti": "63f874fac660ddb22345c5d1",
-            "Kannaigudem": "63f87872c660ddb2234614c6",
-            "Kannepally": "63f87388c660ddb22345a33f",
-            "Kapra": "63f87816c660ddb223460dcc",
-            "Karakagudem": "63f874f7c660ddb22345c580",
-            "Karimnagar": "63f9cf59519359b7438e9109",
-            "Karimnagar Rural": "63f9cf42519359b7438e8ee0",
-            "Kasipet": "63f8735dc660ddb223459f40",
-            "Kataram": "63f87417c660ddb22345b0aa",
-            "Kathlapur": "63f872d6c660ddb223459282",
-            "Kattangur": "63f9d04f519359b7438ea8e1",
-            "Keesara": "63f8780ac660ddb223460c91",
-            "Kerameri": "63f877abc660ddb2234602f3",
-            "Kesamudram": "63f87461c660ddb22345b75f",
-            "Keshampet": "63f87204c660ddb223457f18",
-            "KethePally": "63f9d056519359b7438ea99e",
-            "Khairatabad": "63f9cf2b519359b7438e8cd4",
-            "Khammam (Rural)": "63f9cf77519359b7438e93fe",
-            "Khanapur": "6492b815882c8da84773717c",
-            "Khazipet": "63f8740dc660ddb22345afb8",
-            "Khila Warangal": "63f8724ec660ddb2234585f4",
-            "Kodad": "63f876cbc660ddb22345ef66",
-            "Kodair": "63f87643c660ddb22345e46b",
-            "Kodakandla": "63f874a4c660ddb22345bdc6",
-            "Kodangal": "63f87796c660ddb2234600ee",
-            "Kodimial": "63f872dac660ddb2234592e3",
-            "Koheda": "63f87581c660ddb22345d22c",
-            "Kohir": "63f87525c660ddb22345c9d1",
-            "Koilkonda": "63f9cfcf519359b7438e9c67",
-            "Kollapur": "63f87646c660ddb22345e4c7",
-            "Komuravelli": "63f875c7c660ddb22345d8f6",
-            "Konaraopet": "63f8731fc660ddb223459951",
-            "Kondamallepally": "63f9d0c9519359b7438eb494",
-            "Kondapak": "63f87598c660ddb22345d44f",
-            "Kondapur": "63f87553c660ddb22345cdc7",
-            "Kondurg": "63f871f5c660ddb223457dd1",
-            "Konijerla": "63f9cf8b519359b7438e95f7",
-            "Korutla": "63f872d1c660ddb2234591f7",
-            "Kosgi": "63f87877c660ddb22346154c",
-            "Kotagiri": "6492b817882c8da847737180",
-            "Kotapally": "63f87365c660ddb223459fe9",
-            "Kotepally": "63f877a5c660ddb223460252",
-            "Kothaguda": "63f87447c660ddb22345b51d",
-            "Kothakota": "63f875d6c660ddb22345da76",
-            "Kothapally": "63f9cf56519359b7438e90cb",
-            "Kothur": "63f87200c660ddb223457ed0",
-            "Koutala": "63f877bec660ddb223460510",
-            "Kowdipally": "63f9d019519359b7438ea3a7",
-            "Krishna": "63f878a6c660ddb223461a4f",
-            "Kubeer": "63f87260c660ddb223458798",
-            "Kukatpally": "63f87819c660ddb223460dfd",
-            "Kulcharam": "63f9d00a519359b7438ea232",
-            "Kulkacharla": "63f87786c660ddb22345ff35",
-            "Kuntala": "63f8725dc660ddb223458746",
-            "Kuravi": "63f8746fc660ddb22345b8b1",
-            "Kusumanchi": "63f9cf73519359b7438e93a2",
-            "Laxmanchanda": "63f87287c660ddb223458b34",
-            "Laxmidevipalli": "63f874f1c660ddb22345c4f3",
-            "Lingal": "63f87637c660ddb22345e377",
-            "LingalaGhanpur": "63f8749ec660ddb22345bd3b",
-            "Lingampet": "63f873d2c660ddb22345aa36",
-            "Lingapur": "63f877f7c660ddb223460a7c",
-            "Lokeswaram": "63f8727ac660ddb223458a1b",
-            "Luxettipet": "63f8736fc660ddb22345a0dd",
-            "MAVALA": "63f9cf16519359b7438e8ab7",
-            "MUTHARAM MAHADEVPUR": "63f87425c660ddb22345b1df",
-            "Machareddy": "63f873a6c660ddb22345a616",
-            "Madanapur": "63f875f8c660ddb22345ddb9",
-            "Maddirala": "63f876d7c660ddb22345f092",
-            "Maddur": "6492b815882c8da84773717a",
-            "Madgul": "63f87211c660ddb223458040",
-            "Madhira": "63f9cf9f519359b7438e97f5",
-            "Madnoor": "63f8738dc660ddb22345a3bb",
-            "Madugulapally": "63f9d0c2519359b7438eb3e6",
-            "Maganoor": "63f878a0c660ddb223461997",
-            "Mahabubabad": "63f87465c660ddb22345b7b6",
-            "Mahabubnagar Rural": "63f9cfe6519359b7438e9eb0",
-            "Mahabubnagar Urban": "63f9cfca519359b7438e9c06",
-            "Mahadevpur": "63f8741ec660ddb22345b147",
-            "Maheshwaram": "63f9d155519359b7438ec235",
-            "Makloor": "63f9d0f4519359b7438eb8e1",
-            "Makthal": "63f87898c660ddb2234618d2",
-            "Maldakal": "63f8765cc660ddb22345e6d5",
-            "Malharrao": "63f87429c660ddb22345b24f",
-            "Malkajgiri": "63f8780ac660ddb223460c85",
-            "Mallapur": "63f872b1c660ddb223458ef9",
-            "Mallial": "63f872c9c660ddb223459133",
-            "Mamada": "63f8728bc660ddb223458b90",
-            "Manakondur": "63f9cf3e519359b7438e8e84",
-            "Manchal": "63f9d167519359b7438ec408",
-            "Mancherial": "63f87373c660ddb22345a148",
-            "Mandamarri": "63f8736dc660ddb22345a0a4",
-            "Mangapet": "63f87828c660ddb223460f9e",
-            "Manoharabad": "63f9d03b519359b7438ea6e6",
-            "Manoor": "63f87500c660ddb22345c65a",
-            "Manopad": "63f87670c660ddb22345e8ba",
-            "Manthani": "63f872edc660ddb22345948b",
-            "Manuguru": "63f874bcc660ddb22345c02f",
-            "Marikal": "63f878a4c660ddb223461a07",
-            "Maripeda": "63f8746bc660ddb22345b850",
-            "Markook": "63f875c2c660ddb22345d87f",
-            "Marpalle": "63f87730c660ddb22345f918",
-            "Marredpally": "63f9cf27519359b7438e8c6d",
-            "Marriguda": "63f9d072519359b7438eac37",
-            "Masaipet": "63f9d042519359b7438ea77b",
-            "MattamPally": "63f876cfc660ddb22345efdd",
-            "Medak": "63f9cffb519359b7438ea0c2",
-            "Medchal": "63f87802c660ddb223460baf",
-            "Medipalli": "63f872cdc660ddb223459196",
-            "Medipally": "63f87817c660ddb223460dd3",
-            "MellaChervu": "63f876d3c660ddb22345f02f",
-            "Mendora": "63f9d125519359b7438ebda2",
-            "Metpalli": "63f872d3c660ddb22345923f",
-            "Midjil": "63f9cfbf519359b7438e9aef",
-            "Mirdoddi": "63f875a0c660ddb22345d50c",
-            "Miryalaguda": "63f9d0bb519359b7438eb347",
-            "Mogudampally": "63f8756bc660ddb22345d01b",
-            "Mogullapally": "63f8742ec660ddb22345b2bf",
-            "Mohammadabad": "6492b814882c8da84773716a",
-            "Moinabad": "63f9d13a519359b7438ebfa5",
-            "Mominpet": "63f87735c660ddb22345f9a6",
-            "Moosapet": "63f9cfea519359b7438e9efd",
-            "Morthad": "63f9d0e3519359b7438eb72e",
-            "Mosara": "63f9d12c519359b7438ebe51",
-            "Motakonduru": "63f8772ac660ddb22345f89f",
-            "Mothey": "63f8769bc660ddb22345ecec",
-            "Mothkur": "63f876fcc660ddb22345f3f3",
-            "Mudhole": "63f87276c660ddb2234589a6",
-            "Mudigonda": "63f9cf7f519359b7438e94bb",
-            "Muduchinthalapally": "63f8781bc660ddb223460e51",
-            "Mugpal": "63f9d120519359b7438ebd1c",
-            "Mulkalapally": "63f874e3c660ddb22345c3b5",
-            "Mulug": "6492b814882c8da847737174",
-            "Munagala": "63f876afc660ddb22345ed9f",
-            "Munipally": "63f87531c660ddb22345caf7",
-            "Munugode": "63f9d06d519359b7438eabc7",
-            "Mupkal": "63f9d127519359b7438ebdcc",
-            "Musheerabad": "63f9cf28519359b7438e8c83",
-            "Mustabad": "63f8732bc660ddb223459a6f",
-            "Mutharam (Manthani)": "63f872f5c660ddb22345953c",
-            "NADIKUDA": "63f87414c660ddb22345b06a",
-            "NIZAMABAD SOUTH": "63f9d12c519359b7438ebe4a",
-            "Nadigudem": "63f876acc660ddb22345ed52",
-            "Nagalgidda": "63f87572c660ddb22345d0c4",
-            "Nagaram": "63f876d5c660ddb22345f05e",
-            "Nagarkurnool": "63f87628c660ddb22345e204",
-            "Nagireddypet": "63f873cdc660ddb22345a9c6",
-            "Nakrekal": "63f9d053519359b7438ea94c",
-            "Nalgonda": "63f9d062519359b7438eaac6",
-            "Nallabelli": "63f87229c660ddb22345827b",
-            "Nampally": "6492b814882c8da847737178",
-            "Nandigama": "63f8721fc660ddb22345819a",
-            "Nandipet": "63f9d0d5519359b7438eb5cf",
-            "Nangnoor": "63f87595c660ddb22345d3ee",
-            "Narayanaraopet": "63f875cbc660ddb22345d96d",
-            "Narayankhed": "63f87505c660ddb22345c6d4",
-            "Narayanpet": "63f87888c660ddb223461717",
-            "Narayanpur": "6492b819882c8da84773718c",
-            "Narketpally": "63f9d04b519359b7438ea86c",
-            "Narmetta": "63f8748ac660ddb22345bb4f",
-            "Narnoor": "63f9cee1519359b7438e85d1",
-            "Narsampet": "63f8723dc660ddb223458487",
-            "Narsapur": "63f9d02b519359b7438ea567",
-            "Narsapur G": "63f8729fc660ddb223458d5a",
-            "Narsimhulapet": "63f87469c660ddb22345b81c",
-            "Narsingi": "63f9d03a519359b7438ea6c1",
-            "Narwa": "63f87894c660ddb22346186c",
-            "Naspur": "63f87380c660ddb22345a282",
-            "Nasurullabad": "63f873efc660ddb22345accb",
-            "Navipet": "63f9d0cf519359b7438eb52d",
-            "Nawabpet": "6492b814882c8da84773716c",
-            "Nekkonda": "63f87246c660ddb223458550",
-            "Nelakondapalli": "63f9cf84519359b7438e9530",
-            "Nellikudur": "63f8745dc660ddb22345b70d",
-            "Nennel": "63f87346c660ddb223459d0d",
-            "Neradigonda": "63f9cf05519359b7438e8923",
-            "Nereducherla": "63f876c1c660ddb22345ee61",
-            "Neredugommu": "63f9d0cb519359b7438eb4c3",
-            "Nidmanoor": "63f9d0ad519359b7438eb1f7",
-            "Nirmal Rural": "63f872a7c660ddb223458e0d",
-            "Nirmal U": "63f87286c660ddb223458b23",
-            "Nizamabad North": "63f9d0fa519359b7438eb96f",
-            "Nizamabad Rural": "63f9d11b519359b7438ebcb6",
-            "Nizampet": "63f9d038519359b7438ea697",
-            "Nizamsagar": "63f873c1c660ddb22345a891",
-            "Nuthanakal": "63f87688c660ddb22345eafd",
-            "Nyalkal": "63f87517c660ddb22345c897",
-            "Odela": "63f8730cc660ddb22345976b",
-            "PALAKURTHY": "63f87311c660ddb2234597ec",
-            "Padara": "63f8764fc660ddb22345e5a9",
-            "Palakeedu": "63f876dac660ddb22345f0d0",
-            "Palakurthy": "63f87492c660ddb22345bc0e",
-            "Palimela": "63f87444c660ddb22345b4ba",
-            "Palvoncha": "63f874d4c660ddb22345c273",
-            "Pangal": "63f875e4c660ddb22345dbd7",
-            "Papannapet": "63f9cff6519359b7438ea03e",
-            "Pargi": "63f87789c660ddb22345ff87",
-            "Parkal": "63f87404c660ddb22345aed4",
-            "Parvathagiri": "63f8724bc660ddb2234585b1",
-            "Patancheru": "63f8755ec660ddb22345ced6",
-            "Pebbair": "63f875e9c660ddb22345dc47",
-            "Pedda Adesherlapally": "63f9d09f519359b7438eb08e",
-            "Pedda Kodapgal": "63f873f2c660ddb22345ad1d",
-            "Peddakothapally": "63f8763bc660ddb22345e3e2",
-            "Peddamandadi": "63f875dbc660ddb22345daeb",
-            "Peddapalli": "63f872fcc660ddb2234595e0",
-            "Peddavangara": "63f87484c660ddb22345baa4",
-            "Peddavoora": "63f9d0a4519359b7438eb103",
-            "Peddemul": "63f8775bc660ddb22345fc17",
-            "Pegadapalli": "63f872ddc660ddb223459330",
-            "Pembi": "63f8729ac660ddb223458cf2",
-            "Penchicalpet": "63f877f9c660ddb223460ab5",
-            "Penpahad": "63f876b2c660ddb22345edfb",
-            "Pentlavelli": "63f8764cc660ddb22345e55a",
-            "Penuballi": "63f9cf68519359b7438e927f",
-            "Pinapaka": "63f874a9c660ddb22345be5f",
-            "Pitlam": "63f873bac660ddb22345a808",
-            "Pudur": "63f8778fc660ddb223460042",
-            "Pulkal": "63f87539c660ddb22345cba3",
-            "Qutballapur": "63f87802c660ddb223460ba8",
-            "RAMAGIRI": "63f87313c660ddb223459834",
-            "RUDRANGI": "63f8733ac660ddb223459be1",
-            "Raghunadhapalem": "63f9cf7c519359b7438e9469",
-            "Ragunathpally": "63f87496c660ddb22345bc79",
-            "Raikal": "63f872b6c660ddb223458f69",
-            "Raikode": "63f8750fc660ddb22345c7d7",
-            "Raipole": "63f875c4c660ddb22345d8b3",
-            "Rajampet": "63f873e6c660ddb22345ac0c",
-            "Rajapeta": "63f876eec660ddb22345f28f",
-            "Rajapur": "6492b814882c8da84773716e",
-            "Rajendranagar": "63f9d139519359b7438ebf8f",
-            "Rajoli": "63f87679c660ddb22345e993",
-            "Ramadugu": "63f9cf36519359b7438e8de5",
-            "Ramannapet": "63f87723c660ddb22345f7e4",
-            "Ramareddy": "63f873ecc660ddb22345ac7e",
-            "Ramayampet": "63f9cfff519359b7438ea11e",
-            "Ramchandrapuram": "63f87562c660ddb22345cf3c",
-            "Rayaparthy": "63f87230c660ddb223458338",
-            "Rebbena": "63f877e1c660ddb22346087d",
-            "Regode": "63f9d015519359b7438ea350",
-            "Regonda": "63f8743cc660ddb22345b402",
-            "Renjal": "63f9d0cd519359b7438eb4f4",
-            "Revally": "63f875f0c660ddb22345dd0e",
-            "Rudrur": "63f9d12a519359b7438ebe16",
-            "SIRIKONDA": "63f9cf1a519359b7438e8b29",
-            "Sadashivanagar": "63f873abc660ddb22345a68b",
-            "Sadasivpet": "63f8754ac660ddb22345cd34",
-            "Saidabad": "63f9cf31519359b7438e8d67",
-            "Sangareddy": "63f87558c660ddb22345ce3c",
-            "Sangem": "63f87236c660ddb2234583d2",
-            "Sarangapur": "6492b813882c8da847737164",
-            "Saroornagar": "63f9d136519359b7438ebf4c",
-            "Sathupalli": "63f9cf65519359b7438e9237",
-            "Secunderabad": "63f9cf25519359b7438e8c37",
-            "Shabad": "63f9d147519359b7438ec0df",
-            "Shaikpet": "63f9cf23519359b7438e8c15",
-            "ShaliGouraram": "63f9d043519359b7438ea7ac",
-            "Shamirpet": "63f87807c660ddb223460c38",
-            "Shamshabad": "6492b819882c8da847737186",
-            "Shankarampet (A)": "63f9cff1519359b7438e9fbf",
-            "Shankarampet (R)": "63f9d006519359b7438ea1db",
-            "Shankarapatnam": "63f9cf4b519359b7438e8fb0",
-            "Shankarpalle": "63f9d12e519359b7438ebe8a",
-            "Shayampet": "63f87406c660ddb22345af0d",
-            "Shivampet": "63f9d026519359b7438ea4e3",
-            "Siddipet Rural": "63f875c0c660ddb22345d846",
-            "Siddipet Urban": "63f8758dc660ddb22345d33b",
-            "Singareni": "63f9cf60519359b7438e91bb",
-            "Sircilla": "63f8732ec660ddb223459ac1",
-            "Sirgapoor": "63f8756ec660ddb22345d06d",
-            "Sirikonda": "63f9d117519359b7438ebc46",
-            "Sirpur (T)": "63f877bac660ddb223460496",
-            "Sirpur U": "63f877ddc660ddb22346082b",
-            "Soan": "63f872a4c660ddb223458dc5",
-            "Srirampur": "63f872f8c660ddb223459589",
-            "Srirangapur": "63f875f6c660ddb22345dd94",
-            "Sujathanagar": "63f874efc660ddb22345c4d3",
-            "Sulthanabad": "63f87307c660ddb223459700",
-            "Suryapet": "63f87692c660ddb22345ec0c",
-            "THANGALLAPALLI": "63f87334c660ddb223459b47",
-            "Tadoor": "63f87624c660ddb22345e194",
-            "Tadvai": "63f8782cc660ddb223461013",
-            "Tadwai": "63f873d6c660ddb22345aaab",
-            "Talamadugu": "63f9ced1519359b7438e8459",
-            "Tamsi": "63f9ceb8519359b7438e8208",
-            "Tandur": "6492b819882c8da847737188",
-            "Tanoor": "63f8726fc660ddb2234588ff",
-            "Tekmal": "63f9d00e519359b7438ea29d",
-            "Tekulapalli": "63f874d9c660ddb22345c2d4",
-            "Tekumatla": "63f87440c660ddb22345b45e",
-            "Telkapally": "63f8761ec660ddb22345e11a",
-            "Thalakondapally": "63f87209c660ddb223457f83",
-            "Thallada": "63f9cf8f519359b7438e9653",
-            "Tharigoppula": "63f874a5c660ddb22345bdf5",
-            "Thimmajipet": "63f87604c660ddb22345dea7",
-            "Thimmapur LMD": "63f9cf43519359b7438e8ef1",
-            "Thipparthy": "63f9d05d519359b7438eaa47",
-            "Thirumalagiri": "63f87683c660ddb22345ea6d",
-            "Thoguta": "63f8759cc660ddb22345d4ba",
-            "Thorrur": "63f87457c660ddb22345b69d",
-            "Thungaturthy": "63f87685c660ddb22345eaab",
-            "Thurkapally": "63f876e8c660ddb22345f210",
-            "Tirumalagiri Sagar": "63f9d0c6519359b7438eb44c",
-            "Tirumalayapalem": "63f9cf6e519359b7438e9323",
-            "Tirumalgiri": "63f9cf25519359b7438e8c43",
-            "Tiryani": "63f877f0c660ddb2234609b7",
-            "Toopran": "63f9d021519359b7438ea46e",
-            "Tripuraram": "63f9d0b1519359b7438eb262",
-            "Undavelly": "63f8767fc660ddb22345ea1e",
-            "Uppal": "63f87811c660ddb223460d44",
-            "Uppununthala": "63f87619c660ddb22345e0a0",
-            "Urkonda": "63f87651c660ddb22345e5ce",
-            "Utkoor": "63f8788dc660ddb2234617aa",
-            "Utnoor": "63f9cee5519359b7438e864b",
-            "V.Saidapur": "63f9cf51519359b7438e9040",
-            "VEERNAPALLI": "63f8733ac660ddb223459bed",
-            "VEMULAWADA RURAL": "63f87337c660ddb223459b99",
-            "Vailpoor": "63f9d0ed519359b7438eb833",
-            "Valigonda": "63f87704c660ddb22345f4ce",
-            "Vangoor": "63f8760dc660ddb22345df7d",
-            "Varni": "63f9d10d519359b7438ebb4b",
-            "Vatpally": "63f87577c660ddb22345d12f",
-            "Veenavanka": "63f9cf46519359b7438e8f39",
-            "Velair": "63f87411c660ddb22345b00c",
-            "Veldanda": "63f875ffc660ddb22345de4b",
-            "Velgatur": "63f872c1c660ddb223459067",
-            "Vemanpally": "63f87340c660ddb223459c75",
-            "Vemsoor": "63f9cfaa519359b7438e98ee",
-            "Vemulapally": "63f9d05a519359b7438ea9f0",
-            "Vemulawada": "63f8731dc660ddb223459922",
-            "Venkatapur": "63f8781fc660ddb223460eaa",
-            "Venkatapuram": "63f87863c660ddb22346135c",
-            "Vikarabad": "63f8773ec660ddb22345fa8b",
-            "Waddepally": "63f8766fc660ddb22345e88b",
-            "Wajedu": "63f8784bc660ddb223461229",
-            "Wanaparthy": "63f875dec660ddb22345db33",
-            "Wankidi": "63f877b3c660ddb2234603db",
-            "Warangal": "63f8723ac660ddb22345842e",
-            "Wardhannapet": "63f87234c660ddb223458394",
-            "Wargal": "63f875b0c660ddb22345d6c7",
-            "Weepangandla": "63f875edc660ddb22345dcc6",
-            "Wyra": "63f9cf97519359b7438e9729",
-            "Yacharam": "63f9d16c519359b7438ec487",
-            "Yadagirigutta": "63f876f3c660ddb22345f2f0",
-            "Yedapally": "63f9d0fa519359b7438eb976",
-            "Yelal": "63f8777ac660ddb22345fdfb",
-            "Yeldurthy": "63f9d01e519359b7438ea41c",
-            "Yellandu": "63f874dac660ddb22345c2f4",
-            "Yellareddipet": "63f87323c660ddb2234599b7",
-            "Yellareddy": "63f873c7c660ddb22345a929",
-            "Yergatla": "63f9d128519359b7438ebdf1",
-            "Yerrupalem": "63f9cfa5519359b7438e9874",
-            "Zaffergadh": "63f8748ec660ddb22345bbbc",
-            "Zahirabad": "63f87520c660ddb22345c95c",
-            "SIDDIPET": "63f8757dc660ddb22345d1d7",
-            "YADADRI BHUVANAGIRI": "63f876e3c660ddb22345f17a",
-            "RANGA REDDY": "63f871f5c660ddb223457dcd",
-            "MEDCHAL MALKAJGIRI": "63f87800c660ddb223460b7b",
-            "BHADRADRI KOTHAGUDEM": "63f874a9c660ddb22345be5c",
-            "KHAMMAM": "63f9cf60519359b7438e91b8",
-            "MAHABUBNAGAR": "63f9cfad519359b7438e9935",
-            "NIZAMABAD": "63f9d0cc519359b7438eb4f1",
-            "ADILABAD": "63f9ceb8519359b7438e8205",
-            "JOGULAMBA GADWAL": "63f87654c660ddb22345e610",
-            "Nirmal": "63f87250c660ddb223458627",
-            "Mulugu": "63f8781fc660ddb223460ea7",
-            "RAJANNA SIRCILLA": "63f87317c660ddb223459894",
-            "JAYASHANKAR BHUPALAPALLY": "63f87417c660ddb22345b0a7",
-            "HANUMAKONDA": "63f873f4c660ddb22345ad5f",
-            "KUMURAM BHEEM ASIFABAD": "63f877aac660ddb2234602f0",
-            "HYDERABAD": "63f9cf23519359b7438e8c12"
-        },
-        "63f874a0d2e83876f03f6866": {
-            "Amarpur": "63f87546d2e83876f03f77c9",
-            "Ambassa": "63f874b7d2e83876f03f6ac0",
-            "Belonia": "63f874dbd2e83876f03f6df8",
-            "Bishalgarh": "63f8752cd2e83876f03f757a",
-            "Dharmanagar": "63f874c9d2e83876f03f6c85",
-            "Gonda Twisa": "63f874a9d2e83876f03f6959",
-            "Jampuijala": "63f87518d2e83876f03f73b9",
-            "Jirania": "63f874f0d2e83876f03f6ff2",
-            "Kailashahar": "63f87550d2e83876f03f78a4",
-            "Kamalpur": "63f874a0d2e83876f03f686c",
-            "Kanchanpur": "63f874c3d2e83876f03f6bd9",
-            "Karbook": "63f87533d2e83876f03f7614",
-            "Khowai": "63f87509d2e83876f03f7228",
-            "Kumarghat": "63f8755ad2e83876f03f7969",
-            "Longtharai Valley": "63f874b0d2e83876f03f6a0f",
-            "Mohanpur": "63f874f8d2e83876f03f709e",
-            "Panisagar": "63f874bfd2e83876f03f6b78",
-            "Sabroom": "63f874e5d2e83876f03f6eef",
-            "Sadar": "6492b819882c8da847737190",
-            "Santirbazar": "63f874d0d2e83876f03f6d38",
-            "Sonamura": "63f8751fd2e83876f03f743d",
-            "Teliamura": "63f87512d2e83876f03f7324",
-            "Udaipur": "6492b819882c8da84773718e",
-            "Dhalai": "63f874a0d2e83876f03f6869",
-            "West Tripura": "63f874f0d2e83876f03f6fef",
-            "North Tripura": "63f874bfd2e83876f03f6b75",
-            "Gomati": "63f87533d2e83876f03f7611"
-        },
-        "63f600f38cec41e6c9607e6b": {
-            "ASPUR DEOSARA": "64140e54c2826eb7b748ad04",
-            "Agra": "63f6010c8cec41e6c96080b2",
-            "Ajitmal": "63f71bd1b2a782b13a33de82",
-            "Akbarpur": "6492b81b882c8da8477371aa",
-            "Aliganj": "63f74351f44414e60b832b04",
-            "Allahabad": "63f71896b2a782b13a338344",
-            "Allapur": "63f71a7bb2a782b13a33b61f",
-            "Amariya": "63f764f5f44414e60b86aa45",
-            "Amethi": "63f9ef8703196b93ff4636cc",
-            "Amritpur": "63f745b5f44414e60b836c2d",
-            "Amroha": "63f75470f44414e60b8503ce",
-            "Anupshahr": "63f73fd2f44414e60b82c53b",
-            "Aonla": "63f738dbf44414e60b81fc07",
-            "Atarra": "63f72206b2a782b13a349faf",
-            "Atrauli": "63f602148cec41e6c9609867",
-            "Aurai": "63f864a719ea3a6e763bc93f",
-            "Auraiya": "63f71ba4b2a782b13a33d999",
-            "Azamgarh": "63f71cd7b2a782b13a33fee2",
-            "BABA BELKHARNATH DHAM": "64140e4bc2826eb7b748ac5d",
-            "BABAGANJ": "64140e20c2826eb7b748a975",
-            "BANGARMAU": "63f9ed3403196b93ff45fa3c",
-            "BIHAR": "64140e20c2826eb7b748a96e",
-            "Baberu": "63f721e4b2a782b13a349ba7",
-            "Badlapur": "63f75170f44414e60b84b422",
-            "Baghpat": "63f71ea4b2a782b13a343672",
-            "Bah": "63f6019a8cec41e6c9608d88",
-            "Baheri": "63f73864f44414e60b81ef2e",
-            "Bahraich": "63f71f0bb2a782b13a3442f7",
-            "Bairia": "63f72110b2a782b13a3481a9",
-            "Bakshi Ka Talab": "63f75b72f44414e60b85b466",
-            "Ballia": "63f7203cb2a782b13a3467bf",
-            "Balrampur": "63f7212bb2a782b13a3484eb",
-            "Banda": "63f721cfb2a782b13a3498e9",
-            "Bansdih": "63f720bfb2a782b13a3477c0",
-            "Bansgaon": "63f74d00f44414e60b843632",
-            "Bansi": "63f867b419ea3a6e763c19e0",
-            "Bara": "63f718b9b2a782b13a33870b",
-            "Baraut": "63f71e8cb2a782b13a343382",
-            "Bareilly": "63f73921f44414e60b820370",
-            "Barhaj": "63f7427ff44414e60b8313cd",
-            "Basti": "63f73b46f44414e60b82413c",
-            "Behat": "63f8618a19ea3a6e763b75a8",
-            "Belthara Road": "63f71fa5b2a782b13a34553a",
-            "Bhadohi": "63f863f719ea3a6e763bb757",
-            "Bhanpur": "63f739f9f44414e60b821a3c",
-            "Bharthana": "63f74437f44414e60b834381",
-            "Bhatpar Rani": "63f74312f44414e60b83240c",
-            "Bhinga": "63f866ad19ea3a6e763bfe4f",
-            "Bhiti": "63f71b35b2a782b13a33cc1e",
-            "Bhogaon": "63f75e2ff44414e60b85f8fb",
-            "Bhognipur": "63f7560af44414e60b852c14",
-            "Bidhuna": "63f71b5fb2a782b13a33d127",
-            "Bighapur": "63f9ecfb03196b93ff45f418",
-            "Bijnor": "63f73c9bf44414e60b8267f0",
-            "Bikapur": "63f74526f44414e60b835cb9",
-            "Bilari": "63f7634af44414e60b867d75",
-            "Bilaspur": "64a3bc3c3d3106a8ce146ea2",
-            "Bilgram": "63f74fb0f44414e60b8483b7",
-            "Bilhaur": "63f7567bf44414e60b8536ee",
-            "Bilsi": "63f73e8af44414e60b829e98",
-            "Bindki": "63f74622f44414e60b837782",
-            "Bisalpur": "63f76442f44414e60b869766",
-            "Bisauli": "63f73e56f44414e60b829888",
-            "Biswan": "63f869e119ea3a6e763c4ffe",
-            "Budaun": "63f73edaf44414e60b82a842",
-            "Budhana": "63f763bdf44414e60b868979",
-            "Bulandshahr": "63f73f88f44414e60b82bcc7",
-            "Burhanpur": "63f71bebb2a782b13a33e1ce",
-            "Campierganj": "63f74c06f44414e60b841a28",
-            "Chail": "63f757e4f44414e60b855867",
-            "Chakarnagar": "63f74455f44414e60b8346c6",
-            "Chakia": "63f740daf44414e60b82e317",
-            "Chandauli": "63f74099f44414e60b82db68",
-            "Chandausi": "63f9f00e03196b93ff464456",
-            "Chandpur": "63f73e02f44414e60b828eed",
-            "Charkhari": "63f75dccf44414e60b85eefb",
-            "Chauri Chaura": "63f74cdcf44414e60b8431f3",
-            "Chhata": "63f75ea1f44414e60b8604ae",
-            "Chhibramau": "63f75513f44414e60b8513c1",
-            "Chunar": "63f7622ff44414e60b865fb1",
-            "Colonelganj": "63f74b2ff44414e60b84021f",
-            "DHAULANA": "63f9f0f103196b93ff465c41",
-            "Dadri": "6492b81b882c8da8477371a6",
-            "Dalmau": "63f8602119ea3a6e763b50bf",
-            "Dataganj": "63f73f1df44414e60b82b04b",
-            "Debai": "63f73feaf44414e60b82c7f9",
-            "Deoband": "63f8626819ea3a6e763b8d1e",
-            "Deoria": "63f741d3f44414e60b83000c",
-            "Derapur": "63f755c8f44414e60b8525be",
-            "Dhampur": "63f73d62f44414e60b827d4d",
-            "Dhanaura": "63f75435f44414e60b84fd91",
-            "Dhaurahara": "63f7590af44414e60b857805",
-            "Domariyaganj": "63f868a819ea3a6e763c3276",
-            "Dudhi": "63f86bb019ea3a6e763c7e74",
-            "Etah": "63f7437bf44414e60b832fbb",
-            "Etawah": "63f74410f44414e60b833f6f",
-            "Etmadpur": "63f600f38cec41e6c9607e71",
-            "Faizabad": "63f744f6f44414e60b83578a",
-            "Faridpur": "63f739aaf44414e60b8211e1",
-            "Farrukhabad": "63f745d5f44414e60b836f8b",
-            "Fatehabad": "6492b81a882c8da847737196",
-            "Fatehpur": "6492b81a882c8da84773719c",
-            "Firozabad": "63f7475af44414e60b8397c4",
-            "GAURA": "64140e89c2826eb7b748b0d0",
-            "GOHAND": "64141096c2826eb7b748d569",
-            "GOVARDHAN": "63f75f3cf44414e60b86146a",
-            "Gabhana": "63f601f18cec41e6c960954a",
-            "Garautha": "63f753bef44414e60b84f111",
-            "Garhmukteshwar": "63f9f0d603196b93ff465960",
-            "Gauriganj": "63f9ef5303196b93ff4631bb",
-            "Gautam Buddha Nagar": "63f74800f44414e60b83a8f4",
-            "Ghanghata": "63f8638c19ea3a6e763babf5",
-            "Ghatampur": "63f7570af44414e60b8543c7",
-            "Ghaziabad": "63f74844f44414e60b83b063",
-            "Ghazipur": "63f74938f44414e60b83cb43",
-            "Ghiror": "63f75e7cf44414e60b8600bb",
-            "Ghorawal": "63f86aeb19ea3a6e763c6a89",
-            "Ghosi": "63f75f4df44414e60b861621",
-            "Gola": "63f74de7f44414e60b844fb3",
-            "Gola Gokaran Nath": "63f7584bf44414e60b856319",
-            "Gonda": "63f74ac2f44414e60b83f674",
-            "Gorakhpur": "63f74c6af44414e60b84256c",
-            "Gunnaur": "63f9f03b03196b93ff464908",
-            "Gyanpur": "63f8644f19ea3a6e763bc00a",
-            "Haidergarh": "63f7381ff44414e60b81e7e1",
-            "Hamirpur": "6492b81b882c8da8477371a8",
-            "Handia": "63f7195cb2a782b13a33947a",
-            "Hapur": "63f9f0bf03196b93ff4656de",
-            "Hardoi": "63f74f5ff44414e60b847a8c",
-            "Harraiya": "63f73a48f44414e60b8222c7",
-            "Hasanganj": "63f9ec3403196b93ff45dedc",
-            "Hasanpur": "63f754a4f44414e60b850925",
-            "Hata": "63f759aef44414e60b85892e",
-            "Hathras": "63f75c43f44414e60b85c90a",
-            "Iglas": "63f602b08cec41e6c960a621",
-            "Ikauna": "63f866cf19ea3a6e763c020c",
-            "Itwa": "63f8684719ea3a6e763c2973",
-            "Jakhania": "63f7485bf44414e60b83b307",
-            "Jalalpur": "63f71ac9b2a782b13a33bf59",
-            "Jalaun": "63f75065f44414e60b8497ec",
-            "Jalesar": "63f743d7f44414e60b83394f",
-            "Jansath": "63f763e7f44414e60b868de2",
-            "Jasrana": "63f74778f44414e60b839b04",
-            "Jaswantnagar": "63f743f3f44414e60b833c4b",
-            "Jaunpur": "63f7521cf44414e60b84c623",
-            "Jewar": "63f7481df44414e60b83ac07",
-            "Jhansi": "63f75412f44414e60b84f9fa",
-            "KALAKANKAR": "64140e1ec2826eb7b748a950",
-            "KASIMABAD": "63f74a4af44414e60b83e9df",
-            "KUNDA": "64140e1fc2826eb7b748a962",
-            "KURARA": "64141090c2826eb7b748d4f2",
-            "Kadipur": "63f86d6b19ea3a6e763c9dc8",
-            "Kaimganj": "63f74566f44414e60b836398",
-            "Kairana": "63f9f08203196b93ff465087",
-            "Kaiserganj": "63f71f32b2a782b13a344795",
-            "Kalan": "63f8668419ea3a6e763bfa27",
-            "Kalinagar": "63f764d6f44414e60b86a700",
-            "Kalpi": "63f7508df44414e60b849c3f",
-            "Kannauj": "63f75555f44414e60b851a4e",
-            "Kanpur": "63f756d0f44414e60b853eed",
-            "Kanth": "63f762e0f44414e60b867254",
-            "Kaptanganj": "63f75a8ff44414e60b859e8f",
-            "Karchhana": "63f718f3b2a782b13a338d70",
-            "Karhal": "63f75e0ef44414e60b85f5b6",
-            "Karwi": "63f74163f44414e60b82f337",
-            "Kasganj": "63f9ee6d03196b93ff461adf",
-            "Kasya": "63f759dbf44414e60b858db3",
-            "Kerakat": "63f75345f44414e60b84e477",
-            "Khadda": "63f75a68f44414e60b859b04",
-            "Khaga": "63f746d9f44414e60b838acb",
-            "Khair": "63f601c88cec41e6c96091ba",
-            "Khajni": "63f74d5ef44414e60b8440ac",
-            "Khalilabad": "63f8631719ea3a6e763b9f87",
-            "Khatauli": "63f763d1f44414e60b868b88",
-            "Khekada": "63f71eb7b2a782b13a3438a9",
-            "Kheragarh": "63f601538cec41e6c960873c",
-            "Khurja": "63f74028f44414e60b82cece",
-            "Kiraoli": "63f6012e8cec41e6c96083d4",
-            "Kishni": "63f75e64f44414e60b85fe39",
-            "Koil": "63f602598cec41e6c9609e72",
-            "Konch": "63f750d7f44414e60b84a413",
-            "Koraon": "63f71a0ab2a782b13a33a8a1",
-            "Kulpahar": "63f75d97f44414e60b85e9a9",
-            "Kunda": "63f7656df44414e60b86b6ea",
-            "Kurawali": "63f75e8cf44414e60b86026b",
-            "LAKSHAMANPUR": "64140eacc2826eb7b748b349",
-            "LALGANJ": "64140eabc2826eb7b748b33b",
-            "Laharpur": "63f8699a19ea3a6e763c4967",
-            "Lakhimpur": "63f758c5f44414e60b857001",
-            "Lalganj": "63f71de2b2a782b13a341f48",
-            "Lalitpur": "63f75ad6f44414e60b85a539",
-            "Lambhua": "63f86cc819ea3a6e763c94c0",
-            "Loni": "63f74852f44414e60b83b20e",
-            "MAGRAURA": "64140e8ec2826eb7b748b11d",
-            "MANDHATA": "64140eb2c2826eb7b748b3b1",
-            "MANIKPUR": "63f741a3f44414e60b82fa84",
-            "MARTINGANJ": "63f71e6bb2a782b13a342f69",
-            "MAUDAHA": "64141096c2826eb7b748d57a",
-            "MIHINPURWA MOTIPUR": "63f71f8cb2a782b13a34526b",
-            "MUSKARA": "641410b0c2826eb7b748d75e",
-            "Machhlishahr": "63f751bbf44414e60b84bc17",
-            "Madhogarh": "63f75034f44414e60b8492e5",
-            "Madhuban": "63f75f8df44414e60b861cf4",
-            "Maharajganj": "63f75d40f44414e60b85e0ea",
-            "Mahasi": "63f71ee8b2a782b13a343e90",
-            "Mahavan": "63f75ef6f44414e60b860d5e",
-            "Mahmudabad": "63f86a2719ea3a6e763c56e5",
-            "Mahoba": "63f75de2f44414e60b85f141",
-            "Maholi": "63f86aae19ea3a6e763c6445",
-            "Mahroni": "63f75afff44414e60b85a928",
-            "Mainpuri": "63f75dfbf44414e60b85f3de",
-            "Maitha": "63f75662f44414e60b853488",
-            "Malihabad": "63f75b4cf44414e60b85b0b3",
-            "Manjhanpur": "63f757a7f44414e60b85523e",
-            "Mankapur": "63f74bb1f44414e60b8410c4",
-            "Mariahu": "63f752c3f44414e60b84d71e",
-            "Marihan": "63f76205f44414e60b865b59",
-            "Mat": "63f75ec3f44414e60b860825",
-            "Mathura": "63f75f16f44414e60b86108f",
-            "Mau": "63f74185f44414e60b82f71c",
-            "Maudaha": "63f74eadf44414e60b846689",
-            "Maunath Bhanjan": "63f75fd3f44414e60b8623fe",
-            "Mauranipur": "63f753f6f44414e60b84f6fb",
-            "Mawana": "63f760bcf44414e60b8639a0",
-            "Meerganj": "63f738adf44414e60b81f728",
-            "Meerut": "63f760f5f44414e60b863f97",
-            "Mehdawal": "63f862b619ea3a6e763b956c",
-            "Mehnagar": "63f71e33b2a782b13a3428f5",
-            "Meja": "63f719c8b2a782b13a33a0e8",
-            "Milak": "63f8616419ea3a6e763b7194",
-            "Milkipur": "63f744a3f44414e60b834ef3",
-            "Mirzapur": "63f76129f44414e60b8644cd",
-            "Misrikh": "63f8690c19ea3a6e763c3b0d",
-            "Mitauli": "63f75931f44414e60b857c26",
-            "Modinagar": "63f7482df44414e60b83add7",
-            "Mohammadabad": "63f749a4f44414e60b83d6b2",
-            "Mohammdi": "63f75884f44414e60b85694c",
-            "Mohanlalganj": "63f75bc5f44414e60b85bc76",
-            "Moradabad": "63f76308f44414e60b867684",
-            "Moth": "63f75394f44414e60b84ecc8",
-            "Mugalsarai": "63f7412af44414e60b82ec79",
-            "Muhammadabad Gohna": "63f7603ef44414e60b862cd4",
-            "Musafirkhana": "63f9ef2603196b93ff462cd7",
-            "Muzaffarnagar": "63f7638af44414e60b868422",
-            "NARWAL": "63f7573af44414e60b854865",
-            "NAUGARH": "63f7414bf44414e60b82f07c",
-            "Nagina": "63f73cfcf44414e60b8272bf",
-            "Najibabad": "63f73c3ef44414e60b825dc1",
-            "Nakur": "63f8621d19ea3a6e763b851a",
-            "Nanpara": "63f71ec0b2a782b13a3439b1",
-            "Naraini": "63f72217b2a782b13a34a1cd",
-            "Naugarh": "63f8675519ea3a6e763c102e",
-            "Naugawan Sadat": "63f754f2f44414e60b851089",
-            "Nautanwa": "63f75c98f44414e60b85d0f9",
-            "Nawabganj": "6492b81a882c8da8477371a0",
-            "Nichlaul": "63f75cd0f44414e60b85d62d",
-            "Nighasan": "63f75818f44414e60b855db1",
-            "Nizamabad": "63f71d47b2a782b13a340cb8",
-            "Obra": "63f86bea19ea3a6e763c8470",
-            "Orai": "63f750baf44414e60b84a100",
-            "PATTI": "64140eadc2826eb7b748b35f",
-            "PAYAGPUR": "63f71f6ab2a782b13a344e95",
-            "PRATAPGARH (SADAR)": "64140ecac2826eb7b748b543",
-            "Padrauna": "63f75966f44414e60b8581d4",
-            "Pailani": "63f72235b2a782b13a34a576",
-            "Palia": "63f7582ff44414e60b856015",
-            "Patiyali": "63f9eec803196b93ff462330",
-            "Pharenda": "63f75d11f44414e60b85dc60",
-            "Phulpur": "6492b81a882c8da84773719a",
-            "Pilibhit": "63f7640ef44414e60b86920f",
-            "Pindra": "63f9ed5c03196b93ff45fe8c",
-            "Powayan": "63f864ee19ea3a6e763bd0aa",
-            "Puranpur": "63f7649af44414e60b86a0a0",
-            "Purwa": "63f9ecca03196b93ff45eed0",
-            "RAMPUR SANRAMGARH": "64140e24c2826eb7b748a9c7",
-            "RATH": "641410a4c2826eb7b748d68a",
-            "Rae Bareli": "63f85f9819ea3a6e763b42da",
-            "Rajapur": "63f741b7f44414e60b82fccf",
-            "Rajatalab": "63f9ee1603196b93ff461239",
-            "Ramnagar": "6492b81a882c8da84773719e",
-            "Rampur Maniharan": "63f8629419ea3a6e763b91c1",
-            "Ramsanehighat": "63f737f1f44414e60b81e302",
-            "Raniganj": "63f85f3119ea3a6e763b3895",
-            "Rasra": "63f71ffbb2a782b13a345fc5",
-            "Rasulabad": "63f755aaf44414e60b8522a6",
-            "Rath": "63f74e83f44414e60b84617b",
-            "Robertsganj": "63f86b2c19ea3a6e763c711b",
-            "Rudauli": "63f74477f44414e60b834a23",
-            "Rudhauli": "63f73c0ef44414e60b825831",
-            "Rudrapur": "6492b81a882c8da8477371a2",
-            "SANDWA CHANDRIKA": "64140fc7c2826eb7b748c6f4",
-            "SANGIPUR": "64140eacc2826eb7b748b342",
-            "SARILA": "64141119c2826eb7b748dea9",
-            "SEVRAI": "63f74aa6f44414e60b83f3a0",
-            "SHIVGARH": "64140f8cc2826eb7b748c2d3",
-            "SIRSAGANJ": "63f747c2f44414e60b83a2b5",
-            "SUMERPUR": "64141090c2826eb7b748d4f9",
-            "Sadabad": "63f75c7cf44414e60b85ce57",
-            "Sadar": "63f75b9df44414e60b85b8b9",
-            "Safipur": "63f9ec1303196b93ff45db56",
-            "Sagri": "63f71c3ab2a782b13a33eb67",
-            "Saharanpur": "63f861c619ea3a6e763b7c0d",
-            "Sahaswan": "63f73eacf44414e60b82a2b9",
-            "Sahawar": "63f9eea003196b93ff461faa",
-            "Sahjanwa": "63f74c2df44414e60b841e67",
-            "Saidpur": "63f748c3f44414e60b83be5d",
-            "Saifai": "63f74403f44414e60b833e14",
-            "Sakaldiha": "63f74049f44414e60b82d29c",
-            "Salempur": "63f742b1f44414e60b831997",
-            "Salon": "63f8607319ea3a6e763b58f7",
-            "Sambhal": "63f9efc303196b93ff463c89",
-            "Sandila": "63f74feef44414e60b848ab7",
-            "Sardhana": "63f760a1f44414e60b8636dd",
-            "Sarila": "63f74e99f44414e60b84642f",
-            "Sarojani Nagar": "63f75bf1f44414e60b85c0fb",
-            "Sasni": "63f75c0af44414e60b85c38e",
-            "Sawayajpur": "63f74f19f44414e60b847305",
-            "Shahabad": "63f74eccf44414e60b846a0c",
-            "Shahganj": "63f7510cf44414e60b84a985",
-            "Shahjahanpur": "63f865ed19ea3a6e763beafd",
-            "Shamli": "63f9f09403196b93ff465282",
-            "Shikarpur": "63f74008f44414e60b82cb3e",
-            "Shikohabad": "63f7479ef44414e60b839efd",
-            "Shohratgarh": "63f8671019ea3a6e763c08cf",
-            "Siana": "63f73fb2f44414e60b82c1a1",
-            "Sidhauli": "63f86a6e19ea3a6e763c5df9",
-            "Sikanderpur": "63f71fd3b2a782b13a345ad2",
-            "Sikandra": "63f75638f44414e60b853067",
-            "Sikandra Rao": "63f75c22f44414e60b85c5cf",
-            "Sikandrabad": "63f73f70f44414e60b82ba09",
-            "Sirathu": "63f75762f44414e60b854c6f",
-            "Sirauli Gauspur": "63f737cff44414e60b81df4f",
-            "Sitapur": "63f8694d19ea3a6e763c41ef",
-            "Sohawal": "63f744d5f44414e60b83546d",
-            "Soraon": "63f602da8cec41e6c960a9d1",
-            "Suar": "63f860a719ea3a6e763b5e28",
-            "Sultanpur": "63f86c0119ea3a6e763c86b3",
-            "TEST SUBDISTRICT": "63f73710f44414e60b81cb08",
-            "Tahrauli": "63f753daf44414e60b84f410",
-            "Takha": "63f7446bf44414e60b8348df",
-            "Talbehat": "63f75ab4f44414e60b85a1ea",
-            "Tamkuhi Raj": "63f75a1af44414e60b85937d",
-            "Tanda": "6492b81a882c8da847737198",
-            "Tarabganj": "63f74b71f44414e60b8409b0",
-            "Thakurdwara": "63f762a7f44414e60b866c35",
-            "Tilhar": "63f8657519ea3a6e763bdea8",
-            "Tiloi": "63f9ef0003196b93ff4628f2",
-            "Tirwa": "63f75588f44414e60b851f69",
-            "Tulsipur": "63f72156b2a782b13a348a24",
-            "Tundla": "63f74748f44414e60b8395d8",
-            "UN": "63f9f0ac03196b93ff4654e6",
-            "Unchahar": "63f8604919ea3a6e763b549a",
-            "Unnao": "63f9ec9203196b93ff45e8e8",
-            "Utraula": "63f72195b2a782b13a3491c4",
-            "Zamania": "63f74a1ef44414e60b83e4d3",
-            "jamunaha": "63f866f419ea3a6e763c05ce",
-            "madawara": "63f75b1df44414e60b85ac04",
-            "VARANASI": "63f9ed5c03196b93ff45fe89",
-            "BARABANKI": "63f73710f44414e60b81cb0e",
-            "RAMPUR": "63f860a719ea3a6e763b5e25",
-            "LUCKNOW": "63f75b4cf44414e60b85b0b0",
-            "ALIGARH": "63f601c88cec41e6c96091b7",
-            "SHRAVASTI": "63f866ac19ea3a6e763bfe4c",
-            "PRATAPGARH": "641835a3f6fb3c67a030fb1a",
-            "KUSHI NAGAR": "63f75966f44414e60b8581d1",
-            "KANPUR NAGAR": "63f7567af44414e60b8536eb",
-            "SONBHADRA": "63f86aeb19ea3a6e763c6a86",
-            "PRAYAGRAJ": "63f602d98cec41e6c960a9ce",
-            "KANPUR DEHAT": "63f755aaf44414e60b8522a3",
-            "KHERI": "63f75818f44414e60b855dae",
-            "KAUSHAMBI": "63f75762f44414e60b854c6c",
-            "SIDDHARTH NAGAR": "63f8671019ea3a6e763c08cc",
-            "AYODHYA": "63f74476f44414e60b834a20",
-            "AMBEDKAR NAGAR": "63f71a37b2a782b13a33ae10",
-            "CHITRAKOOT": "63f74163f44414e60b82f334",
-            "SANT KABEER NAGAR": "63f862b619ea3a6e763b9569"
-        },
-        "63f37f20491ca1c6048696ce": {
-            "Adibadri": "63f3829f491ca1c60486ec7c",
-            "Almora": "63f37fe5491ca1c60486a994",
-            "Bageshwar": "63f3813d491ca1c60486c9c2",
-            "Bagwalipokhar": "63f380d2491ca1c60486c01f",
-            "Bajpur": "63f5c19698d5e0c03dba3c6c",
-            "Balganga": "63f5c14898d5e0c03dba368d",
-            "Bangapani": "63f5be6f98d5e0c03db9fd1c",
-            "Barakot": "63f38337491ca1c60486fc3f",
-            "Barnigad": "63f5c2bd98d5e0c03dba53c2",
-            "Basukedar": "63f5bf5398d5e0c03dba11b2",
-            "Berinag": "63f5bdbb98d5e0c03db9eb17",
-            "Betalghat": "63f5b98e98d5e0c03db988bb",
-            "Bhagwanpur": "63f5b94b98d5e0c03db9819f",
-            "Bhanoli": "63f38050491ca1c60486b395",
-            "Bhatwari": "63f5c29498d5e0c03dba50ae",
-            "Bhikiasain": "63f37f20491ca1c6048696d4",
-            "Bironkhal": "63f5bcdf98d5e0c03db9d812",
-            "Chakisain": "63f5bcc698d5e0c03db9d5cc",
-            "Chakrata": "63f3834a491ca1c60486fe46",
-            "Chamoli": "63f381da491ca1c60486d8cb",
-            "Champawat": "63f382c4491ca1c60486f021",
-            "Chaubatta Khal": "63f5bc2098d5e0c03db9c5cc",
-            "Chaukhutiya": "63f37f50491ca1c604869b8b",
-            "Chinyali Saur": "63f5c27598d5e0c03dba4e90",
-            "Dehradun": "63f5b8bd98d5e0c03db97340",
-            "Devalthal": "63f5bea498d5e0c03dba0251",
-            "Devprayag": "63f5bf9098d5e0c03dba16ef",
-            "Dewal": "63f382b3491ca1c60486ee7e",
-            "Dhanaulti": "63f5c06698d5e0c03dba25a2",
-            "Dharchula": "63f5bd7c98d5e0c03db9e55a",
-            "Dhari": "63f5b9be98d5e0c03db98dec",
-            "Dhaulchhina": "63f3809e491ca1c60486bb37",
-            "Dhauntari": "63f5c2a298d5e0c03dba51b4",
-            "Dhoomakot": "63f5bb6898d5e0c03db9b51d",
-            "Dhyari": "63f380dd491ca1c60486c12a",
-            "Didihat": "63f5bd8d98d5e0c03db9e6e2",
-            "Doiwala": "63f5b8ed98d5e0c03db97821",
-            "Dugnakuri": "63f3819f491ca1c60486d31c",
-            "Dunda": "63f5c25998d5e0c03dba4c5e",
-            "Dwarahat": "63f37fd1491ca1c60486a7c1",
-            "Gadarpur": "63f5c1c198d5e0c03dba4017",
-            "Gairsain": "63f38244491ca1c60486e355",
-            "Gaja": "63f5c12b98d5e0c03dba3415",
-            "Ganai Gangoli": "63f5be5398d5e0c03db9fa63",
-            "Gangolihat": "63f5bde198d5e0c03db9eeed",
-            "Garud": "63f38176491ca1c60486cf46",
-            "Ghaat": "63f38283491ca1c60486e9ad",
-            "Ghansali": "63f5bf6298d5e0c03dba1305",
-            "Haldwani": "63f5b9d198d5e0c03db99014",
-            "Hardwar": "63f5b90f98d5e0c03db97bc4",
-            "Jainti": "63f3803b491ca1c60486b226",
-            "Jakhani Dhar": "63f5bfdb98d5e0c03dba1dc4",
-            "Jakhanikhal": "63f5bd4b98d5e0c03db9e117",
-            "Jakholi*": "63f5bf3898d5e0c03dba0f76",
-            "Jalali": "63f380c2491ca1c60486be9c",
-            "Jaspur": "63f5c17b98d5e0c03dba3a5d",
-            "Jilasu": "63f382ac491ca1c60486eddc",
-            "Joshimath": "63f381c5491ca1c60486d6b2",
-            "Joshiyara": "63f5c2a998d5e0c03dba5238",
-            "Kafligair": "63f381ac491ca1c60486d454",
-            "Kaladhungi": "63f5ba2098d5e0c03db99764",
-            "Kalsi": "63f3a943491ca1c604870232",
-            "Kanalichhina": "63f5beb598d5e0c03dba03ca",
-            "Kanda": "63f38113491ca1c60486c63c",
-            "Kandisaur": "63f5c0cd98d5e0c03dba2d05",
-            "Kapkot": "63f380fa491ca1c60486c3e2",
-            "Karnaprayag": "63f38207491ca1c60486dd4d",
-            "Kashipur": "63f5c16798d5e0c03dba38d0",
-            "Khatima": "63f5c1e298d5e0c03dba42cd",
-            "Kichha": "63f5c1b398d5e0c03dba3ee4",
-            "Kirtinagar": "63f5c0ea98d5e0c03dba2f5a",
-            "Kosya Kutauli": "63f5b97698d5e0c03db9863e",
-            "Kotdwara": "63f5bc5998d5e0c03db9cb46",
-            "Laksar": "63f5b92c98d5e0c03db97e5f",
-            "Laldhang": "63f5b95b98d5e0c03db98354",
-            "Lalkuan": "63f5ba3c98d5e0c03db999dc",
-            "Lamgada": "63f380e4491ca1c60486c1d6",
-            "Lansdowne": "63f5bbad98d5e0c03db9bb32",
-            "Lohaghat": "63f382fe491ca1c60486f61a",
-            "Machhor": "63f380b6491ca1c60486bd82",
-            "Madannegi": "63f5c11698d5e0c03dba3281",
-            "Manch": "63f3831c491ca1c60486f970",
-            "Mori": "63f5c22598d5e0c03dba4868",
-            "Munsiari": "63f5bd6298d5e0c03db9e30a",
-            "Nainbag": "63f5c0b198d5e0c03dba2af1",
-            "Nainital": "63f5b99b98d5e0c03db98a34",
-            "Nanakmatta": "63f5c20498d5e0c03dba45a1",
-            "Nandprayag": "63f38291491ca1c60486eb30",
-            "Narayanbagar": "63f38265491ca1c60486e69f",
-            "Narendra Nagar": "63f5c09598d5e0c03dba28e7",
-            "Narsan": "63f5b95f98d5e0c03db983d3",
-            "Okhalkanda": "63f5ba4898d5e0c03db99add",
-            "Pankhu": "63f5be8798d5e0c03db9ffa5",
-            "Pati": "63f382e2491ca1c60486f33e",
-            "Pauri": "63f5ba9498d5e0c03db9a1d2",
-            "Pawkidevi": "63f5c12298d5e0c03dba3364",
-            "Pithoragarh": "63f5be0d98d5e0c03db9f340",
-            "Pokhari": "63f381f2491ca1c60486db25",
-            "Poornagiri": "63f3830e491ca1c60486f7d4",
-            "Pratapnagar": "63f5bfc298d5e0c03dba1b79",
-            "Pulla Gumdesh": "63f38324491ca1c60486fa58",
-            "Puraula": "63f5c21198d5e0c03dba46c2",
-            "Rajgarhi": "63f5c23898d5e0c03dba49e6",
-            "Ramgarh": "6492b819882c8da847737192",
-            "Ramnagar": "6492b819882c8da847737194",
-            "Ranikhet": "63f37f8f491ca1c60486a1b6",
-            "Rikhanikhal": "63f5bd1d98d5e0c03db9dd5f",
-            "Rishikesh": "63f5b8e498d5e0c03db97734",
-            "Roorkee": "63f5b8f898d5e0c03db9795b",
-            "Rudraprayag": "63f5bef398d5e0c03dba0961",
-            "Rudrapur": "63f5c1fa98d5e0c03dba44c8",
-            "Sankari": "63f5c2b798d5e0c03dba534d",
-            "Satpuli": "63f5bbe598d5e0c03db9c048",
-            "Shama": "63f381bd491ca1c60486d5fa",
-            "Sitarganj": "63f5c1d098d5e0c03dba4154",
-            "Someshwar": "63f3801e491ca1c60486af36",
-            "Srinagar": "63f5ba6598d5e0c03db99d61",
-            "Sult": "63f37f74491ca1c604869efd",
-            "Syalde": "63f38076491ca1c60486b766",
-            "Tehri": "63f5c01c98d5e0c03dba2096",
-            "Tejam": "63f5be7698d5e0c03db9fddc",
-            "Thailisain": "63f5bb4f98d5e0c03db9b2dc",
-            "Thal": "63f5be8e98d5e0c03dba004c",
-            "Tharali": "63f38232491ca1c60486e187",
-            "Tyuni": "63f38363491ca1c60487010e",
-            "Ukhimath": "63f5bec698d5e0c03dba054a",
-            "Vikas Nagar": "63f3a9da491ca1c604870586",
-            "Yamkeshwar": "63f5bc9b98d5e0c03db9d19c",
-            "UDAM SINGH NAGAR": "63f5c16798d5e0c03dba38cd",
-            "UTTAR KASHI": "63f5c21198d5e0c03dba46bf",
-            "RUDRA PRAYAG": "63f5bec598d5e0c03dba0547",
-            "PAURI GARHWAL": "63f5ba6598d5e0c03db99d5e",
-            "TEHRI GARHWAL": "63f5bf6298d5e0c03dba1302",
-            "HARIDWAR": "63f5b8f898d5e0c03db97958"
-        },
-        "63f87a1836497c055ce09df5": {
-            "Alipurduar - I": "63f88f2d36497c055ce29783",
-            "Alipurduar - II": "63f88f4436497c055ce298b6",
-            "Amdanga": "63f89436d2e83876f0423346",
-            "Amta - I": "63f8803e36497c055ce13617",
-            "Amta - II": "63f8803136497c055ce134bc",
-            "Arambag": "63f87eef36497c055ce1118e",
-            "Arsha": "63f88d4936497c055ce27a4a",
-            "Ausgram - I": "63f89cc7d2e83876f042bec9",
-            "Ausgram - II": "63f89cacd2e83876f042bcb5",
-            "BANARHAT": "63f8810036497c055ce14959",
-            "Baduria": "63f894a9d2e83876f0423bb8",
-            "Bagda": "63f8939ed2e83876f042280e",
-            "Bagmundi": "63f88dbf36497c055ce2818a",
-            "Bagnan - I": "63f8808b36497c055ce13df2",
-            "Bagnan - II": "63f8809536497c055ce13ef3",
-            "Balagarh": "63f87f6636497c055ce11eb3",
-            "Balarampur": "63f88df136497c055ce28452",
-            "Bally Jagachha": "63f8806836497c055ce13a41",
-            "Balurghat": "63f87ce836497c055ce0de63",
-            "Bamangola": "63f881a136497c055ce15b15",
-            "Bankura - I": "63f89989d2e83876f0428372",
-            "Bankura - II": "63f899bed2e83876f0428662",
-            "Bansihari": "63f87d6d36497c055ce0e9ed",
-            "Barabani": "63f8936f36497c055ce2da32",
-            "Barabazar": "63f88e0c36497c055ce2862f",
-            "Barasat - I": "63f89462d2e83876f0423676",
-            "Barasat - II": "63f89477d2e83876f0423812",
-            "Barjora": "63f899f3d2e83876f0428966",
-            "Barrackpur - I": "63f8944bd2e83876f04234dd",
-            "Barrackpur - II": "63f89459d2e83876f04235e8",
-            "Baruipur": "63f89615d2e83876f0425398",
-            "Basanti": "63f897cfd2e83876f0426a8f",
-            "Basirhat - I": "63f894c3d2e83876f0423d9f",
-            "Basirhat - II": "63f894d3d2e83876f0423edc",
-            "Beldanga - I": "63f88a0d36497c055ce23c2b",
-            "Beldanga - II": "63f88a1836497c055ce23d77",
-            "Berhampore": "63f889df36497c055ce23748",
-            "Bhagawangola - I": "63f8893036497c055ce2263d",
-            "Bhagawangola - II": "63f8893d36497c055ce2276b",
-            "Bhagawanpur - I": "63f8832b36497c055ce186d3",
-            "Bhagawanpur - II": "63f8830e36497c055ce18389",
-            "Bhangar - I": "63f895bad2e83876f0424e59",
-            "Bhangar - II": "63f895d1d2e83876f0424fff",
-            "Bharatpur - I": "63f88a3136497c055ce23fe2",
-            "Bharatpur - II": "63f88a2636497c055ce23edc",
-            "Bhatar": "63f89d94d2e83876f042ce2b",
-            "Binpur - I": "63f8904936497c055ce2a74b",
-            "Binpur - II": "63f88fa736497c055ce29e1b",
-            "Bishnupur - I": "63f8957ad2e83876f04249ee",
-            "Bishnupur - II": "63f89594d2e83876f0424bad",
-            "Bolpur Sriniketan": "63f87a2536497c055ce09f17",
-            "Bongaon": "63f893b9d2e83876f0422a2c",
-            "Budge Budge - I": "63f89561d2e83876f0424832",
-            "Budge Budge - II": "63f89568d2e83876f04248a2",
-            "Bundwan": "63f88ebf36497c055ce291d9",
-            "Burdwan - I": "63f89ddbd2e83876f042d36d",
-            "Burdwan - II": "63f89deed2e83876f042d4ff",
-            "Burwan": "63f88a4336497c055ce241b0",
-            "COOCHBEHAR I": "63f87b2336497c055ce0b581",
-            "Canning - I": "63f895e2d2e83876f042512d",
-            "Canning - II": "63f895f9d2e83876f0425260",
-            "Chakdah": "63f88b7b36497c055ce25adc",
-            "Chanchal - I": "63f8813036497c055ce14e95",
-            "Chanchal - II": "63f8814336497c055ce15090",
-            "Chandipur": "63f8834836497c055ce18a18",
-            "Chanditala - I": "63f87fe436497c055ce12c0c",
-            "Chanditala - II": "63f87fed36497c055ce12d26",
-            "Chandrakona - I": "63f8851836497c055ce1bbba",
-            "Chandrakona - II": "63f8852f36497c055ce1be50",
-            "Chapra": "63f88adf36497c055ce24e31",
-            "Chhatna": "63f898ced2e83876f0427978",
-            "Chinsurah - Magra": "63f87f7f36497c055ce1215d",
-            "Chopra": "63f87da736497c055ce0f010",
-            "Contai - I": "63f883a336497c055ce193ea",
-            "Contai - III": "63f883e936497c055ce19ba0",
-            "Cooch Behar - II": "63f87b3f36497c055ce0b85d",
-            "Dantan - I": "63f8885b36497c055ce210a1",
-            "Dantan - II": "63f8887e36497c055ce21486",
-            "Darjeeling Pulbazar": "63f87bd436497c055ce0c48e",
-            "Daspur - I": "63f8856036497c055ce1c3b8",
-            "Daspur - II": "63f8857e36497c055ce1c6e4",
-            "Debra": "63f8871436497c055ce1f0c6",
-            "Deganga": "63f8948cd2e83876f042399a",
-            "Deshopran": "63f883ca36497c055ce19851",
-            "Dhaniakhali": "63f87f2236497c055ce1176b",
-            "Dhupguri": "63f880da36497c055ce145e3",
-            "Diamond Harbour - I": "63f896c9d2e83876f0425c56",
-            "Diamond Harbour - II": "63f896e4d2e83876f0425dc0",
-            "Dinhata - I": "63f87b7336497c055ce0bd22",
-            "Dinhata - II": "63f87b9a36497c055ce0bfb3",
-            "Domjur": "63f8805e36497c055ce1392c",
-            "Domkal": "63f8895e36497c055ce22a8c",
-            "Dubrajpur": "63f87a6036497c055ce0a50b",
-            "Egra - I": "63f8840636497c055ce19edb",
-            "Egra - II": "63f8841e36497c055ce1a176",
-            "English Bazar": "63f8820336497c055ce165de",
-            "Falakata": "63f88f6336497c055ce29a48",
-            "Falta": "63f89692d2e83876f04259bb",
-            "Farakka": "63f888aa36497c055ce2190d",
-            "Faridpur Durgapur": "63f893a736497c055ce2ddbe",
-            "Gaighata": "63f893e0d2e83876f0422d1c",
-            "Galsi - I": "63f89db1d2e83876f042d044",
-            "Galsi - II": "63f89dc7d2e83876f042d1fe",
-            "Gangajalghati": "63f89898d2e83876f042763d",
-            "Gangarampur": "63f87c8836497c055ce0d48a",
-            "Garbeta - I": "63f884a736497c055ce1afea",
-            "Garbeta - II": "63f8846736497c055ce1a962",
-            "Garbeta - III": "63f884ed36497c055ce1b72b",
-            "Gazole": "63f8817036497c055ce1555a",
-            "Ghatal": "63f8854636497c055ce1c0e1",
-            "Goalpokhar - I": "63f87dcf36497c055ce0f460",
-            "Goalpokhar - II": "63f87df536497c055ce0f75f",
-            "Goghat - I": "63f87eca36497c055ce10d6b",
-            "Goghat - II": "63f87edc36497c055ce10f5c",
-            "Gopiballavpur - I": "63f8925236497c055ce2c846",
-            "Gopiballavpur - II": "63f8921536497c055ce2c484",
-            "Gorubathan": "63f88f9536497c055ce29d20",
-            "Gosaba": "63f897e5d2e83876f0426be0",
-            "Habibpur": "63f881bb36497c055ce15ddd",
-            "Habra - I": "63f89411d2e83876f0423081",
-            "Habra - II": "63f89421d2e83876f04231b4",
-            "Haldia": "63f8836a36497c055ce18deb",
-            "Haldibari": "63f87ab236497c055ce0accd",
-            "Hanskhali": "63f88b2636497c055ce2542b",
-            "Hariharpara": "63f889fa36497c055ce23a29",
-            "Haringhata": "63f88b9936497c055ce25ceb",
-            "Haripal": "63f87fb136497c055ce1267a",
-            "Harirampur": "63f87d8d36497c055ce0ed14",
-            "Harischandrapur - I": "63f8811036497c055ce14b12",
-            "Harischandrapur - II": "63f8812236497c055ce14d21",
-            "Haroa": "63f894e9d2e83876f042403c",
-            "Hasnabad": "63f89535d2e83876f0424550",
-            "Hemtabad": "63f87e6736497c055ce1030e",
-            "Hilli": "63f87cda36497c055ce0dcc7",
-            "Hingalganj": "63f8954dd2e83876f04246c9",
-            "Hirbandh": "63f89bfdd2e83876f042af6a",
-            "Hura": "63f88ce036497c055ce273a0",
-            "Illambazar": "63f87a4736497c055ce0a26b",
-            "Indpur": "63f89944d2e83876f0427f1a",
-            "Indus": "63f89a97d2e83876f042941b",
-            "Islampur": "63f87dbd36497c055ce0f265",
-            "Itahar": "63f87ea236497c055ce10916",
-            "Jagatballavpur": "63f8804d36497c055ce137a9",
-            "Jaipur": "6492b81b882c8da8477371b6",
-            "Jalangi": "63f8895336497c055ce22981",
-            "Jalpaiguri": "63f880f936497c055ce148c6",
-            "Jamalpur": "63f89e74d2e83876f042deeb",
-            "Jamboni": "63f891ac36497c055ce2bde8",
-            "Jamuria": "63f8938036497c055ce2db38",
-            "Jangipara": "63f87ff436497c055ce12dd7",
-            "Jaynagar - I": "63f89798d2e83876f0426741",
-            "Jaynagar - II": "63f897afd2e83876f04268b0",
-            "Jaypur": "63f89ae2d2e83876f0429a00",
-            "Jhalda - I": "63f88d6d36497c055ce27c2c",
-            "Jhalda - II": "63f88d9b36497c055ce27ef9",
-            "Jhargram": "63f890f436497c055ce2b21a",
-            "Jorebunglow Sukiapokhri": "63f87be336497c055ce0c60e",
-            "KALYANI": "63f88baf36497c055ce25ea0",
-            "KRANTI": "63f8810936497c055ce14a46",
-            "Kakdwip": "63f897ffd2e83876f0426d6a",
-            "Kalchini": "63f88f0436497c055ce2957c",
-            "Kaliachak - I": "63f8822a36497c055ce16a42",
-            "Kaliachak - II": "63f8823536497c055ce16b8e",
-            "Kaliachak - III": "63f8824036497c055ce16cda",
-            "Kaliaganj": "63f87e7c36497c055ce10554",
-            "Kaliganj": "63f88a9c36497c055ce24991",
-            "Kalimpong -I": "63f88f7a36497c055ce29b91",
-            "Kalna - I": "63f89e3bd2e83876f042dab4",
-            "Kalna - II": "63f89e57d2e83876f042dcb4",
-            "Kandi": "6492b81b882c8da8477371b2",
-            "Kanksa": "63f893b736497c055ce2dedd",
-            "Karandighi": "63f87e1d36497c055ce0fab3",
-            "Karimpur - I": "63f88a6936497c055ce244d4",
-            "Karimpur - II": "63f88a7836497c055ce24648",
-            "Kashipur": "6492b81b882c8da8477371b8",
-            "Katwa - I": "63f89d1ed2e83876f042c4f8",
-            "Katwa - II": "63f89d2fd2e83876f042c649",
-            "Keshiary": "63f8882f36497c055ce20c53",
-            "Keshpur": "63f8858e36497c055ce1c894",
-            "Ketugram - I": "63f89cfcd2e83876f042c292",
-            "Ketugram - II": "63f89d0ed2e83876f042c3de",
-            "Khanakul - I": "63f8800b36497c055ce1305e",
-            "Khanakul - II": "63f8801b36497c055ce13236",
-            "Khandaghosh": "63f89eb2d2e83876f042e38b",
-            "Kharagpur - I": "63f886a236497c055ce1e497",
-            "Kharagpur - II": "63f886d236497c055ce1e9df",
-            "Khargram": "63f889ae36497c055ce2326e",
-            "Kharibari": "63f87c3636497c055ce0ce85",
-            "Khatra": "63f89bd7d2e83876f042ac61",
-            "Khejuri - I": "63f8838936497c055ce19125",
-            "Khejuri - II": "63f8839036497c055ce191f9",
-            "Khoyrasol": "63f87a8f36497c055ce0a977",
-            "Kolaghat": "63f8827736497c055ce172cb",
-            "Kotulpur": "63f89ab8d2e83876f04296ac",
-            "Krishnaganj": "63f88b1836497c055ce2531b",
-            "Krishnagar - I": "63f88b0236497c055ce25148",
-            "Krishnagar - II": "63f88af236497c055ce24fd7",
-            "Kulpi": "63f89703d2e83876f0425f89",
-            "Kultali": "63f897bfd2e83876f04269a7",
-            "Kumarganj": "63f87caf36497c055ce0d883",
-            "Kumargram": "63f88f1836497c055ce29664",
-            "Kurseong": "63f87bf136497c055ce0c789",
-            "Kushmundi": "63f87c5e36497c055ce0d005",
-            "LAVA": "63f88f8b36497c055ce29c92",
-            "Labpur": "63f8a093d2e83876f0430401",
-            "Lalgola": "63f888f936497c055ce2208a",
-            "MATHABHANGA II": "63f87b1036497c055ce0b3ae",
-            "Madarihat": "63f88ef236497c055ce29480",
-            "Magrahat - I": "63f89671d2e83876f04257fc",
-            "Magrahat - II": "63f89652d2e83876f042564c",
-            "Mahisadal": "63f882bf36497c055ce17ab2",
-            "Mal": "63f880be36497c055ce1434e",
-            "Maldah (Old)": "63f881ee36497c055ce1638e",
-            "Manbazar - I": "63f88e4c36497c055ce28a69",
-            "Manbazar - II": "63f88e9036497c055ce28f2f",
-            "Mandirbazar": "63f8974ed2e83876f0426319",
-            "Mangolkote": "63f89cd8d2e83876f042bffc",
-            "Manikchak": "63f8821b36497c055ce16883",
-            "Manteswar": "63f89d70d2e83876f042cb59",
-            "Mathabhanga - I": "63f87af136497c055ce0b1ae",
-            "Mathurapur - I": "63f89777d2e83876f0426550",
-            "Mathurapur - II": "63f897f5d2e83876f0426ce1",
-            "Matiali": "63f880cd36497c055ce1449a",
-            "Matigara": "63f87bfe36497c055ce0c8f8",
-            "Maynaguri": "63f880e636497c055ce14711",
-            "Mayureswar - I": "63f89f7fd2e83876f042f18d",
-            "Mayureswar - II": "63f89fa5d2e83876f042f3c9",
-            "Mejhia": "63f8987dd2e83876f04274c4",
-            "Mekliganj": "63f87abd36497c055ce0ae05",
-            "Memari - I": "63f89e06d2e83876f042d6be",
-            "Memari - II": "63f89e24d2e83876f042d8f5",
-            "Midnapore": "63f8866e36497c055ce1df4a",
-            "Minakhan": "63f8950fd2e83876f04242ca",
-            "Mirik": "63f87bec36497c055ce0c705",
-            "Mohammad Bazar": "63f89fcfd2e83876f042f65a",
-            "Mohanpur": "6492b81b882c8da8477371b0",
-            "Moyna": "63f882cc36497c055ce17c2b",
-            "Murarai - I": "63f89ee9d2e83876f042e790",
-            "Murarai - II": "63f89f01d2e83876f042e92c",
-            "Murshidabad Jiaganj": "63f8897e36497c055ce22d88",
-            "Nabadwip": "63f88afb36497c055ce250ba",
-            "Nabagram": "63f8899836497c055ce2301e",
-            "Nagrakata": "63f880d336497c055ce14537",
-            "Nakashipara": "63f88abe36497c055ce24c0e",
-            "Nalhati - I": "63f89f18d2e83876f042ea96",
-            "Nalhati - II": "63f89f32d2e83876f042ec6e",
-            "Namkhana": "63f8981bd2e83876f0426f1c",
-            "Nanda Kumar": "63f882ad36497c055ce178b7",
-            "Nandigram - I": "63f8836f36497c055ce18e65",
-            "Nandigram - II": "63f8838236497c055ce19056",
-            "Nanoor": "63f87a1936497c055ce09dfd",
-            "Narayangarh": "63f887c636497c055ce20238",
-            "Nawda": "63f88a0636497c055ce23b66",
-            "Naxalbari": "63f87c0b36497c055ce0ca6c",
-            "Nayagram": "63f8929636497c055ce2cc80",
-            "Neturia": "63f88c5836497c055ce26afa",
-            "Onda": "63f89b2fd2e83876f0429fe0",
-            "Ondal": "63f8939736497c055ce2dcb1",
-            "PEDONG": "63f88fa236497c055ce29de0",
-            "Panchla": "63f8807136497c055ce13b30",
-            "Pandabeswar": "63f8939f36497c055ce2dd35",
-            "Pandua": "63f87f4b36497c055ce11b9b",
-            "Panskura": "63f8824d36497c055ce16e50",
-            "Para": "63f88bfc36497c055ce2642d",
-            "Patharpratima": "63f89829d2e83876f0426fe1",
-            "Patrasayer": "63f89a6ad2e83876f04290f9",
-            "Phansidewa": "63f87c2036497c055ce0cc4e",
-            "Pingla": "63f8877636497c055ce1fa1e",
-            "Polba - Dadpur": "63f87f8b36497c055ce122ae",
-            "Potashpur - I": "63f882dc36497c055ce17dd6",
-            "Potashpur - II": "63f882f436497c055ce18094",
-            "Puncha": "63f88d2636497c055ce27827",
-            "Purbasthali - I": "63f89d40d2e83876f042c79f",
-            "Purbasthali - II": "63f89d5ad2e83876f042c995",
-            "Pursura": "63f87f0b36497c055ce114ab",
-            "Purulia - I": "63f88d0436497c055ce275e6",
-            "Purulia - II": "63f88bda36497c055ce261e7",
-            "Raghunathganj - I": "63f888d736497c055ce21d89",
-            "Raghunathganj - II": "63f888e636497c055ce21ed5",
-            "Raghunathpur - I": "63f88c3b36497c055ce268f5",
-            "Raghunathpur - II": "63f88c1f36497c055ce266dc",
-            "Raiganj": "63f87e4136497c055ce0feac",
-            "Raina - I": "63f89e94d2e83876f042e154",
-            "Raina - II": "63f89ed0d2e83876f042e5b8",
-            "Raipur": "6492b81b882c8da8477371ac",
-            "Rajarhat": "63f89503d2e83876f0424200",
-            "Rajganj": "63f880b936497c055ce142bb",
-            "Rajnagar": "63f8a000d2e83876f042f972",
-            "Ramnagar - I": "63f8843336497c055ce1a3c1",
-            "Ramnagar - II": "63f8844f36497c055ce1a6b1",
-            "Rampurhat - I": "63f89f3fd2e83876f042ed60",
-            "Rampurhat - II": "63f89f60d2e83876f042efb5",
-            "Ranaghat - I": "63f88b4b36497c055ce25722",
-            "Ranaghat - II": "63f88b5c36497c055ce25891",
-            "Rangli Rangliot": "63f87bde36497c055ce0c57b",
-            "Ranibundh": "63f89c1dd2e83876f042b1c9",
-            "Raniganj": "6492b81b882c8da8477371b4",
-            "Raninagar - I": "63f8897236497c055ce22c41",
-            "Raninagar - II": "63f8894c36497c055ce228cb",
-            "Ratua - I": "63f8815336497c055ce1525e",
-            "Ratua - II": "63f8816536497c055ce15459",
-            "Sabang": "63f8879936497c055ce1fdae",
-            "Sagar": "63f8980cd2e83876f0426e2f",
-            "Sagardighi": "63f8890c36497c055ce22262",
-            "Sahid Matangini": "63f8829d36497c055ce176fd",
-            "Sainthia": "63f8a05ad2e83876f042ff7c",
-            "Salanpur": "63f8935936497c055ce2d8af",
-            "Salbani": "63f8860b36497c055ce1d4f8",
-            "Saltora": "63f89849d2e83876f04271b1",
-            "Samserganj": "63f888b836497c055ce21a81",
-            "Sandeshkhali - I": "63f89525d2e83876f042443e",
-            "Sandeshkhali - II": "63f8952ed2e83876f04244d6",
-            "Sankrail": "6492b81b882c8da8477371ae",
-            "Santipur": "63f88b3a36497c055ce255c2",
-            "Santuri": "63f88c7e36497c055ce26d72",
-            "Sarenga": "63f89c83d2e83876f042b973",
-            "Serampur Uttarpara": "63f87fe036497c055ce12b92",
-            "Shyampur - I": "63f8809d36497c055ce13fea",
-            "Shyampur - II": "63f880ab36497c055ce1413b",
-            "Simlapal": "63f89ba0d2e83876f042a868",
-            "Singur": "63f87fcc36497c055ce1297e",
-            "Sitai": "63f87bbd36497c055ce0c221",
-            "Sitalkuchi": "63f87bc736497c055ce0c32c",
-            "Sonamukhi": "63f89a31d2e83876f0428d55",
-            "Sonar pur": "63f895a6d2e83876f0424cef",
-            "Suri - I": "63f8a01ed2e83876f042fb63",
-            "Suri - II": "63f8a040d2e83876f042fd9f",
-            "Sutahata": "63f8835c36497c055ce18c54",
-            "Suti - I": "63f888c036497c055ce21b5f",
-            "Suti - II": "63f888cc36497c055ce21c97",
-            "Swarupnagar": "63f893fdd2e83876f0422f35",
-            "Taldangra": "63f89b7ad2e83876f042a591",
-            "Tamluk": "63f8828c36497c055ce17502",
-            "Tapan": "63f87d3836497c055ce0e478",
-            "Tarakeswar": "63f87f1336497c055ce115a7",
-            "Tehatta - I": "63f88a8536497c055ce247ad",
-            "Tehatta - II": "63f88a9236497c055ce248e5",
-            "Thakurpukur Mahestola": "63f8955ad2e83876f04247a9",
-            "Tufanganj - I": "63f87b5436497c055ce0baa3",
-            "Tufanganj - II": "63f87b6236497c055ce0bc12",
-            "Udaynarayanpur": "63f8802436497c055ce13343",
-            "Uluberia - I": "63f8807e36497c055ce13c8d",
-            "Uluberia - II": "63f8807836497c055ce13bd7",
-            "Vishnupur": "63f89b05d2e83876f0429cb9",
-            "MURSHIDABAD": "63f888aa36497c055ce2190a",
-            "HOOGHLY": "63f87eca36497c055ce10d68",
-            "24 PARAGANAS NORTH": "63f8939dd2e83876f042280b",
-            "MALDAH": "63f8811036497c055ce14b0f",
-            "24 PARAGANAS SOUTH": "63f8955ad2e83876f04247a6",
-            "MEDINIPUR WEST": "63f8846736497c055ce1a95f",
-            "BIRBHUM": "63f87a1936497c055ce09dfa",
-            "BANKURA": "63f89849d2e83876f04271ae",
-            "NADIA": "63f88a6936497c055ce244d1",
-            "PURULIA": "63f88bbc36497c055ce25faf",
-            "PURBA BARDHAMAN": "63f89cacd2e83876f042bcb2",
-            "COOCHBEHAR": "63f87ab236497c055ce0acca",
-            "KALIMPONG": "63f88f7a36497c055ce29b8e",
-            "DINAJPUR UTTAR": "63f87da736497c055ce0f00d"
-        }
-    },
-    "crops": {
-        "63f9ce47519359b7438e76fa": {
-            "Arecanut (All Variety)": "6625fcb2c986db5da828c206",
-            "Banana (Rainfed / Annual Crop)": "6766545e6112cf7f303c5820",
-            "Bitter Gourd (All Variety)": "6625fcbec986db5da828c517",
-            "Brinjal (Rainfed / Annual Crop)": "676654b5fbb2cbacd169edb9",
-            "Chilli (All Variety)": "6625fccec986db5da828c8fd",
-            "Coconut (Rainfed / Kharif)": "66fabb857d64243f07fedf82",
-            "Cowpea (Lobia)": "6625fcdec986db5da828cc8b",
-            "Cucumber (All Variety)": "6625fce0c986db5da828ccdf",
-            "Guava (All Variety)": "6625fcefc986db5da828d06a",
-            "Maize (All Variety)": "6625fd02c986db5da828d451",
-            "Mango (Rainfed / Rabi)": "67665315f150ec5ca611ee0c",
-            "Okra (All Variety)": "6625fcbdc986db5da828c4d8",
-            "Pumpkin (All Variety)": "6625fd29c986db5da828ddd4",
-            "Rice (All Variety)": "6625fd1cc986db5da828da93",
-            "Sapota (All Variety)": "6625fd31c986db5da828dfe6",
-            "Tapioca (Rainfed / Annual Crop)": "67b43848a6d5cbf4b6b929d1",
-            "Tomato (Irrigated / Rabi)": "676653505ab3ccf528cc5e53"
-        },
-        "63f957b089d86ca9e2c00e14": {
-            "నిమ్మకాయ (Acid Lime 1st year / Irrigated / Annual Crop)": "66c41540f576c8c832b3a075",
-            "నిమ్మకాయ (Acid Lime/ All Varieties / Rainfed / Annual Crop)": "6625fcacc986db5da828c0ca",
-            "నిమ్మకాయ (Acid Lime 2nd year / Irrigated / Annual Crop)": "66c415506c5969665c2fd239",
-            "నిమ్మకాయ (Acid Lime 3rd Year / Irrigated / Annual Crop)": "66c4155fb98893c09a570356",
-            "నిమ్మకాయ (Acid Lime 4th Year / Irrigated / Annual Crop)": "66c415706211dd4f8d51d8f6",
-            "వాము (Ajwain/All Variety / Irrigated / Annual Crop)": "6625fcadc986db5da828c0d8",
-            "వక్కలు / పోకలు  (Arecanut All Varieties / Irrigated / Annual Crop)": "6929a4293b25d2c9e5cff884",
-            "అరటి (Banana/తెల్ల చక్కర ఖేలి / Irrigated / Annual Crop)": "66c413358aa9e5022f257032",
-            "అరటి (Banana/అరటి/All varieties/Annual / Irrigated / Annual Crop)": "6625fcb6c986db5da828c2fe",
-            "ఊదలు (ఊదలు/Barnyard Millet/Lcoal / Rainfed / Kharif)": "66791df877314b7c8b661ffa",
-            "బెర్సీమ్ గడ్డి  (Berseem Grass/బెర్సీమ్ గడ్డి  / Rainfed / Kharif)": "667d4cbdf638afa5a1f7f730",
-            "బీన్స్ చిక్కుడు (French Bean/ All Seasons / Irrigated / Rabi)": "669fe69a18fa29ccd3858e96",
-            "సొరకాయ , ఆనపకాయ (ఆనపకాయ/bottle gourd all varieties / Irrigated / Kharif)": "66c33016246c96443bb5ef1d",
-            "వంకాయ (Brinjal/వంకాయ/All Variety/60-100days / Irrigated / Kharif)": "6625fcc2c986db5da828c5d9",
-            "Brown Top Millet (అన్డుకొర్రలు / Irrigated / Kharif)": "669e3127bb109ac363c733a5",
-            "buffel grass (anjan grass) (బఫెల్ లేదా అంజన్ గడ్డి  / Irrigated / Rabi)": "667d4d54cdf0b5c9d689c90b",
-            "Cabbage (All Variety)": "6625fcc4c986db5da828c694",
-            "Capsicum (Green Chilli/ పచ్చి మిరప / Irrigated / Annual Crop)": "67fe54801829b52f8e7d6ae4",
-            "క్యారెట్ (Carrot/క్యారెట్/All Varieties / Irrigated / Rabi)": "6682ae9848fd7808b6c2fba4",
-            "జీడిమామిడి  (Cashew Nut/జీడిమామిడి/All varieties / Irrigated / Kharif)": "66a2027868c18bc89ef646c4",
-            "ఆముదము (Hybrid Castor Kharif/ ఖరీఫ్/ 95-180days / Irrigated / Kharif)": "6679308158c0184c1fd31ea6",
-            "ఆముదము (Castor Kharif/ఆముదము ఖరీఫ్ /Varieties/90-180days / Rainfed / Kharif)": "6625fcc9c986db5da828c7a7",
-            "ఆముదము (Hybrid Castor Rabi/95-180 days / Irrigated / Rabi)": "667930af02ccc5bb213fd624",
-            "ఆముదము (Castor Rabi/ఆముదము రబీ/Varieties/90-180days / Rainfed / Rabi)": "6678498b44ed264662ee0716",
-            "కాలీఫ్లవర్ (Cauliflower/All Variety / Irrigated / Rabi)": "6625fcc9c986db5da828c7cd",
-            "శనగలు (శనగ రబీ /140/Bengalgram Varieties / Rainfed / Rabi)": "6672c13f46bfb892132efa1d",
-            "ఎండుమిరప (Red Chillies/Rainfed Hybrids/200-210days / Rainfed / Kharif)": "6625fccfc986db5da828c92f",
-            "ఎండుమిరప (Red chillies Irrigated/Rabi/250days / Irrigated / Rabi)": "6682ad05c7246082fe6fc196",
-            "ఎండుమిరప (Red Chillies/ Kharif Irrigated Hybrids/200-210 days / Irrigated / Kharif)": "66784b0f44ed264662ee0ed4",
-            "చామంతి (Chrysanthemum/All varieties / Irrigated / Annual Crop)": "66c32c45f576c8c832af94f9",
-            "గోరుచిక్కుడు  (Cluster Bean/Goruchikkudu/All Variety / Irrigated / Annual Crop)": "6625fcd5c986db5da828ca2c",
-            "కోకో  (COCOA/All Variety / Irrigated / Annual Crop)": "6625fcd5c986db5da828ca58",
-            "కోకో  (3rd year COCOA/Perennial/Varieties / Irrigated / Kharif)": "6625fcd6c986db5da828ca83",
-            "కొబ్బరి చెట్టు  (Coconut/5th Year/All Varieties/Perennial / Irrigated / Kharif)": "6625fcd8c986db5da828cb01",
-            "కొబ్బరి చెట్టు  (Coconut/All Variety / Irrigated / Annual Crop)": "6625fcd6c986db5da828ca9b",
-            "కొత్తిమీర-ధనియాలు (Coriander/All Variety / Irrigated / Annual Crop)": "6625fcdac986db5da828cb92",
-            "అలసందలు/బొబ్బర (Cowpea/ alasandalu/All Variety / Rainfed / Kharif)": "6625fcdec986db5da828cc70",
-            "కనకాంబరం  (Crossandra/Kanakambaram / Irrigated / Rabi)": "67fe67ab945e1f97b6546121",
-            "దోస/ దోసకాయ (Cucumber/దోసకాయ/All Variety/60-100days / Irrigated / Kharif)": "6625fcdfc986db5da828ccb5",
-            "డ్రాగన్ ఫ్రూట్ (Dragon Fruit/డ్రాగన్ ఫ్రూట్/Irrigated/Perennial/All Varieties / Irrigated / Annual Crop)": "66784d9dd7ca8ef1e99c8f6f",
-            "డ్రాగన్ ఫ్రూట్ (Dragon Fruit/All Variety / Irrigated / Annual Crop)": "6625fce3c986db5da828cd97",
-            "యూకలిప్టస్-నీలగిరి (All varieties / Irrigated / Annual Crop)": "687a148e05fe96b5145ad4d6",
-            "యూకలిప్టస్-నీలగిరి (Eucalyptus / Rainfed / Annual Crop)": "687a127c9a1b76efacfe676c",
-            "రాగులు (Finger Millet/Ragi/Rabi Rainfed/రాగి రబీ/Long Duration/100-115 / Rainfed / Rabi)": "66784377580b2be940b55a9d",
-            "రాగులు (Finger Millet/Kharif-Rainfed/ఖరీఫ్ రాగి /All Variety/80-90days / Rainfed / Kharif)": "6625fce5c986db5da828cde0",
-            "కొర్రలు (Korra/Foxtail millet/All seasons / Rainfed / Kharif)": "669e307818fa29ccd35c354a",
-            "వేరుశనగ (Groundnut/Kharif-Rainfed/వేరుశనగ ఖరీఫ్ /90-100/all varieties / Rainfed / Kharif)": "666cd59fcfbe3cadfc44dc13",
-            "వేరుశనగ (Groundnut/Rabi-Irrigated/వేరుశనగ రబీ/110-120days/all varieties / Irrigated / Rabi)": "6678471a58c0184c1fc2cb49",
-            "జామ పండు  (Guava/Jamapandu/All Variety / Rainfed / Annual Crop)": "6625fcefc986db5da828d05e",
-            "Guinea Grass (గినియా గడ్డి  / Irrigated / Rabi)": "667d4d2da79149c866c209c6",
-            "దశరథ గడ్డి/హెడ్జ్ లూసెర్న్  (Hedge Lucern/Dasardha Grass/దశరథ గడ్డి/హెడ్జ్ లూసెర్న్  / Irrigated / Rabi)": "667d4ca796ae43ed2ff91c87",
-            "పచ్చి బఠానీ (Horsegram/ఉలవలు/Local/90days / Rainfed / Rabi)": "667925b102ccc5bb213d8da5",
-            "దొండకాయ (Ivy gourd/ Coccinia/దొండకాయ/All Variety/60-100days / Irrigated / Kharif)": "6625fcf3c986db5da828d13c",
-            "మల్లె పువ్వులు (Jasmine/మల్లెపువ్వులు /All Variety/Pernnial / Irrigated / Kharif)": "6625fcf6c986db5da828d1d3",
-            "జనుము (Jute/All Variety / Rainfed / Annual Crop)": "6625fcf6c986db5da828d211",
-            "Kodo Millet (Rabi Millets/Arikalu/80-85days / Rainfed / Rabi)": "6678442d77314b7c8b5ad5d2",
-            "Kodo Millet (All Variety/Kharif Arikalu/70-75 days / Rainfed / Kharif)": "6625fcf8c986db5da828d25b",
-            "Lemon (నిమ్మ 5th year/All Varieties/Perennial / Irrigated / Annual Crop)": "6625fcd3c986db5da828c9e3",
-            "Little Millet (Sama/Little Millet/సామలు/All Variety/Local / Rainfed / Kharif)": "6625fd02c986db5da828d44b",
-            "మొక్కజొన్న (Maize Hybrid/Rabi-Irrigated/Hybrids/100-120days/మొక్కజొన్న  / Irrigated / Rabi)": "66783e52580b2be940b50d6a",
-            "మొక్కజొన్న (Popcorn/85-90/Kharif Hybrids / Irrigated / Kharif)": "66783f3dac3b2717f6dadd93",
-            "మొక్కజొన్న (Sweet Corn/75-100/తీపి మొక్కజొన్న  / Irrigated / Kharif)": "6673fde59ac28a6f1d5c8135",
-            "మొక్కజొన్న (BABY CORN/70-75/Hybrids / Irrigated / Kharif)": "667417eba28c654e764b2b7e",
-            "మొక్కజొన్న (Sweet Corn Rabi/75-100/Hybrids / Irrigated / Rabi)": "66783f06580b2be940b511d0",
-            "మొక్కజొన్న (Babycorn/Rabi Hybrids/120-130days / Irrigated / Rabi)": "6678402444ed264662edd8cd",
-            "మొక్కజొన్న (Maize/HYBRIDS/Kharif-irrigated120/Maize / Irrigated / Kharif)": "666cd1722818ea3c41c26a2d",
-            "మొక్కజొన్న (Fodder Maize/Rabi-Irrigated/మేత మొక్కజొన్న/ Irrigated Crop / Irrigated / Rabi)": "667d4bd8cdf0b5c9d6895ac4",
-            "మొక్కజొన్న (Fodder Maize/ Kharif Rainfed/మేత మొక్కజొన్న/Dryland Crop / Rainfed / Kharif)": "667d4b849aa447a7b7d2379a",
-            "మొక్కజొన్న (Hybrid Popcorn/95-10/Rabi / Irrigated / Rabi)": "66783f79580b2be940b51666",
-            "మామిడి చెట్టు  (Mango 4th Year 100 Trees/Ha / Irrigated / Annual Crop)": "6625fd08c986db5da828d5d1",
-            "మామిడి చెట్టు  (Mango 6Th Year 100 Trees/Ha / Rainfed / Annual Crop)": "6625fd08c986db5da828d5e3",
-            "మామిడి చెట్టు  (Mango 3rd Year 100 Trees/Ha / Irrigated / Annual Crop)": "6625fd08c986db5da828d5cb",
-            "మామిడి చెట్టు  (Mango First Year 100 Trees/Ha / Irrigated / Annual Crop)": "6625fd07c986db5da828d5ad",
-            "మామిడి చెట్టు  (Mango >10 Years old 100 Trees/Ha / Rainfed / Annual Crop)": "6625fd07c986db5da828d5a1",
-            "మామిడి చెట్టు  (Mango 8th Year 100 Trees/Ha / Rainfed / Annual Crop)": "6625fd09c986db5da828d5fb",
-            "మామిడి చెట్టు  (Mango 7th Year 100 Trees/Ha / Rainfed / Annual Crop)": "6625fd09c986db5da828d5ef",
-            "మామిడి చెట్టు  (Mango 9Th Year 100 Trees/Ha / Rainfed / Annual Crop)": "6625fd09c986db5da828d601",
-            "మామిడి చెట్టు  (Mango 2nd Year 100 Trees/Ha / Irrigated / Annual Crop)": "6625fd07c986db5da828d5b9",
-            "మామిడి చెట్టు  (Mango/All Variety / Rainfed / Annual Crop)": "6625fd06c986db5da828d571",
-            "మామిడి చెట్టు  (Mango 5th Year 100 Trees/Ha / Irrigated / Annual Crop)": "6625fd08c986db5da828d5d7",
-            "మామిడి చెట్టు  (Mango 10th year / Rainfed / Annual Crop)": "6625fd09c986db5da828d613",
-            "బంతి పువ్వులు  (Marigold/All Variety / Irrigated / Annual Crop)": "6625fd0cc986db5da828d6a4",
-            "గోగునార  (Mesta/Kharif/120days / Rainfed / Kharif)": "6682aacee2e6255ee4fbc511",
-            "మునగ (Drumstick/munaga/All Variety / Irrigated / Annual Crop)": "6625fd0ec986db5da828d6f8",
-            "మల్బరీ  (Mulberry all varieties/Perennial  / Irrigated / Kharif)": "66742170654eb22a3d7a7719",
-            "పెసలు  (Greengram/Irrigated-Rabi/పెసలు రబీ/all varieties/60-65days / Irrigated / Rabi)": "667844fa8d865d80c0aa4a5a",
-            "పెసలు  (Greengarm/Kharif-Rainfed/పెసలు ఖరీఫ్ /all varieties/60-65days / Rainfed / Kharif)": "6672c0dfec2c54c2840e92a9",
-            "ఖర్బూజా (Muskmelon/ఖర్బూజా/All Variety/60-100days / Irrigated / Kharif)": "6625fd0fc986db5da828d73d",
-            "పామ్ ఆయిల్ (Oilpalm/3rd Year Onwards 140 Trees/Ha / Irrigated / Annual Crop)": "6625fd14c986db5da828d84f",
-            "పామ్ ఆయిల్ (Oilpalm/1st Year 140 Trees/Ha / Irrigated / Annual Crop)": "6625fd13c986db5da828d843",
-            "పామ్ ఆయిల్ (Oilpalm/2nd Year 140 Trees/Ha / Irrigated / Annual Crop)": "6625fd13c986db5da828d849",
-            "పామ్ ఆయిల్ (Oilpalm/All Variety / Rainfed / Annual Crop)": "6625fd13c986db5da828d82b",
-            "పామ్ ఆయిల్ (Oilpalm/3rd year / Irrigated / Annual Crop)": "6625fd14c986db5da828d874",
-            "బెండ (Okra/Ladiesfinger/బెండ/All Varieties/60-100days / Irrigated / Kharif)": "6678516777314b7c8b5b9983",
-            "ఉల్లిపాయలు  (Onion/All Variety / Irrigated / Annual Crop)": "6625fd15c986db5da828d8aa",
-            "ఉల్లిపాయలు  (Onion/Kharif-Rainfed/ఉల్లిపాయలు/Kharif/90-100days / Rainfed / Kharif)": "6682acdf22d02c8ccfd42125",
-            "బొప్పాయి  (Papaya/బొప్పాయి/All Variety/Annual / Irrigated / Kharif)": "6625fd1ec986db5da828db33",
-            "Pea (Green Peas/All varieties / Irrigated / Rabi)": "6682af2b48fd7808b6c2fe46",
-            "సజ్జలు (Bajra Napier Grass/95 days/ID crop Rabi / Irrigated / Rabi)": "667938578d865d80c0bbcbf3",
-            "సజ్జలు (Fodder Bajra/మేత సజ్జలు/Dryland Crop / Rainfed / Kharif)": "667d4bb49aa447a7b7d23f10",
-            "సజ్జలు (Fodder Bajra/Rabi-irrigated/మేత సజ్జలు /Irrigated / Irrigated / Rabi)": "667d4c0896ae43ed2ff903da",
-            "సజ్జలు (Bajra Hybrids/రబీ/110-120days / Irrigated / Rabi)": "667842ce77314b7c8b5ace9b",
-            "సజ్జలు (Bajra Hybrids/ఖరీఫ్/120-130days / Rainfed / Kharif)": "6678429577314b7c8b5acd6b",
-            "సజ్జలు (Napier Grass/నేపియర్ గడ్డి  / Rainfed / Kharif)": "667d4d16f638afa5a1f8067e",
-            "Pigeon Pea (ఖరీఫ్ కంది /120/all varieties / Rainfed / Kharif)": "6672c1202b33a6ac763b6648",
-            "Pigeon Pea (కందులు రబీ/180days/all varieties / Rainfed / Rabi)": "6678463c44ed264662edf6f4",
-            "దానిమ్మ (Pomegranate/All Variety / Rainfed / Annual Crop)": "6625fd25c986db5da828dcca",
-            "వరిగలు (Prosomillet/Variga/వరిగలు/All Variety/Local / Rainfed / Kharif)": "6625fd29c986db5da828dd98",
-            "గుమ్మడి (Pumpkin/All Variety / Irrigated / Annual Crop)": "6625fd29c986db5da828ddaa",
-            "వరి (PADDY/150days/Rice / Irrigated / Kharif)": "6625fd1bc986db5da828da62",
-            "వరి (Rabi Paddy/120days/వరి  / Irrigated / Rabi)": "66783bcbac3b2717f6dac600",
-            "కుసుమలు (Safflower/Kharif-Rainfed/కుసుమ ఖరీఫ్ /varieties/120-125 days / Rainfed / Kharif)": "6625fd30c986db5da828df9e",
-            "కుసుమలు (Safflower/Rabi-Irrigated/కుసుమ రబీ/varieities/120-125 days / Irrigated / Rabi)": "667848c3d7ca8ef1e99c44a4",
-            "సీమారూబ/లక్ష్మీతరు (Seema Ruba/All Variety / Irrigated / Annual Crop)": "6625fd32c986db5da828e016",
-            "నువ్వులు (Sesame/Gingelly/Rabi-Irrigated/నువ్వులు రబీ/ID Crop/80-90days / Irrigated / Rabi)": "667926fa44ed264662fc3826",
-            "నువ్వులు (Sesame/Gingelly/Kharif-Rainfed/నువ్వులు ఖరీఫ్ /80-85days/Varieties / Rainfed / Kharif)": "666cd26bcfbe3cadfc44d70c",
-            "పొట్లకాయ  (Snake Gourd/All Variety / Rainfed / Kharif)": "6625fd35c986db5da828e0b1",
-            "జొన్న (Jowar Rabi Light Soils / Irrigated / Rabi)": "66825d82bfa3c128cea23391",
-            "జొన్న (Jowar Fodder grass/ID Crop/105 days Rabi/ / Irrigated / Rabi)": "6679388244ed264662ff85d5",
-            "జొన్న (Jowar/Rabi-Irrigated/రబీ జొన్న /హైబ్రిడ్/120-130days / Irrigated / Rabi)": "667840f002ccc5bb212f55e6",
-            "జొన్న (Fodder Jowar/Kharif Rainfed/మేత జొన్న/ Dryland crop / Rainfed / Kharif)": "667d4c2bf638afa5a1f7e2bb",
-            "జొన్న (Jowar/Kharif-Rainfed/ఖరీఫ్Hybrids/100/జొన్న  / Rainfed / Kharif)": "666cd1c5cfbe3cadfc44d594",
-            "జొన్న (Jowar Rabi Fertile Soils / Irrigated / Rabi)": "66825d9948fd7808b6b6e24a",
-            "జొన్న (మేత జొన్న /Irrigated Crop / Irrigated / Rabi)": "667d4c4dcafd11f3709d240c",
-            "సోయాబీన్స్ (Soybean/Kharif-Rainfed/సోయాచిక్కుడు ఖరీఫ్/Varieties/90-100days / Rainfed / Kharif)": "667849cc77314b7c8b5b18af",
-            "Spinach (Spinach/Palakura/All Variety / Irrigated / Annual Crop)": "6625fd1dc986db5da828db08",
-            "ఆ కాకర/ బోడ కాకరకాయ  (Spiny Gourd/Agakara/All Variety / Rainfed / Annual Crop)": "6625fd38c986db5da828e191",
-            "స్టైలో హమాటా (Stylo Grass/స్టైలో గడ్డి / Rainfed / Kharif)": "667d4ce9cafd11f3709d3a5c",
-            "Subabul (All varieties / Rainfed / Annual Crop)": "687a1385b5d812c7bf61292f",
-            "చెరకు (క్రొత్త) (Sugarcane/Single Bud Seedlings/Kharif/irrigated / Irrigated / Kharif)": "6625fd3bc986db5da828e233",
-            "చెరకు (క్రొత్త) (Sugarcane/Planted/చెరకు నాటినది/Planted Varieties/10-12 months / Irrigated / Kharif)": "6625fd3bc986db5da828e239",
-            "చెరకు (క్రొత్త) (Saline & Alkalaine Sugarcane Varieties / Irrigated / Kharif)": "6683a38519870b2c41a443b5",
-            "చెరకు (క్రొత్త) (Ratoon Sugarcane/Varieties/12-15months / Irrigated / Kharif)": "6625fd3bc986db5da828e245",
-            "ప్రొద్దు తిరుగుడు (Sunflower/ Kharif-Rainfed/ప్రొద్దుతిరుగుడు ఖరీఫ్/varieties/90-95days / Rainfed / Kharif)": "6625fd3cc986db5da828e288",
-            "ప్రొద్దు తిరుగుడు (Sunflower/Rabi-Irrigagted/ప్రొద్దుతిరుగుడు రబీ/varieties/90-95 / Irrigated / Rabi)": "6678482102ccc5bb212fa6dd",
-            "నారింజపండు  (Sweet Orange 2nd Year / Irrigated / Annual Crop)": "66c41428bf5261f087f3d98e",
-            "నారింజపండు  (Sweet Orange Fifth Year/All Varieties/Perennial / Irrigated / Annual Crop)": "6625fd3dc986db5da828e2a6",
-            "నారింజపండు  (Sweet Orange 4th Year / Irrigated / Annual Crop)": "66c4144e8f07b3ccadcc8fe7",
-            "నారింజపండు  (Sweet Orange 3rd year / Irrigated / Annual Crop)": "66c4143b8aa9e5022f257928",
-            "నారింజపండు  (Sweet Orange 1st Year / Irrigated / Annual Crop)": "66c4141312bba54891245505",
-            "చిలగడదుంప (All Variety)": "6625fd3ec986db5da828e303",
-            "చిలగడదుంప (Sweet Potato/All varieties / Irrigated / Rabi)": "6682b050922b1d8135b3bbc8",
-            "Tapioca (Tapioca/Karrapendalam/All Variety / Irrigated / Annual Crop)": "6625fd3fc986db5da828e357",
-            "హైబ్రీడ్ ప్రత్తి  (Bt Hybrid Kharif Irrigated Dry / Irrigated)": "6625fcdcc986db5da828cbf8",
-            "హైబ్రీడ్ ప్రత్తి  (DESI COTTON VARIETIES/ID crop   / Irrigated / Rabi)": "6625fcdcc986db5da828cc11",
-            "హైబ్రీడ్ ప్రత్తి  (CONVENTIONAL COTTON HYBRIDS   / Irrigated / Rabi)": "6625fcdcc986db5da828cc0b",
-            "హైబ్రీడ్ ప్రత్తి  (AMERICAN COTTON VARIETIES/Hybrids   / Irrigated / Rabi)": "6625fcdec986db5da828cc57",
-            "హైబ్రీడ్ ప్రత్తి  (Hybrid Bt Cotton/Kharif-Rainfedప్రత్తి హైబ్రీడ్ /180-200days/Hybrids / Rainfed / Kharif)": "6625fcdbc986db5da828cbf2",
-            "హైబ్రీడ్ ప్రత్తి  (BT Cotton Hybrids Kharif/180-200days / Rainfed / Kharif)": "6625fcdbc986db5da828cbeb",
-            "పొగాకు  (Tobacco/పొగాకు Heavy soils/90-120days/Varieties / Irrigated / Kharif)": "6625fd42c986db5da828e402",
-            "పొగాకు  (Tobacco/Kharif-Irrigated/పొగాకు Light soils/90-120days/Varieties / Irrigated / Kharif)": "6625fd42c986db5da828e408",
-            "టొమాట (Tomato/టొమాటో/All Variety/60-100days / Irrigated / Kharif)": "6625fd42c986db5da828e414",
-            "Tuberose (Tuberose/కాగడమల్లెలు/ట్యూబ్ రోజ్ / all varieties / Irrigated / Annual Crop)": "66c32c95246c96443bb5950d",
-            "పసుపుకొమ్ములు  (Turmeric/పసుపుకొమ్ములు/All Variety/180-210days / Irrigated / Kharif)": "6625fd44c986db5da828e4a4",
-            "మినుములు (Blackgram/Rabi/మినుములు రబీ/all varieties/80-85 days / Rainfed / Rabi)": "667845b5d7ca8ef1e99c0853",
-            "మినుములు (Blackgram/Kharif/మినుములు ఖరీఫ్ /all varieties/80-85days / Rainfed / Kharif)": "6672c0fc9ac28a6f1d43d250",
-            "పుచ్చకాయ  (Water melon/పుచ్చకాయ/all Varieties/60-100days / Irrigated / Kharif)": "667852c502ccc5bb213002b5"
-        },
-        "63f86a1cd2e83876f03e7d32": {
-            "Apple (Local)": "6625fcafc986db5da828c176",
-            "Arecanut (Arecanut)": "6625fcb3c986db5da828c221",
-            "Banana (Local)": "6625fcb7c986db5da828c32b",
-            "Brinjal (Local)": "6625fcc2c986db5da828c612",
-            "Cabbage (Local)": "6625fcc6c986db5da828c6dd",
-            "Castor (Rainfed / Kharif)": "69843577fe908add57fd398e",
-            "Cauliflower (Local)": "6625fccbc986db5da828c833",
-            "Dragon Fruit (Irrigated / Rabi)": "698426125e80806f2c734351",
-            "Finger Millet (Local)": "6625fd0dc986db5da828d6ce",
-            "Ginger (Local)": "6625fce8c986db5da828cec5",
-            "Groundnut (Rainfed / Kharif)": "6983244097bb4259c448b94f",
-            "Indian Mustard (Rainfed / Rabi)": "69831b7b870d7135e0a91b90",
-            "Large Cardamon (Rainfed / Kharif)": "66a8c69808f32d5d1a15fb88",
-            "Maize (Local)": "6625fd03c986db5da828d4bb",
-            "Oil Palm (Oil palm)": "6625fd13c986db5da828d83d",
-            "Pineapple (Local)": "6625fd24c986db5da828dc81",
-            "Potato (Local)": "6625fd28c986db5da828dd5c",
-            "Pumpkin (Local)": "6625fd29c986db5da828ddce",
-            "Rapeseed (Rainfed / Rabi)": "6985bf5519b955c297f412e7",
-            "Rice (Local)": "6625fd1bc986db5da828da56",
-            "Rubber (Rubber)": "6625fd2fc986db5da828df4a",
-            "Sesame (Rainfed / Annual Crop)": "698323410bc3b1b1587148f2",
-            "Soybean (Rainfed / Kharif)": "6983246f870d7135e0aac2c7",
-            "Sunflower (Rainfed / Annual Crop)": "6985bed119b955c297f3ec71",
-            "Sweet Orange (Local)": "6625fd16c986db5da828d91d",
-            "Tea (Local)": "6625fd40c986db5da828e3ad",
-            "Tomato (Local)": "6625fd43c986db5da828e444"
-        },
-        "63f87b48d2e83876f040050d": {
-            "বেঙেনা  (F1 Megna)": "6625fcc2c986db5da828c5ff",
-            "ফুলকবি (F1 Megna)": "6625fccac986db5da828c7f7",
-            "মাকৈ (Rainfed / Rabi)": "66264ad15a09e4dc482eff02",
-            "মাকৈ (Rainfed / Kharif)": "66264ab9d9f6c87ed8935fb4",
-            "আলু (Kufri Pukhraj)": "6625fd27c986db5da828dd44",
-            "বাছমতী চাউল (All Variety / Rainfed / Rabi)": "6625fd3bc986db5da828e24b"
-        },
-        "63f86570d2e83876f03e015b": {
-            "Indian Mustard (All / Irrigated / Rabi)": "66a1dcec68c18bc89eeb2ee4",
-            "Maize (All / Irrigated / Kharif)": "66a0adb9bb109ac363fe26cd",
-            "Potato (All Variety)": "6625fd26c986db5da828dd01",
-            "Rice (All Variety / Kharif)": "6625fd1cc986db5da828da86"
-        },
-        "63f8e35adbc0f7fe06708342": {
-            "चना (Kabuli)": "6625fceac986db5da828cf32",
-            "चना (Desi)": "6625fceac986db5da828cf2c",
-            "मूंगफली (Rainfed / Kharif)": "6846c718602e389524c5a27f",
-            "मूंगफली (Irrigated / Kharif)": "6846c5bd1f262933289c1997",
-            "Horse Gram (Medium / Rainfed)": "6625fcf2c986db5da828d0f0",
-            "सरसों (Medium / Irrigated)": "6625fd10c986db5da828d767",
-            "Kodo (All Variety)": "6625fcf7c986db5da828d254",
-            "अलसी (All Variety)": "6625fd00c986db5da828d3ea",
-            "मक्का (All Variety)": "6625fd02c986db5da828d458",
-            "मूंग (All Variety)": "6625fd0ec986db5da828d6ec",
-            "Nigerseed (All Variety / Rainfed / Kharif)": "6846c0c41f262933289b2203",
-            "Nigerseed (All Variety / Irrigated / Kharif)": "6846c04da16920e60f26226e",
-            "अरहर (All Variety)": "6625fcb4c986db5da828c259",
-            "धान (All Variety / Irrigated / Rabi)": "664c935fa6ac8234847b36d4",
-            "धान (Rainfed)": "6625fd2bc986db5da828de59",
-            "Sesame (All Variety / Rainfed / Kharif)": "6846c272602e389524c4aa2c",
-            "Sesame (All Variety / Irrigated / Kharif)": "6846c25c3e7d6bb1092cb976",
-            "Sesame (All Variety / Irrigated / Rabi)": "6846c290f184cf40e3603c56",
-            "Soybean (All Variety)": "6625fd36c986db5da828e0f9",
-            "सूरजमुखी (All Variety)": "6625fd3bc986db5da828e25e",
-            "गेहूं (All Variety)": "6625fd49c986db5da828e5ea"
-        },
-        "63f5ceb98cec41e6c95ce3a8": {
-            "Acacia (All Variety / Irrigated / Annual Crop)": "6633625b7ca2283f41005d9e",
-            "Apple (Hybrid)": "6625fcb0c986db5da828c184",
-            "Apple (All Variety)": "6625fcafc986db5da828c169",
-            "Banana (All Variety)": "6625fcb6c986db5da828c30b",
-            "Cabbage (local / Irrigated / Rabi)": "6625fcc4c986db5da828c6a0",
-            "Carrot (All Variety / Irrigated / Rabi)": "6625fcc7c986db5da828c752",
-            "Mango (local / Irrigated / Kharif)": "6622305a5051cacf29ce36e8",
-            "Potato (Irrigated / Rabi)": "661115d8e043e79219441dd2",
-            "Tomato (All Variety / Irrigated / Rabi)": "6625fd43c986db5da828e456",
-            "Wheat (Irrigated / Rabi)": "661115e71d0579666d72fcbd"
-        },
-        "63f9bcdc519359b7438cdeb3": {
-            "Arecanut (Irrigated / Kharif)": "6625e2eb5dce468bfe773555",
-            "Banana (Irrigated / Kharif)": "6625e33d5dce468bfe774c73",
-            "Black Pepper (Irrigated / Kharif)": "6625e3635dce468bfe775079",
-            "Cashew (Rainfed / Annual Crop)": "685bd54677cdcbd3e5fade2c",
-            "Chilli (Local)": "6625fccfc986db5da828c935",
-            "Coconut (Benaulim, Calangute)": "6625fcd7c986db5da828caad",
-            "Cowpea (Irrigated / Kharif)": "6625e4635dce468bfe77609b",
-            "Cucumber (Irrigated / Kharif)": "6625e4785dce468bfe7765bd",
-            "Finger Millet (Irrigated / Kharif)": "6625e4e2e957592861bb5ef7",
-            "Groundnut (Irrigated / Kharif)": "6625e50ae957592861bba62e",
-            "Mango (Irrigated / Kharif)": "6625e5c35dce468bfe7785b6",
-            "Nutmeg (Irrigated / Kharif)": "6625e5f3e957592861bbe551",
-            "Papaya (Irrigated / Kharif)": "6625e6c1e957592861bc2a70",
-            "Pineapple (Irrigated / Kharif)": "6625e6f829f208603783c898",
-            "Rice (Irrigated / Kharif)": "6625e7b2e957592861bc5c01",
-            "Sapota (Irrigated / Kharif)": "6625e7e9b0e7b1b0f9f65f42",
-            "Tomato (Local)": "6625fd43c986db5da828e45c",
-            "Turmeric (Irrigated / Kharif)": "6625e869b0e7b1b0f9f661dd"
-        },
-        "63f922a6dbc0f7fe06751641": {
-            "રીંગણ (Local  / Irrigated / Kharif)": "661e4d9fa48550cd2e1f83fb",
-            "રીંગણ (Local)": "6625fcc2c986db5da828c606",
-            "એરંડા (gch 7, gch 8, gch 9 (pcs 124), gac 11,dcs-94, 48-1, dcs-89, ji 35, ji 96, jp 96, ski 215, skp-84, vi 9, vp-1 (conv.), vp-1 (modified) / Irrigated / Kharif)": "661e506624edc2edfe155b33",
-            "એરંડા (All Variety)": "6625fcc9c986db5da828c79b",
-            "મરચાં (Local)": "6625fccec986db5da828c8cf",
-            "મરચાં (local varieties / Irrigated / Kharif)": "661e510924edc2edfe15dc89",
-            "ગુવાર (pusa navbahar, gg-1, gg-2)": "6625fcd5c986db5da828ca45",
-            "ગુવાર (pusa navbahar, gg-1, gg-2 / Irrigated / Kharif)": "661e532b85ffb7195a899667",
-            "કોથમીર (guj-1, guj-2)": "6625fcdac986db5da828cb98",
-            "જીરું (All Variety)": "6625fce1c986db5da828cd16",
-            "વરીયાળી (All Variety)": "6625fce4c986db5da828cdbc",
-            "લસણ (All Variety)": "6625fce6c986db5da828ce4b",
-            "મગફળી (All Variety)": "6625fcefc986db5da828d039",
-            "મગફળી (gg 34, gaug 10, gg 11, gg 2, gg 20, gg 41 (padma), gg 5, gg 7, gg hps 2, gjg 17, gjg 21, gjg 22, gjg 31, gjg 32, gjg 9, sb xi (j 11) / Irrigated / Kharif)": "661e548391211e05b3d13ee9",
-            "મગફળી (Padma)": "6625fcefc986db5da828d045",
-            "રાયડો (All Variety)": "6625fd10c986db5da828d761",
-            "ઇસબગુલ (guj. isabgol-2)": "6625fcf3c986db5da828d135",
-            "જ્યુટ (Local)": "6625fcf6c986db5da828d217",
-            "મકાઈ (gawmh2 female igi-1102, gawmh2 male igi-1104, gaymh1 female igi-1101, gaymh1 male igi-1103, gm-6, narmada moti, gaymh3 female gyl-2 gaymh3 male igi-1101 / Irrigated / Kharif)": "661e644924edc2edfe22de5d",
-            "મકાઈ (All Variety)": "6625fd02c986db5da828d477",
-            "કેરી (Alphonso, Kesar, Rajapuri, Vanraj, Jamadar, Totapuri, Neelum, Dashehari, Langra / Irrigated / Kharif)": "661e650024edc2edfe234e3a",
-            "કેરી (All Variety)": "6625fd07c986db5da828d589",
-            "લાંગ (gm-4, gm-6, gm-7 / Irrigated / Kharif)": "661e6b1824edc2edfe258d4e",
-            "લાંગ (gm-4, gm-6, gm-7)": "6625fcecc986db5da828cf9f",
-            "ભીંડા (Local)": "6625fd14c986db5da828d88c",
-            "ડુંગળી (GAWO 2)": "6625fd15c986db5da828d8c8",
-            "બાજરી (ghb 1231 (female parent icma 11222), ghb 1231 (male parent j-2597) / Irrigated / Kharif)": "661e659f85ffb7195a95453c",
-            "તુવેર (gnp-2, gt-104, gt-105, bdn-2, gt-103, icpl-87, / Irrigated / Kharif)": "661e6c0e8ef8310c00411383",
-            "તુવેર (All Variety)": "6625fd23c986db5da828dc63",
-            "બટાકા (All Variety)": "6625fd27c986db5da828dd1f",
-            " ચોખા (gnr-3, gnr-6, gr-17 (sardar), gar 13,  gar 14, gr 11, gr 3, gr 4, gr 7, gurjari, ir 28, jaya, mahisagar, masuri / Irrigated / Kharif)": "661e6a1da48550cd2e2bedc5",
-            " ચોખા (All Variety)": "6625fd1ac986db5da828da01",
-            "ચીકુ  (Kalipatti, Pilipatti, Cricket Ball, PKM-1 / Irrigated / Kharif)": "661e67178ef8310c003fe5f0",
-            "ચીકુ  (Kalipatti, Pilipatti, Cricket Ball, PKM-1)": "6625fd31c986db5da828dfe0",
-            "તલ (All Variety)": "6625fd34c986db5da828e066",
-            "તલ (gjt-5 / Rainfed)": "6625fd34c986db5da828e087",
-            "તલ (g. til 1, g. til 10, g. til 2, g. til 3, g. til 4, g. til 6 / Irrigated / Kharif)": "661e6a858ef8310c00408ac9",
-            "જુવાર (gafs 11, gafs 12 / Irrigated / Kharif)": "661e675291211e05b3d66146",
-            "જુવાર (gafs 11, gafs 12)": "6625fd36c986db5da828e0d5",
-            "સોયાબીન (nrc 37)": "6625fd37c986db5da828e123",
-            "સોયાબીન (nrc 37 / Irrigated / Kharif)": "661e695591211e05b3d74617",
-            "શેરડી (All Variety)": "6625fd3ac986db5da828e1d4",
-            "શેરડી (gujarat sugarcane-1, gujarat sugarcane-2,gujarat sugarcane-3, gujarat sugarcane-4, gujarat sugarcane-5, gujarat sugarcane-6,  gns-8, co-86032, gujarat navsari sugarcane-7, co-62175, co-6304, c.o.l.k.-8001 / Irrigated / Kharif)": "661e680f91211e05b3d69f1f",
-            " કપાસ (g. cot 21, gujarat-67 female of hybrid-4, srt-gms1 female of g.cot. mdh-11, gadc 3, v 797,  bc-68-2 (ww) female of g.cot hy 10 (non bt), g.cot.10 male of g.cot hy-6 (non bt), g.cot.100 female of g.cot hy-6 (non bt), lra-5166 (sb) male of g. cot hy.10 (non bt) / Irrigated / Kharif)": "661e542585ffb7195a89d707",
-            "તમાકુ (hybrid)": "6625fd42c986db5da828e3e4",
-            "Tobacco (g. t.-4, g. c.-1, g. t. -6, g .t.-5, g. t.-7, g.c.t.-3, guj. tobacco-8, guj. tobacco-9, guj. hybrid tobacco-1 / Irrigated / Kharif)": "661e68f824edc2edfe24a625",
-            "અડદ (guj-1, guj-2, t-9 / Kharif)": "6625fcc0c986db5da828c596",
-            "ઘઉં (gw 1346, gdw-1255, gw - 451, gw 496, gw 513, gw-11, gw-173, gw-273, gw-322, gw-499, gw-503, lok 1   / Irrigated / Rabi)": "66559cfc55fbea98e3182152"
-        },
-        "63f5c2cf98d5e0c03dba5507": {
-            "जौ  (All Variety / Rainfed / Rabi)": "66b185e2a27591badcdc39a3",
-            "जौ  (All Variety / Irrigated / Rabi)": "66b185caf7fa5723d2555deb",
-            "बरसीम (All Variety / Irrigated / Rabi)": "66b18807066e74bc773e70fc",
-            "चना (All Variety / Irrigated / Rabi)": "66b18608ffef4aef89300a19",
-            "ग्वार फली (All Variety / Irrigated / Kharif)": "66b18a4fa27591badcdc6062",
-            "कपास (All Variety (desi) / Irrigated / Kharif)": "66b18a3afe9d6e9cee25850a",
-            "मूंगफली (All Variety / Irrigated / Kharif)": "66b187f6502b111df7ae71c6",
-            "भारतीय सरसों (All Variety / Rainfed / Rabi)": "66b187c178427c14fdee474d",
-            "भारतीय सरसों (All Variety / Irrigated / Rabi)": "66b1878997ed547d8de5132f",
-            "मसूर (All Variety / Irrigated / Rabi)": "66b186b5066e74bc773e6448",
-            "मक्का (Hybrid (Kharif) / Irrigated / Kharif)": "66b188e7a27591badcdc5919",
-            "मक्का (Local / Irrigated / Rabi)": "66b188f8a27591badcdc5a09",
-            "मक्का (All Variety (Rabi) / Irrigated / Rabi)": "66c70ee608e71fc16dab082c",
-            "मूंग (All Variety / Irrigated / Kharif)": "66b18b0aa27591badcdc6745",
-            "बाजरा   (Hybrid / Irrigated / Kharif)": "66b189d8fe9d6e9cee25839f",
-            "बाजरा   (Rainfed / Rainfed / Kharif)": "66b18a02ffef4aef8930661f",
-            "अरहर (All Variety / Irrigated / Kharif)": "66b1875697ed547d8de51219",
-            "आलू  (All Variety / Irrigated / Rabi)": "66b1887fa27591badcdc565a",
-            "Rice (dwarf variety / Irrigated / Kharif)": "66b18967ffef4aef89306216",
-            "Rice (All Variety (Basmati) / Irrigated / Kharif)": "66c70da774cd6dfb250c7eb4",
-            "Rice (Local variety / Irrigated / Kharif)": "66b1898762360e63de20ade4",
-            "गन्ना (planted / Irrigated / Annual Crop)": "66b18845d9d25a760fcb822e",
-            "गन्ना (ratoon / Irrigated / Annual Crop)": "66b18867502b111df7ae7583",
-            "सूरजमुखी (All Variety / Irrigated / Rabi)": "66b187e0fe9d6e9cee257579",
-            "Tetraploid Cotton (All Variety (bt) / Irrigated / Kharif)": "66b18a26f7fa5723d2558622",
-            "टमाटर  (Irrigated / Rabi)": "66c70d709a5020d850a83b8d",
-            "उड़द (All Variety / Irrigated / Kharif)": "66b18ca878427c14fdee6ab6",
-            "गेहूं (dwarf variety / Irrigated / Rabi)": "66b1848d97ed547d8de4f9e6",
-            "गेहूं (All Variety / Rainfed / Rabi)": "66b1858e78427c14fdee36e1",
-            "Wheat (desi / Irrigated / Rabi)": "66b1856c502b111df7ae5baa"
-        },
-        "63f21f6089e2887695740385": {
-            "Apple (All variety >10 years)": "6625fcb0c986db5da828c17d",
-            "Cabbage (All Variety)": "6625fcc6c986db5da828c6f5",
-            "Cauliflower (All Variety)": "6625fcc9c986db5da828c7c7",
-            "Chickpea (All Variety)": "6625fcbbc986db5da828c439",
-            "Chilli (capsicum)": "6625fcc7c986db5da828c726",
-            "Garlic (All Variety)": "6625fce7c986db5da828ce75",
-            "Maize (All Variety)": "6625fd02c986db5da828d46a",
-            "Mungbean (All Variety)": "6625fcecc986db5da828cf99",
-            "Okra (All Variety)": "6625fd14c986db5da828d880",
-            "Pea (All Variety)": "6625fd21c986db5da828dbe9",
-            "Pear (All variety >10 years)": "6625fd20c986db5da828dbb3",
-            "Pearl Millet (All Variety)": "6625fd21c986db5da828dbdd",
-            "Potato (Rainfed / Rabi)": "66cdae4fffba855b2c92966a",
-            "Radish (All Variety)": "6625fd2ac986db5da828ddf8",
-            "Rice (Rainfed / Kharif)": "6694bfafa2deaefb33a34cce",
-            "Spinach (All Variety)": "6625fd38c986db5da828e161",
-            "Tomato (All Variety)": "6625fd44c986db5da828e462",
-            "Urdbean (All Variety)": "6625fcbfc986db5da828c52a",
-            "Wheat (Rainfed)": "6625fd4ac986db5da828e61a",
-            "Wheat (All Irrigated varieties)": "6625fd4ac986db5da828e60e"
-        },
-        "63f20ca84fadd776ffd9d608": {
-            "Apple (apple/pear/cherry (9th year 278 trees/ha) / Irrigated / Pre-kharif)": "666409e60644f0353570ee98",
-            "Apple (Apple Pear Cherry (13th Year) / Rainfed / Annual Crop)": "66f688fe3b597c4c695aad1d",
-            "Apple (Apple Pear Cherry (14th Year) / Rainfed / Annual Crop)": "66f68975ae840b26770853e0",
-            "Apple (Apple Pear Cherry (15th Year & Above) / Rainfed / Annual Crop)": "66f68d270c72412606d83721",
-            "Apple (Apple Pear Cherry (15th Year) / Rainfed / Annual Crop)": "66f6899b3b597c4c695ad34e",
-            "Apple (Apple (5th Year) / Irrigated / Pre-kharif)": "66fa6c47371417cf16fa9249",
-            "Apple (Apple (3rd Year) / Irrigated / Pre-kharif)": "66fa6b676c55374eaab7f0a4",
-            "Apple (Apple 10Th Year / Rainfed / Annual Crop)": "66f6858dae840b2677073540",
-            "Apple (Apple ( 2nd Year) / Irrigated / Pre-kharif)": "66fa6a7a371417cf16fa39e3",
-            "Apple (Apple Pear Cherry (11th Year) / Rainfed / Annual Crop)": "66f6878427a0d5aca32245d5",
-            "Apple (apple/pear/cherry (10th year 278 trees/ha) / Irrigated / Pre-kharif)": "66640a597d6cba82b0ca0509",
-            "Apple (Apple Ist Year / Rainfed / Pre-kharif)": "66fa68626c55374eaab75426",
-            "Apple (Apple ( 4th Year) / Irrigated / Pre-kharif)": "66fa6be127a0d5aca355b58b",
-            "Apple (Apple Pear Cherry (12 th Year) / Rainfed / Annual Crop)": "66f688076c55374eaa848391",
-            "Apple (apple/pear/cherry (3rd year 278 trees/ha) / Irrigated / Annual Crop)": "666406ba0644f035356fef5f",
-            "Apple (apple/pear/cherry (5th year 278 trees/ha) / Irrigated / Annual Crop)": "666407e12567ceb1c9a789f1",
-            "Apple (apple/pear/cherry (4rd year 278 trees/ha) / Irrigated / Pre-kharif)": "6664074b2567ceb1c9a77081",
-            "Apple (2Nd Year 278 Trees/Ha)": "6625fcb1c986db5da828c1ba",
-            "Apple (apple/pear/cherry (6th year 278 trees/ha) / Irrigated / Pre-kharif)": "666408480644f03535702958",
-            "Apple (apple/pear/cherry (8th year 278 trees/ha) / Irrigated / Pre-kharif)": "666409645bba5202ebaf8a9f",
-            "Apple (apple/pear/cherry (7th year 278 trees/ha) / Irrigated / Pre-kharif)": "666408dc76ff3b6221523ba6",
-            "Barley (Barley / Rainfed / Rabi)": "66fa4d399df72a13e646fcde",
-            "Barseem (Barseem / Rainfed / Rabi)": "66fa4af36c55374eaaaff460",
-            "Brinjal (Irrigated / Kharif)": "6663f06c76ff3b62214846c5",
-            "Brinjal (Vegetable)": "6625fcc2c986db5da828c5f9",
-            "Cabbage (Vegetable)": "6625fcc5c986db5da828c6bf",
-            "Cauliflower (Irrigated / Kharif)": "6663fab276ff3b62214e2d05",
-            "Celery (Irrigated / Kharif)": "6663ff77b84bdecb6405e07d",
-            "Chickpea (Chickpea / Irrigated / Kharif)": "66fa48079df72a13e645b38e",
-            "Chilli (Vegetable)": "6625fccec986db5da828c8f0",
-            "Cowpea (Shalimar Cowpea I)": "6625fcdec986db5da828cc7d",
-            "Cucumber (Vegetable / Irrigated / Kharif)": "6625fcdfc986db5da828ccc7",
-            "Cucumber (Japanese Long Green)": "6625fce0c986db5da828ccd9",
-            "Garlic (Vegetable)": "6625fce6c986db5da828ce51",
-            "Groundnut (Groundnut / Rainfed / Rabi)": "66fa50f69df72a13e647d0bf",
-            "Guava (2nd Year / Irrigated / Kharif)": "6960cf60f3486eb349af126d",
-            "Guava (3rd year / Irrigated / Kharif)": "6960cf7e98f372424a297903",
-            "Guava (4th year / Irrigated / Kharif)": "6960cf99e864088829e6bf4e",
-            "Guava (1st year / Rainfed / Kharif)": "6960cf3416ae9c032a5f9b44",
-            "Guava (5th Year / Irrigated / Kharif)": "6960cfae846388e21dc5ea94",
-            "Indian Mustard (Brown Sarsoon/ Indian Mustard / Irrigated / Rabi)": "66b7334146e23eb3e9e813a5",
-            "Indian Mustard (Irrigated / Rabi)": "665ac4404090a42962a127e0",
-            "Kidney Beans (RAJMA / Rainfed / Kharif)": "66fa53a89df72a13e6489332",
-            "Kodo Millet (KODO MILLET / Rainfed / Rabi)": "66fa5087371417cf16f49a9f",
-            "Lemon (lemon/irrigated/6yrs / Irrigated / Pre kharif)": "695e7a5c846388e21da241dc",
-            "Lemon (lemon/irrigated/2yr / Irrigated / Annual Crop)": "6954f493fb4640b1f8caa04a",
-            "Lemon (lemon/irrigated/3yr / Irrigated / Annual Crop)": "6956280dda277814c2093133",
-            "Lemon (Irrigated / Annual Crop)": "6954f37e6dc8fafb0da0ad86",
-            "Lemon (lemon/irrigated/4yr / Irrigated / Annual Crop)": "6956287039c7a41550bf8d17",
-            "Lemon (lemon/irrigated/5yr / Irrigated / Annual Crop)": "695628a0fb4640b1f8d5b657",
-            "Lentil (Lentil / Rainfed / Rabi)": "66fa492a0c724126060268d1",
-            "Litchi (litchi/irrigated/3yrs / Irrigated / Rabi)": "695e89a198f372424a06bdbd",
-            "Litchi (litchi/irrigated/7yrs / Irrigated / Rabi)": "695e8a6bac601f825555b57c",
-            "Litchi (litchi/irrigated/8yrs / Irrigated / Rabi)": "695e8aabe864088829c3769a",
-            "Litchi (lemon/irrigated/9yrs above / Irrigated / Rabi)": "695e8aeda3172b93e22e21d9",
-            "Litchi (litchi/irrigated/1yr / Irrigated / Rabi)": "695e7c89846388e21da24e1f",
-            "Litchi (litchi/irrigated/2yrs / Irrigated / Rabi)": "695e7cb59d3b4b4c5a92f919",
-            "Maize (J 1006)": "6625fd03c986db5da828d4b5",
-            "Maize (Rainfed / Rainfed / Kharif)": "66b72eae9b1620ec17604219",
-            "Maize (Shalimar Maize Hybrid 1 / Irrigated / Kharif)": "66b72b851af5a34d55702e94",
-            "Maize (Food)": "6625fd03c986db5da828d4a8",
-            "Mango (mango/irrigated/5YR / Irrigated / Annual Crop)": "6953a5e302fc037cb0682fbd",
-            "Mango (MANGO/IRRIGATED/8YR / Irrigated / Annual Crop)": "6954f08329241d3bc4edb74e",
-            "Mango (MANGO/IRRIGATED/9YR / Irrigated / Annual Crop)": "6954f14cfe9a3037241c6e9d",
-            "Mango (MANGO/IRRIGATED/10YR / Irrigated / Annual Crop)": "6954f18b6dc8fafb0da04a5e",
-            "Mango (mango/2 / Irrigated / Annual Crop)": "695252112dbbc5016ef10a47",
-            "Mango (2 / Irrigated / Annual Crop)": "692011ee973439e365105f10",
-            "Mango (MANGO/IRRIGATED/6YR / Irrigated / Annual Crop)": "6954c94ffe9a303724155cd8",
-            "Mango (mango/irrigated/13yr / Irrigated / Annual Crop)": "6954f29f39c7a41550b4006c",
-            "Mango (mango/irrigated/14 yrs above / Irrigated / Annual Crop)": "695756463fa36ddc86596d41",
-            "Mango (mango/1 / Irrigated / Annual Crop)": "695241386619aec002812183",
-            "Mango (mango/irrigated/4yr / Irrigated / Annual Crop)": "69537b63243de1c8b00b247e",
-            "Mango (mango/3 / Irrigated / Annual Crop)": "6953614ff785a6c01df033ba",
-            "Mango (1 / Irrigated / Annual Crop)": "694957c47cc629c712a906df",
-            "Mango (MANGO/IRRIGATED/11YR / Irrigated / Annual Crop)": "6954f1c674de7106627bece0",
-            "Mango (mango/irrigated/15 yr onwards / Irrigated / Annual Crop)": "6954f300da277814c2fd82d5",
-            "Mango (MANGO/IRRIGATED/12YR / Irrigated / Annual Crop)": "6954f20139c7a41550b3d9cf",
-            "Mungbean (Moong / Rainfed / Rabi)": "66fa52f99df72a13e648692c",
-            "Mungbean (Moong / Irrigated / Kharif)": "66b9dbbb5aaac08165fc2707",
-            "Oat (Shalimar Fodder I)": "6625fd13c986db5da828d811",
-            "Oat (Kent)": "6625fd12c986db5da828d80b",
-            "Onion (Vegetable)": "6625fd15c986db5da828d8d4",
-            "Pea (Shalimar Pea I)": "6625fd20c986db5da828db8d",
-            "Pea (Vegetable)": "6625fd21c986db5da828dbef",
-            "Pear (All/1 / Rainfed / Annual Crop)": "6635fb681faa91e2dd1d8334",
-            "Potato (Kufri Jyoti)": "6625fd27c986db5da828dd50",
-            "Proso Millet (Proso Millet / Rainfed / Kharif)": "66fa4f5d71fb71fb5dcb662b",
-            "Radish (Vegetable)": "6625fd2ac986db5da828de16",
-            "Rapeseed (Irrigated / Rabi)": "666401e476ff3b622150bf91",
-            "Rice (SR-II)": "6625fd1ac986db5da828d9f5",
-            "Rice (Rainfed / Rainfed / Kharif)": "66b7306ba12ea87890ecffd3",
-            "Rice (China-1039 / Irrigated / Kharif)": "66f7d9b1d4df4f1797fcb904",
-            "Rice (Ratna / Irrigated / Kharif)": "66f7dbf0d4df4f1797fd0d83",
-            "Rice (Irrigated / Kharif)": "665ac567719a543de1d085b4",
-            "Rice (Pusa 1121 / Irrigated / Kharif)": "66fa4e3e71fb71fb5dcaba65",
-            "Rice (IET-1410)": "6625fd1bc986db5da828da4a",
-            "Rice (Ranbir Basmati / Irrigated / Kharif)": "66fa4e7b27a0d5aca34f10a9",
-            "Rice (K - 39)": "6625fd1bc986db5da828da50",
-            "Rice (SJR-5 / Irrigated / Kharif)": "66f7dc706c55374eaa994a12",
-            "Rice (SR-III)": "6625fd1ac986db5da828d9fb",
-            "Rice (K448)": "6625fd1ac986db5da828d9e9",
-            "Rice (SR-I)": "6625fd1ac986db5da828d9ef",
-            "Safflower (Safflower / Irrigated / Kharif)": "66fa49eb9df72a13e64632b8",
-            "Spinach (Vegetable)": "6625fd38c986db5da828e16d",
-            "Spinach (Irrigated / Rabi)": "666400782567ceb1c9a68f29",
-            "Sugarcane (Sugarcane / Irrigated / Kharif)": "66fa46129df72a13e6454185",
-            "Tomato (Vegetable)": "6625fd43c986db5da828e432",
-            "Tomato (All Variety)": "6625fd43c986db5da828e438",
-            "Walnut (14 th year)": "6625fd47c986db5da828e53c",
-            "Wheat (PBW 187 / Irrigated / Kharif)": "66b729ea9b1620ec175f88ed",
-            "Wheat (Rainfed / Rabi)": "666401612567ceb1c9a6c277",
-            "Wheat (Wheat / Rainfed / Rabi)": "66fa4c87371417cf16f3188e",
-            "Wheat (DBW 303 / Irrigated / Kharif)": "66b72a9da12ea87890ec2ee7"
-        },
-        "63f893d236497c055ce2e09a": {
-            "Brinjal (Hybrid)": "6625fcc3c986db5da828c632",
-            "Cauliflower (All Variety)": "6625fccbc986db5da828c81b",
-            "Chickpea (All Variety)": "6625fceac986db5da828cf1a",
-            "Cluster Bean (All Variety)": "6625fcd5c986db5da828ca3f",
-            "Finger Millet (All Variety)": "6625fce5c986db5da828ce06",
-            "Little Millet (Birsa Gundali-1)": "6625fd01c986db5da828d43f",
-            "Maize (Maize)": "6625fd03c986db5da828d4cf",
-            "Pigeon Pea (All Variety)": "6625fcb4c986db5da828c26d",
-            "Potato (All Variety)": "6625fd28c986db5da828dd74",
-            "Pumpkin (All Variety)": "6625fd29c986db5da828dd9e",
-            "Rice (Gora Paddy, HYV)": "6625fd1cc986db5da828da68",
-            "Wheat (All Variety)": "6625fd4ac986db5da828e62c"
-        },
-        "63f99fbd519359b7438a84ca": {
-            "ಲೋಳೆಸರ (All Variety / Irrigated / Kharif)": "66b5b6a605f96e8242f1a87f",
-            "ಲೋಳೆಸರ (All Variety / Rainfed / Kharif)": "673c34e6d7df5f1bd0b6386e",
-            "ಲೋಳೆಸರ (All Variety / Irrigated / Rabi)": "673c34d7d9431658b0fbf665",
-            "ಲೋಳೆಸರ (All Variety / Rainfed / Rabi)": "673c34f500b21a3a5013c23a",
-            "ಆಂಥೋರಿಯಂ (All Variety / Irrigated / Rabi)": "673c3e6ba7e031e72deb96ab",
-            "ಆಂಥೋರಿಯಂ (all variety / Rainfed / Kharif)": "673c3e78a7e031e72deb9930",
-            "ಆಂಥೋರಿಯಂ (all variety / Irrigated / Kharif)": "66b9eb30759a34554e97f1be",
-            "ಆಂಥೋರಿಯಂ (All Variety / Rainfed / Rabi)": "673c3e8600b21a3a5016f264",
-            "ಅಡಿಕೆ (All Variety / Irrigated / Rabi)": "67178b18f87fc96c374495fe",
-            "ಅಡಿಕೆ (All Variety / Irrigated / Kharif)": "66221d035dce468bfe22fce3",
-            "ಅಡಿಕೆ (all variety / Rainfed / Kharif)": "67178b405dc33be7b611d7d4",
-            "ಅಡಿಕೆ (all variety / Rainfed / Rabi)": "67178bdefda01acf6feef08d",
-            "ಅಶ್ವಗಂಧ (All Variety / Irrigated / Kharif)": "66221a2c5dce468bfe223e99",
-            "ಅಶ್ವಗಂಧ (All Variety / Rainfed / Kharif)": "6735db9937f95e71719e3c79",
-            "ಅಶ್ವಗಂಧ (All Variety / Irrigated / Rabi)": "6735db8b1d4ef6d7e6f50ffc",
-            "ಅಶ್ವಗಂಧ (All Variety / Rainfed / Rabi)": "6735dbae43c0f5959641b48b",
-            "ಅವರೆ (All Variety / Rainfed / Rabi)": "66b5b7ae05f96e8242f2c942",
-            "ಅವರೆ (All Variety / Rainfed / Kharif)": "66b5bf5a05f96e8242f4c8fb",
-            "Avocado (All Variety / Irrigated / Kharif)": "66c48664bcf8f6407c270379",
-            "Avocado (All Variety / Rainfed / Rabi)": "673c3f033973c701cd938a98",
-            "Avocado (All Variety / Irrigated / Rabi)": "673c3ee53973c701cd938480",
-            "Avocado (All Variety / Rainfed / Kharif)": "673c3ef3fb8dd24a10972ade",
-            "ಬಾಳೆ (All Variety / Irrigated / Kharif)": "66221d435dce468bfe23061f",
-            "ಬಾಳೆ (All Variety / Irrigated / Rabi)": "67178bfd59be4b4fb3385c58",
-            "ಬಾಳೆ (All Variety / Rainfed / Rabi)": "67178c3b70b4612eb9f4ee42",
-            "ಬಾಳೆ (All Variety / Rainfed / Kharif)": "67178c265dc33be7b611fb47",
-            "ಊದಲು (All Variety / Rainfed / Kharif)": "66235a099f7cb2d9152c9804",
-            "ಊದಲು (All Variety / Irrigated / Rabi)": "673c345e5e25f80629e620ed",
-            "ಊದಲು (All Variety / Rainfed / Rabi)": "673c344359548458e05c6cfb",
-            "ಊದಲು (All Variety / Irrigated / Kharif)": "673c344fd7df5f1bd0b6007a",
-            "ಬೀಟ್‌ರೂಟ್ (All Variety / Rainfed / Rabi)": "673c3ecad7df5f1bd0ba6868",
-            "ಬೀಟ್‌ರೂಟ್ (all varieties / Irrigated / Kharif)": "66c485b39bfeb323882b2639",
-            "ಬೀಟ್‌ರೂಟ್ (All Variety / Rainfed / Kharif)": "673c3ebf5e25f80629e9f442",
-            "ಬೀಟ್‌ರೂಟ್ (All Variety / Irrigated / Rabi)": "673c3eb2d9431658b0fef093",
-            "ವಿಳೇದೆಲೆ, ವೀಳ್ಯದೆಲೆ (All Variety / Rainfed / Kharif)": "67178c8ff87fc96c3744d89a",
-            "ವಿಳೇದೆಲೆ, ವೀಳ್ಯದೆಲೆ (All Variety / Irrigated / Rabi)": "67178c76f877395948c07280",
-            "ವಿಳೇದೆಲೆ, ವೀಳ್ಯದೆಲೆ (All Variety / Irrigated / Kharif)": "662224415051cacf29c6dfa1",
-            "ವಿಳೇದೆಲೆ, ವೀಳ್ಯದೆಲೆ (All Variety / Rainfed / Rabi)": "67178ca1f87fc96c3744db35",
-            "ಹಾಗಲಕಾಯಿ (All Variety / Rainfed / Rabi)": "67178d62f877395948c090b4",
-            "ಹಾಗಲಕಾಯಿ (All Variety / Irrigated / Kharif)": "6622246729f20860372fd6d1",
-            "ಹಾಗಲಕಾಯಿ (All Variety / Irrigated / Rabi)": "67178d3a0610e537c63ce81a",
-            "ಹಾಗಲಕಾಯಿ (All Variety / Rainfed / Kharif)": "67178d4f5dc33be7b6122711",
-            "ಮೆಣಸು, ಕರಿಮೆಣಸು (All Variety / Irrigated / Kharif)": "6625fcc0c986db5da828c576",
-            "ಮೆಣಸು, ಕರಿಮೆಣಸು (All Variety / Rainfed / Kharif)": "67178dc57ab35c5ed5dcf194",
-            "ಮೆಣಸು, ಕರಿಮೆಣಸು (All Variety / Rainfed / Rabi)": "67178dd87ab35c5ed5dcf439",
-            "ಮೆಣಸು, ಕರಿಮೆಣಸು (All Variety / Irrigated / Rabi)": "67178db4f87fc96c37450213",
-            "ಸೋರೆಕಾಯಿ (All Variety / Rainfed / Rabi)": "673c421ffb8dd24a109858ed",
-            "ಸೋರೆಕಾಯಿ (All Variety / Rainfed / Kharif)": "673c4213d7df5f1bd0bb26c8",
-            "ಸೋರೆಕಾಯಿ (All Variety / Irrigated / Rabi)": "673c4205fb8dd24a109854f7",
-            "ಸೋರೆಕಾಯಿ (All Variety / Irrigated / Kharif)": "66c48633bcf8f6407c26ff51",
-            "ಬದನೇಕಾಯಿ (All Variety / Rainfed / Kharif)": "67178e0de243bafd8c4c7e48",
-            "ಬದನೇಕಾಯಿ (All Variety / Irrigated / Rabi)": "67178dfd1083937850959d76",
-            "ಬದನೇಕಾಯಿ (All Variety / Rainfed / Rabi)": "67178e1ef877395948c0a9ac",
-            "ಬದನೇಕಾಯಿ (All Variety / Irrigated / Kharif)": "662224825051cacf29c7096d",
-            "ಎಲೆಕೋಸು (All Variety / Rainfed / Rabi)": "67178faef87fc96c374542b3",
-            "ಎಲೆಕೋಸು (All Variety / Irrigated / Rabi)": "67178f8b70b4612eb9f55ebe",
-            "ಎಲೆಕೋಸು (All Variety / Rainfed / Kharif)": "67178f9d70b4612eb9f5645b",
-            "ಎಲೆಕೋಸು (All Variety / Irrigated / Kharif)": "6622249d5dce468bfe267398",
-            "Capsicum (All Variety / Rainfed / Kharif)": "673c64e31e5598a5932ef11b",
-            "Capsicum (All Variety / Irrigated / Rabi)": "673c64d3d9431658b007d225",
-            "Capsicum (All Variety / Rainfed / Rabi)": "673c64f13973c701cd9d1533",
-            "Capsicum (All Variety / Irrigated / Kharif)": "66c4867af4a0fadad6097b0a",
-            "ಕ್ಯಾರೆಟ್, ಗಜ್ಜರಿ (All Variety / Irrigated / Kharif)": "662224bb5051cacf29c775ed",
-            "ಕ್ಯಾರೆಟ್, ಗಜ್ಜರಿ (All Variety / Rainfed / Rabi)": "67178fedf87fc96c37454bac",
-            "ಕ್ಯಾರೆಟ್, ಗಜ್ಜರಿ (All Variety / Irrigated / Rabi)": "67178fc8f877395948c0e249",
-            "ಕ್ಯಾರೆಟ್, ಗಜ್ಜರಿ (All Variety / Rainfed / Kharif)": "67178fdc70b4612eb9f56bf3",
-            "ಗೋಡಂಬಿ, ಗೇರು (All Variety / Rainfed / Kharif)": "66b9e8cd5aaac08165ff94a7",
-            "ಮರಗೆಣಸು (All Variety / Irrigated / Rabi)": "6735d8ce79b50ca80cac05e4",
-            "ಮರಗೆಣಸು (All Variety / Irrigated / Kharif)": "662224d45051cacf29c78aca",
-            "ಮರಗೆಣಸು (All Variety / Rainfed / Kharif)": "6735d8d943c0f59596415437",
-            "ಮರಗೆಣಸು (All Variety / Rainfed / Rabi)": "6735d8e7219f5ab8a7829871",
-            "ಹರಳು, ಔಡಲ (All Variety / Irrigated / Kharif)": "662224ef5dce468bfe2698d9",
-            "ಹರಳು, ಔಡಲ (All Variety / Irrigated / Rabi)": "673d79923973c701cda8d1cf",
-            "ಹರಳು, ಔಡಲ (All Variety / Rainfed / Kharif)": "66237348e9575928619f82eb",
-            "ಹರಳು, ಔಡಲ (All Variety / Rainfed / Rabi)": "673d798259548458e075a33f",
-            "ಹೂ ಕೋಸು (all varieties / Irrigated / Rabi)": "6717900f7ab35c5ed5dd3e0b",
-            "ಹೂ ಕೋಸು (all varieties / Rainfed / Kharif)": "67179021f877395948c0e858",
-            "ಹೂ ಕೋಸು (All Variety / Irrigated / Kharif)": "6622250929f20860373052d2",
-            "ಹೂ ಕೋಸು (all varieties / Rainfed / Rabi)": "6717903259be4b4fb338f609",
-            "ಕಡಲೆ (All Variety / Irrigated / Kharif)": "673c36c0a7e031e72de9062b",
-            "ಕಡಲೆ (All Variety / Rainfed / Kharif)": "673c36d15e25f80629e746da",
-            "ಕಡಲೆ (All Variety / Irrigated / Rabi)": "66236f7de9575928619f31ea",
-            "ಕಡಲೆ (All Variety / Rainfed / Rabi)": "66c7072568fb7bba3d0a41a7",
-            "ಮೆಣಸಿನಕಾಯಿ (All Variety / Rainfed / Rabi)": "66c7078b2949bc49382ff029",
-            "ಮೆಣಸಿನಕಾಯಿ (All Variety / Irrigated / Kharif)": "66222526e95759286178fb47",
-            "ಮೆಣಸಿನಕಾಯಿ (All Variety / Rainfed / Kharif)": "66c70764706e831243486d5d",
-            "ಮೆಣಸಿನಕಾಯಿ (All Variety / Irrigated / Rabi)": "66c70779706e8312434874ff",
-            "ಚೈನಾ ಆಸ್ಟರ್ (All Variety / Rainfed / Kharif)": "671790bbf877395948c0f304",
-            "ಚೈನಾ ಆಸ್ಟರ್ (All Variety / Irrigated / Rabi)": "671790a7108393785095f204",
-            "ಚೈನಾ ಆಸ್ಟರ್ (All Variety / Rainfed / Rabi)": "671790cde243bafd8c4cd5f3",
-            "ಚೈನಾ ಆಸ್ಟರ್ (All Variety / Irrigated / Kharif)": "6622264829f208603730d797",
-            "Chow Chow (All Variety / Rainfed / Kharif)": "674ae81764a32b275ae5db23",
-            "Chow Chow (All Variety / Irrigated / Kharif)": "66c48a4e6e05d0b265d87820",
-            "Chow Chow (All Variety / Rainfed / Rabi)": "674ae82787360146304e6852",
-            "Chow Chow (All Variety / Irrigated / Rabi)": "674ae7fef3d1f2acc090b443",
-            "ಸೇವಂತಿಗೆ (All Variety / Irrigated / Kharif)": "6622421ce957592861820e1d",
-            "ಸೇವಂತಿಗೆ (all varieties / Irrigated / Rabi)": "6717911f108393785095fd3f",
-            "ಸೇವಂತಿಗೆ (All Variety / Rainfed / Kharif)": "6717913159be4b4fb3390bc8",
-            "ಸೇವಂತಿಗೆ (all varieties / Rainfed / Rabi)": "671791425dc33be7b612a266",
-            "ಚೌವಳಿ ಕಾಯಿ, ಗೋರಿಕಾಯಿ (All Variety / Irrigated / Rabi)": "6717915e5dc33be7b612a50a",
-            "ಚೌವಳಿ ಕಾಯಿ, ಗೋರಿಕಾಯಿ (All Variety / Rainfed / Kharif)": "67179170fda01acf6fefabfe",
-            "ಚೌವಳಿ ಕಾಯಿ, ಗೋರಿಕಾಯಿ (All Variety / Irrigated / Kharif)": "6622410c5dce468bfe2f8335",
-            "ಚೌವಳಿ ಕಾಯಿ, ಗೋರಿಕಾಯಿ (All Variety / Rainfed / Rabi)": "6717918670b4612eb9f59aa7",
-            "ಕೋಕೋ (Rainfed / Rabi)": "671791ca0610e537c63d6f43",
-            "ಕೋಕೋ (Rainfed / Kharif)": "671791b70610e537c63d6e95",
-            "ಕೋಕೋ (Irrigated / Rabi)": "671791a57ab35c5ed5dd6a0f",
-            "ಕೋಕೋ (All Variety / Rainfed / Rabi)": "673d75921e5598a5933b2292",
-            "ಕೋಕೋ (All Variety / Irrigated / Kharif)": "662241399f7cb2d915135d84",
-            "ತೆಂಗು (All Variety / Irrigated / Rabi)": "66b9e414606f68e8dd56478b",
-            "ತೆಂಗು (Irrigated / Kharif)": "66b9e40087bf0cf1cf7e30a5",
-            "ತೆಂಗು (All Variety / Rainfed / Kharif)": "671791ed70b4612eb9f5a2a6",
-            "ತೆಂಗು (All Variety / Rainfed / Rabi)": "671792001083937850961b6a",
-            "ತೆಂಗು (All Variety / Irrigated / Kharif)": "662241fb5051cacf29d81fc8",
-            "ಕಾಫಿ (All Variety / Irrigated / Kharif)": "6622418a5051cacf29d7c107",
-            "ಕಾಫಿ (All Variety / Rainfed / Kharif)": "66c707a0706e8312434880db",
-            "ಕಾಫಿ (All Variety / Rainfed / Rabi)": "6717926cf87fc96c37458862",
-            "ಕಾಫಿ (All Variety / Irrigated / Rabi)": "671792431083937850962297",
-            "ಧನಿಯ (All Variety / Irrigated / Kharif)": "6622415d5051cacf29d79e1a",
-            "ಧನಿಯ (All Variety / Irrigated / Rabi)": "671792bf59be4b4fb3393667",
-            "ಧನಿಯ (All Variety / Rainfed / Kharif)": "671792d1fda01acf6fefcdb1",
-            "ಧನಿಯ (All Variety / Rainfed / Rabi)": "671792e45dc33be7b612cd67",
-            "ಅಲಸಂದೆ (All Variety / Irrigated / Kharif)": "6735cdb979b50ca80caa614d",
-            "ಅಲಸಂದೆ (All Variety / Rainfed / Rabi)": "66236f9a5dce468bfe4f1f29",
-            "ಅಲಸಂದೆ (All Variety / Rainfed / Kharif)": "66236e26e9575928619eccb9",
-            "ಅಲಸಂದೆ (All Variety / Irrigated / Rabi)": "66236e4529f2086037601eb4",
-            "ಕನಕಾಂಬರ (All Variety / Irrigated / Kharif)": "673c78a700b21a3a5023a40a",
-            "ಕನಕಾಂಬರ (All Variety / Rainfed / Rabi)": "673c78cffb8dd24a10a36a35",
-            "ಕನಕಾಂಬರ (All Variety / Irrigated / Rabi)": "66b9e9f887bf0cf1cf80699e",
-            "ಕನಕಾಂಬರ (All Variety / Rainfed / Kharif)": "673c78c2a7e031e72df8b751",
-            "ಸೌತೆಕಾಯಿ (All Variety / Irrigated / Rabi)": "6735ce0ded8b134a5241ce4e",
-            "ಸೌತೆಕಾಯಿ (All Variety / Rainfed / Rabi)": "6735ce3237f95e71719c46b0",
-            "ಸೌತೆಕಾಯಿ (All Variety / Irrigated / Kharif)": "662242455051cacf29d8443b",
-            "ಸೌತೆಕಾಯಿ (All Variety / Rainfed / Kharif)": "6735ce23a77d60433707227a",
-            "Curry Leaf (All Variety / Irrigated / Kharif)": "662242865dce468bfe303178",
-            "Curry Leaf (All Variety / Irrigated / Rabi)": "6735ce7a219f5ab8a7810658",
-            "Curry Leaf (All Variety / Rainfed / Rabi)": "6735cea079b50ca80caa8dbe",
-            "Curry Leaf (All Variety / Rainfed / Kharif)": "6735ce9179b50ca80caa8add",
-            "ಸೀತಾಫಲ  (All Variety / Irrigated / Kharif)": "6625fce2c986db5da828cd58",
-            "ಸೀತಾಫಲ  (All Variety / Irrigated / Rabi)": "6735d09479b50ca80caae99c",
-            "ಸೀತಾಫಲ  (All Variety / Rainfed / Rabi)": "6735d0af1d4ef6d7e6f375d1",
-            "ಸೀತಾಫಲ  (All Variety / Rainfed / Kharif)": "6735d0a2ed8b134a524244ce",
-            "ಸಬ್ಬಸಿಗೆ ಸೊಪ್ಪು (All Variety / Rainfed / Rabi)": "6735d4d87747932a63335648",
-            "ಸಬ್ಬಸಿಗೆ ಸೊಪ್ಪು (All Variety / Irrigated / Kharif)": "662243025dce468bfe3064cd",
-            "ಸಬ್ಬಸಿಗೆ ಸೊಪ್ಪು (All Variety / Rainfed / Kharif)": "6735d4caa77d60433708319b",
-            "ಸಬ್ಬಸಿಗೆ ಸೊಪ್ಪು (All Variety / Irrigated / Rabi)": "6735d4bd7747932a633352bf",
-            "ಅಂಜೂರ (All Variety / Rainfed / Kharif)": "6735d141450284f81f8beacc",
-            "ಅಂಜೂರ (All Variety / Irrigated / Rabi)": "6735d1321d4ef6d7e6f38e87",
-            "ಅಂಜೂರ (All Variety / Rainfed / Rabi)": "6735d14e79b50ca80cab09a0",
-            "ಅಂಜೂರ (All Variety / Irrigated / Kharif)": "6622432a5dce468bfe307f31",
-            "ರಾಗಿ (All Variety / Rainfed / Kharif)": "66234f155dce468bfe444353",
-            "ರಾಗಿ (All Variety / Irrigated / Rabi)": "66234d0b5dce468bfe43e28d",
-            "ರಾಗಿ (All Variety / Rainfed / Rabi)": "66b5c41960b6f1593a222d91",
-            "ರಾಗಿ (All Variety / Irrigated / Kharif)": "66b5c397a12ea87890bfee1f",
-            "ನವಣೆ (All Variety / Rainfed / Kharif)": "66b9e067c97d9e7b4640b38e",
-            "Gallardia (All Variety / Rainfed / Kharif)": "6735d18c37f95e71719cd99a",
-            "Gallardia (All Variety / Rainfed / Rabi)": "6735d1997747932a6332e470",
-            "Gallardia (All Variety / Irrigated / Rabi)": "6735d17b219f5ab8a7818971",
-            "Gallardia (All Variety / Irrigated / Kharif)": "6622436b9f7cb2d91513f43b",
-            "ಬೆಳ್ಳುಳ್ಳಿ (All Variety / Irrigated / Kharif)": "6622438a5051cacf29d92c41",
-            "ಬೆಳ್ಳುಳ್ಳಿ (All Variety / Rainfed / Kharif)": "6735d22d219f5ab8a781a4b2",
-            "ಬೆಳ್ಳುಳ್ಳಿ (All Variety / Irrigated / Rabi)": "6735d21637f95e71719cecc5",
-            "ಬೆಳ್ಳುಳ್ಳಿ (All Variety / Rainfed / Rabi)": "6735d23a43c0f59596404bfb",
-            "ಜೆರ್ಬೆರಾ (All Variety / Irrigated / Rabi)": "6735dbffa77d604337092600",
-            "ಜೆರ್ಬೆರಾ (All Variety / Rainfed / Kharif)": "6735dc0c188a5c05a872580a",
-            "ಜೆರ್ಬೆರಾ (All Variety / Rainfed / Rabi)": "6735dc1a450284f81f8d66fb",
-            "ಜೆರ್ಬೆರಾ (All Variety / Irrigated / Kharif)": "662243b39f7cb2d915140ca3",
-            "ಶುಂಠಿ (All Variety / Rainfed / Kharif)": "6735d1ea1d4ef6d7e6f3acb1",
-            "ಶುಂಠಿ (All Variety / Rainfed / Rabi)": "6735d1f879b50ca80cab1efa",
-            "ಶುಂಠಿ (All Variety / Irrigated / Kharif)": "662243d9e95759286182543d",
-            "ಶುಂಠಿ (All Variety / Irrigated / Rabi)": "6735d1db1d4ef6d7e6f3ab7e",
-            "ಗ್ಲ್ಯಾಡಿಯೋಲಸ್ (All Variety / Irrigated / Kharif)": "662243fc9f7cb2d91514288c",
-            "ಗ್ಲ್ಯಾಡಿಯೋಲಸ್ (All Variety / Rainfed / Kharif)": "6735dc5d7747932a63346ad5",
-            "ಗ್ಲ್ಯಾಡಿಯೋಲಸ್ (All Variety / Irrigated / Rabi)": "6735dc5037f95e71719e50eb",
-            "ಗ್ಲ್ಯಾಡಿಯೋಲಸ್ (All Variety / Rainfed / Rabi)": "6735dc6e1d4ef6d7e6f52d2b",
-            "ದ್ರಾಕ್ಷಿ (All Variety / Irrigated / Kharif)": "66224420e957592861827a07",
-            "ದ್ರಾಕ್ಷಿ (All Variety / Rainfed / Rabi)": "6735dcb9188a5c05a87276bf",
-            "ದ್ರಾಕ್ಷಿ (All Variety / Irrigated / Rabi)": "6735dc9e37f95e71719e5963",
-            "ದ್ರಾಕ್ಷಿ (All Variety / Rainfed / Kharif)": "6735dcada77d60433709384a",
-            "ಶೇಂಗಾ, ನೆಲಗಡಲೆ, ಕಡಲೆ ಕಾಯಿ (All Variety / Rainfed / Rabi)": "6735dcefa77d60433709445b",
-            "ಶೇಂಗಾ, ನೆಲಗಡಲೆ, ಕಡಲೆ ಕಾಯಿ (All Variety / Rainfed / Kharif)": "6622450a5051cacf29da05aa",
-            "ಶೇಂಗಾ, ನೆಲಗಡಲೆ, ಕಡಲೆ ಕಾಯಿ (All Variety / Irrigated / Kharif)": "662363205dce468bfe4adcc5",
-            "ಶೇಂಗಾ, ನೆಲಗಡಲೆ, ಕಡಲೆ ಕಾಯಿ (All Variety / Irrigated / Rabi)": "6735dce1450284f81f8d831c",
-            "ಸೀಬೆ, ಪೇರಲ, ಚೇಪೆಹಣ್ನು (All Variety / Rainfed / Rabi)": "6735dd5a79b50ca80cacb1cd",
-            "ಸೀಬೆ, ಪೇರಲ, ಚೇಪೆಹಣ್ನು (All Variety / Rainfed / Kharif)": "6735dd4c43c0f5959641ed45",
-            "ಸೀಬೆ, ಪೇರಲ, ಚೇಪೆಹಣ್ನು (All Variety / Irrigated / Rabi)": "6735dd3da77d604337094f24",
-            "ಸೀಬೆ, ಪೇರಲ, ಚೇಪೆಹಣ್ನು (All Variety / Irrigated / Kharif)": "662245a1e957592861833766",
-            "Hedge Lucerne (All Variety / Irrigated / Kharif)": "67d9085208d9b8230bfad75a",
-            "Hedge Lucerne (All Variety / Irrigated / Rabi)": "67d9086e028c7f21b6b139d4",
-            "Hedge Lucerne (All Variety / Rainfed / Kharif)": "66c4879dddc5cb1b46559d03",
-            "Hedge Lucerne (All Variety / Rainfed / Rabi)": "67d90884df8c20d0f4dbd401",
-            "ಬಟಾಣಿ, ವಠಾಣಿ, ಬಟಕಡ್ಲೆ, ಹಸಿರು ಬಟಾಣಿ (All Variety / Rainfed / Rabi)": "66c707d496cb53a5593088f9",
-            "ಬಟಾಣಿ, ವಠಾಣಿ, ಬಟಕಡ್ಲೆ, ಹಸಿರು ಬಟಾಣಿ (All Variety / Irrigated / Rabi)": "66c707e808e71fc16da91ef9",
-            "ಬಟಾಣಿ, ವಠಾಣಿ, ಬಟಕಡ್ಲೆ, ಹಸಿರು ಬಟಾಣಿ (All Variety / Rainfed / Kharif)": "66c707c174cd6dfb250af508",
-            "ಬಟಾಣಿ, ವಠಾಣಿ, ಬಟಕಡ್ಲೆ, ಹಸಿರು ಬಟಾಣಿ (All Variety / Irrigated / Kharif)": "6623639e29f20860375cc7f6",
-            "ತುಳಸಿ (All Variety / Rainfed / Rabi)": "673c3401fb8dd24a10932aee",
-            "ತುಳಸಿ (All Variety / Irrigated / Rabi)": "673c33e659548458e05beb37",
-            "ತುಳಸಿ (All Variety / Rainfed / Kharif)": "673c33f459548458e05beddb",
-            "ತುಳಸಿ (All Variety / Irrigated / Kharif)": "6623a9165051cacf2911607c",
-            "ನೆಲ್ಲಿಕಾಯಿ (All Variety / Rainfed / Kharif)": "673c3555d9431658b0fc16a9",
-            "ನೆಲ್ಲಿಕಾಯಿ (All Variety / Irrigated / Rabi)": "673c3547a7e031e72de88898",
-            "ನೆಲ್ಲಿಕಾಯಿ (All Variety / Irrigated / Kharif)": "6625fcafc986db5da828c15c",
-            "ನೆಲ್ಲಿಕಾಯಿ (All Variety / Rainfed / Rabi)": "673c356200b21a3a5013e6de",
-            "ಸಾಸಿವೆ (All Variety / Irrigated / Rabi)": "66c487f51d344cde6a3dc402",
-            "ಸಾಸಿವೆ (All Variety / Irrigated / Kharif)": "673d738500b21a3a502999a8",
-            "ಸಾಸಿವೆ (All Variety / Rainfed / Rabi)": "673d73a659548458e074a535",
-            "ಸಾಸಿವೆ (All Variety / Rainfed / Kharif)": "673d7396d9431658b01556a3",
-            "ತೊಂಡೆಕಾಯಿ (All Variety / Irrigated / Kharif)": "6622474a5051cacf29db28fe",
-            "ತೊಂಡೆಕಾಯಿ (All Variety / Irrigated / Rabi)": "6735defda77d604337097bb9",
-            "ತೊಂಡೆಕಾಯಿ (All Variety / Rainfed / Kharif)": "6735df0b188a5c05a872ca3d",
-            "ತೊಂಡೆಕಾಯಿ (All Variety / Rainfed / Rabi)": "6735df191d4ef6d7e6f58ba3",
-            "ಹಲಸು (All Variety / Rainfed / Rabi)": "6735df6ea77d6043370983bd",
-            "ಹಲಸು (All Variety / Irrigated / Kharif)": "66224ce45dce468bfe36188e",
-            "ಹಲಸು (All Variety / Irrigated / Rabi)": "6735df557747932a6334b647",
-            "ಹಲಸು (All Variety / Rainfed / Kharif)": "6735df6179b50ca80cace5a9",
-            "ನೇರಳೆ (All Variety / Irrigated / Kharif)": "66224d0b5dce468bfe361f5b",
-            "ನೇರಳೆ (All Variety / Irrigated / Rabi)": "6736de0fe65d33ba8473441e",
-            "ನೇರಳೆ (All Variety / Rainfed / Rabi)": "6736de30f9112eb5fb355f72",
-            "ನೇರಳೆ (All Variety / Rainfed / Kharif)": "6736de229c0e3dea68b0b57a",
-            "ಮಲ್ಲಿಗೆ (All Variety / Irrigated / Rabi)": "6736e691f9112eb5fb35fa9b",
-            "ಮಲ್ಲಿಗೆ (All Variety / Irrigated / Kharif)": "66224d419f7cb2d915175390",
-            "ಮಲ್ಲಿಗೆ (All Variety / Rainfed / Rabi)": "6736e6aff8611beb4a7827e2",
-            "ಮಲ್ಲಿಗೆ (All Variety / Rainfed / Kharif)": "6736e6a2cdfa68dc9b851cc4",
-            "Kodo (All Variety / Irrigated / Kharif)": "673d7a0ca7e031e72d00e436",
-            "Kodo (All Variety / Rainfed / Rabi)": "673d79eca7e031e72d00df43",
-            "Kodo (All Variety / Irrigated / Rabi)": "673d7a1cda9f81925ad4354a",
-            "Kodo (All Variety / Rainfed / Kharif)": "6625f346b0e7b1b0f9f92698",
-            "Lemon (All Variety / Rainfed / Kharif)": "6736e6e4cdfa68dc9b852204",
-            "Lemon (All Variety / Irrigated / Rabi)": "6736e6ce63cb5330385da910",
-            "Lemon (All Variety / Rainfed / Rabi)": "6736e6f3bec3e55c72459e91",
-            "Lemon (All Variety / Irrigated / Kharif)": "66224de029f208603743472b",
-            "ನಿಂಬೆ ಹುಲ್ಲು (All Variety / Irrigated / Rabi)": "6736e7079c0e3dea68b156ca",
-            "ನಿಂಬೆ ಹುಲ್ಲು (All Variety / Irrigated / Kharif)": "66224eb85051cacf29e0bb68",
-            "ನಿಂಬೆ ಹುಲ್ಲು (All Variety / Rainfed / Rabi)": "6736e7209c0e3dea68b15a28",
-            "ನಿಂಬೆ ಹುಲ್ಲು (All Variety / Rainfed / Kharif)": "6736e7143899ed61b07abb6d",
-            "ಲೆಟ್ಯೂಸ್, ಹಕ್ಕರಿಕೆ ಸೊಪ್ಪು (All Variety / Irrigated / Kharif)": "66224f365051cacf29e11791",
-            "ಲೆಟ್ಯೂಸ್, ಹಕ್ಕರಿಕೆ ಸೊಪ್ಪು (All Variety / Rainfed / Kharif)": "6736e76f63cb5330385db2e1",
-            "ಲೆಟ್ಯೂಸ್, ಹಕ್ಕರಿಕೆ ಸೊಪ್ಪು (All Variety / Rainfed / Rabi)": "6736e77de65d33ba8474016b",
-            "ಲೆಟ್ಯೂಸ್, ಹಕ್ಕರಿಕೆ ಸೊಪ್ಪು (All Variety / Irrigated / Rabi)": "6736e760bec3e55c7245a753",
-            "ಅಗಸೆ (All Variety / Rainfed / Kharif)": "66c4877a87650ee918b9327b",
-            "Little Millet (All Variety / Rainfed / Kharif)": "66236c0d9f7cb2d9153475f7",
-            "Little Millet (All Variety / Irrigated / Rabi)": "673c3b825e25f80629e8f5ff",
-            "Little Millet (All Variety / Irrigated / Kharif)": "673c3b73d9431658b0fdeff3",
-            "Little Millet (All Variety / Rainfed / Rabi)": "673c3b66a7e031e72deac67a",
-            "ಮೆಕ್ಕೆಜೋಳ, ಮುಸುಕಿನ ಜೋಳ, ಗೋವಿನ ಜೋಳ (Rainfed / Kharif)": "66c70998ccdf5a5ed0a95946",
-            "ಮೆಕ್ಕೆಜೋಳ, ಮುಸುಕಿನ ಜೋಳ, ಗೋವಿನ ಜೋಳ (All Variety / Irrigated / Kharif)": "66224f775dce468bfe36e7d3",
-            "ಮೆಕ್ಕೆಜೋಳ, ಮುಸುಕಿನ ಜೋಳ, ಗೋವಿನ ಜೋಳ (All Variety / Irrigated / Rabi)": "6623646f9f7cb2d91530c685",
-            "ಮೆಕ್ಕೆಜೋಳ, ಮುಸುಕಿನ ಜೋಳ, ಗೋವಿನ ಜೋಳ (Rainfed / Rabi)": "66c709aa74cd6dfb250b7943",
-            "ಮೆಕ್ಕೆಜೋಳ, ಮುಸುಕಿನ ಜೋಳ, ಗೋವಿನ ಜೋಳ (All Variety / Rainfed / Kharif)": "6623648ee9575928619be2de",
-            "ಮೆಕ್ಕೆಜೋಳ, ಮುಸುಕಿನ ಜೋಳ, ಗೋವಿನ ಜೋಳ (All Variety / Rainfed / Rabi)": "662364a99f7cb2d91530df89",
-            "ಕಿತ್ತಲೆ (All Variety / Rainfed / Kharif)": "673d7b4dfb8dd24a10ac0cf0",
-            "ಕಿತ್ತಲೆ (All Variety / Rainfed / Rabi)": "673d7b5ba7e031e72d01278f",
-            "ಕಿತ್ತಲೆ (All Variety / Irrigated / Kharif)": "6622500a29f208603743f172",
-            "ಕಿತ್ತಲೆ (All Variety / Irrigated / Rabi)": "673d7b40fb8dd24a10ac0b66",
-            "ಮಾವು (All Variety / Irrigated / Kharif)": "6622505f29f208603744108f",
-            "ಮಾವು (All Variety / Irrigated / Rabi)": "67372ef9dd0397e2d4297617",
-            "ಮಾವು (All Variety / Rainfed / Rabi)": "67372f162026c9747ec0ba89",
-            "ಮಾವು (All Variety / Rainfed / Kharif)": "67372f0a067bf5a4dc8a800f",
-            "ಚೆಂಡುಹೂ (All Variety / Rainfed / Rabi)": "673d7d97da9f81925ad4f9f4",
-            "ಚೆಂಡುಹೂ (All Variety / Rainfed / Kharif)": "673d7d8ad9431658b0171c70",
-            "ಚೆಂಡುಹೂ (All Variety / Irrigated / Kharif)": "6622509f5051cacf29e2161a",
-            "ಚೆಂಡುಹೂ (All Variety / Irrigated / Rabi)": "673d7d7bd7df5f1bd0d058c3",
-            "ಪುದಿನ (All Variety / Rainfed / Rabi)": "673d7e285e25f80629fef009",
-            "ಪುದಿನ (All Variety / Rainfed / Kharif)": "673d7e1dfb8dd24a10acbaa0",
-            "ಪುದಿನ (All Variety / Irrigated / Rabi)": "673d7e105e25f80629fee69b",
-            "ಪುದಿನ (All Variety / Irrigated / Kharif)": "66c487b287650ee918b93722",
-            "ನುಗ್ಗೆಕಾಯಿ (All Variety / Irrigated / Rabi)": "673dabf4da9f81925ade4cb4",
-            "ನುಗ್ಗೆಕಾಯಿ (All Variety / Rainfed / Kharif)": "66c707fb0afe7c7615b1d8d9",
-            "ನುಗ್ಗೆಕಾಯಿ (All Variety / Rainfed / Rabi)": "673dac233973c701cdb64e66",
-            "ನುಗ್ಗೆಕಾಯಿ (All Variety / Irrigated / Kharif)": "66c486c5ddc5cb1b46559326",
-            "ಚನ್ನಂಗಿ, ಮಸೂರ ಬೀಜ (All Variety / Rainfed / Rabi)": "673d764bd7df5f1bd0cee2e6",
-            "ಚನ್ನಂಗಿ, ಮಸೂರ ಬೀಜ (All Variety / Irrigated / Rabi)": "673d763b1e5598a5933b429e",
-            "ಚನ್ನಂಗಿ, ಮಸೂರ ಬೀಜ (All Variety / Irrigated / Kharif)": "66c48720bcf8f6407c271065",
-            "ಚನ್ನಂಗಿ, ಮಸೂರ ಬೀಜ (All Variety / Rainfed / Kharif)": "66c4871016e46f5d743dcc61",
-            "ಹಿಪ್ಪುನೇರಳೆ, ರೇಷ್ಮೆಗಿಡ (all varieties / Irrigated / Rabi)": "674592ce0a2cf8656854526b",
-            "ಹಿಪ್ಪುನೇರಳೆ, ರೇಷ್ಮೆಗಿಡ (all varieties / Irrigated / Kharif)": "6745938bf81965ac7b1abc08",
-            "ಹಿಪ್ಪುನೇರಳೆ, ರೇಷ್ಮೆಗಿಡ (all variety / Rainfed / Kharif)": "674592f4f3d1f2acc0e714a3",
-            "ಮಡಿಕಿ, ಮಟಕಿ (All Variety / Rainfed / Kharif)": "66c486fe3d6ca339314b570e",
-            "ಮಡಿಕಿ, ಮಟಕಿ (All Variety / Irrigated / Rabi)": "673dacddd7df5f1bd0dbf37c",
-            "ಮಡಿಕಿ, ಮಟಕಿ (All Variety / Rainfed / Rabi)": "673dad15fb8dd24a10b79177",
-            "ಮಡಿಕಿ, ಮಟಕಿ (All Variety / Irrigated / Kharif)": "66c486ee32ee44a85a1d0bde",
-            "ಕರಬೂಜ (All Variety / Irrigated / Kharif)": "662250cf5051cacf29e232ba",
-            "ಕರಬೂಜ (All Variety / Irrigated / Rabi)": "67372f46dd0397e2d4297c55",
-            "ಕರಬೂಜ (All Variety / Rainfed / Rabi)": "67372f642026c9747ec0beed",
-            "ಕರಬೂಜ (All Variety / Rainfed / Kharif)": "67372f56213cd125c3afa156",
-            "ಬೇವಿನ ಮರ (All Variety / Rainfed / Kharif)": "66c4880e32ee44a85a1d1968",
-            "ಗುರೆಳ್ಳು, ಹುಚ್ಚೆಳ್ಳು (All Variety / Rainfed / Kharif)": "662374e55dce468bfe4fe6a8",
-            "ಗುರೆಳ್ಳು, ಹುಚ್ಚೆಳ್ಳು (All Variety / Irrigated / Kharif)": "673c31592026c9747eff734e",
-            "ಗುರೆಳ್ಳು, ಹುಚ್ಚೆಳ್ಳು (All Variety / Irrigated / Rabi)": "673c3167127081b99cfe6785",
-            "ಗುರೆಳ್ಳು, ಹುಚ್ಚೆಳ್ಳು (All Variety / Rainfed / Rabi)": "66225132e95759286187018d",
-            "ಎಣ್ಣೆ ತಾಳೆ (All Variety / Rainfed / Kharif)": "673c310f067bf5a4dcc7d32c",
-            "ಎಣ್ಣೆ ತಾಳೆ (All Variety / Irrigated / Rabi)": "673c3101dd0397e2d46c8952",
-            "ಎಣ್ಣೆ ತಾಳೆ (All Variety / Rainfed / Rabi)": "673c311c067bf5a4dcc7d62b",
-            "ಎಣ್ಣೆ ತಾಳೆ (All Variety / Irrigated / Kharif)": "662251635051cacf29e27fc9",
-            "ಬೆಂಡೆ ಕಾಯಿ (All Variety / Irrigated / Kharif)": "66c4875ef4a0fadad6098a7e",
-            "ಬೆಂಡೆ ಕಾಯಿ (All Variety / Rainfed / Rabi)": "673daba500b21a3a5035f890",
-            "ಬೆಂಡೆ ಕಾಯಿ (All Variety / Irrigated / Rabi)": "673dabb6fb8dd24a10b74ffd",
-            "ಬೆಂಡೆ ಕಾಯಿ (All Variety / Rainfed / Kharif)": "673dab8d5e25f806290ba0f1",
-            "ಈರುಳ್ಳಿ, ಉಳ್ಳಾಗಡ್ಡಿ (All Variety / Rainfed / Rabi)": "66c708b374cd6dfb250b34f8",
-            "ಈರುಳ್ಳಿ, ಉಳ್ಳಾಗಡ್ಡಿ (All Variety / Irrigated / Kharif)": "6622518d29f2086037450a40",
-            "ಈರುಳ್ಳಿ, ಉಳ್ಳಾಗಡ್ಡಿ (All Variety / Rainfed / Kharif)": "66c7089f706e83124348d7b6",
-            "ಈರುಳ್ಳಿ, ಉಳ್ಳಾಗಡ್ಡಿ (All Variety / Irrigated / Rabi)": "66c708c308e71fc16da9618e",
-            "ಪಪಾಯ, ಪರಂಗಿ (All Variety / Rainfed / Kharif)": "6736e979f9112eb5fb364130",
-            "ಪಪಾಯ, ಪರಂಗಿ (All Variety / Irrigated / Rabi)": "6736e96c63cb5330385de026",
-            "ಪಪಾಯ, ಪರಂಗಿ (All Variety / Irrigated / Kharif)": "6625fd1ec986db5da828db2d",
-            "ಪಪಾಯ, ಪರಂಗಿ (All Variety / Rainfed / Rabi)": "6736e985f8611beb4a787102",
-            "ಪಚೌಲಿ (All Variety / Irrigated / Kharif)": "6623a13bb0e7b1b0f9d8b798",
-            "Pea (All Variety / Irrigated / Kharif)": "66b9bc69995be79f0c253169",
-            "Pea (All Variety / Rainfed / Rabi)": "66b9bc9ad8607609df32f284",
-            "Pea (All Variety / Irrigated / Rabi)": "66b9bcb4d8607609df32f966",
-            "Pea (All Variety / Rainfed / Kharif)": "66224687e957592861838f1b",
-            "ಸಜ್ಜೆ (All Variety / Rainfed / Kharif)": "66236b8f29f20860375f3b19",
-            "ಸಜ್ಜೆ (all varieties / Rainfed / Rabi)": "673d82c0d9431658b0183e74",
-            "ಸಜ್ಜೆ (all varieties / Irrigated / Rabi)": "673d82b41e5598a5933e112d",
-            "ಸಜ್ಜೆ (All Variety / Irrigated / Kharif)": "66236b7629f20860375f2feb",
-            "Pigeon Pea (All Variety / Irrigated / Rabi)": "673d8639da9f81925ad6f95e",
-            "Pigeon Pea (All Variety / Rainfed / Rabi)": "673d864659548458e07892a6",
-            "Pigeon Pea (All Variety / Rainfed / Kharif)": "66236c479f7cb2d91534a6d5",
-            "Pigeon Pea (All Variety / Irrigated / Kharif)": "66c7083c08e71fc16da93703",
-            "ಅನಾನಸ್ (All Variety / Rainfed / Rabi)": "673c31f5ece67becae8ad09d",
-            "ಅನಾನಸ್ (All Variety / Irrigated / Kharif)": "6622522d29f2086037459643",
-            "ಅನಾನಸ್ (All Variety / Irrigated / Rabi)": "673c31d9c3268c902c88ab47",
-            "ಅನಾನಸ್ (All Variety / Rainfed / Kharif)": "673c31e8213cd125c3ee9221",
-            "ಹಿಪ್ಪಲಿ (1st year)": "6625fd22c986db5da828dc38",
-            "ದಾಳಿಂಬೆ (All Variety / Rainfed / Rabi)": "673c31c5127081b99cfe86e3",
-            "ದಾಳಿಂಬೆ (All Variety / Irrigated / Kharif)": "662252545051cacf29e33124",
-            "ದಾಳಿಂಬೆ (All Variety / Rainfed / Kharif)": "673c31b8067bf5a4dcc80b53",
-            "ದಾಳಿಂಬೆ (All Variety / Irrigated / Rabi)": "66b9ed85606f68e8dd59153d",
-            "ಆಲೂಗಡ್ಡೆ, ಬಟಾಟೆ (All Variety / Irrigated / Rabi)": "6735d2bd188a5c05a8710df1",
-            "ಆಲೂಗಡ್ಡೆ, ಬಟಾಟೆ (All Variety / Irrigated / Kharif)": "6622529329f2086037466cbb",
-            "ಆಲೂಗಡ್ಡೆ, ಬಟಾಟೆ (All Variety / Rainfed / Kharif)": "6735d2cc188a5c05a87110e7",
-            "ಆಲೂಗಡ್ಡೆ, ಬಟಾಟೆ (All Variety / Rainfed / Rabi)": "6735d2dd219f5ab8a781bb85",
-            "ಬರಗು (All Variety / Rainfed / Kharif)": "66b9beb2606f68e8dd4d0314",
-            "ಬರಗು (All Variety / Irrigated / Rabi)": "673d731b59548458e0748d12",
-            "ಬರಗು (All Variety / Rainfed / Rabi)": "673d7302fb8dd24a10aa9f02",
-            "ಬರಗು (All Variety / Irrigated / Kharif)": "673d730ed9431658b01545de",
-            "ಕುಂಬಳಕಾಯಿ (All Variety / Irrigated / Kharif)": "662253dd29f2086037478d12",
-            "ಕುಂಬಳಕಾಯಿ (All Variety / Irrigated / Rabi)": "6735d303450284f81f8c299a",
-            "ಕುಂಬಳಕಾಯಿ (All Variety / Rainfed / Rabi)": "6735d32637f95e71719d1515",
-            "ಕುಂಬಳಕಾಯಿ (All Variety / Rainfed / Kharif)": "6735d314ed8b134a5242a6d6",
-            "ಮೂಲಂಗಿ (All Variety / Rainfed / Rabi)": "6735d3d343c0f595964097ed",
-            "ಮೂಲಂಗಿ (All Variety / Irrigated / Kharif)": "6622540c29f208603747c397",
-            "ಮೂಲಂಗಿ (All Variety / Irrigated / Rabi)": "6735d3a2a77d604337080477",
-            "ಮೂಲಂಗಿ (All Variety / Rainfed / Kharif)": "6735d3bced8b134a5242c506",
-            "ಭತ್ತ (All Variety / Irrigated / Rabi)": "66c7088b96cb53a55930ba9e",
-            "ಭತ್ತ (All Variety / Irrigated / Kharif)": "662369f329f20860375eb5c2",
-            "ಭತ್ತ (All Variety / Rainfed / Kharif)": "66c7085bccdf5a5ed0a90552",
-            "ಭತ್ತ (All Variety / Rainfed / Rabi)": "66c708729a5020d850a70a90",
-            "ಹಿರೇಕಾಯಿ (All Variety / Rainfed / Kharif)": "673d744d1e5598a5933aeb5a",
-            "ಹಿರೇಕಾಯಿ (All Variety / Irrigated / Rabi)": "673d743f5e25f80629fce8db",
-            "ಹಿರೇಕಾಯಿ (All Variety / Rainfed / Rabi)": "673d745f1e5598a5933af0e3",
-            "ಹಿರೇಕಾಯಿ (All Variety / Irrigated / Kharif)": "662256875051cacf29e5dd05",
-            "ಗುಲಾಬಿ (All Variety / Irrigated / Rabi)": "6735d55937f95e71719d5fcb",
-            "ಗುಲಾಬಿ (All Variety / Rainfed / Rabi)": "6735d578ed8b134a5243022a",
-            "ಗುಲಾಬಿ (All Variety / Rainfed / Kharif)": "6735d56a450284f81f8c82e5",
-            "ಗುಲಾಬಿ (All Variety / Irrigated / Kharif)": "662256b89f7cb2d9151b6c3b",
-            "ರಬ್ಬರ್ (All Variety / Rainfed / Rabi)": "6735d5c3a77d6043370852d0",
-            "ರಬ್ಬರ್ (All Variety / Irrigated / Kharif)": "662256f95051cacf29e60219",
-            "ರಬ್ಬರ್ (All Variety / Irrigated / Rabi)": "6735d5ac7747932a63336ec9",
-            "ರಬ್ಬರ್ (All Variety / Rainfed / Kharif)": "6735d5b779b50ca80caba84c",
-            "ಕುಸುಬೆ (All Variety / Irrigated / Rabi)": "6735d668219f5ab8a7823d39",
-            "ಕುಸುಬೆ (All Variety / Rainfed / Rabi)": "66237468e9575928619fb2a9",
-            "ಕುಸುಬೆ (All Variety / Irrigated / Kharif)": "6735d65c188a5c05a8718f98",
-            "ಕುಸುಬೆ (All Variety / Rainfed / Kharif)": "6735d678a77d604337086964",
-            "ಸಪೋಟ, ಚಿಕ್ಕು (All Variety / Rainfed / Kharif)": "6735d6f1219f5ab8a7825253",
-            "ಸಪೋಟ, ಚಿಕ್ಕು (All Variety / Irrigated / Kharif)": "662257245051cacf29e60dbd",
-            "ಸಪೋಟ, ಚಿಕ್ಕು (All Variety / Rainfed / Rabi)": "6735d6fe37f95e71719d9d07",
-            "ಸಪೋಟ, ಚಿಕ್ಕು (All Variety / Irrigated / Rabi)": "6735d6e337f95e71719d994b",
-            "ಎಳ್ಳು (All Variety / Irrigated / Rabi)": "6735d7737747932a6333b79f",
-            "ಎಳ್ಳು (All Variety / Irrigated / Kharif)": "6735d768450284f81f8cbf46",
-            "ಎಳ್ಳು (All Variety / Rainfed / Kharif)": "662373da29f2086037612089",
-            "ಎಳ್ಳು (All Variety / Rainfed / Rabi)": "6622578ce957592861890255",
-            "ಏಲಕ್ಕಿ (All Variety / Irrigated / Kharif)": "66b9e6f0c97d9e7b4643410b",
-            "ಪಡವಲಕಾಯಿ (All Variety / Irrigated / Kharif)": "66c48827bcf8f6407c2721ff",
-            "ಪಡವಲಕಾಯಿ (All Variety / Rainfed / Kharif)": "673d844600b21a3a502d0095",
-            "ಪಡವಲಕಾಯಿ (All Variety / Rainfed / Rabi)": "673d84535e25f806290041be",
-            "ಪಡವಲಕಾಯಿ (All Variety / Irrigated / Rabi)": "673d843afb8dd24a10ae1cec",
-            "ಜೋಳ (All Variety / Irrigated / Kharif)": "66b5c19805f96e8242f55ec0",
-            "ಜೋಳ (All Variety / Rainfed / Kharif)": "66b5c1719b1620ec172fe1b1",
-            "ಜೋಳ (All Variety / Irrigated / Rabi)": "66b5c1aa05f96e8242f5651b",
-            "ಜೋಳ (All Variety / Rainfed / Rabi)": "66b5c1d81af5a34d553b586d",
-            "ಸೊಯಾಬಿನ್ (All Variety / Irrigated / Rabi)": "662372e59f7cb2d915383e23",
-            "ಸೊಯಾಬಿನ್ (All Variety / Irrigated / Kharif)": "662372c89f7cb2d915383489",
-            "ಸೊಯಾಬಿನ್ (All Variety / Rainfed / Rabi)": "662372765051cacf29016e52",
-            "ಸೊಯಾಬಿನ್ (All Variety / Rainfed / Kharif)": "662257db5dce468bfe387bf5",
-            "Spinach (All Variety / Rainfed / Rabi)": "6735d7fc79b50ca80cabefbb",
-            "Spinach (All Variety / Rainfed / Kharif)": "6735d7ee219f5ab8a782766b",
-            "Spinach (All Variety / Irrigated / Kharif)": "6622583829f208603749cb56",
-            "Spinach (All Variety / Irrigated / Rabi)": "6735d7e043c0f59596412b54",
-            "ಕಬ್ಬು (All Variety / Irrigated / Rabi)": "6623752b5dce468bfe4fffce",
-            "ಕಬ್ಬು (All Variety / Rainfed / Rabi)": "6735d836219f5ab8a7828201",
-            "ಕಬ್ಬು (All Variety / Rainfed / Kharif)": "6735d829450284f81f8cd81c",
-            "ಕಬ್ಬು (All Variety / Irrigated / Kharif)": "662258a529f208603749fcf1",
-            "ಸೂರ್ಯಕಾಂತಿ (All Variety / Rainfed / Kharif)": "662259765051cacf29e6bacf",
-            "ಸೂರ್ಯಕಾಂತಿ (All Variety / Irrigated / Rabi)": "662371db29f2086037609de7",
-            "ಸೂರ್ಯಕಾಂತಿ (All Variety / Irrigated / Kharif)": "6622594c29f20860374a570a",
-            "ಸೂರ್ಯಕಾಂತಿ (All Variety / Rainfed / Rabi)": "662371f629f208603760a492",
-            "ಮೊಸಂಬಿ (2 Years Rainfed / Rainfed)": "6625fd16c986db5da828d929",
-            "ಮೊಸಂಬಿ (All Variety / Irrigated / Rabi)": "673c7672d9431658b00c466c",
-            "ಮೊಸಂಬಿ (All Variety / Rainfed / Rabi)": "673c768dd7df5f1bd0c6ae46",
-            "ಮೊಸಂಬಿ (4 Years Rainfed / Rainfed)": "6625fd17c986db5da828d935",
-            "ಮೊಸಂಬಿ (3 Years Rainfed / Rainfed)": "6625fd17c986db5da828d92f",
-            "ಮೊಸಂಬಿ (All Variety / Rainfed / Kharif)": "673c7680a7e031e72df86c9f",
-            "ಮೊಸಂಬಿ (All Variety)": "6625fd19c986db5da828d9a7",
-            "ಮೊಸಂಬಿ (1 Years Rainfed / Rainfed)": "6625fd16c986db5da828d923",
-            "ಸಿಹಿ ಗೆಣಸು (All Variety / Rainfed / Kharif)": "673c3ad559548458e05e7ee2",
-            "ಸಿಹಿ ಗೆಣಸು (All Variety / Irrigated / Kharif)": "66c488b09bfeb323882b4b20",
-            "ಸಿಹಿ ಗೆಣಸು (All Variety / Rainfed / Rabi)": "673c3ae2d7df5f1bd0b8e209",
-            "ಸಿಹಿ ಗೆಣಸು (All Variety / Irrigated / Rabi)": "66c488c387650ee918b944ea",
-            "ಹತ್ತಿ (ಟೆಟ್ರಾಪ್ಲಾಯ್ಡ್) (All Variety / Irrigated / Rabi)": "673d85945e25f8062900ebe8",
-            "ಹತ್ತಿ (ಟೆಟ್ರಾಪ್ಲಾಯ್ಡ್) (All Variety / Irrigated / Kharif)": "66c486a83d6ca339314b5594",
-            "ಹತ್ತಿ (ಟೆಟ್ರಾಪ್ಲಾಯ್ಡ್) (All Variety / Rainfed / Rabi)": "673d85afd7df5f1bd0d2771a",
-            "ಹತ್ತಿ (ಟೆಟ್ರಾಪ್ಲಾಯ್ಡ್) (All Variety / Rainfed / Kharif)": "673d85a13973c701cdac4a94",
-            "ತಂಬಾಕು (All Variety / Irrigated / Rabi)": "6735d94743c0f59596415c1b",
-            "ತಂಬಾಕು (All Variety / Irrigated / Kharif)": "66b9e1af4e1f5eaa85fb6b05",
-            "ತಂಬಾಕು (All variety / Rainfed / Kharif)": "66225a375dce468bfe38beb6",
-            "ತಂಬಾಕು (All Variety / Rainfed / Rabi)": "6735d93679b50ca80cac116f",
-            "ಟೊಮೆಟೊ (All Variety / Rainfed / Rabi)": "6735d9a7219f5ab8a782b46c",
-            "ಟೊಮೆಟೊ (All Variety / Irrigated / Rabi)": "6735d98f450284f81f8d0a1b",
-            "ಟೊಮೆಟೊ (All Variety / Irrigated / Kharif)": "66225a6e5051cacf29e742e8",
-            "ಟೊಮೆಟೊ (hybrid)": "6625fd44c986db5da828e474",
-            "ಟೊಮೆಟೊ (All Variety / Rainfed / Kharif)": "6735d99bed8b134a52439839",
-            "ಸುಗಂಧರಾಜ (All Variety / Rainfed / Rabi)": "6735da59a77d60433708f229",
-            "ಸುಗಂಧರಾಜ (All Variety / Irrigated / Kharif)": "66225a9ee95759286189f393",
-            "ಸುಗಂಧರಾಜ (All Variety / Rainfed / Kharif)": "6735da42ed8b134a5243b9f4",
-            "ಸುಗಂಧರಾಜ (All Variety / Irrigated / Rabi)": "6735da3479b50ca80cac42b9",
-            "ಅರಿಶಿನ (All Variety / Rainfed / Kharif)": "673c3d17a7e031e72deb3506",
-            "ಅರಿಶಿನ (All Variety / Irrigated / Kharif)": "66b9e7f2995be79f0c3020c6",
-            "ಅರಿಶಿನ (All Variety / Irrigated / Rabi)": "673c3d06fb8dd24a10963361",
-            "ಅರಿಶಿನ (All Variety / Rainfed / Rabi)": "673c3d2500b21a3a50162245",
-            "Turnips (All Variety / Irrigated / Rabi)": "6735dab443c0f5959641935b",
-            "Turnips (All Variety / Rainfed / Rabi)": "6735dacd37f95e71719e2335",
-            "Turnips (All Variety / Rainfed / Kharif)": "6735dabfa77d60433708fbfe",
-            "Turnips (All Variety / Irrigated / Kharif)": "66225ac2e9575928618a016d",
-            "ಉದ್ದು (All Variety / Rainfed / Kharif)": "66236e855dce468bfe4eb879",
-            "ಉದ್ದು (All Variety / Irrigated / Rabi)": "66236ea09f7cb2d915361c1f",
-            "ಉದ್ದು (All Variety / Irrigated / Kharif)": "673c3dd9a7e031e72deb690b",
-            "ಉದ್ದು (All Variety / Rainfed / Rabi)": "673c3dec00b21a3a5016c807",
-            "ದಂಟಿನ ಸೊಪ್ಪು (All Variety / Rainfed / Kharif)": "67208fd2b47b776f6fadd235",
-            "ದಂಟಿನ ಸೊಪ್ಪು (All Variety / Rainfed / Rabi)": "67209002e4ec2fd78adecc45",
-            "ದಂಟಿನ ಸೊಪ್ಪು (All Variety / Irrigated / Kharif)": "67208f50e4ec2fd78adea979",
-            "ದಂಟಿನ ಸೊಪ್ಪು (All Variety / Irrigated / Rabi)": "67208f7c1d3c5f71ff0eb417",
-            "ಕಲ್ಲಂಗಡಿ (All Variety / Rainfed / Rabi)": "6735daa237f95e71719e1bad",
-            "ಕಲ್ಲಂಗಡಿ (All Variety / Irrigated / Kharif)": "66225ae35dce468bfe391999",
-            "ಕಲ್ಲಂಗಡಿ (All Variety / Rainfed / Kharif)": "6735da93188a5c05a8722de9",
-            "ಕಲ್ಲಂಗಡಿ (All Variety / Irrigated / Rabi)": "6735da84450284f81f8d35b7",
-            "ಗೋಧಿ (All Variety / Rainfed / Kharif)": "6735db0e37f95e71719e2907",
-            "ಗೋಧಿ (All Variety / Irrigated / Rabi)": "66225b2d9f7cb2d9151ca9f6",
-            "ಗೋಧಿ (All Variety / Irrigated / Kharif)": "6735db007747932a63343e2f",
-            "ಗೋಧಿ (All Variety / Rainfed / Rabi)": "6735db201d4ef6d7e6f5073f"
-        },
-        "63f9bd39519359b7438ce777": {
-            "കവുങ്ങ് (hyv)": "6625fcb3c986db5da828c23a",
-            "കവുങ്ങ് (All Variety)": "6625fcb3c986db5da828c21a",
-            "കുമ്പളം (All Variety / Rainfed / Annual Crop)": "6674008a104b26c0900088de",
-            "വാഴ (Palayamkodan alluvial soils of Kuttanad / Rainfed / Annual Crop)": "66740ce3a28c654e7648f434",
-            "വാഴ (Nendran / Rainfed / Annual Crop)": "66740c929ac28a6f1d5f719b",
-            "വാഴ (Palayamkodan)": "6625fcb8c986db5da828c36e",
-            "വാഴ (Other variety)": "6625fcb8c986db5da828c367",
-            "പാവല്‍ (All Variety)": "6625fcbec986db5da828c504",
-            "കുരുമുളക് (All Variety / Rainfed / Annual Crop)": "667523db9ac28a6f1d6fa768",
-            "വഴുതന (All Variety / Rainfed / Annual Crop)": "6673eba1cd8957981f1ad915",
-            "കാബേജ് (All Variety)": "6625fcc6c986db5da828c6e9",
-            "കാരറ്റ് (All Variety)": "6625fcc8c986db5da828c77c",
-            "കോളി ഫ്ലവര്‍ (All Variety)": "6625fccbc986db5da828c815",
-            "മുളക് (All Variety / Rainfed / Annual Crop)": "66740888ec2c54c2842af653",
-            "China Aster (All Variety)": "6625fcd0c986db5da828c93b",
-            "Cinnamon (1st year)": "6625fcd3c986db5da828c9cb",
-            "Cinnamon (2nd year)": "6625fcd3c986db5da828c9d1",
-            "അമര പയര്‍ (All Variety)": "6625fcd4c986db5da828ca26",
-            "കൊക്കോ (650 Plants/Ha)": "6625fcd5c986db5da828ca6b",
-            "തെങ്ങ് (general)": "6625fcd7c986db5da828cab9",
-            "തെങ്ങ് (Hybrids & HYV rainfed)": "6625fcd7c986db5da828cad1",
-            "തെങ്ങ് (reclaimed clayey soils kuttanad)": "6625fcd7c986db5da828cabf",
-            "തെങ്ങ് (Hybrids &HYV irrigated)": "6625fcd7c986db5da828cacb",
-            "തെങ്ങ് (Red loam soils(Southern Kerala))": "6625fcd7c986db5da828cac5",
-            "കാപ്പി (All Variety)": "6625fcd9c986db5da828cb4a",
-            "വന്‍പയര്‍ (All Variety)": "6625fcdec986db5da828cc69",
-            "വന്‍പയര്‍ (Rainfed / Annual Crop)": "667d056896ae43ed2fe857f2",
-            "വെള്ളരി (All Variety)": "6625fce0c986db5da828cce5",
-            "കറിവേപ്പ് (All Variety)": "6625fce1c986db5da828cd22",
-            "ഇഞ്ചി (All Variety)": "6625fce9c986db5da828ceea",
-            "Gladioulus (All Variety / Rainfed / Annual Crop)": "667904f044ed264662f2b458",
-            "Greater Yam (All Variety)": "6625fcecc986db5da828cf8c",
-            "നിലക്കടല (All Variety)": "6625fcedc986db5da828cfdb",
-            "പേര (278 Trees/Ha)": "6625fcf0c986db5da828d09a",
-            "Guinea Grass (All Variety)": "6625fcf1c986db5da828d0ca",
-            "Jasmine (All Variety / Rainfed / Annual Crop)": "667904ae631e8343d63f7e1f",
-            "lesser yam (rafula) (All Variety / Rainfed / Annual Crop)": "6673fb8246bfb8921348366a",
-            "Maize (All Variety / Rainfed / Annual Crop)": "66751d28654eb22a3d869fcd",
-            "മാങ്ങ (1St Year 100 Trees/Ha)": "6625fd07c986db5da828d5b3",
-            "മാങ്ങ (>10 Years 100 Trees/Ha)": "6625fd07c986db5da828d5a7",
-            "മാങ്ങ (8-10 Years 100 Trees/Ha)": "6625fd09c986db5da828d5f5",
-            "മാങ്ങ (3-5 Years 100 Trees/Ha)": "6625fd08c986db5da828d5c5",
-            "മാങ്ങ (6-7 Years 100 Trees/Ha)": "6625fd08c986db5da828d5dd",
-            "മാങ്ങ (2Nd Year 100 Trees/Ha)": "6625fd07c986db5da828d5bf",
-            "Marigold (All Variety)": "6625fd0cc986db5da828d697",
-            "ജാതി (156 Trees/Ha)": "6625fd11c986db5da828d7b1",
-            "വെണ്ട (All Variety / Rainfed / Annual Crop)": "6678ff6d58c0184c1fc7878b",
-            "Onion (All Variety / Rainfed / Annual Crop)": "667905f78d865d80c0b0149e",
-            "Papaya (All Variety / Rainfed / Annual Crop)": "66751cfa5149fd41703a6d0e",
-            "Paragrass (Rainfed / Annual Crop)": "667bc68477314b7c8ba5476d",
-            "കൈതചക്ക (All Variety)": "6625fd24c986db5da828dc8d",
-            "pipali; long pepper (3year and above)": "6625fd22c986db5da828dc20",
-            "pipali; long pepper (Kozhikode & similar areas)": "6625fd22c986db5da828dc2c",
-            "pipali; long pepper (Panniyur and similar areas)": "6625fd22c986db5da828dc26",
-            "ഉരുളകിഴങ്ങ് (All Variety / Rainfed / Annual Crop)": "667905d6ac3b2717f6e0f078",
-            "മത്തന്‍ (All Variety)": "6625fd2ac986db5da828ddda",
-            "റാഡിഷ്‌ (All Variety / Rainfed / Annual Crop)": "667409219ac28a6f1d5eddb0",
-            "നെല്ല് (Upland)": "6625fd1cc986db5da828daa7",
-            "നെല്ല് (HYV Short Duration / Rainfed / Kharif)": "67024d5fd906b369cdf22c68",
-            "നെല്ല് (Koottumundakan II nd crop / Rainfed / Kharif)": "67024eeec151cd3a4eeea265",
-            "നെല്ല് (Kole Lands Short Duration / Rainfed / Kharif)": "67024dc066829035ecc0fc4d",
-            "നെല്ല് (Ponnani/Kaattukambal Kole HYV Medium Duration / Rainfed / Kharif)": "67024e591c0f189b7903f82a",
-            "നെല്ല് (Koottumundakan I st crop / Rainfed / Kharif)": "67024ec4a1cfef63cf3c307e",
-            "നെല്ല് (HYV Medium duration / Rainfed / Kharif)": "67024cba6f20bb3e707ee391",
-            "നെല്ല് (Kole Lands HYV Medium Duration / Rainfed / Kharif)": "67024df9ce891b12c4f9f746",
-            "നെല്ല് (Wetland Mahsuri)": "6625fd1dc986db5da828dac5",
-            "നെല്ല് (Wetland Local Varieties)": "6625fd1dc986db5da828dabf",
-            "നെല്ല് (Wetland H4 Variety)": "6625fd1dc986db5da828dab9",
-            "നെല്ല് (Wetland)": "6625fd1dc986db5da828dacb",
-            "നെല്ല് (Upland Short Duration)": "6625fd1cc986db5da828daa0",
-            "പീച്ചിങ്ങ (All Variety)": "6625fd2dc986db5da828dedd",
-            "റബ്ബര്‍ (1St Year)": "6625fd2fc986db5da828df5c",
-            "റബ്ബര്‍ (2Nd Year)": "6625fd2fc986db5da828df62",
-            "റബ്ബര്‍ (3rd year)": "6625fd2fc986db5da828df68",
-            "റബ്ബര്‍ (>5 Year Natural Cover)": "6625fd2fc986db5da828df56",
-            "റബ്ബര്‍ (>5 Year Cover Crops)": "6625fd2fc986db5da828df50",
-            "റബ്ബര്‍ (4 th year / Rainfed)": "6625fd2fc986db5da828df6e",
-            "സപ്പോട്ട (All Variety / Rainfed)": "6625fd32c986db5da828dff2",
-            "എള്ള് (All Variety)": "6625fd34c986db5da828e081",
-            "പടവലം (All Variety)": "6625fd35c986db5da828e0a5",
-            "പടവലം (All Variety / Rainfed / Annual Crop)": "6679027002ccc5bb21345a2f",
-            "അരിചോളം (All Variety / Irrigated / Annual Crop)": "66751db75149fd41703a9254",
-            "സ്ട്രോബെറി (All Variety / Rainfed / Annual Crop)": "667902f78d865d80c0afa898",
-            "കരിമ്പ്‌  (All Variety)": "6625fd3ac986db5da828e1f4",
-            "Sweet Orange (278 Plants/Ha 4Th Year)": "6625fd17c986db5da828d94d",
-            "Sweet Orange (278 Plants/Ha 6Th Year)": "6625fd17c986db5da828d959",
-            "Sweet Orange (278 Plants/Ha1St Year)": "6625fd17c986db5da828d965",
-            "Sweet Orange (278 Plants/Ha 5Th Year)": "6625fd17c986db5da828d953",
-            "Sweet Orange (278 Plants/Ha 3Rd Year)": "6625fd17c986db5da828d947",
-            "Sweet Orange (278 Plants/Ha 7Th Year Onwards)": "6625fd17c986db5da828d95f",
-            "Sweet Orange (278 Plants/Ha 2Nd Year)": "6625fd17c986db5da828d941",
-            "മധുരക്കിഴങ്ങ് (All Variety)": "6625fd3ec986db5da828e2f5",
-            "വാളരി പയര്‍ (All Variety)": "6625fd3fc986db5da828e333",
-            "വാളന്‍ പുളി (All Variety / Rainfed)": "6625fd3fc986db5da828e345",
-            "മരിച്ചീനി (M4 andf local)": "6625fd40c986db5da828e37c",
-            "മരിച്ചീനി (M-4 And Local Variety)": "6625fd40c986db5da828e38e",
-            "മരിച്ചീനി (H-97 and H 226)": "6625fd40c986db5da828e370",
-            "മരിച്ചീനി (H-165 And Sree Visakham)": "6625fd40c986db5da828e382",
-            "മരിച്ചീനി (H-97 And H226)": "6625fd40c986db5da828e388",
-            "മരിച്ചീനി (H-165, Sree Vishakam, Sree Sahya)": "6625fd40c986db5da828e376",
-            "തേയില (1St Year)": "6625fd41c986db5da828e3b9",
-            "തേയില (3rd year / Rainfed)": "6625fd41c986db5da828e3c5",
-            "തേയില (2Nd Year)": "6625fd41c986db5da828e3bf",
-            "തക്കാളി (All Variety)": "6625fd43c986db5da828e450",
-            "Tuberose (All Variety)": "6625fd44c986db5da828e47a",
-            "Tuberose (All Variety / Rainfed / Annual Crop)": "6679052c44ed264662f2bbd0",
-            "മഞ്ഞള്‍ (All Variety)": "6625fd45c986db5da828e4ce",
-            "Vetiver (All Variety)": "6625fd46c986db5da828e518",
-            "തണ്ണിമത്തന്‍ (All Variety)": "6625fd48c986db5da828e5a8"
-        },
-        "63f878a8c660ddb223461a90": {
-            "Barley (All Variety)": "6625fcb9c986db5da828c392",
-            "Barley (All / Irrigated / Kharif)": "6620caea101b1dba5a27d870",
-            "Broccoli (Irrigated / Kharif)": "66d6c51a4539b5677ade2d5b",
-            "Cabbage (All / Irrigated / Kharif)": "6620cbc1101b1dba5a28c5e3",
-            "Carrot (All / Irrigated / Kharif)": "6620cbe8101b1dba5a28e14e",
-            "Cauliflower (All / Irrigated / Kharif)": "6620cc38ab6cb69126fbb5bb",
-            "Cucumber (All Variety)": "6625fcdfc986db5da828ccbb",
-            "Indian Mustard (all / Irrigated / Kharif)": "68ef34bf0e179078346a13be",
-            "Lettuce (All / Irrigated / Kharif)": "66d6c5575ceb55ca7ebf3300",
-            "Onion (All Variety)": "6625fd15c986db5da828d8b6",
-            "Pea (All / Irrigated / Kharif)": "66d6c5975ceb55ca7ebf3f7a",
-            "Potato (All / Irrigated / Kharif)": "6620cb90a9fa24bd99757b84",
-            "Spinach (Irrigated / Kharif)": "66d6c53dd38a315933c136bb",
-            "Tomato (All / Irrigated / Kharif)": "6620ccbca9fa24bd9975cfa7",
-            "Turnips (All / Irrigated / Kharif)": "6620cbd3ab6cb69126fb7502",
-            "Wheat (All Variety)": "6625fd4ac986db5da828e5f0"
-        },
-        "63f8e729dbc0f7fe0670d050": {
-            "Barley (Rainfed / Rabi)": "6624d7a75dce468bfe6e1ed2",
-            "काबुली चना (All Variety / Irrigated / Rabi)": "6625fceac986db5da828cf02",
-            "काबुली चना (Irrigated / Rabi)": "6624c4a75dce468bfe6cee3e",
-            "मिर्च (All Variety  / Irrigated / Rabi)": "6669a52c1657e6e1e159dd07",
-            "मिर्च (All Variety  / Irrigated / Kharif)": "6669a4691657e6e1e159c1ad",
-            "मूंगफली (Irrigated / Kharif)": "6624cbdde957592861b40690",
-            "भारतीय सरसों (All Variety)": "6625fd10c986db5da828d755",
-            "खेसारी (Rainfed / Rabi)": "6624c55fe957592861b3b0c5",
-            "अलसी का बीज (Rainfed / Rabi)": "6624d0025dce468bfe6d9ad4",
-            "मक्का (Hybrid)": "6625fd04c986db5da828d4ed",
-            "मक्का (All Variety / Irrigated / Kharif)": "6625fd04c986db5da828d4e1",
-            "मक्का (Maze Hybrid / Irrigated / Kharif)": "6624d14d29f20860377a769d",
-            "मोठ की दाल (Irrigated / Kharif)": "6624ccb55dce468bfe6d6b26",
-            "नाइजरसीड (Irrigated / Kharif)": "6624d9ca5051cacf291c5b14",
-            "Pea (Irrigated / Rabi)": "6624d85be957592861b4aeb1",
-            "बाजरा (Rainfed / Kharif)": "6624d092b0e7b1b0f9e8bb71",
-            "Pigeon Pea (Rainfed / Kharif)": "6624d5195dce468bfe6de31d",
-            "चावल (All Variety / Irrigated / Kharif)": "6625fd1ac986db5da828d9e3",
-            "चावल (Irrigated / Kharif)": "6624d5bd5051cacf291bfe99",
-            "कुसुम (Rainfed / Rabi)": "6624d482e957592861b47b65",
-            "तिल (Rainfed / Kharif)": "6624d328b0e7b1b0f9e929bd",
-            "चारा (Jowar / Rainfed / Kharif)": "6624dbaf5051cacf291c8f53",
-            "सोयाबीन (All Variety / Rainfed / Kharif)": "6625fd37c986db5da828e117",
-            "सोयाबीन (Rainfed / Kharif)": "6624c702e957592861b3dd88",
-            "गन्ना (Irrigated / Rabi)": "6624cf175dce468bfe6d74bf",
-            "सूरजमुखी (Irrigated / Rabi)": "6624d26eb0e7b1b0f9e917eb",
-            "टेट्राप्लोइड कपास (Irrigated / Kharif)": "6624d381e957592861b45e44",
-            "टेट्राप्लोइड कपास (All Variety)": "6625fcdbc986db5da828cbd0",
-            "उर्दबीन (Irrigated / Kharif)": "6624ce21b0e7b1b0f9e82b18",
-            "गेहूँ (Irrigated / Rabi)": "662229e229f2086037325335",
-            "गेहूँ (Rainfed / Rabi)": "6624da98b0e7b1b0f9e9ac40"
-        },
-        "63f9322a89d86ca9e2bca5df": {
-            "कागदी लिंबु/लिंबू  (all variety / Irrigated / Annual Crop)": "66aa0d03f2b4a5e348911513",
-            "कागदी लिंबु/लिंबू  (all variety/3rd year / Irrigated / Annual Crop)": "66c5adf6fa1fd21b53e0b1bb",
-            "कागदी लिंबु/लिंबू  (all variety/1st year / Irrigated / Annual Crop)": "66c5ade6fbb4fe5da5f4e30d",
-            "सुपारी (All Variety)": "6625fcb2c986db5da828c213",
-            "सुपारी (3 rd year onwards)": "6625fcb3c986db5da828c234",
-            "सुपारी (2nd year)": "6625fcb3c986db5da828c22e",
-            "सुपारी (1st year)": "6625fcb3c986db5da828c228",
-            "बांबु  (All Variety)": "6625fcb6c986db5da828c2eb",
-            "केळी (All Variety)": "6625fcb7c986db5da828c33d",
-            "केळी (all variety / Irrigated / Annual Crop)": "66acc7b05479c5daf6c1959b",
-            "वरी/भगर (All variety / Rainfed / Rabi)": "663c7639199c895c9208bdfe",
-            "वरी/भगर (All variety / Rainfed / Kharif)": "663c7580e57595145ad64c9d",
-            "वरी/भगर (All variety / Irrigated / Kharif)": "663c756df47f3c93edbbfd7e",
-            "वरी/भगर (All variety / Irrigated / Rabi)": "663c75e9199c895c920881b2",
-            "कारले (all variety / Rainfed / Kharif)": "66baf91f4de28f3ac397b8e8",
-            "कारले (all variety / Irrigated / Kharif)": "667a613858c0184c1fe7594b",
-            "काळी मिरी (2nd year)": "6625fcbfc986db5da828c563",
-            "काळी मिरी (3rd year onward)": "6625fcbfc986db5da828c56a",
-            "काळी मिरी (1st year)": "6625fcc0c986db5da828c570",
-            "काळी मिरी (All Variety)": "6625fcc0c986db5da828c590",
-            "दुधीभोपळा (all variety / Rainfed / Kharif)": "66baf90df24d2d12f5d36992",
-            "वांगे (all variety / Rainfed / Kharif)": "66baf95a24ced6ac1ebb63c1",
-            "वांगे (all variety / Irrigated / Kharif)": "66c70b9c74cd6dfb250c03cd",
-            "वांगे (all variety / Irrigated / Pre-kharif)": "66bb0ed9f24d2d12f5db9173",
-            "वांगे (All Variety)": "6625fcc3c986db5da828c61f",
-            "वांगे (all variety / Irrigated / Rabi)": "66bb0eeea611d6b6665924df",
-            "पत्ताकोबी (All Variety)": "6625fcc6c986db5da828c6fc",
-            "पत्ताकोबी (all variety / Irrigated / Rabi)": "66bf1e68a611d6b666ae3dd5",
-            "काजू (2 nd year / Irrigated / Annual Crop)": "66ab780f2206913525970687",
-            "काजू (4 th year onwards / Irrigated / Annual Crop)": "66ab783cdc579f2de87bce39",
-            "काजू (1 st year / Irrigated / Annual Crop)": "66ab77fcdc579f2de87bc3eb",
-            "काजू (all variety / Irrigated / Annual Crop)": "66961b8fb5887cc203e7f09d",
-            "काजू (3 rd year / Irrigated / Annual Crop)": "66ab781f088102326cbe4092",
-            "फुलकोबी (All Variety)": "6625fccbc986db5da828c821",
-            "फुलकोबी (all variety / Irrigated / Rabi)": "66bf1e784de28f3ac3f8ffaa",
-            "चणे (All variety / Rainfed / Kharif)": "663c772726a0446a668c3960",
-            "चणे (All variety / Irrigated / Kharif)": "663c7714471f27d998834ada",
-            "चणे (All variety / Rainfed / Rabi)": "663c7758d668a1e6e9726baa",
-            "चणे (All variety / Irrigated / Rabi)": "663c773c1bc1ec2e9f684f9c",
-            "मिरची (All variety / Rainfed / Rabi)": "66585b785a1036204ee4fd47",
-            "मिरची (All variety / Rainfed / Kharif)": "66585b13dc56ca00f50b6254",
-            "मिरची (All variety / Irrigated / Rabi)": "66585b3234c01f2d633c7ea9",
-            "मिरची (All variety / Irrigated / Kharif)": "66585af65a1036204ee4cb3c",
-            "मिरची (capsicum)": "6625fcc7c986db5da828c733",
-            "ॲस्टर (all variety / Irrigated / Kharif)": "66c7111c0afe7c7615b440e9",
-            "ॲस्टर (all variety / Irrigated / Pre-kharif)": "66c59ac725b1b594f4d08bd2",
-            "शेवंती (all variety / Irrigated / Kharif)": "66c711c39f3b2cc657268a92",
-            "शेवंती (All Variety)": "6625fcd0c986db5da828c968",
-            "शेवंती (all variety / Irrigated / Rabi)": "66bf1f70a611d6b666ae8bc4",
-            "दालचिनी (10 th year onwards)": "6625fcd1c986db5da828c98f",
-            "दालचिनी (8 th year)": "6625fcd2c986db5da828c9bf",
-            "दालचिनी (1st year)": "6625fcd1c986db5da828c995",
-            "दालचिनी (2nd year)": "6625fcd2c986db5da828c99b",
-            "दालचिनी (5 th year)": "6625fcd2c986db5da828c9ad",
-            "दालचिनी (3 rd year)": "6625fcd2c986db5da828c9a1",
-            "दालचिनी (6 th year)": "6625fcd2c986db5da828c9b3",
-            "दालचिनी (9 th year)": "6625fcd3c986db5da828c9c5",
-            "दालचिनी (7 th year)": "6625fcd2c986db5da828c9b9",
-            "दालचिनी (4 th year/all variety / Irrigated / Annual Crop)": "66ab6f2c664a4caa715246a0",
-            "नारळ (hybrid 1st year)": "6625fcd8c986db5da828cb14",
-            "नारळ (Above 5 Years)": "6625fcd7c986db5da828cadd",
-            "नारळ (hybrid 5th year onwards)": "6625fcd9c986db5da828cb2c",
-            "नारळ (All Variety)": "6625fcd7c986db5da828cab3",
-            "नारळ (hybrid 4 th year)": "6625fcd9c986db5da828cb26",
-            "नारळ (hybrid 3 rd year)": "6625fcd9c986db5da828cb20",
-            "नारळ (hybrid 2 nd year)": "6625fcd8c986db5da828cb1a",
-            "नारळ (1st year)": "6625fcd7c986db5da828cae9",
-            "चवळी (all variety / Rainfed / Kharif)": "66ab38eeaaa952f83c5d95b1",
-            "चवळी (All Variety)": "6625fcdec986db5da828cc84",
-            "काकडी (all variety / Rainfed / Kharif)": "66baf92d24ced6ac1ebb5aee",
-            "काकडी (All Variety)": "6625fce0c986db5da828ccf1",
-            "सीताफळ (Fully develop / Irrigated / Annual Crop)": "66c72965ccdf5a5ed0b05e70",
-            "सीताफळ (All Variety)": "6625fcacc986db5da828c0bd",
-            "सीताफळ (all variety/3rd year / Irrigated / Annual Crop)": "66c5ad3bfbb4fe5da5f4b57b",
-            "सीताफळ (all variety/1st year / Irrigated / Annual Crop)": "66c5ad2483660866ff48fabb",
-            "सीताफळ (all variety / Irrigated / Annual Crop)": "66acc863cd14d86dbf645eb1",
-            "मेथी (All Variety)": "6625fce4c986db5da828cdc8",
-            "मेथी (all variety / Rainfed / Kharif)": "66baf6dc984e5fa8d3232ea0",
-            "अंजीर (All Variety)": "6625fce5c986db5da828cdda",
-            "रागी/नाचणी/नागली  (All variety / Rainfed / Kharif)": "663c74d3b084f91a8af10028",
-            "रागी/नाचणी/नागली  (All variety / Irrigated / Rabi)": "663c74bdb084f91a8af0e461",
-            "रागी/नाचणी/नागली  (all variety / Irrigated / Kharif)": "66b605519b1620ec17472047",
-            "रागी/नाचणी/नागली  (All Variety)": "6625fce6c986db5da828ce0d",
-            "आले (All Variety)": "6625fce9c986db5da828cee4",
-            "आले (all variety / Irrigated / Kharif)": "66acc697893fc7afc6bff27d",
-            "द्राक्षे (All Variety)": "6625fcebc986db5da828cf4a",
-            "भुईमूग (all variety / Irrigated / Pre-kharif)": "66b07cde066e74bc772857e0",
-            "भुईमूग (all variety / Rainfed / Kharif)": "66ab3310aaa952f83c5be53c",
-            "भुईमूग (all variety / Irrigated / Rabi)": "66b32a8b7d283a0791852ea3",
-            "भुईमूग (all variety / Irrigated / Kharif)": "66b32a3fed9c95628bb8a242",
-            "भुईमूग (All Variety)": "6625fceec986db5da828d018",
-            "पेरू (all variety/1st year / Irrigated / Annual Crop)": "66c5ad5aee131dd6e3d8a918",
-            "पेरू (All Variety)": "6625fcf0c986db5da828d07c",
-            "पेरू (Fully develop / Irrigated / Annual Crop)": "66c729ae74cd6dfb25125399",
-            "पेरू (all variety/3rd year / Irrigated / Annual Crop)": "66c5ad8161481669143acba5",
-            "पेरू (all variety / Irrigated / Annual Crop)": "66acc7e598d686dbf0e4fff5",
-            "वाटाणा  (All Variety)": "6625fcf2c986db5da828d0f6",
-            "आवळा (all variety/above 5 years / Rainfed / Kharif)": "66bafaaf4de28f3ac3982d78",
-            "बोर (All Variety)": "6625fcbcc986db5da828c46d",
-            "भारतीय मोहरी (All Variety / Irrigated)": "6625fd10c986db5da828d774",
-            "भारतीय मोहरी (Rainfed / Rabi)": "66b34f0c6de5cd618f4b85cf",
-            "फणस (Above 5 Years)": "6625fcf5c986db5da828d196",
-            "फणस (All variety / Irrigated / Annual Crop)": "671b4159451be93363a47743",
-            "जांभूळ  (all variety/above 5 years / Rainfed / Kharif)": "66bafa3c4de28f3ac3980dd2",
-            "जाई (All Variety)": "6625fcf6c986db5da828d1e1",
-            "Kidney Beans (All variety / Irrigated / Kharif)": "670cee4e0c75cee989560055",
-            "कोकम (9 th year)": "6625fcfac986db5da828d29d",
-            "कोकम (5 th year)": "6625fcf9c986db5da828d285",
-            "कोकम (2nd year)": "6625fcf9c986db5da828d273",
-            "कोकम (1st year)": "6625fcf8c986db5da828d26d",
-            "कोकम (3 rd year)": "6625fcf9c986db5da828d279",
-            "कोकम (8 th year)": "6625fcf9c986db5da828d297",
-            "कोकम (10 th year onward)": "6625fcf8c986db5da828d267",
-            "कोकम (7 th year)": "6625fcf9c986db5da828d291",
-            "कोकम (4 th year)": "6625fcf9c986db5da828d27f",
-            "कोकम (6 th year)": "6625fcf9c986db5da828d28b",
-            "Lemon (All variety / Irrigated / Annual Crop)": "6658181481503d95a6ea1b42",
-            "Lemon (1st year)": "6625fcffc986db5da828d3c0",
-            "Lemon (4th year)": "6625fcffc986db5da828d3d2",
-            "Lemon (5th year)": "6625fd00c986db5da828d3d8",
-            "Lemon (Above 5 Years)": "6625fcfcc986db5da828d31c",
-            "Lemon (2nd year)": "6625fcffc986db5da828d3c6",
-            "Lemon (3rd year)": "6625fcffc986db5da828d3cc",
-            "Lemon (6 year and above)": "6625fd00c986db5da828d3de",
-            "Lima Bean (all variety / Irrigated / Rabi)": "66bafa08f24d2d12f5d3b478",
-            "जवस (All Variety)": "6625fd00c986db5da828d3fd",
-            "जवस (Rainfed / Rabi)": "66b34ef1edd00a485eb94fd8",
-            "मका (All variety / Irrigated / Kharif)": "663c7d001bc1ec2e9f6f0d6d",
-            "मका (All variety / Rainfed / Kharif)": "663c7d3e471f27d99887b2be",
-            "मका (all variety / Irrigated / Pre-kharif)": "66c7288c9a5020d850adc7d3",
-            "मका (All variety / Rainfed / Rabi)": "663c7d5f1bc1ec2e9f6f99ce",
-            "मका (All variety / Irrigated / Rabi)": "663c7d241bc1ec2e9f6f2b09",
-            "आंबा (3 rd year alphanso, kesar, other)": "6625fd0ac986db5da828d625",
-            "आंबा (10 th year onwards)": "6625fd09c986db5da828d60d",
-            "आंबा (all variety / Irrigated / Annual Crop)": "66acc78e7d602028fd6da411",
-            "आंबा (9th year alphanso, kesar, other)": "6625fd0ac986db5da828d649",
-            "आंबा (4th year alphanso, kesar, other)": "6625fd0ac986db5da828d62b",
-            "आंबा (Above 10 Years)": "6625fd09c986db5da828d607",
-            "आंबा (1st year alphanso, kesar, other)": "6625fd0ac986db5da828d619",
-            "आंबा (2 nd year alphanso, kesar, other)": "6625fd0ac986db5da828d61f",
-            "आंबा (all variety below 10 years / Irrigated / Annual Crop)": "66b07cfc066e74bc772862ee",
-            "आंबा (7th year alphanso, kesar, other)": "6625fd0ac986db5da828d63d",
-            "आंबा (5th year alphanso, kesar, other)": "6625fd0ac986db5da828d631",
-            "आंबा (All Variety)": "6625fd07c986db5da828d59b",
-            "आंबा (8th year alphanso, kesar, other)": "6625fd0ac986db5da828d643",
-            "आंबा (6th year alphanso, kesar, other)": "6625fd0ac986db5da828d637",
-            "झेंडू (all variety / Irrigated / Rabi)": "66bf1f5c984e5fa8d383dcb7",
-            "झेंडू (all variety / Irrigated / Kharif)": "66c7285e08e71fc16db08935",
-            "झेंडू (All Variety)": "6625fd0cc986db5da828d6b0",
-            "शेवगा (all variety / Rainfed / Kharif)": "66baf97a24ced6ac1ebb6c4f",
-            "मोसंबी (all variety/1st year / Irrigated / Annual Crop)": "66c5da460b2fdca3f924413a",
-            "मोसंबी (4 th year/all variety / Irrigated / Annual Crop)": "66c5da99d46dd4291e9a9fb7",
-            "मोसंबी (all variety/5th-6th year / Irrigated / Annual Crop)": "66c5dabee7b1ed2e872de575",
-            "मोसंबी (all variety/2nd year / Irrigated / Annual Crop)": "66c5da6ee86c4ab76b99bc99",
-            "मोसंबी (all variety/8th -10th year / Irrigated / Annual Crop)": "66c5dae6d46dd4291e9aa457",
-            "मोसंबी (all variety/3rd year / Irrigated / Annual Crop)": "66c5da810b2fdca3f92445c8",
-            "मोसंबी (all variety 11 years above / Irrigated / Annual Crop)": "66c5db07558911dcfb2cb5d1",
-            "मॉथ बीन (Irrigated / Kharif)": "668f974302997d3b2a77a9e8",
-            "मॉथ बीन (All variety / Rainfed / Rabi)": "663dd5de4f5a139b60071889",
-            "मॉथ बीन (Irrigated / Pre-kharif)": "66bf1976984e5fa8d3824f86",
-            "मॉथ बीन (Rainfed / Rabi)": "6671527a9ac28a6f1d23793f",
-            "मॉथ बीन (All variety / Irrigated / Rabi)": "66542dcf00ff3f5de314dffd",
-            "मॉथ बीन (All variety / Rainfed / Kharif)": "66542d9cea3e0548662b0513",
-            "मॉथ बीन (Rainfed / Pre-kharif)": "66bf19869317759e09794455",
-            "मॉथ बीन (All variety / Irrigated / Kharif)": "66542dbc479f1e6c3cfbda6d",
-            "जायफळ (All Variety)": "6625fd11c986db5da828d7a4",
-            "जायफळ (9 th year)": "6625fd12c986db5da828d7f3",
-            "जायफळ (1st year)": "6625fd11c986db5da828d7c3",
-            "जायफळ (3 rd year)": "6625fd11c986db5da828d7cf",
-            "जायफळ (2nd year)": "6625fd11c986db5da828d7c9",
-            "जायफळ (5 th year)": "6625fd12c986db5da828d7db",
-            "जायफळ (4 th year)": "6625fd12c986db5da828d7d5",
-            "जायफळ (7 th year)": "6625fd12c986db5da828d7e7",
-            "जायफळ (8 th year)": "6625fd12c986db5da828d7ed",
-            "जायफळ (10 th year onwards)": "6625fd11c986db5da828d7bd",
-            "जायफळ (6 th year)": "6625fd12c986db5da828d7e1",
-            "भेंडी (all variety / Irrigated / Rabi)": "66bf1e984de28f3ac3f90802",
-            "भेंडी (Okra)": "6625fd15c986db5da828d89e",
-            "भेंडी (all variety / Rainfed / Kharif)": "66baf8f8f211445faff9f3f3",
-            "कांदा (All Variety)": "6625fd16c986db5da828d904",
-            "कांदा (Irrigated / Kharif)": "66b34fafc6de9bd6a07bf420",
-            "कांदा (All variety / Irrigated / Kharif)": "66e3f070380b20cc0e74313a",
-            "कांदा (all variety / Irrigated / Rabi)": "66acc6825479c5daf6c16db4",
-            "कांदा (all variety / Irrigated / Pre-kharif)": "66bb0ec28b7c4dc652563d6a",
-            "पपई (All Variety)": "6625fd1fc986db5da828db57",
-            "Pea (All variety / Irrigated / Rabi)": "66e405ca61d3d46ca892dc36",
-            "बाजरी (all variety / Rainfed / Kharif)": "66accf0e5479c5daf6c3066b",
-            "बाजरी (All variety / Irrigated / Kharif)": "663c73ebb084f91a8aeffb83",
-            "बाजरी (all variety / Irrigated / Rabi)": "6694eec621da090d698f9be7",
-            "बाजरी (all variety / Rainfed / Rabi)": "6694eee1871ebe13d69c6a7b",
-            "बाजरी (Trimbak / Rainfed / Kharif)": "663c7400199c895c920698c3",
-            "Pigeon Pea (All variety / Irrigated / Kharif)": "663dd5b64f5a139b6006f359",
-            "Pigeon Pea (All variety / Rainfed / Kharif)": "66543ee400ff3f5de31e518c",
-            "Pigeon Pea (All variety / Irrigated / Rabi)": "66543ed2479f1e6c3c0422be",
-            "Pigeon Pea (All variety / Rainfed / Rabi)": "66543ef7d9d2b8d9d82ee33f",
-            "डाळिंब (all variety/3rd year / Irrigated / Annual Crop)": "66c5a019614816691437cd06",
-            "डाळिंब (All variety / Irrigated / Annual Crop)": "66584db334c01f2d6338515c",
-            "डाळिंब (4 th year/all variety / Irrigated / Annual Crop)": "66c72a019f3b2cc6572b47d8",
-            "डाळिंब (All variety / Rainfed / Annual Crop)": "66584dc50f0fb5ae6e269456",
-            "डाळिंब (all variety/2nd year / Irrigated / Annual Crop)": "66c5db5be86c4ab76b99cfae",
-            "डाळिंब (all variety/1st year / Irrigated / Annual Crop)": "66c5a031614816691437d2bc",
-            "डाळिंब (5 th year/all variety / Irrigated / Annual Crop)": "66c72a2168fb7bba3d11bc09",
-            "बटाटा (all variety / Irrigated / Kharif)": "66aa0e7629dba8721178f667",
-            "बटाटा (All Variety)": "6625fd28c986db5da828dd6e",
-            "लाल भोपळा (all variety / Irrigated / Kharif)": "667a60c4631e8343d65cfb47",
-            "तांदूळ/धान/भात/साळ (all variety / Irrigated / Kharif)": "66a8b27013dce115e24dea41",
-            "तांदूळ/धान/भात/साळ (All variety / Rainfed / Kharif)": "663c7383b084f91a8aefa3b5",
-            "तांदूळ/धान/भात/साळ (Hybrid / Rainfed / Kharif)": "66bafa229317759e091a57e5",
-            "दोडका (All Variety / Irrigated)": "6625fd2dc986db5da828def5",
-            "दोडका (all variety / Rainfed / Kharif)": "66baf93df24d2d12f5d3779c",
-            "गुलाब (All Variety)": "6625fd2ec986db5da828df19",
-            "गुलाब (Irrigated / Kharif)": "66e2b6ef61d3d46ca86dda5c",
-            "करडई (All variety / Rainfed / Rabi)": "66585703dc56ca00f5093611",
-            "करडई (All variety / Irrigated / Kharif)": "665856f2dc15203bf3033edb",
-            "करडई (All variety / Rainfed / Kharif)": "66585757ebc2b3d75b46b0fd",
-            "करडई (All variety / Irrigated / Rabi)": "6658571bdc56ca00f509427b",
-            "चिकु  (20 th year onwards)": "6625fcccc986db5da828c893",
-            "चिकु  (15 th year)": "6625fcccc986db5da828c86f",
-            "चिकु  (Above 20 Years)": "6625fccdc986db5da828c8c3",
-            "चिकु  (9 th year)": "6625fccdc986db5da828c8bd",
-            "चिकु  (5 th year)": "6625fccdc986db5da828c8a5",
-            "चिकु  (7 th year)": "6625fccdc986db5da828c8b1",
-            "चिकु  (8 th year)": "6625fccdc986db5da828c8b7",
-            "चिकु  (4 th year)": "6625fccdc986db5da828c89f",
-            "चिकु  (All Variety)": "6625fd31c986db5da828dfec",
-            "चिकु  (all variety/3rd year / Irrigated / Annual Crop)": "66c5adc359d736a721c12c67",
-            "चिकु  (3 rd year)": "6625fccdc986db5da828c899",
-            "चिकु  (10 th year)": "6625fccbc986db5da828c857",
-            "चिकु  (2nd year)": "6625fcccc986db5da828c88d",
-            "चिकु  (6 th year)": "6625fccdc986db5da828c8ab",
-            "चिकु  (12 Year)": "6625fccbc986db5da828c85d",
-            "चिकु  (16 th year)": "6625fcccc986db5da828c875",
-            "चिकु  (17 th year)": "6625fcccc986db5da828c87b",
-            "चिकु  (all variety / Irrigated / Annual Crop)": "66acc7cc98d686dbf0e4fdcc",
-            "चिकु  (11st year)": "6625fccbc986db5da828c84b",
-            "चिकु  (13 Year)": "6625fccbc986db5da828c863",
-            "चिकु  (18 th year)": "6625fcccc986db5da828c881",
-            "चिकु  (19 th year)": "6625fcccc986db5da828c887",
-            "चिकु  (all variety/1st year / Irrigated / Annual Crop)": "66c5adacfbb4fe5da5f4cf21",
-            "चिकु  (14 th year)": "6625fcccc986db5da828c869",
-            "चिकु  (1st year)": "6625fccbc986db5da828c851",
-            "तीळ (all variety / Rainfed / Rabi)": "66c59db425b1b594f4d130a7",
-            "तीळ (all variety / Irrigated / Kharif)": "66a8b831aafb797c13856948",
-            "तीळ (all variety / Rainfed / Kharif)": "66baf991f24d2d12f5d38ef2",
-            "पडवळ (all variety / Rainfed / Kharif)": "66baf94c9317759e091a1aed",
-            "ज्वारी (All variety / Rainfed / Rabi)": "663c743ff47f3c93edbb3428",
-            "ज्वारी (All variety / Irrigated / Kharif)": "663c9abd28c392312156f8f2",
-            "ज्वारी (All variety / Irrigated / Rabi)": "663c7427b084f91a8af02499",
-            "ज्वारी (All variety / Rainfed / Kharif)": "66543f39d9edc2014a740731",
-            "सोयाबीन (All variety / Rainfed / Kharif)": "663dd7944f5a139b6008814b",
-            "सोयाबीन (All variety / Irrigated / Kharif)": "663dd76ee3aa8a260d58385d",
-            "सोयाबीन (All variety / Irrigated / Rabi)": "663dd7584f5a139b60085396",
-            "सोयाबीन (All variety / Rainfed / Rabi)": "6655c7d970d2406e8e34a7b2",
-            "पालक (all variety / Rainfed / Kharif)": "66baf8e2b2787ed38c3742ee",
-            "पालक (All Variety)": "6625fd38c986db5da828e179",
-            "स्ट्रॉबेरी (all variety / Irrigated / Annual Crop)": "66aa09b31f418bb5cca8aea7",
-            "ऊस (bene)": "6625fd3bc986db5da828e221",
-            "ऊस (Suru)": "6625fd3ac986db5da828e1fa",
-            "ऊस (Pre seasonal / Irrigated / Annual Crop)": "670cf0f288f4b2afd79438e2",
-            "ऊस (suru purv,khodwa)": "6625fd3bc986db5da828e22d",
-            "ऊस (All variety / Irrigated / Rabi)": "66e405f02e554146333259d6",
-            "ऊस (adsali)": "6625fd3ac986db5da828e201",
-            "ऊस (all variety/seasonal / Irrigated / Annual Crop)": "66c70ffb74cd6dfb250d1a65",
-            "ऊस (all variety/Ratoon / Irrigated / Annual Crop)": "66c70fd5ccdf5a5ed0aaffbe",
-            "ऊस (All variety / Irrigated / Kharif)": "66e405de0f3303ab5387e892",
-            "सूर्यफूल (all variety / Rainfed / Rabi)": "66bb0e2e4a4beeca6efcaeee",
-            "सूर्यफूल (Modern / Rainfed / Pre-kharif)": "66f5467d3f033694f1b3d4e8",
-            "सूर्यफूल (pkvsh, pdkvsh)": "6625fd3cc986db5da828e28e",
-            "सूर्यफूल (Modern / Irrigated / Kharif)": "66a8b7b01bfb22327d130544",
-            "सूर्यफूल (all variety / Rainfed / Kharif)": "66ab3062664a4caa713fe44f",
-            "सूर्यफूल (all variety / Irrigated / Kharif)": "66b32b317d431fdcd296879d",
-            "सूर्यफूल (Modern / Rainfed / Rabi)": "66f546d56630aa55df898449",
-            "सूर्यफूल (all variety / Rainfed / Pre-kharif)": "66bb0e434de28f3ac39f6e5d",
-            "सूर्यफूल (all variety / Irrigated / Rabi)": "66b470f8f1b5bc4c0f38c74b",
-            "संत्री  (3rd year)": "6625fd18c986db5da828d98f",
-            "संत्री  (all variety/3rd year / Irrigated / Annual Crop)": "66c5ae1f2dd4138f9fab53cf",
-            "संत्री  (6 year and above)": "6625fd19c986db5da828d9a1",
-            "संत्री  (All variety / Irrigated / Annual Crop)": "665858545140c9e65099d91b",
-            "संत्री  (1st year)": "6625fd18c986db5da828d983",
-            "संत्री  (4 th year)": "6625fd18c986db5da828d995",
-            "संत्री  (5 th year)": "6625fd18c986db5da828d99b",
-            "संत्री  (2nd year)": "6625fd18c986db5da828d989",
-            "संत्री  (all variety/1st year / Irrigated / Annual Crop)": "66c5ae0b4ffe782b7c5b7bf4",
-            "टेट्राप्लॉइड कापूस (Hybrid / Irrigated / Kharif)": "66f5478e2053367485227a0d",
-            "टेट्राप्लॉइड कापूस (all variety / Rainfed / Kharif)": "66c6e9fcb8fdd9e421d6ef04",
-            "टेट्राप्लॉइड कापूस (BT / Rainfed / Kharif)": "66f547ab9389d424a36f54df",
-            "टेट्राप्लॉइड कापूस (Improved Variety)": "6625fcdcc986db5da828cc31",
-            "टेट्राप्लॉइड कापूस (all variety/BT / Irrigated / Kharif)": "66c702a7ccdf5a5ed0a7922a",
-            "टेट्राप्लॉइड कापूस (Hybrid)": "6625fcdcc986db5da828cc2a",
-            "टेट्राप्लॉइड कापूस (all variety / Irrigated / Kharif)": "66c6e886382b3ce0b01e6e27",
-            "टेट्राप्लॉइड कापूस (improved variety / Rainfed / Kharif)": "66ed43df54d321c2123025d8",
-            "टोमॅटो (all variety / Irrigated / Pre-kharif)": "66bb0efff24d2d12f5db9f8d",
-            "टोमॅटो (All variety / Rainfed / Rabi)": "66584d4aad3570d2f8e1c996",
-            "टोमॅटो (All variety / Irrigated / Kharif)": "66584d1c38c8ee5616ded55f",
-            "टोमॅटो (All variety / Rainfed / Kharif)": "66584d31dc15203bf3fb909d",
-            "टोमॅटो (All variety / Irrigated / Rabi)": "66584d7934c01f2d6337f121",
-            "गु्लछडी/निशिगंध (All Variety / Irrigated)": "6625fd44c986db5da828e492",
-            "हळद (all variety / Irrigated / Kharif)": "66acc6b6600b45d85d911659",
-            "हळद (all variety / Irrigated / Rabi)": "66baface8b7c4dc6524f190e",
-            "हळद (All Variety)": "6625fd45c986db5da828e4c8",
-            "उडीद (all variety / Rainfed / Kharif)": "66ab3440088102326cabb02e",
-            "उडीद (Rainfed / Pre-kharif)": "66bf19e124ced6ac1e1bee0b",
-            "उडीद (Irrigated / Pre-kharif)": "66bf19d2f211445faf599a7c",
-            "उडीद (All variety / Irrigated / Rabi)": "663dd70151175b825964d440",
-            "उडीद (Irrigated / Kharif)": "66a8b62313dce115e24edfca",
-            "कलींगड/टरबुज (All Variety)": "6625fd49c986db5da828e5de",
-            "गहू (All variety / Irrigated / Rabi)": "66542df3d9edc2014a6addc9",
-            "गहू (All variety / Rainfed / Rabi)": "663c6cddf47f3c93edb27520"
-        },
-        "63f870acd2e83876f03f0b46": {
-            "Rice (Hybrid / Rainfed / Kharif)": "667d50dea79149c866c29a1f"
-        },
-        "63f87562d2e83876f03f7a2c": {
-            "Arecanut (All Variety / Rainfed / Annual Crop)": "6625fcb1c986db5da828c1ea",
-            "Ash Gourd (All Variety / Rainfed / Kharif)": "6625fcc0c986db5da828c5a2",
-            "Banana (All Variety / Rainfed / Annual Crop)": "6625fcb6c986db5da828c311",
-            "Betelvine (All Variety / Rainfed / Annual Crop)": "6625fcbcc986db5da828c498",
-            "Bitter Gourd (All Variety / Rainfed / Kharif)": "6625fcbec986db5da828c4e5",
-            "Black Pepper (All Variety / Rainfed / Rabi)": "6625fcc0c986db5da828c57c",
-            "Brinjal (All Variety / Rainfed / Kharif)": "6625fcc2c986db5da828c5ed",
-            "Broccoli (All variety / Rainfed / Rabi)": "66f1448bf0d309b573d9d060",
-            "Cabbage (All Variety / Rainfed / Rabi)": "6625fcc6c986db5da828c6e3",
-            "Capsicum (All variety / Rainfed / Kharif)": "66ebb44f55de6f346ee4cfe4",
-            "Carrot (All Variety / Rainfed / Rabi)": "6625fcc8c986db5da828c75e",
-            "Cauliflower (All Variety / Rainfed / Rabi)": "6625fcc9c986db5da828c7bb",
-            "Chilli (All Variety / Rainfed / Kharif)": "6625fccec986db5da828c8dc",
-            "Cluster Bean (All Variety / Rainfed / Kharif)": "6625fcbac986db5da828c3e3",
-            "Coffee (All Variety / Rainfed / Rabi)": "6625fcd9c986db5da828cb56",
-            "Coriander (All Variety / Rainfed / Annual Crop)": "6625fcdbc986db5da828cbaa",
-            "Cucumber (All Variety / Rainfed / Pre-kharif)": "6625fcdfc986db5da828ccc1",
-            "Finger Millet (All Variety / Rainfed / Kharif)": "6625fd0dc986db5da828d6e0",
-            "Garlic (All Variety / Rainfed / Kharif)": "6625fce6c986db5da828ce3f",
-            "Ginger (All Variety / Rainfed / Kharif)": "6625fce8c986db5da828cea0",
-            "Groundnut (Rainfed / Kharif)": "6989708c48a20ef990bd58e9",
-            "Indian Mustard (All Variety / Rainfed / Rabi)": "6625fd10c986db5da828d76d",
-            "Jackfruit (All Variety / Rainfed / Kharif)": "6625fcf4c986db5da828d166",
-            "Jute (All Variety / Rainfed / Annual Crop)": "6625fcf7c986db5da828d224",
-            "Lemon (All Variety / Rainfed / Kharif)": "6625fcfbc986db5da828d2d3",
-            "Lettuce (All Variety / Rainfed / Rabi)": "66f14850d908679f7a0ef879",
-            "Litchi (All Variety / Rainfed / Kharif)": "6625fd01c986db5da828d409",
-            "Maize (All Variety / Rainfed / Kharif)": "6625fd04c986db5da828d4db",
-            "Mandarin (Khasi Mandarin / Rainfed / Rabi)": "6632164979ed9cd8b80a7f82",
-            "Okra (All Variety / Rainfed / Kharif)": "6625fd15c986db5da828d898",
-            "Onion (All Variety / Rainfed / Kharif)": "6625fd15c986db5da828d8b0",
-            "Papaya (All Variety / Rainfed / Annual Crop)": "6625fd1ec986db5da828db4b",
-            "Pea (All Variety / Rainfed / Kharif)": "6625fd20c986db5da828db93",
-            "Pear (All Variety / Rainfed / Annual Crop)": "6625fd20c986db5da828dbad",
-            "Pineapple (All Variety / Rainfed / Annual Crop)": "6625fd24c986db5da828dc99",
-            "Potato (All Variety / Rainfed / Kharif)": "6625fd27c986db5da828dd38",
-            "Pumpkin (All Variety / Rainfed / Kharif)": "6625fd29c986db5da828dda4",
-            "Radish (All Variety / Rainfed / Kharif)": "6625fd2ac986db5da828de10",
-            "Rice (HYV / Rainfed / Kharif)": "6625fcf3c986db5da828d123",
-            "Rice (Hybrid / Rainfed / Kharif)": "6625fcf3c986db5da828d115",
-            "Rubber (All Variety / Rainfed / Annual Crop)": "6625fd2fc986db5da828df44",
-            "Sesame (All Variety / Rainfed / Kharif)": "6625fd33c986db5da828e048",
-            "Soybean (Soybean  / Rainfed / Kharif)": "6986b4a32d2a3c8078cc933a",
-            "Soybean (Rainfed / Kharif)": "69877791b69b6b7fba586e43",
-            "Spinach (All Variety / Rainfed / Rabi)": "6625fd38c986db5da828e173",
-            "Strawberry (All variety / Irrigated / Annual Crop)": "663217a679ed9cd8b80ac85e",
-            "Sweet Orange (All Variety / Rainfed / Kharif)": "6625fd16c986db5da828d90a",
-            "Tapioca (All Variety / Rainfed / Annual Crop)": "6625fd40c986db5da828e369",
-            "Tea (All Variety / Rainfed / Annual Crop)": "6625fd41c986db5da828e3b3",
-            "Tetraploid Cotton (All Variety)": "6625fcdbc986db5da828cbd6",
-            "Tomato (All Variety / Rainfed / Kharif)": "6625fd43c986db5da828e42c",
-            "Turmeric (All Variety / Rainfed / Kharif)": "6625fd44c986db5da828e49e",
-            "Turnips (All Variety / Rainfed / Kharif)": "66f147f507f796b0430e3496",
-            "Wheat (All Variety)": "6625fd4ac986db5da828e620"
-        },
-        "63f873e5d2e83876f03f573a": {
-            "Arecanut (All Variety)": "6625fcb2c986db5da828c1ff",
-            "Banana (All Variety)": "6625fcb7c986db5da828c31e",
-            "Bitter Gourd (All Variety)": "6625fcbec986db5da828c4eb",
-            "Brinjal (All Variety)": "6625fcc2c986db5da828c5e7",
-            "Cabbage (All Variety)": "6625fcc5c986db5da828c6b3",
-            "Cauliflower (All Variety)": "6625fccac986db5da828c7fd",
-            "Chickpea (All Variety)": "6625fccbc986db5da828c83f",
-            "Chilli (All Variety)": "6625fccec986db5da828c8e9",
-            "Chow Chow (All Variety)": "6625fcd0c986db5da828c956",
-            "Cowpea (All Variety)": "6625fcdec986db5da828cc77",
-            "Cucumber (All Variety)": "6625fce0c986db5da828ccd3",
-            "Dragon Fruit (All Variety)": "6625fce3c986db5da828cda3",
-            "Finger Millet (All Variety)": "6625fd0dc986db5da828d6da",
-            "Ginger (All Variety)": "6625fce8c986db5da828ceb9",
-            "Guava (All Variety)": "6625fcefc986db5da828d076",
-            "Lemon (All Variety / Rabi)": "6625fcb5c986db5da828c2b0",
-            "Lentil (All Variety)": "6625fcfec986db5da828d37e",
-            "Maize (HYV)": "6625fd03c986db5da828d49c",
-            "Mango (All Variety)": "6625fd07c986db5da828d58f",
-            "Oil Palm (Hybrid)": "6625fd13c986db5da828d831",
-            "Okra (All Variety)": "6625fd15c986db5da828d892",
-            "Onion (All Variety)": "6625fd16c986db5da828d8e0",
-            "Papaya (All Variety)": "6625fd1ec986db5da828db3f",
-            "Pea (All Variety)": "6625fd1fc986db5da828db81",
-            "Pigeon Pea (All Variety)": "6625fcb4c986db5da828c260",
-            "Pineapple (Rainfed / Kharif)": "662f57dbeddb05acaeb0bc35",
-            "Potato (All Variety)": "6625fd27c986db5da828dd4a",
-            "Pumpkin (Rainfed / Kharif)": "662f587e9f5b637024d420e5",
-            "Rapeseed (Rainfed / Rabi)": "662f5561fb33a39527656bc1",
-            "Rice (All Variety)": "6625fd1bc986db5da828da3d",
-            "Rice (bean)": "6625fd2dc986db5da828dec5",
-            "Sesame (All Variety)": "6625fd34c986db5da828e06c",
-            "Sorghum (All Variety)": "6625fd36c986db5da828e0db",
-            "Soybean (HYV/ Hybrid)": "6625fd37c986db5da828e10b",
-            "Sugarcane (All Variety)": "6625fd3ac986db5da828e1da",
-            "Sweet Orange (Khasi Mandarin)": "6625fd16c986db5da828d917",
-            "Tomato (All Variety)": "6625fd43c986db5da828e426",
-            "Turmeric (All Variety)": "6625fd44c986db5da828e4b6",
-            "Watermelon (All Variety)": "6625fd49c986db5da828e5cc"
-        },
-        "63f86f4dd2e83876f03eea29": {},
-        "63f8bb7b36497c055ce5624b": {
-            "Avarekalu (RUNNER BEAN(RABI) / Irrigated / Rabi)": "66b5b1675396b632426416d4",
-            "Avarekalu (RUNNER BEAN(KHARIF) / Irrigated / Kharif)": "66b5b14c05f96e8242eef137",
-            "ବିଟ୍   (BEET / Irrigated / Annual Crop)": "66b1eac097ed547d8dfb8383",
-            "ପାନ \t (BETELVINE / Irrigated / Annual Crop)": "66b09bd2066e74bc772f445c",
-            "Bhatt (FRENCH BEAN(ଫରାସୀ ଶିମ୍ବ ) / Irrigated / Annual Crop)": "66b5b1d99b1620ec1728eaff",
-            "କଲରା  (OPV / Irrigated / Annual Crop)": "66b1dbd9d9d25a760fdc2161",
-            "କଲରା  (HYBRID / Irrigated / Annual Crop)": "66b1dbf878427c14fd004167",
-            "ଲାଉ  (SMALL GOURD(ଛୋଟ ଲୌକି) / Irrigated / Annual Crop)": "66b1dd4afe9d6e9cee3838f0",
-            "ବାଇଗଣ  (RABI-HYBRID / Irrigated / Rabi)": "66b09d3afe9d6e9cee17cbef",
-            "ବାଇଗଣ  (KHARIF-OPV / Irrigated / Kharif)": "66b09c2878427c14fddfaf1b",
-            "ବାଇଗଣ  (RABI-OPV / Irrigated / Rabi)": "66b09d22f7fa5723d2470f58",
-            "ବାଇଗଣ  (KHARIF-HYBRID / Irrigated / Kharif)": "66b09c95d9d25a760fbb083a",
-            "ବନ୍ଧାକୋବି  (CABBAGE / Irrigated / Rabi)": "66b1e755066e74bc775520d0",
-            "Capsicum (HYBRID / Irrigated / Annual Crop)": "66b1e9efffef4aef8945ba1f",
-            "Capsicum (ସବଜି ଲଙ୍କା / Irrigated / Annual Crop)": "66b1e9d9502b111df7c45d05",
-            "ଗାଜର  (CARROT / Irrigated / Annual Crop)": "66b1eaaa066e74bc7755f47a",
-            "ଜଡା  (CASTOR / Irrigated / Annual Crop)": "66ae1b8398d686dbf0ffe91e",
-            "ଫୁଲକୋବି  (CAULIFLOWER / Irrigated / Rabi)": "66b1e698a063870f1a9a6ff5",
-            "କାବୁଲି ବୁଟ  ((GRAM)(CHANA/GRAM) / Irrigated / Annual Crop)": "66ae12745479c5daf6dcd103",
-            "ଲଙ୍କା  (RABI / Irrigated / Rabi)": "66b09f85ffef4aef89238caf",
-            "ଲଙ୍କା  (KHARIF / Irrigated / Kharif)": "66b09f75066e74bc772ff9b1",
-            "ସେବତୀ \t (CRYSANTHEMUM / Irrigated / Annual Crop)": "66b1ec89f7fa5723d26b9f09",
-            "ଝୁଡଙ୍ଗ \t (COWPEA / Irrigated / Annual Crop)": "66b1da8da063870f1a97d5a7",
-            "ଅଁଳେଇ ଫୁଲ  (CROSSANDRA / Irrigated / Annual Crop)": "66b1eb9df7fa5723d26b6777",
-            "କାକୁଡି  (OPV / Irrigated / Annual Crop)": "66b1db9af7fa5723d267776a",
-            "କାକୁଡି  (HYBRID / Irrigated / Annual Crop)": "66b1dbc362360e63de361b4e",
-            "ତୁଳ।  (COTTON(HYBRID)(କପା) / Irrigated / Annual Crop)": "66b0777362360e63de076d5b",
-            "ତୁଳ।  (COTTON(HYV)(କପା) / Irrigated / Annual Crop)": "66b0778aa27591badcc3d5db",
-            "ମାଣ୍ଡିଆ  (RAGI(TRANSPLANTED) / Irrigated / Annual Crop)": "66add60b007a5b5d59fd8997",
-            "ମାଣ୍ଡିଆ  (RAGI(DIRECT SOWN-EARLY DURATION(<100 DAYS)) / Irrigated / Annual Crop)": "66add6e54de7e7dd5f7936b2",
-            "ମାଣ୍ଡିଆ  (RAGI(DIRECT SOWN-MEDIUM DURATION(>100 DAYS)) / Irrigated / Annual Crop)": "66add759893fc7afc6cf415d",
-            "କାଙ୍ଗୁ  (KANGU / Irrigated / Annual Crop)": "66addc51893fc7afc6d04cb8",
-            "ରସୁଣ  (GARLIC / Irrigated / Annual Crop)": "66b1eb5b502b111df7c4aec3",
-            "ଅଦା  (GINGER / Irrigated / Annual Crop)": "66b1eb2fffef4aef89460458",
-            "ଗ୍ଲାଡିଔଷ ଫୁଲ \t (GLADIOLUS / Irrigated / Annual Crop)": "66b1ebbc502b111df7c4c390",
-            "ଖଡା  (AMARANTHUS(ଖଡା ଶାଗ) / Irrigated / Annual Crop)": "66b1ea4effef4aef8945d2fc",
-            "ମାଟିଆଳୁ \t (YAM(ଖମ୍ବ ଆଳୁ) / Irrigated / Annual Crop)": "66b1d981502b111df7c032f6",
-            "ଚିନାବାଦାମ  (GROUNDNUT / Irrigated / Annual Crop)": "66ae1ae2600b45d85dac41c5",
-            "ମଟର ଚଣା  (କୋଳଥ / Irrigated / Annual Crop)": "66ae0ab716e18b48aaa16c03",
-            "ସୋରିଷ  (MUSTARD(RAINFED) / Rainfed / Rabi)": "66ae1c1847e320daf40c55c1",
-            "ସୋରିଷ  (YELLOW SARSON / Irrigated / Rabi)": "66ae1e325479c5daf6dde4e5",
-            "ସୋରିଷ  (MUSTARD(IRRIGATED) / Irrigated / Rabi)": "66ae1bea007a5b5d5909babc",
-            "ଝୋଟ  (IRRIGATED / Irrigated / Annual Crop)": "66ae1efb600b45d85dac91a3",
-            "ଝୋଟ  (RAINFED / Rainfed / Annual Crop)": "66ae1ee64de7e7dd5f858841",
-            "Kidney Beans (RAJMA(ରାଜମା) / Irrigated / Annual Crop)": "66bf0f2824ced6ac1e194405",
-            "Kodo Millet (KODO MILLET / Irrigated / Annual Crop)": "66b206c4f7fa5723d27251c5",
-            "Kohlrabi (KNOLKHOL / Irrigated / Rabi)": "66b1e91cffef4aef89457f41",
-            "ପେଶୀ  (LINSEED / Irrigated / Annual Crop)": "66ae1ec77d602028fd8acc24",
-            "ସୁଆଁ  (SUAN / Irrigated / Annual Crop)": "66add8af5479c5daf6d2132e",
-            "ମକ୍କା  (SWEET CORN / Irrigated / Annual Crop)": "66adcdf3bc3afe222d016c04",
-            "ମକ୍କା  (HYV / Irrigated / Annual Crop)": "66adcd55893fc7afc6ccac5f",
-            "ମକ୍କା  (QUALITY PROTEIN MAIZE (QPM) / Irrigated / Annual Crop)": "66adcdc75479c5daf6cf927d",
-            "ମକ୍କା  (HYBRID / Irrigated / Annual Crop)": "66adcd4116e18b48aa956b31",
-            "ମକ୍କା  (BABY CORN / Irrigated / Annual Crop)": "66adce1a7d602028fd7c5a5a",
-            "ଗେଣ୍ଡୁ \t (MARIGOLD / Irrigated / Annual Crop)": "66b1eb75fe9d6e9cee3b8641",
-            "ଛଣି ଜାତୀୟ \t (MESTA / Irrigated / Annual Crop)": "66b07656ffef4aef89199488",
-            "ମସୁର  (LENTIL(ମସୁର) / Irrigated / Annual Crop)": "66ae135747e320daf40b81e1",
-            "କାନ୍ଦୁଲ  (GREENGRAM(ମୁଗ) / Irrigated / Annual Crop)": "66b5b018a12ea87890b591ac",
-            "ଅଳସୀ  (NIGER / Irrigated / Annual Crop)": "66ae1b9abc3afe222d0e194b",
-            "ଭେଣ୍ଡି  (KHARIF / Irrigated / Kharif)": "66b1dac162360e63de35dca0",
-            "ଭେଣ୍ଡି  (RABI / Irrigated / Rabi)": "66b1dad662360e63de35e25f",
-            "ପିଆଜ  (KHARIF / Irrigated / Kharif)": "66b0a1cf502b111df7a0afb5",
-            "ପିଆଜ  (RABI / Irrigated / Rabi)": "66b0a1edf7fa5723d248a9f3",
-            "Pea (ମଟର / Irrigated / Annual Crop)": "66ae0c3f47e320daf40ac2db",
-            "Pea (GARDEN PEAN(ଗ୍ରୀନ ମଟର) / Irrigated / Annual Crop)": "66b1e98ba063870f1a9b3033",
-            "ହରଡ  (RED GRAM(ARHAR) / Irrigated / Annual Crop)": "66adff8616e18b48aa9fab18",
-            "ପୋଟଳ \t (POINTED GOURD / Irrigated / Annual Crop)": "66b1e669a063870f1a9a614d",
-            "ଆଳୁ  (POTATO / Irrigated / Annual Crop)": "66b1e682fe9d6e9cee3a3418",
-            "ଚୀନା   (CHEENA / Irrigated / Annual Crop)": "66add987893fc7afc6cfb614",
-            "କଖାରୁ  (RABI / Irrigated / Rabi)": "66b1db5b066e74bc7751d4a6",
-            "କଖାରୁ  (KHARIF / Irrigated / Kharif)": "66b1db3b97ed547d8df74ba3",
-            "ମୂଳା  (RADISH / Irrigated / Rabi)": "66b0a20d502b111df7a0c14f",
-            "ସୋରିଷ  (TORIA(IRRIGATED) / Irrigated / Rabi)": "66ae1ca1600b45d85dac6216",
-            "ସୋରିଷ  (TORIA(RAINFED) / Rainfed / Rabi)": "66ae1dcb16e18b48aaa36006",
-            "ଧାନ  (MEDIUM LAND-IMPROVED / Irrigated / Annual Crop)": "66adcba74de7e7dd5f76b957",
-            "ଧାନ  (HYBRID / Irrigated / Annual Crop)": "66adcce798d686dbf0f24d42",
-            "ଧାନ  (MEDIUM LAND-HYV / Irrigated / Annual Crop)": "66adcc08600b45d85d9e0f42",
-            "ଧାନ  (LOW LAND-LOCAL / Irrigated / Annual Crop)": "66adcc9247e320daf4ff7d25",
-            "ଧାନ  (UPLAND-HYV / Irrigated / Annual Crop)": "66adcb8316e18b48aa95098c",
-            "ଧାନ  (MEDIUM LAND-LOCAL / Irrigated / Annual Crop)": "66adcbc847e320daf4ff5023",
-            "ଧାନ  (LOW LAND-HYV / Irrigated / Annual Crop)": "66adcca8007a5b5d59fb468c",
-            "ଧାନ  (LOW LAND-IMPROVED / Irrigated / Annual Crop)": "66adcc275479c5daf6cf3f55",
-            "ଧାନ  (UPLAND-IMPROVED / Irrigated / Annual Crop)": "66adca0b7d602028fd7af9e3",
-            "ଧାନ  (UPLAND-LOCAL / Irrigated / Annual Crop)": "66adcb0f98d686dbf0f1e6fa",
-            "rice bean (red bean) (RICE BEAN / Irrigated / Annual Crop)": "66ae0125893fc7afc6d7417f",
-            "ଜହ୍ନି  (HYBRID / Irrigated / Annual Crop)": "66b1dc27ffef4aef89423eb5",
-            "ଜହ୍ନି  (OPV / Irrigated / Annual Crop)": "66b1dc0d62360e63de362a31",
-            "କୁସୁମୀ  (IRRIGATED / Irrigated / Annual Crop)": "66ae1ead16e18b48aaa36e1a",
-            "କୁସୁମୀ  (RAINFED / Rainfed / Annual Crop)": "66ae1e9947e320daf40c80ca",
-            "ରାଶି  (TIL(PRE RABI/SUMMER) / Irrigated / Rabi)": "66ae1b597d602028fd8a896a",
-            "ରାଶି  (TIL(KHARIF) / Irrigated / Kharif)": "66ae1b2f16e18b48aaa32bec",
-            "ଛଚିନ୍ଦ୍ରା \t (SNAKE GOURD / Irrigated / Annual Crop)": "66b1e650fe9d6e9cee3a23f8",
-            "ସୋୟା  (SOYABEAN / Irrigated / Annual Crop)": "66ae186247e320daf40c0412",
-            "spiny gourd / akakara/ bodakakara (SPINE GOURD(କାଙ୍କଡ) / Irrigated / Annual Crop)": "66b1dc92fe9d6e9cee380fe5",
-            "ଆଖୁ \t (SUGARCANE / Irrigated / Annual Crop)": "66b07d28d9d25a760fb38832",
-            "ସୂର୍ଯ୍ୟ ମୁଖୀ  (HYV / Irrigated / Annual Crop)": "66ae1e7c16e18b48aaa36a3e",
-            "ସୂର୍ଯ୍ୟ ମୁଖୀ  (HYBRID / Irrigated / Annual Crop)": "66ae1e4e7d602028fd8ac6f4",
-            "କନ୍ଦମୂଳ \t (SWEET POTATO / Irrigated / Annual Crop)": "66b1db23502b111df7c0a489",
-            "ବିଲାତି  (RABI-HYBRID / Irrigated / Rabi)": "66b0a1b1fe9d6e9cee190c95",
-            "ବିଲାତି  (RABI-OPV / Irrigated / Rabi)": "66b0a192066e74bc77308235",
-            "ବିଲାତି  (KHARIF-OPV / Irrigated / Kharif)": "66b0a148066e74bc773071b0",
-            "ବିଲାତି  (KHARIF-HYBRID / Irrigated / Kharif)": "66b0a166ffef4aef8923fcaa",
-            "ରଜନୀଗନ୍ଧା \t (TUBEROSE / Irrigated / Annual Crop)": "66b1eb88f7fa5723d26b62a6",
-            "ହଳଦୀ  (TURMERIC / Irrigated / Annual Crop)": "66b1eb46a063870f1a9b9bc6",
-            "Turnips (ଟରନିପି / Irrigated / Annual Crop)": "66b1eaeefe9d6e9cee3b6497",
-            "ବିରି  (BLACKGRAM(ବିରି) / Irrigated / Annual Crop)": "66adfcf598d686dbf0fb7b12",
-            "ଗହମ  (FOR COASTAL DISTRICTS / Irrigated / Rabi)": "66adddc3007a5b5d59ff1012",
-            "ଗହମ  (FOR HIRAKUD COMMAND AREAS / Irrigated / Rabi)": "66adddf64de7e7dd5f7a9157",
-            "ଗହମ  (FOR INLAND DISTRICTS / Irrigated / Rabi)": "66addd9698d686dbf0f5d562",
-            "ଗହମ  (FOR KORAPUT DISTRICT / Irrigated / Rabi)": "66ade0aa98d686dbf0f6950d"
-        },
-        "63f9ce2c519359b7438e746d": {
-            "Acid Lime (Irrigated / Annual Crop)": "67befcb5135dca60fd8a32a2",
-            "Alfalfa (Lucerne/Kudiraimasal / Irrigated / Annual Crop)": "67befe0ab94f32d2ef8c14ad",
-            "Arecanut (Irrigated / Annual Crop)": "6625fcb3c986db5da828c24c",
-            "Arecanut (WCT / Irrigated / Annual Crop)": "6625fcb4c986db5da828c253",
-            "Ash Gourd (Hybrid / Irrigated / Kharif)": "67befb2069420221380a4464",
-            "Banana (Irrigated / Annual Crop)": "668bdc5457fede45cbd76115",
-            "Banana (-Nendran (Garden Land) / Irrigated / Annual Crop)": "67befcd87e74be3d185189bd",
-            "Banana (-Poovan, Robusta (Wetland) / Irrigated / Annual Crop)": "67befd1d4c94dd3377fba24b",
-            "Banana (Other Varieties / Irrigated / Annual Crop)": "67befd374c94dd3377fba57b",
-            "Banana (-Rasthali, Nendran (Wetland) / Irrigated / Annual Crop)": "67befcf88cfa6bbecbbb4f55",
-            "Barnyard Millet (Kudhiraivali / Irrigated / Kharif)": "67bead118cfa6bbecbb4f091",
-            "Betelvine (Irrigated / Annual Crop)": "67beed00b94f32d2ef8ad2dd",
-            "Bitter Gourd (Variety / Irrigated / Kharif)": "67befb79bcebf0957030ea00",
-            "Bitter Gourd (Hybrid / Irrigated / Kharif)": "67befb6d135dca60fd8a1a9d",
-            "Black Pepper (Irrigated / Annual Crop)": "67beea3f8cfa6bbecbb9e65b",
-            "Bottle Gourd (Variety / Irrigated / Kharif)": "67befb624c94dd3377fb80dd",
-            "Bottle Gourd (Hybrid / Irrigated / Kharif)": "67befb338cfa6bbecbbb2c28",
-            "Brinjal ((Variety) / Irrigated / Kharif)": "67befab04c94dd3377fb762b",
-            "Brinjal ((Hybrid) / Irrigated / Kharif)": "67befaa369420221380a3889",
-            "Cabbage (Plains / Irrigated / Rabi)": "67bef3a67cdfbc3c2ae33fbb",
-            "Cashew (Irrigated / Annual Crop)": "668e94f502997d3b2a695735",
-            "Casurina (Irrigated / Annual Crop)": "668e950d02997d3b2a695790",
-            "Cauliflower (Plains / Irrigated / Rabi)": "67bef3974c94dd3377faf9f4",
-            "Chilli (Variety / Irrigated / Kharif)": "67befc00b94f32d2ef8be564",
-            "Chilli (Hybrid / Irrigated / Kharif)": "67befbef7cdfbc3c2ae3cfb1",
-            "Chow Chow (Irrigated / Kharif)": "67befb0d7e74be3d185166bb",
-            "Chrysanthemum (Irrigated / Annual Crop)": "67beefec6942022138096ba1",
-            "Cluster Bean (Irrigated / Rabi)": "67bef3eabcebf09570306344",
-            "Coconut (T x D Hybrid / Irrigated / Annual Crop)": "67bec06bbcebf095702c5901",
-            "Coconut (WCT)": "6625fcd9c986db5da828cb44",
-            "Coconut (ECT Tall / Irrigated / Annual Crop)": "6625fcd8c986db5da828cb07",
-            "Coriander (Irrigated / Rabi)": "67befc0de142dd44930d54ea",
-            "Cowpea (/Vegetable Cowpea / Irrigated / Rabi)": "67bef3d87cdfbc3c2ae341fa",
-            "Cowpea (Irrigated / Rabi)": "67beb18c6942022138046649",
-            "Cowpea (Fodder/Green manure / Irrigated / Rabi)": "6625fcedc986db5da828cfd5",
-            "Crossandra (Delhi Crossandra / Irrigated / Annual Crop)": "67bef00c8cfa6bbecbba5cff",
-            "Crossandra (Variety / Irrigated / Annual Crop)": "67bef59bbcebf09570307bf9",
-            "Cucumber (Hybrid / Irrigated / Rabi)": "67bef4771a24dc0f465a571b",
-            "Cucumber (Variety / Irrigated / Rabi)": "67bef488e142dd44930cccf2",
-            "Diploid Cotton (Cotton / Irrigated / Kharif)": "67bebd5de142dd4493089234",
-            "Elephant Foot Yam (Irrigated / Annual Crop)": "67bef34e1a24dc0f465a4573",
-            "Finger Millet (Ragi / Irrigated / Kharif)": "67beafc77e74be3d184b555c",
-            "Foxtail Millet (Thenai / Irrigated / Kharif)": "67beb1dd6942022138046a66",
-            "Ginger (Irrigated / Annual Crop)": "67beecce135dca60fd891294",
-            "Groundnut (Irrigated / Kharif)": "6625fcefc986db5da828d04b",
-            "Groundnut (Irrigated / Rabi)": "67beb1577e74be3d184b6e81",
-            "Guava (Irrigated / Annual Crop)": "67befc9cbcebf0957030fef4",
-            "Hedge Lucerne (Velimasal / Irrigated / Annual Crop)": "67befdc97cdfbc3c2ae3f48e",
-            "Indian Gooseberry (/Amla / Irrigated / Annual Crop)": "67befc4cbcebf0957030f850",
-            "Ivy Gourd (Coccinia / Irrigated / Kharif)": "67bef2e61a24dc0f465a3cff",
-            "Jasmine (Gundu Malli/Malligai / Irrigated / Annual Crop)": "67bef02cb94f32d2ef8b0f5a",
-            "Jasmine (Mullai / Irrigated / Annual Crop)": "67bef03f7cdfbc3c2ae2fafc",
-            "Kodo (Varagu / Irrigated / Kharif)": "67beacefbcebf095702a8ac2",
-            "Lemon (Irrigated / Annual Crop)": "67befca9135dca60fd8a3143",
-            "Little Millet (Samai / Irrigated / Kharif)": "67beaccc6942022138041278",
-            "Mahogany (and Other Forest Trees / Rainfed / Annual Crop)": "67beee9a4c94dd3377fa9f44",
-            "Maize (/Fodder Maize / Irrigated / Kharif)": "67befdadbcebf095703118df",
-            "Maize (Variety / Irrigated / Kharif)": "67bea7cf8cfa6bbecbb49a27",
-            "Maize (Hybrid / Irrigated / Kharif)": "67bea7bc1a24dc0f465454ea",
-            "Mango (6th year onwards / Irrigated / Annual Crop)": "67befc3869420221380a5a0e",
-            "Marigold (African Marigold / Irrigated / Annual Crop)": "67beefd78cfa6bbecbba599a",
-            "Moringa (/Annual Moringa / Irrigated / Annual Crop)": "67befafebcebf0957030e2af",
-            "Moth Bean (/French Beans (Bush Type) / Irrigated / Rabi)": "67bef6e8694202213809ea93",
-            "Mungbean (vbn3)": "6625fcedc986db5da828cfc9",
-            "Mungbean (vbn6)": "6625fcedc986db5da828cfcf",
-            "Mungbean (Green Gram / Irrigated / Rabi)": "6625fcecc986db5da828cfb7",
-            "Mungbean (c5)": "6625fcecc986db5da828cfbd",
-            "Muskmelon (Irrigated / Rabi)": "67befc22135dca60fd8a27de",
-            "Napier Grass (/Cumbu Napier Hybrid / Irrigated / Annual Crop)": "67befd7ae142dd44930d6d24",
-            "Nutmeg (15th year onwards / Irrigated / Annual Crop)": "67beea26694202213808f091",
-            "Okra (/Bhendi (Hybrid) / Irrigated / Kharif)": "67befa79b94f32d2ef8bc710",
-            "Okra (Bhendi (Variety) / Irrigated / Kharif)": "67befa927e74be3d18515e3c",
-            "Onion (/Small Onion / Irrigated / Rabi)": "67bef33c135dca60fd898e3d",
-            "Papaya (Irrigated / Annual Crop)": "67befc86e142dd44930d5d2c",
-            "Pearl Millet (Cumbu / Irrigated / Kharif)": "67beb0058cfa6bbecbb52343",
-            "Pigeon Pea (Red gram / Irrigated / Rabi)": "67beb23db94f32d2ef85f214",
-            "pipali; long pepper (Panniyur - 1)": "6625fd23c986db5da828dc50",
-            "Proso Millet (Panivaragu / Irrigated / Kharif)": "67beb0236942022138044c4e",
-            "Pumpkin (Hybrid / Irrigated / Kharif)": "67befba3e142dd44930d4d61",
-            "Pumpkin (Variety / Irrigated / Kharif)": "67befbae135dca60fd8a1ec3",
-            "Radish (Irrigated / Rabi)": "67bef384e142dd44930cc227",
-            "Rice (Kharif / Irrigated / Kharif)": "66d5a40027be0fc99d8fd046",
-            "Rice (Rabi 2 / Irrigated / Rabi)": "6625fcd9c986db5da828cb3e",
-            "Rice (SRI / Irrigated / Kharif)": "66d5a37d95843ad512949d50",
-            "Rice (Rabi 1 / Irrigated / Rabi)": "66d5a30cfe34d3349cf6c71a",
-            "Ridge Gourd (/Ribbed gourd / Irrigated / Kharif)": "67bef0a86942022138097af5",
-            "Rose (Hybrid / Irrigated / Annual Crop)": "67beed178cfa6bbecbba1bb2",
-            "Sapota (Irrigated / Annual Crop)": "67befc917e74be3d185183aa",
-            "Sesame (Gingelly / Irrigated / Rabi)": "67beb1267e74be3d184b6bfd",
-            "Snake Gourd (Hybrid / Irrigated / Kharif)": "67befb89bcebf0957030ec48",
-            "Snake Gourd (Variety / Irrigated / Kharif)": "67befb94e142dd44930d4c60",
-            "Sorghum (Cholam / Irrigated / Rabi)": "67beb04a1a24dc0f4654da30",
-            "Subabul (Rainfed / Annual Crop)": "67befe3cb94f32d2ef8c1964",
-            "Sugarcane (Irrigated / Annual Crop)": "6625fd39c986db5da828e1b1",
-            "Sweet Potato (Irrigated / Annual Crop)": "67bef372e142dd44930cc0a4",
-            "Sword Bean (Lab lab/ Dolichos beans/ Avarai / Irrigated / Rabi)": "67bef45f4c94dd3377fb087d",
-            "Tamarind (Rainfed / Annual Crop)": "67befd4f1a24dc0f465afc49",
-            "Tapioca (Irrigated / Annual Crop)": "6625fd40c986db5da828e394",
-            "Tetraploid Cotton (Cotton / Irrigated / Kharif)": "67bebd03135dca60fd855d7b",
-            "Tomato ((Variety) / Irrigated / Kharif)": "67befadf1a24dc0f465ad0d5",
-            "Tomato ((Hybrid) / Irrigated / Kharif)": "67beface69420221380a3c04",
-            "Tuberose (Irrigated / Annual Crop)": "67beed268cfa6bbecbba1dac",
-            "Turmeric (Irrigated / Annual Crop)": "6625fd45c986db5da828e4e6",
-            "Urdbean (Black gram / Irrigated / Rabi)": "6625fcbfc986db5da828c544",
-            "Urdbean (Blackgram / Irrigated / Kharif)": "6625fcbfc986db5da828c551"
-        },
-        "63f2495789e288769575a424": {},
-        "63f5cef58cec41e6c95ce84e": {
-            " kundroo       ": "6706437f69a7df0013a57515",
-            "aak, mudar": "670634d771fcaa001364a8ff",
-            "aakaash gadda": "67063f3969a7df0013a52bc9",
-            "aakash neem": "6706442769a7df0013a58622",
-            "adenium, desert rose": "670634ed71fcaa001364a946",
-            "adusa": "67063b4aa5755e0013d798d0",
-            "agave (century plant)": "670634fb71fcaa001364a98f",
-            "ajgar bel , pilwan": "67063fb669a7df0013a52f44",
-            "aldu, mahrukh": "6706443269a7df0013a5878d",
-            "allamanda pink": "67063fd469a7df0013a53074",
-            "aloevera gwarpaatha": "6706351071fcaa001364a9da",
-            "alternanthera brown ": "6706352171fcaa001364aa27",
-            "amaltas": "6706443c69a7df0013a588f0",
-            "amarbel": "67063fe369a7df0013a531a1",
-            "amrul, wood sorel": "6706358271fcaa001364aa76",
-            "anjan": "6706444569a7df0013a58a58",
-            "ankol": "6706445f69a7df0013a58bbf",
-            "apamarg, aandhijhara": "670635a471fcaa001364aac7",
-            "aprajita": "67063ff369a7df0013a532d0",
-            "arand costor ": "67063b5ca5755e0013d799a3",
-            "arjun": "6706446c69a7df0013a58d28",
-            "ashwagandha": "67063b6ba5755e0013d79a78",
-            "azgarbel,महामूल": "6706404169a7df0013a53411",
-            "bada gokhru": "670635b471fcaa001364ab1a",
-            "bahera": "6706447669a7df0013a58e93",
-            "bakayan, china berry": "6706448369a7df0013a594ab",
-            "balam kheera, sausage tree": "6706453869a7df0013a59ad1",
-            "ban tulsi kala bhangra": "670635c371fcaa001364ab71",
-            "bargad": "6706454169a7df0013a59c42",
-            "जौ ( all variety / Irrigated / Rabi)": "66430b5c1e12e93837a29b4a",
-            "bathua": "670635d171fcaa001364abc8",
-            "bda baraira": "67063b7ba5755e0013d79b4f",
-            "beel tree ": "6706454d69a7df0013a59db5",
-            "behaya, besharam": "670642cb69a7df0013a560ac",
-            "bengal day flower bokha": "670635e071fcaa001364ac21",
-            "ber": "6706455e69a7df0013a59f2a",
-            "bhakar biyani rock tephrosia ": "670635f071fcaa001364ac7f",
-            "bharunt": "6706318371fcaa00136496ce",
-            "bhongta grass": "670632a571fcaa001364a286",
-            "bhumi aaunla": "6706360171fcaa001364ace5",
-            "bignonia": "670642d769a7df0013a561e3",
-            "bottle brush": "6706456869a7df0013a5a0a1",
-            "bougainvillea, greater bougainvillea ": "670642e369a7df0013a56322",
-            "bougainvillea, paper flower ": "670642ee69a7df0013a5645d",
-            "brassaia tree": "6706457569a7df0013a5a21a",
-            "buddha belly": "670632b571fcaa001364a29f",
-            "bui, kapok bush": "67063b8fa5755e0013d79c28",
-            "calliandra powder puff": "67063c5ba5755e0013d79ee5",
-            "cat claw creeper": "670642fc69a7df0013a5659a",
-            "ceylon iron wood": "6706458169a7df0013a5a395",
-            "chamror": "6706458b69a7df0013a5a512",
-            "chandan": "6706459769a7df0013a5a69f",
-            "chandni": "67063c69a5755e0013d79fc2",
-            "cheekoo": "670645a369a7df0013a5a85e",
-            "चना ( all variety / Irrigated / Rabi)": "664316401e12e93837abe594",
-            "chikti burrbuss": "6706361371fcaa001364ad70",
-            "chir / chilgoza": "670645ad69a7df0013a5a9e1",
-            "chirmi": "6706430769a7df0013a566d9",
-            "chirpotan ": "6706362471fcaa001364adda",
-            "chonch": "6706363571fcaa001364ae4b",
-            "chota dhatura ": "6706364471fcaa001364aebe",
-            "chota gokhru": "67063662e0b7ad00133b5d14",
-            "christmas tree": "670645ba69a7df0013a5b00a",
-            "churel, bandar baati": "670645c669a7df0013a5b1ca",
-            "clerodendrum": "67063c79a5755e0013d7a0a4",
-            "क्लस्टर बीन ( all variety / Rainfed / Kharif)": "66430813a33a0f41daa05655",
-            "coffee senna": "67063c86a5755e0013d7a185",
-            "coloured agave": "6706367ee0b7ad00133b63c0",
-            "धनिया ( all variety / Irrigated / Rabi)": "664315891e12e93837ab83f3",
-            "धनिया ( all variety / Rainfed / Rabi)": "664315a1a33a0f41dab04afa",
-            "croton ": "670636e8e0b7ad00133b6447",
-            "curry leaf": "670645d369a7df0013a5b384",
-            "daab": "670632c871fcaa001364a2c3",
-            "datura": "67063713e0b7ad00133b64e5",
-            "deshi babool": "670645df69a7df0013a5b50f",
-            "dhaman grass kala": "670632db71fcaa001364a2fa",
-            "dhaman grass safed": "670632eb71fcaa001364a32e",
-            "dhok": "670645eb69a7df0013a5b69c",
-            "din ka raja": "67063c97a5755e0013d7a268",
-            "diya baati bel": "6706431269a7df0013a5681a",
-            "doob": "6706330871fcaa001364a36c",
-            "dudhi": "67063724e0b7ad00133b6557",
-            "false agave": "67063ca5a5755e0013d7a35e",
-            "fang/ guar kakdi": "6706431c69a7df0013a56960",
-            "feather fingergrass": "6706331771fcaa001364a38f",
-            "fire bush, hamelia ": "67063cc1a5755e0013d7a448",
-            "five finger leaf climber": "6706432869a7df0013a56aa5",
-            "forest burr": "67063731e0b7ad00133b65cb",
-            "gajar grass": "6706373fe0b7ad00133b6644",
-            "लहसुन ( all variety / Irrigated / Rabi)": "664315b71e12e93837ab9fb4",
-            "ghoda doob": "6706332771fcaa001364a3b4",
-            "giant al         giant cabuya": "67063759e0b7ad00133b66b9",
-            "giloy": "6706433169a7df0013a56bec",
-            "golden duranta": "67063cd1a5755e0013d7a531",
-            "goya khair": "670645f469a7df0013a5b82b",
-            "मूंगफली ( all variety / Irrigated / Kharif)": "66430b201e12e93837a27154",
-            "gudal": "67063ce1a5755e0013d7a61c",
-            "gulmohar": "670645fd69a7df0013a5b9ed",
-            "gultura ": "67063cf0a5755e0013d7a709",
-            "gundi": "6706460969a7df0013a5bb8a",
-            "haar shringar, parijat": "67063d03a5755e0013d7a7f8",
-            "hadjod": "6706433e69a7df0013a56d35",
-            "harshringar, parijaat": "6706461769a7df0013a5bd20",
-            "hemkand": "6706434a69a7df0013a56e80",
-            "hinsa jaal/ kanthari": "67063d14a5755e0013d7a8e9",
-            "horn fruited jute": "67063768e0b7ad00133b6730",
-            "hul-hul, bagra ": "67063d5a69a7df0013a50ebd",
-            "hulhul, bagra": "6706377be0b7ad00133b67a9",
-            "indian comet grass": "6706333771fcaa001364a3e4",
-            "भारतीय सरसों ( all variety / Rainfed / Rabi)": "66430b89a33a0f41daa43180",
-            "भारतीय सरसों ( all variety / Irrigated / Rabi)": "66430b7342b79738d9b9e7d3",
-            "indian shot canna": "6706378be0b7ad00133b6824",
-            "israeli babool": "6706462a69a7df0013a5c761",
-            "jamalgota": "67063d6969a7df0013a50fb2",
-            "jamun": "670646ae69a7df0013a5d1e6",
-            "jangal jalebi": "670646bd69a7df0013a5d381",
-            "jatropa / ratanjot": "67063d7969a7df0013a510a9",
-            "jatropa peregrina": "67063d8969a7df0013a511a2",
-            "jatropha red": "67063d9b69a7df0013a5129d",
-            "jhad ber": "67063dab69a7df0013a513ab",
-            "jhinjha": "670646c769a7df0013a5d51e",
-            "jirio,junglr rice": "6706335471fcaa001364a414",
-            "jojharu": "670637abe0b7ad00133b68b5",
-            "juhi": "6706435669a7df0013a56fcd",
-            "jungli bhindi": "670637bde0b7ad00133b6934",
-            "jungli chanlayi": "670637cde0b7ad00133b69b5",
-            "jungli mooli": "670637dae0b7ad00133b6a38",
-            "jungli pyaaj, coli kaandaa": "670637f4e0b7ad00133b6ac9",
-            "jungli surajmukhi": "67063802e0b7ad00133b6b51",
-            "jungli tulsi": "67063812e0b7ad00133b6bda",
-            "kaala siris": "670646d169a7df0013a5d6bd",
-            "kadaya": "670646dd69a7df0013a5d85e",
-            "kair/teent": "67063ddf69a7df0013a514ad",
-            "kakeda": "670646e769a7df0013a5da01",
-            "kakjangha": "67063854e0b7ad00133b6c65",
-            "kalihari": "6706435f69a7df0013a5711c",
-            "kalonchoe": "67063863e0b7ad00133b6cfe",
-            "kanghi": "67063874e0b7ad00133b6d99",
-            "kangi": "67063ded69a7df0013a515ae",
-            "kanteli": "67063884e0b7ad00133b6e5c",
-            "karanj": "670646f069a7df0013a5dbcb",
-            "karonda": "67063dfe69a7df0013a516b4",
-            "kat karanj": "6706436b69a7df0013a5726d",
-            "kat sagwan": "670646fa69a7df0013a5dd86",
-            "kheer kheemp": "6706437469a7df0013a573c0",
-            "khejri": "6706470369a7df0013a5df2f",
-            "khirni": "6706471069a7df0013a5e0fa",
-            "khirni(mimisop hexandra)": "6706474069a7df0013a5e2a7",
-            "khjoor": "67063894e0b7ad00133b6eef",
-            "kuppikhokhli": "670638a2e0b7ad00133b6f84",
-            "laapla ": "6706336e71fcaa001364a472",
-            "laathi baans": "6706338071fcaa001364a49f",
-            "laghu dudhi": "670638b4e0b7ad00133b713a",
-            "lantana": "67063e0f69a7df0013a517c7",
-            "lemon grass": "6706338f71fcaa001364a4fb",
-            "lemon tree": "6706475069a7df0013a5e456",
-            "lisoda": "6706475d69a7df0013a5e607",
-            "love grass": "670633bd71fcaa001364a53b",
-            "luniya": "670638c7e0b7ad00133b7414",
-            "maal kaangani": "6706438b69a7df0013a5766f",
-            "magregrass,green foxtail": "670633f271fcaa001364a56e",
-            "मक्का ( all variety / Rainfed / Kharif)": "664308661e12e938379efe3d",
-            "मक्का ( all variety / Irrigated / Rabi)": "664309a01e12e93837a0670c",
-            "makda": "6706340271fcaa001364a5a3",
-            "makoy": "670638d6e0b7ad00133b74da",
-            "mango, aam tree": "6706476b69a7df0013a5e7ba",
-            "mehandi, henna": "67063e2069a7df0013a518d1",
-            "menda singi, gadaria ki bel": "6706439769a7df0013a577cd",
-            "midnight horror, sheonaak": "670647b069a7df0013a5e979",
-            "milli, crown of thorns": "67063e2e69a7df0013a519da",
-            "morpankhi": "67063e3e69a7df0013a51aee",
-            "motha ghas nut grass": "6706341171fcaa001364a5da",
-            "मूंग (Rainfed / Kharif)": "669e3fe32906e5daecf13bf9",
-            "munja,pani pula": "6706342071fcaa001364a613",
-            "murat": "6706347f71fcaa001364a657",
-            "murwa, sweet marjorum, marjorum": "670638f0e0b7ad00133b7577",
-            "naag champ": "67063e4c69a7df0013a51bfb",
-            "neem": "670647bd69a7df0013a5efd7",
-            "negad/nirgundi": "67063e5d69a7df0013a51d0a",
-            "nimbu lemon": "67063e6b69a7df0013a51e1b",
-            "nodding bristle grass": "6706348f71fcaa001364a694",
-            "oot kateli": "670638fde0b7ad00133b7616",
-            "panwar": "6706390ce0b7ad00133b76c3",
-            "paras peepal,indian tulip tree": "670647cb69a7df0013a5f637",
-            "parda bel": "670643a569a7df0013a5828c",
-            "parkinsonia": "670647d769a7df0013a5f7f2",
-            "pathar chatta": "6706391be0b7ad00133b777e",
-            "बाजरा (>600Mm Rainfall)": "6625fcb5c986db5da828c2cb",
-            "बाजरा (<600Mm Rainfall)": "6625fcb5c986db5da828c2c4",
-            "pilkhan": "670647e669a7df0013a5f9af",
-            "pipal": "670647f269a7df0013a5fb6e",
-            "putkanta": "67063929e0b7ad00133b7823",
-            "putranjeeva": "670647fd69a7df0013a5fd2f",
-            "raat raani": "67063e7a69a7df0013a51f34",
-            "rakt punarnava": "6706393de0b7ad00133b78ce",
-            "rakt stambhi": "6706394de0b7ad00133b7977",
-            "ram tulsi": "6706395ce0b7ad00133b7a22",
-            "red kaner": "67063e8769a7df0013a52051",
-            "redbird flower nagdon": "67063e9e69a7df0013a52171",
-            "चावल ( all variety / Irrigated / Kharif)": "6643090a42b79738d9b6b49f",
-            "rohida": "6706480969a7df0013a5fef2",
-            "saagwaan": "6706481469a7df0013a600b7",
-            "sabed champa": "67063eaf69a7df0013a52291",
-            "sabuni, svetsabuni": "670639a9e0b7ad00133b7b2a",
-            "sadabahar": "670639b8e0b7ad00133b7bd9",
-            "safed aak": "670639c7e0b7ad00133b7c8a",
-            "safed kheri, kumtha": "6706481e69a7df0013a6027e",
-            "safeda": "6706482869a7df0013a60447",
-            "sago palm": "67063ebd69a7df0013a523ac",
-            "sahdev": "67063ecc69a7df0013a524cd",
-            "sahdevi": "670639ffa5755e0013d78594",
-            "satyanassi": "67063a4da5755e0013d78b4d",
-            "seemia, kassod": "6706483069a7df0013a60612",
-            "sejna": "6706483969a7df0013a607df",
-            "semal": "6706484569a7df0013a609ae",
-            "तिल (all / Irrigated / Kharif)": "66828e576e406605744905c3",
-            "sharpunkha": "67063a60a5755e0013d78d67",
-            "shatvari": "670643af69a7df0013a58422",
-            "shehtoot": "6706485169a7df0013a60b7f",
-            "shisham": "6706485a69a7df0013a60d52",
-            "sisal agave": "67063a74a5755e0013d78e20",
-            "sitafal": "6706486669a7df0013a613ce",
-            "snake plant": "67063a83a5755e0013d78edb",
-            "soft fig": "6706487169a7df0013a615a5",
-            "सोयाबीन ( all variety / Rainfed / Kharif)": "664308c942b79738d9b67594",
-            "spiny amaranth": "67063a9aa5755e0013d78f98",
-            "subabool": "6706487b69a7df0013a6177e",
-            "sudarshan": "67063aaaa5755e0013d79057",
-            "surwal,black spear grass": "6706349f71fcaa001364a81e",
-            "tecoma, gudichadi": "67063edc69a7df0013a525f3",
-            "टेट्राप्लोइड कपास ( all variety / Irrigated / Kharif)": "66430ace1e12e93837a22379",
-            "til (jungli) ": "67063ab8a5755e0013d791d4",
-            "tiny flower , hibiscus": "67063ee969a7df0013a52714",
-            "triparni, khatti": "67063ac8a5755e0013d79297",
-            "Urdbean ( all variety / Rainfed / Kharif)": "664309c61e12e93837a08879",
-            "vajradanti": "67063ef769a7df0013a52837",
-            "van gobi": "67063ad8a5755e0013d7935c",
-            "variegated agave": "67063ae7a5755e0013d79423",
-            "vilayati babool": "6706488769a7df0013a6195c",
-            "vishdodi, goatweed": "67063af6a5755e0013d794ec",
-            "vishnukranthi": "67063b03a5755e0013d795b9",
-            "wavy mulein": "67063b11a5755e0013d79686",
-            "गेहूँ ( all variety / Irrigated / Rabi)": "66430b3ca33a0f41daa3f996",
-            "winter grass": "670634ad71fcaa001364a85f",
-            "yellow kaner": "67063f0669a7df0013a5295c",
-            "zebrina": "67063b1fa5755e0013d79755",
-            "zharnia,crowfoot grass,": "670634bb71fcaa001364a8a2"
-        },
-        "63f869bfd2e83876f03e7396": {},
-        "63f9be9f519359b7438d08bb": {
-            "எலுமிச்சை (Irrigated / Kharif)": "661d176a91211e05b3980511",
-            "ஆப்பிள் (All Variety)": "6625fcb0c986db5da828c18a",
-            "பாக்கு  (All Variety)": "6625fcb2c986db5da828c1f1",
-            "சாம்பல் பூசணிக்காய் (All Variety)": "6625fcb4c986db5da828c29b",
-            "வாழை (Poovan, Robusta)": "6625fcb8c986db5da828c386",
-            "வாழை (Irrigated)": "6625fcb8c986db5da828c37a",
-            "வாழை (Rasthali, Nendran,)": "6625fcb8c986db5da828c38c",
-            "வாழை (Varieties other than Nendran)": "6625fcb8c986db5da828c374",
-            "வாழை (Nendran)": "6625fcb8c986db5da828c380",
-            "குதிரைவாலி (Irrigated / Kharif)": "662f87549f5b637024ed7e17",
-            "பீட்ரூட் (Irrigated / Rabi)": "67174dd87ab35c5ed5d1db24",
-            "பாகற்காய் (Variety)": "6625fcbec986db5da828c511",
-            "பாகற்காய் (Hybrid)": "6625fcbec986db5da828c50b",
-            "கருமிளகு (Rainfed / Kharif)": "662f8573992696b9715cd150",
-            "கத்தரிக்காய் (Variety)": "6625fcc3c986db5da828c657",
-            "கத்தரிக்காய் (Hybrid)": "6625fcc3c986db5da828c639",
-            "முட்டைக்கோஸ் (Hills)": "6625fcc6c986db5da828c702",
-            "முட்டைக்கோஸ் (Plains)": "6625fcc6c986db5da828c70e",
-            "முட்டைக்கோஸ் (chineese)": "6625fcd0c986db5da828c949",
-            "முட்டைக்கோஸ் (Hybrid)": "6625fcc6c986db5da828c708",
-            "கேரட் (All Variety)": "6625fcc8c986db5da828c788",
-            "ஆமணக்கு (Rainfed / Kharif)": "662c7d16b5edd941b69336a8",
-            "ஆமணக்கு (Hybrid / Rainfed / Kharif)": "662c7d6ad9f6c87ed8de5f50",
-            "ஆமணக்கு (Irrigated / Kharif)": "662c7d27b5edd941b6933a1a",
-            "ஆமணக்கு (Hybrid / Irrigated / Kharif)": "662c7d55b5edd941b6934e96",
-            "சவுக்கு  (Irrigated / Kharif)": "662c7d96b5edd941b6936572",
-            "காலிஃபிளவர் (Hills)": "6625fccbc986db5da828c827",
-            "காலிஃபிளவர் (Plains)": "6625fccbc986db5da828c82d",
-            "செலரி (All Variety / Irrigated)": "6625fccbc986db5da828c839",
-            "கொண்டைக்கடலை (Irrigated)": "6625fcbbc986db5da828c454",
-            "கொண்டைக்கடலை (Rainfed)": "6625fcbbc986db5da828c45b",
-            "மிளகாய் (Hybrid / Irrigated / Kharif)": "662c7e33b5edd941b69387a3",
-            "மிளகாய் (Irrigated / Kharif)": "662c7e09b5edd941b6937de2",
-            "மேரக்காய் (All Variety / Irrigated)": "6625fcd0c986db5da828c962",
-            "கிராம்பு (Rainfed / Kharif)": "6627914e94683671a1c08f6d",
-            "கொத்தவரை  (Irrigated / Kharif)": "6627916dd9f6c87ed8e53aed",
-            "தென்னை  (tall)": "6625fcd9c986db5da828cb38",
-            "தென்னை  (Hybrid)": "6625fcd8c986db5da828cb0e",
-            "காபி செடி  (Arabica bears above 0.4 mt / acre / Rainfed / Kharif)": "66279e69d9f6c87ed8ee0941",
-            "காபி செடி  (Arabica - bears 0.4 mt / acre / Rainfed / Kharif)": "66279dc391a51101fb9d66fe",
-            "காபி செடி  (Robusta bears above 0.4 mt /acre / Rainfed / Kharif)": "66279ed5b5edd941b68f8851",
-            "காபி செடி  (Robusta bears 0.4 mt /acre / Rainfed / Kharif)": "66279eae91a51101fb9db66f",
-            "கொத்தமல்லி (Clipping / Rainfed / Kharif)": "66279f7ed9f6c87ed8ee858a",
-            "கொத்தமல்லி (All Variety)": "6625fcdbc986db5da828cbb6",
-            "காராமணி  (Rainfed / Kharif)": "66279fe1b5edd941b69058a7",
-            "காராமணி  (Irrigated / Kharif)": "66279fcd94683671a1c6c74a",
-            "வெள்ளரிக்காய் (Hybrid)": "6625fce0c986db5da828ccf7",
-            "கறிவேப்பிலை (All Variety)": "6625fce1c986db5da828cd28",
-            "சேனைக்கிழங்கு  (கருனைக்கிழங்கு  / Irrigated / Annual Crop)": "669bed2fdd508884548183b3",
-            "கேழ்வரகு (All varieties / Irrigated / Kharif)": "6627a68cb5edd941b69551bd",
-            "பூண்டு (All Variety)": "6625fce7c986db5da828ce7b",
-            "இஞ்சி (All Variety)": "6625fce9c986db5da828cef0",
-            "திராட்சை (Sonaka manik chaman / Irrigated / Kharif)": "662c80b4b5edd941b694234f",
-            "திராட்சை (Muscat hamburg paneer / Irrigated / Kharif)": "662c808ab914104e214b5cc4",
-            "திராட்சை (Pachadraksha)": "6625fcebc986db5da828cf5c",
-            "திராட்சை (Sharad Seedless)": "6625fcebc986db5da828cf62",
-            "திராட்சை (Thompson Seedless)": "6625fcebc986db5da828cf68",
-            "திராட்சை (Anab-E-Shahi)": "6625fcebc986db5da828cf56",
-            "நிலக்கடலை (irrigated)": "6625fceec986db5da828d01f",
-            "நிலக்கடலை (Rainfed)": "6625fcefc986db5da828d03f",
-            "கொய்யா (All Variety)": "6625fcf1c986db5da828d0b8",
-            "பட்டாணி (கொள்ளு / Irrigated & rainfed / Rainfed / Kharif)": "669bee7bc0e295c4504ddb24",
-            "இலந்தைப் பழம் (All Variety)": "6625fcbbc986db5da828c461",
-            "கோவைக்காய்  (Irrigated / Kharif)": "662c7e69b5edd941b6939618",
-            "பலாப்பழம் (All Variety)": "6625fcf4c986db5da828d154",
-            "மல்லிகை (Irrigated / Kharif)": "6627a5085a09e4dc487a1887",
-            "Kodo Millet (Irrigated / Kharif)": "662f872aeddb05acaecf5aaa",
-            "நூல் கோல்    (Rainfed / Kharif)": "6627a57d94683671a1c87de6",
-            "பெரிய ஏலக்கி (Rainfed / Kharif)": "6627a245d9f6c87ed8efb894",
-            "சாமை (Irrigated / Kharif)": "662f8708fb33a39527860225",
-            "மக்காச்சோளம் (All Variety)": "6625fd05c986db5da828d51d",
-            "மக்காச்சோளம் (Hybrid)": "6625fd04c986db5da828d4d5",
-            "மா (6Th Year Onwards)": "6625fd08c986db5da828d5e9",
-            "செவ்வந்தி  (All Variety)": "6625fd0dc986db5da828d6b6",
-            "மெந்தோல் புதினா (Irrigated / Kharif)": "662c844ab914104e214c2e12",
-            "ஜாதிக்காய் (15Th Year Onwards)": "6625fd11c986db5da828d7b7",
-            "வெண்டை  (Irrigated / Rabi)": "662c7c7eb5edd941b69302d1",
-            "வெங்காயம் (Bellary / Irrigated / Kharif)": "6627a82bb5edd941b695f439",
-            "வெங்காயம் (All Variety)": "6625fcbbc986db5da828c433",
-            "Pea (All Variety / Irrigated)": "6625fd21c986db5da828dbfb",
-            "கம்பு  (Hybrid mixed black calcareous- periyanaickenpalayam series / Irrigated / Kharif)": "6627a0aad9f6c87ed8eef461",
-            "துவரை (Rainfed / Kharif)": "6627a7acb5edd941b695dd98",
-            "துவரை (Irrigated / Kharif)": "6627a797d9f6c87ed8f1aa45",
-            "உருளைக்கிழங்கு (All Variety / Rainfed)": "6625fd28c986db5da828dd80",
-            "பனிவரகு (Irrigated / Kharif)": "662f873beddb05acaecf6271",
-            "பூசணிக்காய் (Hybrid / Irrigated)": "6625fd2ac986db5da828dde0",
-            "பூசணிக்காய் (All Variety)": "6625fd2ac986db5da828ddec",
-            "முள்ளங்கி (All Variety / Rainfed)": "6625fd2bc986db5da828de3a",
-            "நெல்  (13 river alluvium)": "6625fd2cc986db5da828de71",
-            "நெல்  (SRI 6 river alluvium ambasamudram / Irrigated / Rabi)": "662f8547fb33a395278500d0",
-            "நெல்  (14 river alluvium)": "6625fd2cc986db5da828de77",
-            "நெல்  (sri 4 river alluvium)": "6625fd2cc986db5da828de8f",
-            "நெல்  (12 black alluvium)": "6625fd2bc986db5da828de6b",
-            "நெல்  (sri white ponni)": "6625fd2dc986db5da828ded7",
-            "நெல்  (1 river alluvium)": "6625fd2dc986db5da828deb3",
-            "நெல்  (sri 3 river alluvium)": "6625fd2cc986db5da828de89",
-            "நெல்  (11 black alluvium)": "6625fd2bc986db5da828de65",
-            "நெல்  (2 river alluvium)": "6625fd2dc986db5da828deb9",
-            "நெல்  (9 red sandy loam)": "6625fd2cc986db5da828de83",
-            "நெல்  (10 black alluvium)": "6625fd2bc986db5da828de5f",
-            "நெல்  (sri white ponni 5 rabi / Irrigated)": "6625fd2cc986db5da828de95",
-            "நெல்  (sri 7  red non calcerous vannapatti series / Rainfed / Rabi)": "667bedc6a840e6b408f7edbe",
-            "நெல்  (8 red sandy loam)": "6625fd2cc986db5da828de7d",
-            "பீர்க்கங்காய்  (Irrigated / Kharif)": "662f85b8992696b9715cf957",
-            "ரப்பர் (All Variety)": "6625fd2fc986db5da828df74",
-            "எள் (Rainfed / Kharif)": "6627a39091a51101fb9fbcf0",
-            "எள் (Irrigated / Kharif)": "6627a37a91a51101fb9fb517",
-            "புடலங்காய் (Hybrid)": "6625fd35c986db5da828e0b7",
-            "புடலங்காய் (Variety)": "6625fd35c986db5da828e0bd",
-            "சோளம் (Irrigated / Kharif)": "662b5893b5edd941b656e5dc",
-            "சோயா மொச்சை (Rainfed / Kharif)": "6627a912d9f6c87ed8f2784c",
-            "சோயா மொச்சை (Irrigated / Kharif)": "6627a8abd9f6c87ed8f24910",
-            "சர்க்கரைவள்ளிக்கிழங்கு (Irrigated / Kharif)": "662f8601b8ec1ea741abfb6e",
-            "கரும்பு (Periyanaikenpalayam Series)": "6625fd3ac986db5da828e207",
-            "கரும்பு (Irugur Series)": "6625fd3ac986db5da828e214",
-            "கரும்பு (Gadillum Series)": "6625fd3ac986db5da828e20e",
-            "சூரியகாந்தி (Irrigated / Kharif)": "6627a84b5a09e4dc487ae6f2",
-            "சூரியகாந்தி (Rainfed / Kharif)": "6627a85fd9f6c87ed8f2018d",
-            "புளி (All Variety)": "6625fd3fc986db5da828e34b",
-            "மரவள்ளிக்கிழங்கு (Rainfed / Kharif)": "6627aa465a09e4dc487b74e0",
-            "மரவள்ளிக்கிழங்கு (Irrigated / Kharif)": "6627aa38d9f6c87ed8f2ea71",
-            "தேயிலை (All Variety)": "6625fd41c986db5da828e3cb",
-            "தேக்கு (All Variety)": "6625fd41c986db5da828e3d1",
-            "டெட்ராப்ளாய்டு பருத்தி (Variety  / Rainfed / Kharif)": "662c7febb914104e214b4e35",
-            "டெட்ராப்ளாய்டு பருத்தி (Variety  / Irrigated / Kharif)": "662c7fd794683671a1a782b2",
-            "தக்காளி (All Variety)": "6625fd44c986db5da828e468",
-            "தக்காளி (hybrid)": "6625fd44c986db5da828e46e",
-            "சம்பங்கி (All Variety)": "6625fd44c986db5da828e498",
-            "மஞ்சள் (All Variety)": "6625fd45c986db5da828e4e0",
-            "உளுந்து (Rainfed / Rabi)": "662c7cd9b5edd941b6932dba",
-            "உளுந்து (Irrigated / Kharif)": "662c7cc60b648c455d673a54",
-            "அமராந்த் கீரை  (Irrigated / Kharif)": "662c7b45b5edd941b692c7e2",
-            "தர்பூசணி (All Variety)": "6625fd49c986db5da828e5e4"
-        },
-        "63f871f5c660ddb223457dca": {
-            "ఆముదం (All Variety)": "6625fcc9c986db5da828c7b4",
-            "సనగలు (All Variety)": "6625fcbbc986db5da828c447",
-            "మిరప (All Variety)": "6625fccec986db5da828c903",
-            "వెరుసనగాలు (All Variety)": "6625fcedc986db5da828cfe9",
-            "మొక్కజొన్న (Irrigated / Kharif)": "66712fb1654eb22a3d2f3f71",
-            "బొబ్బర్లు (All Variety)": "6625fcedc986db5da828cfc3",
-            "బొబ్బర్లు (Rainfed / Kharif)": "66729c0446bfb8921327de6b",
-            "కంది  (Rainfed / Kharif)": "667298f4eefa9aac5884f7a6",
-            "వరి (15048)": "6625fd2dc986db5da828decb",
-            "వరి (Variety)": "6625fd2dc986db5da828ded1",
-            "కుసుమ పువ్వు (All Variety)": "6625fd31c986db5da828dfbc",
-            "నువ్వులు (All Variety)": "6625fd34c986db5da828e060",
-            "జొన్నలు (Rainfed / Kharif)": "667295dca28c654e7621afd5",
-            "సోయా చిక్కుడు (All Variety / Irrigated)": "6625fd36c986db5da828e0f3",
-            "చెరుకు (All Variety)": "6625fd3ac986db5da828e21a",
-            "పత్తి (All Variety)": "6625fcddc986db5da828cc49",
-            "పసుపు  (All Variety)": "6625fd45c986db5da828e4da"
-        },
-        "63f874a0d2e83876f03f6866": {
-            "Anthurium (Irrigated / Rabi)": "66953393973c50356bed4797",
-            "Banana (All Variety)": "6625fcb6c986db5da828c304",
-            "Beetroot (Irrigated / Rabi)": "669531698e24ce5400f2aa67",
-            "Bitter Gourd (All Variety)": "6625fcbec986db5da828c4df",
-            "Bottle Gourd (Irrigated / Rabi)": "669509393e0f1992d15d2e26",
-            "Brinjal (All Variety)": "6625fcc1c986db5da828c5d3",
-            "Broccoli (Irrigated / Rabi)": "669531a0244b0d2e9227bb00",
-            "Cabbage (All Variety)": "6625fcc5c986db5da828c6b9",
-            "Carrot (All Variety)": "6625fcc7c986db5da828c740",
-            "Cauliflower (All Variety)": "6625fccac986db5da828c7e5",
-            "Chilli (Irrigated / Annual Crop)": "66952d9ff408840353f7796f",
-            "Chrysanthemum (Irrigated / Rabi)": "6695346569e752a9c885cffe",
-            "Coconut (All Variety)": "6625fcd6c986db5da828ca95",
-            "Cucumber (All Variety)": "6625fcdfc986db5da828cc9d",
-            "Dragon Fruit (All Variety)": "6625fce3c986db5da828cd9d",
-            "Finger Millet (All Variety)": "6625fce5c986db5da828cdff",
-            "Foxtail Millet (Rainfed / Annual Crop)": "669501f31a512f7280ef152f",
-            "Ginger (All Variety)": "6625fce7c986db5da828ce8d",
-            "Groundnut (Rainfed / Kharif)": "6862310c881d0dce25f44950",
-            "Groundnut (Rainfed / Rabi)": "68623429881d0dce25f4ef82",
-            "Guava (All Variety)": "6625fcefc986db5da828d052",
-            "Jackfruit (All Variety)": "6625fcf5c986db5da828d17e",
-            "Lemon (All Variety)": "6625fcffc986db5da828d3ba",
-            "Lentil (All Variety)": "6625fcfec986db5da828d38a",
-            "Litchi (All Variety)": "6625fd01c986db5da828d439",
-            "Maize (All Variety)": "6625fd02c986db5da828d45e",
-            "Mango (All Variety)": "6625fd06c986db5da828d56b",
-            "Marigold (All Variety)": "6625fd0cc986db5da828d69d",
-            "Okra (All Variety)": "6625fcbdc986db5da828c4ca",
-            "Onion (All Variety)": "6625fd15c986db5da828d8a4",
-            "Orchid (Dendrobium)": "6625fd19c986db5da828d9cb",
-            "Papaya (All Variety)": "6625fd1ec986db5da828db27",
-            "Pea (Irrigated / Rabi)": "66961ec1973c50356bf9a173",
-            "Pigeon Pea (All Variety)": "6625fcb4c986db5da828c287",
-            "Pointed Gourd (All Variety)": "6625fd25c986db5da828dcb8",
-            "Potato (All Variety)": "6625fd26c986db5da828dd07",
-            "Pumpkin (Irrigated / Annual Crop)": "66950cda4b57a5337a750042",
-            "Radish (All Variety)": "6625fd2ac986db5da828ddfe",
-            "Rice (HYV / Rainfed / Kharif)": "6625fd1cc986db5da828da6e",
-            "Rice (Hybrid / Irrigated / Kharif)": "6625fd1dc986db5da828daf6",
-            "Rice (Irrigated / Rabi)": "66950169bc3bddd74140f6d4",
-            "Ridge Gourd (All Variety)": "6625fd2dc986db5da828dee3",
-            "Sesame (Rainfed / Rabi)": "669535f8073426f7b5dfd7ea",
-            "Sesame (All Variety)": "6625fd34c986db5da828e073",
-            "Snake Gourd (All Variety)": "6625fd35c986db5da828e0ab",
-            "spiny gourd / akakara/ bodakakara (All Variety)": "6625fd38c986db5da828e18b",
-            "Sweet Orange (All Variety)": "6625fd0ec986db5da828d6ff",
-            "Sweet Potato (All Variety)": "6625fd3ec986db5da828e2fc",
-            "Tomato (All Variety)": "6625fd42c986db5da828e40e",
-            "Tuberose (All Variety)": "6625fd44c986db5da828e486",
-            "Turmeric (All Variety)": "6625fd45c986db5da828e4d4",
-            "Urdbean (All Variety)": "6625fcbfc986db5da828c557"
-        },
-        "63f600f38cec41e6c9607e6b": {
-            "जौ (All Variety)": "6625fcb9c986db5da828c3b2",
-            "बैंगन (All Variety)": "6625fcc2c986db5da828c5e0",
-            "पत्ता गोभी (All Variety)": "6625fcc5c986db5da828c6ad",
-            "गाजर (All Variety)": "6625fcc8c986db5da828c758",
-            "फूलगोभी (All Variety)": "6625fccac986db5da828c7df",
-            "चना (All Variety)": "6625fceac986db5da828cf20",
-            "मिर्च (All Variety)": "6625fccec986db5da828c8e2",
-            "लहसुन (All Variety)": "6625fce6c986db5da828ce45",
-            "मूंगफली (All Variety / Irrigated)": "6625fceec986db5da828d026",
-            "भारतीय सरसों (All Variety)": "6625fd10c986db5da828d75b",
-            "मसूर (All Variety)": "6625fcfec986db5da828d390",
-            "अलसी (All Variety)": "6625fd00c986db5da828d3f7",
-            "मक्का (All Variety / Irrigated / Kharif)": "664d7a41f96cafc8da43e27f",
-            "Mungbean (All Variety)": "6625fd0fc986db5da828d724",
-            "भिंडी (All Variety)": "6625fcfac986db5da828d2c1",
-            "प्याज (All Variety)": "6625fd15c986db5da828d8c2",
-            "Pea (All Variety)": "6625fd20c986db5da828dba1",
-            "बाजरा (All Variety)": "6625fcb6c986db5da828c2e4",
-            "अरहर (All Variety)": "6625fd23c986db5da828dc6f",
-            "आलू (All Variety)": "6625fd27c986db5da828dd19",
-            "बासमती धान (All Varient / Irrigated / Kharif)": "66502cec3d399498c181d74d",
-            "तिल (All Variety)": "6625fd33c986db5da828e036",
-            "सोयाबीन (All Variety)": "6625fd37c986db5da828e11d",
-            "पालक (All Variety)": "6625fd38c986db5da828e167",
-            "गन्ना (All Variety)": "6625fd3ac986db5da828e1cd",
-            "टमाटर (All Variety)": "6625fd42c986db5da828e41a",
-            "उर्दबीन (All Variety)": "6625fcbfc986db5da828c53d",
-            "गेहूँ (All Variety)": "6625fd4ac986db5da828e5fc"
-        },
-        "63f37f20491ca1c6048696ce": {
-            "Ajwain (All Variety)": "6625fcadc986db5da828c0df",
-            "Barley (All / Irrigated / Rabi)": "6648863e17f773ed439c7af2",
-            "Barley (All / Rainfed / Rabi)": "66488628f5dfae5f6306e26b",
-            "Barnyard Millet (All / Rainfed / Kharif)": "66360c9174c79ac08c99a30e",
-            "Bitter Gourd (All Variety / Kharif)": "6625fcf7c986db5da828d230",
-            "Brinjal (Hybrid)": "6625fcc3c986db5da828c645",
-            "Brinjal (Desi)": "6625fcc3c986db5da828c625",
-            "Buckwheat (Long Duration)": "6625fcc4c986db5da828c681",
-            "Buckwheat (Short Duration)": "6625fcc4c986db5da828c688",
-            "Cabbage (All Variety)": "6625fcc5c986db5da828c6cb",
-            "Cauliflower (All Variety)": "6625fccac986db5da828c803",
-            "Chilli (Hybrid / Irrigated / Annual Crop)": "6625fccfc986db5da828c911",
-            "Cucumber (All Variety)": "6625fce0c986db5da828ccfd",
-            "Finger Millet (All / Rainfed / Kharif)": "663df14151175b8259704259",
-            "Finger Millet (All / Irrigated / Kharif)": "663df1575f5c6523d3d2d1a6",
-            "Ginger (All Variety)": "6625fcadc986db5da828c0d1",
-            "Grain Amaranth (All / Irrigated / Kharif)": "66488462f0360900260b47dc",
-            "Grain Amaranth (All / Rainfed / Kharif)": "6648844321899de919f78719",
-            "Groundnut (All Variety)": "6625fceec986db5da828d011",
-            "Horse Gram (All / Rainfed / Kharif)": "663df5c5e3aa8a260d661bb1",
-            "Horse Gram (All / Irrigated / Kharif)": "663df5d651175b8259730f5d",
-            "Indian Mustard (Rai (sarson) / Irrigated / Rabi)": "663e0562f9c9dc1fe9ada585",
-            "Indian Mustard (Rai (sarson) / Rainfed / Rabi)": "663e057bf9c9dc1fe9adaed1",
-            "Kodo (All Variety)": "6625fcf7c986db5da828d24e",
-            "Lettuce (All Variety)": "6625fcffc986db5da828d3ae",
-            "Maize (Short Duration)": "6625fd05c986db5da828d517",
-            "Maize (Long Duration)": "6625fd04c986db5da828d4ff",
-            "Maize (Medium Duration / Kharif)": "6625fd04c986db5da828d505",
-            "Mungbean (All / Rainfed / Kharif)": "663df776f9c9dc1fe9a66fc1",
-            "Mungbean (All / Irrigated / Kharif)": "663df7675f5c6523d3d661d7",
-            "Okra (All Variety)": "6625fcbdc986db5da828c4d1",
-            "Onion (All Variety)": "6625fd16c986db5da828d8e6",
-            "Pigeon Pea (All Variety)": "6625fcb4c986db5da828c28e",
-            "Pumpkin (All / Irrigated / Annual Crop)": "663de3494f5a139b600f69db",
-            "Pumpkin (All / Rainfed / Annual Crop)": "663de35ae3aa8a260d5e95d2",
-            "Rapeseed (Yellow Sarson / Rainfed / Rabi)": "663e060d51175b82597bdb98",
-            "Rapeseed (lahi (toria) / Irrigated / Rabi)": "663dfca151175b825974c082",
-            "Rapeseed (Yellow Sarson / Irrigated / Rabi)": "663e05fb51175b82597bd49b",
-            "Rapeseed (lahi (toria) / Rainfed / Rabi)": "663dfc8fe3aa8a260d6aba59",
-            "Rice (Desi / Rainfed / Annual Crop)": "663dbb2d00a332cc0433b897",
-            "Rice (Hybrid / Irrigated)": "6625fd2cc986db5da828de9b",
-            "Rice (scented / Irrigated / Kharif)": "663dbb6743c1b7188f8100f3",
-            "Rice (Desi / Irrigated / Annual Crop)": "663dbb1243c1b7188f80d628",
-            "Rice (Hyv / Irrigated)": "6625fd2cc986db5da828dea1",
-            "Rice (Dwarf / Rainfed / Annual Crop)": "663dbb5100a332cc0433d47a",
-            "Sesame (All Variety / Rainfed)": "6625fd41c986db5da828e3d7",
-            "Sesame (All / Irrigated / Kharif)": "663df48af9c9dc1fe9a3dae9",
-            "Soybean (All Variety)": "6625fd37c986db5da828e14e",
-            "Spinach (All Variety)": "6625fd1ec986db5da828db15",
-            "Sugarcane (Kharif)": "6625fd3ac986db5da828e1ee",
-            "Sugarcane (All Variety)": "6625fd3ac986db5da828e1e7",
-            "Sunflower (All Variety)": "6625fd3cc986db5da828e276",
-            "Sweet Potato (All Variety)": "6625fd3ec986db5da828e318",
-            "Turmeric (All Variety)": "6625fcf2c986db5da828d0de",
-            "Urdbean (All / Irrigated / Kharif)": "663df6aaf9c9dc1fe9a5aae4",
-            "Urdbean (All / Rainfed / Kharif)": "663df6b9f9c9dc1fe9a5b08a",
-            "Wheat (All / Rainfed / Annual Crop)": "66360ad874c79ac08c98f0cc",
-            "Wheat (All / Irrigated / Annual Crop)": "663609ea05aa6558a0bdaf82",
-            "Wheat (Late Sowing / Irrigated / Annual Crop)": "663dbc2100a332cc04346824"
-        },
-        "63f87a1836497c055ce09df5": {
-            "Arecanut (All / Irrigated / Annual Crop)": "661e2a6a91211e05b3beb5f8",
-            "Banana (All / Irrigated / Rabi)": "6625fcb6c986db5da828c318",
-            "Betelvine (All / Irrigated / Rabi)": "6625fcbdc986db5da828c4a5",
-            "Bitter Gourd (All / Rainfed / Kharif)": "662a99e4b5edd941b640fd39",
-            "Bitter Gourd (All / Irrigated / Pre-kharif)": "663a5ba2758a7049fca03a60",
-            "Brinjal (Hybrid / Irrigated / Rabi)": "661ec0588ef8310c004b3d76",
-            "Brinjal (All / Rainfed / Kharif)": "661ec26f24edc2edfe2e0d00",
-            "Brinjal (All / Irrigated / Rabi)": "661ec23324edc2edfe2e08e6",
-            "Cabbage (All / Irrigated / Rabi)": "661ff6063544ff87a04aaf2a",
-            "Carrot (All / Irrigated / Rabi)": "661ff7d685ffb7195abdddb2",
-            "Castor (All / Rainfed / Kharif)": "661ffa883544ff87a04b3cba",
-            "Cauliflower (All / Irrigated / Rabi)": "661ffbcb101b1dba5a0a487f",
-            "Chickpea (All / Rainfed / Rabi)": "662fe7d39f5b637024f9ea5a",
-            "Chilli (Capsicum / Irrigated / Rabi)": "6625fcc7c986db5da828c72d",
-            "Chilli (All / Irrigated / Rabi)": "6625fccec986db5da828c8f7",
-            "Cluster Bean (All / Rainfed / Kharif)": "663ca606146c067d4c34ccb6",
-            "Cluster Bean (All / Irrigated / Pre-kharif)": "662feacbb8ec1ea741b9366a",
-            "Coconut (All / Rainfed / Annual Crop)": "6625fcd6c986db5da828caa1",
-            "Coriander (All / Irrigated / Rabi)": "6625fcdbc986db5da828cba4",
-            "Cucumber (All / Rainfed / Kharif)": "663cb17ba120aca480472081",
-            "Cucumber (All / Irrigated / Rabi)": "663cb14b4e171687e1d7f3c0",
-            "Cucumber (All / Irrigated / Pre-kharif)": "6625fcdfc986db5da828cccd",
-            "Custard Apple (All / Rainfed / Annual Crop)": "6625fce1c986db5da828cd34",
-            "Fenugreek (All / Rainfed / Rabi)": "662cb337b5edd941b6a780fa",
-            "Garlic (All / Irrigated / Rabi)": "6625fce6c986db5da828ce57",
-            "Ginger (All / Rainfed / Kharif)": "6625fce8c986db5da828cebf",
-            "Groundnut (All / Rainfed / Kharif)": "662b4058b5edd941b64a9ee9",
-            "Groundnut (All / Irrigated / Rabi)": "662b406eb5edd941b64ab254",
-            "Groundnut (All / Irrigated / Pre-kharif)": "663a5c60930a438595e38b47",
-            "Guava (All / Irrigated / Annual Crop)": "6625fcefc986db5da828d064",
-            "Indian Mustard (All(Rai) / Irrigated / Rabi)": "662f67aefb33a39527707b5b",
-            "Indian Mustard (All(Rai) / Rainfed / Rabi)": "662f67cb9f5b637024d89fdc",
-            "Jackfruit (All / Irrigated / Annual Crop)": "6625fcf5c986db5da828d18a",
-            "Jute (Tossa(Olitorius) / Irrigated / Pre-kharif)": "663770ee1b60b982137dce6d",
-            "Jute (White(Capsularis) / Irrigated / Pre-kharif)": "663772628d07d28afe66a1ab",
-            "Khesari (All / Rainfed / Rabi)": "662fe8ca9f5b637024f9f912",
-            "Lentil (All / Rainfed / Rabi)": "662fe94fb8ec1ea741b926ad",
-            "Linseed (All / Irrigated / Rabi)": "662caecfb914104e2159631f",
-            "Linseed (All / Rainfed / Kharif)": "662caeeab914104e2159768f",
-            "Litchi (All / Irrigated / Annual Crop)": "6625fd01c986db5da828d40f",
-            "Maize (All(Except Hybrid) / Irrigated / Pre-kharif)": "663773cb8d07d28afe66de5f",
-            "Maize (Hybrid / Irrigated / Pre-kharif)": "663cb87d11370fab67b0f94d",
-            "Maize (All(Except Hybrid) / Rainfed / Kharif)": "662fe64c9f5b637024f9b440",
-            "Maize (Hybrid / Irrigated / Rabi)": "662fe483992696b97168aeb6",
-            "Maize (All(Except Hybrid) / Irrigated / Rabi)": "662fe61c9f5b637024f9afd0",
-            "Maize (Hybrid / Rainfed / Kharif)": "663cb81828c39231216c9424",
-            "Mango (All / Irrigated / Annual Crop)": "6625fd06c986db5da828d57d",
-            "Mulberry (All / Irrigated / Annual Crop)": "6625fd0fc986db5da828d71e",
-            "Mungbean (All / Rainfed / Rabi)": "662fea129f5b637024fa37f0",
-            "Mungbean (All / Irrigated / Pre-kharif)": "663a5cc4295c86f31806f063",
-            "Nigerseed (All / Rainfed / Rabi)": "662cccea94683671a1b7d360",
-            "Onion (All / Rainfed / Kharif)": "663a5d2e2678040e7b0b0fa5",
-            "Onion (All / Irrigated / Rabi)": "6625fd15c986db5da828d8da",
-            "Papaya (All / Irrigated / Annual Crop)": "6625fd1ec986db5da828db39",
-            "Pea (All / Rainfed / Rabi)": "662fe714b8ec1ea741b90eeb",
-            "Pigeon Pea (All / Rainfed / Kharif)": "661e26dba48550cd2e07d0c6",
-            "Pigeon Pea (All / Irrigated / Rabi)": "663cba0311370fab67b23947",
-            "Pineapple (All / Irrigated / Annual Crop)": "6625fd24c986db5da828dc9f",
-            "Pointed Gourd (All / Irrigated / Pre-kharif)": "662a9ce9b914104e21f518b8",
-            "Pomegranate (All / Irrigated / Annual Crop)": "6625fd25c986db5da828dcd0",
-            "Potato (All (Traditional Tuber) / Irrigated / Rabi)": "662feccc9f5b637024fa4768",
-            "Potato (All (Hybrid TPS) / Irrigated / Rabi)": "662fed03eddb05acaed8e3f3",
-            "Pumpkin (All / Irrigated / Pre-kharif)": "6625fd29c986db5da828ddc2",
-            "Radish (All / Irrigated / Rabi)": "6625fd2bc986db5da828de1c",
-            "Rapeseed (Yellow sarson / Irrigated / Rabi)": "662f6729eddb05acaeba991f",
-            "Rapeseed (Yellow sarson / Rainfed / Rabi)": "662f66b0b8ec1ea741980f5e",
-            "Rapeseed (Toria / Rainfed / Rabi)": "662f6590fb33a395276f4b48",
-            "Rapeseed (Toria / Irrigated / Rabi)": "662f6616eddb05acaeb9ef8b",
-            "Rice (Medium Duration / Rainfed / Kharif)": "662fdcddeddb05acaed8867a",
-            "Rice (Aromatic Rice / Irrigated / Kharif)": "6641f95d856d89a557e19897",
-            "Rice (All(Boro) / Irrigated / Rabi)": "661ff25885ffb7195abd1fa0",
-            "Rice (Long Duration(wd30-50cm) / Rainfed / Kharif)": "662fdd8beddb05acaed88f0a",
-            "Rice (Direct seeded  / Irrigated / Pre-kharif)": "6641efe1218cae0164f3bca9",
-            "Rice (Short Duration / Rainfed / Kharif)": "662fdcb29f5b637024f8cd33",
-            "Rice (Hybrid / Irrigated / Kharif)": "662fde9b9f5b637024f8fb1b",
-            "Rice (Transplanted Traditional Improved / Rainfed / Kharif)": "662fdb01eddb05acaed86e24",
-            "Rice (Long Duration(wd>100 cm) / Rainfed / Kharif)": "662fddfc9f5b637024f8f099",
-            "Rice (Long Duration(wd 15-30cm) / Rainfed / Kharif)": "662fdd5ceddb05acaed88b9d",
-            "Rice (Transplanted / Irrigated / Pre-kharif)": "6641f055e20a3a7f520ebd88",
-            "Rice (Long Duration(wd50-100cm) / Rainfed / Kharif)": "662fddb99f5b637024f8e8b9",
-            "Ridge Gourd (All / Irrigated / Pre-kharif)": "6625fd2dc986db5da828dee9",
-            "Safflower (Hybrid / Irrigated / Rabi)": "6625fd30c986db5da828dfaa",
-            "Safflower (Improved Variety / Irrigated / Rabi)": "6625fd30c986db5da828dfb0",
-            "Sapota (All / Rainfed / Annual Crop)": "6625fd31c986db5da828dfda",
-            "Sesame (Roma / Irrigated / Pre-kharif)": "6625fd33c986db5da828e04e",
-            "Sesame (Tilottoma and All Variety / Irrigated / Pre-kharif)": "6625fd33c986db5da828e054",
-            "Sesame (All / Rainfed / Rabi)": "6625fd34c986db5da828e05a",
-            "Spinach (All / Irrigated / Rabi)": "6625fd1dc986db5da828dafc",
-            "Sugar Beet (All / Irrigated / Rabi)": "661eb5dd91211e05b3ddfc92",
-            "Sugarcane (All / Irrigated / Pre-kharif)": "663f1bd35f5c6523d3fb94c9",
-            "Sugarcane (Main Crop / Irrigated / Kharif)": "662a8b570b648c455d1bfab1",
-            "Sugarcane (Ratoon  / Irrigated / Rabi)": "662a8beeb914104e21f387ef",
-            "Sunflower (All / Irrigated / Rabi)": "6625fd3cc986db5da828e264",
-            "Sweet Potato (All / Irrigated / Kharif)": "6625fd3ec986db5da828e311",
-            "Tetraploid Cotton (All (Traditional) / Irrigated / Kharif)": "662fed7eeddb05acaed8e6cf",
-            "Tetraploid Cotton (All (Hybrid) / Irrigated / Kharif)": "662fedae992696b97168e85a",
-            "Tobacco (All / Irrigated / Rabi)": "6625fd42c986db5da828e3f0",
-            "Tomato (Hybrid / Irrigated / Rabi)": "662f6d989f5b637024dc1d8b",
-            "Tomato (Desi / Irrigated / Rabi)": "662f6c63992696b9714c1325",
-            "Turmeric (All / Rainfed / Kharif)": "6625fd44c986db5da828e4b0",
-            "Turnips (All / Rainfed / Rabi)": "662fc81feddb05acaed6e863",
-            "Urdbean (All / Irrigated / Pre-kharif)": "663a5f23295c86f318075873",
-            "Urdbean (All / Rainfed / Rabi)": "662fe9c69f5b637024fa339e",
-            "Water Chestnut (All / Rainfed / Kharif)": "6625fd48c986db5da828e596",
-            "Watermelon (Hybrid / Rainfed / Pre-kharif)": "662fc956fb33a3952798de13",
-            "Watermelon (Local / Rainfed / Pre-kharif)": "662fc8ff9f5b637024f76bf6",
-            "Wheat (All (Hill&Terai Soils) / Irrigated / Rabi)": "662fe256b8ec1ea741b8c9b6",
-            "Wheat (All (exceptHill&Terai Soil) / Irrigated / Rabi)": "662fe3b0fb33a395279aac60"
-        }
-    }
-}
+# Soil Health portal lookup data: state / district / crop names -> MongoDB ids.
+#
+# The ids live in soilhealth_data.json next to this module and are read on
+# first use, so importing the server no longer compiles a ~10k-line literal.
+# `from data import SOILHEALTH_DATA` keeps working (it triggers the load).
+
+from __future__ import annotations
+
+import json
+import os
+from functools import lru_cache
+from typing import Any
+
+DATA_PATH = os.getenv(
+    "SOILHEALTH_DATA_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "soilhealth_data.json"),
+)
+
+
+@lru_cache(maxsize=1)
+def load_data() -> dict[str, Any]:
+    """{"states": {name: id}, "districts": {state_id: {name: id}}, "crops": {state_id: {name: id}}}"""
+    with open(DATA_PATH, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "SOILHEALTH_DATA":
+        return load_data()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,7 +11,7 @@ from typing import Any
 import httpx
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
-from data import SOILHEALTH_DATA
+from soil_index import get_index
 
 # Ensure UTF-8 output on all platforms including Windows
 # This enables support for all Indian languages (Hindi, Telugu, Tamil, Kannada, Marathi, etc.)
@@ -317,41 +317,6 @@ async def soilhealth_get_fertilizer_recommendations(
             "detail": f"INCOMPLETE INFORMATION PROVIDED: This tool requires several mandatory soil test values to calculate recommendations. The following parameters are missing: {', '.join(missing)}. Please provide these values to get accurate fertilizer recommendations."
         }
 
-    def find_best_match(target, choices_dict):
-        if not target: return None
-        # Exact match
-        if target in choices_dict: return choices_dict[target]
-        # ID match (case check)
-        if target in [v for v in choices_dict.values()]: return target
-        
-        # Case-insensitive match
-        target_upper = target.strip().upper()
-        for name, cid in choices_dict.items():
-            if name.upper() == target_upper:
-                return cid
-        
-        # 1. Flexible substring match (e.g., "Potato" in "आलू (Potato) (All Variety)")
-        # If multiple matches are found, we pick the one with the shortest name 
-        # (closest length match) to prioritize "Agra" over "Agra Block".
-        target_lower = target.strip().lower()
-        substring_matches = []
-        for name, cid in choices_dict.items():
-            if target_lower in name.lower():
-                substring_matches.append((name, cid))
-        
-        if substring_matches:
-            # Sort by name length and return the CID of the shortest one
-            substring_matches.sort(key=lambda x: len(x[0]))
-            return substring_matches[0][1]
-        
-        # 2. Fuzzy match (lower cutoff for short names)
-        import difflib
-        cutoff = 0.4 if len(target) < 10 else 0.6
-        matches = difflib.get_close_matches(target, choices_dict.keys(), n=1, cutoff=cutoff)
-        if matches:
-            return choices_dict[matches[0]]
-        return target # Fallback to original if no match found (might be an ID)
-
     def is_valid_mongodb_id(oid):
         if not isinstance(oid, str): return False
         if len(oid) != 24: return False
@@ -361,13 +326,14 @@ async def soilhealth_get_fertilizer_recommendations(
         except ValueError:
             return False
 
-    # 2. Look up state ID
-    state_id = find_best_match(state, SOILHEALTH_DATA["states"])
+    # 2. Look up state ID (name indexes are built once, on first use)
+    index = get_index()
+    state_id = index.states.match(state)
     
     # 3. Look up district ID if provided
     district_id = district
-    if district and state_id in SOILHEALTH_DATA["districts"]:
-        district_id = find_best_match(district, SOILHEALTH_DATA["districts"][state_id])
+    if district and state_id in index.districts:
+        district_id = index.districts[state_id].match(district)
     
     # Validate district_id - if it's not a valid MongoDB ID, unset it to avoid 400 error
     if district_id and not is_valid_mongodb_id(district_id):
@@ -376,11 +342,8 @@ async def soilhealth_get_fertilizer_recommendations(
     
     # 4. Look up crop IDs if provided
     crop_ids = crops
-    if crops and state_id in SOILHEALTH_DATA["crops"]:
-        crop_ids = []
-        for c in crops:
-            cid = find_best_match(c, SOILHEALTH_DATA["crops"][state_id])
-            crop_ids.append(cid)
+    if crops and state_id in index.crops:
+        crop_ids = [index.crops[state_id].match(c) for c in crops]
 
     variables = {
         "state": state_id,
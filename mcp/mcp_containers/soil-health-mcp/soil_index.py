@@ -0,0 +1,139 @@
+# Load-time indexes over SOILHEALTH_DATA for resolving state / district / crop
+# names (or ids) to portal MongoDB ids.
+#
+# ChoiceIndex.match gives the same answer as the per-query scan it replaces:
+#   exact name -> known id -> case-insensitive name -> shortest name containing
+#   the text -> difflib close match -> the text itself (may already be an id)
+
+from __future__ import annotations
+
+import difflib
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any
+
+from data import load_data
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # plain difflib over all names
+    fuzz = process = None
+
+_SEP = "\x00"
+
+
+class ChoiceIndex:
+    """One name -> id table with its normalized lookups precomputed."""
+
+    def __init__(self, choices: dict[str, str]):
+        self.choices = choices
+        self.names = list(choices)
+        self._ids = set(choices.values())
+
+        # first name (in table order) per upper-cased spelling
+        self._upper: dict[str, str] = {}
+        for name, cid in choices.items():
+            self._upper.setdefault(name.upper(), cid)
+
+        # Lower-cased names joined shortest-first (ties in table order), so the
+        # first str.find hit is the shortest name containing the text.
+        ordered = sorted(range(len(self.names)), key=lambda i: len(self.names[i]))
+        lowered = [self.names[i].lower() for i in ordered]
+        self._by_length = [choices[self.names[i]] for i in ordered]
+        self._starts: list[int] = []
+        offset = 0
+        for low in lowered:
+            self._starts.append(offset)
+            offset += len(low) + 1
+        # (plain scan instead if a name itself contains the separator)
+        self._haystack = None if any(_SEP in low for low in lowered) else _SEP.join(lowered)
+        self._lowered = lowered
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _shortest_containing(self, needle: str) -> str | None:
+        if not self._by_length:
+            return None
+        if self._haystack is None or _SEP in needle:
+            for low, cid in zip(self._lowered, self._by_length):
+                if needle in low:
+                    return cid
+            return None
+        pos = self._haystack.find(needle)
+        if pos < 0:
+            return None
+        return self._by_length[bisect_right(self._starts, pos) - 1]
+
+    def closest(self, target: str, cutoff: float) -> str | None:
+        """
+        Same answer as difflib.get_close_matches(target, names, n=1, cutoff).
+        rapidfuzz's ratio (LCS-based) never scores below difflib's, so it
+        ranks candidates best-first and difflib stops once no remaining
+        candidate can beat (or tie) the best score found.
+        """
+        if process is None:
+            matches = difflib.get_close_matches(target, self.names, n=1, cutoff=cutoff)
+            return matches[0] if matches else None
+
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(target)
+        best: tuple[float, str] | None = None
+        for name, bound, _ in process.extract(
+            target,
+            self.names,
+            scorer=fuzz.ratio,
+            score_cutoff=cutoff * 100 - 1e-6,
+            limit=None,
+        ):
+            if best is not None and bound / 100 + 1e-9 < best[0]:
+                break
+            matcher.set_seq1(name)
+            if (
+                matcher.real_quick_ratio() >= cutoff
+                and matcher.quick_ratio() >= cutoff
+                and matcher.ratio() >= cutoff
+            ):
+                # get_close_matches breaks score ties on the larger name
+                scored = (matcher.ratio(), name)
+                best = scored if best is None else max(best, scored)
+        return best[1] if best else None
+
+    def match(self, target: str | None) -> str | None:
+        """Resolve a name (minor typos allowed) or id; unknown text is returned as-is."""
+        if not target:
+            return None
+        if target in self.choices:
+            return self.choices[target]
+        if target in self._ids:
+            return target
+
+        cid = self._upper.get(target.strip().upper())
+        if cid is not None:
+            return cid
+
+        cid = self._shortest_containing(target.strip().lower())
+        if cid is not None:
+            return cid
+
+        # lower cutoff for short names
+        cutoff = 0.4 if len(target) < 10 else 0.6
+        name = self.closest(target, cutoff)
+        if name is not None:
+            return self.choices[name]
+        return target
+
+
+class SoilHealthIndex:
+    """ChoiceIndexes for states, and for districts / crops per state id."""
+
+    def __init__(self, data: dict[str, Any]):
+        self.states = ChoiceIndex(data.get("states", {}))
+        self.districts = {sid: ChoiceIndex(rows) for sid, rows in data.get("districts", {}).items()}
+        self.crops = {sid: ChoiceIndex(rows) for sid, rows in data.get("crops", {}).items()}
+
+
+@lru_cache(maxsize=1)
+def get_index() -> SoilHealthIndex:
+    """Built once, on the first lookup."""
+    return SoilHealthIndex(load_data())
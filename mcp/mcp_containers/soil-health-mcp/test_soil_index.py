@@ -0,0 +1,175 @@
+"""Soil Health name indexes: parity with the per-query find_best_match scan, plus load / lookup latency."""
+
+import asyncio
+import difflib
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+import pytest
+
+import data
+import soil_index
+
+
+def _legacy_find_best_match(target, choices_dict):
+    # the matcher soilhealth_get_fertilizer_recommendations ran on every call
+    if not target: return None
+    if target in choices_dict: return choices_dict[target]
+    if target in [v for v in choices_dict.values()]: return target
+    target_upper = target.strip().upper()
+    for name, cid in choices_dict.items():
+        if name.upper() == target_upper:
+            return cid
+    target_lower = target.strip().lower()
+    substring_matches = []
+    for name, cid in choices_dict.items():
+        if target_lower in name.lower():
+            substring_matches.append((name, cid))
+    if substring_matches:
+        substring_matches.sort(key=lambda x: len(x[0]))
+        return substring_matches[0][1]
+    cutoff = 0.4 if len(target) < 10 else 0.6
+    matches = difflib.get_close_matches(target, choices_dict.keys(), n=1, cutoff=cutoff)
+    if matches:
+        return choices_dict[matches[0]]
+    return target
+
+
+def _variants(rng, name):
+    chars = list(name)
+    i = rng.randrange(len(chars))
+    op = rng.choice(["drop", "swap", "sub", "case", "pad", "prefix", "word"])
+    if op == "drop" and len(chars) > 2:
+        del chars[i]
+    elif op == "swap" and i + 1 < len(chars):
+        chars[i], chars[i + 1] = chars[i + 1], chars[i]
+    elif op == "sub":
+        chars[i] = rng.choice("aeiouKX")
+    elif op == "case":
+        return name.swapcase()
+    elif op == "pad":
+        return f"  {name.lower()} "
+    elif op == "prefix":
+        return name[: rng.randint(1, max(1, len(name) // 2))]
+    elif op == "word":
+        words = name.replace("(", " ").split()
+        return rng.choice(words) if words else name
+    return "".join(chars)
+
+
+def _queries(rng, table, n):
+    names = list(table)
+    ids = list(table.values())
+    out = ["", None, "   ", "zzqx", "x" * 30, "not-a-real-id-000000000000"]
+    for _ in range(n if names else 0):
+        roll = rng.random()
+        if roll < 0.1:
+            out.append(rng.choice(names))
+        elif roll < 0.15:
+            out.append(rng.choice(ids))
+        else:
+            out.append(_variants(rng, rng.choice(names)))
+    return out
+
+
+def _tables():
+    raw = data.load_data()
+    tables = [("states", raw["states"])]
+    tables += [(f"districts/{sid}", rows) for sid, rows in raw["districts"].items()]
+    tables += [(f"crops/{sid}", rows) for sid, rows in raw["crops"].items()]
+    return tables
+
+
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+def test_match_parity_with_find_best_match(monkeypatch, use_rapidfuzz):
+    if use_rapidfuzz and soil_index.process is None:
+        pytest.skip("rapidfuzz not installed")
+    if not use_rapidfuzz:
+        monkeypatch.setattr(soil_index, "process", None)
+    rng = random.Random(17)
+    index = soil_index.SoilHealthIndex(data.load_data())
+    lookup = {"states": index.states}
+    lookup.update({f"districts/{sid}": ix for sid, ix in index.districts.items()})
+    lookup.update({f"crops/{sid}": ix for sid, ix in index.crops.items()})
+
+    for key, table in _tables():
+        for q in _queries(rng, table, 60 if use_rapidfuzz else 15):
+            assert lookup[key].match(q) == _legacy_find_best_match(q, table), (key, q)
+
+
+def test_edge_cases_match_legacy():
+    table = {"Agra Block": "b", "Agra": "a", "AGRA": "c", "Ägra": "d", "Kota": "k"}
+    index = soil_index.ChoiceIndex(table)
+    for q in ["agra", "AGRA", " Agra ", "gra", "ÄGRA", "ägr", "Kotaa", "k", "a", "b", "qqqqqq", "\x00", ""]:
+        assert index.match(q) == _legacy_find_best_match(q, table), q
+    empty = soil_index.ChoiceIndex({})
+    assert empty.match("anything") == "anything"
+    assert empty.match("") is None
+
+
+def test_tool_resolves_names_through_index(monkeypatch):
+    server = pytest.importorskip("server")
+    raw = data.load_data()
+    sent = []
+
+    async def fake_graphql(query, variables):
+        sent.append(json.loads(json.dumps(variables)))
+        return {"success": True, "data": {"getRecommendations": []}}
+
+    monkeypatch.setattr(server, "_soilhealth_graphql", fake_graphql)
+    result = asyncio.run(
+        server.soilhealth_get_fertilizer_recommendations(
+            state="assam", district="Baska", crops=["Rice"], n=1, p=2, k=3, oc=0.5
+        )
+    )
+    assert result["success"] is True
+    state_id = raw["states"]["ASSAM"]
+    assert sent[0]["state"] == state_id
+    assert sent[0]["district"] == _legacy_find_best_match("Baska", raw["districts"][state_id])
+    assert sent[0]["crops"] == [_legacy_find_best_match("Rice", raw["crops"][state_id])]
+
+
+def test_server_import_does_not_load_dataset():
+    pytest.importorskip("server")
+    code = (
+        "import server, data, soil_index; "
+        "print(data.load_data.cache_info().currsize, soil_index.get_index.cache_info().currsize)"
+    )
+    here = os.path.dirname(os.path.abspath(__file__))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=here)
+    assert out.stdout.split() == ["0", "0"]
+
+
+def _per_lookup_us(fn, queries):
+    started = time.perf_counter()
+    for q in queries:
+        fn(*q)
+    return (time.perf_counter() - started) / len(queries) * 1e6
+
+
+def test_load_and_lookup_latency():
+    data.load_data.cache_clear()
+    soil_index.get_index.cache_clear()
+    started = time.perf_counter()
+    raw = data.load_data()
+    load_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    index = soil_index.get_index()
+    build_ms = (time.perf_counter() - started) * 1000
+
+    rng = random.Random(5)
+    largest = max(raw["districts"], key=lambda sid: len(raw["districts"][sid]))
+    table = raw["districts"][largest]
+    queries = [(q,) for q in _queries(rng, table, 300)]
+    linear = _per_lookup_us(lambda q: _legacy_find_best_match(q, table), queries)
+    indexed = _per_lookup_us(index.districts[largest].match, queries)
+
+    print(
+        f"\njson load {load_ms:.1f}ms, index build {build_ms:.1f}ms"
+        f"\ndistrict match ({len(table)} names): linear {linear:.0f}us, indexed {indexed:.0f}us"
+    )
+    assert indexed * 2 < linear
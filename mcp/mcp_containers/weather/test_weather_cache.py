@@ -0,0 +1,193 @@
+"""Geo-grid weather cache: nearby lookups share one upstream call, stale entries refresh in the background."""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import weather
+import weather_cache
+
+
+def _tool(tool):
+    return getattr(tool, "fn", tool)
+
+
+class _StubProvider:
+    """OpenWeatherMap-shaped stub that counts requests per path."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.fail = False
+        self.queries: list[tuple[str, dict]] = []
+
+    def serve(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                stub.queries.append((url.path, query))
+                time.sleep(stub.delay)
+                if stub.fail:
+                    body, status = b'{"message": "unauthorized"}', 401
+                elif url.path == "/data/2.5/weather":
+                    body = json.dumps({
+                        "name": "Ludhiana",
+                        "coord": {"lat": float(query["lat"]), "lon": float(query["lon"])},
+                        "sys": {"country": "IN"},
+                        "main": {"temp": 31.0, "humidity": 40},
+                        "weather": [{"main": "Clear", "description": "clear sky"}],
+                        "wind": {"speed": 2.0},
+                    }).encode()
+                    status = 200
+                elif url.path == "/data/3.0/onecall":
+                    body = json.dumps({
+                        "timezone": "Asia/Kolkata",
+                        "daily": [{"dt": 1761868800, "temp": {"min": 20, "max": 32}, "weather": []}],
+                    }).encode()
+                    status = 200
+                else:
+                    body, status = b"{}", 404
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    stub = _StubProvider()
+    server = stub.serve()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(weather, "OPENWEATHERMAP_BASE_URL", base)
+    monkeypatch.setattr(weather, "WEATHERAPI_BASE_URL", base)
+    monkeypatch.setattr(weather, "MAX_RETRIES", 1)
+    monkeypatch.setenv("OPENWEATHERMAP_API_KEY", "test-key")
+    monkeypatch.delenv("WEATHERAPI_KEY", raising=False)
+    monkeypatch.setattr(weather_cache, "_cache", weather_cache.GeoWeatherCache())
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+def test_snap_maps_nearby_points_to_one_cell():
+    assert weather_cache.snap(30.901, 0.05) == weather_cache.snap(30.949, 0.05) == 30.925
+    assert weather_cache.snap(30.951, 0.05) == 30.975
+    assert weather_cache.snap(-0.01, 0.05) == -0.025
+    assert weather_cache.snap(12.3456, 0) == 12.3456
+
+
+def test_nearby_concurrent_lookups_share_one_upstream_call(provider):
+    provider.delay = 0.2
+    current = _tool(weather.get_current_weather)
+
+    async def burst():
+        return await asyncio.gather(
+            *(current(lat=30.905 + i * 0.0008, lon=75.855 + i * 0.0008) for i in range(50))
+        )
+
+    results = asyncio.run(burst())
+    assert all(r["success"] for r in results)
+    assert len(provider.queries) == 1
+    path, query = provider.queries[0]
+    assert path == "/data/2.5/weather"
+    assert (query["lat"], query["lon"]) == ("30.925", "75.875")  # cell centre
+    assert {r["cache"]["status"] for r in results} == {"miss"}
+
+    again = asyncio.run(current(lat=30.93, lon=75.86))
+    assert again["cache"]["status"] == "hit"
+    assert len(provider.queries) == 1
+
+
+def test_cells_units_and_kinds_are_cached_separately(provider):
+    current = _tool(weather.get_current_weather)
+    forecast = _tool(weather.get_weather_forecast)
+
+    async def lookups():
+        await current(lat=30.91, lon=75.86)
+        await current(lat=31.20, lon=75.85)
+        await current(lat=30.91, lon=75.86, units="imperial")
+        await forecast(lat=30.91, lon=75.86)
+        await forecast(lat=30.94, lon=75.87)
+
+    asyncio.run(lookups())
+    paths = [path for path, _ in provider.queries]
+    assert paths.count("/data/2.5/weather") == 3
+    assert paths.count("/data/3.0/onecall") == 1
+
+
+def test_failures_are_not_cached(provider):
+    current = _tool(weather.get_current_weather)
+    provider.fail = True
+    first = asyncio.run(current(lat=30.91, lon=75.86))
+    assert first["success"] is False
+    assert "cache" not in first
+
+    provider.fail = False
+    second = asyncio.run(current(lat=30.91, lon=75.86))
+    assert second["success"] is True
+    assert second["cache"]["status"] == "miss"
+    assert len(provider.queries) == 2
+
+
+def test_stale_entry_is_served_while_one_refresh_runs():
+    now = [0.0]
+    cache = weather_cache.GeoWeatherCache(stale_sec=100, clock=lambda: now[0])
+    calls = []
+
+    async def loader():
+        calls.append(now[0])
+        await asyncio.sleep(0.05)
+        return {"success": True, "temp": len(calls)}
+
+    async def scenario():
+        first, status, _ = await cache.get(("k",), loader, ttl=10)
+        assert (first["temp"], status) == (1, "miss")
+
+        now[0] = 5
+        assert (await cache.get(("k",), loader, ttl=10))[1] == "hit"
+
+        now[0] = 50
+        stale = await asyncio.gather(*(cache.get(("k",), loader, ttl=10) for _ in range(10)))
+        assert {(v["temp"], s) for v, s, _ in stale} == {(1, "stale")}
+        await asyncio.sleep(0.1)
+
+        refreshed, status, _ = await cache.get(("k",), loader, ttl=10)
+        assert (refreshed["temp"], status) == (2, "hit")
+
+        now[0] = 500  # past ttl + stale window: callers wait for the reload
+        expired, status, _ = await cache.get(("k",), loader, ttl=10)
+        assert (expired["temp"], status) == (3, "miss")
+
+    asyncio.run(scenario())
+    assert len(calls) == 3
+
+
+def test_lru_bound():
+    cache = weather_cache.GeoWeatherCache(max_entries=2)
+
+    async def loader():
+        return {"success": True}
+
+    async def fill():
+        for key in ("a", "b", "a", "c"):
+            await cache.get((key,), loader, ttl=60)
+
+    asyncio.run(fill())
+    assert len(cache) == 2
+    assert ("b",) not in cache._entries
@@ -11,6 +11,7 @@ Features:
 - Multi-unit support (metric, imperial, standard)
 - Automatic fallback mechanism
 - Retry logic with exponential backoff
+- Geo-grid response cache with stale-while-revalidate (weather_cache.py)
 - ISO 8601 timestamps
 - Agricultural-relevant metrics
 
@@ -27,6 +28,8 @@ import logging
 import asyncio
 from datetime import datetime, timezone
 
+import weather_cache
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -38,6 +41,10 @@ MAX_RETRIES = 3
 INITIAL_BACKOFF = 0.5  # seconds
 TIMEOUT = 8  # seconds (reduced from 15s for better real-time performance)
 
+# Upstream base URLs (overridable for staging / local stubs)
+OPENWEATHERMAP_BASE_URL = os.getenv("OPENWEATHERMAP_BASE_URL", "https://api.openweathermap.org").rstrip("/")
+WEATHERAPI_BASE_URL = os.getenv("WEATHERAPI_BASE_URL", "https://api.weatherapi.com").rstrip("/")
+
 async def retry_with_backoff(func, *args, max_retries=MAX_RETRIES, **kwargs):
     """
     Retry an async function with exponential backoff.
@@ -149,12 +156,17 @@ async def get_weather_forecast(
     if (lat is None) != (lon is None):
         raise ValueError("Provide both 'lat' and 'lon' together, or neither.")
 
-    if use_fallback:
-        return await _get_forecast_from_weatherapi(
-            lat=lat, lon=lon, zip_code=zip_code, country_code=country_code,
-            units=units, lang=lang, days=days
-        )
-    else:
+    # Nearby farmers share one cached forecast per grid cell (see weather_cache)
+    location = weather_cache.location_key(lat, lon, zip_code, country_code)
+    if location and location[0] == "grid":
+        lat, lon = location[1], location[2]
+
+    async def fetch():
+        if use_fallback:
+            return await _get_forecast_from_weatherapi(
+                lat=lat, lon=lon, zip_code=zip_code, country_code=country_code,
+                units=units, lang=lang, days=days
+            )
         ow = await _get_forecast_from_openweathermap(
             lat=lat, lon=lon, zip_code=zip_code,
             country_code=country_code, units=units, lang=lang, days=days
@@ -167,6 +179,11 @@ async def get_weather_forecast(
             )
         return ow
 
+    return await weather_cache.cached_lookup(
+        "forecast", location, (units, lang, days, use_fallback), fetch,
+        weather_cache.TTL_FORECAST_SEC,
+    )
+
 async def _get_forecast_from_openweathermap(
     lat: Optional[float],
     lon: Optional[float],
@@ -187,7 +204,7 @@ async def _get_forecast_from_openweathermap(
     # 1) if we have no coordinates, first resolve zip -> coords
     if lat is None and lon is None:
         # reuse the current endpoint to resolve location
-        base = "https://api.openweathermap.org/data/2.5/weather"
+        base = f"{OPENWEATHERMAP_BASE_URL}/data/2.5/weather"
         params = {"appid": api_key, "units": units, "lang": lang}
         if zip_code:
             zip_code = zip_code.strip()
@@ -211,7 +228,7 @@ async def _get_forecast_from_openweathermap(
             return {"success": False, "error": "resolve_failed", "detail": str(e)}
 
     # 2) now call One Call
-    onecall_base = "https://api.openweathermap.org/data/3.0/onecall"
+    onecall_base = f"{OPENWEATHERMAP_BASE_URL}/data/3.0/onecall"
     oc_params = {
         "appid": api_key,
         "lat": lat,
@@ -312,7 +329,7 @@ async def _get_forecast_from_weatherapi(
     supported_langs = {"en","ar","bn","bg","zh","cs","nl","fi","fr","de","el","hi","hu","it","ja","jv","ko","mr","pl","pt","pa","ro","ru","sr","si","sk","es","sv","ta","te","tr","uk","ur","vi","zh_cn","zh_tw","zu"}
     weatherapi_lang = lang if lang in supported_langs else "en"
 
-    base = "https://api.weatherapi.com/v1/forecast.json"
+    base = f"{WEATHERAPI_BASE_URL}/v1/forecast.json"
     params = {
         "key": api_key,
         "q": loc,
@@ -451,12 +468,18 @@ async def get_current_weather(
     if country_code is None:
         country_code = ""
     
+    # Nearby farmers share one cached reading per grid cell (see weather_cache)
+    location = weather_cache.location_key(lat, lon, zip_code, country_code)
+    if location and location[0] == "grid":
+        lat, lon = location[1], location[2]
+
     # Route to chosen backend
-    if use_fallback:
-        # User explicitly wants WeatherAPI as primary
-        logger.info("Using WeatherAPI as primary source (use_fallback=True)")
-        return await _get_weather_from_weatherapi(lat=lat, lon=lon, zip_code=zip_code, country_code=country_code, units=units, lang=lang)
-    else:
+    async def fetch():
+        if use_fallback:
+            # User explicitly wants WeatherAPI as primary
+            logger.info("Using WeatherAPI as primary source (use_fallback=True)")
+            return await _get_weather_from_weatherapi(lat=lat, lon=lon, zip_code=zip_code, country_code=country_code, units=units, lang=lang)
+
         # Try OpenWeatherMap first, fallback to WeatherAPI on error
         result = await _get_weather_from_openweathermap(
             lat=lat, lon=lon, zip_code=zip_code, 
@@ -470,6 +493,11 @@ async def get_current_weather(
         
         return result
 
+    return await weather_cache.cached_lookup(
+        "current", location, (units, lang, use_fallback), fetch,
+        weather_cache.TTL_CURRENT_SEC,
+    )
+
 
 async def _get_weather_from_openweathermap(
     lat: Optional[float], 
@@ -489,7 +517,7 @@ async def _get_weather_from_openweathermap(
             "hint": "Set environment variable OPENWEATHERMAP_API_KEY or call with use_fallback=True for WeatherAPI.com"
         }
 
-    base = "https://api.openweathermap.org/data/2.5/weather"
+    base = f"{OPENWEATHERMAP_BASE_URL}/data/2.5/weather"
     params = {"appid": api_key, "units": units, "lang": lang}
     
     # Determine location query method (priority: lat/lon > zip)
@@ -645,7 +673,7 @@ async def _get_weather_from_weatherapi(
         }
 
     # Security: Use HTTPS instead of HTTP
-    base = "https://api.weatherapi.com/v1/current.json"
+    base = f"{WEATHERAPI_BASE_URL}/v1/current.json"
     
     # Determine location query
     if lat is not None and lon is not None:
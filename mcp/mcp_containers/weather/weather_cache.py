@@ -0,0 +1,180 @@
+"""
+Geo-grid cache for weather lookups.
+
+Farmers in the same district ask for the same weather within minutes, so
+results are shared per grid cell: coordinates are snapped to a
+WEATHER_CACHE_GRID_DEG grid (0.05° ≈ 5.5 km) and the upstream call is made
+for the cell centre. Each entry is
+
+- fresh for its TTL (served straight from memory),
+- then stale for WEATHER_CACHE_STALE_SEC (served immediately while one
+  background task refreshes it),
+- then expired (callers wait for a refresh).
+
+Concurrent misses on one key share a single upstream call. Failed lookups
+(``success`` is False) are never cached.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+GRID_DEG = float(os.getenv("WEATHER_CACHE_GRID_DEG", "0.05"))
+TTL_CURRENT_SEC = float(os.getenv("WEATHER_CACHE_TTL_CURRENT_SEC", "600"))
+TTL_FORECAST_SEC = float(os.getenv("WEATHER_CACHE_TTL_FORECAST_SEC", "1800"))
+STALE_SEC = float(os.getenv("WEATHER_CACHE_STALE_SEC", "1800"))
+MAX_ENTRIES = int(os.getenv("WEATHER_CACHE_MAX_ENTRIES", "5000"))
+CACHE_ENABLED = os.getenv("WEATHER_CACHE_ENABLED", "true").strip().lower() in ("1", "true", "yes")
+
+
+def snap(value: float, grid: float = GRID_DEG) -> float:
+    """Centre of the grid cell holding ``value``."""
+    if grid <= 0:
+        return value
+    return round((math.floor(value / grid) + 0.5) * grid, 6)
+
+
+class _Entry:
+    __slots__ = ("value", "fetched_at")
+
+    def __init__(self, value: dict, fetched_at: float):
+        self.value = value
+        self.fetched_at = fetched_at
+
+
+class GeoWeatherCache:
+    """TTL + stale-while-revalidate cache with single-flight loads."""
+
+    def __init__(
+        self,
+        *,
+        stale_sec: float = STALE_SEC,
+        max_entries: int = MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.stale_sec = stale_sec
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[tuple, _Entry]" = OrderedDict()
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._background: set[asyncio.Task] = set()
+        self.upstream_calls = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _store(self, key: tuple, value: dict) -> None:
+        self._entries[key] = _Entry(value, self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _load(self, key: tuple, loader: Callable[[], Awaitable[dict]]) -> dict:
+        """Run ``loader`` once per key at a time; other callers await the same result."""
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            return await asyncio.shield(pending)
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            self.upstream_calls += 1
+            value = await loader()
+            if isinstance(value, dict) and value.get("success", True):
+                self._store(key, value)
+            future.set_result(value)
+            return value
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                # retrieved by waiters, if any; avoid "exception never retrieved"
+                future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _refresh_in_background(self, key: tuple, loader: Callable[[], Awaitable[dict]]) -> None:
+        if key in self._inflight:
+            return
+
+        async def refresh():
+            try:
+                await self._load(key, loader)
+            except Exception as exc:
+                logger.warning(f"Background weather refresh failed for {key}: {exc}")
+
+        task = asyncio.create_task(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def get(
+        self,
+        key: tuple,
+        loader: Callable[[], Awaitable[dict]],
+        ttl: float,
+    ) -> tuple[dict, str, float]:
+        """Return (value, cache_status, age_sec); status is hit, stale or miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self._clock() - entry.fetched_at
+            if age < ttl:
+                self._entries.move_to_end(key)
+                return entry.value, "hit", age
+            if age < ttl + self.stale_sec:
+                self._refresh_in_background(key, loader)
+                return entry.value, "stale", age
+        value = await self._load(key, loader)
+        return value, "miss", 0.0
+
+
+_cache = GeoWeatherCache()
+
+
+def location_key(
+    lat: Optional[float],
+    lon: Optional[float],
+    zip_code: Optional[str],
+    country_code: Optional[str],
+) -> Optional[tuple]:
+    """Grid cell for coordinates, or the normalized ZIP; None if uncached."""
+    if not CACHE_ENABLED:
+        return None
+    if lat is not None and lon is not None:
+        return ("grid", snap(lat), snap(lon))
+    if zip_code:
+        return ("zip", zip_code.strip().upper(), (country_code or "").strip().upper())
+    return None
+
+
+async def cached_lookup(
+    kind: str,
+    location: Optional[tuple],
+    options: tuple,
+    loader: Callable[[], Awaitable[dict]],
+    ttl: float,
+) -> dict:
+    """Serve ``loader``'s result through the shared cache and tag it with cache metadata."""
+    if location is None:
+        return await loader()
+    value, status, age = await _cache.get((kind, *location, *options), loader, ttl)
+    if not isinstance(value, dict) or not value.get("success", True):
+        return value
+    tagged = dict(value)
+    tagged["cache"] = {
+        "status": status,
+        "age_sec": round(age, 1),
+        "ttl_sec": ttl,
+        "grid_deg": GRID_DEG if location[0] == "grid" else None,
+    }
+    return tagged
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-import re
 from typing import Any
 
 import httpx
 
+import scrape_store
+from html_parser import AZADPUR_DATE_RE, parse_azadpur_html
+
 # ================= MCP (OPTIONAL) =================
 try:
     from mcp.server.fastmcp import FastMCP
@@ -18,6 +20,10 @@ except ImportError:
 
 BASE_URL = "https://www.apmcazadpurdelhi.com/"
 
+# scrape_store key; the page has no filters, so one snapshot covers it
+STORE_SOURCE = "azadpur"
+STORE_SCOPE = ""
+
 TIMEOUT = 30
 RETRIES = 3
 
@@ -43,7 +49,7 @@ def extract_date(text: str) -> str:
     Extract date like:
     Dated:23/04/2026
     """
-    match = re.search(r"Dated:(\d{2}/\d{2}/\d{4})", text)
+    match = AZADPUR_DATE_RE.search(text)
 
     if match:
         return match.group(1)
@@ -53,90 +59,92 @@ def extract_date(text: str) -> str:
 
 # ================= CORE REQUEST =================
 
-async def _request() -> dict[str, Any]:
+async def _fetch_html() -> str:
     for i in range(RETRIES):
         try:
             async with httpx.AsyncClient(timeout=TIMEOUT) as client:
                 response = await client.get(BASE_URL)
                 response.raise_for_status()
+                return response.text
 
-                html = response.text
-
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(html, "html.parser")
-
-                parsed_data = []
-
-                body = soup.find("body")
-                body_text = body.get_text(" ", strip=True) if body else ""
-
-                arrival_date = extract_date(body_text)
-
-                price_items = soup.select(".price-item")
-
-                for item in price_items:
-                    commodity_tag = item.select_one(".comm-name")
-                    min_tag = item.select_one(".comm-min")
-                    max_tag = item.select_one(".comm-max")
-
-                    commodity = (
-                        commodity_tag.get_text(strip=True)
-                        if commodity_tag
-                        else ""
-                    )
-
-                    min_price = safe_float(
-                        min_tag.get_text(strip=True)
-                        if min_tag
-                        else ""
-                    )
-
-                    max_price = safe_float(
-                        max_tag.get_text(strip=True)
-                        if max_tag
-                        else ""
-                    )
-
-                    modal_price = round(
-                        (min_price + max_price) / 2,
-                        2
-                    )
-
-                    parsed_data.append(
-                        {
-                            "state": "Delhi",
-                            "district": "Azadpur",
-                            "market": "Azadpur Mandi",
-                            "commodity": commodity,
-                            "arrival_date": arrival_date,
-                            "min_price": min_price,
-                            "max_price": max_price,
-                            "modal_price": modal_price,
-                            "source": "APMC Azadpur",
-                        }
-                    )
-
-                return {
-                    "success": True,
-                    "count": len(parsed_data),
-                    "data": parsed_data,
-                }
-
-        except Exception as e:
+        except Exception:
             if i == RETRIES - 1:
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "data": [],
-                }
+                raise
 
             await asyncio.sleep(0.5 * (2 ** i))
 
 
+def parse_prices(html: str) -> list[dict[str, Any]]:
+    """
+    Azadpur page -> normalized price rows
+    """
+
+    page = parse_azadpur_html(html)
+    parsed_data = []
+
+    for item in page["data"]:
+        min_price = safe_float(item["min_price"])
+        max_price = safe_float(item["max_price"])
+
+        parsed_data.append(
+            {
+                "state": "Delhi",
+                "district": "Azadpur",
+                "market": "Azadpur Mandi",
+                "commodity": item["commodity"],
+                "arrival_date": page["date"],
+                "min_price": min_price,
+                "max_price": max_price,
+                "modal_price": round(
+                    (min_price + max_price) / 2,
+                    2
+                ),
+                "source": "APMC Azadpur",
+            }
+        )
+
+    return parsed_data
+
+
+async def _request() -> dict[str, Any]:
+    try:
+        parsed_data = parse_prices(await _fetch_html())
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "data": [],
+        }
+
+    return {
+        "success": True,
+        "count": len(parsed_data),
+        "data": parsed_data,
+    }
+
+
+async def refresh_azadpur_prices() -> dict[str, Any]:
+    """
+    Scrape the page now and replace the stored snapshot.
+    Used by the background ingester and on stale/missing snapshots.
+    """
+
+    response = await _request()
+    store = scrape_store.get_store()
+
+    if response.get("success"):
+        store.replace_snapshot(STORE_SOURCE, STORE_SCOPE, response["data"])
+    else:
+        store.record_failure(STORE_SOURCE, STORE_SCOPE, response.get("error", ""))
+
+    return response
+
+
 # ================= BUSINESS LOGIC =================
 
 async def fetch_azadpur_mandi_prices(
     commodity: str | None = None,
+    refresh: bool = False,
 ) -> dict[str, Any]:
     """
     Fetch mandi price data from APMC Azadpur.
@@ -152,31 +160,38 @@ async def fetch_azadpur_mandi_prices(
 
     Parameters:
     - commodity (e.g. "Brinjal", "Tomato")
+    - refresh: scrape the page now instead of using the stored copy
 
+    Prices are served from the scrape store kept current by
+    scrape_ingester; "freshness" says when they were scraped.
     """
 
-    response = await _request()
+    store = scrape_store.get_store()
+    snapshot = store.snapshot(STORE_SOURCE, STORE_SCOPE)
 
-    if not response.get("success"):
-        return response
+    if refresh or snapshot is None or not snapshot.is_fresh():
+        # on failure the previous snapshot is served, marked stale
+        response = await refresh_azadpur_prices()
+        snapshot = store.snapshot(STORE_SOURCE, STORE_SCOPE)
+        if snapshot is None:
+            return response
 
-    data = response.get("data", [])
+    data = snapshot.rows
 
     if commodity:
-        filtered = [
+        data = [
             item
             for item in data
             if commodity.lower()
             in item.get("commodity", "").lower()
         ]
 
-        return {
-            "success": True,
-            "count": len(filtered),
-            "data": filtered,
-        }
-
-    return response
+    return {
+        "success": True,
+        "count": len(data),
+        "data": data,
+        "freshness": snapshot.freshness(),
+    }
 
 
 if mcp:
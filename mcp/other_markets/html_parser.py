@@ -134,4 +134,68 @@ def karnatak_state_daily(html_content: str) -> list[dict]:
         else:
             rows.append(dict(zip(headers, values)))
     
-    return rows
\ No newline at end of file
+    return rows
+
+AZADPUR_DATE_RE = re.compile(r"Dated:(\d{2}/\d{2}/\d{4})")
+
+SPICES_BOARD_HEADERS = [
+    "date",
+    "spice",
+    "market",
+    "state",
+    "grade",
+    "price_source",
+    "min_price",
+    "max_price",
+    "avg_price",
+]
+
+
+def parse_azadpur_html(html_content: str) -> dict:
+    """
+    APMC Azadpur home page -> {"date": "23/04/2026", "data": [{commodity, min_price, max_price}]}
+    Prices are returned as the raw cell text.
+    """
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    body = soup.find("body")
+    body_text = body.get_text(" ", strip=True) if body else ""
+    match = AZADPUR_DATE_RE.search(body_text)
+
+    rows = []
+    for item in soup.select(".price-item"):
+        def text(selector):
+            tag = item.select_one(selector)
+            return tag.get_text(strip=True) if tag else ""
+
+        rows.append({
+            "commodity": text(".comm-name"),
+            "min_price": text(".comm-min"),
+            "max_price": text(".comm-max"),
+        })
+
+    return {
+        "date": match.group(1) if match else "",
+        "data": rows,
+    }
+
+
+def parse_spices_board_html(html_content: str) -> list[dict] | None:
+    """
+    Spices Board current-market-price page -> rows keyed by SPICES_BOARD_HEADERS.
+    Returns None when the page has no price table; malformed rows are skipped.
+    """
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    table = soup.find("table")
+    if not table:
+        return None
+
+    rows = []
+    for tr in table.find_all("tr")[1:]:
+        cells = [cell.text.strip() for cell in tr.find_all("td")]
+        if len(cells) != len(SPICES_BOARD_HEADERS):
+            continue
+        rows.append(dict(zip(SPICES_BOARD_HEADERS, cells)))
+
+    return rows
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import time
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -28,6 +30,20 @@ BASE_URL = f"https://api.data.gov.in/resource/{RESOURCE_ID}"
 TIMEOUT = 30
 RETRIES = 3
 
+# Records per page and the most records one query collects; paging stops
+# once this many rows for the requested arrival date have been seen.
+# The defaults keep data.gov.in's own 10-row page: rows go straight into
+# the tool output, so raise DATA_GOV_MAX_RECORDS deliberately.
+PAGE_SIZE = int(os.getenv("DATA_GOV_PAGE_SIZE", "10"))
+MAX_RECORDS = int(os.getenv("DATA_GOV_MAX_RECORDS", "10"))
+
+# Mandi data is published a few times a day: today's answers are cached
+# briefly, recent days longer, older dates (which no longer change) longest.
+CACHE_TTL_TODAY_SEC = float(os.getenv("DATA_GOV_CACHE_TTL_TODAY_SEC", "900"))
+CACHE_TTL_RECENT_SEC = float(os.getenv("DATA_GOV_CACHE_TTL_RECENT_SEC", "3600"))
+CACHE_TTL_PAST_SEC = float(os.getenv("DATA_GOV_CACHE_TTL_PAST_SEC", "86400"))
+CACHE_MAX_ENTRIES = int(os.getenv("DATA_GOV_CACHE_MAX_ENTRIES", "1024"))
+
 
 # ================= VALIDATION =================
 
@@ -121,70 +137,220 @@ def _parse_dd_mm_yyyy(value: str) -> datetime | None:
         return None
 
 
+# ================= HTTP CLIENT =================
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    One pooled client per event loop (keeps TLS connections to data.gov.in alive)
+    """
+
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=TIMEOUT,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose_client() -> None:
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+# ================= RESPONSE CACHE =================
+
+_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_inflight: dict[tuple, asyncio.Future] = {}
+
+
+def _cache_key(params: dict[str, Any]) -> tuple:
+    return tuple(
+        sorted(
+            (key, " ".join(str(value).split()))
+            for key, value in params.items()
+            if value not in (None, "")
+        )
+    )
+
+
+def _cache_ttl(arrival_date: str | None) -> float:
+    requested = _parse_dd_mm_yyyy(arrival_date or "")
+    if requested is None:
+        return CACHE_TTL_TODAY_SEC
+    days_old = (datetime.now().date() - requested.date()).days
+    if days_old <= 0:
+        return CACHE_TTL_TODAY_SEC
+    if days_old <= 2:
+        return CACHE_TTL_RECENT_SEC
+    return CACHE_TTL_PAST_SEC
+
+
+def _cache_get(key: tuple) -> dict[str, Any] | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        _cache.pop(key, None)
+        return None
+    return entry[1]
+
+
+def _cache_set(key: tuple, response: dict[str, Any], ttl: float) -> None:
+    if ttl <= 0:
+        return
+    if len(_cache) >= CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        for stale in [k for k, (expires, _) in _cache.items() if expires <= now]:
+            del _cache[stale]
+        if len(_cache) >= CACHE_MAX_ENTRIES:
+            del _cache[min(_cache, key=lambda k: _cache[k][0])]
+    _cache[key] = (time.monotonic() + ttl, response)
+
+
+def clear_cache() -> None:
+    _cache.clear()
+
+
 # ================= CORE REQUEST =================
 
-async def _request(params: dict[str, Any]) -> dict[str, Any]:
-    query = {
-        "api-key": API_KEY,
-        "format": "json",
-        **params,
+def _clean_record(r: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "state": r.get("State"),
+        "district": r.get("District"),
+        "market": r.get("Market"),
+        "commodity": r.get("Commodity"),
+        "arrival_date": r.get("Arrival_Date"),
+        "min_price": r.get("Min_Price"),
+        "max_price": r.get("Max_Price"),
+        "modal_price": r.get("Modal_Price"),
     }
 
+
+async def _get_page(query: dict[str, Any]) -> dict[str, Any]:
+    """
+    One data.gov.in page, retried on transport/HTTP errors
+    """
+
+    client = _get_client()
     for i in range(RETRIES):
         try:
-            async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-                response = await client.get(BASE_URL, params=query)
-                response.raise_for_status()
-
-                api_response = response.json()
-                if api_response.get("error"):
-                    return {
-                        "success": False,
-                        "error_type": "data_gov_api_error",
-                        "error": api_response.get("error"),
-                        "api_response": api_response,
-                    }
+            response = await client.get(BASE_URL, params=query)
+            response.raise_for_status()
+            return response.json()
 
-                # Correct key from API response
-                records = api_response.get("records", [])
-
-                cleaned = [
-                    {
-                        "state": r.get("State"),
-                        "district": r.get("District"),
-                        "market": r.get("Market"),
-                        "commodity": r.get("Commodity"),
-                        "arrival_date": r.get("Arrival_Date"),
-                        "min_price": r.get("Min_Price"),
-                        "max_price": r.get("Max_Price"),
-                        "modal_price": r.get("Modal_Price"),
-                    }
-                    for r in records
-                ]
-                requested_arrival_date = params.get("filters[Arrival_Date]")
-                if requested_arrival_date:
-                    cleaned = [
-                        row
-                        for row in cleaned
-                        if row.get("arrival_date") == requested_arrival_date
-                    ]
+        except Exception:
+            if i == RETRIES - 1:
+                raise
 
-                return {
-                    "success": True,
-                    "total": api_response.get("total", 0),
-                    "count": len(cleaned),
-                    "data": cleaned,
-                }
+            await asyncio.sleep(0.5 * (2 ** i))
 
-        except Exception as e:
-            if i == RETRIES - 1:
+
+async def _fetch(params: dict[str, Any]) -> dict[str, Any]:
+    requested_arrival_date = params.get("filters[Arrival_Date]")
+    offset = int(params.get("offset") or 0)
+    cleaned: list[dict[str, Any]] = []
+    total = 0
+
+    try:
+        while True:
+            api_response = await _get_page({
+                "api-key": API_KEY,
+                "format": "json",
+                **params,
+                "offset": offset,
+                "limit": PAGE_SIZE,
+            })
+            if api_response.get("error"):
                 return {
                     "success": False,
-                    "error_type": "request_failed",
-                    "error": str(e),
+                    "error_type": "data_gov_api_error",
+                    "error": api_response.get("error"),
+                    "api_response": api_response,
                 }
 
-            await asyncio.sleep(0.5 * (2 ** i))
+            # Correct key from API response
+            records = api_response.get("records", [])
+            total = int(api_response.get("total") or 0)
+
+            # the API filter is the primary one; this guards against loose matches
+            for record in records:
+                row = _clean_record(record)
+                if not requested_arrival_date or row.get("arrival_date") == requested_arrival_date:
+                    cleaned.append(row)
+
+            offset += len(records)
+            if (
+                len(cleaned) >= MAX_RECORDS
+                or len(records) < PAGE_SIZE
+                or offset >= total
+            ):
+                break
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error_type": "request_failed",
+            "error": str(e),
+        }
+
+    cleaned = cleaned[:MAX_RECORDS]
+    return {
+        "success": True,
+        "total": total,
+        "count": len(cleaned),
+        "data": cleaned,
+    }
+
+
+async def _request(params: dict[str, Any]) -> dict[str, Any]:
+    """
+    Cached, de-duplicated data.gov.in query.
+
+    Identical queries (same normalized params) in flight at the same time
+    share one upstream call; successful answers are cached with a TTL that
+    depends on how old the requested arrival date is.
+    """
+
+    # callers annotate the response (fallback_info etc.), so hand out copies
+    key = _cache_key(params)
+    cached = _cache_get(key)
+    if cached is not None:
+        return dict(cached)
+
+    loop = asyncio.get_running_loop()
+    pending = _inflight.get(key)
+    if pending is not None and pending.get_loop() is loop:
+        return dict(await asyncio.shield(pending))
+
+    future: asyncio.Future = loop.create_future()
+    _inflight[key] = future
+    try:
+        response = await _fetch(params)
+        if response.get("success"):
+            _cache_set(key, response, _cache_ttl(params.get("filters[Arrival_Date]")))
+        future.set_result(response)
+        return dict(response)
+    except BaseException as e:
+        if not future.done():
+            future.set_result({
+                "success": False,
+                "error_type": "request_failed",
+                "error": str(e) or type(e).__name__,
+            })
+        raise
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
 
 # ================= BUSINESS LOGIC =================
 
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import threading
+from typing import Any
+
+import scrape_store
+from azadpur_apmc import refresh_azadpur_prices
+from spices_board import refresh_spices_board_prices
+
+logger = logging.getLogger(__name__)
+
+
+# ================= CONFIG =================
+
+# Scrape cadence for the background ingester.
+INGEST_INTERVAL_SEC = float(os.getenv("SCRAPE_INGEST_INTERVAL_SEC", "1800"))
+
+INGEST_ENABLED = os.getenv("SCRAPE_INGEST_ENABLED", "true").strip().lower() in ("1", "true", "yes")
+
+# States scraped from the Spices Board each cycle (all spices per state).
+SPICES_STATES = [
+    s.strip()
+    for s in os.getenv(
+        "SCRAPE_SPICES_STATES",
+        "KERALA,KARNATAKA,TAMIL NADU,ANDHRA PRADESH,TELANGANA,MADHYA PRADESH,"
+        "RAJASTHAN,GUJARAT,ASSAM,SIKKIM,MAHARASHTRA,DELHI",
+    ).split(",")
+    if s.strip()
+]
+
+
+# ================= INGESTION =================
+
+async def ingest_once(
+    sources: str = "all",
+    states: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Scrape every configured page once and store the parsed rows.
+
+    sources: "all", "azadpur" or "spices_board"
+    Returns {source/scope: {success, count[, error]}}
+    """
+
+    jobs: dict[str, Any] = {}
+
+    if sources in ("all", "azadpur"):
+        jobs["azadpur"] = refresh_azadpur_prices()
+
+    if sources in ("all", "spices_board"):
+        for state in states or SPICES_STATES:
+            jobs[f"spices_board/{state}"] = refresh_spices_board_prices(state)
+
+    results = await asyncio.gather(*jobs.values(), return_exceptions=True)
+
+    summary = {}
+    for name, result in zip(jobs, results):
+        if isinstance(result, Exception):
+            summary[name] = {"success": False, "count": 0, "error": str(result)}
+        else:
+            summary[name] = {
+                "success": bool(result.get("success")),
+                "count": len(result.get("data") or []),
+            }
+            if not result.get("success"):
+                summary[name]["error"] = result.get("error", "")
+
+    failed = [name for name, item in summary.items() if not item["success"]]
+    logger.info(
+        "Scrape ingest: %d pages, %d failed%s",
+        len(summary),
+        len(failed),
+        f" ({', '.join(failed)})" if failed else "",
+    )
+    return summary
+
+
+class ScrapeIngester:
+    """
+    Runs ingest_once every interval_sec on a daemon thread with its own event loop
+    """
+
+    def __init__(self, interval_sec: float = INGEST_INTERVAL_SEC):
+        self.interval_sec = interval_sec
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.cycles = 0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name="scrape-ingester",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                asyncio.run(ingest_once())
+            except Exception:
+                logger.exception("Scrape ingest cycle failed")
+            self.cycles += 1
+            self._stop.wait(self.interval_sec)
+
+
+_ingester: ScrapeIngester | None = None
+
+
+def start_background_ingester() -> ScrapeIngester | None:
+    global _ingester
+    if not INGEST_ENABLED or INGEST_INTERVAL_SEC <= 0:
+        return None
+    if _ingester is None:
+        _ingester = ScrapeIngester()
+        _ingester.start()
+    return _ingester
+
+
+# ================= CLI =================
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Scrape Azadpur APMC and Spices Board prices into the local store",
+    )
+    parser.add_argument("command", choices=("once", "run", "status"))
+    parser.add_argument(
+        "--source",
+        choices=("all", "azadpur", "spices_board"),
+        default="all",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "once":
+        print(json.dumps(asyncio.run(ingest_once(args.source)), indent=2))
+    elif args.command == "status":
+        print(json.dumps(scrape_store.get_store().status(), indent=2))
+    else:
+        ingester = ScrapeIngester()
+        ingester._run()
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(main())
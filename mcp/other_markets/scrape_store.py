@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+# ================= CONFIG =================
+
+# Scraped price pages (Azadpur, Spices Board) are stored here by the
+# background ingester and read back by the tools.
+STORE_PATH = os.getenv(
+    "SCRAPE_STORE_PATH",
+    str(Path(__file__).with_name(".cache") / "scrape_prices.sqlite3"),
+)
+
+# A snapshot older than this is refreshed on the next tool call.
+MAX_AGE_SEC = float(os.getenv("SCRAPE_MAX_AGE_SEC", "3600"))
+
+ROW_FIELDS = (
+    "state",
+    "district",
+    "market",
+    "commodity",
+    "arrival_date",
+    "min_price",
+    "max_price",
+    "modal_price",
+    "grade",
+    "price_source",
+    "source",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrape_rows (
+    source       TEXT NOT NULL,
+    scope        TEXT NOT NULL,
+    state        TEXT,
+    district     TEXT,
+    market       TEXT,
+    commodity    TEXT,
+    arrival_date TEXT,
+    min_price    REAL,
+    max_price    REAL,
+    modal_price  REAL,
+    grade        TEXT,
+    price_source TEXT,
+    row_source   TEXT,
+    fetched_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scrape_rows_scope ON scrape_rows (source, scope);
+CREATE TABLE IF NOT EXISTS scrape_fetches (
+    source          TEXT NOT NULL,
+    scope           TEXT NOT NULL,
+    fetched_at      REAL,
+    row_count       INTEGER NOT NULL DEFAULT 0,
+    last_attempt_at REAL NOT NULL,
+    last_error      TEXT,
+    PRIMARY KEY (source, scope)
+);
+"""
+
+
+# ================= MODELS =================
+
+def _iso(ts: float | None) -> str | None:
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass
+class Snapshot:
+    """
+    Rows from the last successful scrape of one (source, scope)
+    """
+
+    source: str
+    scope: str
+    rows: list[dict[str, Any]]
+    fetched_at: float
+    last_attempt_at: float
+    last_error: str | None
+
+    @property
+    def age_sec(self) -> float:
+        return max(0.0, time.time() - self.fetched_at)
+
+    def is_fresh(self, max_age_sec: float | None = None) -> bool:
+        limit = MAX_AGE_SEC if max_age_sec is None else max_age_sec
+        return self.age_sec < limit
+
+    def freshness(self, max_age_sec: float | None = None) -> dict[str, Any]:
+        info = {
+            "fetched_at": _iso(self.fetched_at),
+            "age_sec": round(self.age_sec),
+            "stale": not self.is_fresh(max_age_sec),
+        }
+        if self.last_error and self.last_attempt_at > self.fetched_at:
+            info["last_error"] = self.last_error
+            info["last_attempt_at"] = _iso(self.last_attempt_at)
+        return info
+
+
+# ================= STORE =================
+
+class ScrapeStore:
+    """
+    SQLite store of normalized scraped rows, one snapshot per (source, scope)
+    """
+
+    def __init__(self, path: str | Path = STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.path), timeout=10.0)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def replace_snapshot(
+        self,
+        source: str,
+        scope: str,
+        rows: list[dict[str, Any]],
+        fetched_at: float | None = None,
+    ) -> int:
+        """
+        Swap in the rows of a successful scrape; returns rows stored
+        """
+
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        values = [
+            (
+                source,
+                scope,
+                *(row.get(field) for field in ROW_FIELDS),
+                fetched_at,
+            )
+            for row in rows
+        ]
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "DELETE FROM scrape_rows WHERE source = ? AND scope = ?",
+                (source, scope),
+            )
+            conn.executemany(
+                "INSERT INTO scrape_rows (source, scope, state, district, market, commodity, "
+                "arrival_date, min_price, max_price, modal_price, grade, price_source, "
+                "row_source, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                values,
+            )
+            conn.execute(
+                "INSERT INTO scrape_fetches (source, scope, fetched_at, row_count, last_attempt_at, last_error) "
+                "VALUES (?, ?, ?, ?, ?, NULL) "
+                "ON CONFLICT (source, scope) DO UPDATE SET fetched_at = excluded.fetched_at, "
+                "row_count = excluded.row_count, last_attempt_at = excluded.last_attempt_at, last_error = NULL",
+                (source, scope, fetched_at, len(values), fetched_at),
+            )
+        return len(values)
+
+    def record_failure(self, source: str, scope: str, error: str) -> None:
+        """
+        Note a failed scrape; the previous snapshot (if any) is kept
+        """
+
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO scrape_fetches (source, scope, fetched_at, row_count, last_attempt_at, last_error) "
+                "VALUES (?, ?, NULL, 0, ?, ?) "
+                "ON CONFLICT (source, scope) DO UPDATE SET last_attempt_at = excluded.last_attempt_at, "
+                "last_error = excluded.last_error",
+                (source, scope, now, error),
+            )
+
+    def snapshot(self, source: str, scope: str) -> Snapshot | None:
+        with self._connect() as conn:
+            fetch = conn.execute(
+                "SELECT fetched_at, last_attempt_at, last_error FROM scrape_fetches "
+                "WHERE source = ? AND scope = ?",
+                (source, scope),
+            ).fetchone()
+            if fetch is None or fetch["fetched_at"] is None:
+                return None
+            rows = conn.execute(
+                "SELECT * FROM scrape_rows WHERE source = ? AND scope = ? ORDER BY rowid",
+                (source, scope),
+            ).fetchall()
+
+        data = []
+        for row in rows:
+            item = {field: row[field] for field in ROW_FIELDS if field != "source"}
+            for optional in ("grade", "price_source"):
+                if item[optional] is None:
+                    del item[optional]
+            item["source"] = row["row_source"]
+            data.append(item)
+        return Snapshot(
+            source=source,
+            scope=scope,
+            rows=data,
+            fetched_at=fetch["fetched_at"],
+            last_attempt_at=fetch["last_attempt_at"],
+            last_error=fetch["last_error"],
+        )
+
+    def status(self) -> list[dict[str, Any]]:
+        """
+        Freshness of every stored (source, scope)
+        """
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM scrape_fetches ORDER BY source, scope"
+            ).fetchall()
+        return [
+            {
+                "source": row["source"],
+                "scope": row["scope"],
+                "fetched_at": _iso(row["fetched_at"]),
+                "row_count": row["row_count"],
+                "last_attempt_at": _iso(row["last_attempt_at"]),
+                "last_error": row["last_error"],
+            }
+            for row in rows
+        ]
+
+
+_store: ScrapeStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> ScrapeStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ScrapeStore()
+    return _store
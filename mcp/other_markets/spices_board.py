@@ -112,10 +112,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from datetime import date, datetime
 from typing import Any
 
 import httpx
-from bs4 import BeautifulSoup
+
+import scrape_store
+from html_parser import parse_spices_board_html
 
 # ================= MCP (OPTIONAL) =================
 try:
@@ -141,6 +144,12 @@ BASE_URL = (
 TIMEOUT = 30
 RETRIES = 3
 
+# scrape_store key; one snapshot per (state, dateFrom), all spices
+STORE_SOURCE = "spices_board"
+
+# Row dates on the page ("Date" column) and dateFrom as callers pass it
+ROW_DATE_FORMATS = ("%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y")
+
 
 # ================= HELPERS =================
 
@@ -180,36 +189,36 @@ def normalize_row(row_data: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-# ================= CORE REQUEST =================
+def parse_row_date(value: str) -> date | None:
+    for fmt in ROW_DATE_FORMATS:
+        try:
+            return datetime.strptime((value or "").strip(), fmt).date()
+        except ValueError:
+            continue
+    return None
 
-async def _request(
-    state: str,
-    spice: str = "",
-    arrival_date: str = "",
-) -> dict[str, Any]:
+
+def rows_since(rows: list[dict[str, Any]], arrival_date: str) -> list[dict[str, Any]] | None:
     """
-    Internal request handler for Indian Spices Board.
+    Rows dated on or after arrival_date (the page's dateFrom filter),
+    or None when the rows do not reach back that far and a dated scrape
+    is needed.
     """
 
-    params = {
-        "filterState": state,
-        "filterSpice": spice,
-        "dateFrom": arrival_date,
-        "dateTo": "",
-    }
+    since = parse_row_date(arrival_date)
+    dates = [parse_row_date(row.get("arrival_date", "")) for row in rows]
+    if since is None or not dates or None in dates or since < min(dates):
+        return None
+    return [row for row, day in zip(rows, dates) if day >= since]
 
-    headers = [
-        "date",
-        "spice",
-        "market",
-        "state",
-        "grade",
-        "price_source",
-        "min_price",
-        "max_price",
-        "avg_price",
-    ]
 
+# ================= CORE REQUEST =================
+
+def store_scope(state: str, arrival_date: str = "") -> str:
+    return f"{state.strip().upper()}|{arrival_date}"
+
+
+async def _fetch_html(params: dict[str, str]) -> str:
     for attempt in range(RETRIES):
         try:
             async with httpx.AsyncClient(timeout=TIMEOUT) as client:
@@ -219,79 +228,89 @@ async def _request(
                 )
 
                 response.raise_for_status()
+                return response.text
 
-                html_content = response.text
+        except Exception as e:
+            logger.error(
+                f"Attempt {attempt + 1} failed: {str(e)}"
+            )
 
-                soup = BeautifulSoup(
-                    html_content,
-                    "html.parser"
-                )
+            if attempt == RETRIES - 1:
+                raise
 
-                table = soup.find("table")
+            await asyncio.sleep(
+                0.5 * (2 ** attempt)
+            )
 
-                if not table:
-                    logger.warning(
-                        "No data table found on Spices Board page"
-                    )
-                    return {
-                        "success": False,
-                        "count": 0,
-                        "data": [],
-                        "error": "Data table not found",
-                    }
 
-                parsed_data = []
+async def _request(
+    state: str,
+    spice: str = "",
+    arrival_date: str = "",
+) -> dict[str, Any]:
+    """
+    Internal request handler for Indian Spices Board.
+    """
 
-                rows = table.find_all("tr")[1:]
+    params = {
+        "filterState": state,
+        "filterSpice": spice,
+        "dateFrom": arrival_date,
+        "dateTo": "",
+    }
 
-                for row in rows:
-                    cells = [
-                        cell.text.strip()
-                        for cell in row.find_all("td")
-                    ]
+    try:
+        html_content = await _fetch_html(params)
+    except Exception as e:
+        return {
+            "success": False,
+            "count": 0,
+            "data": [],
+            "error": str(e),
+        }
 
-                    if len(cells) != 9:
-                        logger.warning(
-                            f"Skipping malformed row: {cells}"
-                        )
-                        continue
+    rows = parse_spices_board_html(html_content)
 
-                    raw_row = dict(zip(headers, cells))
+    if rows is None:
+        logger.warning(
+            "No data table found on Spices Board page"
+        )
+        return {
+            "success": False,
+            "count": 0,
+            "data": [],
+            "error": "Data table not found",
+        }
 
-                    normalized = normalize_row(raw_row)
+    parsed_data = [normalize_row(row) for row in rows]
 
-                    parsed_data.append(normalized)
+    return {
+        "success": True,
+        "count": len(parsed_data),
+        "data": parsed_data,
+        "source": "Indian Spices Board",
+    }
 
-                return {
-                    "success": True,
-                    "count": len(parsed_data),
-                    "data": parsed_data,
-                    "source": "Indian Spices Board",
-                }
 
-        except Exception as e:
-            logger.error(
-                f"Attempt {attempt + 1} failed: {str(e)}"
-            )
+async def refresh_spices_board_prices(
+    state: str,
+    arrival_date: str = "",
+) -> dict[str, Any]:
+    """
+    Scrape all spices for a state (and optional dateFrom) now and
+    replace the stored snapshot.
+    """
 
-            if attempt == RETRIES - 1:
-                return {
-                    "success": False,
-                    "count": 0,
-                    "data": [],
-                    "error": str(e),
-                }
+    response = await _request(state=state, arrival_date=arrival_date)
+    store = scrape_store.get_store()
+    scope = store_scope(state, arrival_date)
 
-            await asyncio.sleep(
-                0.5 * (2 ** attempt)
-            )
+    if response.get("success"):
+        store.replace_snapshot(STORE_SOURCE, scope, response["data"])
+    else:
+        store.record_failure(STORE_SOURCE, scope, response.get("error", ""))
 
-    return {
-        "success": False,
-        "count": 0,
-        "data": [],
-        "error": "All retries failed",
-    }
+    return response
 
 
 # ================= BUSINESS LOGIC =================
@@ -300,6 +319,7 @@ async def fetch_spices_board_prices(
     state: str,
     spice: str = "",
     arrival_date: str = "",
+    refresh: bool = False,
 ) -> dict[str, Any]:
     """
     Fetch mandi prices from Indian Spices Board.
@@ -311,11 +331,21 @@ async def fetch_spices_board_prices(
     - spice (optional)
       Example: "Pepper", "Cardamom"
 
+    - arrival_date (optional): dateFrom, e.g. "2026-04-23"
+
+    - refresh: scrape the page now instead of using the stored copy
+
+    Prices are served from the scrape store kept current by
+    scrape_ingester; "freshness" says when they were scraped. Dated
+    queries are answered from the ingested state snapshot when it
+    covers the date, and scraped under their own scope otherwise.
+
     Returns:
     {
         success: bool,
         count: int,
-        data: list
+        data: list,
+        freshness: {fetched_at, age_sec, stale}
     }
     """
 
@@ -327,11 +357,45 @@ async def fetch_spices_board_prices(
             "error": "State is required",
         }
 
-    return await _request(
-        state=state,
-        spice=spice,
-        arrival_date=arrival_date,
-    )
+    store = scrape_store.get_store()
+    snapshot = None
+    data = None
+
+    if arrival_date and not refresh:
+        latest = store.snapshot(STORE_SOURCE, store_scope(state))
+        if latest is not None and latest.is_fresh():
+            data = rows_since(latest.rows, arrival_date)
+            if data is not None:
+                snapshot = latest
+
+    if data is None:
+        scope = store_scope(state, arrival_date)
+        snapshot = store.snapshot(STORE_SOURCE, scope)
+
+        if refresh or snapshot is None or not snapshot.is_fresh():
+            # on failure the previous snapshot is served, marked stale
+            response = await refresh_spices_board_prices(state, arrival_date)
+            snapshot = store.snapshot(STORE_SOURCE, scope)
+            if snapshot is None:
+                return response
+
+        data = snapshot.rows
+
+    if spice:
+        data = [
+            item
+            for item in data
+            if spice.lower()
+            in (item.get("commodity") or "").lower()
+        ]
+
+    return {
+        "success": True,
+        "count": len(data),
+        "data": data,
+        "source": "Indian Spices Board",
+        "freshness": snapshot.freshness(),
+    }
 
 
 if mcp:
@@ -0,0 +1,192 @@
+"""data.gov.in client: pooled connections, paging, TTL cache and de-duplication against a stub API."""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import market_data_gov as mdg
+
+
+def _record(i: int, date: str) -> dict:
+    return {
+        "State": "Punjab",
+        "District": "Ludhiana",
+        "Market": f"Market {i}",
+        "Commodity": "Wheat",
+        "Arrival_Date": date,
+        "Min_Price": "2200",
+        "Max_Price": "2400",
+        "Modal_Price": "2300",
+    }
+
+
+class _StubApi:
+    def __init__(self, records: list[dict], *, delay: float = 0.0):
+        self.records = records
+        self.delay = delay
+        self.fail = False
+        self.queries: list[dict] = []
+        self.peers: set = set()
+
+    def serve(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                api.queries.append(query)
+                api.peers.add(self.client_address)
+                time.sleep(api.delay)
+                if api.fail:
+                    body, status = b'{"message": "busy"}', 503
+                else:
+                    date = query.get("filters[Arrival_Date]")
+                    rows = [r for r in api.records if not date or r["Arrival_Date"] == date]
+                    offset, limit = int(query.get("offset", 0)), int(query.get("limit", 10))
+                    page = rows[offset:offset + limit]
+                    body = json.dumps({"total": len(rows), "count": len(page), "records": page}).encode()
+                    status = 200
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+@pytest.fixture
+def api(monkeypatch):
+    servers = []
+
+    def start(records, **kwargs):
+        stub = _StubApi(records, **kwargs)
+        server = stub.serve()
+        servers.append(server)
+        monkeypatch.setattr(mdg, "BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/resource")
+        return stub
+
+    monkeypatch.setattr(mdg, "_cache", {})
+    monkeypatch.setattr(mdg, "RETRIES", 1)
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+TODAY = datetime.now().strftime("%d/%m/%Y")
+OLD = (datetime.now() - timedelta(days=30)).strftime("%d/%m/%Y")
+
+
+def _run(coro_factory):
+    async def main():
+        try:
+            return await coro_factory()
+        finally:
+            await mdg.aclose_client()
+
+    return asyncio.run(main())
+
+
+def test_paging_stops_once_enough_records_match(api, monkeypatch):
+    stub = api([_record(i, TODAY) for i in range(250)])
+    monkeypatch.setattr(mdg, "PAGE_SIZE", 50)
+    monkeypatch.setattr(mdg, "MAX_RECORDS", 60)
+
+    res = _run(lambda: mdg.fetch_mandi_prices(state="Punjab", commodity="Wheat", arrival_date=TODAY))
+    assert res["success"] is True
+    assert res["count"] == 60
+    assert res["total"] == 250
+    assert [q["offset"] for q in stub.queries] == ["0", "50"]
+    assert stub.queries[0]["limit"] == "50"
+
+
+def test_default_cap_matches_data_gov_page(api):
+    stub = api([_record(i, TODAY) for i in range(250)])
+    res = _run(lambda: mdg.fetch_mandi_prices(state="Punjab", commodity="Wheat", arrival_date=TODAY))
+    assert res["count"] == 10  # the API's default page, as before paging was added
+    assert len(stub.queries) == 1
+
+
+def test_short_last_page_ends_paging(api, monkeypatch):
+    stub = api([_record(i, TODAY) for i in range(70)])
+    monkeypatch.setattr(mdg, "PAGE_SIZE", 50)
+    monkeypatch.setattr(mdg, "MAX_RECORDS", 200)
+    res = _run(lambda: mdg.fetch_mandi_prices(state="Punjab", commodity="Wheat", arrival_date=TODAY))
+    assert res["count"] == 70
+    assert len(stub.queries) == 2
+
+
+def test_repeat_queries_hit_cache_and_share_connections(api):
+    stub = api([_record(i, TODAY) for i in range(5)])
+
+    async def three_queries():
+        results = []
+        for state in ("Punjab", " punjab ", "Punjab"):
+            results.append(await mdg.fetch_mandi_prices(state=state, commodity="wheat", arrival_date=TODAY))
+        # a different query still goes upstream, over the pooled connection
+        await mdg.fetch_mandi_prices(state="Punjab", district="Ludhiana", commodity="Wheat", arrival_date=TODAY)
+        return results
+
+    results = _run(three_queries)
+    assert all(r["count"] == 5 for r in results)
+    assert len(stub.queries) == 2
+    assert len(stub.peers) == 1
+
+
+def test_concurrent_identical_queries_are_deduplicated(api):
+    stub = api([_record(i, OLD) for i in range(3)], delay=0.2)
+
+    async def burst():
+        return await asyncio.gather(
+            *(mdg.fetch_mandi_prices(state="Punjab", commodity="Wheat", arrival_date=OLD) for _ in range(20))
+        )
+
+    results = _run(burst)
+    assert all(r["count"] == 3 for r in results)
+    assert len(stub.queries) == 1
+
+
+def test_failures_are_not_cached(api):
+    stub = api([_record(0, OLD)])
+    stub.fail = True
+    first = _run(lambda: mdg.fetch_mandi_prices(state="Punjab", commodity="Wheat", arrival_date=OLD))
+    assert first["success"] is False
+    assert first["error_type"] == "request_failed"
+
+    stub.fail = False
+    second = _run(lambda: mdg.fetch_mandi_prices(state="Punjab", commodity="Wheat", arrival_date=OLD))
+    assert second["count"] == 1
+    assert len(stub.queries) == 2
+
+
+def test_fallback_annotations_do_not_leak_into_cache(api):
+    yesterday = (datetime.now() - timedelta(days=1)).strftime("%d/%m/%Y")
+    api([_record(0, yesterday)])
+    res = _run(lambda: mdg.fetch_mandi_prices(state="Punjab", commodity="Wheat", arrival_date=TODAY))
+    assert res["fallback_info"]["fallback_arrival_date"] == yesterday
+
+    direct = _run(lambda: mdg.fetch_mandi_prices(state="Punjab", commodity="Wheat", arrival_date=yesterday))
+    assert "fallback_info" not in direct
+
+
+def test_ttl_follows_arrival_date():
+    two_days = (datetime.now() - timedelta(days=2)).strftime("%d/%m/%Y")
+    assert mdg._cache_ttl(TODAY) == mdg.CACHE_TTL_TODAY_SEC
+    assert mdg._cache_ttl(two_days) == mdg.CACHE_TTL_RECENT_SEC
+    assert mdg._cache_ttl(OLD) == mdg.CACHE_TTL_PAST_SEC
+    assert mdg._cache_ttl("") == mdg.CACHE_TTL_TODAY_SEC
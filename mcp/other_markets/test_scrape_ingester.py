@@ -0,0 +1,170 @@
+"""Scrape ingester: saved HTML pages -> scrape store -> tool responses with freshness."""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+import azadpur_apmc
+import scrape_ingester
+import scrape_store
+import spices_board
+from html_parser import parse_azadpur_html, parse_spices_board_html
+
+FIXTURES = Path(__file__).with_name("fixtures")
+
+
+@pytest.fixture
+def pages(monkeypatch, tmp_path):
+    """Serve the saved pages instead of the live sites; counts fetches."""
+    fetches = {"azadpur": 0, "spices_board": []}
+    state = {"fail": False}
+
+    async def azadpur_html():
+        fetches["azadpur"] += 1
+        if state["fail"]:
+            raise RuntimeError("azadpur unreachable")
+        return (FIXTURES / "azadpur.html").read_text(encoding="utf-8")
+
+    async def spices_html(params):
+        fetches["spices_board"].append(params)
+        if state["fail"]:
+            raise RuntimeError("spices board unreachable")
+        return (FIXTURES / "spices_board.html").read_text(encoding="utf-8")
+
+    monkeypatch.setattr(azadpur_apmc, "_fetch_html", azadpur_html)
+    monkeypatch.setattr(spices_board, "_fetch_html", spices_html)
+    monkeypatch.setattr(scrape_store, "_store", scrape_store.ScrapeStore(tmp_path / "scrape.sqlite3"))
+    monkeypatch.setattr(scrape_ingester, "SPICES_STATES", ["KERALA"])
+    return fetches, state
+
+
+def test_parsers_on_saved_pages():
+    azadpur = parse_azadpur_html((FIXTURES / "azadpur.html").read_text(encoding="utf-8"))
+    assert azadpur["date"] == "23/04/2026"
+    assert [r["commodity"] for r in azadpur["data"]] == [
+        "Tomato", "Onion", "Potato", "Brinjal", "Cherry Tomato"
+    ]
+
+    spices = parse_spices_board_html((FIXTURES / "spices_board.html").read_text(encoding="utf-8"))
+    assert len(spices) == 4  # the colspan note row is skipped
+    assert spices[2]["spice"] == "Small Cardamom"
+    assert parse_spices_board_html("<html><body>maintenance</body></html>") is None
+
+
+def test_ingest_then_serve_from_store(pages):
+    fetches, _ = pages
+    summary = asyncio.run(scrape_ingester.ingest_once())
+    assert summary == {
+        "azadpur": {"success": True, "count": 5},
+        "spices_board/KERALA": {"success": True, "count": 4},
+    }
+
+    tomato = asyncio.run(azadpur_apmc.fetch_azadpur_mandi_prices("tomato"))
+    assert [r["commodity"] for r in tomato["data"]] == ["Tomato", "Cherry Tomato"]
+    assert tomato["data"][0]["modal_price"] == 1100.0
+    assert tomato["data"][0]["arrival_date"] == "23/04/2026"
+    assert tomato["freshness"]["stale"] is False
+    assert tomato["freshness"]["age_sec"] <= 1
+
+    brinjal = asyncio.run(azadpur_apmc.fetch_azadpur_mandi_prices("Brinjal"))
+    assert brinjal["data"][0]["max_price"] == 0.0  # "-" parses as before
+
+    pepper = asyncio.run(spices_board.fetch_spices_board_prices("Kerala", "pepper"))
+    assert [r["grade"] for r in pepper["data"]] == ["Ungarbled", "Garbled"]
+    ginger = asyncio.run(spices_board.fetch_spices_board_prices("KERALA", "ginger"))
+    assert ginger["data"][0]["modal_price"] is None
+    cardamom = asyncio.run(spices_board.fetch_spices_board_prices("KERALA", "cardamom"))
+    assert cardamom["data"][0]["modal_price"] == 2402.55
+
+    # served from the store: no page fetches beyond the ingest
+    assert fetches["azadpur"] == 1
+    assert len(fetches["spices_board"]) == 1
+
+
+def test_stale_snapshot_is_refreshed_on_demand(pages, monkeypatch):
+    fetches, _ = pages
+    asyncio.run(scrape_ingester.ingest_once("azadpur"))
+    monkeypatch.setattr(scrape_store, "MAX_AGE_SEC", 0.05)
+    time.sleep(0.1)
+    result = asyncio.run(azadpur_apmc.fetch_azadpur_mandi_prices())
+    assert fetches["azadpur"] == 2
+    assert result["freshness"]["stale"] is False
+
+    asyncio.run(azadpur_apmc.fetch_azadpur_mandi_prices(refresh=True))
+    assert fetches["azadpur"] == 3
+
+
+def test_failed_scrape_keeps_last_snapshot(pages, monkeypatch):
+    fetches, state = pages
+    asyncio.run(scrape_ingester.ingest_once())
+    state["fail"] = True
+
+    summary = asyncio.run(scrape_ingester.ingest_once())
+    assert summary["azadpur"] == {"success": False, "count": 0, "error": "azadpur unreachable"}
+
+    monkeypatch.setattr(scrape_store, "MAX_AGE_SEC", 0)
+    result = asyncio.run(azadpur_apmc.fetch_azadpur_mandi_prices("onion"))
+    assert result["success"] is True
+    assert result["data"][0]["commodity"] == "Onion"
+    assert result["freshness"]["stale"] is True
+    assert result["freshness"]["last_error"] == "azadpur unreachable"
+
+    status = {row["scope"] or row["source"]: row for row in scrape_store.get_store().status()}
+    assert status["azadpur"]["row_count"] == 5
+    assert status["KERALA|"]["last_error"] == "spices board unreachable"
+
+
+def test_unknown_scope_without_snapshot_reports_error(pages):
+    _, state = pages
+    state["fail"] = True
+    result = asyncio.run(spices_board.fetch_spices_board_prices("Assam", "chilli", "2026-04-20"))
+    assert result["success"] is False
+    assert result["error"] == "spices board unreachable"
+
+
+def test_date_filtered_query_gets_its_own_snapshot(pages):
+    fetches, _ = pages
+    for _ in range(2):
+        asyncio.run(spices_board.fetch_spices_board_prices("KERALA", "pepper", "2026-04-20"))
+    assert fetches["spices_board"] == [
+        {"filterState": "KERALA", "filterSpice": "", "dateFrom": "2026-04-20", "dateTo": ""}
+    ]
+
+
+def test_dated_query_is_served_from_the_ingested_snapshot(pages):
+    fetches, _ = pages
+    asyncio.run(scrape_ingester.ingest_once("spices_board"))
+    for arrival_date in ("2026-04-23", "23/04/2026"):
+        pepper = asyncio.run(spices_board.fetch_spices_board_prices("Kerala", "pepper", arrival_date))
+        assert [r["grade"] for r in pepper["data"]] == ["Ungarbled", "Garbled"]
+        assert pepper["freshness"]["stale"] is False
+    assert asyncio.run(spices_board.fetch_spices_board_prices("KERALA", "", "2026-04-24"))["data"] == []
+    assert len(fetches["spices_board"]) == 1
+
+    # the snapshot starts on the 23rd, so an earlier dateFrom still needs its own scrape
+    asyncio.run(spices_board.fetch_spices_board_prices("KERALA", "pepper", "2026-04-20"))
+    assert fetches["spices_board"][1]["dateFrom"] == "2026-04-20"
+
+
+def test_rows_since_requires_coverage():
+    rows = [{"arrival_date": "22-04-2026"}, {"arrival_date": "2026-04-23"}]
+    assert spices_board.rows_since(rows, "2026-04-23") == rows[1:]
+    assert spices_board.rows_since(rows, "22/04/2026") == rows
+    assert spices_board.rows_since(rows, "2026-04-21") is None
+    assert spices_board.rows_since(rows, "not a date") is None
+    assert spices_board.rows_since([], "2026-04-23") is None
+    assert spices_board.rows_since([{"arrival_date": ""}], "2026-04-23") is None
+
+
+def test_background_ingester_runs_on_cadence(pages):
+    fetches, _ = pages
+    ingester = scrape_ingester.ScrapeIngester(interval_sec=0.1)
+    ingester.start()
+    deadline = time.monotonic() + 5
+    while ingester.cycles < 2 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    ingester.stop(timeout=5)
+    assert ingester.cycles >= 2
+    assert fetches["azadpur"] >= 2
@@ -0,0 +1,190 @@
+"""unified_mandi_prices fan-out against stub upstreams with different latencies and failures."""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import azadpur_apmc
+import market_data_gov
+import scrape_ingester
+import scrape_store
+import spices_board
+import unified_mandi_prices as ump
+
+# fastmcp 2.x wraps the tool; the coroutine function lives on .fn
+_tool = getattr(ump.unified_mandi_prices, "fn", ump.unified_mandi_prices)
+
+_DATA_GOV = {
+    "records": [
+        {
+            "State": "NCT of Delhi",
+            "District": "Delhi",
+            "Market": "Keshopur",
+            "Commodity": "Tomato",
+            "Arrival_Date": "23/04/2026",
+            "Min_Price": "800",
+            "Max_Price": "1200",
+            "Modal_Price": "1000",
+        }
+    ],
+    "total": 1,
+}
+
+_SPICES = """<html><body><table>
+<tr><th>Date</th><th>Spice</th><th>Market</th><th>State</th><th>Grade</th>
+<th>Source</th><th>Min</th><th>Max</th><th>Avg</th></tr>
+<tr><td>2026-04-23</td><td>Tomato Powder</td><td>Delhi</td><td>DELHI</td><td>A</td>
+<td>Trade</td><td>9,000</td><td>9,500</td><td>9,250</td></tr>
+</table></body></html>"""
+
+_AZADPUR = """<html><body><p>Dated:23/04/2026</p>
+<div class="price-item"><span class="comm-name">Tomato</span>
+<span class="comm-min">700</span><span class="comm-max">1100</span></div>
+</body></html>"""
+
+
+def _serve(body: str, content_type: str, delay: float, status: int):
+    calls = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            calls.append(self.path)
+            time.sleep(delay)
+            payload = body.encode()
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/", calls
+
+
+@pytest.fixture
+def upstreams(monkeypatch, tmp_path):
+    servers = []
+
+    def start(*, data_gov=(0.0, 200), spices=(0.0, 200), azadpur=(0.0, 200)):
+        calls = {}
+        for module, source, body, ctype, (delay, status) in (
+            (market_data_gov, "data.gov.in", json.dumps(_DATA_GOV), "application/json", data_gov),
+            (spices_board, "Indian Spices Board", _SPICES, "text/html", spices),
+            (azadpur_apmc, "Azadpur Mandi", _AZADPUR, "text/html", azadpur),
+        ):
+            server, url, hits = _serve(body, ctype, delay, status)
+            servers.append(server)
+            monkeypatch.setattr(module, "BASE_URL", url)
+            monkeypatch.setattr(module, "RETRIES", 1)
+            calls[source] = hits
+        return calls
+
+    monkeypatch.setattr(ump, "PROVIDER_TIMEOUTS", {k: 0.5 for k in ump.PROVIDER_TIMEOUTS})
+    monkeypatch.setattr(market_data_gov, "_cache", {})
+    # scraped sources: fresh store, always re-scrape so the stubs see every call
+    monkeypatch.setattr(scrape_store, "_store", scrape_store.ScrapeStore(tmp_path / "scrape.sqlite3"))
+    monkeypatch.setattr(scrape_store, "MAX_AGE_SEC", 0)
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _query(**kwargs):
+    args = {"state": "Delhi", "commodity": "Tomato", "arrival_date": "23/04/2026", **kwargs}
+    started = time.perf_counter()
+    result = asyncio.run(_tool(**args))
+    return result, time.perf_counter() - started
+
+
+def test_providers_run_concurrently(upstreams):
+    upstreams(data_gov=(0.3, 200), spices=(0.3, 200), azadpur=(0.3, 200))
+    result, elapsed = _query()
+    assert elapsed < 0.8  # ~0.3s, not the 0.9s sum
+    assert result["success"] is True
+    assert result["best_match"]["source"] == "data.gov.in"
+    assert [r["source"] for r in result["alternatives"]] == ["Indian Spices Board", "Azadpur Mandi"]
+    assert {k: v["status"] for k, v in result["sources"].items()} == {
+        "data.gov.in": "ok",
+        "Indian Spices Board": "ok",
+        "Azadpur Mandi": "ok",
+    }
+
+
+def test_slow_provider_times_out_with_partial_results(upstreams):
+    upstreams(data_gov=(2.0, 200), spices=(0.05, 200), azadpur=(0.1, 200))
+    result, elapsed = _query()
+    assert elapsed < 1.5
+    assert result["success"] is True
+    assert {r["source"] for r in [result["best_match"], *result["alternatives"]]} == {
+        "Indian Spices Board",
+        "Azadpur Mandi",
+    }
+    assert result["sources"]["data.gov.in"]["status"] == "timeout"
+    assert result["data_gov_warning"]["error_type"] == "timeout"
+
+
+def test_failing_provider_is_reported_and_not_cached(upstreams):
+    calls = upstreams(spices=(0.0, 500))
+    first, _ = _query()
+    assert first["sources"]["Indian Spices Board"]["status"] == "error"
+    assert first["sources"]["data.gov.in"]["status"] == "ok"
+    assert first["total_results"] == 2
+
+    second, _ = _query()
+    assert len(calls["Indian Spices Board"]) == 2
+    assert len(calls["data.gov.in"]) == 1
+    assert second["sources"]["data.gov.in"]["status"] == "ok"
+
+
+def test_sources_are_cached_by_their_own_layer(upstreams):
+    calls = upstreams()
+    first, _ = _query()
+    first["best_match"]["modal_price"] = "0"
+    first["alternatives"].clear()
+    for _ in range(2):
+        again, _ = _query()
+    # data.gov.in answers come from market_data_gov's cache; the scraped sources
+    # follow scrape_store freshness (MAX_AGE_SEC=0 here), with no second cache on top
+    assert len(calls["data.gov.in"]) == 1
+    assert len(calls["Indian Spices Board"]) == 3
+    assert len(calls["Azadpur Mandi"]) == 3
+    assert again["best_match"]["modal_price"] != "0"
+    assert len(again["alternatives"]) == 2
+
+
+def test_refresh_is_served_on_the_next_query(upstreams, monkeypatch):
+    calls = upstreams()
+    monkeypatch.setattr(scrape_store, "MAX_AGE_SEC", 3600)
+    monkeypatch.setattr(scrape_ingester, "SPICES_STATES", ["DELHI"])
+    refresh = getattr(ump.refresh_scraped_prices, "fn", ump.refresh_scraped_prices)
+
+    assert asyncio.run(refresh())["success"] is True
+    first, _ = _query()
+    # the dated query is answered from the ingested DELHI snapshot
+    assert len(calls["Indian Spices Board"]) == 1
+    assert len(calls["Azadpur Mandi"]) == 1
+
+    time.sleep(1.1)
+    asyncio.run(refresh())
+    second, _ = _query()
+    assert len(calls["Indian Spices Board"]) == 2
+    before = first["sources"]["Indian Spices Board"]["freshness"]["fetched_at"]
+    after = second["sources"]["Indian Spices Board"]["freshness"]["fetched_at"]
+    assert after > before
+
+
+def test_azadpur_skipped_outside_delhi(upstreams):
+    calls = upstreams()
+    result, _ = _query(state="Kerala")
+    assert result["sources"]["Azadpur Mandi"] == {"status": "skipped", "count": 0}
+    assert calls["Azadpur Mandi"] == []
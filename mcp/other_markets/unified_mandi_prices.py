@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable
 
 from datetime import datetime
 
@@ -18,6 +22,28 @@ mcp = FastMCP("ajrasakha-unified-mandi-mcp")
 from market_data_gov import fetch_mandi_prices
 from spices_board import fetch_spices_board_prices
 from azadpur_apmc import fetch_azadpur_mandi_prices
+from scrape_ingester import ingest_once, start_background_ingester
+import scrape_store
+
+logger = logging.getLogger(__name__)
+
+
+# ================= CONFIG =================
+
+DATA_GOV_SOURCE = "data.gov.in"
+SPICES_SOURCE = "Indian Spices Board"
+AZADPUR_SOURCE = "Azadpur Mandi"
+
+# Upstreams are queried concurrently; each gets its own budget so one slow
+# site cannot hold back the others. Results also merge in this order.
+PROVIDER_TIMEOUTS = {
+    DATA_GOV_SOURCE: float(os.getenv("UNIFIED_DATA_GOV_TIMEOUT_SEC", "25")),
+    SPICES_SOURCE: float(os.getenv("UNIFIED_SPICES_TIMEOUT_SEC", "15")),
+    AZADPUR_SOURCE: float(os.getenv("UNIFIED_AZADPUR_TIMEOUT_SEC", "15")),
+}
+
+# No response cache here: data.gov.in answers are cached in market_data_gov,
+# and the scraped sources are served from scrape_store.
 
 
 # ================= HELPERS =================
@@ -139,6 +165,89 @@ def filter_by_commodity(
     ]
 
 
+# ================= PROVIDER FAN-OUT =================
+
+async def _call_provider(
+    source: str,
+    fetch: Callable[[], Awaitable[dict[str, Any]]],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Run one provider under its timeout.
+
+    Returns (response, status) where status is
+    {status: ok | empty | error | timeout, count, elapsed_ms[, freshness][, error]}
+    """
+
+    started = time.perf_counter()
+    timeout = PROVIDER_TIMEOUTS[source]
+    try:
+        response = await asyncio.wait_for(fetch(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning("%s timed out after %ss", source, timeout)
+        response = {
+            "success": False,
+            "error_type": "timeout",
+            "error": f"{source} did not respond within {timeout:g}s",
+            "data": [],
+        }
+    except Exception as e:
+        logger.exception("%s failed", source)
+        response = {
+            "success": False,
+            "error_type": "provider_error",
+            "error": str(e),
+            "data": [],
+        }
+    elapsed_ms = round((time.perf_counter() - started) * 1000)
+
+    if response.get("success"):
+        count = len(response.get("data") or [])
+        status = {"status": "ok" if count else "empty", "count": count}
+        if response.get("freshness"):
+            # scraped sources: when the stored page was fetched
+            status["freshness"] = response["freshness"]
+    else:
+        status = {
+            "status": "timeout" if response.get("error_type") == "timeout" else "error",
+            "count": 0,
+            "error": response.get("error", "Unknown error"),
+        }
+    status["elapsed_ms"] = elapsed_ms
+    return response, status
+
+
+async def fan_out(
+    providers: dict[str, Callable[[], Awaitable[dict[str, Any]]]],
+) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+    """
+    Query all providers concurrently.
+
+    providers: {source: fetch}
+    Returns ({source: response}, {source: status}); responses are
+    recorded as each provider finishes.
+    """
+
+    responses: dict[str, dict[str, Any]] = {}
+    statuses: dict[str, dict[str, Any]] = {}
+
+    async def run(source: str, fetch):
+        return source, await _call_provider(source, fetch)
+
+    pending = [run(source, fetch) for source, fetch in providers.items()]
+    for finished in asyncio.as_completed(pending):
+        source, (response, status) = await finished
+        responses[source] = response
+        statuses[source] = status
+        logger.info(
+            "%s: %s (%s rows, %sms)",
+            source,
+            status["status"],
+            status["count"],
+            status["elapsed_ms"],
+        )
+    return responses, statuses
+
+
 # ================= BUSINESS LOGIC =================
 @mcp.tool()
 async def unified_mandi_prices(
@@ -154,11 +263,11 @@ async def unified_mandi_prices(
     - Indian Spices Board
     - Azadpur Mandi
 
-    Returns best match + alternatives
+    Returns best match + alternatives, with per-source status in "sources"
     """
 
     # -----------------------------
-    # Call all services
+    # Call all services (concurrently)
     # -----------------------------
 
     spices_arrival_date = to_yyyy_mm_dd(arrival_date)
@@ -170,12 +279,30 @@ async def unified_mandi_prices(
  
     if state == "Delhi":
         data_gov_state = "NCT of Delhi"
-    data_gov_response = await fetch_mandi_prices(
-        state=data_gov_state,
-        district=district,
-        commodity=commodity,
-        arrival_date=data_gov_arrival_date,
-    )
+
+    providers = {
+        DATA_GOV_SOURCE: lambda: fetch_mandi_prices(
+            state=data_gov_state,
+            district=district,
+            commodity=commodity,
+            arrival_date=data_gov_arrival_date,
+        ),
+        SPICES_SOURCE: lambda: fetch_spices_board_prices(
+            state=state,
+            spice=commodity,
+            arrival_date=spices_arrival_date,
+        ),
+    }
+    if state == 'Delhi' or district == 'Azadpur':
+        providers[AZADPUR_SOURCE] = lambda: fetch_azadpur_mandi_prices(commodity=commodity)
+
+    responses, sources = await fan_out(providers)
+    if AZADPUR_SOURCE not in sources:
+        sources[AZADPUR_SOURCE] = {"status": "skipped", "count": 0}
+
+    data_gov_response = responses[DATA_GOV_SOURCE]
+    spices_response = responses[SPICES_SOURCE]
+    azadpur_response = responses.get(AZADPUR_SOURCE, {"data": []})
     data_gov_fallback_info = data_gov_response.get("fallback_info", {})
     data_gov_date_check_info = data_gov_response.get("date_check_info", {})
     data_gov_warning: dict[str, Any] | None = None
@@ -183,7 +310,7 @@ async def unified_mandi_prices(
         data_gov_warning = {
             "error_type": data_gov_response.get("error_type", "data_gov_error"),
             "error": data_gov_response.get("error", "Unknown error from data.gov.in"),
-            "source": "data.gov.in",
+            "source": DATA_GOV_SOURCE,
         }
         available_commodities = data_gov_response.get("available_commodities", [])
         if available_commodities:
@@ -192,36 +319,23 @@ async def unified_mandi_prices(
         if available_districts:
             data_gov_warning["available_districts"] = available_districts
 
-    spices_response = await fetch_spices_board_prices(
-        state=state,
-        spice=commodity,
-        arrival_date=spices_arrival_date,
-    )
-    
-    if state == 'Delhi' or district == 'Azadpur':
-        azadpur_response = await fetch_azadpur_mandi_prices(
-            commodity=commodity,
-    )
-    else:
-        azadpur_response = {"data": []}
-
     # -----------------------------
     # Normalize all responses
     # -----------------------------
 
     normalized_data_gov = normalize_data(
         data_gov_response.get("data", []) if data_gov_response.get("success") else [],
-        "data.gov.in",
+        DATA_GOV_SOURCE,
     )
 
     normalized_spices = normalize_data(
         spices_response.get("data", []),
-        "Indian Spices Board",
+        SPICES_SOURCE,
     )
 
     normalized_azadpur = normalize_data(
         azadpur_response.get("data", []),
-        "Azadpur Mandi",
+        AZADPUR_SOURCE,
     )
 
     # -----------------------------
@@ -278,6 +392,7 @@ async def unified_mandi_prices(
         "total_results": len(final_results),
         "Error Message": error_msg,
         "alternatives": final_results[1:5],
+        "sources": sources,
     }
     if data_gov_warning:
         response["data_gov_warning"] = data_gov_warning
@@ -285,5 +400,29 @@ async def unified_mandi_prices(
 
 
 
+@mcp.tool()
+async def refresh_scraped_prices(source: str = "all") -> dict[str, Any]:
+    """
+    Re-scrape Azadpur Mandi and/or Indian Spices Board prices now
+    instead of waiting for the next background ingest.
+
+    source: "all", "azadpur" or "spices_board"
+    """
+
+    if source not in ("all", "azadpur", "spices_board"):
+        return {
+            "success": False,
+            "error": 'source must be "all", "azadpur" or "spices_board"',
+        }
+
+    results = await ingest_once(source)
+    return {
+        "success": all(item["success"] for item in results.values()),
+        "results": results,
+        "store": scrape_store.get_store().status(),
+    }
+
+
 if __name__ == "__main__":
+    start_background_ingester()
     mcp.run(transport="streamable-http", host="0.0.0.0", port=8000)